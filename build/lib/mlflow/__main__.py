@@ -0,0 +1,3 @@
+from mlflow.cli import cli
+
+cli.main()
@@ -0,0 +1,12 @@
+"""
+The ``mlflow.client`` module provides a Python CRUD interface to MLflow Experiments, Runs,
+Model Versions, and Registered Models. This is a lower level API that directly translates to MLflow
+`REST API <../rest-api.html>`_ calls.
+For a higher level API for managing an "active run", use the :py:mod:`mlflow` module.
+"""
+
+from mlflow.tracking.client import MlflowClient
+
+__all__ = [
+    "MlflowClient",
+]
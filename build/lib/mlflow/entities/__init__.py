@@ -0,0 +1,44 @@
+"""
+The ``mlflow.entities`` module defines entities returned by the MLflow
+`REST API <../rest-api.html>`_.
+"""
+
+from mlflow.entities.experiment import Experiment
+from mlflow.entities.experiment_tag import ExperimentTag
+from mlflow.entities.file_info import FileInfo
+from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.entities.run import Run
+from mlflow.entities.run_data import RunData
+from mlflow.entities.run_info import RunInfo
+from mlflow.entities.run_status import RunStatus
+from mlflow.entities.run_tag import RunTag
+from mlflow.entities.source_type import SourceType
+from mlflow.entities.view_type import ViewType
+from mlflow.entities.dataset import Dataset
+from mlflow.entities.input_tag import InputTag
+from mlflow.entities.dataset_input import DatasetInput
+from mlflow.entities.run_inputs import RunInputs
+from mlflow.entities.dataset_summary import _DatasetSummary
+
+__all__ = [
+    "Experiment",
+    "FileInfo",
+    "Metric",
+    "Param",
+    "Run",
+    "RunData",
+    "RunInfo",
+    "RunStatus",
+    "RunTag",
+    "ExperimentTag",
+    "SourceType",
+    "ViewType",
+    "LifecycleStage",
+    "Dataset",
+    "InputTag",
+    "DatasetInput",
+    "RunInputs",
+    "_DatasetSummary",
+]
@@ -0,0 +1,14 @@
+from mlflow.entities.model_registry.registered_model import RegisteredModel
+from mlflow.entities.model_registry.model_version import ModelVersion
+from mlflow.entities.model_registry.registered_model_alias import RegisteredModelAlias
+from mlflow.entities.model_registry.registered_model_tag import RegisteredModelTag
+from mlflow.entities.model_registry.model_version_tag import ModelVersionTag
+
+
+__all__ = [
+    "RegisteredModel",
+    "ModelVersion",
+    "RegisteredModelAlias",
+    "RegisteredModelTag",
+    "ModelVersionTag",
+]
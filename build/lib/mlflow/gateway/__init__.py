@@ -0,0 +1,14 @@
+from mlflow.gateway.fluent import get_route, search_routes, query, create_route, delete_route
+from mlflow.gateway.utils import set_gateway_uri, get_gateway_uri
+from mlflow.gateway.client import MlflowGatewayClient
+
+__all__ = [
+    "create_route",
+    "delete_route",
+    "get_route",
+    "get_gateway_uri",
+    "MlflowGatewayClient",
+    "query",
+    "search_routes",
+    "set_gateway_uri",
+]
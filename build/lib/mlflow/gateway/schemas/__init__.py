@@ -0,0 +1,4 @@
+from . import chat, completions, embeddings
+
+
+__all__ = ["chat", "completions", "embeddings"]
@@ -0,0 +1,10 @@
+# pylint: disable=unused-import
+from mlflow.tensorflow import (
+    # Redirect `mlflow.keras._load_pyfunc` to `mlflow.tensorflow._load_pyfunc`,
+    # For backwards compatibility on loading keras model saved by old mlflow versions.
+    _load_pyfunc,
+    load_model,
+    log_model,
+    save_model,
+    autolog,
+)
@@ -0,0 +1,9 @@
+"""
+The ``mlflow.llm`` module provides utilities for Large Language Models (LLMs).
+"""
+
+from mlflow.tracking.llm_utils import log_predictions
+
+__all__ = [
+    "log_predictions",
+]
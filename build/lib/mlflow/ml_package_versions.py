@@ -0,0 +1,270 @@
+# This file was auto-generated by update_ml_package_versions.py.
+# Please do not edit it manually.
+
+_ML_PACKAGE_VERSIONS = {
+    "sklearn": {
+        "package_info": {
+            "pip_release": "scikit-learn"
+        },
+        "models": {
+            "minimum": "0.22.1",
+            "maximum": "1.3.0"
+        },
+        "autologging": {
+            "minimum": "0.22.1",
+            "maximum": "1.3.0"
+        }
+    },
+    "pytorch": {
+        "package_info": {
+            "pip_release": "torch"
+        },
+        "models": {
+            "minimum": "1.6.0",
+            "maximum": "2.0.1"
+        },
+        "autologging": {
+            "minimum": "1.6.0",
+            "maximum": "2.0.1"
+        }
+    },
+    "pytorch-lightning": {
+        "package_info": {
+            "pip_release": "pytorch-lightning"
+        },
+        "autologging": {
+            "minimum": "1.0.5",
+            "maximum": "2.0.5"
+        }
+    },
+    "tensorflow": {
+        "package_info": {
+            "pip_release": "tensorflow"
+        },
+        "models": {
+            "minimum": "2.3.0",
+            "maximum": "2.13.0"
+        },
+        "autologging": {
+            "minimum": "2.3.0",
+            "maximum": "2.13.0"
+        }
+    },
+    "xgboost": {
+        "package_info": {
+            "pip_release": "xgboost"
+        },
+        "models": {
+            "minimum": "1.1.1",
+            "maximum": "1.7.6"
+        },
+        "autologging": {
+            "minimum": "1.1.1",
+            "maximum": "1.7.6"
+        }
+    },
+    "lightgbm": {
+        "package_info": {
+            "pip_release": "lightgbm"
+        },
+        "models": {
+            "minimum": "2.3.1",
+            "maximum": "4.0.0"
+        },
+        "autologging": {
+            "minimum": "2.3.1",
+            "maximum": "4.0.0"
+        }
+    },
+    "catboost": {
+        "package_info": {
+            "pip_release": "catboost"
+        },
+        "models": {
+            "minimum": "0.23.1",
+            "maximum": "1.2"
+        }
+    },
+    "gluon": {
+        "package_info": {
+            "pip_release": "mxnet"
+        },
+        "models": {
+            "minimum": "1.5.1",
+            "maximum": "1.9.1"
+        },
+        "autologging": {
+            "minimum": "1.5.1",
+            "maximum": "1.9.1"
+        }
+    },
+    "fastai": {
+        "package_info": {
+            "pip_release": "fastai"
+        },
+        "models": {
+            "minimum": "2.4.1",
+            "maximum": "2.7.12"
+        },
+        "autologging": {
+            "minimum": "2.4.1",
+            "maximum": "2.7.12"
+        }
+    },
+    "onnx": {
+        "package_info": {
+            "pip_release": "onnx"
+        },
+        "models": {
+            "minimum": "1.7.0",
+            "maximum": "1.14.0"
+        }
+    },
+    "spacy": {
+        "package_info": {
+            "pip_release": "spacy"
+        },
+        "models": {
+            "minimum": "2.2.4",
+            "maximum": "3.6.0"
+        }
+    },
+    "statsmodels": {
+        "package_info": {
+            "pip_release": "statsmodels"
+        },
+        "models": {
+            "minimum": "0.11.1",
+            "maximum": "0.14.0"
+        },
+        "autologging": {
+            "minimum": "0.11.1",
+            "maximum": "0.14.0"
+        }
+    },
+    "spark": {
+        "package_info": {
+            "pip_release": "pyspark"
+        },
+        "models": {
+            "minimum": "3.0.0",
+            "maximum": "3.4.1"
+        },
+        "autologging": {
+            "minimum": "3.0.0",
+            "maximum": "3.4.1"
+        }
+    },
+    "mleap": {
+        "package_info": {
+            "pip_release": "mleap"
+        },
+        "models": {
+            "minimum": "0.18.0",
+            "maximum": "0.23.0"
+        }
+    },
+    "prophet": {
+        "package_info": {
+            "pip_release": "prophet"
+        },
+        "models": {
+            "minimum": "1.0.1",
+            "maximum": "1.1.4"
+        }
+    },
+    "pmdarima": {
+        "package_info": {
+            "pip_release": "pmdarima"
+        },
+        "models": {
+            "minimum": "1.8.0",
+            "maximum": "2.0.3"
+        }
+    },
+    "diviner": {
+        "package_info": {
+            "pip_release": "diviner"
+        },
+        "models": {
+            "minimum": "0.1.0",
+            "maximum": "0.1.1"
+        }
+    },
+    "h2o": {
+        "package_info": {
+            "pip_release": "h2o"
+        },
+        "models": {
+            "minimum": "3.40.0.1",
+            "maximum": "3.42.0.1"
+        }
+    },
+    "shap": {
+        "package_info": {
+            "pip_release": "shap"
+        },
+        "models": {
+            "minimum": "0.41.0",
+            "maximum": "0.42.0"
+        }
+    },
+    "paddle": {
+        "package_info": {
+            "pip_release": "paddlepaddle"
+        },
+        "models": {
+            "minimum": "2.4.1",
+            "maximum": "2.5.0"
+        }
+    },
+    "transformers": {
+        "package_info": {
+            "pip_release": "transformers"
+        },
+        "models": {
+            "minimum": "4.25.1",
+            "maximum": "4.30.2"
+        },
+        "autologging": {
+            "minimum": "4.25.1",
+            "maximum": "4.30.2"
+        }
+    },
+    "openai": {
+        "package_info": {
+            "pip_release": "openai"
+        },
+        "models": {
+            "minimum": "0.27.2",
+            "maximum": "0.27.8"
+        }
+    },
+    "langchain": {
+        "package_info": {
+            "pip_release": "langchain"
+        },
+        "models": {
+            "minimum": "0.0.169",
+            "maximum": "0.0.232"
+        }
+    },
+    "sentence_transformers": {
+        "package_info": {
+            "pip_release": "sentence-transformers"
+        },
+        "models": {
+            "minimum": "2.2.2",
+            "maximum": "2.2.2"
+        }
+    },
+    "johnsnowlabs": {
+        "package_info": {
+            "pip_release": "johnsnowlabs"
+        },
+        "models": {
+            "minimum": "4.4.6",
+            "maximum": "5.0.0"
+        }
+    }
+}
@@ -0,0 +1,24 @@
+from mlflow.models.evaluation.base import (
+    ModelEvaluator,
+    EvaluationDataset,
+    EvaluationResult,
+    EvaluationMetric,
+    EvaluationArtifact,
+    make_metric,
+    evaluate,
+    list_evaluators,
+)
+
+from mlflow.models.evaluation.validation import MetricThreshold
+
+__all__ = [
+    "ModelEvaluator",
+    "EvaluationDataset",
+    "EvaluationResult",
+    "EvaluationMetric",
+    "EvaluationArtifact",
+    "make_metric",
+    "evaluate",
+    "list_evaluators",
+    "MetricThreshold",
+]
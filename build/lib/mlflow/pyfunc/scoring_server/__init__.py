@@ -0,0 +1,629 @@
+"""
+Scoring server for python model format.
+The passed int model is expected to have function:
+   predict(pandas.Dataframe) -> pandas.DataFrame
+
+Input, expected in text/csv, application/json, Arrow IPC stream or Parquet format,
+is parsed into pandas.DataFrame and passed to the model. Predictions are returned as JSON, or in
+the Arrow IPC stream or Parquet format when requested with the Accept header.
+
+Defines four endpoints:
+    /ping used for health check
+    /health (same as /ping)
+    /version used for getting the mlflow version
+    /invocations used for scoring
+
+When micro-batching is enabled with ``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE``, a fifth endpoint,
+/metrics, exposes the batch size and prediction latency histograms in the Prometheus format.
+"""
+from collections import namedtuple
+from typing import Tuple, Dict
+import flask
+import json
+import logging
+import os
+import sys
+import traceback
+
+from mlflow.environment_variables import (
+    MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE,
+    MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS,
+    MLFLOW_SCORING_SERVER_PRELOAD_MODEL,
+    MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
+    MLFLOW_SCORING_SERVER_USE_ORJSON,
+)
+
+# NB: We need to be careful what we import form mlflow here. Scoring server is used from within
+# model's conda environment. The version of mlflow doing the serving (outside) and the version of
+# mlflow in the model's conda environment (inside) can differ. We should therefore keep mlflow
+# dependencies to the minimum here.
+# ALl of the mlflow dependencies below need to be backwards compatible.
+from mlflow.exceptions import MlflowException
+from mlflow.types import DataType, Schema
+from mlflow.utils import reraise
+from mlflow.utils.file_utils import path_to_local_file_uri
+from mlflow.utils.proto_json_utils import (
+    NumpyEncoder,
+    dataframe_from_parsed_json,
+    _get_jsonable_obj,
+    parse_tf_serving_input,
+)
+from mlflow.version import VERSION
+
+try:
+    from mlflow.pyfunc import load_model, PyFuncModel
+except ImportError:
+    from mlflow.pyfunc import load_pyfunc as load_model
+from mlflow.protos.databricks_pb2 import BAD_REQUEST, INVALID_PARAMETER_VALUE
+from mlflow.server.handlers import catch_mlflow_exception
+from io import StringIO
+
+_SERVER_MODEL_PATH = "__pyfunc_model_path__"
+
+CONTENT_TYPE_CSV = "text/csv"
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_ARROW = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/vnd.apache.parquet"
+
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4"
+
+CONTENT_TYPES = [
+    CONTENT_TYPE_CSV,
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_ARROW,
+    CONTENT_TYPE_PARQUET,
+]
+
+# Binary columnar formats in which DataFrames are sent to and returned by the server without
+# a round-trip through JSON
+COLUMNAR_CONTENT_TYPES = [CONTENT_TYPE_ARROW, CONTENT_TYPE_PARQUET]
+
+# Maximum number of threads used to handle concurrent requests in each worker when micro-batching
+# is enabled
+_MAX_BATCHING_THREADS = 64
+
+_logger = logging.getLogger(__name__)
+
+DF_RECORDS = "dataframe_records"
+DF_SPLIT = "dataframe_split"
+INSTANCES = "instances"
+INPUTS = "inputs"
+
+SUPPORTED_FORMATS = {DF_RECORDS, DF_SPLIT, INSTANCES, INPUTS}
+
+REQUIRED_INPUT_FORMAT = (
+    f"The input must be a JSON dictionary with exactly one of the input fields {SUPPORTED_FORMATS}"
+)
+SCORING_PROTOCOL_CHANGE_INFO = (
+    "IMPORTANT: The MLflow Model scoring protocol has changed in MLflow version 2.0. If you are"
+    " seeing this error, you are likely using an outdated scoring request format. To resolve the"
+    " error, either update your request format or adjust your MLflow Model's requirements file to"
+    " specify an older version of MLflow (for example, change the 'mlflow' requirement specifier"
+    " to 'mlflow==1.30.0'). If you are making a request using the MLflow client"
+    " (e.g. via `mlflow.pyfunc.spark_udf()`), upgrade your MLflow client to a version >= 2.0 in"
+    " order to use the new request format. For more information about the updated MLflow"
+    " Model scoring protocol in MLflow 2.0, see"
+    " https://mlflow.org/docs/latest/models.html#deploy-mlflow-models."
+)
+
+
+def _get_orjson():
+    """
+    :return: The ``orjson`` module if the scoring server is configured to use it and it's
+             installed, ``None`` otherwise.
+    """
+    if not MLFLOW_SCORING_SERVER_USE_ORJSON.get():
+        return None
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+def _loads_json(json_input):
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(json_input)
+        except orjson.JSONDecodeError:
+            # The NaN and Infinity literals produced by the json module aren't valid JSON and
+            # are rejected by orjson
+            pass
+    return json.loads(json_input)
+
+
+def infer_and_parse_json_input(json_input, schema: Schema = None):
+    """
+    :param json_input: A JSON-formatted string representation of TF serving input or a Pandas
+                       DataFrame, or a stream containing such a string representation.
+    :param schema: Optional schema specification to be used during parsing.
+    """
+    if isinstance(json_input, dict):
+        decoded_input = json_input
+    else:
+        try:
+            decoded_input = _loads_json(json_input)
+        except json.decoder.JSONDecodeError as ex:
+            raise MlflowException(
+                message=(
+                    "Failed to parse input from JSON. Ensure that input is a valid JSON"
+                    f" formatted string. Error: '{ex}'. Input: \n{json_input}\n"
+                ),
+                error_code=BAD_REQUEST,
+            )
+    if isinstance(decoded_input, dict):
+        format_keys = set(decoded_input.keys()).intersection(SUPPORTED_FORMATS)
+        if len(format_keys) != 1:
+            message = f"Received dictionary with input fields: {list(decoded_input.keys())}"
+            raise MlflowException(
+                message=f"{REQUIRED_INPUT_FORMAT}. {message}. {SCORING_PROTOCOL_CHANGE_INFO}",
+                error_code=BAD_REQUEST,
+            )
+        input_format = format_keys.pop()
+        if input_format in (INSTANCES, INPUTS):
+            return parse_tf_serving_input(decoded_input, schema=schema)
+
+        elif input_format in (DF_SPLIT, DF_RECORDS):
+            # NB: skip the dataframe_ prefix
+            pandas_orient = input_format[10:]
+            return dataframe_from_parsed_json(
+                decoded_input[input_format], pandas_orient=pandas_orient, schema=schema
+            )
+    elif isinstance(decoded_input, list):
+        message = "Received a list"
+        raise MlflowException(
+            message=f"{REQUIRED_INPUT_FORMAT}. {message}. {SCORING_PROTOCOL_CHANGE_INFO}",
+            error_code=BAD_REQUEST,
+        )
+    else:
+        message = f"Received unexpected input type '{type(decoded_input)}'"
+        raise MlflowException(
+            message=f"{REQUIRED_INPUT_FORMAT}. {message}.", error_code=BAD_REQUEST
+        )
+
+
+def parse_csv_input(csv_input, schema: Schema = None):
+    """
+    :param csv_input: A CSV-formatted string representation of a Pandas DataFrame, or a stream
+                      containing such a string representation.
+    :param schema: Optional schema specification to be used during parsing.
+    """
+    import pandas as pd
+
+    try:
+        if schema is None:
+            return pd.read_csv(csv_input)
+        else:
+            dtypes = dict(zip(schema.input_names(), schema.pandas_types()))
+            return pd.read_csv(csv_input, dtype=dtypes)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is"
+                " a valid CSV-formatted Pandas DataFrame produced using the"
+                " `pandas.DataFrame.to_csv()` method."
+            ),
+            error_code=BAD_REQUEST,
+        )
+
+
+def dataframe_from_columnar_bytes(data, content_type):
+    """
+    :param data: A DataFrame serialized by :py:func:`dataframe_to_columnar_bytes`.
+    :param content_type: One of ``COLUMNAR_CONTENT_TYPES``.
+    """
+    import pyarrow as pa
+
+    if content_type == CONTENT_TYPE_ARROW:
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(pa.BufferReader(data))
+    return table.to_pandas()
+
+
+def dataframe_to_columnar_bytes(pdf, content_type):
+    """
+    :param pdf: The DataFrame to serialize. Its index isn't serialized.
+    :param content_type: One of ``COLUMNAR_CONTENT_TYPES``.
+    :return: The DataFrame serialized in the Arrow IPC stream format or the Parquet format.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(pdf, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    if content_type == CONTENT_TYPE_ARROW:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def parse_columnar_input(data, content_type, schema: Schema = None):
+    """
+    :param data: A Pandas DataFrame in the Arrow IPC stream format or the Parquet format, as bytes.
+    :param content_type: One of ``COLUMNAR_CONTENT_TYPES``.
+    :param schema: Optional schema specification used to cast the numeric columns, as is done for
+                   JSON inputs. The other columns keep the types they were serialized with.
+    """
+    try:
+        pdf = dataframe_from_columnar_bytes(data, content_type)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                f"Failed to parse input as a Pandas DataFrame. Ensure that the input is a valid"
+                f" DataFrame serialized in the '{content_type}' format."
+            ),
+            error_code=BAD_REQUEST,
+        )
+    if schema is None or not schema.has_input_names() or schema.is_tensor_spec():
+        return pdf
+
+    numeric_types = {
+        DataType.boolean,
+        DataType.integer,
+        DataType.long,
+        DataType.float,
+        DataType.double,
+    }
+    for name, col_type in zip(schema.input_names(), schema.input_types()):
+        if name in pdf.columns and col_type in numeric_types:
+            try:
+                pdf[name] = pdf[name].astype(col_type.to_pandas(), copy=False)
+            except Exception:
+                _handle_serving_error(
+                    error_message=f"Failed to convert column {name} to type '{col_type}'.",
+                    error_code=BAD_REQUEST,
+                )
+    return pdf
+
+
+def predictions_to_columnar_bytes(raw_predictions, content_type):
+    """
+    :return: The predictions serialized in the given columnar format, or ``None`` if they aren't
+             tabular and must be serialized as JSON.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(raw_predictions, pd.DataFrame):
+        pdf = raw_predictions
+    elif isinstance(raw_predictions, pd.Series):
+        pdf = raw_predictions.to_frame()
+    elif isinstance(raw_predictions, np.ndarray) and raw_predictions.ndim in (1, 2):
+        pdf = pd.DataFrame(raw_predictions)
+    else:
+        return None
+    try:
+        return dataframe_to_columnar_bytes(pdf, content_type)
+    except Exception as e:
+        _logger.debug("Failed to serialize the predictions in the '%s' format: %s", content_type, e)
+        return None
+
+
+def _get_accepted_columnar_content_type(accept):
+    """
+    :param accept: The value of the ``Accept`` header of the request, if any.
+    :return: The first columnar content type accepted by the client, or ``None``.
+    """
+    for media_range in (accept or "").split(","):
+        mime_type = media_range.split(";")[0].strip()
+        if mime_type in COLUMNAR_CONTENT_TYPES:
+            return mime_type
+    return None
+
+
+def predictions_to_json(raw_predictions, output, metadata=None):
+    if metadata and "predictions" in metadata:
+        raise MlflowException(
+            "metadata cannot contain 'predictions' key", error_code=INVALID_PARAMETER_VALUE
+        )
+    predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
+    payload = {"predictions": predictions, **(metadata or {})}
+    orjson = _get_orjson()
+    if orjson is not None:
+        encoded = orjson.dumps(
+            payload,
+            default=NumpyEncoder().default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+        output.write(encoded.decode("utf-8"))
+    else:
+        output.write(json.dumps(payload, cls=NumpyEncoder))
+
+
+def _handle_serving_error(error_message, error_code, include_traceback=True):
+    """
+    Logs information about an exception thrown by model inference code that is currently being
+    handled and reraises it with the specified error message. The exception stack trace
+    is also included in the reraised error message.
+
+    :param error_message: A message for the reraised exception.
+    :param error_code: An appropriate error code for the reraised exception. This should be one of
+                       the codes listed in the `mlflow.protos.databricks_pb2` proto.
+    :param include_traceback: Whether to include the current traceback in the returned error.
+    """
+    if include_traceback:
+        traceback_buf = StringIO()
+        traceback.print_exc(file=traceback_buf)
+        traceback_str = traceback_buf.getvalue()
+        e = MlflowException(message=error_message, error_code=error_code, stack_trace=traceback_str)
+    else:
+        e = MlflowException(message=error_message, error_code=error_code)
+    reraise(MlflowException, e)
+
+
+InvocationsResponse = namedtuple("InvocationsResponse", ["response", "status", "mimetype"])
+
+
+def _get_micro_batcher(model: PyFuncModel):
+    """
+    :return: A ``MicroBatcher`` predicting with the model if micro-batching is enabled, ``None``
+             otherwise.
+    """
+    max_batch_size = MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get()
+    if not max_batch_size:
+        return None
+
+    from mlflow.pyfunc.scoring_server.batching import MicroBatcher
+
+    return MicroBatcher(
+        model.predict,
+        max_batch_size=max_batch_size,
+        max_wait_ms=MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS.get(),
+    )
+
+
+def invocations(data, content_type, predict, input_schema, accept=None):
+    """
+    Do an inference on a single batch of data. In this sample server,
+    we take data as CSV, json, Arrow or Parquet, convert it to a Pandas DataFrame or Numpy,
+    generate predictions and convert them back to json, or to Arrow or Parquet if requested.
+
+    :param data: The body of the request, as bytes.
+    :param content_type: The value of the ``Content-Type`` header of the request.
+    :param predict: The function generating the predictions, typically ``PyFuncModel.predict``.
+    :param input_schema: The input schema of the model, if any.
+    :param accept: The value of the ``Accept`` header of the request, if any.
+    :return: An ``InvocationsResponse``. Errors are raised as ``MlflowException``.
+    """
+
+    # Content-Type can include other attributes like CHARSET
+    # Content-type RFC: https://datatracker.ietf.org/doc/html/rfc2045#section-5.1
+    # TODO: Suport ";" in quoted parameter values
+    type_parts = content_type.split(";")
+    type_parts = list(map(str.strip, type_parts))
+    mime_type = type_parts[0]
+    parameter_value_pairs = type_parts[1:]
+    parameter_values = {}
+    for parameter_value_pair in parameter_value_pairs:
+        (key, _, value) = parameter_value_pair.partition("=")
+        parameter_values[key] = value
+
+    charset = parameter_values.get("charset", "utf-8").lower()
+    if charset != "utf-8":
+        return InvocationsResponse(
+            response="The scoring server only supports UTF-8",
+            status=415,
+            mimetype="text/plain",
+        )
+
+    unexpected_content_parameters = set(parameter_values.keys()).difference({"charset"})
+    if unexpected_content_parameters:
+        return InvocationsResponse(
+            response=(
+                f"Unrecognized content type parameters: "
+                f"{', '.join(unexpected_content_parameters)}. "
+                f"{SCORING_PROTOCOL_CHANGE_INFO}"
+            ),
+            status=415,
+            mimetype="text/plain",
+        )
+    # Convert from CSV to pandas
+    if mime_type == CONTENT_TYPE_CSV:
+        csv_input = StringIO(data.decode("utf-8"))
+        data = parse_csv_input(csv_input=csv_input, schema=input_schema)
+    elif mime_type == CONTENT_TYPE_JSON:
+        json_str = data.decode("utf-8")
+        data = infer_and_parse_json_input(json_str, input_schema)
+    elif mime_type in COLUMNAR_CONTENT_TYPES:
+        data = parse_columnar_input(data, mime_type, input_schema)
+    else:
+        return InvocationsResponse(
+            response=(
+                "This predictor only supports the following content types:"
+                f" Types: {CONTENT_TYPES}."
+                f" Got '{content_type}'."
+            ),
+            status=415,
+            mimetype="text/plain",
+        )
+
+    # Do the prediction
+    try:
+        raw_predictions = predict(data)
+    except MlflowException as e:
+        raise e
+    except Exception:
+        raise MlflowException(
+            message=(
+                "Encountered an unexpected error while evaluating the model. Verify"
+                " that the serialized input Dataframe is compatible with the model for"
+                " inference."
+            ),
+            error_code=BAD_REQUEST,
+            stack_trace=traceback.format_exc(),
+        )
+    response_content_type = _get_accepted_columnar_content_type(accept)
+    if response_content_type is not None:
+        result = predictions_to_columnar_bytes(raw_predictions, response_content_type)
+        if result is not None:
+            return InvocationsResponse(response=result, status=200, mimetype=response_content_type)
+    result = StringIO()
+    predictions_to_json(raw_predictions, result)
+    return InvocationsResponse(response=result.getvalue(), status=200, mimetype="application/json")
+
+
+def init(model: PyFuncModel):
+    """
+    Initialize the server. Loads pyfunc model from the path.
+    """
+    app = flask.Flask(__name__)
+    input_schema = model.metadata.get_input_schema()
+    batcher = _get_micro_batcher(model)
+    predict = batcher.predict if batcher else model.predict
+
+    if batcher:
+
+        @app.route("/metrics", methods=["GET"])
+        def metrics():
+            """
+            Returns the micro-batching histograms in the Prometheus text format.
+            """
+            return flask.Response(
+                response=batcher.get_metrics(), status=200, mimetype=CONTENT_TYPE_PROMETHEUS
+            )
+
+    @app.route("/ping", methods=["GET"])
+    @app.route("/health", methods=["GET"])
+    def ping():
+        """
+        Determine if the container is working and healthy.
+        We declare it healthy if we can load the model successfully.
+        """
+        health = model is not None
+        status = 200 if health else 404
+        return flask.Response(response="\n", status=status, mimetype="application/json")
+
+    @app.route("/version", methods=["GET"])
+    def version():
+        """
+        Returns the current mlflow version.
+        """
+        return flask.Response(response=VERSION, status=200, mimetype="application/json")
+
+    @app.route("/invocations", methods=["POST"])
+    @catch_mlflow_exception
+    def transformation():
+        """
+        Do an inference on a single batch of data.
+        """
+        result = invocations(
+            flask.request.data,
+            flask.request.content_type,
+            predict,
+            input_schema,
+            accept=flask.request.headers.get("Accept"),
+        )
+        return flask.Response(
+            response=result.response, status=result.status, mimetype=result.mimetype
+        )
+
+    return app
+
+
+def _predict(model_uri, input_path, output_path, content_type):
+    pyfunc_model = load_model(model_uri)
+
+    if content_type == "json":
+        if input_path is None:
+            input_str = sys.stdin.read()
+        else:
+            with open(input_path) as f:
+                input_str = f.read()
+        df = infer_and_parse_json_input(input_str)
+    elif content_type == "csv":
+        if input_path is not None:
+            df = parse_csv_input(input_path)
+        else:
+            df = parse_csv_input(sys.stdin)
+    else:
+        raise Exception(f"Unknown content type '{content_type}'")
+
+    if output_path is None:
+        predictions_to_json(pyfunc_model.predict(df), sys.stdout)
+    else:
+        with open(output_path, "w") as fout:
+            predictions_to_json(pyfunc_model.predict(df), fout)
+
+
+def _serve(model_uri, port, host):
+    pyfunc_model = load_model(model_uri)
+    init(pyfunc_model).run(port=port, host=host)
+
+
+def get_cmd(
+    model_uri: str,
+    port: int = None,
+    host: int = None,
+    timeout: int = None,
+    nworkers: int = None,
+    enable_asgi: bool = False,
+) -> Tuple[str, Dict[str, str]]:
+    local_uri = path_to_local_file_uri(model_uri)
+    timeout = timeout or MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.get()
+    # Requests are only batched together if they are handled concurrently by the same worker
+    max_batch_size = MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get()
+    batching_threads = min(max_batch_size, _MAX_BATCHING_THREADS) if max_batch_size else None
+    command_env = os.environ.copy()
+    # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
+    # platform compatibility.
+    if enable_asgi:
+        args = []
+        if host:
+            args.append(f"--host={host}")
+
+        if port:
+            args.append(f"--port={port}")
+
+        if nworkers:
+            args.append(f"--workers={nworkers}")
+
+        # uvicorn doesn't time out requests, the ASGI app does
+        command_env[MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.name] = str(timeout)
+        command = f"uvicorn {' '.join(args)} --factory mlflow.pyfunc.scoring_server.asgi:create_app"
+    elif os.name != "nt":
+        args = [f"--timeout={timeout}"]
+        if port and host:
+            args.append(f"-b {host}:{port}")
+        elif host:
+            args.append(f"-b {host}")
+
+        if nworkers:
+            args.append(f"-w {nworkers}")
+
+        if batching_threads:
+            args.append(f"--threads={batching_threads}")
+
+        if MLFLOW_SCORING_SERVER_PRELOAD_MODEL.get():
+            args.append("--preload")
+
+        command = (
+            f"gunicorn {' '.join(args)} ${{GUNICORN_CMD_ARGS}}"
+            " -- mlflow.pyfunc.scoring_server.wsgi:app"
+        )
+    else:
+        args = []
+        if host:
+            args.append(f"--host={host}")
+
+        if port:
+            args.append(f"--port={port}")
+
+        if batching_threads:
+            args.append(f"--threads={batching_threads}")
+
+        command = (
+            f"waitress-serve {' '.join(args)} "
+            "--ident=mlflow mlflow.pyfunc.scoring_server.wsgi:app"
+        )
+
+    command_env[_SERVER_MODEL_PATH] = local_uri
+
+    return command, command_env
@@ -0,0 +1,251 @@
+"""
+Adaptive micro-batching of scoring requests.
+
+Concurrent ``/invocations`` requests handled by the same scoring server process are queued and
+predicted together: a background thread concatenates the inputs of the queued requests into a
+single DataFrame or array of up to ``max_batch_size`` rows, calls the model once and splits the
+predictions back per request. When the server is idle, a request waits at most ``max_wait_ms``
+for other requests to batch with; under load, the requests queued while the previous batch was
+being predicted are batched without waiting.
+
+Only inputs that can be concatenated are batched: DataFrames with the same columns and dtypes,
+and arrays with the same trailing dimensions and dtype. Other inputs, and inputs that don't fit in
+a batch on their own, are predicted directly.
+"""
+import logging
+import queue
+import threading
+import time
+from bisect import bisect_left
+
+_logger = logging.getLogger(__name__)
+
+_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class _Histogram:
+    """
+    Thread-safe histogram rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, name, description, buckets):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def to_prometheus(self):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        cumulative_count = 0
+        for bucket, count in zip([*self.buckets, "+Inf"], counts):
+            cumulative_count += count
+            lines.append(f'{self.name}_bucket{{le="{bucket}"}} {cumulative_count}')
+        lines.append(f"{self.name}_sum {total}")
+        lines.append(f"{self.name}_count {cumulative_count}")
+        return "\n".join(lines) + "\n"
+
+
+def _get_batch_key(data):
+    """
+    :return: A key that is equal for inputs that can be concatenated, or ``None`` if the input
+             can't be batched.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        return ("dataframe", tuple(data.columns), tuple(str(dtype) for dtype in data.dtypes))
+    if isinstance(data, np.ndarray) and data.ndim >= 1:
+        return ("ndarray", data.shape[1:], data.dtype.str)
+    return None
+
+
+def _concat(inputs):
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(inputs[0], pd.DataFrame):
+        return pd.concat(inputs, ignore_index=True)
+    return np.concatenate(inputs)
+
+
+def _split(predictions, sizes):
+    """
+    Splits the predictions of a batch into the predictions of each request.
+
+    :return: A list with the predictions of each request, or ``None`` if the predictions don't
+             have one row per input row.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(predictions, (pd.DataFrame, pd.Series)):
+        # Give the predictions of each request the index they would have if predicted on their own
+        get_rows = lambda start, end: predictions.iloc[start:end].reset_index(drop=True)
+    elif isinstance(predictions, (np.ndarray, list)) and np.ndim(predictions) >= 1:
+        get_rows = lambda start, end: predictions[start:end]
+    else:
+        return None
+    if len(predictions) != sum(sizes):
+        return None
+
+    results = []
+    start = 0
+    for size in sizes:
+        results.append(get_rows(start, start + size))
+        start += size
+    return results
+
+
+class _PredictionRequest:
+    def __init__(self, data, batch_key):
+        self.data = data
+        self.num_rows = len(data)
+        self.batch_key = batch_key
+        self.enqueued_at = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    Batches the inputs of concurrent calls to :py:meth:`predict`.
+
+    :param predict_fn: The function predicting a batch, typically ``PyFuncModel.predict``.
+    :param max_batch_size: The maximum number of rows predicted by a single call to
+                           ``predict_fn``.
+    :param max_wait_ms: The maximum time, in milliseconds, that a request waits for other requests
+                        to batch with.
+    """
+
+    def __init__(self, predict_fn, max_batch_size, max_wait_ms):
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+        size_buckets = []
+        bucket = 1
+        while bucket < max_batch_size:
+            size_buckets.append(bucket)
+            bucket *= 2
+        size_buckets.append(max_batch_size)
+        self.batch_size_histogram = _Histogram(
+            "mlflow_scoring_server_batch_size",
+            "Number of input rows passed to each call to the model.",
+            size_buckets,
+        )
+        self.latency_histogram = _Histogram(
+            "mlflow_scoring_server_prediction_latency_ms",
+            "Time taken to predict a request, including the time spent waiting for a batch.",
+            _LATENCY_BUCKETS_MS,
+        )
+
+    def _call_predict_fn(self, data):
+        self.batch_size_histogram.observe(len(data) if hasattr(data, "__len__") else 1)
+        return self._predict_fn(data)
+
+    def predict(self, data):
+        """
+        Predicts the given input, batched with the inputs of concurrent calls when possible.
+        """
+        start = time.monotonic()
+        try:
+            batch_key = _get_batch_key(data)
+            if batch_key is None or len(data) >= self._max_batch_size:
+                return self._call_predict_fn(data)
+
+            request = _PredictionRequest(data, batch_key)
+            self._ensure_worker()
+            self._queue.put(request)
+            request.done.wait()
+            if request.error is not None:
+                raise request.error
+            return request.result
+        finally:
+            self.latency_histogram.observe((time.monotonic() - start) * 1000)
+
+    def _ensure_worker(self):
+        # The worker is started lazily so that it's started in the server worker processes rather
+        # than in a parent process that forks them
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="MlflowScoringServerBatcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        next_request = None
+        while True:
+            first = next_request or self._queue.get()
+            next_request = None
+            batch = [first]
+            num_rows = first.num_rows
+            # Requests that already waited for the previous batch to be predicted don't wait again
+            deadline = first.enqueued_at + self._max_wait_seconds
+            while num_rows < self._max_batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    if timeout > 0:
+                        request = self._queue.get(timeout=timeout)
+                    else:
+                        request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if (
+                    request.batch_key != first.batch_key
+                    or num_rows + request.num_rows > self._max_batch_size
+                ):
+                    next_request = request
+                    break
+                batch.append(request)
+                num_rows += request.num_rows
+            self._predict_batch(batch)
+
+    def _predict_one(self, request):
+        try:
+            request.result = self._call_predict_fn(request.data)
+        except BaseException as e:
+            request.error = e
+        finally:
+            request.done.set()
+
+    def _predict_batch(self, batch):
+        if len(batch) == 1:
+            self._predict_one(batch[0])
+            return
+
+        try:
+            predictions = self._call_predict_fn(_concat([request.data for request in batch]))
+            results = _split(predictions, [request.num_rows for request in batch])
+        except Exception as e:
+            # Predict the requests one by one so that an invalid input only fails its own request
+            _logger.debug("Failed to predict a batch of %d requests: %s", len(batch), e)
+            results = None
+
+        if results is None:
+            for request in batch:
+                self._predict_one(request)
+        else:
+            for request, result in zip(batch, results):
+                request.result = result
+                request.done.set()
+
+    def get_metrics(self):
+        """
+        :return: The batch size and latency histograms in the Prometheus text exposition format.
+        """
+        return self.batch_size_histogram.to_prometheus() + self.latency_histogram.to_prometheus()
@@ -0,0 +1 @@
+from . import ml  # pylint: disable=unused-import
@@ -0,0 +1,5 @@
+from mlflow.recipes.regression.v1.recipe import (
+    RegressionRecipe as RecipeImpl,
+)
+
+__all__ = ["RecipeImpl"]
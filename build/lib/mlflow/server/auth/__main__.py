@@ -0,0 +1,5 @@
+from .cli import commands
+
+
+if __name__ == "__main__":
+    commands()
@@ -0,0 +1,249 @@
+from typing import List
+from sqlalchemy.exc import IntegrityError, NoResultFound, MultipleResultsFound
+from sqlalchemy.orm import sessionmaker
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import (
+    RESOURCE_ALREADY_EXISTS,
+    RESOURCE_DOES_NOT_EXIST,
+    INVALID_STATE,
+)
+from mlflow.server.auth.entities import User, ExperimentPermission, RegisteredModelPermission
+from mlflow.server.auth.permissions import _validate_permission
+from mlflow.server.auth.db.models import (
+    SqlUser,
+    SqlExperimentPermission,
+    SqlRegisteredModelPermission,
+)
+from mlflow.server.auth.db import utils as dbutils
+from mlflow.store.db.utils import create_sqlalchemy_engine_with_retry, _get_managed_session_maker
+from mlflow.utils.uri import extract_db_type_from_uri
+from mlflow.utils.validation import _validate_username
+
+
+class SqlAlchemyStore:
+    def init_db(self, db_uri):
+        self.db_uri = db_uri
+        self.db_type = extract_db_type_from_uri(db_uri)
+        self.engine = create_sqlalchemy_engine_with_retry(db_uri)
+        dbutils.migrate_if_needed(self.engine, "head")
+        SessionMaker = sessionmaker(bind=self.engine)
+        self.ManagedSessionMaker = _get_managed_session_maker(SessionMaker, self.db_type)
+
+    def authenticate_user(self, username: str, password: str) -> bool:
+        with self.ManagedSessionMaker() as session:
+            try:
+                user = self._get_user(session, username)
+                return check_password_hash(user.password_hash, password)
+            except MlflowException:
+                return False
+
+    def create_user(self, username: str, password: str, is_admin: bool = False) -> User:
+        _validate_username(username)
+        pwhash = generate_password_hash(password)
+        with self.ManagedSessionMaker() as session:
+            try:
+                user = SqlUser(username=username, password_hash=pwhash, is_admin=is_admin)
+                session.add(user)
+                session.flush()
+                return user.to_mlflow_entity()
+            except IntegrityError as e:
+                raise MlflowException(
+                    f"User (username={username}) already exists. Error: {e}",
+                    RESOURCE_ALREADY_EXISTS,
+                )
+
+    @staticmethod
+    def _get_user(session, username: str) -> SqlUser:
+        try:
+            return session.query(SqlUser).filter(SqlUser.username == username).one()
+        except NoResultFound:
+            raise MlflowException(
+                f"User with username={username} not found",
+                RESOURCE_DOES_NOT_EXIST,
+            )
+        except MultipleResultsFound:
+            raise MlflowException(
+                f"Found multiple users with username={username}",
+                INVALID_STATE,
+            )
+
+    def has_user(self, username: str) -> bool:
+        with self.ManagedSessionMaker() as session:
+            return session.query(SqlUser).filter(SqlUser.username == username).first() is not None
+
+    def get_user(self, username: str) -> User:
+        with self.ManagedSessionMaker() as session:
+            return self._get_user(session, username).to_mlflow_entity()
+
+    def list_users(self) -> List[User]:
+        with self.ManagedSessionMaker() as session:
+            users = session.query(SqlUser).all()
+            return [u.to_mlflow_entity() for u in users]
+
+    def update_user(self, username: str, password: str = None, is_admin: bool = None) -> User:
+        with self.ManagedSessionMaker() as session:
+            user = self._get_user(session, username)
+            if password is not None:
+                pwhash = generate_password_hash(password)
+                user.password_hash = pwhash
+            if is_admin is not None:
+                user.is_admin = is_admin
+            return user.to_mlflow_entity()
+
+    def delete_user(self, username: str):
+        with self.ManagedSessionMaker() as session:
+            user = self._get_user(session, username)
+            session.delete(user)
+
+    def create_experiment_permission(
+        self, experiment_id: str, username: str, permission: str
+    ) -> ExperimentPermission:
+        _validate_permission(permission)
+        with self.ManagedSessionMaker() as session:
+            try:
+                user = self._get_user(session, username=username)
+                perm = SqlExperimentPermission(
+                    experiment_id=experiment_id, user_id=user.id, permission=permission
+                )
+                session.add(perm)
+                session.flush()
+                return perm.to_mlflow_entity()
+            except IntegrityError as e:
+                raise MlflowException(
+                    f"Experiment permission (experiment_id={experiment_id}, username={username}) "
+                    f"already exists. Error: {e}",
+                    RESOURCE_ALREADY_EXISTS,
+                )
+
+    def _get_experiment_permission(
+        self, session, experiment_id: str, username: str
+    ) -> SqlExperimentPermission:
+        try:
+            user = self._get_user(session, username=username)
+            return (
+                session.query(SqlExperimentPermission)
+                .filter(
+                    SqlExperimentPermission.experiment_id == experiment_id,
+                    SqlExperimentPermission.user_id == user.id,
+                )
+                .one()
+            )
+        except NoResultFound:
+            raise MlflowException(
+                f"Experiment permission with experiment_id={experiment_id} and "
+                f"username={username} not found",
+                RESOURCE_DOES_NOT_EXIST,
+            )
+        except MultipleResultsFound:
+            raise MlflowException(
+                f"Found multiple experiment permissions with experiment_id={experiment_id} "
+                f"and username={username}",
+                INVALID_STATE,
+            )
+
+    def get_experiment_permission(self, experiment_id: str, username: str) -> ExperimentPermission:
+        with self.ManagedSessionMaker() as session:
+            return self._get_experiment_permission(
+                session, experiment_id, username
+            ).to_mlflow_entity()
+
+    def list_experiment_permissions(self, username: str) -> List[ExperimentPermission]:
+        with self.ManagedSessionMaker() as session:
+            user = self._get_user(session, username=username)
+            perms = (
+                session.query(SqlExperimentPermission)
+                .filter(SqlExperimentPermission.user_id == user.id)
+                .all()
+            )
+            return [p.to_mlflow_entity() for p in perms]
+
+    def update_experiment_permission(
+        self, experiment_id: str, username: str, permission: str
+    ) -> ExperimentPermission:
+        _validate_permission(permission)
+        with self.ManagedSessionMaker() as session:
+            perm = self._get_experiment_permission(session, experiment_id, username)
+            perm.permission = permission
+            return perm.to_mlflow_entity()
+
+    def delete_experiment_permission(self, experiment_id: str, username: str):
+        with self.ManagedSessionMaker() as session:
+            perm = self._get_experiment_permission(session, experiment_id, username)
+            session.delete(perm)
+
+    def create_registered_model_permission(
+        self, name: str, username: str, permission: str
+    ) -> RegisteredModelPermission:
+        _validate_permission(permission)
+        with self.ManagedSessionMaker() as session:
+            try:
+                user = self._get_user(session, username=username)
+                perm = SqlRegisteredModelPermission(
+                    name=name, user_id=user.id, permission=permission
+                )
+                session.add(perm)
+                session.flush()
+                return perm.to_mlflow_entity()
+            except IntegrityError as e:
+                raise MlflowException(
+                    f"Registered model permission (name={name}, username={username}) "
+                    f"already exists. Error: {e}",
+                    RESOURCE_ALREADY_EXISTS,
+                )
+
+    def _get_registered_model_permission(
+        self, session, name: str, username: str
+    ) -> SqlRegisteredModelPermission:
+        try:
+            user = self._get_user(session, username=username)
+            return (
+                session.query(SqlRegisteredModelPermission)
+                .filter(
+                    SqlRegisteredModelPermission.name == name,
+                    SqlRegisteredModelPermission.user_id == user.id,
+                )
+                .one()
+            )
+        except NoResultFound:
+            raise MlflowException(
+                f"Registered model permission with name={name} and username={username} not found",
+                RESOURCE_DOES_NOT_EXIST,
+            )
+        except MultipleResultsFound:
+            raise MlflowException(
+                f"Found multiple registered model permissions with name={name} "
+                f"and username={username}",
+                INVALID_STATE,
+            )
+
+    def get_registered_model_permission(
+        self, name: str, username: str
+    ) -> RegisteredModelPermission:
+        with self.ManagedSessionMaker() as session:
+            return self._get_registered_model_permission(session, name, username).to_mlflow_entity()
+
+    def list_registered_model_permissions(self, username: str) -> List[RegisteredModelPermission]:
+        with self.ManagedSessionMaker() as session:
+            user = self._get_user(session, username=username)
+            perms = (
+                session.query(SqlRegisteredModelPermission)
+                .filter(SqlRegisteredModelPermission.user_id == user.id)
+                .all()
+            )
+            return [p.to_mlflow_entity() for p in perms]
+
+    def update_registered_model_permission(
+        self, name: str, username: str, permission: str
+    ) -> RegisteredModelPermission:
+        _validate_permission(permission)
+        with self.ManagedSessionMaker() as session:
+            perm = self._get_registered_model_permission(session, name, username)
+            perm.permission = permission
+            return perm.to_mlflow_entity()
+
+    def delete_registered_model_permission(self, name: str, username: str):
+        with self.ManagedSessionMaker() as session:
+            perm = self._get_registered_model_permission(session, name, username)
+            session.delete(perm)
@@ -0,0 +1,77 @@
+from prometheus_client import Counter, Histogram
+from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+from flask import request
+
+from mlflow.store.artifact.instrumentation import register_artifact_transfer_listener
+from mlflow.version import VERSION
+
+
+class ArtifactTransferMetrics:
+    """
+    Artifact transfer listener counting the artifacts transferred by the server, e.g. when it proxies
+    artifact uploads and downloads.
+    """
+
+    def __init__(self, registry=None):
+        labels = ["operation", "scope", "backend"]
+        kwargs = {} if registry is None else {"registry": registry}
+        self.transfers = Counter(
+            "mlflow_artifact_transfers",
+            "Number of artifact transfers",
+            labels + ["status"],
+            **kwargs,
+        )
+        self.transferred_bytes = Counter(
+            "mlflow_artifact_transferred_bytes",
+            "Number of bytes of transferred artifacts",
+            labels,
+            **kwargs,
+        )
+        self.retries = Counter(
+            "mlflow_artifact_transfer_retries",
+            "Number of requests retried by artifact transfers",
+            labels,
+            **kwargs,
+        )
+        self.duration = Histogram(
+            "mlflow_artifact_transfer_duration_seconds",
+            "Duration of artifact transfers",
+            labels,
+            **kwargs,
+        )
+
+    def __call__(self, event):
+        labels = {"operation": event.operation, "scope": event.scope, "backend": event.backend}
+        status = "success" if event.error is None else "failure"
+        self.transfers.labels(status=status, **labels).inc()
+        self.transferred_bytes.labels(**labels).inc(event.num_bytes)
+        self.retries.labels(**labels).inc(event.retries)
+        self.duration.labels(**labels).observe(event.duration_seconds)
+
+
+_artifact_transfer_metrics = None
+
+
+def _register_artifact_transfer_metrics():
+    global _artifact_transfer_metrics
+
+    # The metrics can only be registered once in the default Prometheus registry
+    if _artifact_transfer_metrics is None:
+        _artifact_transfer_metrics = ArtifactTransferMetrics()
+        register_artifact_transfer_listener(_artifact_transfer_metrics)
+
+
+def activate_prometheus_exporter(app):
+    def mlflow_version(_: request):
+        return VERSION
+
+    metrics = GunicornInternalPrometheusMetrics(
+        app,
+        export_defaults=True,
+        defaults_prefix="mlflow",
+        excluded_paths=["/health", "/version"],
+        group_by=mlflow_version,
+    )
+    _register_artifact_transfer_metrics()
+
+    return metrics
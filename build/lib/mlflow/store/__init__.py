@@ -0,0 +1,9 @@
+from mlflow.store.tracking import abstract_store
+from mlflow.store.artifact import artifact_repo
+
+__all__ = [
+    # tracking server meta-data stores
+    "abstract_store",
+    # artifact repository stores
+    "artifact_repo",
+]
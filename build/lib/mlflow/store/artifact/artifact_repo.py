@@ -0,0 +1,461 @@
+import os
+import posixpath
+import re
+import tempfile
+import uuid
+from abc import abstractmethod, ABCMeta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from mlflow.environment_variables import MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_MAX_WORKERS
+from mlflow.exceptions import MlflowException
+from mlflow.entities.file_info import FileInfo
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.download_planner import DownloadPlanner
+from mlflow.store.artifact.instrumentation import _ProgressBar, instrument_artifact_repository
+from mlflow.utils.annotations import developer_stable
+from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.utils.validation import path_not_unique, bad_path_message
+
+
+# Constants used to determine max level of parallelism to use while uploading/downloading artifacts.
+# Max threads to use for parallelism.
+_NUM_MAX_THREADS = 20
+# Max threads per CPU
+_NUM_MAX_THREADS_PER_CPU = 2
+assert _NUM_MAX_THREADS >= _NUM_MAX_THREADS_PER_CPU
+assert _NUM_MAX_THREADS_PER_CPU > 0
+# Default number of CPUs to assume on the machine if unavailable to fetch it using os.cpu_count()
+_NUM_DEFAULT_CPUS = _NUM_MAX_THREADS // _NUM_MAX_THREADS_PER_CPU
+# Size of the chunks in which artifacts are streamed
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+@developer_stable
+class ArtifactRepository:
+    """
+    Abstract artifact repo that defines how to upload (log) and download potentially large
+    artifacts from different storage backends.
+    """
+
+    __metaclass__ = ABCMeta
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Report the transfers of the repository to the artifact transfer listeners
+        instrument_artifact_repository(cls)
+
+    def __init__(self, artifact_uri):
+        self.artifact_uri = artifact_uri
+        # Limit the number of threads used for artifact uploads/downloads. Use at most
+        # constants._NUM_MAX_THREADS threads or 2 * the number of CPU cores available on the
+        # system (whichever is smaller)
+        self.thread_pool = self._create_thread_pool()
+
+    def _create_thread_pool(self):
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    @abstractmethod
+    def log_artifact(self, local_file, artifact_path=None):
+        """
+        Log a local file as an artifact, optionally taking an ``artifact_path`` to place it in
+        within the run's artifacts. Run artifacts can be organized into directories, so you can
+        place the artifact in a directory this way.
+
+        :param local_file: Path to artifact to log
+        :param artifact_path: Directory within the run's artifact directory in which to log the
+                              artifact.
+        """
+        pass
+
+    @abstractmethod
+    def log_artifacts(self, local_dir, artifact_path=None):
+        """
+        Log the files in the specified local directory as artifacts, optionally taking
+        an ``artifact_path`` to place them in within the run's artifacts.
+
+        :param local_dir: Directory of local artifacts to log
+        :param artifact_path: Directory within the run's artifact directory in which to log the
+                              artifacts
+        """
+        pass
+
+    def _log_artifacts_concurrently(self, local_dir, artifact_path, log_file):
+        """
+        Log the files in the specified local directory as artifacts, uploading them concurrently
+        on the repository's thread pool.
+
+        :param local_dir: Directory of local artifacts to log
+        :param artifact_path: Directory within the run's artifact directory in which to log the
+                              artifacts
+        :param log_file: Function logging a single file, called with the path of the local file
+                         and the directory in which to log it, like :py:meth:`log_artifact`.
+        """
+        local_dir = os.path.abspath(local_dir)
+        # The total of the progress bar grows as the files are queued, so that the directory is
+        # only walked once
+        progress_bar = _ProgressBar.create(
+            f"Uploading artifacts to {self.artifact_uri}", total_bytes=0
+        )
+        futures = {}
+        for root, _, filenames in os.walk(local_dir):
+            if root == local_dir:
+                artifact_dir = artifact_path
+            else:
+                rel_path = os.path.relpath(root, local_dir)
+                rel_path = relative_path_to_artifact_path(rel_path)
+                artifact_dir = (
+                    posixpath.join(artifact_path, rel_path) if artifact_path else rel_path
+                )
+            for f in filenames:
+                local_file = os.path.join(root, f)
+                file_size = None
+                if progress_bar is not None:
+                    file_size = os.path.getsize(local_file)
+                    progress_bar.add_total(file_size)
+                fut = self.thread_pool.submit(log_file, local_file, artifact_dir)
+                futures[fut] = (local_file, file_size)
+
+        # Wait for uploads to complete and collect failures
+        failed_uploads = {}
+        for f in as_completed(futures):
+            local_file, file_size = futures[f]
+            try:
+                f.result()
+            except Exception as e:
+                failed_uploads[local_file] = repr(e)
+            else:
+                if progress_bar is not None:
+                    progress_bar.update(file_size)
+        if progress_bar is not None:
+            progress_bar.close()
+
+        if failed_uploads:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while uploading one or more artifacts"
+                    f" to {self.artifact_uri}: {failed_uploads}"
+                )
+            )
+
+    @abstractmethod
+    def list_artifacts(self, path):
+        """
+        Return all the artifacts for this run_id directly under path. If path is a file, returns
+        an empty list. Will error if path is neither a file nor directory.
+
+        :param path: Relative source path that contains desired artifacts
+
+        :return: List of artifacts as FileInfo listed directly under path.
+        """
+        pass
+
+    def _is_directory(self, artifact_path):
+        listing = self.list_artifacts(artifact_path)
+        return len(listing) > 0
+
+    def _create_download_destination(self, src_artifact_path, dst_local_dir_path=None):
+        """
+        Creates a local filesystem location to be used as a destination for downloading the artifact
+        specified by `src_artifact_path`. The destination location is a subdirectory of the
+        specified `dst_local_dir_path`, which is determined according to the structure of
+        `src_artifact_path`. For example, if `src_artifact_path` is `dir1/file1.txt`, then the
+        resulting destination path is `<dst_local_dir_path>/dir1/file1.txt`. Local directories are
+        created for the resulting destination location if they do not exist.
+
+        :param src_artifact_path: A relative, POSIX-style path referring to an artifact stored
+                                  within the repository's artifact root location.
+                                  `src_artifact_path` should be specified relative to the
+                                  repository's artifact root location.
+        :param dst_local_dir_path: The absolute path to a local filesystem directory in which the
+                                   local destination path will be contained. The local destination
+                                   path may be contained in a subdirectory of `dst_root_dir` if
+                                   `src_artifact_path` contains subdirectories.
+        :return: The absolute path to a local filesystem location to be used as a destination
+                 for downloading the artifact specified by `src_artifact_path`.
+        """
+        src_artifact_path = src_artifact_path.rstrip("/")  # Ensure correct dirname for trailing '/'
+        dirpath = posixpath.dirname(src_artifact_path)
+        local_dir_path = os.path.join(dst_local_dir_path, dirpath)
+        local_file_path = os.path.join(dst_local_dir_path, src_artifact_path)
+        if not os.path.exists(local_dir_path):
+            os.makedirs(local_dir_path, exist_ok=True)
+        return local_file_path
+
+    def list_artifacts_recursive(self, path=None):
+        """
+        Return all the artifact files under path, recursively. Empty directories are listed as
+        FileInfo with ``is_dir=True``. If path is a file or an empty directory, returns an empty
+        list.
+
+        :param path: Relative source path that contains desired artifacts
+
+        :return: List of artifacts as FileInfo listed under path, sorted by path.
+        """
+        return sorted(self._iter_artifacts_recursive(path), key=lambda f: f.path)
+
+    def _iter_artifacts_recursive(self, path):
+        """
+        Yield the artifacts listed by :py:meth:`list_artifacts_recursive` as they're listed, so
+        that :py:meth:`download_artifacts` can download them while the listing is in progress.
+
+        The default implementation calls ``list_artifacts`` once per directory. Repositories of
+        stores with a flat namespace override it to list all the artifacts at once.
+        """
+        for file_info in self.list_artifacts(path):
+            # prevent infinite loop, sometimes the dir is recursively included
+            if file_info.path in [".", path]:
+                continue
+            if file_info.is_dir:
+                is_empty_dir = True
+                for dir_file_info in self._iter_artifacts_recursive(file_info.path):
+                    is_empty_dir = False
+                    yield dir_file_info
+                if is_empty_dir:
+                    yield FileInfo(file_info.path, True, None)
+            else:
+                yield file_info
+
+    def download_artifacts(self, artifact_path, dst_path=None):
+        """
+        Download an artifact file or directory to a local directory if applicable, and return a
+        local path for it.
+        The caller is responsible for managing the lifecycle of the downloaded artifacts.
+
+        :param artifact_path: Relative source path to the desired artifacts.
+        :param dst_path: Absolute path of the local filesystem destination directory to which to
+                         download the specified artifacts. This directory must already exist.
+                         If unspecified, the artifacts will either be downloaded to a new
+                         uniquely-named directory on the local filesystem or will be returned
+                         directly in the case of the LocalArtifactRepository.
+
+        :return: Absolute path of the local filesystem location containing the desired artifacts.
+        """
+        if dst_path:
+            dst_path = os.path.abspath(dst_path)
+            if not os.path.exists(dst_path):
+                raise MlflowException(
+                    message=(
+                        "The destination path for downloaded artifacts does not"
+                        f" exist! Destination path: {dst_path}"
+                    ),
+                    error_code=RESOURCE_DOES_NOT_EXIST,
+                )
+            elif not os.path.isdir(dst_path):
+                raise MlflowException(
+                    message=(
+                        "The destination path for downloaded artifacts must be a directory!"
+                        f" Destination path: {dst_path}"
+                    ),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+        else:
+            dst_path = tempfile.mkdtemp()
+
+        progress_bar = _ProgressBar.create(f"Downloading artifacts from {self.artifact_uri}")
+        if progress_bar is None:
+            return DownloadPlanner(self, dst_path).download(artifact_path)
+        try:
+            return DownloadPlanner(
+                self, dst_path, progress_callback=progress_bar.report_download_progress
+            ).download(artifact_path)
+        finally:
+            progress_bar.close()
+
+    @abstractmethod
+    def _download_file(self, remote_file_path, local_path):
+        """
+        Download the file at the specified relative remote path and saves
+        it at the specified local path.
+
+        :param remote_file_path: Source path to the remote file, relative to the root
+                                 directory of the artifact repository.
+        :param local_path: The path to which to save the downloaded file.
+        """
+        pass
+
+    def _get_artifact_file_size(self, artifact_path):
+        """
+        Get the size in bytes of the artifact file at the specified path. Must be implemented by
+        the repositories that implement :py:meth:`_download_artifact_stream`.
+
+        :param artifact_path: Relative source path to the artifact file.
+        :return: The size of the file.
+        """
+        raise NotImplementedError()
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        """
+        Stream a range of bytes of the artifact file at the specified path without writing it to
+        the local filesystem. Repositories that can't stream artifacts raise
+        ``NotImplementedError``, in which case :py:meth:`download_artifacts` must be used instead.
+
+        :param artifact_path: Relative source path to the artifact file.
+        :param range_start: Offset of the first byte to stream.
+        :param range_end: Offset of the last byte to stream, inclusive. Defaults to the last byte
+                          of the file.
+        :return: An iterator over the chunks of bytes of the range.
+        """
+        raise NotImplementedError()
+
+    def _supports_file_range_downloads(self):
+        """
+        Whether :py:meth:`download_artifacts` can download large files in chunks downloaded in
+        parallel with :py:meth:`_download_file_range`, which requires
+        :py:meth:`_download_artifact_stream`.
+        """
+        return (
+            type(self)._download_artifact_stream is not ArtifactRepository._download_artifact_stream
+        )
+
+    def _download_file_range(self, remote_file_path, local_path, range_start, range_end):
+        """
+        Download a range of bytes of the file at the specified relative remote path and write it
+        at the same offset of the existing local file at the specified local path.
+
+        :param remote_file_path: Source path to the remote file, relative to the root
+                                 directory of the artifact repository.
+        :param local_path: The path of the local file to which to write the range.
+        :param range_start: Offset of the first byte to download.
+        :param range_end: Offset of the last byte to download, inclusive.
+        """
+        with open(local_path, "r+b") as f:
+            f.seek(range_start)
+            for chunk in self._download_artifact_stream(remote_file_path, range_start, range_end):
+                f.write(chunk)
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        """
+        Log the content of a binary stream as an artifact file without writing it to the local
+        filesystem. Repositories that can't log streams raise ``NotImplementedError``, in which
+        case :py:meth:`log_artifact` must be used instead.
+
+        :param stream: A binary file-like object, read until its end.
+        :param artifact_file: Relative destination path of the artifact file, including its name.
+        """
+        raise NotImplementedError()
+
+    def _create_multipart_upload(self, artifact_file):
+        """
+        Start a multipart upload of an artifact file, whose parts are then uploaded with
+        :py:meth:`_upload_multipart_part`. Repositories that don't support multipart uploads raise
+        ``NotImplementedError``.
+
+        :param artifact_file: Relative destination path of the artifact file, including its name.
+        :return: ID of the multipart upload.
+        """
+        raise NotImplementedError()
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        """
+        Upload a part of a multipart upload. Parts can be uploaded concurrently and in any order.
+
+        :param artifact_file: Relative destination path of the artifact file, including its name.
+        :param upload_id: ID of the multipart upload.
+        :param part_number: Number of the part, starting from 1.
+        :param part_file: A seekable binary file-like object with the content of the part.
+        :return: ETag of the part.
+        """
+        raise NotImplementedError()
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        """
+        Complete a multipart upload by concatenating its parts into the artifact file.
+
+        :param artifact_file: Relative destination path of the artifact file, including its name.
+        :param upload_id: ID of the multipart upload.
+        :param parts: List of ``(part_number, etag)`` tuples of all the parts of the upload.
+        """
+        raise NotImplementedError()
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        """
+        Abort a multipart upload and discard its uploaded parts.
+
+        :param artifact_file: Relative destination path of the artifact file, including its name.
+        :param upload_id: ID of the multipart upload.
+        """
+        raise NotImplementedError()
+
+    def delete_artifacts(self, artifact_path=None):
+        """
+        Delete the artifacts at the specified location.
+        Supports the deletion of a single file or of a directory. Deletion of a directory
+        is recursive.
+        :param artifact_path: Path of the artifact to delete
+        """
+        pass
+
+    @property
+    def max_workers(self) -> int:
+        """Compute the number of workers to use for multi-threading."""
+        if MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_MAX_WORKERS.get():
+            return MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_MAX_WORKERS.get()
+        num_cpus = os.cpu_count() or _NUM_DEFAULT_CPUS
+        return min(num_cpus * _NUM_MAX_THREADS_PER_CPU, _NUM_MAX_THREADS)
+
+
+instrument_artifact_repository(ArtifactRepository)
+
+
+def verify_artifact_path(artifact_path):
+    if artifact_path and path_not_unique(artifact_path):
+        raise MlflowException(
+            f"Invalid artifact path: '{artifact_path}'. {bad_path_message(artifact_path)}"
+        )
+
+
+def _filter_empty_directories(file_infos):
+    """
+    Removes the directories that aren't empty from a recursive listing of a flat namespace store,
+    which lists directory placeholder objects regardless of whether the directories have content.
+    The listing must be in the lexicographic order of the object keys, in which the placeholder of
+    a directory is directly followed by its content.
+    """
+    empty_dir = None
+    for file_info in file_infos:
+        if empty_dir is not None and not file_info.path.startswith(empty_dir.path + "/"):
+            yield empty_dir
+        if file_info.is_dir:
+            empty_dir = file_info
+        else:
+            empty_dir = None
+            yield file_info
+    if empty_dir is not None:
+        yield empty_dir
+
+
+def _yield_chunks_range(chunks, range_start, range_end):
+    """
+    Yields a range of bytes of the stream of the inputted chunks, for streams that can only be read
+    from their start, e.g. the responses of servers that ignore requested ranges.
+    """
+    offset = 0
+    for chunk in chunks:
+        chunk_start = offset
+        offset += len(chunk)
+        if offset <= range_start:
+            continue
+        start = max(range_start - chunk_start, 0)
+        end = len(chunk) if range_end is None else min(range_end + 1 - chunk_start, len(chunk))
+        yield chunk[start:end]
+        if range_end is not None and offset > range_end:
+            return
+
+
+def _generate_multipart_upload_id():
+    """
+    Generates the ID of a multipart upload for the repositories that don't get one from their
+    storage service.
+    """
+    return uuid.uuid4().hex
+
+
+def _verify_multipart_upload_id(upload_id):
+    """
+    Verifies that a multipart upload ID was generated by :py:func:`_generate_multipart_upload_id`,
+    since it's used to build the paths of the uploaded parts.
+    """
+    if not re.fullmatch(r"[0-9a-f]{32}", upload_id or ""):
+        raise MlflowException(
+            f"Invalid multipart upload ID: '{upload_id}'", INVALID_PARAMETER_VALUE
+        )
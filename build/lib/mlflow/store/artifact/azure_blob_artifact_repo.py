@@ -0,0 +1,274 @@
+import base64
+import os
+import posixpath
+import re
+import urllib.parse
+
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    _generate_multipart_upload_id,
+    _verify_multipart_upload_id,
+)
+from mlflow.tracking._tracking_service.utils import _get_default_host_creds
+
+from mlflow.environment_variables import MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT
+
+
+class AzureBlobArtifactRepository(ArtifactRepository):
+    """
+    Stores artifacts on Azure Blob Storage.
+
+    This repository is used with URIs of the form
+    ``wasbs://<container-name>@<ystorage-account-name>.blob.core.windows.net/<path>``,
+    following the same URI scheme as Hadoop on Azure blob storage. It requires either that:
+    - Azure storage connection string is in the env var ``AZURE_STORAGE_CONNECTION_STRING``
+    - Azure storage access key is in the env var ``AZURE_STORAGE_ACCESS_KEY``
+    - DefaultAzureCredential is configured
+    """
+
+    def __init__(self, artifact_uri, client=None):
+        super().__init__(artifact_uri)
+
+        _DEFAULT_TIMEOUT = 600  # 10 minutes
+        self.write_timeout = MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT.get() or _DEFAULT_TIMEOUT
+
+        # Allow override for testing
+        if client:
+            self.client = client
+            return
+
+        from azure.storage.blob import BlobServiceClient
+
+        (_, account, _, api_uri_suffix) = AzureBlobArtifactRepository.parse_wasbs_uri(artifact_uri)
+        if "AZURE_STORAGE_CONNECTION_STRING" in os.environ:
+            self.client = BlobServiceClient.from_connection_string(
+                conn_str=os.environ.get("AZURE_STORAGE_CONNECTION_STRING"),
+                connection_verify=_get_default_host_creds(artifact_uri).verify,
+            )
+        elif "AZURE_STORAGE_ACCESS_KEY" in os.environ:
+            account_url = f"https://{account}.{api_uri_suffix}"
+            self.client = BlobServiceClient(
+                account_url=account_url,
+                credential=os.environ.get("AZURE_STORAGE_ACCESS_KEY"),
+                connection_verify=_get_default_host_creds(artifact_uri).verify,
+            )
+        else:
+            try:
+                from azure.identity import DefaultAzureCredential
+            except ImportError as exc:
+                raise ImportError(
+                    "Using DefaultAzureCredential requires the azure-identity package. "
+                    "Please install it via: pip install azure-identity"
+                ) from exc
+
+            account_url = f"https://{account}.{api_uri_suffix}"
+            self.client = BlobServiceClient(
+                account_url=account_url,
+                credential=DefaultAzureCredential(),
+                connection_verify=_get_default_host_creds(artifact_uri).verify,
+            )
+
+    @staticmethod
+    def parse_wasbs_uri(uri):
+        """Parse a wasbs:// URI, returning (container, storage_account, path, api_uri_suffix)."""
+        parsed = urllib.parse.urlparse(uri)
+        if parsed.scheme != "wasbs":
+            raise Exception("Not a WASBS URI: %s" % uri)
+
+        match = re.match(
+            r"([^@]+)@([^.]+)\.(blob\.core\.(windows\.net|chinacloudapi\.cn))", parsed.netloc
+        )
+
+        if match is None:
+            raise Exception(
+                "WASBS URI must be of the form "
+                "<container>@<account>.blob.core.windows.net"
+                " or <container>@<account>.blob.core.chinacloudapi.cn"
+            )
+        container = match.group(1)
+        storage_account = match.group(2)
+        api_uri_suffix = match.group(3)
+        path = parsed.path
+        if path.startswith("/"):
+            path = path[1:]
+        return container, storage_account, path, api_uri_suffix
+
+    def log_artifact(self, local_file, artifact_path=None):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        dest_path = posixpath.join(dest_path, os.path.basename(local_file))
+        with open(local_file, "rb") as file:
+            container_client.upload_blob(
+                dest_path, file, overwrite=True, timeout=self.write_timeout
+            )
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        local_dir = os.path.abspath(local_dir)
+        for root, _, filenames in os.walk(local_dir):
+            upload_path = dest_path
+            if root != local_dir:
+                rel_path = os.path.relpath(root, local_dir)
+                upload_path = posixpath.join(dest_path, rel_path)
+            for f in filenames:
+                remote_file_path = posixpath.join(upload_path, f)
+                local_file_path = os.path.join(root, f)
+                with open(local_file_path, "rb") as file:
+                    container_client.upload_blob(
+                        remote_file_path, file, overwrite=True, timeout=self.write_timeout
+                    )
+
+    def list_artifacts(self, path=None):
+        # Newer versions of `azure-storage-blob` (>= 12.4.0) provide a public
+        # `azure.storage.blob.BlobPrefix` object to signify that a blob is a directory,
+        # while older versions only expose this API internally as
+        # `azure.storage.blob._models.BlobPrefix`
+        try:
+            from azure.storage.blob import BlobPrefix
+        except ImportError:
+            from azure.storage.blob._models import BlobPrefix
+
+        def is_dir(result):
+            return isinstance(result, BlobPrefix)
+
+        (container, _, artifact_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        infos = []
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+        results = container_client.walk_blobs(name_starts_with=prefix)
+
+        for result in results:
+            if (
+                dest_path == result.name
+            ):  # result isn't actually a child of the path we're interested in, so skip it
+                continue
+
+            if not result.name.startswith(artifact_path):
+                raise MlflowException(
+                    "The name of the listed Azure blob does not begin with the specified"
+                    f" artifact path. Artifact path: {artifact_path}. Blob name: {result.name}"
+                )
+
+            if is_dir(result):
+                subdir = posixpath.relpath(path=result.name, start=artifact_path)
+                if subdir.endswith("/"):
+                    subdir = subdir[:-1]
+                infos.append(FileInfo(subdir, is_dir=True, file_size=None))
+            else:  # Just a plain old blob
+                file_name = posixpath.relpath(path=result.name, start=artifact_path)
+                infos.append(FileInfo(file_name, is_dir=False, file_size=result.size))
+
+        # The list_artifacts API expects us to return an empty list if the
+        # the path references a single file.
+        rel_path = dest_path[len(artifact_path) + 1 :]
+        if (len(infos) == 1) and not infos[0].is_dir and (infos[0].path == rel_path):
+            return []
+        return sorted(infos, key=lambda f: f.path)
+
+    def _iter_artifacts_recursive(self, path):
+        (container, _, artifact_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+        # Unlike `walk_blobs`, `list_blobs` lists all the blobs under the prefix at once
+        for result in container_client.list_blobs(name_starts_with=prefix):
+            if not result.name.startswith(artifact_path):
+                raise MlflowException(
+                    "The name of the listed Azure blob does not begin with the specified"
+                    f" artifact path. Artifact path: {artifact_path}. Blob name: {result.name}"
+                )
+            file_name = posixpath.relpath(path=result.name, start=artifact_path)
+            yield FileInfo(file_name, is_dir=False, file_size=result.size)
+
+    def _download_file(self, remote_file_path, local_path):
+        (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, remote_file_path)
+        with open(local_path, "wb") as file:
+            container_client.download_blob(remote_full_path).readinto(file)
+
+    def _get_artifact_file_size(self, artifact_path):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        try:
+            properties = container_client.get_blob_client(remote_full_path).get_blob_properties()
+        except ResourceNotFoundError as e:
+            raise MlflowException(
+                f"Artifact file '{artifact_path}' does not exist", RESOURCE_DOES_NOT_EXIST
+            ) from e
+        return properties.size
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        length = None if range_end is None else range_end - range_start + 1
+        return container_client.download_blob(
+            remote_full_path, offset=range_start, length=length
+        ).chunks()
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        container_client.upload_blob(
+            posixpath.join(dest_path, artifact_file),
+            stream,
+            overwrite=True,
+            timeout=self.write_timeout,
+        )
+
+    def _get_blob_client(self, artifact_file):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        return container_client.get_blob_client(posixpath.join(dest_path, artifact_file))
+
+    @staticmethod
+    def _get_block_id(upload_id, part_number):
+        # The parts are staged as blocks of the artifact blob, whose IDs must all have the same
+        # length
+        _verify_multipart_upload_id(upload_id)
+        return base64.b64encode(f"{upload_id}-{part_number:06d}".encode()).decode()
+
+    def _create_multipart_upload(self, artifact_file):
+        return _generate_multipart_upload_id()
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        block_id = self._get_block_id(upload_id, part_number)
+        self._get_blob_client(artifact_file).stage_block(
+            block_id, part_file, timeout=self.write_timeout
+        )
+        return block_id
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        from azure.storage.blob import BlobBlock
+
+        self._get_blob_client(artifact_file).commit_block_list(
+            [
+                BlobBlock(block_id=self._get_block_id(upload_id, part_number))
+                for part_number, _ in sorted(parts)
+            ],
+            timeout=self.write_timeout,
+        )
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        # Staged blocks that are never committed are garbage collected by Azure Blob Storage
+        _verify_multipart_upload_id(upload_id)
+
+    def delete_artifacts(self, artifact_path=None):
+        raise MlflowException("Not implemented yet")
@@ -0,0 +1,251 @@
+"""
+Opt-in compression of text artifact files for their transfer and storage.
+
+When ``MLFLOW_ARTIFACT_COMPRESSION`` is set to a codec, the artifact repositories returned by
+:py:func:`mlflow.store.artifact.artifact_repository_registry.get_artifact_repository` compress the
+text artifact files of at least ``MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE`` bytes, e.g. JSON
+tables, dictionaries and requirements files, before uploading them. A compressed file is stored as
+``<file name>.mlflow-<codec>``, recording the codec it's compressed with.
+
+The compressed files are decompressed when artifacts are listed, downloaded and streamed, e.g. by
+the artifact proxy of the tracking server when it's run with the same setting, so that they're seen
+as the files that were logged.
+"""
+import gzip
+import os
+import posixpath
+import shutil
+import tempfile
+import zlib
+
+from mlflow.entities import FileInfo
+from mlflow.environment_variables import MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _yield_chunks_range,
+)
+from mlflow.utils.mime_type_utils import get_text_extensions
+
+_COMPRESSED_SUFFIX_PREFIX = ".mlflow-"
+# The maximum compression ratio of DEFLATE
+_MAX_GZIP_COMPRESSION_RATIO = 1032
+
+
+class _GzipCodec:
+    name = "gzip"
+
+    @staticmethod
+    def compress_file(src, dst):
+        with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+            # Compress deterministically, without the modification time of the file
+            with gzip.GzipFile(
+                filename="", mode="wb", fileobj=f_out, compresslevel=6, mtime=0
+            ) as f:
+                shutil.copyfileobj(f_in, f, _STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def decompress_file(src, dst):
+        with gzip.open(src, "rb") as f_in, open(dst, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, _STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def decompress_chunks(chunks):
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            if data := decompressor.decompress(chunk):
+                yield data
+        if data := decompressor.flush():
+            yield data
+
+    @staticmethod
+    def get_decompressed_size(repo, compressed_path):
+        compressed_size = repo._get_artifact_file_size(compressed_path)
+        if compressed_size * _MAX_GZIP_COMPRESSION_RATIO < 2**32:
+            # The last 4 bytes of a gzip file are its decompressed size modulo 2^32
+            trailer = b"".join(
+                repo._download_artifact_stream(
+                    compressed_path, compressed_size - 4, compressed_size - 1
+                )
+            )
+            return int.from_bytes(trailer, "little")
+        chunks = repo._download_artifact_stream(compressed_path)
+        return sum(len(data) for data in _GzipCodec.decompress_chunks(chunks))
+
+
+_CODECS = {codec.name: codec for codec in [_GzipCodec]}
+
+
+def get_codec(name):
+    if name not in _CODECS:
+        raise MlflowException(
+            f"Unsupported artifact compression codec {name!r}. Supported codecs are:"
+            f" {list(_CODECS)}",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return _CODECS[name]
+
+
+def _get_codec_of_stored_path(path):
+    """
+    :return: The codec a stored artifact file is compressed with, or ``None`` if it isn't
+             compressed.
+    """
+    _, separator, suffix = posixpath.basename(path).rpartition(_COMPRESSED_SUFFIX_PREFIX)
+    return _CODECS.get(suffix) if separator else None
+
+
+def _is_text_file(path):
+    name = posixpath.basename(path)
+    extension = os.path.splitext(name)[1].lstrip(".") or name
+    return extension in get_text_extensions()
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.symlink(os.path.abspath(src), dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+class CompressedArtifactRepository(ArtifactRepository):
+    """
+    Compresses the text artifact files of an artifact repository.
+
+    :param repo: The artifact repository storing the artifacts.
+    :param codec: The name of the codec with which to compress artifact files, e.g. ``"gzip"``.
+    """
+
+    def __init__(self, repo, codec):
+        super().__init__(repo.artifact_uri)
+        self.repo = repo
+        self.codec = get_codec(codec)
+        # The artifact paths of the text files known to be stored compressed, mapped to their codec,
+        # and stored as is, which are found by listing their directories
+        self._compressed_paths = {}
+        self._file_paths = set()
+
+    def _should_compress(self, local_file):
+        return (
+            _is_text_file(local_file)
+            and os.path.getsize(local_file) >= MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE.get()
+        )
+
+    def _stage_file(self, local_file, staged_path):
+        """
+        Write the file to log for the specified local file at the specified staging path, without
+        its compression suffix.
+
+        :return: The path of the staged file.
+        """
+        if self._should_compress(local_file):
+            staged_path += _COMPRESSED_SUFFIX_PREFIX + self.codec.name
+            self.codec.compress_file(local_file, staged_path)
+        else:
+            _link_or_copy(local_file, staged_path)
+        return staged_path
+
+    def log_artifact(self, local_file, artifact_path=None):
+        if not self._should_compress(local_file):
+            self.repo.log_artifact(local_file, artifact_path)
+            return
+
+        with tempfile.TemporaryDirectory() as staging_dir:
+            staged_file = self._stage_file(
+                local_file, os.path.join(staging_dir, os.path.basename(local_file))
+            )
+            self.repo.log_artifact(staged_file, artifact_path)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        with tempfile.TemporaryDirectory() as staging_dir:
+            for root, _, filenames in os.walk(local_dir):
+                staged_dir = os.path.join(staging_dir, os.path.relpath(root, local_dir))
+                os.makedirs(staged_dir, exist_ok=True)
+                for f in filenames:
+                    self._stage_file(os.path.join(root, f), os.path.join(staged_dir, f))
+            self.repo.log_artifacts(staging_dir, artifact_path)
+
+    def _resolve_file_info(self, file_info):
+        if not file_info.is_dir:
+            if codec := _get_codec_of_stored_path(file_info.path):
+                path = file_info.path[: -len(_COMPRESSED_SUFFIX_PREFIX + codec.name)]
+                self._compressed_paths[path] = codec
+                return FileInfo(path, False, None)
+            self._file_paths.add(file_info.path)
+        return file_info
+
+    def _resolve_file_infos(self, file_infos):
+        """
+        Replace the compressed files of a listing with the files they decompress to, which take
+        precedence over the files of the same paths.
+        """
+        resolved = {}
+        for file_info in map(self._resolve_file_info, file_infos):
+            if file_info.path not in resolved or file_info.path in self._compressed_paths:
+                resolved[file_info.path] = file_info
+        return sorted(resolved.values(), key=lambda f: f.path)
+
+    def list_artifacts(self, path=None):
+        return self._resolve_file_infos(self.repo.list_artifacts(path))
+
+    def _iter_artifacts_recursive(self, path):
+        listed_paths = set()
+        for file_info in map(self._resolve_file_info, self.repo._iter_artifacts_recursive(path)):
+            # A file and a compressed file of the same path are downloaded once, decompressed
+            if file_info.path not in listed_paths:
+                listed_paths.add(file_info.path)
+                yield file_info
+
+    def _get_stored_codec(self, artifact_path):
+        """
+        :return: The codec the artifact file at the specified path is stored compressed with, or
+                 ``None`` if it's stored as is.
+        """
+        if not _is_text_file(artifact_path):
+            return None
+        if artifact_path not in self._compressed_paths and artifact_path not in self._file_paths:
+            # List the directory of the artifact to find whether it's stored compressed
+            self.list_artifacts(posixpath.dirname(artifact_path) or None)
+        return self._compressed_paths.get(artifact_path)
+
+    def _download_file(self, remote_file_path, local_path):
+        codec = self._get_stored_codec(remote_file_path)
+        if codec is None:
+            self.repo._download_file(remote_file_path, local_path)
+            return
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            compressed_path = os.path.join(tmp_dir, "compressed")
+            self.repo._download_file(
+                remote_file_path + _COMPRESSED_SUFFIX_PREFIX + codec.name, compressed_path
+            )
+            codec.decompress_file(compressed_path, local_path)
+
+    def _get_artifact_file_size(self, artifact_path):
+        codec = self._get_stored_codec(artifact_path)
+        if codec is None:
+            return self.repo._get_artifact_file_size(artifact_path)
+        return codec.get_decompressed_size(
+            self.repo, artifact_path + _COMPRESSED_SUFFIX_PREFIX + codec.name
+        )
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        codec = self._get_stored_codec(artifact_path)
+        if codec is None:
+            return self.repo._download_artifact_stream(artifact_path, range_start, range_end)
+        chunks = self.repo._download_artifact_stream(
+            artifact_path + _COMPRESSED_SUFFIX_PREFIX + codec.name
+        )
+        # Compressed files can only be decompressed from their start
+        return _yield_chunks_range(codec.decompress_chunks(chunks), range_start, range_end)
+
+    def _supports_file_range_downloads(self):
+        # Compressed files are listed without their size, so they're never downloaded in ranges
+        return self.repo._supports_file_range_downloads()
+
+    def delete_artifacts(self, artifact_path=None):
+        if artifact_path and (codec := self._get_stored_codec(artifact_path)):
+            artifact_path += _COMPRESSED_SUFFIX_PREFIX + codec.name
+        self.repo.delete_artifacts(artifact_path)
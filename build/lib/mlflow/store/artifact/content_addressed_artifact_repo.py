@@ -0,0 +1,265 @@
+"""
+Opt-in deduplication of logged artifact files with a content-addressed blob store.
+
+When ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` is set, the artifact repositories returned by
+:py:func:`mlflow.store.artifact.artifact_repository_registry.get_artifact_repository` store the
+content of the artifact files of at least ``MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE`` bytes as
+blobs named by the SHA-256 hash of their content in the blob store, and log a small reference
+object named ``<file name>.mlflow-ref`` instead of each file. Blobs that already exist in the blob
+store aren't uploaded again, so that logging unchanged files, e.g. the weights of a base model
+logged again with a new adapter, only logs their references.
+
+The references are resolved when artifacts are listed and downloaded, so that they're seen with
+the normal layout of the logged artifacts. Blobs are shared by all the artifacts referencing them
+and aren't deleted with them.
+"""
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import tempfile
+from concurrent.futures import as_completed
+
+from mlflow.entities import FileInfo
+from mlflow.environment_variables import MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+
+REFERENCE_SUFFIX = ".mlflow-ref"
+_HASH_ALGORITHM = "sha256"
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def _compute_file_hash(local_file):
+    file_hash = hashlib.new(_HASH_ALGORITHM)
+    with open(local_file, "rb") as f:
+        while chunk := f.read(_HASH_BUFFER_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_blob_path(digest):
+    return posixpath.join(_HASH_ALGORITHM, digest[:2], digest)
+
+
+class ContentAddressedArtifactRepository(ArtifactRepository):
+    """
+    Stores the artifact files of an artifact repository as references to deduplicated blobs of a
+    blob store.
+
+    :param repo: The artifact repository of the artifacts, in which the references are logged.
+    :param blob_repo: The artifact repository of the blob store.
+    """
+
+    def __init__(self, repo, blob_repo):
+        super().__init__(repo.artifact_uri)
+        self.repo = repo
+        self.blob_repo = blob_repo
+        # The artifact paths of the files known to be stored as references, mapped to their
+        # reference, or as files, which are found by listing their directories
+        self._references = {}
+        self._file_paths = set()
+
+    def _upload_blobs(self, local_files):
+        """
+        Upload the content of the specified local files to the blob store, skipping the blobs that
+        already exist in it.
+
+        :return: A dictionary mapping the local files to their hash.
+        """
+        digests = {}
+        futures = {}
+        for local_file in local_files:
+            futures[self.thread_pool.submit(_compute_file_hash, local_file)] = local_file
+        for f in as_completed(futures):
+            digests[futures[f]] = f.result()
+
+        local_files_by_digest = {digest: local_file for local_file, digest in digests.items()}
+        existing_blobs = set()
+        for blob_dir in {posixpath.dirname(_get_blob_path(d)) for d in local_files_by_digest}:
+            existing_blobs.update(
+                file_info.path for file_info in self.blob_repo.list_artifacts(blob_dir)
+            )
+
+        futures = {}
+        for digest, local_file in local_files_by_digest.items():
+            blob_path = _get_blob_path(digest)
+            if blob_path not in existing_blobs:
+                future = self.thread_pool.submit(self._upload_blob, local_file, blob_path)
+                futures[future] = local_file
+
+        failed_uploads = {}
+        for f in as_completed(futures):
+            try:
+                f.result()
+            except Exception as e:
+                failed_uploads[futures[f]] = repr(e)
+        if failed_uploads:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while uploading one or more artifact blobs"
+                    f" to {self.blob_repo.artifact_uri}: {failed_uploads}"
+                )
+            )
+        return digests
+
+    def _upload_blob(self, local_file, blob_path):
+        try:
+            with open(local_file, "rb") as f:
+                self.blob_repo._log_artifact_stream(f, blob_path)
+            return
+        except NotImplementedError:
+            pass
+
+        # The blob store can't log streams, log a copy of the file named like the blob
+        blob_dir, blob_name = posixpath.split(blob_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, blob_name)
+            shutil.copyfile(local_file, tmp_file)
+            self.blob_repo.log_artifact(tmp_file, blob_dir)
+
+    def _stage_artifacts(self, local_files, staging_dir):
+        """
+        Write the artifacts to log for the specified local files to the staging directory: the
+        references to their blobs for large files, and copies of small files.
+
+        :param local_files: A dictionary mapping the local files to their relative paths in the
+                            staging directory.
+        """
+        minimum_size = MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE.get()
+        large_files = [f for f in local_files if os.path.getsize(f) >= minimum_size]
+        digests = self._upload_blobs(large_files)
+        for local_file, rel_path in local_files.items():
+            staged_path = os.path.join(staging_dir, rel_path)
+            os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+            if local_file in digests:
+                with open(staged_path + REFERENCE_SUFFIX, "w") as f:
+                    json.dump(
+                        {
+                            "algorithm": _HASH_ALGORITHM,
+                            "digest": digests[local_file],
+                            "size": os.path.getsize(local_file),
+                        },
+                        f,
+                    )
+            else:
+                shutil.copyfile(local_file, staged_path)
+
+    def log_artifact(self, local_file, artifact_path=None):
+        if os.path.getsize(local_file) < MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE.get():
+            self.repo.log_artifact(local_file, artifact_path)
+            return
+
+        name = os.path.basename(local_file)
+        with tempfile.TemporaryDirectory() as staging_dir:
+            self._stage_artifacts({local_file: name}, staging_dir)
+            self.repo.log_artifact(
+                os.path.join(staging_dir, name + REFERENCE_SUFFIX), artifact_path
+            )
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        local_files = {}
+        for root, _, filenames in os.walk(local_dir):
+            for f in filenames:
+                local_file = os.path.join(root, f)
+                local_files[local_file] = os.path.relpath(local_file, local_dir)
+        with tempfile.TemporaryDirectory() as staging_dir:
+            self._stage_artifacts(local_files, staging_dir)
+            self.repo.log_artifacts(staging_dir, artifact_path)
+
+    def _download_reference(self, artifact_path):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_path = os.path.join(tmp_dir, "reference")
+            self.repo._download_file(artifact_path + REFERENCE_SUFFIX, local_path)
+            with open(local_path) as f:
+                return json.load(f)
+
+    def _resolve_file_infos(self, file_infos):
+        """
+        Replace the references of a listing with the files they reference, which take precedence
+        over the files of the same paths. The references are read for the sizes of their blobs.
+        """
+        file_infos = list(file_infos)
+        reference_paths = [
+            f.path[: -len(REFERENCE_SUFFIX)]
+            for f in file_infos
+            if not f.is_dir and f.path.endswith(REFERENCE_SUFFIX)
+        ]
+        unread_paths = [p for p in reference_paths if p not in self._references]
+        for path, reference in zip(
+            unread_paths, self.thread_pool.map(self._download_reference, unread_paths)
+        ):
+            self._references[path] = reference
+        resolved = []
+        for file_info in file_infos:
+            if file_info.is_dir:
+                resolved.append(file_info)
+            elif file_info.path.endswith(REFERENCE_SUFFIX):
+                path = file_info.path[: -len(REFERENCE_SUFFIX)]
+                resolved.append(FileInfo(path, False, self._references[path]["size"]))
+            elif file_info.path not in self._references:
+                self._file_paths.add(file_info.path)
+                resolved.append(file_info)
+        return resolved
+
+    def list_artifacts(self, path=None):
+        return sorted(
+            self._resolve_file_infos(self.repo.list_artifacts(path)), key=lambda f: f.path
+        )
+
+    def _iter_artifacts_recursive(self, path):
+        listed_paths = set()
+        for file_info in self.repo._iter_artifacts_recursive(path):
+            for resolved in self._resolve_file_infos([file_info]):
+                # A file and a reference of the same path are downloaded once, from the reference
+                if resolved.path not in listed_paths:
+                    listed_paths.add(resolved.path)
+                    yield resolved
+
+    def _read_reference(self, artifact_path):
+        """
+        :return: The reference stored for the artifact file at the specified path, or ``None`` if
+                 the file isn't stored as a reference.
+        """
+        if artifact_path not in self._references and artifact_path not in self._file_paths:
+            # List the directory of the artifact to find whether it's stored as a reference
+            parent_path = posixpath.dirname(artifact_path) or None
+            self._resolve_file_infos(self.repo.list_artifacts(parent_path))
+        return self._references.get(artifact_path)
+
+    def _get_artifact_digest(self, artifact_path):
+        """
+        :return: The digest of the blob of the artifact file at the specified path, or ``None`` if
+                 the file isn't stored as a reference.
+        """
+        if reference := self._read_reference(artifact_path):
+            return reference["digest"]
+        return None
+
+    def _download_file(self, remote_file_path, local_path):
+        if reference := self._read_reference(remote_file_path):
+            self.blob_repo._download_file(_get_blob_path(reference["digest"]), local_path)
+        else:
+            self.repo._download_file(remote_file_path, local_path)
+
+    def _get_artifact_file_size(self, artifact_path):
+        if reference := self._read_reference(artifact_path):
+            return reference["size"]
+        return self.repo._get_artifact_file_size(artifact_path)
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        if reference := self._read_reference(artifact_path):
+            return self.blob_repo._download_artifact_stream(
+                _get_blob_path(reference["digest"]), range_start, range_end
+            )
+        return self.repo._download_artifact_stream(artifact_path, range_start, range_end)
+
+    def _supports_file_range_downloads(self):
+        return (
+            self.repo._supports_file_range_downloads()
+            and self.blob_repo._supports_file_range_downloads()
+        )
+
+    def delete_artifacts(self, artifact_path=None):
+        self.repo.delete_artifacts(artifact_path)
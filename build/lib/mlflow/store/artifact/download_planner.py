@@ -0,0 +1,211 @@
+"""
+Pipelined downloads of artifacts, used by ``ArtifactRepository.download_artifacts``.
+
+The files of a directory are downloaded while the directory is being listed: the listing of the
+artifact repository is consumed as it's produced, and the downloads are scheduled on the thread
+pool of the repository through a bounded queue, so that the listing pauses while the queue is full.
+Large files of repositories that can download ranges of artifact files are split into chunks that
+are downloaded in parallel.
+"""
+import os
+import threading
+import time
+from concurrent.futures import as_completed, wait
+from functools import partial
+from typing import NamedTuple
+
+from mlflow.entities.file_info import FileInfo
+from mlflow.environment_variables import (
+    MLFLOW_ENABLE_MULTIPART_DOWNLOAD,
+    MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE,
+    MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE,
+)
+from mlflow.exceptions import MlflowException
+
+# The number of downloads scheduled ahead of the download threads, per thread
+_QUEUED_DOWNLOADS_PER_WORKER = 2
+
+
+class DownloadProgress(NamedTuple):
+    """
+    Progress of a download of artifacts. The totals grow while the artifacts are being listed.
+    """
+
+    completed_files: int
+    total_files: int
+    downloaded_bytes: int
+    total_bytes: int
+    elapsed_seconds: float
+    listing_complete: bool
+
+    @property
+    def throughput(self):
+        """
+        The average download throughput in bytes per second.
+        """
+        return self.downloaded_bytes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class DownloadPlanner:
+    """
+    Downloads artifacts of an artifact repository with its thread pool. Used by
+    ``ArtifactRepository.download_artifacts``, or directly to follow the progress of a download:
+
+    .. code-block:: python
+
+        DownloadPlanner(repo, dst_path, progress_callback=print).download("model")
+
+    :param repo: The artifact repository to download from.
+    :param dst_path: Absolute path of the existing local directory to download to.
+    :param progress_callback: Optional function called with a :py:class:`DownloadProgress` every
+                              time a file or a chunk of a file is downloaded. It's called from the
+                              download threads, one call at a time.
+    """
+
+    def __init__(self, repo, dst_path, progress_callback=None):
+        self.repo = repo
+        self.dst_path = dst_path
+        self.progress_callback = progress_callback
+        self._queue_slots = threading.BoundedSemaphore(
+            repo.max_workers * _QUEUED_DOWNLOADS_PER_WORKER
+        )
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._remaining_chunks = {}
+        self._start_time = None
+        self._completed_files = 0
+        self._total_files = 0
+        self._downloaded_bytes = 0
+        self._total_bytes = 0
+        self._listing_complete = False
+
+    def download(self, artifact_path):
+        """
+        Downloads the artifact file or directory at the specified path.
+
+        :return: Absolute path of the local filesystem location containing the artifacts.
+        """
+        self._start_time = time.monotonic()
+        is_listed = False
+        try:
+            for file_info in self.repo._iter_artifacts_recursive(artifact_path):
+                is_listed = True
+                if file_info.is_dir:  # Empty directory
+                    os.makedirs(os.path.join(self.dst_path, file_info.path), exist_ok=True)
+                else:
+                    self._schedule_file(file_info)
+            if not is_listed:
+                # The path is a file, or an empty directory which is only distinguished from a file
+                # if it can't be downloaded, to avoid listing files twice
+                self._schedule_file(FileInfo(artifact_path, False, None))
+        except BaseException:
+            # Don't leave downloads running in the background
+            wait(self._futures)
+            raise
+        with self._lock:
+            self._listing_complete = True
+
+        failed_downloads = {}
+        for f in as_completed(self._futures):
+            try:
+                f.result()
+            except Exception as e:
+                path = self._futures[f]
+                failed_downloads[path] = repr(e)
+
+        if failed_downloads and not is_listed and self.repo._is_directory(artifact_path):
+            local_path = os.path.join(self.dst_path, artifact_path)
+            if os.path.isfile(local_path):
+                os.remove(local_path)
+            os.makedirs(local_path, exist_ok=True)
+            failed_downloads = {}
+
+        if failed_downloads:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while downloading one or more"
+                    f" artifacts from {self.repo.artifact_uri}: {failed_downloads}"
+                )
+            )
+
+        return os.path.join(self.dst_path, artifact_path)
+
+    def _schedule_file(self, file_info):
+        local_path = self.repo._create_download_destination(
+            src_artifact_path=file_info.path, dst_local_dir_path=self.dst_path
+        )
+        file_size = file_info.file_size
+        with self._lock:
+            self._total_files += 1
+            self._total_bytes += file_size or 0
+
+        if (
+            MLFLOW_ENABLE_MULTIPART_DOWNLOAD.get()
+            and self.repo._supports_file_range_downloads()
+            and file_size
+            and file_size >= MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE.get()
+        ):
+            chunk_size = MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE.get()
+            with open(local_path, "wb") as f:
+                f.truncate(file_size)
+            range_starts = range(0, file_size, chunk_size)
+            self._remaining_chunks[file_info.path] = len(range_starts)
+            for range_start in range_starts:
+                range_end = min(range_start + chunk_size, file_size) - 1
+                self._submit(
+                    file_info.path,
+                    range_end - range_start + 1,
+                    self.repo._download_file_range,
+                    remote_file_path=file_info.path,
+                    local_path=local_path,
+                    range_start=range_start,
+                    range_end=range_end,
+                )
+        else:
+            self._submit(
+                file_info.path,
+                file_size,
+                self.repo._download_file,
+                remote_file_path=file_info.path,
+                local_path=local_path,
+            )
+
+    def _submit(self, path, size, fn, **kwargs):
+        # Wait for a slot in the queue, so that the listing doesn't get ahead of the downloads
+        self._queue_slots.acquire()
+        try:
+            future = self.repo.thread_pool.submit(fn, **kwargs)
+        except BaseException:
+            self._queue_slots.release()
+            raise
+        self._futures[future] = path
+        future.add_done_callback(partial(self._on_done, path, size, kwargs["local_path"]))
+
+    def _on_done(self, path, size, local_path, future):
+        self._queue_slots.release()
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        with self._lock:
+            if size is None:
+                # The size of files that aren't listed with their size is known once downloaded
+                size = os.path.getsize(local_path)
+                self._total_bytes += size
+            self._downloaded_bytes += size
+            if path in self._remaining_chunks:
+                self._remaining_chunks[path] -= 1
+                if self._remaining_chunks[path] == 0:
+                    self._completed_files += 1
+            else:
+                self._completed_files += 1
+            if self.progress_callback is not None:
+                self.progress_callback(
+                    DownloadProgress(
+                        completed_files=self._completed_files,
+                        total_files=self._total_files,
+                        downloaded_bytes=self._downloaded_bytes,
+                        total_bytes=self._total_bytes,
+                        elapsed_seconds=time.monotonic() - self._start_time,
+                        listing_complete=self._listing_complete,
+                    )
+                )
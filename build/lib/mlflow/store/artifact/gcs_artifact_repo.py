@@ -0,0 +1,246 @@
+import os
+
+import posixpath
+import urllib.parse
+
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _filter_empty_directories,
+    _generate_multipart_upload_id,
+    _verify_multipart_upload_id,
+)
+from mlflow.utils.file_utils import relative_path_to_artifact_path, yield_stream_range_in_chunks
+from mlflow.environment_variables import (
+    MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT,
+    MLFLOW_GCS_DEFAULT_TIMEOUT,
+    MLFLOW_GCS_DOWNLOAD_CHUNK_SIZE,
+    MLFLOW_GCS_UPLOAD_CHUNK_SIZE,
+)
+
+
+# Maximum number of objects that can be composed into a single object by a GCS compose request
+_GCS_MAX_COMPOSE_SOURCES = 32
+
+
+class GCSArtifactRepository(ArtifactRepository):
+    """
+    Stores artifacts on Google Cloud Storage.
+
+    :param artifact_uri: URI of GCS bucket
+    :param client: Optional. The client to use for GCS operations; a default
+                       client object will be created if unspecified, using default
+                       credentials as described in https://google-cloud.readthedocs.io/en/latest/core/auth.html
+    """
+
+    def __init__(self, artifact_uri, client=None):
+        super().__init__(artifact_uri)
+        from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+        from google.auth.exceptions import DefaultCredentialsError
+        from google.cloud import storage as gcs_storage
+
+        self._GCS_DOWNLOAD_CHUNK_SIZE = MLFLOW_GCS_DOWNLOAD_CHUNK_SIZE.get()
+        self._GCS_UPLOAD_CHUNK_SIZE = MLFLOW_GCS_UPLOAD_CHUNK_SIZE.get()
+        self._GCS_DEFAULT_TIMEOUT = (
+            MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT.get()
+            or MLFLOW_GCS_DEFAULT_TIMEOUT.get()
+            or _DEFAULT_TIMEOUT
+        )
+
+        # If the user-supplied timeout environment variable value is -1,
+        # use `None` for `self._GCS_DEFAULT_TIMEOUT`
+        # to use indefinite timeout
+        self._GCS_DEFAULT_TIMEOUT = (
+            None if self._GCS_DEFAULT_TIMEOUT == -1 else self._GCS_DEFAULT_TIMEOUT
+        )
+        if client is not None:
+            self.client = client
+        else:
+            try:
+                self.client = gcs_storage.Client()
+            except DefaultCredentialsError:
+                self.client = gcs_storage.Client.create_anonymous_client()
+
+    @staticmethod
+    def parse_gcs_uri(uri):
+        """Parse an GCS URI, returning (bucket, path)"""
+        parsed = urllib.parse.urlparse(uri)
+        if parsed.scheme != "gs":
+            raise Exception("Not a GCS URI: %s" % uri)
+        path = parsed.path
+        if path.startswith("/"):
+            path = path[1:]
+        return parsed.netloc, path
+
+    def _get_bucket(self, bucket):
+        return self.client.bucket(bucket)
+
+    def log_artifact(self, local_file, artifact_path=None):
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        dest_path = posixpath.join(dest_path, os.path.basename(local_file))
+
+        gcs_bucket = self._get_bucket(bucket)
+        blob = gcs_bucket.blob(dest_path, chunk_size=self._GCS_UPLOAD_CHUNK_SIZE)
+        blob.upload_from_filename(local_file, timeout=self._GCS_DEFAULT_TIMEOUT)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        gcs_bucket = self._get_bucket(bucket)
+
+        local_dir = os.path.abspath(local_dir)
+        for root, _, filenames in os.walk(local_dir):
+            upload_path = dest_path
+            if root != local_dir:
+                rel_path = os.path.relpath(root, local_dir)
+                rel_path = relative_path_to_artifact_path(rel_path)
+                upload_path = posixpath.join(dest_path, rel_path)
+            for f in filenames:
+                path = posixpath.join(upload_path, f)
+                gcs_bucket.blob(path, chunk_size=self._GCS_UPLOAD_CHUNK_SIZE).upload_from_filename(
+                    os.path.join(root, f), timeout=self._GCS_DEFAULT_TIMEOUT
+                )
+
+    def list_artifacts(self, path=None):
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+
+        bkt = self._get_bucket(bucket)
+
+        infos = self._list_folders(bkt, prefix, artifact_path)
+
+        results = bkt.list_blobs(prefix=prefix, delimiter="/")
+        for result in results:
+            # skip blobs matching current directory path as list_blobs api
+            # returns subdirectories as well
+            if result.name == prefix:
+                continue
+            blob_path = result.name[len(artifact_path) + 1 :]
+            infos.append(FileInfo(blob_path, False, result.size))
+
+        return sorted(infos, key=lambda f: f.path)
+
+    def _iter_artifacts_recursive(self, path):
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+
+        def iter_blobs():
+            # Without a delimiter, all the blobs under the prefix are listed at once
+            for result in self._get_bucket(bucket).list_blobs(prefix=prefix):
+                if result.name == prefix:
+                    continue
+                blob_path = result.name[len(artifact_path) + 1 :]
+                if blob_path.endswith("/"):
+                    # Placeholder blob of a directory
+                    yield FileInfo(blob_path[:-1], True, None)
+                else:
+                    yield FileInfo(blob_path, False, result.size)
+
+        yield from _filter_empty_directories(iter_blobs())
+
+    def _list_folders(self, bkt, prefix, artifact_path):
+        results = bkt.list_blobs(prefix=prefix, delimiter="/")
+        dir_paths = set()
+        for page in results.pages:
+            dir_paths.update(page.prefixes)
+
+        return [FileInfo(path[len(artifact_path) + 1 : -1], True, None) for path in dir_paths]
+
+    def _download_file(self, remote_file_path, local_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, remote_file_path)
+        gcs_bucket = self._get_bucket(bucket)
+        gcs_bucket.blob(
+            remote_full_path, chunk_size=self._GCS_DOWNLOAD_CHUNK_SIZE
+        ).download_to_filename(local_path, timeout=self._GCS_DEFAULT_TIMEOUT)
+
+    def _get_artifact_file_size(self, artifact_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob = self._get_bucket(bucket).get_blob(
+            remote_full_path, timeout=self._GCS_DEFAULT_TIMEOUT
+        )
+        if blob is None:
+            raise MlflowException(
+                f"Artifact file '{artifact_path}' does not exist", RESOURCE_DOES_NOT_EXIST
+            )
+        return blob.size
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob = self._get_bucket(bucket).blob(remote_full_path)
+        with blob.open(
+            "rb", chunk_size=self._GCS_DOWNLOAD_CHUNK_SIZE, timeout=self._GCS_DEFAULT_TIMEOUT
+        ) as f:
+            yield from yield_stream_range_in_chunks(f, range_start, range_end, _STREAM_CHUNK_SIZE)
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        blob = self._get_bucket(bucket).blob(
+            posixpath.join(dest_path, artifact_file), chunk_size=self._GCS_UPLOAD_CHUNK_SIZE
+        )
+        blob.upload_from_file(stream, timeout=self._GCS_DEFAULT_TIMEOUT)
+
+    def _get_multipart_upload_prefix(self, upload_id):
+        # GCS has no native multipart upload, the parts are uploaded as temporary objects that are
+        # composed into the artifact file when the upload is completed
+        _verify_multipart_upload_id(upload_id)
+        (_, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        return posixpath.join(dest_path, ".mlflow-multipart-uploads", upload_id) + "/"
+
+    def _create_multipart_upload(self, artifact_file):
+        return _generate_multipart_upload_id()
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        (bucket, _) = self.parse_gcs_uri(self.artifact_uri)
+        blob = self._get_bucket(bucket).blob(
+            self._get_multipart_upload_prefix(upload_id) + str(part_number),
+            chunk_size=self._GCS_UPLOAD_CHUNK_SIZE,
+        )
+        blob.upload_from_file(part_file, timeout=self._GCS_DEFAULT_TIMEOUT)
+        return blob.etag
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        gcs_bucket = self._get_bucket(bucket)
+        prefix = self._get_multipart_upload_prefix(upload_id)
+        sources = [gcs_bucket.blob(prefix + str(part_number)) for part_number, _ in sorted(parts)]
+        destination = gcs_bucket.blob(posixpath.join(dest_path, artifact_file))
+        # A compose request accepts a limited number of sources, so larger uploads are composed
+        # incrementally by appending the next parts to the partially composed artifact file
+        destination.compose(sources[:_GCS_MAX_COMPOSE_SOURCES], timeout=self._GCS_DEFAULT_TIMEOUT)
+        for start in range(_GCS_MAX_COMPOSE_SOURCES, len(sources), _GCS_MAX_COMPOSE_SOURCES - 1):
+            destination.compose(
+                [destination, *sources[start : start + _GCS_MAX_COMPOSE_SOURCES - 1]],
+                timeout=self._GCS_DEFAULT_TIMEOUT,
+            )
+        self._abort_multipart_upload(artifact_file, upload_id)
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        (bucket, _) = self.parse_gcs_uri(self.artifact_uri)
+        gcs_bucket = self._get_bucket(bucket)
+        parts = list(gcs_bucket.list_blobs(prefix=self._get_multipart_upload_prefix(upload_id)))
+        gcs_bucket.delete_blobs(parts, timeout=self._GCS_DEFAULT_TIMEOUT)
+
+    def delete_artifacts(self, artifact_path=None):
+        (bucket_name, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+
+        gcs_bucket = self._get_bucket(bucket_name)
+        blobs = gcs_bucket.list_blobs(prefix=f"{dest_path}")
+        for blob in blobs:
+            blob.delete()
@@ -0,0 +1,437 @@
+"""
+Instrumentation of the transfers of artifact repositories.
+
+The uploads and downloads of artifact repositories are reported to the registered artifact transfer
+listeners as :py:class:`ArtifactTransferEvent` events, with their size, duration, number of retried
+requests and backend:
+
+- A ``"file"`` event for each file transferred with ``log_artifact`` or ``_download_file``, or
+  streamed with ``_log_artifact_stream`` or ``_download_artifact_stream``. Files downloaded in
+  chunks are reported once per chunk.
+- An ``"operation"`` event for each directory or file transferred with ``log_artifacts`` or
+  ``download_artifacts``.
+
+Listeners are functions called with the events, registered with
+:py:func:`register_artifact_transfer_listener` or by other packages with the
+``mlflow.artifact_transfer_listener`` entrypoint. They're called from the threads transferring the
+artifacts. When no listener is registered, the transfers aren't instrumented.
+
+Setting ``MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR`` additionally displays the progress of
+``log_artifacts`` and ``download_artifacts`` with ``tqdm``.
+"""
+import contextvars
+import functools
+import logging
+import os
+import posixpath
+import time
+import warnings
+from typing import NamedTuple, Optional
+
+import entrypoints
+
+from mlflow.environment_variables import MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR
+
+_logger = logging.getLogger(__name__)
+
+UPLOAD = "upload"
+DOWNLOAD = "download"
+FILE_SCOPE = "file"
+OPERATION_SCOPE = "operation"
+
+
+class ArtifactTransferEvent(NamedTuple):
+    """
+    A completed or failed transfer of artifacts.
+    """
+
+    #: ``"upload"`` or ``"download"``.
+    operation: str
+    #: ``"file"`` for the transfer of a single file, ``"operation"`` for ``log_artifacts`` and
+    #: ``download_artifacts``.
+    scope: str
+    #: The name of the artifact repository class transferring the artifacts.
+    backend: str
+    #: The artifact URI of the repository.
+    artifact_uri: str
+    #: The artifact path of the transferred artifacts, relative to the artifact URI.
+    path: Optional[str]
+    #: The number of bytes transferred.
+    num_bytes: int
+    #: The duration of the transfer in seconds.
+    duration_seconds: float
+    #: The number of requests retried by the transfer.
+    retries: int
+    #: The exception the transfer failed with, or ``None`` if it succeeded.
+    error: Optional[BaseException]
+
+
+class ArtifactTransferListenerRegistry:
+    def __init__(self):
+        self._registry = []
+
+    def register(self, listener):
+        self._registry.append(listener)
+
+    def unregister(self, listener):
+        self._registry.remove(listener)
+
+    def register_entrypoints(self):
+        """Register artifact transfer listeners provided by other packages"""
+        for entrypoint in entrypoints.get_group_all("mlflow.artifact_transfer_listener"):
+            try:
+                self.register(entrypoint.load())
+            except (AttributeError, ImportError) as exc:
+                warnings.warn(
+                    'Failure attempting to register artifact transfer listener "{}": {}'.format(
+                        entrypoint.name, str(exc)
+                    ),
+                    stacklevel=2,
+                )
+
+    def __bool__(self):
+        return bool(self._registry)
+
+    def __iter__(self):
+        return iter(list(self._registry))
+
+
+_artifact_transfer_listener_registry = ArtifactTransferListenerRegistry()
+_artifact_transfer_listener_registry.register_entrypoints()
+
+
+def register_artifact_transfer_listener(listener):
+    """
+    Register a function called with an :py:class:`ArtifactTransferEvent` for each transfer of
+    artifacts.
+    """
+    _artifact_transfer_listener_registry.register(listener)
+
+
+def unregister_artifact_transfer_listener(listener):
+    """
+    Unregister a function registered with :py:func:`register_artifact_transfer_listener`.
+    """
+    _artifact_transfer_listener_registry.unregister(listener)
+
+
+def _emit(event):
+    for listener in _artifact_transfer_listener_registry:
+        try:
+            listener(event)
+        except Exception as e:
+            _logger.warning("Encountered unexpected error in artifact transfer listener: %s", e)
+
+
+class _Transfer:
+    def __init__(self, repo, operation, scope, path):
+        self.backend = type(repo).__name__
+        self.artifact_uri = repo.artifact_uri
+        self.operation = operation
+        self.scope = scope
+        self.path = path
+        self.start_time = time.monotonic()
+        self.retries = 0
+
+    def delegate_to(self, transfer):
+        """
+        Attribute the transfer to the nested transfer of another repository doing it, e.g. the
+        repository of the artifact URI a ``runs:/`` URI resolves to.
+        """
+        self.backend = transfer.backend
+        self.artifact_uri = transfer.artifact_uri
+        self.retries += transfer.retries
+
+    def emit(self, num_bytes, error=None):
+        _emit(
+            ArtifactTransferEvent(
+                operation=self.operation,
+                scope=self.scope,
+                backend=self.backend,
+                artifact_uri=self.artifact_uri,
+                path=self.path,
+                num_bytes=num_bytes,
+                duration_seconds=time.monotonic() - self.start_time,
+                retries=self.retries,
+                error=error,
+            )
+        )
+
+
+# The transfers in progress in the current thread, innermost last
+_active_transfers = contextvars.ContextVar("_active_transfers", default=())
+
+
+def record_retries(retries=1):
+    """
+    Record requests retried by the artifact transfer in progress in the current thread, if any.
+    """
+    if transfers := _active_transfers.get():
+        transfers[-1].retries += retries
+
+
+def _get_path_size(path):
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(root, f))
+            for root, _, files in os.walk(path)
+            for f in files
+        )
+    return os.path.getsize(path)
+
+
+def _log_artifact_path(local_file, artifact_path=None):
+    name = os.path.basename(local_file)
+    return posixpath.join(artifact_path, name) if artifact_path else name
+
+
+# The instrumented methods of artifact repositories: their operation, scope, and functions
+# returning the transferred artifact path from their arguments, and the number of transferred
+# bytes from their arguments and result
+_INSTRUMENTED_METHODS = {
+    "log_artifact": (
+        UPLOAD,
+        FILE_SCOPE,
+        _log_artifact_path,
+        lambda result, local_file, artifact_path=None: os.path.getsize(local_file),
+    ),
+    "log_artifacts": (
+        UPLOAD,
+        OPERATION_SCOPE,
+        lambda local_dir, artifact_path=None: artifact_path,
+        lambda result, local_dir, artifact_path=None: _get_path_size(local_dir),
+    ),
+    "_download_file": (
+        DOWNLOAD,
+        FILE_SCOPE,
+        lambda remote_file_path, local_path: remote_file_path,
+        lambda result, remote_file_path, local_path: os.path.getsize(local_path),
+    ),
+    "download_artifacts": (
+        DOWNLOAD,
+        OPERATION_SCOPE,
+        lambda artifact_path, dst_path=None: artifact_path,
+        lambda result, artifact_path, dst_path=None: _get_path_size(result),
+    ),
+}
+
+
+def _instrument_transfer(func):
+    operation, scope, get_path, get_num_bytes = _INSTRUMENTED_METHODS[func.__name__]
+
+    @functools.wraps(func)
+    def instrumented(self, *args, **kwargs):
+        if not _artifact_transfer_listener_registry:
+            return func(self, *args, **kwargs)
+
+        transfers = _active_transfers.get()
+        # The transfer this one does for another repository, which reports it
+        parent = next(
+            (t for t in reversed(transfers) if (t.operation, t.scope) == (operation, scope)),
+            None,
+        )
+        transfer = _Transfer(self, operation, scope, get_path(*args, **kwargs))
+        token = _active_transfers.set(transfers + (transfer,))
+        try:
+            result = func(self, *args, **kwargs)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            if parent is None:
+                transfer.emit(0, error=e)
+            raise
+        finally:
+            _active_transfers.reset(token)
+            if parent is not None:
+                parent.delegate_to(transfer)
+
+        if parent is None:
+            try:
+                num_bytes = get_num_bytes(result, *args, **kwargs)
+            except OSError:
+                num_bytes = 0
+            transfer.emit(num_bytes)
+        return result
+
+    instrumented._instrumented = True
+    return instrumented
+
+
+class _CountingStream:
+    """
+    Wraps a file-like object to count the bytes read from it.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.num_bytes = 0
+
+    def read(self, *args, **kwargs):
+        data = self._stream.read(*args, **kwargs)
+        self.num_bytes += len(data)
+        return data
+
+    def readinto(self, buffer):
+        num_bytes = self._stream.readinto(buffer)
+        self.num_bytes += num_bytes or 0
+        return num_bytes
+
+    def __iter__(self):
+        for data in self._stream:
+            self.num_bytes += len(data)
+            yield data
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _instrument_log_artifact_stream(func):
+    @functools.wraps(func)
+    def instrumented(self, stream, artifact_file):
+        if not _artifact_transfer_listener_registry or isinstance(stream, _CountingStream):
+            # The stream is counted by the repository delegating the upload to this one
+            return func(self, stream, artifact_file)
+
+        stream = _CountingStream(stream)
+        transfer = _Transfer(self, UPLOAD, FILE_SCOPE, artifact_file)
+        token = _active_transfers.set(_active_transfers.get() + (transfer,))
+        try:
+            result = func(self, stream, artifact_file)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            transfer.emit(stream.num_bytes, error=e)
+            raise
+        finally:
+            _active_transfers.reset(token)
+        transfer.emit(stream.num_bytes)
+        return result
+
+    instrumented._instrumented = True
+    return instrumented
+
+
+class _InstrumentedStream:
+    """
+    Wraps the iterator over the chunks of a downloaded artifact stream to report the download once
+    the stream is consumed or closed.
+    """
+
+    def __init__(self, chunks, transfer):
+        self._chunks = iter(chunks)
+        self._transfer = transfer
+        self._num_bytes = 0
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._finish()
+            raise
+        except Exception as e:
+            self._finish(error=e)
+            raise
+        self._num_bytes += len(chunk)
+        return chunk
+
+    def close(self):
+        if close := getattr(self._chunks, "close", None):
+            close()
+        self._finish()
+
+    def _finish(self, error=None):
+        if not self._done:
+            self._done = True
+            self._transfer.emit(self._num_bytes, error=error)
+
+
+def _instrument_download_artifact_stream(func):
+    @functools.wraps(func)
+    def instrumented(self, artifact_path, range_start=0, range_end=None):
+        chunks = func(self, artifact_path, range_start, range_end)
+        if not _artifact_transfer_listener_registry or isinstance(chunks, _InstrumentedStream):
+            # The stream is reported by the repository the download is delegated to
+            return chunks
+        return _InstrumentedStream(chunks, _Transfer(self, DOWNLOAD, FILE_SCOPE, artifact_path))
+
+    instrumented._instrumented = True
+    return instrumented
+
+
+_INSTRUMENTED_STREAM_METHODS = {
+    "_log_artifact_stream": _instrument_log_artifact_stream,
+    "_download_artifact_stream": _instrument_download_artifact_stream,
+}
+
+
+def instrument_artifact_repository(cls):
+    """
+    Instrument the transfer methods defined by an artifact repository class.
+    """
+    for name, value in list(vars(cls).items()):
+        if not callable(value) or getattr(value, "_instrumented", False):
+            continue
+        if name in _INSTRUMENTED_METHODS:
+            setattr(cls, name, _instrument_transfer(value))
+        elif name in _INSTRUMENTED_STREAM_METHODS:
+            setattr(cls, name, _INSTRUMENTED_STREAM_METHODS[name](value))
+    return cls
+
+
+class _ProgressBar:
+    """
+    Displays the progress of a transfer of artifacts with ``tqdm``.
+    """
+
+    def __init__(self, pbar):
+        self._pbar = pbar
+
+    @classmethod
+    def create(cls, description, total_bytes=None):
+        """
+        :return: A progress bar, or ``None`` if progress bars are disabled or ``tqdm`` isn't
+                 installed.
+        """
+        if not MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR.get():
+            return None
+        try:
+            from tqdm.auto import tqdm
+        except ImportError:
+            _logger.warning(
+                "Displaying the progress of artifact transfers requires tqdm. Install it with"
+                " `pip install tqdm`."
+            )
+            return None
+        return cls(
+            tqdm(
+                desc=description,
+                total=total_bytes,
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+            )
+        )
+
+    def update(self, num_bytes):
+        self._pbar.update(num_bytes)
+
+    def add_total(self, num_bytes):
+        """
+        Add the specified number of bytes to the total of the transfer, e.g. as files are queued.
+        """
+        self._pbar.total = (self._pbar.total or 0) + num_bytes
+        self._pbar.refresh()
+
+    def report_download_progress(self, progress):
+        """
+        Progress callback of :py:class:`mlflow.store.artifact.download_planner.DownloadPlanner`.
+        """
+        self._pbar.total = progress.total_bytes
+        self._pbar.update(progress.downloaded_bytes - self._pbar.n)
+
+    def close(self):
+        self._pbar.close()
@@ -0,0 +1,344 @@
+from datetime import datetime
+from functools import lru_cache
+import os
+import json
+from mimetypes import guess_type
+
+import posixpath
+import urllib.parse
+
+from mlflow.entities import FileInfo
+from mlflow.environment_variables import (
+    MLFLOW_S3_UPLOAD_EXTRA_ARGS,
+    MLFLOW_S3_ENDPOINT_URL,
+    MLFLOW_S3_IGNORE_TLS,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _filter_empty_directories,
+)
+from mlflow.utils import data_utils
+
+_MAX_CACHE_SECONDS = 300
+
+
+def _get_utcnow_timestamp():
+    return datetime.utcnow().timestamp()
+
+
+@lru_cache(maxsize=64)
+def _cached_get_s3_client(
+    signature_version,
+    s3_endpoint_url,
+    verify,
+    timestamp,
+    access_key_id=None,
+    secret_access_key=None,
+    session_token=None,
+):  # pylint: disable=unused-argument
+    """Returns a boto3 client, caching to avoid extra boto3 verify calls.
+
+    This method is outside of the S3ArtifactRepository as it is
+    agnostic and could be used by other instances.
+
+    `maxsize` set to avoid excessive memory consumption in the case
+    a user has dynamic endpoints (intentionally or as a bug).
+
+    Some of the boto3 endpoint urls, in very edge cases, might expire
+    after twelve hours as that is the current expiration time. To ensure
+    we throw an error on verification instead of using an expired endpoint
+    we utilise the `timestamp` parameter to invalidate cache.
+    """
+    import boto3
+    from botocore.client import Config
+
+    # Making it possible to access public S3 buckets
+    # Workaround for https://github.com/boto/botocore/issues/2442
+    if signature_version.lower() == "unsigned":
+        from botocore import UNSIGNED
+
+        signature_version = UNSIGNED
+
+    return boto3.client(
+        "s3",
+        config=Config(signature_version=signature_version),
+        endpoint_url=s3_endpoint_url,
+        verify=verify,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        aws_session_token=session_token,
+    )
+
+
+def _get_s3_client(access_key_id=None, secret_access_key=None, session_token=None):
+    s3_endpoint_url = MLFLOW_S3_ENDPOINT_URL.get()
+    do_verify = not MLFLOW_S3_IGNORE_TLS.get()
+
+    # The valid verify argument value is None/False/path to cert bundle file, See
+    # https://github.com/boto/boto3/blob/73865126cad3938ca80a2f567a1c79cb248169a7/
+    # boto3/session.py#L212
+    verify = None if do_verify else False
+
+    # NOTE: If you need to specify this env variable, please file an issue at
+    # https://github.com/mlflow/mlflow/issues so we know your use-case!
+    signature_version = os.environ.get("MLFLOW_EXPERIMENTAL_S3_SIGNATURE_VERSION", "s3v4")
+
+    # Invalidate cache every `_MAX_CACHE_SECONDS`
+    timestamp = int(_get_utcnow_timestamp() / _MAX_CACHE_SECONDS)
+
+    return _cached_get_s3_client(
+        signature_version,
+        s3_endpoint_url,
+        verify,
+        timestamp,
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+        session_token=session_token,
+    )
+
+
+class S3ArtifactRepository(ArtifactRepository):
+    """Stores artifacts on Amazon S3."""
+
+    def __init__(
+        self, artifact_uri, access_key_id=None, secret_access_key=None, session_token=None
+    ):
+        super().__init__(artifact_uri)
+        self._access_key_id = access_key_id
+        self._secret_access_key = secret_access_key
+        self._session_token = session_token
+
+    def _get_s3_client(self):
+        return _get_s3_client(
+            access_key_id=self._access_key_id,
+            secret_access_key=self._secret_access_key,
+            session_token=self._session_token,
+        )
+
+    @staticmethod
+    def parse_s3_uri(uri):
+        """Parse an S3 URI, returning (bucket, path)"""
+        parsed = urllib.parse.urlparse(uri)
+        if parsed.scheme != "s3":
+            raise Exception("Not an S3 URI: %s" % uri)
+        path = parsed.path
+        if path.startswith("/"):
+            path = path[1:]
+        return parsed.netloc, path
+
+    @staticmethod
+    def get_s3_file_upload_extra_args():
+        s3_file_upload_extra_args = MLFLOW_S3_UPLOAD_EXTRA_ARGS.get()
+        if s3_file_upload_extra_args:
+            return json.loads(s3_file_upload_extra_args)
+        else:
+            return None
+
+    def _get_upload_extra_args(self, file_name):
+        extra_args = {}
+        guessed_type, guessed_encoding = guess_type(file_name)
+        if guessed_type is not None:
+            extra_args["ContentType"] = guessed_type
+        if guessed_encoding is not None:
+            extra_args["ContentEncoding"] = guessed_encoding
+        environ_extra_args = self.get_s3_file_upload_extra_args()
+        if environ_extra_args is not None:
+            extra_args.update(environ_extra_args)
+        return extra_args
+
+    def _upload_file(self, s3_client, local_file, bucket, key):
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs=self._get_upload_extra_args(local_file),
+        )
+
+    def log_artifact(self, local_file, artifact_path=None):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        dest_path = posixpath.join(dest_path, os.path.basename(local_file))
+        self._upload_file(
+            s3_client=self._get_s3_client(), local_file=local_file, bucket=bucket, key=dest_path
+        )
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        s3_client = self._get_s3_client()
+
+        def log_file(local_file, artifact_dir):
+            upload_path = posixpath.join(dest_path, artifact_dir) if artifact_dir else dest_path
+            self._upload_file(
+                s3_client=s3_client,
+                local_file=local_file,
+                bucket=bucket,
+                key=posixpath.join(upload_path, os.path.basename(local_file)),
+            )
+
+        self._log_artifacts_concurrently(local_dir, artifact_path, log_file)
+
+    def list_artifacts(self, path=None):
+        (bucket, artifact_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        infos = []
+        prefix = dest_path + "/" if dest_path else ""
+        s3_client = self._get_s3_client()
+        paginator = s3_client.get_paginator("list_objects_v2")
+        results = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/")
+        for result in results:
+            # Subdirectories will be listed as "common prefixes" due to the way we made the request
+            for obj in result.get("CommonPrefixes", []):
+                subdir_path = obj.get("Prefix")
+                self._verify_listed_object_contains_artifact_path_prefix(
+                    listed_object_path=subdir_path, artifact_path=artifact_path
+                )
+                subdir_rel_path = posixpath.relpath(path=subdir_path, start=artifact_path)
+                if subdir_rel_path.endswith("/"):
+                    subdir_rel_path = subdir_rel_path[:-1]
+                infos.append(FileInfo(subdir_rel_path, True, None))
+            # Objects listed directly will be files
+            for obj in result.get("Contents", []):
+                file_path = obj.get("Key")
+                self._verify_listed_object_contains_artifact_path_prefix(
+                    listed_object_path=file_path, artifact_path=artifact_path
+                )
+                file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
+                file_size = int(obj.get("Size"))
+                infos.append(FileInfo(file_rel_path, False, file_size))
+        return sorted(infos, key=lambda f: f.path)
+
+    def _iter_artifacts_recursive(self, path):
+        (bucket, artifact_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path + "/" if dest_path else ""
+
+        def iter_objects():
+            s3_client = self._get_s3_client()
+            paginator = s3_client.get_paginator("list_objects_v2")
+            # Without a delimiter, all the objects under the prefix are listed at once
+            for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for obj in result.get("Contents", []):
+                    file_path = obj.get("Key")
+                    self._verify_listed_object_contains_artifact_path_prefix(
+                        listed_object_path=file_path, artifact_path=artifact_path
+                    )
+                    file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
+                    if file_path.endswith("/"):
+                        # Placeholder object of a directory
+                        if file_path != prefix:
+                            yield FileInfo(file_rel_path, True, None)
+                        continue
+                    yield FileInfo(file_rel_path, False, int(obj.get("Size")))
+
+        yield from _filter_empty_directories(iter_objects())
+
+    @staticmethod
+    def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
+        if not listed_object_path.startswith(artifact_path):
+            raise MlflowException(
+                "The path of the listed S3 object does not begin with the specified"
+                f" artifact path. Artifact path: {artifact_path}. Object path:"
+                f" {listed_object_path}."
+            )
+
+    def _download_file(self, remote_file_path, local_path):
+        (bucket, s3_root_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, remote_file_path)
+        s3_client = self._get_s3_client()
+        s3_client.download_file(bucket, s3_full_path, local_path)
+
+    def _get_artifact_file_size(self, artifact_path):
+        from botocore.exceptions import ClientError
+
+        (bucket, s3_root_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        try:
+            head = self._get_s3_client().head_object(Bucket=bucket, Key=s3_full_path)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                raise MlflowException(
+                    f"Artifact file '{artifact_path}' does not exist", RESOURCE_DOES_NOT_EXIST
+                ) from e
+            raise
+        return head["ContentLength"]
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        (bucket, s3_root_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        kwargs = {}
+        # S3 rejects ranges of empty objects, so only request a range if a partial content is
+        # needed
+        if range_start > 0 or range_end is not None:
+            kwargs["Range"] = f"bytes={range_start}-{'' if range_end is None else range_end}"
+        response = self._get_s3_client().get_object(Bucket=bucket, Key=s3_full_path, **kwargs)
+        return response["Body"].iter_chunks(_STREAM_CHUNK_SIZE)
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        self._get_s3_client().upload_fileobj(
+            Fileobj=stream,
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            ExtraArgs=self._get_upload_extra_args(artifact_file),
+        )
+
+    def _create_multipart_upload(self, artifact_file):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        response = self._get_s3_client().create_multipart_upload(
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            **self._get_upload_extra_args(artifact_file),
+        )
+        return response["UploadId"]
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        response = self._get_s3_client().upload_part(
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=part_file,
+        )
+        return response["ETag"]
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        self._get_s3_client().complete_multipart_upload(
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": etag} for part_number, etag in sorted(parts)
+                ]
+            },
+        )
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        self._get_s3_client().abort_multipart_upload(
+            Bucket=bucket, Key=posixpath.join(dest_path, artifact_file), UploadId=upload_id
+        )
+
+    def delete_artifacts(self, artifact_path=None):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+
+        s3_client = self._get_s3_client()
+        list_objects = s3_client.list_objects(Bucket=bucket, Prefix=dest_path).get("Contents", [])
+        for to_delete_obj in list_objects:
+            file_path = to_delete_obj.get("Key")
+            self._verify_listed_object_contains_artifact_path_prefix(
+                listed_object_path=file_path, artifact_path=dest_path
+            )
+            s3_client.delete_object(Bucket=bucket, Key=file_path)
@@ -0,0 +1,313 @@
+from abc import abstractmethod, ABCMeta
+from mlflow.utils.annotations import developer_stable
+
+
+@developer_stable
+class AbstractStore:
+    """
+    Abstract class that defines API interfaces for storing Model Registry metadata.
+    """
+
+    __metaclass__ = ABCMeta
+
+    def __init__(self, store_uri=None, tracking_uri=None):
+        """
+        Empty constructor. This is deliberately not marked as abstract, else every derived class
+        would be forced to create one.
+
+        :param store_uri: The model registry store URI
+        :param tracking_uri: URI of the current MLflow tracking server, used to perform operations
+                             like fetching source run metadata or downloading source run artifacts
+                             to support subsequently uploading them to the model registry storage
+                             location
+        """
+        pass
+
+    # CRUD API for RegisteredModel objects
+
+    @abstractmethod
+    def create_registered_model(self, name, tags=None, description=None):
+        """
+        Create a new registered model in backend store.
+
+        :param name: Name of the new model. This is expected to be unique in the backend store.
+        :param tags: A list of :py:class:`mlflow.entities.model_registry.RegisteredModelTag`
+                     instances associated with this registered model.
+        :param description: Description of the model.
+        :return: A single object of :py:class:`mlflow.entities.model_registry.RegisteredModel`
+                 created in the backend.
+        """
+        pass
+
+    @abstractmethod
+    def update_registered_model(self, name, description):
+        """
+        Update description of the registered model.
+
+        :param name: Registered model name.
+        :param description: New description.
+        :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        pass
+
+    @abstractmethod
+    def rename_registered_model(self, name, new_name):
+        """
+        Rename the registered model.
+
+        :param name: Registered model name.
+        :param new_name: New proposed name.
+        :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        pass
+
+    @abstractmethod
+    def delete_registered_model(self, name):
+        """
+        Delete the registered model.
+        Backend raises exception if a registered model with given name does not exist.
+
+        :param name: Registered model name.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def search_registered_models(
+        self, filter_string=None, max_results=None, order_by=None, page_token=None
+    ):
+        """
+        Search for registered models in backend that satisfy the filter criteria.
+
+        :param filter_string: Filter query string, defaults to searching all registered models.
+        :param max_results: Maximum number of registered models desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_registered_models`` call.
+        :return: A PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects
+                that satisfy the search expressions. The pagination token for the next page can be
+                obtained via the ``token`` attribute of the object.
+        """
+        pass
+
+    @abstractmethod
+    def get_registered_model(self, name):
+        """
+        Get registered model instance by name.
+
+        :param name: Registered model name.
+        :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        pass
+
+    @abstractmethod
+    def get_latest_versions(self, name, stages=None):
+        """
+        Latest version models for each requested stage. If no ``stages`` argument is provided,
+        returns the latest version for each stage.
+
+        :param name: Registered model name.
+        :param stages: List of desired stages. If input list is None, return latest versions for
+                       each stage.
+        :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+        """
+        pass
+
+    @abstractmethod
+    def set_registered_model_tag(self, name, tag):
+        """
+        Set a tag for the registered model.
+
+        :param name: Registered model name.
+        :param tag: :py:class:`mlflow.entities.model_registry.RegisteredModelTag` instance to log.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def delete_registered_model_tag(self, name, key):
+        """
+        Delete a tag associated with the registered model.
+
+        :param name: Registered model name.
+        :param key: Registered model tag key.
+        :return: None
+        """
+        pass
+
+    # CRUD API for ModelVersion objects
+
+    @abstractmethod
+    def create_model_version(
+        self,
+        name,
+        source,
+        run_id=None,
+        tags=None,
+        run_link=None,
+        description=None,
+        local_model_path=None,
+    ):
+        """
+        Create a new model version from given source and run ID.
+
+        :param name: Registered model name.
+        :param source: Source path where the MLflow model is stored.
+        :param run_id: Run ID from MLflow tracking server that generated the model.
+        :param tags: A list of :py:class:`mlflow.entities.model_registry.ModelVersionTag`
+                     instances associated with this model version.
+        :param run_link: Link to the run from an MLflow tracking server that generated this model.
+        :param description: Description of the version.
+        :param local_model_path: Local path to the MLflow model, if it's already accessible
+                                 on the local filesystem. Can be used by AbstractStores that
+                                 upload model version files to the model registry to avoid
+                                 a redundant download from the source location when logging
+                                 and registering a model via a single
+                                 mlflow.<flavor>.log_model(..., registered_model_name) call
+        :return: A single object of :py:class:`mlflow.entities.model_registry.ModelVersion`
+                 created in the backend.
+        """
+        pass
+
+    @abstractmethod
+    def update_model_version(self, name, version, description):
+        """
+        Update metadata associated with a model version in backend.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param description: New model description.
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        pass
+
+    @abstractmethod
+    def transition_model_version_stage(self, name, version, stage, archive_existing_versions):
+        """
+        Update model version stage.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param stage: New desired stage for this model version.
+        :param archive_existing_versions: If this flag is set to ``True``, all existing model
+            versions in the stage will be automatically moved to the "archived" stage. Only valid
+            when ``stage`` is ``"staging"`` or ``"production"`` otherwise an error will be raised.
+
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        pass
+
+    @abstractmethod
+    def delete_model_version(self, name, version):
+        """
+        Delete model version in backend.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def get_model_version(self, name, version):
+        """
+        Get the model version instance by name and version.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        pass
+
+    @abstractmethod
+    def get_model_version_download_uri(self, name, version):
+        """
+        Get the download location in Model Registry for this model version.
+        NOTE: For first version of Model Registry, since the models are not copied over to another
+              location, download URI points to input source path.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :return: A single URI location that allows reads for downloading.
+        """
+        pass
+
+    @abstractmethod
+    def search_model_versions(
+        self, filter_string=None, max_results=None, order_by=None, page_token=None
+    ):
+        """
+        Search for model versions in backend that satisfy the filter criteria.
+
+        :param filter_string: A filter string expression. Currently supports a single filter
+                              condition either name of model like ``name = 'model_name'`` or
+                              ``run_id = '...'``.
+        :param max_results: Maximum number of model versions desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_model_versions`` call.
+        :return: A PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion`
+                 objects that satisfy the search expressions. The pagination token for the next
+                 page can be obtained via the ``token`` attribute of the object.
+        """
+        pass
+
+    @abstractmethod
+    def set_model_version_tag(self, name, version, tag):
+        """
+        Set a tag for the model version.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param tag: :py:class:`mlflow.entities.model_registry.ModelVersionTag` instance to log.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def delete_model_version_tag(self, name, version, key):
+        """
+        Delete a tag associated with the model version.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param key: Tag key.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def set_registered_model_alias(self, name, alias, version):
+        """
+        Set a registered model alias pointing to a model version.
+
+        :param name: Registered model name.
+        :param alias: Name of the alias.
+        :param version: Registered model version number.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def delete_registered_model_alias(self, name, alias):
+        """
+        Delete an alias associated with a registered model.
+
+        :param name: Registered model name.
+        :param alias: Name of the alias.
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def get_model_version_by_alias(self, name, alias):
+        """
+        Get the model version instance by name and alias.
+
+        :param name: Registered model name.
+        :param alias: Name of the alias.
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        pass
@@ -0,0 +1,283 @@
+"""
+A persistent, per-experiment index of run metadata for the file-based tracking ``FileStore``.
+
+The index is a SQLite database stored next to the runs of an experiment. It records the run info,
+the latest value of each metric, the params and the tags of every run, which is all the data
+required to evaluate search filters, ``order_by`` clauses and pagination without reading the
+``meta.yaml``, metric, param and tag files of every run.
+
+The run directories remain the source of truth: the index is kept up to date by the ``FileStore``
+write APIs and is reconciled with the run directories of the experiment on every search, so that
+runs created (or permanently deleted) without the index are picked up. Updates made to existing
+runs by writers that don't maintain the index are not detected.
+"""
+import logging
+import math
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.entities.lifecycle_stage import LifecycleStage
+
+_logger = logging.getLogger(__name__)
+
+# Seconds to wait for a lock held by a concurrent writer before giving up
+_SQLITE_TIMEOUT_SECONDS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_uuid TEXT PRIMARY KEY,
+    run_name TEXT,
+    experiment_id TEXT,
+    user_id TEXT,
+    status TEXT,
+    start_time INTEGER,
+    end_time INTEGER,
+    lifecycle_stage TEXT,
+    artifact_uri TEXT
+);
+CREATE TABLE IF NOT EXISTS latest_metrics (
+    run_uuid TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value REAL,
+    is_nan INTEGER NOT NULL,
+    timestamp INTEGER,
+    step INTEGER,
+    PRIMARY KEY (run_uuid, key)
+);
+CREATE TABLE IF NOT EXISTS params (
+    run_uuid TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_uuid, key)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    run_uuid TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_uuid, key)
+);
+"""
+
+_RUN_INFO_COLUMNS = (
+    "run_uuid",
+    "run_name",
+    "experiment_id",
+    "user_id",
+    "status",
+    "start_time",
+    "end_time",
+    "lifecycle_stage",
+    "artifact_uri",
+)
+
+
+def _latest_metric_sort_key(metric):
+    # Must match the ordering used by ``FileStore._get_metric_from_file``
+    return (metric.step, metric.timestamp, metric.value)
+
+
+class FileStoreRunIndex:
+    """
+    Index of the runs of a single experiment directory.
+    """
+
+    INDEX_FILE_NAME = ".run_index.sqlite"
+
+    def __init__(self, experiment_dir):
+        self.experiment_dir = experiment_dir
+        self.path = os.path.join(experiment_dir, FileStoreRunIndex.INDEX_FILE_NAME)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=_SQLITE_TIMEOUT_SECONDS)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _update(self):
+        """
+        Applies an update to the index. Failures are not propagated to the caller because the run
+        directories remain the source of truth; instead, the index is discarded so that it is
+        rebuilt from the run directories by the next search.
+        """
+        try:
+            with self._connect() as conn:
+                yield conn
+        except sqlite3.Error as e:
+            _logger.warning(
+                "Failed to update the run index '%s', it will be rebuilt on the next search: %s",
+                self.path,
+                e,
+            )
+            self.invalidate()
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _upsert_run_info(conn, run_info, insert):
+        values = [getattr(run_info, column) for column in _RUN_INFO_COLUMNS]
+        if insert:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs ({}) VALUES ({})".format(
+                    ", ".join(_RUN_INFO_COLUMNS), ", ".join("?" * len(_RUN_INFO_COLUMNS))
+                ),
+                values,
+            )
+        else:
+            # Only runs that have been fully indexed are updated, other runs are indexed from their
+            # run directory by the next search
+            conn.execute(
+                "UPDATE runs SET {} WHERE run_uuid = ?".format(
+                    ", ".join(f"{column} = ?" for column in _RUN_INFO_COLUMNS[1:])
+                ),
+                values[1:] + values[:1],
+            )
+
+    @staticmethod
+    def _log_metrics(conn, run_id, metrics):
+        for metric in metrics:
+            row = conn.execute(
+                "SELECT value, is_nan, timestamp, step FROM latest_metrics "
+                "WHERE run_uuid = ? AND key = ?",
+                (run_id, metric.key),
+            ).fetchone()
+            if row is not None:
+                value, is_nan, timestamp, step = row
+                latest = Metric(metric.key, math.nan if is_nan else value, timestamp, step)
+                if not _latest_metric_sort_key(metric) > _latest_metric_sort_key(latest):
+                    continue
+            is_nan = math.isnan(metric.value)
+            conn.execute(
+                "INSERT OR REPLACE INTO latest_metrics "
+                "(run_uuid, key, value, is_nan, timestamp, step) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    metric.key,
+                    None if is_nan else float(metric.value),
+                    int(is_nan),
+                    metric.timestamp,
+                    metric.step,
+                ),
+            )
+
+    @staticmethod
+    def _set_key_values(conn, table, run_id, entities):
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {table} (run_uuid, key, value) VALUES (?, ?, ?)",
+            [(run_id, entity.key, entity.value) for entity in entities],
+        )
+
+    def create_run(self, run_info):
+        with self._update() as conn:
+            self._upsert_run_info(conn, run_info, insert=True)
+
+    def update_run_info(self, run_info):
+        with self._update() as conn:
+            self._upsert_run_info(conn, run_info, insert=False)
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Records metrics, params and tags that have been written to the run directory. ``params``
+        and ``tags`` must contain the values as they have been persisted.
+        """
+        with self._update() as conn:
+            self._log_metrics(conn, run_id, metrics)
+            self._set_key_values(conn, "params", run_id, params)
+            self._set_key_values(conn, "tags", run_id, tags)
+
+    def delete_tag(self, run_id, key):
+        with self._update() as conn:
+            conn.execute("DELETE FROM tags WHERE run_uuid = ? AND key = ?", (run_id, key))
+
+    @staticmethod
+    def _delete_runs(conn, run_ids):
+        for table in ("runs", "latest_metrics", "params", "tags"):
+            conn.executemany(
+                f"DELETE FROM {table} WHERE run_uuid = ?", [(run_id,) for run_id in run_ids]
+            )
+
+    def delete_run(self, run_id):
+        """
+        Removes a run from the index. If the run directory still exists, the run is indexed again
+        from its run directory by the next search.
+        """
+        with self._update() as conn:
+            self._delete_runs(conn, [run_id])
+
+    def _list_run_dirs(self):
+        with os.scandir(self.experiment_dir) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+
+    def reconcile(self, reserved_folders, load_run):
+        """
+        Brings the index in sync with the run directories of the experiment.
+
+        :param reserved_folders: Names of the experiment sub-directories that aren't runs.
+        :param load_run: Function that reads the ``Run`` stored in the given run directory, or
+                         returns ``None`` if the run can't be indexed.
+        """
+        run_dirs = self._list_run_dirs() - set(reserved_folders)
+        with self._connect() as conn:
+            indexed = {row[0] for row in conn.execute("SELECT run_uuid FROM runs")}
+            self._delete_runs(conn, indexed - run_dirs)
+            for run_dir in run_dirs - indexed:
+                run = load_run(os.path.join(self.experiment_dir, run_dir))
+                if run is None:
+                    continue
+                # Replace any partial data recorded for the run before it was indexed
+                self._delete_runs(conn, [run.info.run_id])
+                self._upsert_run_info(conn, run.info, insert=True)
+                self._log_metrics(conn, run.info.run_id, run.data._metric_objs)
+                params = [Param(key, value) for key, value in run.data.params.items()]
+                tags = [RunTag(key, value) for key, value in run.data.tags.items()]
+                self._set_key_values(conn, "params", run.info.run_id, params)
+                self._set_key_values(conn, "tags", run.info.run_id, tags)
+
+    def load_runs(self, view_type):
+        """
+        Returns the runs of the experiment that match the given view type. The runs contain the
+        run info, the latest metrics, the params and the tags recorded in the index.
+        """
+        stages = LifecycleStage.view_type_to_stages(view_type)
+        with self._connect() as conn:
+            run_infos = {
+                row[0]: RunInfo(**dict(zip(_RUN_INFO_COLUMNS, row)))
+                for row in conn.execute(
+                    "SELECT {} FROM runs WHERE lifecycle_stage IN ({})".format(
+                        ", ".join(_RUN_INFO_COLUMNS), ", ".join("?" * len(stages))
+                    ),
+                    stages,
+                )
+            }
+            metrics = {run_id: [] for run_id in run_infos}
+            params = {run_id: [] for run_id in run_infos}
+            tags = {run_id: [] for run_id in run_infos}
+            for run_id, key, value, is_nan, timestamp, step in conn.execute(
+                "SELECT run_uuid, key, value, is_nan, timestamp, step FROM latest_metrics"
+            ):
+                if run_id in metrics:
+                    metrics[run_id].append(
+                        Metric(key, math.nan if is_nan else value, timestamp, step)
+                    )
+            for table, entities, entity_class in (
+                ("params", params, Param),
+                ("tags", tags, RunTag),
+            ):
+                for run_id, key, value in conn.execute(f"SELECT run_uuid, key, value FROM {table}"):
+                    if run_id in entities:
+                        entities[run_id].append(entity_class(key, value))
+
+        return [
+            Run(run_info, RunData(metrics[run_id], params[run_id], tags[run_id]))
+            for run_id, run_info in run_infos.items()
+        ]
@@ -0,0 +1,102 @@
+"""
+Downsampling of metric histories for plotting.
+
+A metric history with more than ``max_points`` points is split into ``max_points // 2`` buckets of
+equal width along the x axis (``step`` or ``timestamp``), and only the points with the minimum and
+maximum value of each bucket are kept. This preserves the envelope of the series, including
+spikes, while bounding the number of points returned for each series. NaN values are only kept
+for buckets that don't contain any other value.
+
+``SqlAlchemyStore`` implements the same sampling in SQL, so any change to the sampling rules must
+be reflected there.
+"""
+import math
+
+METRIC_SAMPLING_X_AXES = ("step", "timestamp")
+
+
+def _get_other_axis(x_axis):
+    return "timestamp" if x_axis == "step" else "step"
+
+
+def _get_min_sort_key(metric, x_axis):
+    is_nan = math.isnan(metric.value)
+    return (
+        is_nan,
+        0 if is_nan else metric.value,
+        getattr(metric, x_axis),
+        getattr(metric, _get_other_axis(x_axis)),
+    )
+
+
+def _get_max_sort_key(metric, x_axis):
+    is_nan = math.isnan(metric.value)
+    return (
+        is_nan,
+        0 if is_nan else -metric.value,
+        getattr(metric, x_axis),
+        getattr(metric, _get_other_axis(x_axis)),
+    )
+
+
+def get_metric_sort_key(metric, x_axis):
+    """
+    Returns the key used to order the points of a sampled metric history.
+    """
+    return (
+        getattr(metric, x_axis),
+        getattr(metric, _get_other_axis(x_axis)),
+        metric.value,
+    )
+
+
+def get_num_buckets(max_points):
+    if max_points < 2:
+        raise ValueError(f"max_points must be at least 2, got {max_points}")
+    return max_points // 2
+
+
+def sample_metric_history(get_metrics, max_points, x_axis="step"):
+    """
+    Downsamples a metric history to at most ``max_points`` points.
+
+    :param get_metrics: A function returning a new iterable over the
+                        :py:class:`mlflow.entities.Metric` points of the history. It is called at
+                        most twice, which allows to stream histories that don't fit in memory
+                        from their source.
+    :param max_points: The maximum number of points to return, at least 2.
+    :param x_axis: The axis along which to bucket the points, either ``"step"`` or
+                   ``"timestamp"``.
+    :return: A list of :py:class:`mlflow.entities.Metric` sorted by ``x_axis``.
+    """
+    num_points = 0
+    x_min = None
+    x_max = None
+    for metric in get_metrics():
+        x = getattr(metric, x_axis)
+        num_points += 1
+        x_min = x if x_min is None else min(x_min, x)
+        x_max = x if x_max is None else max(x_max, x)
+
+    num_buckets = get_num_buckets(max_points)
+    if num_points <= max_points:
+        return sorted(get_metrics(), key=lambda m: get_metric_sort_key(m, x_axis))
+
+    x_range = x_max - x_min + 1
+    min_points = {}
+    max_points_by_bucket = {}
+    for metric in get_metrics():
+        bucket = (getattr(metric, x_axis) - x_min) * num_buckets // x_range
+        current_min = min_points.get(bucket)
+        if current_min is None or _get_min_sort_key(metric, x_axis) < _get_min_sort_key(
+            current_min, x_axis
+        ):
+            min_points[bucket] = metric
+        current_max = max_points_by_bucket.get(bucket)
+        if current_max is None or _get_max_sort_key(metric, x_axis) < _get_max_sort_key(
+            current_max, x_axis
+        ):
+            max_points_by_bucket[bucket] = metric
+
+    sampled = {id(m): m for m in [*min_points.values(), *max_points_by_bucket.values()]}
+    return sorted(sampled.values(), key=lambda m: get_metric_sort_key(m, x_axis))
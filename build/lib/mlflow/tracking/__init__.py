@@ -0,0 +1,28 @@
+"""
+The ``mlflow.tracking`` module provides a Python CRUD interface to MLflow experiments
+and runs. This is a lower level API that directly translates to MLflow
+`REST API <../rest-api.html>`_ calls.
+For a higher level API for managing an "active run", use the :py:mod:`mlflow` module.
+"""
+
+from mlflow.tracking.client import MlflowClient
+from mlflow.tracking._tracking_service.utils import (
+    set_tracking_uri,
+    get_tracking_uri,
+    is_tracking_uri_set,
+    _get_store,
+)
+from mlflow.tracking._model_registry.utils import (
+    set_registry_uri,
+    get_registry_uri,
+)
+
+__all__ = [
+    "MlflowClient",
+    "get_tracking_uri",
+    "set_tracking_uri",
+    "is_tracking_uri_set",
+    "_get_store",
+    "get_registry_uri",
+    "set_registry_uri",
+]
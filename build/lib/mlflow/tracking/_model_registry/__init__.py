@@ -0,0 +1 @@
+DEFAULT_AWAIT_MAX_SLEEP_SECONDS = 5 * 60
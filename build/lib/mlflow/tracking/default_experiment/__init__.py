@@ -0,0 +1 @@
+DEFAULT_EXPERIMENT_ID = "0"
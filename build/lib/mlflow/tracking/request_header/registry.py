@@ -0,0 +1,113 @@
+import entrypoints
+import warnings
+import logging
+import time
+
+from mlflow.tracking.request_header.databricks_request_header_provider import (
+    DatabricksRequestHeaderProvider,
+)
+from mlflow.tracking.request_header.default_request_header_provider import (
+    DefaultRequestHeaderProvider,
+)
+from mlflow.environment_variables import MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL
+
+_logger = logging.getLogger(__name__)
+
+# The registry of the providers that the cached request headers were resolved from, the monotonic
+# time at which they expire and the cached request headers
+_cached_request_headers = None
+
+
+def _invalidate_request_headers_cache():
+    global _cached_request_headers
+    _cached_request_headers = None
+
+
+class RequestHeaderProviderRegistry:
+    def __init__(self):
+        self._registry = []
+
+    def register(self, request_header_provider):
+        self._registry.append(request_header_provider())
+        _invalidate_request_headers_cache()
+
+    def register_entrypoints(self):
+        """Register tracking stores provided by other packages"""
+        for entrypoint in entrypoints.get_group_all("mlflow.request_header_provider"):
+            try:
+                self.register(entrypoint.load())
+            except (AttributeError, ImportError) as exc:
+                warnings.warn(
+                    'Failure attempting to register request header provider "{}": {}'.format(
+                        entrypoint.name, str(exc)
+                    ),
+                    stacklevel=2,
+                )
+
+    def __iter__(self):
+        return iter(self._registry)
+
+
+_request_header_provider_registry = RequestHeaderProviderRegistry()
+_request_header_provider_registry.register(DatabricksRequestHeaderProvider)
+_request_header_provider_registry.register(DefaultRequestHeaderProvider)
+
+_request_header_provider_registry.register_entrypoints()
+
+
+def _resolve_provider_request_headers():
+    all_request_headers = {}
+    for provider in _request_header_provider_registry:
+        try:
+            if provider.in_context():
+                # all_request_headers.update(provider.request_headers())
+                for header, value in provider.request_headers().items():
+                    all_request_headers[header] = (
+                        f"{all_request_headers[header]} {value}"
+                        if header in all_request_headers
+                        else value
+                    )
+        except Exception as e:
+            _logger.warning("Encountered unexpected error during resolving request headers: %s", e)
+    return all_request_headers
+
+
+def resolve_request_headers(request_headers=None):
+    """Generate a set of request headers from registered providers. Request headers are resolved in
+    the order that providers are registered. Argument headers are applied last.
+
+    This function iterates through all request header providers in the registry. Additional context
+    providers can be registered as described in
+    :py:class:`mlflow.tracking.request_header.RequestHeaderProvider`. The headers resolved from the
+    providers are cached for ``MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL`` seconds, or until another
+    provider is registered.
+
+    :param tags: A dictionary of request headers to override. If specified, headers passed in this
+        argument will override those inferred from the context.
+    :return: A dictionary of resolved headers.
+    """
+    global _cached_request_headers
+
+    cache_ttl = MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL.get()
+    now = time.monotonic()
+    cached = _cached_request_headers
+    if (
+        cache_ttl > 0
+        and cached is not None
+        and cached[0] is _request_header_provider_registry
+        and now < cached[1]
+    ):
+        all_request_headers = dict(cached[2])
+    else:
+        all_request_headers = _resolve_provider_request_headers()
+        if cache_ttl > 0:
+            _cached_request_headers = (
+                _request_header_provider_registry,
+                now + cache_ttl,
+                dict(all_request_headers),
+            )
+
+    if request_headers is not None:
+        all_request_headers.update(request_headers)
+
+    return all_request_headers
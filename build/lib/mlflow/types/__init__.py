@@ -0,0 +1,8 @@
+"""
+The :py:mod:`mlflow.types` module defines data types and utilities to be used by other mlflow
+components to describe interface independent of other frameworks or languages.
+"""
+
+from .schema import DataType, ColSpec, Schema, TensorSpec
+
+__all__ = ["Schema", "ColSpec", "DataType", "TensorSpec"]
@@ -0,0 +1,9 @@
+# Copyright 2018 Databricks, Inc.
+import re
+
+
+VERSION = "2.4.3.dev0"
+
+
+def is_release_version():
+    return bool(re.match(r"^\d+\.\d+\.\d+$", VERSION))
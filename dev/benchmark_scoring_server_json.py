@@ -0,0 +1,97 @@
+"""
+Benchmarks the JSON decoding and encoding of the pyfunc scoring server against the pandas-based
+implementation it replaces.
+
+Usage:
+    python dev/benchmark_scoring_server_json.py --rows 1000 --columns 200
+"""
+import argparse
+import json
+import os
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from mlflow.pyfunc.scoring_server import infer_and_parse_json_input, predictions_to_json
+from mlflow.types import ColSpec, Schema
+from mlflow.utils.proto_json_utils import NumpyEncoder, cast_df_types_according_to_schema
+
+
+def parse_with_pandas(payload, schema):
+    decoded_input = json.loads(payload)["dataframe_split"]
+    pdf = pd.DataFrame(columns=decoded_input["columns"], data=decoded_input["data"])
+    return cast_df_types_according_to_schema(pdf, schema)
+
+
+class _NullOutput:
+    def write(self, _):
+        pass
+
+
+def encode_with_pandas(predictions):
+    json.dump(
+        {"predictions": predictions.to_dict(orient="records")}, _NullOutput(), cls=NumpyEncoder
+    )
+
+
+def report(name, baseline_fn, optimized_fn, number):
+    baseline = min(timeit.repeat(baseline_fn, number=number, repeat=5)) / number
+    optimized = min(timeit.repeat(optimized_fn, number=number, repeat=5)) / number
+    print(
+        f"{name:<30} baseline: {baseline * 1000:8.2f} ms   optimized: {optimized * 1000:8.2f} ms"
+        f"   speedup: {baseline / optimized:5.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    columns = [f"c{i}" for i in range(args.columns)]
+    types = ["double", "float", "long", "integer"]
+    schema = Schema([ColSpec(types[i % len(types)], name) for i, name in enumerate(columns)])
+    data = rng.integers(0, 1000, size=(args.rows, args.columns)).tolist()
+    payload = json.dumps({"dataframe_split": {"columns": columns, "data": data}})
+    predictions = pd.DataFrame(rng.random((args.rows, args.columns)), columns=columns)
+
+    print(f"{args.rows} rows x {args.columns} columns")
+    report(
+        "parse dataframe_split",
+        lambda: parse_with_pandas(payload, schema),
+        lambda: infer_and_parse_json_input(payload, schema),
+        args.number,
+    )
+    report(
+        "encode predictions",
+        lambda: encode_with_pandas(predictions),
+        lambda: predictions_to_json(predictions, _NullOutput()),
+        args.number,
+    )
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        print("orjson is not installed, skipping the orjson benchmarks")
+        return
+
+    os.environ["MLFLOW_SCORING_SERVER_USE_ORJSON"] = "true"
+    report(
+        "parse dataframe_split (orjson)",
+        lambda: parse_with_pandas(payload, schema),
+        lambda: infer_and_parse_json_input(payload, schema),
+        args.number,
+    )
+    report(
+        "encode predictions (orjson)",
+        lambda: encode_with_pandas(predictions),
+        lambda: predictions_to_json(predictions, _NullOutput()),
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -172,6 +172,8 @@ from mlflow.tracking.fluent import (
     last_active_run,
     log_input,
     get_parent_run,
+    enable_async_logging,
+    flush_async_logging,
 )
 from mlflow.tracking._model_registry.fluent import (
     register_model,
@@ -214,6 +216,8 @@ __all__ = [
     "active_run",
     "start_run",
     "end_run",
+    "enable_async_logging",
+    "flush_async_logging",
     "search_runs",
     "get_artifact_uri",
     "get_tracking_uri",
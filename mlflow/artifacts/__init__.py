@@ -8,6 +8,7 @@ from typing import Optional
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, BAD_REQUEST
+from mlflow.store.artifact.download_cache import download_artifacts_with_cache
 from mlflow.tracking import _get_store
 from mlflow.tracking.artifact_utils import (
     _download_artifact_from_uri,
@@ -38,7 +39,10 @@ def download_artifacts(
                      specified artifacts. If the directory does not exist, it is created. If
                      unspecified, the artifacts are downloaded to a new uniquely-named directory on
                      the local filesystem, unless the artifacts already exist on the local
-                     filesystem, in which case their local path is returned directly.
+                     filesystem, in which case their local path is returned directly. If the
+                     artifact download cache is enabled with ``MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR``,
+                     the cached artifacts are hard linked to the new directory if possible, and
+                     must not be modified in place.
     :param tracking_uri: The tracking URI to be used when downloading artifacts.
     :return: The location of the artifact file or directory on the local filesystem.
     """
@@ -66,7 +70,9 @@ def download_artifacts(
     artifact_repo = get_artifact_repository(
         add_databricks_profile_info_to_artifact_uri(artifact_uri, tracking_uri)
     )
-    artifact_location = artifact_repo.download_artifacts(artifact_path, dst_path=dst_path)
+    artifact_location = download_artifacts_with_cache(
+        artifact_repo, artifact_path, dst_path=dst_path
+    )
     return artifact_location
 
 
@@ -102,6 +102,23 @@ MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR = _EnvironmentVariable(
 #: (default: ``120``)
 MLFLOW_HTTP_REQUEST_TIMEOUT = _EnvironmentVariable("MLFLOW_HTTP_REQUEST_TIMEOUT", int, 120)
 
+#: Specifies the number of hosts for which MLflow HTTP requests keep a pool of connections alive
+#: (default: ``10``)
+MLFLOW_HTTP_POOL_CONNECTIONS = _EnvironmentVariable("MLFLOW_HTTP_POOL_CONNECTIONS", int, 10)
+
+#: Specifies the maximum number of connections that MLflow HTTP requests keep alive per host, which
+#: should be at least the number of threads concurrently making requests to the same host
+#: (default: ``10``)
+MLFLOW_HTTP_POOL_MAXSIZE = _EnvironmentVariable("MLFLOW_HTTP_POOL_MAXSIZE", int, 10)
+
+#: Specifies the number of seconds for which the request headers resolved from the registered
+#: request header providers are cached and reused by MLflow HTTP requests. The cache must only be
+#: enabled if none of the registered providers resolve headers that change between requests.
+#: (default: ``0``, which disables the cache)
+MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL = _EnvironmentVariable(
+    "MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL", int, 0
+)
+
 #: Specifies whether MLFlow HTTP requests should be signed using AWS signature V4. It will overwrite
 #: (default: ``False``). When set, it will overwrite the "Authorization" HTTP header.
 #: See https://docs.aws.amazon.com/general/latest/gr/signature-version-4.html for more information.
@@ -205,6 +222,59 @@ MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT = _EnvironmentVariable(
     "MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT", int, 60
 )
 
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum number of input rows that the MLflow Model Scoring server predicts in a
+#: single call to the model. When set, concurrent ``/invocations`` requests are queued and
+#: predicted together in batches of up to this many rows.
+#: (default: ``None``)
+MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", int, None
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies how long, in milliseconds, the MLflow Model Scoring server waits for more requests
+#: before predicting a batch smaller than ``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE``.
+#: (default: ``5``)
+MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS", int, 5
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum number of requests that each worker of the ASGI MLflow Model Scoring
+#: server predicts concurrently. Defaults to the number of threads of a
+#: ``concurrent.futures.ThreadPoolExecutor``.
+#: (default: ``None``)
+MLFLOW_SCORING_SERVER_ASGI_MAX_THREADS = _EnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_ASGI_MAX_THREADS", int, None
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether the MLflow Model Scoring server uses ``orjson``, if installed, to decode
+#: requests and encode predictions. Note that ``orjson`` encodes NaN and infinite values as
+#: ``null``, whereas they are encoded as ``NaN`` and ``Infinity`` by default.
+#: (default: ``False``)
+MLFLOW_SCORING_SERVER_USE_ORJSON = _BooleanEnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_USE_ORJSON", False
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether the gunicorn-based MLflow Model Scoring server loads the model in the master
+#: process before forking the workers (gunicorn's ``--preload`` option). The workers then share
+#: the memory of the model copy-on-write instead of each loading a copy of it. Note that models
+#: whose libraries start threads when they are loaded may not work in the forked workers.
+#: (default: ``False``)
+MLFLOW_SCORING_SERVER_PRELOAD_MODEL = _BooleanEnvironmentVariable(
+    "MLFLOW_SCORING_SERVER_PRELOAD_MODEL", False
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether models are loaded by memory-mapping their weights from the model directory
+#: instead of reading them into memory, so that the processes loading the same model share its
+#: weights through the page cache. Currently, this variable is only supported by the MLflow
+#: PyTorch flavor with PyTorch >= 2.1 and models saved in the default zip format.
+#: (default: ``False``)
+MLFLOW_MMAP_MODEL_WEIGHTS = _BooleanEnvironmentVariable("MLFLOW_MMAP_MODEL_WEIGHTS", False)
+
 #: (Experimental, may be changed or removed)
 #: Specifies the timeout to use when uploading or downloading a file
 #: (default: ``None``). If None, individual artifact stores will choose defaults.
@@ -212,6 +282,15 @@ MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT = _EnvironmentVariable(
     "MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT", int, None
 )
 
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum number of files that an artifact repository uploads or downloads
+#: concurrently when logging or downloading a directory. If None, two threads per CPU are used,
+#: up to 20 threads.
+#: (default: ``None``)
+MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_MAX_WORKERS = _EnvironmentVariable(
+    "MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_MAX_WORKERS", int, None
+)
+
 #: Specifies the device intended for use in the predict function - can be used
 #: to override behavior where the GPU is used by default when available by
 #: setting this environment variable to be ``cpu``. Currently, this
@@ -277,11 +356,89 @@ MLFLOW_WHEELED_MODEL_PIP_DOWNLOAD_OPTIONS = _EnvironmentVariable(
     "MLFLOW_WHEELED_MODEL_PIP_DOWNLOAD_OPTIONS", str, "--only-binary=:all:"
 )
 
-# Specifies whether or not to use multipart download when downloading a large file on Databricks.
+#: Specifies whether or not to use multipart download when downloading a large file, whose chunks
+#: are downloaded in parallel. Applies to Databricks and to the artifact repositories that can
+#: download ranges of artifact files.
+#: (default: ``True``)
 MLFLOW_ENABLE_MULTIPART_DOWNLOAD = _BooleanEnvironmentVariable(
     "MLFLOW_ENABLE_MULTIPART_DOWNLOAD", True
 )
 
+#: (Experimental, may be changed or removed)
+#: Specifies the minimum size in bytes of the artifact files downloaded with multipart downloads by
+#: the artifact repositories that can download ranges of artifact files.
+#: (default: ``500_000_000`` (500 MB))
+MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE = _EnvironmentVariable(
+    "MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE", int, 500_000_000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the size in bytes of the chunks of multipart downloads by the artifact repositories
+#: that can download ranges of artifact files.
+#: (default: ``100_000_000`` (100 MB))
+MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE = _EnvironmentVariable(
+    "MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE", int, 100_000_000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether or not to upload large artifact files to a tracking server serving proxied
+#: artifacts with multipart uploads, whose parts are uploaded in parallel and retried individually.
+#: Falls back to uploading the whole file in a single request if the server doesn't support them.
+#: (default: ``True``)
+MLFLOW_ENABLE_PROXY_MULTIPART_UPLOAD = _BooleanEnvironmentVariable(
+    "MLFLOW_ENABLE_PROXY_MULTIPART_UPLOAD", True
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the minimum size in bytes of the artifact files uploaded to a tracking server serving
+#: proxied artifacts with multipart uploads.
+#: (default: ``500_000_000`` (500 MB))
+MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE = _EnvironmentVariable(
+    "MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", int, 500_000_000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the size in bytes of the parts of multipart uploads to a tracking server serving
+#: proxied artifacts. The parts of files of more than 10,000 parts are made larger.
+#: (default: ``10_000_000`` (10 MB))
+MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE = _EnvironmentVariable(
+    "MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", int, 10_000_000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether to display the progress of the uploads of directories of artifacts and of the
+#: downloads of artifacts with ``tqdm``, which must be installed.
+#: (default: ``False``)
+MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR = _BooleanEnvironmentVariable(
+    "MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR", False
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the directory of an on-disk cache of downloaded artifacts, shared by the processes of
+#: the host, that is used by :py:func:`mlflow.artifacts.download_artifacts` and to load models.
+#: The cache is disabled if unset.
+#: (default: ``None``)
+MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR = _EnvironmentVariable(
+    "MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR", str, None
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum total size in bytes of the artifacts in the artifact download cache. The
+#: least recently used artifacts are evicted when it's exceeded.
+#: (default: ``10_000_000_000`` (10 GB))
+MLFLOW_ARTIFACT_DOWNLOAD_CACHE_MAX_SIZE = _EnvironmentVariable(
+    "MLFLOW_ARTIFACT_DOWNLOAD_CACHE_MAX_SIZE", int, 10_000_000_000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether or not the file-based tracking ``FileStore`` maintains a per-experiment
+#: index of run metadata that is used to answer ``search_runs`` queries without reading the files
+#: of every run. All the processes writing to the store should enable it.
+#: (default: ``False``)
+MLFLOW_ENABLE_FILE_STORE_RUN_INDEX = _BooleanEnvironmentVariable(
+    "MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", False
+)
+
 #: Private environment variable that's set to ``True`` while running tests.
 _MLFLOW_TESTING = _BooleanEnvironmentVariable("MLFLOW_TESTING", False)
 
@@ -354,3 +511,48 @@ _MLFLOW_AUTOLOGGING_TESTING = _BooleanEnvironmentVariable("MLFLOW_AUTOLOGGING_TE
 #: Specifies the uri of a Mlflow Gateway Server instance to be used with the Gateway Client APIs
 #: (default: ``None``)
 MLFLOW_GATEWAY_URI = _EnvironmentVariable("MLFLOW_GATEWAY_URI", str, None)
+
+#: (Experimental, may be changed or removed)
+#: Specifies whether metrics, params and tags logged with the fluent and client APIs are queued and
+#: logged asynchronously in batches by a background thread.
+#: (default: ``False``)
+MLFLOW_ENABLE_ASYNC_LOGGING = _BooleanEnvironmentVariable("MLFLOW_ENABLE_ASYNC_LOGGING", False)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the maximum number of logging operations that can be queued when asynchronous logging
+#: is enabled. Logging calls block while the queue is full.
+#: (default: ``10000``)
+MLFLOW_ASYNC_LOGGING_MAX_QUEUE_SIZE = _EnvironmentVariable(
+    "MLFLOW_ASYNC_LOGGING_MAX_QUEUE_SIZE", int, 10000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the URI of a content-addressed blob store in which to deduplicate the content of the
+#: logged artifact files, which are logged as references to their blobs. Artifacts are logged
+#: without deduplication if unset.
+#: (default: ``None``)
+MLFLOW_ARTIFACT_BLOB_STORE_URI = _EnvironmentVariable("MLFLOW_ARTIFACT_BLOB_STORE_URI", str, None)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the minimum size in bytes of the artifact files whose content is deduplicated in the
+#: blob store specified by ``MLFLOW_ARTIFACT_BLOB_STORE_URI``. Smaller files are logged as is.
+#: (default: ``1_000_000`` (1 MB))
+MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE = _EnvironmentVariable(
+    "MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE", int, 1_000_000
+)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the codec with which to compress the text artifact files, e.g. JSON tables and
+#: requirements files, for their transfer and storage. Compressed artifacts are decompressed
+#: when they're read whether this is set or not. The only supported codec is ``gzip``. Artifacts
+#: are logged uncompressed if unset.
+#: (default: ``None``)
+MLFLOW_ARTIFACT_COMPRESSION = _EnvironmentVariable("MLFLOW_ARTIFACT_COMPRESSION", str, None)
+
+#: (Experimental, may be changed or removed)
+#: Specifies the minimum size in bytes of the text artifact files compressed with the codec
+#: specified by ``MLFLOW_ARTIFACT_COMPRESSION``.
+#: (default: ``1024``)
+MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE = _EnvironmentVariable(
+    "MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE", int, 1024
+)
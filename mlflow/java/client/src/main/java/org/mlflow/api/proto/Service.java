@@ -43145,244 +43145,72 @@ public final class Service {
 
   }
 
-  public interface SearchRunsOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns)
+  public interface GetRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.GetRuns)
       com.google.protobuf.MessageOrBuilder {
 
     /**
      * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @return A list containing the experimentIds.
-     */
-    java.util.List<java.lang.String>
-        getExperimentIdsList();
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @return The count of experimentIds.
-     */
-    int getExperimentIdsCount();
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @param index The index of the element to return.
-     * @return The experimentIds at the given index.
-     */
-    java.lang.String getExperimentIds(int index);
-    /**
-     * <pre>
-     * List of experiment IDs to search over.
-     * </pre>
-     *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @param index The index of the value to return.
-     * @return The bytes of the experimentIds at the given index.
-     */
-    com.google.protobuf.ByteString
-        getExperimentIdsBytes(int index);
-
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return Whether the filter field is set.
-     */
-    boolean hasFilter();
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return The filter.
-     */
-    java.lang.String getFilter();
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return The bytes for filter.
-     */
-    com.google.protobuf.ByteString
-        getFilterBytes();
-
-    /**
-     * <pre>
-     * Whether to display only active, only deleted, or all runs.
-     * Defaults to only active runs.
-     * </pre>
-     *
-     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-     * @return Whether the runViewType field is set.
-     */
-    boolean hasRunViewType();
-    /**
-     * <pre>
-     * Whether to display only active, only deleted, or all runs.
-     * Defaults to only active runs.
-     * </pre>
-     *
-     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-     * @return The runViewType.
-     */
-    org.mlflow.api.proto.Service.ViewType getRunViewType();
-
-    /**
-     * <pre>
-     * Maximum number of runs desired. If unspecified, defaults to 1000.
-     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-     * but may support more. Callers of this endpoint are encouraged to pass max_results
-     * explicitly and leverage page_token to iterate through experiments.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5 [default = 1000];</code>
-     * @return Whether the maxResults field is set.
-     */
-    boolean hasMaxResults();
-    /**
-     * <pre>
-     * Maximum number of runs desired. If unspecified, defaults to 1000.
-     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-     * but may support more. Callers of this endpoint are encouraged to pass max_results
-     * explicitly and leverage page_token to iterate through experiments.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5 [default = 1000];</code>
-     * @return The maxResults.
-     */
-    int getMaxResults();
-
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string order_by = 6;</code>
-     * @return A list containing the orderBy.
+     * <code>repeated string run_ids = 1;</code>
+     * @return A list containing the runIds.
      */
     java.util.List<java.lang.String>
-        getOrderByList();
+        getRunIdsList();
     /**
      * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string order_by = 6;</code>
-     * @return The count of orderBy.
+     * <code>repeated string run_ids = 1;</code>
+     * @return The count of runIds.
      */
-    int getOrderByCount();
+    int getRunIdsCount();
     /**
      * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string order_by = 6;</code>
+     * <code>repeated string run_ids = 1;</code>
      * @param index The index of the element to return.
-     * @return The orderBy at the given index.
+     * @return The runIds at the given index.
      */
-    java.lang.String getOrderBy(int index);
+    java.lang.String getRunIds(int index);
     /**
      * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string order_by = 6;</code>
+     * <code>repeated string run_ids = 1;</code>
      * @param index The index of the value to return.
-     * @return The bytes of the orderBy at the given index.
-     */
-    com.google.protobuf.ByteString
-        getOrderByBytes(int index);
-
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return Whether the pageToken field is set.
-     */
-    boolean hasPageToken();
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return The pageToken.
-     */
-    java.lang.String getPageToken();
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return The bytes for pageToken.
+     * @return The bytes of the runIds at the given index.
      */
     com.google.protobuf.ByteString
-        getPageTokenBytes();
+        getRunIdsBytes(int index);
   }
   /**
-   * Protobuf type {@code mlflow.SearchRuns}
+   * Protobuf type {@code mlflow.GetRuns}
    */
-  public static final class SearchRuns extends
+  public static final class GetRuns extends
       com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.SearchRuns)
-      SearchRunsOrBuilder {
+      // @@protoc_insertion_point(message_implements:mlflow.GetRuns)
+      GetRunsOrBuilder {
   private static final long serialVersionUID = 0L;
-    // Use SearchRuns.newBuilder() to construct.
-    private SearchRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+    // Use GetRuns.newBuilder() to construct.
+    private GetRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
       super(builder);
     }
-    private SearchRuns() {
-      experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      filter_ = "";
-      runViewType_ = 1;
-      maxResults_ = 1000;
-      orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      pageToken_ = "";
+    private GetRuns() {
+      runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
     }
 
     @java.lang.Override
     @SuppressWarnings({"unused"})
     protected java.lang.Object newInstance(
         UnusedPrivateParameter unused) {
-      return new SearchRuns();
+      return new GetRuns();
     }
 
     @java.lang.Override
@@ -43390,7 +43218,7 @@ public final class Service {
     getUnknownFields() {
       return this.unknownFields;
     }
-    private SearchRuns(
+    private GetRuns(
         com.google.protobuf.CodedInputStream input,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
@@ -43412,48 +43240,10 @@ public final class Service {
             case 10: {
               com.google.protobuf.ByteString bs = input.readBytes();
               if (!((mutable_bitField0_ & 0x00000001) != 0)) {
-                experimentIds_ = new com.google.protobuf.LazyStringArrayList();
+                runIds_ = new com.google.protobuf.LazyStringArrayList();
                 mutable_bitField0_ |= 0x00000001;
               }
-              experimentIds_.add(bs);
-              break;
-            }
-            case 24: {
-              int rawValue = input.readEnum();
-                @SuppressWarnings("deprecation")
-              org.mlflow.api.proto.Service.ViewType value = org.mlflow.api.proto.Service.ViewType.valueOf(rawValue);
-              if (value == null) {
-                unknownFields.mergeVarintField(3, rawValue);
-              } else {
-                bitField0_ |= 0x00000002;
-                runViewType_ = rawValue;
-              }
-              break;
-            }
-            case 34: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              filter_ = bs;
-              break;
-            }
-            case 40: {
-              bitField0_ |= 0x00000004;
-              maxResults_ = input.readInt32();
-              break;
-            }
-            case 50: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              if (!((mutable_bitField0_ & 0x00000010) != 0)) {
-                orderBy_ = new com.google.protobuf.LazyStringArrayList();
-                mutable_bitField0_ |= 0x00000010;
-              }
-              orderBy_.add(bs);
-              break;
-            }
-            case 58: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000008;
-              pageToken_ = bs;
+              runIds_.add(bs);
               break;
             }
             default: {
@@ -43472,10 +43262,7 @@ public final class Service {
             e).setUnfinishedMessage(this);
       } finally {
         if (((mutable_bitField0_ & 0x00000001) != 0)) {
-          experimentIds_ = experimentIds_.getUnmodifiableView();
-        }
-        if (((mutable_bitField0_ & 0x00000010) != 0)) {
-          orderBy_ = orderBy_.getUnmodifiableView();
+          runIds_ = runIds_.getUnmodifiableView();
         }
         this.unknownFields = unknownFields.build();
         makeExtensionsImmutable();
@@ -43483,24 +43270,25 @@ public final class Service {
     }
     public static final com.google.protobuf.Descriptors.Descriptor
         getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_descriptor;
     }
 
     @java.lang.Override
     protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
         internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_fieldAccessorTable
+      return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_fieldAccessorTable
           .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
+              org.mlflow.api.proto.Service.GetRuns.class, org.mlflow.api.proto.Service.GetRuns.Builder.class);
     }
 
     public interface ResponseOrBuilder extends
-        // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns.Response)
+        // @@protoc_insertion_point(interface_extends:mlflow.GetRuns.Response)
         com.google.protobuf.MessageOrBuilder {
 
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43509,7 +43297,8 @@ public final class Service {
           getRunsList();
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43517,7 +43306,8 @@ public final class Service {
       org.mlflow.api.proto.Service.Run getRuns(int index);
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43525,7 +43315,8 @@ public final class Service {
       int getRunsCount();
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43534,37 +43325,21 @@ public final class Service {
           getRunsOrBuilderList();
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
        */
       org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
           int index);
-
-      /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return Whether the nextPageToken field is set.
-       */
-      boolean hasNextPageToken();
-      /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The nextPageToken.
-       */
-      java.lang.String getNextPageToken();
-      /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The bytes for nextPageToken.
-       */
-      com.google.protobuf.ByteString
-          getNextPageTokenBytes();
     }
     /**
-     * Protobuf type {@code mlflow.SearchRuns.Response}
+     * Protobuf type {@code mlflow.GetRuns.Response}
      */
     public static final class Response extends
         com.google.protobuf.GeneratedMessageV3 implements
-        // @@protoc_insertion_point(message_implements:mlflow.SearchRuns.Response)
+        // @@protoc_insertion_point(message_implements:mlflow.GetRuns.Response)
         ResponseOrBuilder {
     private static final long serialVersionUID = 0L;
       // Use Response.newBuilder() to construct.
@@ -43573,7 +43348,6 @@ public final class Service {
       }
       private Response() {
         runs_ = java.util.Collections.emptyList();
-        nextPageToken_ = "";
       }
 
       @java.lang.Override
@@ -43616,12 +43390,6 @@ public final class Service {
                     input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
                 break;
               }
-              case 18: {
-                com.google.protobuf.ByteString bs = input.readBytes();
-                bitField0_ |= 0x00000001;
-                nextPageToken_ = bs;
-                break;
-              }
               default: {
                 if (!parseUnknownField(
                     input, unknownFields, extensionRegistry, tag)) {
@@ -43646,23 +43414,23 @@ public final class Service {
       }
       public static final com.google.protobuf.Descriptors.Descriptor
           getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_descriptor;
       }
 
       @java.lang.Override
       protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
           internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_fieldAccessorTable
             .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
+                org.mlflow.api.proto.Service.GetRuns.Response.class, org.mlflow.api.proto.Service.GetRuns.Response.Builder.class);
       }
 
-      private int bitField0_;
       public static final int RUNS_FIELD_NUMBER = 1;
       private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43673,7 +43441,8 @@ public final class Service {
       }
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43685,7 +43454,8 @@ public final class Service {
       }
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43696,7 +43466,8 @@ public final class Service {
       }
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43707,7 +43478,8 @@ public final class Service {
       }
       /**
        * <pre>
-       * Runs that match the search criteria.
+       * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+       * the requested run IDs.
        * </pre>
        *
        * <code>repeated .mlflow.Run runs = 1;</code>
@@ -43718,54 +43490,6 @@ public final class Service {
         return runs_.get(index);
       }
 
-      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 2;
-      private volatile java.lang.Object nextPageToken_;
-      /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return Whether the nextPageToken field is set.
-       */
-      @java.lang.Override
-      public boolean hasNextPageToken() {
-        return ((bitField0_ & 0x00000001) != 0);
-      }
-      /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The nextPageToken.
-       */
-      @java.lang.Override
-      public java.lang.String getNextPageToken() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          return (java.lang.String) ref;
-        } else {
-          com.google.protobuf.ByteString bs = 
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            nextPageToken_ = s;
-          }
-          return s;
-        }
-      }
-      /**
-       * <code>optional string next_page_token = 2;</code>
-       * @return The bytes for nextPageToken.
-       */
-      @java.lang.Override
-      public com.google.protobuf.ByteString
-          getNextPageTokenBytes() {
-        java.lang.Object ref = nextPageToken_;
-        if (ref instanceof java.lang.String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          nextPageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
-      }
-
       private byte memoizedIsInitialized = -1;
       @java.lang.Override
       public final boolean isInitialized() {
@@ -43783,9 +43507,6 @@ public final class Service {
         for (int i = 0; i < runs_.size(); i++) {
           output.writeMessage(1, runs_.get(i));
         }
-        if (((bitField0_ & 0x00000001) != 0)) {
-          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, nextPageToken_);
-        }
         unknownFields.writeTo(output);
       }
 
@@ -43799,9 +43520,6 @@ public final class Service {
           size += com.google.protobuf.CodedOutputStream
             .computeMessageSize(1, runs_.get(i));
         }
-        if (((bitField0_ & 0x00000001) != 0)) {
-          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, nextPageToken_);
-        }
         size += unknownFields.getSerializedSize();
         memoizedSize = size;
         return size;
@@ -43812,18 +43530,13 @@ public final class Service {
         if (obj == this) {
          return true;
         }
-        if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns.Response)) {
+        if (!(obj instanceof org.mlflow.api.proto.Service.GetRuns.Response)) {
           return super.equals(obj);
         }
-        org.mlflow.api.proto.Service.SearchRuns.Response other = (org.mlflow.api.proto.Service.SearchRuns.Response) obj;
+        org.mlflow.api.proto.Service.GetRuns.Response other = (org.mlflow.api.proto.Service.GetRuns.Response) obj;
 
         if (!getRunsList()
             .equals(other.getRunsList())) return false;
-        if (hasNextPageToken() != other.hasNextPageToken()) return false;
-        if (hasNextPageToken()) {
-          if (!getNextPageToken()
-              .equals(other.getNextPageToken())) return false;
-        }
         if (!unknownFields.equals(other.unknownFields)) return false;
         return true;
       }
@@ -43839,78 +43552,74 @@ public final class Service {
           hash = (37 * hash) + RUNS_FIELD_NUMBER;
           hash = (53 * hash) + getRunsList().hashCode();
         }
-        if (hasNextPageToken()) {
-          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
-          hash = (53 * hash) + getNextPageToken().hashCode();
-        }
         hash = (29 * hash) + unknownFields.hashCode();
         memoizedHashCode = hash;
         return hash;
       }
 
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           java.nio.ByteBuffer data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           java.nio.ByteBuffer data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           com.google.protobuf.ByteString data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           com.google.protobuf.ByteString data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(byte[] data)
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(byte[] data)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           byte[] data,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
         return PARSER.parseFrom(data, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(java.io.InputStream input)
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(java.io.InputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           java.io.InputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(java.io.InputStream input)
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseDelimitedFrom(java.io.InputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseDelimitedWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseDelimitedFrom(
           java.io.InputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           com.google.protobuf.CodedInputStream input)
           throws java.io.IOException {
         return com.google.protobuf.GeneratedMessageV3
             .parseWithIOException(PARSER, input);
       }
-      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+      public static org.mlflow.api.proto.Service.GetRuns.Response parseFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws java.io.IOException {
@@ -43923,7 +43632,7 @@ public final class Service {
       public static Builder newBuilder() {
         return DEFAULT_INSTANCE.toBuilder();
       }
-      public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns.Response prototype) {
+      public static Builder newBuilder(org.mlflow.api.proto.Service.GetRuns.Response prototype) {
         return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
       @java.lang.Override
@@ -43939,26 +43648,26 @@ public final class Service {
         return builder;
       }
       /**
-       * Protobuf type {@code mlflow.SearchRuns.Response}
+       * Protobuf type {@code mlflow.GetRuns.Response}
        */
       public static final class Builder extends
           com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-          // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns.Response)
-          org.mlflow.api.proto.Service.SearchRuns.ResponseOrBuilder {
+          // @@protoc_insertion_point(builder_implements:mlflow.GetRuns.Response)
+          org.mlflow.api.proto.Service.GetRuns.ResponseOrBuilder {
         public static final com.google.protobuf.Descriptors.Descriptor
             getDescriptor() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_descriptor;
         }
 
         @java.lang.Override
         protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
             internalGetFieldAccessorTable() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_fieldAccessorTable
               .ensureFieldAccessorsInitialized(
-                  org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
+                  org.mlflow.api.proto.Service.GetRuns.Response.class, org.mlflow.api.proto.Service.GetRuns.Response.Builder.class);
         }
 
-        // Construct using org.mlflow.api.proto.Service.SearchRuns.Response.newBuilder()
+        // Construct using org.mlflow.api.proto.Service.GetRuns.Response.newBuilder()
         private Builder() {
           maybeForceBuilderInitialization();
         }
@@ -43983,25 +43692,23 @@ public final class Service {
           } else {
             runsBuilder_.clear();
           }
-          nextPageToken_ = "";
-          bitField0_ = (bitField0_ & ~0x00000002);
           return this;
         }
 
         @java.lang.Override
         public com.google.protobuf.Descriptors.Descriptor
             getDescriptorForType() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+          return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_Response_descriptor;
         }
 
         @java.lang.Override
-        public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
-          return org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance();
+        public org.mlflow.api.proto.Service.GetRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.GetRuns.Response.getDefaultInstance();
         }
 
         @java.lang.Override
-        public org.mlflow.api.proto.Service.SearchRuns.Response build() {
-          org.mlflow.api.proto.Service.SearchRuns.Response result = buildPartial();
+        public org.mlflow.api.proto.Service.GetRuns.Response build() {
+          org.mlflow.api.proto.Service.GetRuns.Response result = buildPartial();
           if (!result.isInitialized()) {
             throw newUninitializedMessageException(result);
           }
@@ -44009,10 +43716,9 @@ public final class Service {
         }
 
         @java.lang.Override
-        public org.mlflow.api.proto.Service.SearchRuns.Response buildPartial() {
-          org.mlflow.api.proto.Service.SearchRuns.Response result = new org.mlflow.api.proto.Service.SearchRuns.Response(this);
+        public org.mlflow.api.proto.Service.GetRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.GetRuns.Response result = new org.mlflow.api.proto.Service.GetRuns.Response(this);
           int from_bitField0_ = bitField0_;
-          int to_bitField0_ = 0;
           if (runsBuilder_ == null) {
             if (((bitField0_ & 0x00000001) != 0)) {
               runs_ = java.util.Collections.unmodifiableList(runs_);
@@ -44022,11 +43728,6 @@ public final class Service {
           } else {
             result.runs_ = runsBuilder_.build();
           }
-          if (((from_bitField0_ & 0x00000002) != 0)) {
-            to_bitField0_ |= 0x00000001;
-          }
-          result.nextPageToken_ = nextPageToken_;
-          result.bitField0_ = to_bitField0_;
           onBuilt();
           return result;
         }
@@ -44065,16 +43766,16 @@ public final class Service {
         }
         @java.lang.Override
         public Builder mergeFrom(com.google.protobuf.Message other) {
-          if (other instanceof org.mlflow.api.proto.Service.SearchRuns.Response) {
-            return mergeFrom((org.mlflow.api.proto.Service.SearchRuns.Response)other);
+          if (other instanceof org.mlflow.api.proto.Service.GetRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.GetRuns.Response)other);
           } else {
             super.mergeFrom(other);
             return this;
           }
         }
 
-        public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns.Response other) {
-          if (other == org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance()) return this;
+        public Builder mergeFrom(org.mlflow.api.proto.Service.GetRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.GetRuns.Response.getDefaultInstance()) return this;
           if (runsBuilder_ == null) {
             if (!other.runs_.isEmpty()) {
               if (runs_.isEmpty()) {
@@ -44101,11 +43802,6 @@ public final class Service {
               }
             }
           }
-          if (other.hasNextPageToken()) {
-            bitField0_ |= 0x00000002;
-            nextPageToken_ = other.nextPageToken_;
-            onChanged();
-          }
           this.mergeUnknownFields(other.unknownFields);
           onChanged();
           return this;
@@ -44121,11 +43817,11 @@ public final class Service {
             com.google.protobuf.CodedInputStream input,
             com.google.protobuf.ExtensionRegistryLite extensionRegistry)
             throws java.io.IOException {
-          org.mlflow.api.proto.Service.SearchRuns.Response parsedMessage = null;
+          org.mlflow.api.proto.Service.GetRuns.Response parsedMessage = null;
           try {
             parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
           } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-            parsedMessage = (org.mlflow.api.proto.Service.SearchRuns.Response) e.getUnfinishedMessage();
+            parsedMessage = (org.mlflow.api.proto.Service.GetRuns.Response) e.getUnfinishedMessage();
             throw e.unwrapIOException();
           } finally {
             if (parsedMessage != null) {
@@ -44150,7 +43846,8 @@ public final class Service {
 
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44164,7 +43861,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44178,7 +43876,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44192,7 +43891,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44213,7 +43913,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44231,7 +43932,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44251,7 +43953,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44272,7 +43975,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44290,7 +43994,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44308,7 +44013,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44327,7 +44033,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44344,7 +44051,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44361,7 +44069,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44372,7 +44081,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44386,7 +44096,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44401,7 +44112,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44412,7 +44124,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44424,7 +44137,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Runs that match the search criteria.
+         * Runs metadata (name, start time, etc) and data (metrics, params, and tags), in the order of
+         * the requested run IDs.
          * </pre>
          *
          * <code>repeated .mlflow.Run runs = 1;</code>
@@ -44447,90 +44161,6 @@ public final class Service {
           }
           return runsBuilder_;
         }
-
-        private java.lang.Object nextPageToken_ = "";
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return Whether the nextPageToken field is set.
-         */
-        public boolean hasNextPageToken() {
-          return ((bitField0_ & 0x00000002) != 0);
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return The nextPageToken.
-         */
-        public java.lang.String getNextPageToken() {
-          java.lang.Object ref = nextPageToken_;
-          if (!(ref instanceof java.lang.String)) {
-            com.google.protobuf.ByteString bs =
-                (com.google.protobuf.ByteString) ref;
-            java.lang.String s = bs.toStringUtf8();
-            if (bs.isValidUtf8()) {
-              nextPageToken_ = s;
-            }
-            return s;
-          } else {
-            return (java.lang.String) ref;
-          }
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return The bytes for nextPageToken.
-         */
-        public com.google.protobuf.ByteString
-            getNextPageTokenBytes() {
-          java.lang.Object ref = nextPageToken_;
-          if (ref instanceof String) {
-            com.google.protobuf.ByteString b = 
-                com.google.protobuf.ByteString.copyFromUtf8(
-                    (java.lang.String) ref);
-            nextPageToken_ = b;
-            return b;
-          } else {
-            return (com.google.protobuf.ByteString) ref;
-          }
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @param value The nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageToken(
-            java.lang.String value) {
-          if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-          nextPageToken_ = value;
-          onChanged();
-          return this;
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @return This builder for chaining.
-         */
-        public Builder clearNextPageToken() {
-          bitField0_ = (bitField0_ & ~0x00000002);
-          nextPageToken_ = getDefaultInstance().getNextPageToken();
-          onChanged();
-          return this;
-        }
-        /**
-         * <code>optional string next_page_token = 2;</code>
-         * @param value The bytes for nextPageToken to set.
-         * @return This builder for chaining.
-         */
-        public Builder setNextPageTokenBytes(
-            com.google.protobuf.ByteString value) {
-          if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-          nextPageToken_ = value;
-          onChanged();
-          return this;
-        }
         @java.lang.Override
         public final Builder setUnknownFields(
             final com.google.protobuf.UnknownFieldSet unknownFields) {
@@ -44544,16 +44174,16 @@ public final class Service {
         }
 
 
-        // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns.Response)
+        // @@protoc_insertion_point(builder_scope:mlflow.GetRuns.Response)
       }
 
-      // @@protoc_insertion_point(class_scope:mlflow.SearchRuns.Response)
-      private static final org.mlflow.api.proto.Service.SearchRuns.Response DEFAULT_INSTANCE;
+      // @@protoc_insertion_point(class_scope:mlflow.GetRuns.Response)
+      private static final org.mlflow.api.proto.Service.GetRuns.Response DEFAULT_INSTANCE;
       static {
-        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns.Response();
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetRuns.Response();
       }
 
-      public static org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstance() {
+      public static org.mlflow.api.proto.Service.GetRuns.Response getDefaultInstance() {
         return DEFAULT_INSTANCE;
       }
 
@@ -44578,1727 +44208,3735 @@ public final class Service {
       }
 
       @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
+      public org.mlflow.api.proto.Service.GetRuns.Response getDefaultInstanceForType() {
         return DEFAULT_INSTANCE;
       }
 
     }
 
-    private int bitField0_;
-    public static final int EXPERIMENT_IDS_FIELD_NUMBER = 1;
-    private com.google.protobuf.LazyStringList experimentIds_;
+    public static final int RUN_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList runIds_;
     /**
      * <pre>
-     * List of experiment IDs to search over.
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @return A list containing the experimentIds.
+     * <code>repeated string run_ids = 1;</code>
+     * @return A list containing the runIds.
      */
     public com.google.protobuf.ProtocolStringList
-        getExperimentIdsList() {
-      return experimentIds_;
+        getRunIdsList() {
+      return runIds_;
     }
     /**
      * <pre>
-     * List of experiment IDs to search over.
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string experiment_ids = 1;</code>
-     * @return The count of experimentIds.
+     * <code>repeated string run_ids = 1;</code>
+     * @return The count of runIds.
      */
-    public int getExperimentIdsCount() {
-      return experimentIds_.size();
+    public int getRunIdsCount() {
+      return runIds_.size();
     }
     /**
      * <pre>
-     * List of experiment IDs to search over.
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string experiment_ids = 1;</code>
+     * <code>repeated string run_ids = 1;</code>
      * @param index The index of the element to return.
-     * @return The experimentIds at the given index.
+     * @return The runIds at the given index.
      */
-    public java.lang.String getExperimentIds(int index) {
-      return experimentIds_.get(index);
+    public java.lang.String getRunIds(int index) {
+      return runIds_.get(index);
     }
     /**
      * <pre>
-     * List of experiment IDs to search over.
+     * IDs of the runs to fetch. Must be provided.
      * </pre>
      *
-     * <code>repeated string experiment_ids = 1;</code>
+     * <code>repeated string run_ids = 1;</code>
      * @param index The index of the value to return.
-     * @return The bytes of the experimentIds at the given index.
+     * @return The bytes of the runIds at the given index.
      */
     public com.google.protobuf.ByteString
-        getExperimentIdsBytes(int index) {
-      return experimentIds_.getByteString(index);
+        getRunIdsBytes(int index) {
+      return runIds_.getByteString(index);
     }
 
-    public static final int FILTER_FIELD_NUMBER = 4;
-    private volatile java.lang.Object filter_;
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return Whether the filter field is set.
-     */
+    private byte memoizedIsInitialized = -1;
     @java.lang.Override
-    public boolean hasFilter() {
-      return ((bitField0_ & 0x00000001) != 0);
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
     }
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return The filter.
-     */
+
     @java.lang.Override
-    public java.lang.String getFilter() {
-      java.lang.Object ref = filter_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          filter_ = s;
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < runIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runIds_.getRaw(i));
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < runIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(runIds_.getRaw(i));
         }
-        return s;
+        size += dataSize;
+        size += 1 * getRunIdsList().size();
       }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
     }
-    /**
-     * <pre>
-     * A filter expression over params, metrics, and tags, that allows returning a subset of
-     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-     * between a param, metric, or tag and a constant.
-     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-     * </pre>
-     *
-     * <code>optional string filter = 4;</code>
-     * @return The bytes for filter.
-     */
+
     @java.lang.Override
-    public com.google.protobuf.ByteString
-        getFilterBytes() {
-      java.lang.Object ref = filter_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        filter_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.GetRuns)) {
+        return super.equals(obj);
       }
+      org.mlflow.api.proto.Service.GetRuns other = (org.mlflow.api.proto.Service.GetRuns) obj;
+
+      if (!getRunIdsList()
+          .equals(other.getRunIdsList())) return false;
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
     }
 
-    public static final int RUN_VIEW_TYPE_FIELD_NUMBER = 3;
-    private int runViewType_;
-    /**
-     * <pre>
-     * Whether to display only active, only deleted, or all runs.
-     * Defaults to only active runs.
-     * </pre>
-     *
-     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-     * @return Whether the runViewType field is set.
-     */
-    @java.lang.Override public boolean hasRunViewType() {
-      return ((bitField0_ & 0x00000002) != 0);
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getRunIdsCount() > 0) {
+        hash = (37 * hash) + RUN_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getRunIdsList().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
     }
-    /**
-     * <pre>
-     * Whether to display only active, only deleted, or all runs.
-     * Defaults to only active runs.
-     * </pre>
-     *
-     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-     * @return The runViewType.
-     */
-    @java.lang.Override public org.mlflow.api.proto.Service.ViewType getRunViewType() {
-      @SuppressWarnings("deprecation")
-      org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
-      return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
+
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.GetRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
     }
 
-    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
-    private int maxResults_;
-    /**
-     * <pre>
-     * Maximum number of runs desired. If unspecified, defaults to 1000.
-     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-     * but may support more. Callers of this endpoint are encouraged to pass max_results
-     * explicitly and leverage page_token to iterate through experiments.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5 [default = 1000];</code>
-     * @return Whether the maxResults field is set.
-     */
     @java.lang.Override
-    public boolean hasMaxResults() {
-      return ((bitField0_ & 0x00000004) != 0);
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.GetRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
     }
-    /**
-     * <pre>
-     * Maximum number of runs desired. If unspecified, defaults to 1000.
-     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-     * but may support more. Callers of this endpoint are encouraged to pass max_results
-     * explicitly and leverage page_token to iterate through experiments.
-     * </pre>
-     *
-     * <code>optional int32 max_results = 5 [default = 1000];</code>
-     * @return The maxResults.
-     */
     @java.lang.Override
-    public int getMaxResults() {
-      return maxResults_;
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
     }
 
-    public static final int ORDER_BY_FIELD_NUMBER = 6;
-    private com.google.protobuf.LazyStringList orderBy_;
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @return A list containing the orderBy.
-     */
-    public com.google.protobuf.ProtocolStringList
-        getOrderByList() {
-      return orderBy_;
-    }
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @return The count of orderBy.
-     */
-    public int getOrderByCount() {
-      return orderBy_.size();
-    }
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @param index The index of the element to return.
-     * @return The orderBy at the given index.
-     */
-    public java.lang.String getOrderBy(int index) {
-      return orderBy_.get(index);
-    }
-    /**
-     * <pre>
-     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-     * (and this is the default ordering criterion if order_by is not provided).
-     * </pre>
-     *
-     * <code>repeated string order_by = 6;</code>
-     * @param index The index of the value to return.
-     * @return The bytes of the orderBy at the given index.
-     */
-    public com.google.protobuf.ByteString
-        getOrderByBytes(int index) {
-      return orderBy_.getByteString(index);
-    }
-
-    public static final int PAGE_TOKEN_FIELD_NUMBER = 7;
-    private volatile java.lang.Object pageToken_;
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return Whether the pageToken field is set.
-     */
-    @java.lang.Override
-    public boolean hasPageToken() {
-      return ((bitField0_ & 0x00000008) != 0);
-    }
-    /**
-     * <code>optional string page_token = 7;</code>
-     * @return The pageToken.
-     */
     @java.lang.Override
-    public java.lang.String getPageToken() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          pageToken_ = s;
-        }
-        return s;
-      }
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
     }
     /**
-     * <code>optional string page_token = 7;</code>
-     * @return The bytes for pageToken.
+     * Protobuf type {@code mlflow.GetRuns}
      */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getPageTokenBytes() {
-      java.lang.Object ref = pageToken_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        pageToken_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.GetRuns)
+        org.mlflow.api.proto.Service.GetRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_descriptor;
       }
-    }
-
-    private byte memoizedIsInitialized = -1;
-    @java.lang.Override
-    public final boolean isInitialized() {
-      byte isInitialized = memoizedIsInitialized;
-      if (isInitialized == 1) return true;
-      if (isInitialized == 0) return false;
 
-      memoizedIsInitialized = 1;
-      return true;
-    }
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.GetRuns.class, org.mlflow.api.proto.Service.GetRuns.Builder.class);
+      }
 
-    @java.lang.Override
-    public void writeTo(com.google.protobuf.CodedOutputStream output)
-                        throws java.io.IOException {
-      for (int i = 0; i < experimentIds_.size(); i++) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, experimentIds_.getRaw(i));
+      // Construct using org.mlflow.api.proto.Service.GetRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
       }
-      if (((bitField0_ & 0x00000002) != 0)) {
-        output.writeEnum(3, runViewType_);
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, filter_);
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+        }
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        output.writeInt32(5, maxResults_);
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        return this;
       }
-      for (int i = 0; i < orderBy_.size(); i++) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 6, orderBy_.getRaw(i));
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_GetRuns_descriptor;
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 7, pageToken_);
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.GetRuns.getDefaultInstance();
       }
-      unknownFields.writeTo(output);
-    }
 
-    @java.lang.Override
-    public int getSerializedSize() {
-      int size = memoizedSize;
-      if (size != -1) return size;
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns build() {
+        org.mlflow.api.proto.Service.GetRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
 
-      size = 0;
-      {
-        int dataSize = 0;
-        for (int i = 0; i < experimentIds_.size(); i++) {
-          dataSize += computeStringSizeNoTag(experimentIds_.getRaw(i));
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.GetRuns buildPartial() {
+        org.mlflow.api.proto.Service.GetRuns result = new org.mlflow.api.proto.Service.GetRuns(this);
+        int from_bitField0_ = bitField0_;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          runIds_ = runIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
         }
-        size += dataSize;
-        size += 1 * getExperimentIdsList().size();
+        result.runIds_ = runIds_;
+        onBuilt();
+        return result;
       }
-      if (((bitField0_ & 0x00000002) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeEnumSize(3, runViewType_);
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
       }
-      if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, filter_);
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
       }
-      if (((bitField0_ & 0x00000004) != 0)) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeInt32Size(5, maxResults_);
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
       }
-      {
-        int dataSize = 0;
-        for (int i = 0; i < orderBy_.size(); i++) {
-          dataSize += computeStringSizeNoTag(orderBy_.getRaw(i));
-        }
-        size += dataSize;
-        size += 1 * getOrderByList().size();
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
       }
-      if (((bitField0_ & 0x00000008) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(7, pageToken_);
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
       }
-      size += unknownFields.getSerializedSize();
-      memoizedSize = size;
-      return size;
-    }
-
-    @java.lang.Override
-    public boolean equals(final java.lang.Object obj) {
-      if (obj == this) {
-       return true;
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns)) {
-        return super.equals(obj);
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.GetRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.GetRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
+        }
       }
-      org.mlflow.api.proto.Service.SearchRuns other = (org.mlflow.api.proto.Service.SearchRuns) obj;
 
-      if (!getExperimentIdsList()
-          .equals(other.getExperimentIdsList())) return false;
-      if (hasFilter() != other.hasFilter()) return false;
-      if (hasFilter()) {
-        if (!getFilter()
-            .equals(other.getFilter())) return false;
-      }
-      if (hasRunViewType() != other.hasRunViewType()) return false;
-      if (hasRunViewType()) {
-        if (runViewType_ != other.runViewType_) return false;
+      public Builder mergeFrom(org.mlflow.api.proto.Service.GetRuns other) {
+        if (other == org.mlflow.api.proto.Service.GetRuns.getDefaultInstance()) return this;
+        if (!other.runIds_.isEmpty()) {
+          if (runIds_.isEmpty()) {
+            runIds_ = other.runIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureRunIdsIsMutable();
+            runIds_.addAll(other.runIds_);
+          }
+          onChanged();
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
       }
-      if (hasMaxResults() != other.hasMaxResults()) return false;
-      if (hasMaxResults()) {
-        if (getMaxResults()
-            != other.getMaxResults()) return false;
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
       }
-      if (!getOrderByList()
-          .equals(other.getOrderByList())) return false;
-      if (hasPageToken() != other.hasPageToken()) return false;
-      if (hasPageToken()) {
-        if (!getPageToken()
-            .equals(other.getPageToken())) return false;
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.GetRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.GetRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
       }
-      if (!unknownFields.equals(other.unknownFields)) return false;
-      return true;
-    }
+      private int bitField0_;
 
-    @java.lang.Override
-    public int hashCode() {
-      if (memoizedHashCode != 0) {
-        return memoizedHashCode;
+      private com.google.protobuf.LazyStringList runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureRunIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) != 0)) {
+          runIds_ = new com.google.protobuf.LazyStringArrayList(runIds_);
+          bitField0_ |= 0x00000001;
+         }
       }
-      int hash = 41;
-      hash = (19 * hash) + getDescriptor().hashCode();
-      if (getExperimentIdsCount() > 0) {
-        hash = (37 * hash) + EXPERIMENT_IDS_FIELD_NUMBER;
-        hash = (53 * hash) + getExperimentIdsList().hashCode();
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return A list containing the runIds.
+       */
+      public com.google.protobuf.ProtocolStringList
+          getRunIdsList() {
+        return runIds_.getUnmodifiableView();
       }
-      if (hasFilter()) {
-        hash = (37 * hash) + FILTER_FIELD_NUMBER;
-        hash = (53 * hash) + getFilter().hashCode();
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return The count of runIds.
+       */
+      public int getRunIdsCount() {
+        return runIds_.size();
       }
-      if (hasRunViewType()) {
-        hash = (37 * hash) + RUN_VIEW_TYPE_FIELD_NUMBER;
-        hash = (53 * hash) + runViewType_;
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index of the element to return.
+       * @return The runIds at the given index.
+       */
+      public java.lang.String getRunIds(int index) {
+        return runIds_.get(index);
       }
-      if (hasMaxResults()) {
-        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
-        hash = (53 * hash) + getMaxResults();
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the runIds at the given index.
+       */
+      public com.google.protobuf.ByteString
+          getRunIdsBytes(int index) {
+        return runIds_.getByteString(index);
       }
-      if (getOrderByCount() > 0) {
-        hash = (37 * hash) + ORDER_BY_FIELD_NUMBER;
-        hash = (53 * hash) + getOrderByList().hashCode();
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param index The index to set the value at.
+       * @param value The runIds to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunIds(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.set(index, value);
+        onChanged();
+        return this;
       }
-      if (hasPageToken()) {
-        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
-        hash = (53 * hash) + getPageToken().hashCode();
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param value The runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addRunIds(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param values The runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addAllRunIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureRunIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, runIds_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunIds() {
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to fetch. Must be provided.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       * @param value The bytes of the runIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addRunIdsBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
       }
-      hash = (29 * hash) + unknownFields.hashCode();
-      memoizedHashCode = hash;
-      return hash;
-    }
 
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        java.nio.ByteBuffer data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        java.nio.ByteBuffer data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.ByteString data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.ByteString data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(byte[] data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        byte[] data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input);
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.GetRuns)
     }
-    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+
+    // @@protoc_insertion_point(class_scope:mlflow.GetRuns)
+    private static final org.mlflow.api.proto.Service.GetRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetRuns();
     }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.CodedInputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
+
+    public static org.mlflow.api.proto.Service.GetRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
     }
-    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetRuns>
+        PARSER = new com.google.protobuf.AbstractParser<GetRuns>() {
+      @java.lang.Override
+      public GetRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new GetRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<GetRuns> parser() {
+      return PARSER;
     }
 
     @java.lang.Override
-    public Builder newBuilderForType() { return newBuilder(); }
-    public static Builder newBuilder() {
-      return DEFAULT_INSTANCE.toBuilder();
-    }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns prototype) {
-      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
-    }
-    @java.lang.Override
-    public Builder toBuilder() {
-      return this == DEFAULT_INSTANCE
-          ? new Builder() : new Builder().mergeFrom(this);
+    public com.google.protobuf.Parser<GetRuns> getParserForType() {
+      return PARSER;
     }
 
     @java.lang.Override
-    protected Builder newBuilderForType(
-        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-      Builder builder = new Builder(parent);
-      return builder;
+    public org.mlflow.api.proto.Service.GetRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
     }
-    /**
-     * Protobuf type {@code mlflow.SearchRuns}
-     */
-    public static final class Builder extends
-        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns)
-        org.mlflow.api.proto.Service.SearchRunsOrBuilder {
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
-      }
-
-      @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
-      }
 
-      // Construct using org.mlflow.api.proto.Service.SearchRuns.newBuilder()
-      private Builder() {
-        maybeForceBuilderInitialization();
-      }
+  }
 
-      private Builder(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        super(parent);
-        maybeForceBuilderInitialization();
-      }
-      private void maybeForceBuilderInitialization() {
-        if (com.google.protobuf.GeneratedMessageV3
-                .alwaysUseFieldBuilders) {
-        }
-      }
-      @java.lang.Override
-      public Builder clear() {
-        super.clear();
-        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000001);
-        filter_ = "";
-        bitField0_ = (bitField0_ & ~0x00000002);
-        runViewType_ = 1;
-        bitField0_ = (bitField0_ & ~0x00000004);
-        maxResults_ = 1000;
-        bitField0_ = (bitField0_ & ~0x00000008);
-        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000010);
-        pageToken_ = "";
-        bitField0_ = (bitField0_ & ~0x00000020);
-        return this;
-      }
+  public interface SearchRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns)
+      com.google.protobuf.MessageOrBuilder {
 
-      @java.lang.Override
-      public com.google.protobuf.Descriptors.Descriptor
-          getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
-      }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @return A list containing the experimentIds.
+     */
+    java.util.List<java.lang.String>
+        getExperimentIdsList();
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @return The count of experimentIds.
+     */
+    int getExperimentIdsCount();
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The experimentIds at the given index.
+     */
+    java.lang.String getExperimentIds(int index);
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the experimentIds at the given index.
+     */
+    com.google.protobuf.ByteString
+        getExperimentIdsBytes(int index);
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance();
-      }
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return Whether the filter field is set.
+     */
+    boolean hasFilter();
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return The filter.
+     */
+    java.lang.String getFilter();
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return The bytes for filter.
+     */
+    com.google.protobuf.ByteString
+        getFilterBytes();
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns build() {
-        org.mlflow.api.proto.Service.SearchRuns result = buildPartial();
-        if (!result.isInitialized()) {
-          throw newUninitializedMessageException(result);
-        }
-        return result;
-      }
+    /**
+     * <pre>
+     * Whether to display only active, only deleted, or all runs.
+     * Defaults to only active runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+     * @return Whether the runViewType field is set.
+     */
+    boolean hasRunViewType();
+    /**
+     * <pre>
+     * Whether to display only active, only deleted, or all runs.
+     * Defaults to only active runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+     * @return The runViewType.
+     */
+    org.mlflow.api.proto.Service.ViewType getRunViewType();
 
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.SearchRuns buildPartial() {
-        org.mlflow.api.proto.Service.SearchRuns result = new org.mlflow.api.proto.Service.SearchRuns(this);
-        int from_bitField0_ = bitField0_;
-        int to_bitField0_ = 0;
-        if (((bitField0_ & 0x00000001) != 0)) {
-          experimentIds_ = experimentIds_.getUnmodifiableView();
-          bitField0_ = (bitField0_ & ~0x00000001);
-        }
-        result.experimentIds_ = experimentIds_;
-        if (((from_bitField0_ & 0x00000002) != 0)) {
-          to_bitField0_ |= 0x00000001;
-        }
-        result.filter_ = filter_;
-        if (((from_bitField0_ & 0x00000004) != 0)) {
-          to_bitField0_ |= 0x00000002;
-        }
-        result.runViewType_ = runViewType_;
-        if (((from_bitField0_ & 0x00000008) != 0)) {
-          to_bitField0_ |= 0x00000004;
-        }
-        result.maxResults_ = maxResults_;
-        if (((bitField0_ & 0x00000010) != 0)) {
-          orderBy_ = orderBy_.getUnmodifiableView();
-          bitField0_ = (bitField0_ & ~0x00000010);
-        }
-        result.orderBy_ = orderBy_;
-        if (((from_bitField0_ & 0x00000020) != 0)) {
-          to_bitField0_ |= 0x00000008;
-        }
-        result.pageToken_ = pageToken_;
-        result.bitField0_ = to_bitField0_;
-        onBuilt();
-        return result;
-      }
+    /**
+     * <pre>
+     * Maximum number of runs desired. If unspecified, defaults to 1000.
+     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+     * but may support more. Callers of this endpoint are encouraged to pass max_results
+     * explicitly and leverage page_token to iterate through experiments.
+     * </pre>
+     *
+     * <code>optional int32 max_results = 5 [default = 1000];</code>
+     * @return Whether the maxResults field is set.
+     */
+    boolean hasMaxResults();
+    /**
+     * <pre>
+     * Maximum number of runs desired. If unspecified, defaults to 1000.
+     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+     * but may support more. Callers of this endpoint are encouraged to pass max_results
+     * explicitly and leverage page_token to iterate through experiments.
+     * </pre>
+     *
+     * <code>optional int32 max_results = 5 [default = 1000];</code>
+     * @return The maxResults.
+     */
+    int getMaxResults();
 
-      @java.lang.Override
-      public Builder clone() {
-        return super.clone();
-      }
-      @java.lang.Override
-      public Builder setField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.setField(field, value);
-      }
-      @java.lang.Override
-      public Builder clearField(
-          com.google.protobuf.Descriptors.FieldDescriptor field) {
-        return super.clearField(field);
-      }
-      @java.lang.Override
-      public Builder clearOneof(
-          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-        return super.clearOneof(oneof);
-      }
-      @java.lang.Override
-      public Builder setRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          int index, java.lang.Object value) {
-        return super.setRepeatedField(field, index, value);
-      }
-      @java.lang.Override
-      public Builder addRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.addRepeatedField(field, value);
-      }
-      @java.lang.Override
-      public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.SearchRuns) {
-          return mergeFrom((org.mlflow.api.proto.Service.SearchRuns)other);
-        } else {
-          super.mergeFrom(other);
-          return this;
-        }
-      }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @return A list containing the orderBy.
+     */
+    java.util.List<java.lang.String>
+        getOrderByList();
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @return The count of orderBy.
+     */
+    int getOrderByCount();
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @param index The index of the element to return.
+     * @return The orderBy at the given index.
+     */
+    java.lang.String getOrderBy(int index);
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the orderBy at the given index.
+     */
+    com.google.protobuf.ByteString
+        getOrderByBytes(int index);
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns other) {
-        if (other == org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance()) return this;
-        if (!other.experimentIds_.isEmpty()) {
-          if (experimentIds_.isEmpty()) {
-            experimentIds_ = other.experimentIds_;
-            bitField0_ = (bitField0_ & ~0x00000001);
-          } else {
-            ensureExperimentIdsIsMutable();
-            experimentIds_.addAll(other.experimentIds_);
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return Whether the pageToken field is set.
+     */
+    boolean hasPageToken();
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return The pageToken.
+     */
+    java.lang.String getPageToken();
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return The bytes for pageToken.
+     */
+    com.google.protobuf.ByteString
+        getPageTokenBytes();
+  }
+  /**
+   * Protobuf type {@code mlflow.SearchRuns}
+   */
+  public static final class SearchRuns extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.SearchRuns)
+      SearchRunsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use SearchRuns.newBuilder() to construct.
+    private SearchRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private SearchRuns() {
+      experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      filter_ = "";
+      runViewType_ = 1;
+      maxResults_ = 1000;
+      orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      pageToken_ = "";
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new SearchRuns();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private SearchRuns(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                experimentIds_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000001;
+              }
+              experimentIds_.add(bs);
+              break;
+            }
+            case 24: {
+              int rawValue = input.readEnum();
+                @SuppressWarnings("deprecation")
+              org.mlflow.api.proto.Service.ViewType value = org.mlflow.api.proto.Service.ViewType.valueOf(rawValue);
+              if (value == null) {
+                unknownFields.mergeVarintField(3, rawValue);
+              } else {
+                bitField0_ |= 0x00000002;
+                runViewType_ = rawValue;
+              }
+              break;
+            }
+            case 34: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              filter_ = bs;
+              break;
+            }
+            case 40: {
+              bitField0_ |= 0x00000004;
+              maxResults_ = input.readInt32();
+              break;
+            }
+            case 50: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              if (!((mutable_bitField0_ & 0x00000010) != 0)) {
+                orderBy_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000010;
+              }
+              orderBy_.add(bs);
+              break;
+            }
+            case 58: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000008;
+              pageToken_ = bs;
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
           }
-          onChanged();
-        }
-        if (other.hasFilter()) {
-          bitField0_ |= 0x00000002;
-          filter_ = other.filter_;
-          onChanged();
         }
-        if (other.hasRunViewType()) {
-          setRunViewType(other.getRunViewType());
-        }
-        if (other.hasMaxResults()) {
-          setMaxResults(other.getMaxResults());
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000001) != 0)) {
+          experimentIds_ = experimentIds_.getUnmodifiableView();
         }
-        if (!other.orderBy_.isEmpty()) {
-          if (orderBy_.isEmpty()) {
-            orderBy_ = other.orderBy_;
-            bitField0_ = (bitField0_ & ~0x00000010);
-          } else {
-            ensureOrderByIsMutable();
-            orderBy_.addAll(other.orderBy_);
-          }
-          onChanged();
+        if (((mutable_bitField0_ & 0x00000010) != 0)) {
+          orderBy_ = orderBy_.getUnmodifiableView();
         }
-        if (other.hasPageToken()) {
-          bitField0_ |= 0x00000020;
-          pageToken_ = other.pageToken_;
-          onChanged();
-        }
-        this.mergeUnknownFields(other.unknownFields);
-        onChanged();
-        return this;
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.SearchRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Run> 
+          getRunsList();
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.Run getRuns(int index);
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      int getRunsCount();
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList();
+      /**
+       * <pre>
+       * Runs that match the search criteria.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index);
+
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return Whether the nextPageToken field is set.
+       */
+      boolean hasNextPageToken();
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return The nextPageToken.
+       */
+      java.lang.String getNextPageToken();
+      /**
+       * <code>optional string next_page_token = 2;</code>
+       * @return The bytes for nextPageToken.
+       */
+      com.google.protobuf.ByteString
+          getNextPageTokenBytes();
+    }
+    /**
+     * Protobuf type {@code mlflow.SearchRuns.Response}
+     */
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.SearchRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        runs_ = java.util.Collections.emptyList();
+        nextPageToken_ = "";
       }
 
       @java.lang.Override
-      public final boolean isInitialized() {
-        return true;
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
       }
 
       @java.lang.Override
-      public Builder mergeFrom(
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        org.mlflow.api.proto.Service.SearchRuns parsedMessage = null;
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
         try {
-          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                  runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                runs_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
+                break;
+              }
+              case 18: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000001;
+                nextPageToken_ = bs;
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
         } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.SearchRuns) e.getUnfinishedMessage();
-          throw e.unwrapIOException();
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
         } finally {
-          if (parsedMessage != null) {
-            mergeFrom(parsedMessage);
+          if (((mutable_bitField0_ & 0x00000001) != 0)) {
+            runs_ = java.util.Collections.unmodifiableList(runs_);
           }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
         }
-        return this;
       }
-      private int bitField0_;
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+      }
 
-      private com.google.protobuf.LazyStringList experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      private void ensureExperimentIdsIsMutable() {
-        if (!((bitField0_ & 0x00000001) != 0)) {
-          experimentIds_ = new com.google.protobuf.LazyStringArrayList(experimentIds_);
-          bitField0_ |= 0x00000001;
-         }
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
       }
+
+      private int bitField0_;
+      public static final int RUNS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
       /**
        * <pre>
-       * List of experiment IDs to search over.
+       * Runs that match the search criteria.
        * </pre>
        *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @return A list containing the experimentIds.
+       * <code>repeated .mlflow.Run runs = 1;</code>
        */
-      public com.google.protobuf.ProtocolStringList
-          getExperimentIdsList() {
-        return experimentIds_.getUnmodifiableView();
+      @java.lang.Override
+      public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+        return runs_;
       }
       /**
        * <pre>
-       * List of experiment IDs to search over.
+       * Runs that match the search criteria.
        * </pre>
        *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @return The count of experimentIds.
+       * <code>repeated .mlflow.Run runs = 1;</code>
        */
-      public int getExperimentIdsCount() {
-        return experimentIds_.size();
+      @java.lang.Override
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList() {
+        return runs_;
       }
       /**
        * <pre>
-       * List of experiment IDs to search over.
+       * Runs that match the search criteria.
        * </pre>
        *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param index The index of the element to return.
-       * @return The experimentIds at the given index.
+       * <code>repeated .mlflow.Run runs = 1;</code>
        */
-      public java.lang.String getExperimentIds(int index) {
-        return experimentIds_.get(index);
+      @java.lang.Override
+      public int getRunsCount() {
+        return runs_.size();
       }
       /**
        * <pre>
-       * List of experiment IDs to search over.
+       * Runs that match the search criteria.
        * </pre>
        *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param index The index of the value to return.
-       * @return The bytes of the experimentIds at the given index.
+       * <code>repeated .mlflow.Run runs = 1;</code>
        */
-      public com.google.protobuf.ByteString
-          getExperimentIdsBytes(int index) {
-        return experimentIds_.getByteString(index);
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.Run getRuns(int index) {
+        return runs_.get(index);
       }
       /**
        * <pre>
-       * List of experiment IDs to search over.
+       * Runs that match the search criteria.
        * </pre>
        *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param index The index to set the value at.
-       * @param value The experimentIds to set.
-       * @return This builder for chaining.
+       * <code>repeated .mlflow.Run runs = 1;</code>
        */
-      public Builder setExperimentIds(
-          int index, java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureExperimentIdsIsMutable();
-        experimentIds_.set(index, value);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param value The experimentIds to add.
-       * @return This builder for chaining.
-       */
-      public Builder addExperimentIds(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureExperimentIdsIsMutable();
-        experimentIds_.add(value);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param values The experimentIds to add.
-       * @return This builder for chaining.
-       */
-      public Builder addAllExperimentIds(
-          java.lang.Iterable<java.lang.String> values) {
-        ensureExperimentIdsIsMutable();
-        com.google.protobuf.AbstractMessageLite.Builder.addAll(
-            values, experimentIds_);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearExperimentIds() {
-        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000001);
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * List of experiment IDs to search over.
-       * </pre>
-       *
-       * <code>repeated string experiment_ids = 1;</code>
-       * @param value The bytes of the experimentIds to add.
-       * @return This builder for chaining.
-       */
-      public Builder addExperimentIdsBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureExperimentIdsIsMutable();
-        experimentIds_.add(value);
-        onChanged();
-        return this;
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index) {
+        return runs_.get(index);
       }
 
-      private java.lang.Object filter_ = "";
+      public static final int NEXT_PAGE_TOKEN_FIELD_NUMBER = 2;
+      private volatile java.lang.Object nextPageToken_;
       /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return Whether the filter field is set.
+       * <code>optional string next_page_token = 2;</code>
+       * @return Whether the nextPageToken field is set.
        */
-      public boolean hasFilter() {
-        return ((bitField0_ & 0x00000002) != 0);
+      @java.lang.Override
+      public boolean hasNextPageToken() {
+        return ((bitField0_ & 0x00000001) != 0);
       }
       /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return The filter.
+       * <code>optional string next_page_token = 2;</code>
+       * @return The nextPageToken.
        */
-      public java.lang.String getFilter() {
-        java.lang.Object ref = filter_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
+      @java.lang.Override
+      public java.lang.String getNextPageToken() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
               (com.google.protobuf.ByteString) ref;
           java.lang.String s = bs.toStringUtf8();
           if (bs.isValidUtf8()) {
-            filter_ = s;
+            nextPageToken_ = s;
           }
           return s;
-        } else {
-          return (java.lang.String) ref;
         }
       }
       /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return The bytes for filter.
+       * <code>optional string next_page_token = 2;</code>
+       * @return The bytes for nextPageToken.
        */
+      @java.lang.Override
       public com.google.protobuf.ByteString
-          getFilterBytes() {
-        java.lang.Object ref = filter_;
-        if (ref instanceof String) {
+          getNextPageTokenBytes() {
+        java.lang.Object ref = nextPageToken_;
+        if (ref instanceof java.lang.String) {
           com.google.protobuf.ByteString b = 
               com.google.protobuf.ByteString.copyFromUtf8(
                   (java.lang.String) ref);
-          filter_ = b;
+          nextPageToken_ = b;
           return b;
         } else {
           return (com.google.protobuf.ByteString) ref;
         }
       }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @param value The filter to set.
-       * @return This builder for chaining.
-       */
-      public Builder setFilter(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        filter_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearFilter() {
-        bitField0_ = (bitField0_ & ~0x00000002);
-        filter_ = getDefaultInstance().getFilter();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * A filter expression over params, metrics, and tags, that allows returning a subset of
-       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
-       * between a param, metric, or tag and a constant.
-       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
-       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
-       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
-       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
-       * </pre>
-       *
-       * <code>optional string filter = 4;</code>
-       * @param value The bytes for filter to set.
-       * @return This builder for chaining.
-       */
-      public Builder setFilterBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000002;
-        filter_ = value;
-        onChanged();
-        return this;
-      }
 
-      private int runViewType_ = 1;
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @return Whether the runViewType field is set.
-       */
-      @java.lang.Override public boolean hasRunViewType() {
-        return ((bitField0_ & 0x00000004) != 0);
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
       }
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @return The runViewType.
-       */
+
       @java.lang.Override
-      public org.mlflow.api.proto.Service.ViewType getRunViewType() {
-        @SuppressWarnings("deprecation")
-        org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
-        return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < runs_.size(); i++) {
+          output.writeMessage(1, runs_.get(i));
+        }
+        if (((bitField0_ & 0x00000001) != 0)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, nextPageToken_);
+        }
+        unknownFields.writeTo(output);
       }
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @param value The runViewType to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunViewType(org.mlflow.api.proto.Service.ViewType value) {
-        if (value == null) {
-          throw new NullPointerException();
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < runs_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, runs_.get(i));
         }
-        bitField0_ |= 0x00000004;
-        runViewType_ = value.getNumber();
-        onChanged();
-        return this;
-      }
-      /**
-       * <pre>
-       * Whether to display only active, only deleted, or all runs.
-       * Defaults to only active runs.
-       * </pre>
-       *
-       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunViewType() {
-        bitField0_ = (bitField0_ & ~0x00000004);
-        runViewType_ = 1;
-        onChanged();
-        return this;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, nextPageToken_);
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
       }
 
-      private int maxResults_ = 1000;
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @return Whether the maxResults field is set.
-       */
       @java.lang.Override
-      public boolean hasMaxResults() {
-        return ((bitField0_ & 0x00000008) != 0);
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.SearchRuns.Response other = (org.mlflow.api.proto.Service.SearchRuns.Response) obj;
+
+        if (!getRunsList()
+            .equals(other.getRunsList())) return false;
+        if (hasNextPageToken() != other.hasNextPageToken()) return false;
+        if (hasNextPageToken()) {
+          if (!getNextPageToken()
+              .equals(other.getNextPageToken())) return false;
+        }
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
       }
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @return The maxResults.
-       */
+
       @java.lang.Override
-      public int getMaxResults() {
-        return maxResults_;
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getRunsCount() > 0) {
+          hash = (37 * hash) + RUNS_FIELD_NUMBER;
+          hash = (53 * hash) + getRunsList().hashCode();
+        }
+        if (hasNextPageToken()) {
+          hash = (37 * hash) + NEXT_PAGE_TOKEN_FIELD_NUMBER;
+          hash = (53 * hash) + getNextPageToken().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
       }
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @param value The maxResults to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMaxResults(int value) {
-        bitField0_ |= 0x00000008;
-        maxResults_ = value;
-        onChanged();
-        return this;
+
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      /**
-       * <pre>
-       * Maximum number of runs desired. If unspecified, defaults to 1000.
-       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
-       * but may support more. Callers of this endpoint are encouraged to pass max_results
-       * explicitly and leverage page_token to iterate through experiments.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5 [default = 1000];</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMaxResults() {
-        bitField0_ = (bitField0_ & ~0x00000008);
-        maxResults_ = 1000;
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-
-      private com.google.protobuf.LazyStringList orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-      private void ensureOrderByIsMutable() {
-        if (!((bitField0_ & 0x00000010) != 0)) {
-          orderBy_ = new com.google.protobuf.LazyStringArrayList(orderBy_);
-          bitField0_ |= 0x00000010;
-         }
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @return A list containing the orderBy.
-       */
-      public com.google.protobuf.ProtocolStringList
-          getOrderByList() {
-        return orderBy_.getUnmodifiableView();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @return The count of orderBy.
-       */
-      public int getOrderByCount() {
-        return orderBy_.size();
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param index The index of the element to return.
-       * @return The orderBy at the given index.
-       */
-      public java.lang.String getOrderBy(int index) {
-        return orderBy_.get(index);
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param index The index of the value to return.
-       * @return The bytes of the orderBy at the given index.
-       */
-      public com.google.protobuf.ByteString
-          getOrderByBytes(int index) {
-        return orderBy_.getByteString(index);
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param index The index to set the value at.
-       * @param value The orderBy to set.
-       * @return This builder for chaining.
-       */
-      public Builder setOrderBy(
-          int index, java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureOrderByIsMutable();
-        orderBy_.set(index, value);
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param value The orderBy to add.
-       * @return This builder for chaining.
-       */
-      public Builder addOrderBy(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureOrderByIsMutable();
-        orderBy_.add(value);
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param values The orderBy to add.
-       * @return This builder for chaining.
-       */
-      public Builder addAllOrderBy(
-          java.lang.Iterable<java.lang.String> values) {
-        ensureOrderByIsMutable();
-        com.google.protobuf.AbstractMessageLite.Builder.addAll(
-            values, orderBy_);
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearOrderBy() {
-        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
-        bitField0_ = (bitField0_ & ~0x00000010);
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      /**
-       * <pre>
-       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
-       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
-       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
-       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
-       * (and this is the default ordering criterion if order_by is not provided).
-       * </pre>
-       *
-       * <code>repeated string order_by = 6;</code>
-       * @param value The bytes of the orderBy to add.
-       * @return This builder for chaining.
-       */
-      public Builder addOrderByBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  ensureOrderByIsMutable();
-        orderBy_.add(value);
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.SearchRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
 
-      private java.lang.Object pageToken_ = "";
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return Whether the pageToken field is set.
-       */
-      public boolean hasPageToken() {
-        return ((bitField0_ & 0x00000020) != 0);
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return The pageToken.
-       */
-      public java.lang.String getPageToken() {
-        java.lang.Object ref = pageToken_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            pageToken_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
-        }
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return The bytes for pageToken.
-       */
-      public com.google.protobuf.ByteString
-          getPageTokenBytes() {
-        java.lang.Object ref = pageToken_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          pageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @param value The pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageToken(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000020;
-        pageToken_ = value;
-        onChanged();
-        return this;
-      }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearPageToken() {
-        bitField0_ = (bitField0_ & ~0x00000020);
-        pageToken_ = getDefaultInstance().getPageToken();
-        onChanged();
-        return this;
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
       }
-      /**
-       * <code>optional string page_token = 7;</code>
-       * @param value The bytes for pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageTokenBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000020;
-        pageToken_ = value;
-        onChanged();
-        return this;
+      public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
       @java.lang.Override
-      public final Builder setUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.setUnknownFields(unknownFields);
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
       }
 
       @java.lang.Override
-      public final Builder mergeUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.mergeUnknownFields(unknownFields);
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
       }
+      /**
+       * Protobuf type {@code mlflow.SearchRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns.Response)
+          org.mlflow.api.proto.Service.SearchRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+        }
 
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.SearchRuns.Response.class, org.mlflow.api.proto.Service.SearchRuns.Response.Builder.class);
+        }
 
-      // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns)
-    }
-
-    // @@protoc_insertion_point(class_scope:mlflow.SearchRuns)
-    private static final org.mlflow.api.proto.Service.SearchRuns DEFAULT_INSTANCE;
-    static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns();
-    }
-
-    public static org.mlflow.api.proto.Service.SearchRuns getDefaultInstance() {
-      return DEFAULT_INSTANCE;
-    }
+        // Construct using org.mlflow.api.proto.Service.SearchRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<SearchRuns>
-        PARSER = new com.google.protobuf.AbstractParser<SearchRuns>() {
-      @java.lang.Override
-      public SearchRuns parsePartialFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return new SearchRuns(input, extensionRegistry);
-      }
-    };
-
-    public static com.google.protobuf.Parser<SearchRuns> parser() {
-      return PARSER;
-    }
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getRunsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            runsBuilder_.clear();
+          }
+          nextPageToken_ = "";
+          bitField0_ = (bitField0_ & ~0x00000002);
+          return this;
+        }
 
-    @java.lang.Override
-    public com.google.protobuf.Parser<SearchRuns> getParserForType() {
-      return PARSER;
-    }
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_Response_descriptor;
+        }
 
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
-      return DEFAULT_INSTANCE;
-    }
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance();
+        }
 
-  }
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.SearchRuns.Response build() {
+          org.mlflow.api.proto.Service.SearchRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
 
-  public interface ListArtifactsOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.ListArtifacts)
-      com.google.protobuf.MessageOrBuilder {
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.SearchRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.SearchRuns.Response result = new org.mlflow.api.proto.Service.SearchRuns.Response(this);
+          int from_bitField0_ = bitField0_;
+          int to_bitField0_ = 0;
+          if (runsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) != 0)) {
+              runs_ = java.util.Collections.unmodifiableList(runs_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.runs_ = runs_;
+          } else {
+            result.runs_ = runsBuilder_.build();
+          }
+          if (((from_bitField0_ & 0x00000002) != 0)) {
+            to_bitField0_ |= 0x00000001;
+          }
+          result.nextPageToken_ = nextPageToken_;
+          result.bitField0_ = to_bitField0_;
+          onBuilt();
+          return result;
+        }
 
-    /**
-     * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return Whether the runId field is set.
-     */
-    boolean hasRunId();
-    /**
-     * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return The runId.
-     */
-    java.lang.String getRunId();
-    /**
-     * <pre>
-     * ID of the run whose artifacts to list. Must be provided.
-     * </pre>
-     *
-     * <code>optional string run_id = 3;</code>
-     * @return The bytes for runId.
-     */
-    com.google.protobuf.ByteString
-        getRunIdBytes();
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.SearchRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.SearchRuns.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
 
-    /**
-     * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
-     * </pre>
-     *
-     * <code>optional string run_uuid = 1;</code>
-     * @return Whether the runUuid field is set.
-     */
-    boolean hasRunUuid();
-    /**
-     * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
-     * </pre>
-     *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The runUuid.
-     */
-    java.lang.String getRunUuid();
-    /**
-     * <pre>
-     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
-     * be removed in a future MLflow version.
-     * </pre>
-     *
-     * <code>optional string run_uuid = 1;</code>
-     * @return The bytes for runUuid.
-     */
-    com.google.protobuf.ByteString
-        getRunUuidBytes();
+        public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.SearchRuns.Response.getDefaultInstance()) return this;
+          if (runsBuilder_ == null) {
+            if (!other.runs_.isEmpty()) {
+              if (runs_.isEmpty()) {
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureRunsIsMutable();
+                runs_.addAll(other.runs_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.runs_.isEmpty()) {
+              if (runsBuilder_.isEmpty()) {
+                runsBuilder_.dispose();
+                runsBuilder_ = null;
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                runsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getRunsFieldBuilder() : null;
+              } else {
+                runsBuilder_.addAllMessages(other.runs_);
+              }
+            }
+          }
+          if (other.hasNextPageToken()) {
+            bitField0_ |= 0x00000002;
+            nextPageToken_ = other.nextPageToken_;
+            onChanged();
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
 
-    /**
-     * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
-     * </pre>
-     *
-     * <code>optional string path = 2;</code>
-     * @return Whether the path field is set.
-     */
-    boolean hasPath();
-    /**
-     * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
-     * </pre>
-     *
-     * <code>optional string path = 2;</code>
-     * @return The path.
-     */
-    java.lang.String getPath();
-    /**
-     * <pre>
-     * Filter artifacts matching this path (a relative path from the root artifact directory).
-     * </pre>
-     *
-     * <code>optional string path = 2;</code>
-     * @return The bytes for path.
-     */
-    com.google.protobuf.ByteString
-        getPathBytes();
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
 
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return Whether the pageToken field is set.
-     */
-    boolean hasPageToken();
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return The pageToken.
-     */
-    java.lang.String getPageToken();
-    /**
-     * <pre>
-     * Token indicating the page of artifact results to fetch
-     * </pre>
-     *
-     * <code>optional string page_token = 4;</code>
-     * @return The bytes for pageToken.
-     */
-    com.google.protobuf.ByteString
-        getPageTokenBytes();
-  }
-  /**
-   * Protobuf type {@code mlflow.ListArtifacts}
-   */
-  public static final class ListArtifacts extends
-      com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.ListArtifacts)
-      ListArtifactsOrBuilder {
-  private static final long serialVersionUID = 0L;
-    // Use ListArtifacts.newBuilder() to construct.
-    private ListArtifacts(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-      super(builder);
-    }
-    private ListArtifacts() {
-      runId_ = "";
-      runUuid_ = "";
-      path_ = "";
-      pageToken_ = "";
-    }
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.SearchRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.SearchRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
 
-    @java.lang.Override
-    @SuppressWarnings({"unused"})
-    protected java.lang.Object newInstance(
-        UnusedPrivateParameter unused) {
-      return new ListArtifacts();
-    }
+        private java.util.List<org.mlflow.api.proto.Service.Run> runs_ =
+          java.util.Collections.emptyList();
+        private void ensureRunsIsMutable() {
+          if (!((bitField0_ & 0x00000001) != 0)) {
+            runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>(runs_);
+            bitField0_ |= 0x00000001;
+           }
+        }
 
-    @java.lang.Override
-    public final com.google.protobuf.UnknownFieldSet
-    getUnknownFields() {
-      return this.unknownFields;
-    }
-    private ListArtifacts(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      this();
-      if (extensionRegistry == null) {
-        throw new java.lang.NullPointerException();
-      }
-      int mutable_bitField0_ = 0;
-      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-          com.google.protobuf.UnknownFieldSet.newBuilder();
-      try {
-        boolean done = false;
-        while (!done) {
-          int tag = input.readTag();
-          switch (tag) {
-            case 0:
-              done = true;
-              break;
-            case 10: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000002;
-              runUuid_ = bs;
-              break;
-            }
-            case 18: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000004;
-              path_ = bs;
-              break;
-            }
-            case 26: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              runId_ = bs;
-              break;
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runsBuilder_;
+
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+          if (runsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(runs_);
+          } else {
+            return runsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public int getRunsCount() {
+          if (runsBuilder_ == null) {
+            return runs_.size();
+          } else {
+            return runsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run getRuns(int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);
+          } else {
+            return runsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
             }
-            case 34: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000008;
-              pageToken_ = bs;
-              break;
+            ensureRunsIsMutable();
+            runs_.set(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
             }
-            default: {
-              if (!parseUnknownField(
-                  input, unknownFields, extensionRegistry, tag)) {
-                done = true;
-              }
-              break;
+            ensureRunsIsMutable();
+            runs_.add(value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
             }
+            ensureRunsIsMutable();
+            runs_.add(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, value);
           }
+          return this;
         }
-      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-        throw e.setUnfinishedMessage(this);
-      } catch (java.io.IOException e) {
-        throw new com.google.protobuf.InvalidProtocolBufferException(
-            e).setUnfinishedMessage(this);
-      } finally {
-        this.unknownFields = unknownFields.build();
-        makeExtensionsImmutable();
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addAllRuns(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Run> values) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, runs_);
+            onChanged();
+          } else {
+            runsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder clearRuns() {
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder removeRuns(int index) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.remove(index);
+            onChanged();
+          } else {
+            runsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder getRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+            int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);  } else {
+            return runsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+             getRunsOrBuilderList() {
+          if (runsBuilder_ != null) {
+            return runsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(runs_);
+          }
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder() {
+          return getRunsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Runs that match the search criteria.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run.Builder> 
+             getRunsBuilderList() {
+          return getRunsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> 
+            getRunsFieldBuilder() {
+          if (runsBuilder_ == null) {
+            runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder>(
+                    runs_,
+                    ((bitField0_ & 0x00000001) != 0),
+                    getParentForChildren(),
+                    isClean());
+            runs_ = null;
+          }
+          return runsBuilder_;
+        }
+
+        private java.lang.Object nextPageToken_ = "";
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return Whether the nextPageToken field is set.
+         */
+        public boolean hasNextPageToken() {
+          return ((bitField0_ & 0x00000002) != 0);
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return The nextPageToken.
+         */
+        public java.lang.String getNextPageToken() {
+          java.lang.Object ref = nextPageToken_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              nextPageToken_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return The bytes for nextPageToken.
+         */
+        public com.google.protobuf.ByteString
+            getNextPageTokenBytes() {
+          java.lang.Object ref = nextPageToken_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            nextPageToken_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @param value The nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageToken(
+            java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @return This builder for chaining.
+         */
+        public Builder clearNextPageToken() {
+          bitField0_ = (bitField0_ & ~0x00000002);
+          nextPageToken_ = getDefaultInstance().getNextPageToken();
+          onChanged();
+          return this;
+        }
+        /**
+         * <code>optional string next_page_token = 2;</code>
+         * @param value The bytes for nextPageToken to set.
+         * @return This builder for chaining.
+         */
+        public Builder setNextPageTokenBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+          nextPageToken_ = value;
+          onChanged();
+          return this;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.SearchRuns.Response)
+      private static final org.mlflow.api.proto.Service.SearchRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.SearchRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    private int bitField0_;
+    public static final int EXPERIMENT_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList experimentIds_;
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @return A list containing the experimentIds.
+     */
+    public com.google.protobuf.ProtocolStringList
+        getExperimentIdsList() {
+      return experimentIds_;
+    }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @return The count of experimentIds.
+     */
+    public int getExperimentIdsCount() {
+      return experimentIds_.size();
+    }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @param index The index of the element to return.
+     * @return The experimentIds at the given index.
+     */
+    public java.lang.String getExperimentIds(int index) {
+      return experimentIds_.get(index);
+    }
+    /**
+     * <pre>
+     * List of experiment IDs to search over.
+     * </pre>
+     *
+     * <code>repeated string experiment_ids = 1;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the experimentIds at the given index.
+     */
+    public com.google.protobuf.ByteString
+        getExperimentIdsBytes(int index) {
+      return experimentIds_.getByteString(index);
+    }
+
+    public static final int FILTER_FIELD_NUMBER = 4;
+    private volatile java.lang.Object filter_;
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return Whether the filter field is set.
+     */
+    @java.lang.Override
+    public boolean hasFilter() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return The filter.
+     */
+    @java.lang.Override
+    public java.lang.String getFilter() {
+      java.lang.Object ref = filter_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          filter_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * A filter expression over params, metrics, and tags, that allows returning a subset of
+     * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+     * between a param, metric, or tag and a constant.
+     * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+     * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+     * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+     * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+     * </pre>
+     *
+     * <code>optional string filter = 4;</code>
+     * @return The bytes for filter.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getFilterBytes() {
+      java.lang.Object ref = filter_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        filter_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int RUN_VIEW_TYPE_FIELD_NUMBER = 3;
+    private int runViewType_;
+    /**
+     * <pre>
+     * Whether to display only active, only deleted, or all runs.
+     * Defaults to only active runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+     * @return Whether the runViewType field is set.
+     */
+    @java.lang.Override public boolean hasRunViewType() {
+      return ((bitField0_ & 0x00000002) != 0);
+    }
+    /**
+     * <pre>
+     * Whether to display only active, only deleted, or all runs.
+     * Defaults to only active runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+     * @return The runViewType.
+     */
+    @java.lang.Override public org.mlflow.api.proto.Service.ViewType getRunViewType() {
+      @SuppressWarnings("deprecation")
+      org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
+      return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
+    }
+
+    public static final int MAX_RESULTS_FIELD_NUMBER = 5;
+    private int maxResults_;
+    /**
+     * <pre>
+     * Maximum number of runs desired. If unspecified, defaults to 1000.
+     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+     * but may support more. Callers of this endpoint are encouraged to pass max_results
+     * explicitly and leverage page_token to iterate through experiments.
+     * </pre>
+     *
+     * <code>optional int32 max_results = 5 [default = 1000];</code>
+     * @return Whether the maxResults field is set.
+     */
+    @java.lang.Override
+    public boolean hasMaxResults() {
+      return ((bitField0_ & 0x00000004) != 0);
+    }
+    /**
+     * <pre>
+     * Maximum number of runs desired. If unspecified, defaults to 1000.
+     * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+     * but may support more. Callers of this endpoint are encouraged to pass max_results
+     * explicitly and leverage page_token to iterate through experiments.
+     * </pre>
+     *
+     * <code>optional int32 max_results = 5 [default = 1000];</code>
+     * @return The maxResults.
+     */
+    @java.lang.Override
+    public int getMaxResults() {
+      return maxResults_;
+    }
+
+    public static final int ORDER_BY_FIELD_NUMBER = 6;
+    private com.google.protobuf.LazyStringList orderBy_;
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @return A list containing the orderBy.
+     */
+    public com.google.protobuf.ProtocolStringList
+        getOrderByList() {
+      return orderBy_;
+    }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @return The count of orderBy.
+     */
+    public int getOrderByCount() {
+      return orderBy_.size();
+    }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @param index The index of the element to return.
+     * @return The orderBy at the given index.
+     */
+    public java.lang.String getOrderBy(int index) {
+      return orderBy_.get(index);
+    }
+    /**
+     * <pre>
+     * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+     * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+     * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+     * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+     * (and this is the default ordering criterion if order_by is not provided).
+     * </pre>
+     *
+     * <code>repeated string order_by = 6;</code>
+     * @param index The index of the value to return.
+     * @return The bytes of the orderBy at the given index.
+     */
+    public com.google.protobuf.ByteString
+        getOrderByBytes(int index) {
+      return orderBy_.getByteString(index);
+    }
+
+    public static final int PAGE_TOKEN_FIELD_NUMBER = 7;
+    private volatile java.lang.Object pageToken_;
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return Whether the pageToken field is set.
+     */
+    @java.lang.Override
+    public boolean hasPageToken() {
+      return ((bitField0_ & 0x00000008) != 0);
+    }
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return The pageToken.
+     */
+    @java.lang.Override
+    public java.lang.String getPageToken() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          pageToken_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <code>optional string page_token = 7;</code>
+     * @return The bytes for pageToken.
+     */
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getPageTokenBytes() {
+      java.lang.Object ref = pageToken_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        pageToken_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < experimentIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, experimentIds_.getRaw(i));
+      }
+      if (((bitField0_ & 0x00000002) != 0)) {
+        output.writeEnum(3, runViewType_);
+      }
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 4, filter_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        output.writeInt32(5, maxResults_);
+      }
+      for (int i = 0; i < orderBy_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 6, orderBy_.getRaw(i));
+      }
+      if (((bitField0_ & 0x00000008) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 7, pageToken_);
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < experimentIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(experimentIds_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getExperimentIdsList().size();
+      }
+      if (((bitField0_ & 0x00000002) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeEnumSize(3, runViewType_);
+      }
+      if (((bitField0_ & 0x00000001) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, filter_);
+      }
+      if (((bitField0_ & 0x00000004) != 0)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt32Size(5, maxResults_);
+      }
+      {
+        int dataSize = 0;
+        for (int i = 0; i < orderBy_.size(); i++) {
+          dataSize += computeStringSizeNoTag(orderBy_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getOrderByList().size();
+      }
+      if (((bitField0_ & 0x00000008) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(7, pageToken_);
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.SearchRuns)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.SearchRuns other = (org.mlflow.api.proto.Service.SearchRuns) obj;
+
+      if (!getExperimentIdsList()
+          .equals(other.getExperimentIdsList())) return false;
+      if (hasFilter() != other.hasFilter()) return false;
+      if (hasFilter()) {
+        if (!getFilter()
+            .equals(other.getFilter())) return false;
+      }
+      if (hasRunViewType() != other.hasRunViewType()) return false;
+      if (hasRunViewType()) {
+        if (runViewType_ != other.runViewType_) return false;
+      }
+      if (hasMaxResults() != other.hasMaxResults()) return false;
+      if (hasMaxResults()) {
+        if (getMaxResults()
+            != other.getMaxResults()) return false;
+      }
+      if (!getOrderByList()
+          .equals(other.getOrderByList())) return false;
+      if (hasPageToken() != other.hasPageToken()) return false;
+      if (hasPageToken()) {
+        if (!getPageToken()
+            .equals(other.getPageToken())) return false;
+      }
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getExperimentIdsCount() > 0) {
+        hash = (37 * hash) + EXPERIMENT_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getExperimentIdsList().hashCode();
+      }
+      if (hasFilter()) {
+        hash = (37 * hash) + FILTER_FIELD_NUMBER;
+        hash = (53 * hash) + getFilter().hashCode();
+      }
+      if (hasRunViewType()) {
+        hash = (37 * hash) + RUN_VIEW_TYPE_FIELD_NUMBER;
+        hash = (53 * hash) + runViewType_;
+      }
+      if (hasMaxResults()) {
+        hash = (37 * hash) + MAX_RESULTS_FIELD_NUMBER;
+        hash = (53 * hash) + getMaxResults();
+      }
+      if (getOrderByCount() > 0) {
+        hash = (37 * hash) + ORDER_BY_FIELD_NUMBER;
+        hash = (53 * hash) + getOrderByList().hashCode();
+      }
+      if (hasPageToken()) {
+        hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
+        hash = (53 * hash) + getPageToken().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.SearchRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.SearchRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.SearchRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.SearchRuns)
+        org.mlflow.api.proto.Service.SearchRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.SearchRuns.class, org.mlflow.api.proto.Service.SearchRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.SearchRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+        }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        filter_ = "";
+        bitField0_ = (bitField0_ & ~0x00000002);
+        runViewType_ = 1;
+        bitField0_ = (bitField0_ & ~0x00000004);
+        maxResults_ = 1000;
+        bitField0_ = (bitField0_ & ~0x00000008);
+        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000010);
+        pageToken_ = "";
+        bitField0_ = (bitField0_ & ~0x00000020);
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_SearchRuns_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.SearchRuns build() {
+        org.mlflow.api.proto.Service.SearchRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.SearchRuns buildPartial() {
+        org.mlflow.api.proto.Service.SearchRuns result = new org.mlflow.api.proto.Service.SearchRuns(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((bitField0_ & 0x00000001) != 0)) {
+          experimentIds_ = experimentIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
+        }
+        result.experimentIds_ = experimentIds_;
+        if (((from_bitField0_ & 0x00000002) != 0)) {
+          to_bitField0_ |= 0x00000001;
+        }
+        result.filter_ = filter_;
+        if (((from_bitField0_ & 0x00000004) != 0)) {
+          to_bitField0_ |= 0x00000002;
+        }
+        result.runViewType_ = runViewType_;
+        if (((from_bitField0_ & 0x00000008) != 0)) {
+          to_bitField0_ |= 0x00000004;
+        }
+        result.maxResults_ = maxResults_;
+        if (((bitField0_ & 0x00000010) != 0)) {
+          orderBy_ = orderBy_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000010);
+        }
+        result.orderBy_ = orderBy_;
+        if (((from_bitField0_ & 0x00000020) != 0)) {
+          to_bitField0_ |= 0x00000008;
+        }
+        result.pageToken_ = pageToken_;
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.SearchRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.SearchRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
+        }
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.SearchRuns other) {
+        if (other == org.mlflow.api.proto.Service.SearchRuns.getDefaultInstance()) return this;
+        if (!other.experimentIds_.isEmpty()) {
+          if (experimentIds_.isEmpty()) {
+            experimentIds_ = other.experimentIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureExperimentIdsIsMutable();
+            experimentIds_.addAll(other.experimentIds_);
+          }
+          onChanged();
+        }
+        if (other.hasFilter()) {
+          bitField0_ |= 0x00000002;
+          filter_ = other.filter_;
+          onChanged();
+        }
+        if (other.hasRunViewType()) {
+          setRunViewType(other.getRunViewType());
+        }
+        if (other.hasMaxResults()) {
+          setMaxResults(other.getMaxResults());
+        }
+        if (!other.orderBy_.isEmpty()) {
+          if (orderBy_.isEmpty()) {
+            orderBy_ = other.orderBy_;
+            bitField0_ = (bitField0_ & ~0x00000010);
+          } else {
+            ensureOrderByIsMutable();
+            orderBy_.addAll(other.orderBy_);
+          }
+          onChanged();
+        }
+        if (other.hasPageToken()) {
+          bitField0_ |= 0x00000020;
+          pageToken_ = other.pageToken_;
+          onChanged();
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.SearchRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.SearchRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
+      }
+      private int bitField0_;
+
+      private com.google.protobuf.LazyStringList experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureExperimentIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) != 0)) {
+          experimentIds_ = new com.google.protobuf.LazyStringArrayList(experimentIds_);
+          bitField0_ |= 0x00000001;
+         }
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @return A list containing the experimentIds.
+       */
+      public com.google.protobuf.ProtocolStringList
+          getExperimentIdsList() {
+        return experimentIds_.getUnmodifiableView();
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @return The count of experimentIds.
+       */
+      public int getExperimentIdsCount() {
+        return experimentIds_.size();
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param index The index of the element to return.
+       * @return The experimentIds at the given index.
+       */
+      public java.lang.String getExperimentIds(int index) {
+        return experimentIds_.get(index);
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the experimentIds at the given index.
+       */
+      public com.google.protobuf.ByteString
+          getExperimentIdsBytes(int index) {
+        return experimentIds_.getByteString(index);
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param index The index to set the value at.
+       * @param value The experimentIds to set.
+       * @return This builder for chaining.
+       */
+      public Builder setExperimentIds(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureExperimentIdsIsMutable();
+        experimentIds_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param value The experimentIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addExperimentIds(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureExperimentIdsIsMutable();
+        experimentIds_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param values The experimentIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addAllExperimentIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureExperimentIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, experimentIds_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearExperimentIds() {
+        experimentIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of experiment IDs to search over.
+       * </pre>
+       *
+       * <code>repeated string experiment_ids = 1;</code>
+       * @param value The bytes of the experimentIds to add.
+       * @return This builder for chaining.
+       */
+      public Builder addExperimentIdsBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureExperimentIdsIsMutable();
+        experimentIds_.add(value);
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object filter_ = "";
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return Whether the filter field is set.
+       */
+      public boolean hasFilter() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return The filter.
+       */
+      public java.lang.String getFilter() {
+        java.lang.Object ref = filter_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            filter_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return The bytes for filter.
+       */
+      public com.google.protobuf.ByteString
+          getFilterBytes() {
+        java.lang.Object ref = filter_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          filter_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @param value The filter to set.
+       * @return This builder for chaining.
+       */
+      public Builder setFilter(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        filter_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearFilter() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        filter_ = getDefaultInstance().getFilter();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * A filter expression over params, metrics, and tags, that allows returning a subset of
+       * runs. The syntax is a subset of SQL that supports ANDing together binary operations
+       * between a param, metric, or tag and a constant.
+       * Example: ``metrics.rmse &lt; 1 and params.model_class = 'LogisticRegression'``
+       * You can select columns with special characters (hyphen, space, period, etc.) by using double quotes:
+       * ``metrics."model class" = 'LinearRegression' and tags."user-name" = 'Tomas'``
+       * Supported operators are ``=``, ``!=``, ``&gt;``, ``&gt;=``, ``&lt;``, and ``&lt;=``.
+       * </pre>
+       *
+       * <code>optional string filter = 4;</code>
+       * @param value The bytes for filter to set.
+       * @return This builder for chaining.
+       */
+      public Builder setFilterBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        filter_ = value;
+        onChanged();
+        return this;
+      }
+
+      private int runViewType_ = 1;
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @return Whether the runViewType field is set.
+       */
+      @java.lang.Override public boolean hasRunViewType() {
+        return ((bitField0_ & 0x00000004) != 0);
+      }
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @return The runViewType.
+       */
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.ViewType getRunViewType() {
+        @SuppressWarnings("deprecation")
+        org.mlflow.api.proto.Service.ViewType result = org.mlflow.api.proto.Service.ViewType.valueOf(runViewType_);
+        return result == null ? org.mlflow.api.proto.Service.ViewType.ACTIVE_ONLY : result;
+      }
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @param value The runViewType to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunViewType(org.mlflow.api.proto.Service.ViewType value) {
+        if (value == null) {
+          throw new NullPointerException();
+        }
+        bitField0_ |= 0x00000004;
+        runViewType_ = value.getNumber();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Whether to display only active, only deleted, or all runs.
+       * Defaults to only active runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.ViewType run_view_type = 3 [default = ACTIVE_ONLY];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunViewType() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        runViewType_ = 1;
+        onChanged();
+        return this;
+      }
+
+      private int maxResults_ = 1000;
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @return Whether the maxResults field is set.
+       */
+      @java.lang.Override
+      public boolean hasMaxResults() {
+        return ((bitField0_ & 0x00000008) != 0);
+      }
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @return The maxResults.
+       */
+      @java.lang.Override
+      public int getMaxResults() {
+        return maxResults_;
+      }
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @param value The maxResults to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMaxResults(int value) {
+        bitField0_ |= 0x00000008;
+        maxResults_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Maximum number of runs desired. If unspecified, defaults to 1000.
+       * All servers are guaranteed to support a `max_results` threshold of at least 50,000
+       * but may support more. Callers of this endpoint are encouraged to pass max_results
+       * explicitly and leverage page_token to iterate through experiments.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5 [default = 1000];</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearMaxResults() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        maxResults_ = 1000;
+        onChanged();
+        return this;
+      }
+
+      private com.google.protobuf.LazyStringList orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureOrderByIsMutable() {
+        if (!((bitField0_ & 0x00000010) != 0)) {
+          orderBy_ = new com.google.protobuf.LazyStringArrayList(orderBy_);
+          bitField0_ |= 0x00000010;
+         }
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @return A list containing the orderBy.
+       */
+      public com.google.protobuf.ProtocolStringList
+          getOrderByList() {
+        return orderBy_.getUnmodifiableView();
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @return The count of orderBy.
+       */
+      public int getOrderByCount() {
+        return orderBy_.size();
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param index The index of the element to return.
+       * @return The orderBy at the given index.
+       */
+      public java.lang.String getOrderBy(int index) {
+        return orderBy_.get(index);
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param index The index of the value to return.
+       * @return The bytes of the orderBy at the given index.
+       */
+      public com.google.protobuf.ByteString
+          getOrderByBytes(int index) {
+        return orderBy_.getByteString(index);
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param index The index to set the value at.
+       * @param value The orderBy to set.
+       * @return This builder for chaining.
+       */
+      public Builder setOrderBy(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureOrderByIsMutable();
+        orderBy_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param value The orderBy to add.
+       * @return This builder for chaining.
+       */
+      public Builder addOrderBy(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureOrderByIsMutable();
+        orderBy_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param values The orderBy to add.
+       * @return This builder for chaining.
+       */
+      public Builder addAllOrderBy(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureOrderByIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, orderBy_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearOrderBy() {
+        orderBy_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000010);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * List of columns to be ordered by, including attributes, params, metrics, and tags with an
+       * optional "DESC" or "ASC" annotation, where "ASC" is the default.
+       * Example: ["params.input DESC", "metrics.alpha ASC", "metrics.rmse"]
+       * Tiebreaks are done by start_time DESC followed by run_id for runs with the same start time
+       * (and this is the default ordering criterion if order_by is not provided).
+       * </pre>
+       *
+       * <code>repeated string order_by = 6;</code>
+       * @param value The bytes of the orderBy to add.
+       * @return This builder for chaining.
+       */
+      public Builder addOrderByBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureOrderByIsMutable();
+        orderBy_.add(value);
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object pageToken_ = "";
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return Whether the pageToken field is set.
+       */
+      public boolean hasPageToken() {
+        return ((bitField0_ & 0x00000020) != 0);
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return The pageToken.
+       */
+      public java.lang.String getPageToken() {
+        java.lang.Object ref = pageToken_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            pageToken_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return The bytes for pageToken.
+       */
+      public com.google.protobuf.ByteString
+          getPageTokenBytes() {
+        java.lang.Object ref = pageToken_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          pageToken_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @param value The pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageToken(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000020;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearPageToken() {
+        bitField0_ = (bitField0_ & ~0x00000020);
+        pageToken_ = getDefaultInstance().getPageToken();
+        onChanged();
+        return this;
+      }
+      /**
+       * <code>optional string page_token = 7;</code>
+       * @param value The bytes for pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageTokenBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000020;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.SearchRuns)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.SearchRuns)
+    private static final org.mlflow.api.proto.Service.SearchRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.SearchRuns();
+    }
+
+    public static org.mlflow.api.proto.Service.SearchRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<SearchRuns>
+        PARSER = new com.google.protobuf.AbstractParser<SearchRuns>() {
+      @java.lang.Override
+      public SearchRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new SearchRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<SearchRuns> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<SearchRuns> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.SearchRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface ListArtifactsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.ListArtifacts)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return Whether the runId field is set.
+     */
+    boolean hasRunId();
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return The runId.
+     */
+    java.lang.String getRunId();
+    /**
+     * <pre>
+     * ID of the run whose artifacts to list. Must be provided.
+     * </pre>
+     *
+     * <code>optional string run_id = 3;</code>
+     * @return The bytes for runId.
+     */
+    com.google.protobuf.ByteString
+        getRunIdBytes();
+
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return Whether the runUuid field is set.
+     */
+    boolean hasRunUuid();
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The runUuid.
+     */
+    java.lang.String getRunUuid();
+    /**
+     * <pre>
+     * [Deprecated, use run_id instead] ID of the run whose artifacts to list. This field will
+     * be removed in a future MLflow version.
+     * </pre>
+     *
+     * <code>optional string run_uuid = 1;</code>
+     * @return The bytes for runUuid.
+     */
+    com.google.protobuf.ByteString
+        getRunUuidBytes();
+
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return Whether the path field is set.
+     */
+    boolean hasPath();
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return The path.
+     */
+    java.lang.String getPath();
+    /**
+     * <pre>
+     * Filter artifacts matching this path (a relative path from the root artifact directory).
+     * </pre>
+     *
+     * <code>optional string path = 2;</code>
+     * @return The bytes for path.
+     */
+    com.google.protobuf.ByteString
+        getPathBytes();
+
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return Whether the pageToken field is set.
+     */
+    boolean hasPageToken();
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The pageToken.
+     */
+    java.lang.String getPageToken();
+    /**
+     * <pre>
+     * Token indicating the page of artifact results to fetch
+     * </pre>
+     *
+     * <code>optional string page_token = 4;</code>
+     * @return The bytes for pageToken.
+     */
+    com.google.protobuf.ByteString
+        getPageTokenBytes();
+  }
+  /**
+   * Protobuf type {@code mlflow.ListArtifacts}
+   */
+  public static final class ListArtifacts extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.ListArtifacts)
+      ListArtifactsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use ListArtifacts.newBuilder() to construct.
+    private ListArtifacts(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private ListArtifacts() {
+      runId_ = "";
+      runUuid_ = "";
+      path_ = "";
+      pageToken_ = "";
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new ListArtifacts();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private ListArtifacts(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000002;
+              runUuid_ = bs;
+              break;
+            }
+            case 18: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000004;
+              path_ = bs;
+              break;
+            }
+            case 26: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              runId_ = bs;
+              break;
+            }
+            case 34: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000008;
+              pageToken_ = bs;
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
       }
     }
     public static final com.google.protobuf.Descriptors.Descriptor
@@ -51837,36 +53475,258 @@ public final class Service {
         }
         return this;
       }
-      private int bitField0_;
+      private int bitField0_;
+
+      private java.lang.Object runId_ = "";
+      /**
+       * <pre>
+       * ID of the run from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return Whether the runId field is set.
+       */
+      public boolean hasRunId() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * ID of the run from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return The runId.
+       */
+      public java.lang.String getRunId() {
+        java.lang.Object ref = runId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runId_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the run from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return The bytes for runId.
+       */
+      public com.google.protobuf.ByteString
+          getRunIdBytes() {
+        java.lang.Object ref = runId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the run from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @param value The runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the run from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunId() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        runId_ = getDefaultInstance().getRunId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the run from which to fetch metric values. Must be provided.
+       * </pre>
+       *
+       * <code>optional string run_id = 3;</code>
+       * @param value The bytes for runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object runUuid_ = "";
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return Whether the runUuid field is set.
+       */
+      public boolean hasRunUuid() {
+        return ((bitField0_ & 0x00000002) != 0);
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return The runUuid.
+       */
+      public java.lang.String getRunUuid() {
+        java.lang.Object ref = runUuid_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runUuid_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return The bytes for runUuid.
+       */
+      public com.google.protobuf.ByteString
+          getRunUuidBytes() {
+        java.lang.Object ref = runUuid_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runUuid_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @param value The runUuid to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunUuid(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        runUuid_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunUuid() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        runUuid_ = getDefaultInstance().getRunUuid();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
+       * will be removed in a future MLflow version.
+       * </pre>
+       *
+       * <code>optional string run_uuid = 1;</code>
+       * @param value The bytes for runUuid to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunUuidBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        runUuid_ = value;
+        onChanged();
+        return this;
+      }
 
-      private java.lang.Object runId_ = "";
+      private java.lang.Object metricKey_ = "";
       /**
        * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional string run_id = 3;</code>
-       * @return Whether the runId field is set.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return Whether the metricKey field is set.
        */
-      public boolean hasRunId() {
-        return ((bitField0_ & 0x00000001) != 0);
+      public boolean hasMetricKey() {
+        return ((bitField0_ & 0x00000004) != 0);
       }
       /**
        * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional string run_id = 3;</code>
-       * @return The runId.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return The metricKey.
        */
-      public java.lang.String getRunId() {
-        java.lang.Object ref = runId_;
+      public java.lang.String getMetricKey() {
+        java.lang.Object ref = metricKey_;
         if (!(ref instanceof java.lang.String)) {
           com.google.protobuf.ByteString bs =
               (com.google.protobuf.ByteString) ref;
           java.lang.String s = bs.toStringUtf8();
           if (bs.isValidUtf8()) {
-            runId_ = s;
+            metricKey_ = s;
           }
           return s;
         } else {
@@ -51875,20 +53735,20 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional string run_id = 3;</code>
-       * @return The bytes for runId.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @return The bytes for metricKey.
        */
       public com.google.protobuf.ByteString
-          getRunIdBytes() {
-        java.lang.Object ref = runId_;
+          getMetricKeyBytes() {
+        java.lang.Object ref = metricKey_;
         if (ref instanceof String) {
           com.google.protobuf.ByteString b = 
               com.google.protobuf.ByteString.copyFromUtf8(
                   (java.lang.String) ref);
-          runId_ = b;
+          metricKey_ = b;
           return b;
         } else {
           return (com.google.protobuf.ByteString) ref;
@@ -51896,87 +53756,85 @@ public final class Service {
       }
       /**
        * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional string run_id = 3;</code>
-       * @param value The runId to set.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @param value The metricKey to set.
        * @return This builder for chaining.
        */
-      public Builder setRunId(
+      public Builder setMetricKey(
           java.lang.String value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
+  bitField0_ |= 0x00000004;
+        metricKey_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional string run_id = 3;</code>
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
        * @return This builder for chaining.
        */
-      public Builder clearRunId() {
-        bitField0_ = (bitField0_ & ~0x00000001);
-        runId_ = getDefaultInstance().getRunId();
+      public Builder clearMetricKey() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        metricKey_ = getDefaultInstance().getMetricKey();
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * ID of the run from which to fetch metric values. Must be provided.
+       * Name of the metric.
        * </pre>
        *
-       * <code>optional string run_id = 3;</code>
-       * @param value The bytes for runId to set.
+       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
+       * @param value The bytes for metricKey to set.
        * @return This builder for chaining.
        */
-      public Builder setRunIdBytes(
+      public Builder setMetricKeyBytes(
           com.google.protobuf.ByteString value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
+  bitField0_ |= 0x00000004;
+        metricKey_ = value;
         onChanged();
         return this;
       }
 
-      private java.lang.Object runUuid_ = "";
+      private java.lang.Object pageToken_ = "";
       /**
        * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional string run_uuid = 1;</code>
-       * @return Whether the runUuid field is set.
+       * <code>optional string page_token = 4;</code>
+       * @return Whether the pageToken field is set.
        */
-      public boolean hasRunUuid() {
-        return ((bitField0_ & 0x00000002) != 0);
+      public boolean hasPageToken() {
+        return ((bitField0_ & 0x00000008) != 0);
       }
       /**
        * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional string run_uuid = 1;</code>
-       * @return The runUuid.
+       * <code>optional string page_token = 4;</code>
+       * @return The pageToken.
        */
-      public java.lang.String getRunUuid() {
-        java.lang.Object ref = runUuid_;
+      public java.lang.String getPageToken() {
+        java.lang.Object ref = pageToken_;
         if (!(ref instanceof java.lang.String)) {
           com.google.protobuf.ByteString bs =
               (com.google.protobuf.ByteString) ref;
           java.lang.String s = bs.toStringUtf8();
           if (bs.isValidUtf8()) {
-            runUuid_ = s;
+            pageToken_ = s;
           }
           return s;
         } else {
@@ -51985,21 +53843,20 @@ public final class Service {
       }
       /**
        * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional string run_uuid = 1;</code>
-       * @return The bytes for runUuid.
+       * <code>optional string page_token = 4;</code>
+       * @return The bytes for pageToken.
        */
       public com.google.protobuf.ByteString
-          getRunUuidBytes() {
-        java.lang.Object ref = runUuid_;
+          getPageTokenBytes() {
+        java.lang.Object ref = pageToken_;
         if (ref instanceof String) {
           com.google.protobuf.ByteString b = 
               com.google.protobuf.ByteString.copyFromUtf8(
                   (java.lang.String) ref);
-          runUuid_ = b;
+          pageToken_ = b;
           return b;
         } else {
           return (com.google.protobuf.ByteString) ref;
@@ -52007,399 +53864,901 @@ public final class Service {
       }
       /**
        * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional string run_uuid = 1;</code>
-       * @param value The runUuid to set.
+       * <code>optional string page_token = 4;</code>
+       * @param value The pageToken to set.
        * @return This builder for chaining.
        */
-      public Builder setRunUuid(
+      public Builder setPageToken(
           java.lang.String value) {
         if (value == null) {
     throw new NullPointerException();
   }
-  bitField0_ |= 0x00000002;
-        runUuid_ = value;
+  bitField0_ |= 0x00000008;
+        pageToken_ = value;
         onChanged();
         return this;
       }
       /**
        * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
+       * Token indicating the page of metric history to fetch
        * </pre>
        *
-       * <code>optional string run_uuid = 1;</code>
+       * <code>optional string page_token = 4;</code>
        * @return This builder for chaining.
        */
-      public Builder clearRunUuid() {
-        bitField0_ = (bitField0_ & ~0x00000002);
-        runUuid_ = getDefaultInstance().getRunUuid();
+      public Builder clearPageToken() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        pageToken_ = getDefaultInstance().getPageToken();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Token indicating the page of metric history to fetch
+       * </pre>
+       *
+       * <code>optional string page_token = 4;</code>
+       * @param value The bytes for pageToken to set.
+       * @return This builder for chaining.
+       */
+      public Builder setPageTokenBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000008;
+        pageToken_ = value;
+        onChanged();
+        return this;
+      }
+
+      private int maxResults_ ;
+      /**
+       * <pre>
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5;</code>
+       * @return Whether the maxResults field is set.
+       */
+      @java.lang.Override
+      public boolean hasMaxResults() {
+        return ((bitField0_ & 0x00000010) != 0);
+      }
+      /**
+       * <pre>
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5;</code>
+       * @return The maxResults.
+       */
+      @java.lang.Override
+      public int getMaxResults() {
+        return maxResults_;
+      }
+      /**
+       * <pre>
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5;</code>
+       * @param value The maxResults to set.
+       * @return This builder for chaining.
+       */
+      public Builder setMaxResults(int value) {
+        bitField0_ |= 0x00000010;
+        maxResults_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Maximum number of logged instances of a metric for a run to return per call.
+       * Backend servers may restrict the value of `max_results` depending on performance requirements.
+       * Requests that do not specify this value will behave as non-paginated queries where all
+       * metric history values for a given metric within a run are returned in a single response.
+       * </pre>
+       *
+       * <code>optional int32 max_results = 5;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearMaxResults() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        maxResults_ = 0;
         onChanged();
         return this;
       }
-      /**
-       * <pre>
-       * [Deprecated, use run_id instead] ID of the run from which to fetch metric values. This field
-       * will be removed in a future MLflow version.
-       * </pre>
-       *
-       * <code>optional string run_uuid = 1;</code>
-       * @param value The bytes for runUuid to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunUuidBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistory)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistory)
+    private static final org.mlflow.api.proto.Service.GetMetricHistory DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistory();
+    }
+
+    public static org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetMetricHistory>
+        PARSER = new com.google.protobuf.AbstractParser<GetMetricHistory>() {
+      @java.lang.Override
+      public GetMetricHistory parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new GetMetricHistory(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<GetMetricHistory> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<GetMetricHistory> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
   }
-  bitField0_ |= 0x00000002;
-        runUuid_ = value;
-        onChanged();
-        return this;
-      }
 
-      private java.lang.Object metricKey_ = "";
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return Whether the metricKey field is set.
-       */
-      public boolean hasMetricKey() {
-        return ((bitField0_ & 0x00000004) != 0);
+  public interface LogBatchOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.LogBatch)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * ID of the run to log under
+     * </pre>
+     *
+     * <code>optional string run_id = 1;</code>
+     * @return Whether the runId field is set.
+     */
+    boolean hasRunId();
+    /**
+     * <pre>
+     * ID of the run to log under
+     * </pre>
+     *
+     * <code>optional string run_id = 1;</code>
+     * @return The runId.
+     */
+    java.lang.String getRunId();
+    /**
+     * <pre>
+     * ID of the run to log under
+     * </pre>
+     *
+     * <code>optional string run_id = 1;</code>
+     * @return The bytes for runId.
+     */
+    com.google.protobuf.ByteString
+        getRunIdBytes();
+
+    /**
+     * <pre>
+     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Metric metrics = 2;</code>
+     */
+    java.util.List<org.mlflow.api.proto.Service.Metric> 
+        getMetricsList();
+    /**
+     * <pre>
+     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Metric metrics = 2;</code>
+     */
+    org.mlflow.api.proto.Service.Metric getMetrics(int index);
+    /**
+     * <pre>
+     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Metric metrics = 2;</code>
+     */
+    int getMetricsCount();
+    /**
+     * <pre>
+     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Metric metrics = 2;</code>
+     */
+    java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+        getMetricsOrBuilderList();
+    /**
+     * <pre>
+     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Metric metrics = 2;</code>
+     */
+    org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+        int index);
+
+    /**
+     * <pre>
+     * Params to log. A single request can contain up to 100 params, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Param params = 3;</code>
+     */
+    java.util.List<org.mlflow.api.proto.Service.Param> 
+        getParamsList();
+    /**
+     * <pre>
+     * Params to log. A single request can contain up to 100 params, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Param params = 3;</code>
+     */
+    org.mlflow.api.proto.Service.Param getParams(int index);
+    /**
+     * <pre>
+     * Params to log. A single request can contain up to 100 params, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Param params = 3;</code>
+     */
+    int getParamsCount();
+    /**
+     * <pre>
+     * Params to log. A single request can contain up to 100 params, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Param params = 3;</code>
+     */
+    java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
+        getParamsOrBuilderList();
+    /**
+     * <pre>
+     * Params to log. A single request can contain up to 100 params, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.Param params = 3;</code>
+     */
+    org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
+        int index);
+
+    /**
+     * <pre>
+     * Tags to log. A single request can contain up to 100 tags, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunTag tags = 4;</code>
+     */
+    java.util.List<org.mlflow.api.proto.Service.RunTag> 
+        getTagsList();
+    /**
+     * <pre>
+     * Tags to log. A single request can contain up to 100 tags, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunTag tags = 4;</code>
+     */
+    org.mlflow.api.proto.Service.RunTag getTags(int index);
+    /**
+     * <pre>
+     * Tags to log. A single request can contain up to 100 tags, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunTag tags = 4;</code>
+     */
+    int getTagsCount();
+    /**
+     * <pre>
+     * Tags to log. A single request can contain up to 100 tags, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunTag tags = 4;</code>
+     */
+    java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+        getTagsOrBuilderList();
+    /**
+     * <pre>
+     * Tags to log. A single request can contain up to 100 tags, and up to 1000
+     * metrics, params, and tags in total.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunTag tags = 4;</code>
+     */
+    org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+        int index);
+  }
+  /**
+   * Protobuf type {@code mlflow.LogBatch}
+   */
+  public static final class LogBatch extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.LogBatch)
+      LogBatchOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use LogBatch.newBuilder() to construct.
+    private LogBatch(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private LogBatch() {
+      runId_ = "";
+      metrics_ = java.util.Collections.emptyList();
+      params_ = java.util.Collections.emptyList();
+      tags_ = java.util.Collections.emptyList();
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new LogBatch();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private LogBatch(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
       }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return The metricKey.
-       */
-      public java.lang.String getMetricKey() {
-        java.lang.Object ref = metricKey_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            metricKey_ = s;
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              runId_ = bs;
+              break;
+            }
+            case 18: {
+              if (!((mutable_bitField0_ & 0x00000002) != 0)) {
+                metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>();
+                mutable_bitField0_ |= 0x00000002;
+              }
+              metrics_.add(
+                  input.readMessage(org.mlflow.api.proto.Service.Metric.PARSER, extensionRegistry));
+              break;
+            }
+            case 26: {
+              if (!((mutable_bitField0_ & 0x00000004) != 0)) {
+                params_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Param>();
+                mutable_bitField0_ |= 0x00000004;
+              }
+              params_.add(
+                  input.readMessage(org.mlflow.api.proto.Service.Param.PARSER, extensionRegistry));
+              break;
+            }
+            case 34: {
+              if (!((mutable_bitField0_ & 0x00000008) != 0)) {
+                tags_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunTag>();
+                mutable_bitField0_ |= 0x00000008;
+              }
+              tags_.add(
+                  input.readMessage(org.mlflow.api.proto.Service.RunTag.PARSER, extensionRegistry));
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
         }
-      }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return The bytes for metricKey.
-       */
-      public com.google.protobuf.ByteString
-          getMetricKeyBytes() {
-        java.lang.Object ref = metricKey_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          metricKey_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000002) != 0)) {
+          metrics_ = java.util.Collections.unmodifiableList(metrics_);
+        }
+        if (((mutable_bitField0_ & 0x00000004) != 0)) {
+          params_ = java.util.Collections.unmodifiableList(params_);
+        }
+        if (((mutable_bitField0_ & 0x00000008) != 0)) {
+          tags_ = java.util.Collections.unmodifiableList(tags_);
         }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
       }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @param value The metricKey to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMetricKey(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-        metricKey_ = value;
-        onChanged();
-        return this;
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.LogBatch.class, org.mlflow.api.proto.Service.LogBatch.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.LogBatch.Response)
+        com.google.protobuf.MessageOrBuilder {
+    }
+    /**
+     * Protobuf type {@code mlflow.LogBatch.Response}
+     */
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.LogBatch.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
       }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMetricKey() {
-        bitField0_ = (bitField0_ & ~0x00000004);
-        metricKey_ = getDefaultInstance().getMetricKey();
-        onChanged();
-        return this;
+      private Response() {
       }
-      /**
-       * <pre>
-       * Name of the metric.
-       * </pre>
-       *
-       * <code>optional string metric_key = 2 [(.mlflow.validate_required) = true];</code>
-       * @param value The bytes for metricKey to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMetricKeyBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000004;
-        metricKey_ = value;
-        onChanged();
-        return this;
+
+      @java.lang.Override
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
       }
 
-      private java.lang.Object pageToken_ = "";
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return Whether the pageToken field is set.
-       */
-      public boolean hasPageToken() {
-        return ((bitField0_ & 0x00000008) != 0);
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
       }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return The pageToken.
-       */
-      public java.lang.String getPageToken() {
-        java.lang.Object ref = pageToken_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            pageToken_ = s;
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
           }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
         }
       }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return The bytes for pageToken.
-       */
-      public com.google.protobuf.ByteString
-          getPageTokenBytes() {
-        java.lang.Object ref = pageToken_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          pageToken_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
-        }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_descriptor;
       }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @param value The pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageToken(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000008;
-        pageToken_ = value;
-        onChanged();
-        return this;
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.LogBatch.Response.class, org.mlflow.api.proto.Service.LogBatch.Response.Builder.class);
       }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearPageToken() {
-        bitField0_ = (bitField0_ & ~0x00000008);
-        pageToken_ = getDefaultInstance().getPageToken();
-        onChanged();
-        return this;
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
       }
-      /**
-       * <pre>
-       * Token indicating the page of metric history to fetch
-       * </pre>
-       *
-       * <code>optional string page_token = 4;</code>
-       * @param value The bytes for pageToken to set.
-       * @return This builder for chaining.
-       */
-      public Builder setPageTokenBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000008;
-        pageToken_ = value;
-        onChanged();
-        return this;
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        unknownFields.writeTo(output);
       }
 
-      private int maxResults_ ;
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return Whether the maxResults field is set.
-       */
       @java.lang.Override
-      public boolean hasMaxResults() {
-        return ((bitField0_ & 0x00000010) != 0);
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
       }
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return The maxResults.
-       */
+
       @java.lang.Override
-      public int getMaxResults() {
-        return maxResults_;
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.LogBatch.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.LogBatch.Response other = (org.mlflow.api.proto.Service.LogBatch.Response) obj;
+
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
       }
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @param value The maxResults to set.
-       * @return This builder for chaining.
-       */
-      public Builder setMaxResults(int value) {
-        bitField0_ |= 0x00000010;
-        maxResults_ = value;
-        onChanged();
-        return this;
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
       }
-      /**
-       * <pre>
-       * Maximum number of logged instances of a metric for a run to return per call.
-       * Backend servers may restrict the value of `max_results` depending on performance requirements.
-       * Requests that do not specify this value will behave as non-paginated queries where all
-       * metric history values for a given metric within a run are returned in a single response.
-       * </pre>
-       *
-       * <code>optional int32 max_results = 5;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearMaxResults() {
-        bitField0_ = (bitField0_ & ~0x00000010);
-        maxResults_ = 0;
-        onChanged();
-        return this;
+      public static Builder newBuilder(org.mlflow.api.proto.Service.LogBatch.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
       }
       @java.lang.Override
-      public final Builder setUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.setUnknownFields(unknownFields);
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
       }
 
       @java.lang.Override
-      public final Builder mergeUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.mergeUnknownFields(unknownFields);
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
       }
+      /**
+       * Protobuf type {@code mlflow.LogBatch.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.LogBatch.Response)
+          org.mlflow.api.proto.Service.LogBatch.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_descriptor;
+        }
 
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.LogBatch.Response.class, org.mlflow.api.proto.Service.LogBatch.Response.Builder.class);
+        }
 
-      // @@protoc_insertion_point(builder_scope:mlflow.GetMetricHistory)
-    }
+        // Construct using org.mlflow.api.proto.Service.LogBatch.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
 
-    // @@protoc_insertion_point(class_scope:mlflow.GetMetricHistory)
-    private static final org.mlflow.api.proto.Service.GetMetricHistory DEFAULT_INSTANCE;
-    static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetMetricHistory();
-    }
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          return this;
+        }
 
-    public static org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstance() {
-      return DEFAULT_INSTANCE;
-    }
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_descriptor;
+        }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetMetricHistory>
-        PARSER = new com.google.protobuf.AbstractParser<GetMetricHistory>() {
-      @java.lang.Override
-      public GetMetricHistory parsePartialFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return new GetMetricHistory(input, extensionRegistry);
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.LogBatch.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.LogBatch.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.LogBatch.Response build() {
+          org.mlflow.api.proto.Service.LogBatch.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.LogBatch.Response buildPartial() {
+          org.mlflow.api.proto.Service.LogBatch.Response result = new org.mlflow.api.proto.Service.LogBatch.Response(this);
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.LogBatch.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.LogBatch.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.LogBatch.Response other) {
+          if (other == org.mlflow.api.proto.Service.LogBatch.Response.getDefaultInstance()) return this;
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.LogBatch.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.LogBatch.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.LogBatch.Response)
       }
-    };
 
-    public static com.google.protobuf.Parser<GetMetricHistory> parser() {
-      return PARSER;
-    }
+      // @@protoc_insertion_point(class_scope:mlflow.LogBatch.Response)
+      private static final org.mlflow.api.proto.Service.LogBatch.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatch.Response();
+      }
 
-    @java.lang.Override
-    public com.google.protobuf.Parser<GetMetricHistory> getParserForType() {
-      return PARSER;
-    }
+      public static org.mlflow.api.proto.Service.LogBatch.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
 
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.GetMetricHistory getDefaultInstanceForType() {
-      return DEFAULT_INSTANCE;
-    }
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
 
-  }
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
 
-  public interface LogBatchOrBuilder extends
-      // @@protoc_insertion_point(interface_extends:mlflow.LogBatch)
-      com.google.protobuf.MessageOrBuilder {
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
 
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.LogBatch.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    private int bitField0_;
+    public static final int RUN_ID_FIELD_NUMBER = 1;
+    private volatile java.lang.Object runId_;
     /**
      * <pre>
      * ID of the run to log under
@@ -52408,7 +54767,10 @@ public final class Service {
      * <code>optional string run_id = 1;</code>
      * @return Whether the runId field is set.
      */
-    boolean hasRunId();
+    @java.lang.Override
+    public boolean hasRunId() {
+      return ((bitField0_ & 0x00000001) != 0);
+    }
     /**
      * <pre>
      * ID of the run to log under
@@ -52417,7 +54779,21 @@ public final class Service {
      * <code>optional string run_id = 1;</code>
      * @return The runId.
      */
-    java.lang.String getRunId();
+    @java.lang.Override
+    public java.lang.String getRunId() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          runId_ = s;
+        }
+        return s;
+      }
+    }
     /**
      * <pre>
      * ID of the run to log under
@@ -52426,9 +54802,23 @@ public final class Service {
      * <code>optional string run_id = 1;</code>
      * @return The bytes for runId.
      */
-    com.google.protobuf.ByteString
-        getRunIdBytes();
+    @java.lang.Override
+    public com.google.protobuf.ByteString
+        getRunIdBytes() {
+      java.lang.Object ref = runId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        runId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
 
+    public static final int METRICS_FIELD_NUMBER = 2;
+    private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_;
     /**
      * <pre>
      * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
@@ -52437,8 +54827,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.Metric metrics = 2;</code>
      */
-    java.util.List<org.mlflow.api.proto.Service.Metric> 
-        getMetricsList();
+    @java.lang.Override
+    public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
+      return metrics_;
+    }
     /**
      * <pre>
      * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
@@ -52447,7 +54839,11 @@ public final class Service {
      *
      * <code>repeated .mlflow.Metric metrics = 2;</code>
      */
-    org.mlflow.api.proto.Service.Metric getMetrics(int index);
+    @java.lang.Override
+    public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+        getMetricsOrBuilderList() {
+      return metrics_;
+    }
     /**
      * <pre>
      * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
@@ -52456,7 +54852,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.Metric metrics = 2;</code>
      */
-    int getMetricsCount();
+    @java.lang.Override
+    public int getMetricsCount() {
+      return metrics_.size();
+    }
     /**
      * <pre>
      * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
@@ -52465,8 +54864,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.Metric metrics = 2;</code>
      */
-    java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
-        getMetricsOrBuilderList();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
+      return metrics_.get(index);
+    }
     /**
      * <pre>
      * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
@@ -52475,9 +54876,14 @@ public final class Service {
      *
      * <code>repeated .mlflow.Metric metrics = 2;</code>
      */
-    org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
-        int index);
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+        int index) {
+      return metrics_.get(index);
+    }
 
+    public static final int PARAMS_FIELD_NUMBER = 3;
+    private java.util.List<org.mlflow.api.proto.Service.Param> params_;
     /**
      * <pre>
      * Params to log. A single request can contain up to 100 params, and up to 1000
@@ -52486,8 +54892,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.Param params = 3;</code>
      */
-    java.util.List<org.mlflow.api.proto.Service.Param> 
-        getParamsList();
+    @java.lang.Override
+    public java.util.List<org.mlflow.api.proto.Service.Param> getParamsList() {
+      return params_;
+    }
     /**
      * <pre>
      * Params to log. A single request can contain up to 100 params, and up to 1000
@@ -52496,7 +54904,11 @@ public final class Service {
      *
      * <code>repeated .mlflow.Param params = 3;</code>
      */
-    org.mlflow.api.proto.Service.Param getParams(int index);
+    @java.lang.Override
+    public java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
+        getParamsOrBuilderList() {
+      return params_;
+    }
     /**
      * <pre>
      * Params to log. A single request can contain up to 100 params, and up to 1000
@@ -52505,7 +54917,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.Param params = 3;</code>
      */
-    int getParamsCount();
+    @java.lang.Override
+    public int getParamsCount() {
+      return params_.size();
+    }
     /**
      * <pre>
      * Params to log. A single request can contain up to 100 params, and up to 1000
@@ -52514,8 +54929,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.Param params = 3;</code>
      */
-    java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
-        getParamsOrBuilderList();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.Param getParams(int index) {
+      return params_.get(index);
+    }
     /**
      * <pre>
      * Params to log. A single request can contain up to 100 params, and up to 1000
@@ -52524,9 +54941,14 @@ public final class Service {
      *
      * <code>repeated .mlflow.Param params = 3;</code>
      */
-    org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
-        int index);
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
+        int index) {
+      return params_.get(index);
+    }
 
+    public static final int TAGS_FIELD_NUMBER = 4;
+    private java.util.List<org.mlflow.api.proto.Service.RunTag> tags_;
     /**
      * <pre>
      * Tags to log. A single request can contain up to 100 tags, and up to 1000
@@ -52535,8 +54957,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.RunTag tags = 4;</code>
      */
-    java.util.List<org.mlflow.api.proto.Service.RunTag> 
-        getTagsList();
+    @java.lang.Override
+    public java.util.List<org.mlflow.api.proto.Service.RunTag> getTagsList() {
+      return tags_;
+    }
     /**
      * <pre>
      * Tags to log. A single request can contain up to 100 tags, and up to 1000
@@ -52545,7 +54969,11 @@ public final class Service {
      *
      * <code>repeated .mlflow.RunTag tags = 4;</code>
      */
-    org.mlflow.api.proto.Service.RunTag getTags(int index);
+    @java.lang.Override
+    public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+        getTagsOrBuilderList() {
+      return tags_;
+    }
     /**
      * <pre>
      * Tags to log. A single request can contain up to 100 tags, and up to 1000
@@ -52554,7 +54982,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.RunTag tags = 4;</code>
      */
-    int getTagsCount();
+    @java.lang.Override
+    public int getTagsCount() {
+      return tags_.size();
+    }
     /**
      * <pre>
      * Tags to log. A single request can contain up to 100 tags, and up to 1000
@@ -52563,8 +54994,10 @@ public final class Service {
      *
      * <code>repeated .mlflow.RunTag tags = 4;</code>
      */
-    java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
-        getTagsOrBuilderList();
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.RunTag getTags(int index) {
+      return tags_.get(index);
+    }
     /**
      * <pre>
      * Tags to log. A single request can contain up to 100 tags, and up to 1000
@@ -52573,2383 +55006,2911 @@ public final class Service {
      *
      * <code>repeated .mlflow.RunTag tags = 4;</code>
      */
-    org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
-        int index);
-  }
-  /**
-   * Protobuf type {@code mlflow.LogBatch}
-   */
-  public static final class LogBatch extends
-      com.google.protobuf.GeneratedMessageV3 implements
-      // @@protoc_insertion_point(message_implements:mlflow.LogBatch)
-      LogBatchOrBuilder {
-  private static final long serialVersionUID = 0L;
-    // Use LogBatch.newBuilder() to construct.
-    private LogBatch(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-      super(builder);
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+        int index) {
+      return tags_.get(index);
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      if (((bitField0_ & 0x00000001) != 0)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runId_);
+      }
+      for (int i = 0; i < metrics_.size(); i++) {
+        output.writeMessage(2, metrics_.get(i));
+      }
+      for (int i = 0; i < params_.size(); i++) {
+        output.writeMessage(3, params_.get(i));
+      }
+      for (int i = 0; i < tags_.size(); i++) {
+        output.writeMessage(4, tags_.get(i));
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      if (((bitField0_ & 0x00000001) != 0)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, runId_);
+      }
+      for (int i = 0; i < metrics_.size(); i++) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(2, metrics_.get(i));
+      }
+      for (int i = 0; i < params_.size(); i++) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(3, params_.get(i));
+      }
+      for (int i = 0; i < tags_.size(); i++) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(4, tags_.get(i));
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.LogBatch)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.LogBatch other = (org.mlflow.api.proto.Service.LogBatch) obj;
+
+      if (hasRunId() != other.hasRunId()) return false;
+      if (hasRunId()) {
+        if (!getRunId()
+            .equals(other.getRunId())) return false;
+      }
+      if (!getMetricsList()
+          .equals(other.getMetricsList())) return false;
+      if (!getParamsList()
+          .equals(other.getParamsList())) return false;
+      if (!getTagsList()
+          .equals(other.getTagsList())) return false;
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (hasRunId()) {
+        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getRunId().hashCode();
+      }
+      if (getMetricsCount() > 0) {
+        hash = (37 * hash) + METRICS_FIELD_NUMBER;
+        hash = (53 * hash) + getMetricsList().hashCode();
+      }
+      if (getParamsCount() > 0) {
+        hash = (37 * hash) + PARAMS_FIELD_NUMBER;
+        hash = (53 * hash) + getParamsList().hashCode();
+      }
+      if (getTagsCount() > 0) {
+        hash = (37 * hash) + TAGS_FIELD_NUMBER;
+        hash = (53 * hash) + getTagsList().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
     }
-    private LogBatch() {
-      runId_ = "";
-      metrics_ = java.util.Collections.emptyList();
-      params_ = java.util.Collections.emptyList();
-      tags_ = java.util.Collections.emptyList();
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
     }
-
-    @java.lang.Override
-    @SuppressWarnings({"unused"})
-    protected java.lang.Object newInstance(
-        UnusedPrivateParameter unused) {
-      return new LogBatch();
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
     }
-
-    @java.lang.Override
-    public final com.google.protobuf.UnknownFieldSet
-    getUnknownFields() {
-      return this.unknownFields;
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
     }
-    private LogBatch(
-        com.google.protobuf.CodedInputStream input,
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        byte[] data,
         com.google.protobuf.ExtensionRegistryLite extensionRegistry)
         throws com.google.protobuf.InvalidProtocolBufferException {
-      this();
-      if (extensionRegistry == null) {
-        throw new java.lang.NullPointerException();
-      }
-      int mutable_bitField0_ = 0;
-      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-          com.google.protobuf.UnknownFieldSet.newBuilder();
-      try {
-        boolean done = false;
-        while (!done) {
-          int tag = input.readTag();
-          switch (tag) {
-            case 0:
-              done = true;
-              break;
-            case 10: {
-              com.google.protobuf.ByteString bs = input.readBytes();
-              bitField0_ |= 0x00000001;
-              runId_ = bs;
-              break;
-            }
-            case 18: {
-              if (!((mutable_bitField0_ & 0x00000002) != 0)) {
-                metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>();
-                mutable_bitField0_ |= 0x00000002;
-              }
-              metrics_.add(
-                  input.readMessage(org.mlflow.api.proto.Service.Metric.PARSER, extensionRegistry));
-              break;
-            }
-            case 26: {
-              if (!((mutable_bitField0_ & 0x00000004) != 0)) {
-                params_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Param>();
-                mutable_bitField0_ |= 0x00000004;
-              }
-              params_.add(
-                  input.readMessage(org.mlflow.api.proto.Service.Param.PARSER, extensionRegistry));
-              break;
-            }
-            case 34: {
-              if (!((mutable_bitField0_ & 0x00000008) != 0)) {
-                tags_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunTag>();
-                mutable_bitField0_ |= 0x00000008;
-              }
-              tags_.add(
-                  input.readMessage(org.mlflow.api.proto.Service.RunTag.PARSER, extensionRegistry));
-              break;
-            }
-            default: {
-              if (!parseUnknownField(
-                  input, unknownFields, extensionRegistry, tag)) {
-                done = true;
-              }
-              break;
-            }
-          }
-        }
-      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-        throw e.setUnfinishedMessage(this);
-      } catch (java.io.IOException e) {
-        throw new com.google.protobuf.InvalidProtocolBufferException(
-            e).setUnfinishedMessage(this);
-      } finally {
-        if (((mutable_bitField0_ & 0x00000002) != 0)) {
-          metrics_ = java.util.Collections.unmodifiableList(metrics_);
-        }
-        if (((mutable_bitField0_ & 0x00000004) != 0)) {
-          params_ = java.util.Collections.unmodifiableList(params_);
-        }
-        if (((mutable_bitField0_ & 0x00000008) != 0)) {
-          tags_ = java.util.Collections.unmodifiableList(tags_);
-        }
-        this.unknownFields = unknownFields.build();
-        makeExtensionsImmutable();
-      }
+      return PARSER.parseFrom(data, extensionRegistry);
     }
-    public static final com.google.protobuf.Descriptors.Descriptor
-        getDescriptor() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_descriptor;
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatch parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.LogBatch parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
     }
 
     @java.lang.Override
-    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-        internalGetFieldAccessorTable() {
-      return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_fieldAccessorTable
-          .ensureFieldAccessorsInitialized(
-              org.mlflow.api.proto.Service.LogBatch.class, org.mlflow.api.proto.Service.LogBatch.Builder.class);
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.LogBatch prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
     }
 
-    public interface ResponseOrBuilder extends
-        // @@protoc_insertion_point(interface_extends:mlflow.LogBatch.Response)
-        com.google.protobuf.MessageOrBuilder {
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
     }
     /**
-     * Protobuf type {@code mlflow.LogBatch.Response}
+     * Protobuf type {@code mlflow.LogBatch}
      */
-    public static final class Response extends
-        com.google.protobuf.GeneratedMessageV3 implements
-        // @@protoc_insertion_point(message_implements:mlflow.LogBatch.Response)
-        ResponseOrBuilder {
-    private static final long serialVersionUID = 0L;
-      // Use Response.newBuilder() to construct.
-      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
-        super(builder);
-      }
-      private Response() {
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.LogBatch)
+        org.mlflow.api.proto.Service.LogBatchOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_descriptor;
       }
 
       @java.lang.Override
-      @SuppressWarnings({"unused"})
-      protected java.lang.Object newInstance(
-          UnusedPrivateParameter unused) {
-        return new Response();
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.LogBatch.class, org.mlflow.api.proto.Service.LogBatch.Builder.class);
       }
 
-      @java.lang.Override
-      public final com.google.protobuf.UnknownFieldSet
-      getUnknownFields() {
-        return this.unknownFields;
+      // Construct using org.mlflow.api.proto.Service.LogBatch.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
       }
-      private Response(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        this();
-        if (extensionRegistry == null) {
-          throw new java.lang.NullPointerException();
-        }
-        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
-            com.google.protobuf.UnknownFieldSet.newBuilder();
-        try {
-          boolean done = false;
-          while (!done) {
-            int tag = input.readTag();
-            switch (tag) {
-              case 0:
-                done = true;
-                break;
-              default: {
-                if (!parseUnknownField(
-                    input, unknownFields, extensionRegistry, tag)) {
-                  done = true;
-                }
-                break;
-              }
-            }
-          }
-        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          throw e.setUnfinishedMessage(this);
-        } catch (java.io.IOException e) {
-          throw new com.google.protobuf.InvalidProtocolBufferException(
-              e).setUnfinishedMessage(this);
-        } finally {
-          this.unknownFields = unknownFields.build();
-          makeExtensionsImmutable();
-        }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
       }
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_descriptor;
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+          getMetricsFieldBuilder();
+          getParamsFieldBuilder();
+          getTagsFieldBuilder();
+        }
       }
-
       @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.LogBatch.Response.class, org.mlflow.api.proto.Service.LogBatch.Response.Builder.class);
+      public Builder clear() {
+        super.clear();
+        runId_ = "";
+        bitField0_ = (bitField0_ & ~0x00000001);
+        if (metricsBuilder_ == null) {
+          metrics_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000002);
+        } else {
+          metricsBuilder_.clear();
+        }
+        if (paramsBuilder_ == null) {
+          params_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000004);
+        } else {
+          paramsBuilder_.clear();
+        }
+        if (tagsBuilder_ == null) {
+          tags_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000008);
+        } else {
+          tagsBuilder_.clear();
+        }
+        return this;
       }
 
-      private byte memoizedIsInitialized = -1;
       @java.lang.Override
-      public final boolean isInitialized() {
-        byte isInitialized = memoizedIsInitialized;
-        if (isInitialized == 1) return true;
-        if (isInitialized == 0) return false;
-
-        memoizedIsInitialized = 1;
-        return true;
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_descriptor;
       }
 
       @java.lang.Override
-      public void writeTo(com.google.protobuf.CodedOutputStream output)
-                          throws java.io.IOException {
-        unknownFields.writeTo(output);
+      public org.mlflow.api.proto.Service.LogBatch getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.LogBatch.getDefaultInstance();
       }
 
       @java.lang.Override
-      public int getSerializedSize() {
-        int size = memoizedSize;
-        if (size != -1) return size;
-
-        size = 0;
-        size += unknownFields.getSerializedSize();
-        memoizedSize = size;
-        return size;
+      public org.mlflow.api.proto.Service.LogBatch build() {
+        org.mlflow.api.proto.Service.LogBatch result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
       }
 
       @java.lang.Override
-      public boolean equals(final java.lang.Object obj) {
-        if (obj == this) {
-         return true;
+      public org.mlflow.api.proto.Service.LogBatch buildPartial() {
+        org.mlflow.api.proto.Service.LogBatch result = new org.mlflow.api.proto.Service.LogBatch(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((from_bitField0_ & 0x00000001) != 0)) {
+          to_bitField0_ |= 0x00000001;
         }
-        if (!(obj instanceof org.mlflow.api.proto.Service.LogBatch.Response)) {
-          return super.equals(obj);
+        result.runId_ = runId_;
+        if (metricsBuilder_ == null) {
+          if (((bitField0_ & 0x00000002) != 0)) {
+            metrics_ = java.util.Collections.unmodifiableList(metrics_);
+            bitField0_ = (bitField0_ & ~0x00000002);
+          }
+          result.metrics_ = metrics_;
+        } else {
+          result.metrics_ = metricsBuilder_.build();
         }
-        org.mlflow.api.proto.Service.LogBatch.Response other = (org.mlflow.api.proto.Service.LogBatch.Response) obj;
-
-        if (!unknownFields.equals(other.unknownFields)) return false;
-        return true;
-      }
-
-      @java.lang.Override
-      public int hashCode() {
-        if (memoizedHashCode != 0) {
-          return memoizedHashCode;
+        if (paramsBuilder_ == null) {
+          if (((bitField0_ & 0x00000004) != 0)) {
+            params_ = java.util.Collections.unmodifiableList(params_);
+            bitField0_ = (bitField0_ & ~0x00000004);
+          }
+          result.params_ = params_;
+        } else {
+          result.params_ = paramsBuilder_.build();
         }
-        int hash = 41;
-        hash = (19 * hash) + getDescriptor().hashCode();
-        hash = (29 * hash) + unknownFields.hashCode();
-        memoizedHashCode = hash;
-        return hash;
-      }
-
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          java.nio.ByteBuffer data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          java.nio.ByteBuffer data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          com.google.protobuf.ByteString data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          com.google.protobuf.ByteString data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(byte[] data)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          byte[] data,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws com.google.protobuf.InvalidProtocolBufferException {
-        return PARSER.parseFrom(data, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(java.io.InputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          java.io.InputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseDelimitedFrom(java.io.InputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseDelimitedWithIOException(PARSER, input);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseDelimitedFrom(
-          java.io.InputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          com.google.protobuf.CodedInputStream input)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input);
-      }
-      public static org.mlflow.api.proto.Service.LogBatch.Response parseFrom(
-          com.google.protobuf.CodedInputStream input,
-          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        return com.google.protobuf.GeneratedMessageV3
-            .parseWithIOException(PARSER, input, extensionRegistry);
+        if (tagsBuilder_ == null) {
+          if (((bitField0_ & 0x00000008) != 0)) {
+            tags_ = java.util.Collections.unmodifiableList(tags_);
+            bitField0_ = (bitField0_ & ~0x00000008);
+          }
+          result.tags_ = tags_;
+        } else {
+          result.tags_ = tagsBuilder_.build();
+        }
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
       }
 
       @java.lang.Override
-      public Builder newBuilderForType() { return newBuilder(); }
-      public static Builder newBuilder() {
-        return DEFAULT_INSTANCE.toBuilder();
+      public Builder clone() {
+        return super.clone();
       }
-      public static Builder newBuilder(org.mlflow.api.proto.Service.LogBatch.Response prototype) {
-        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
       }
       @java.lang.Override
-      public Builder toBuilder() {
-        return this == DEFAULT_INSTANCE
-            ? new Builder() : new Builder().mergeFrom(this);
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
       }
-
       @java.lang.Override
-      protected Builder newBuilderForType(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        Builder builder = new Builder(parent);
-        return builder;
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
       }
-      /**
-       * Protobuf type {@code mlflow.LogBatch.Response}
-       */
-      public static final class Builder extends
-          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-          // @@protoc_insertion_point(builder_implements:mlflow.LogBatch.Response)
-          org.mlflow.api.proto.Service.LogBatch.ResponseOrBuilder {
-        public static final com.google.protobuf.Descriptors.Descriptor
-            getDescriptor() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_descriptor;
-        }
-
-        @java.lang.Override
-        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-            internalGetFieldAccessorTable() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_fieldAccessorTable
-              .ensureFieldAccessorsInitialized(
-                  org.mlflow.api.proto.Service.LogBatch.Response.class, org.mlflow.api.proto.Service.LogBatch.Response.Builder.class);
-        }
-
-        // Construct using org.mlflow.api.proto.Service.LogBatch.Response.newBuilder()
-        private Builder() {
-          maybeForceBuilderInitialization();
-        }
-
-        private Builder(
-            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-          super(parent);
-          maybeForceBuilderInitialization();
-        }
-        private void maybeForceBuilderInitialization() {
-          if (com.google.protobuf.GeneratedMessageV3
-                  .alwaysUseFieldBuilders) {
-          }
-        }
-        @java.lang.Override
-        public Builder clear() {
-          super.clear();
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.LogBatch) {
+          return mergeFrom((org.mlflow.api.proto.Service.LogBatch)other);
+        } else {
+          super.mergeFrom(other);
           return this;
         }
+      }
 
-        @java.lang.Override
-        public com.google.protobuf.Descriptors.Descriptor
-            getDescriptorForType() {
-          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_Response_descriptor;
-        }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.LogBatch.Response getDefaultInstanceForType() {
-          return org.mlflow.api.proto.Service.LogBatch.Response.getDefaultInstance();
+      public Builder mergeFrom(org.mlflow.api.proto.Service.LogBatch other) {
+        if (other == org.mlflow.api.proto.Service.LogBatch.getDefaultInstance()) return this;
+        if (other.hasRunId()) {
+          bitField0_ |= 0x00000001;
+          runId_ = other.runId_;
+          onChanged();
         }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.LogBatch.Response build() {
-          org.mlflow.api.proto.Service.LogBatch.Response result = buildPartial();
-          if (!result.isInitialized()) {
-            throw newUninitializedMessageException(result);
+        if (metricsBuilder_ == null) {
+          if (!other.metrics_.isEmpty()) {
+            if (metrics_.isEmpty()) {
+              metrics_ = other.metrics_;
+              bitField0_ = (bitField0_ & ~0x00000002);
+            } else {
+              ensureMetricsIsMutable();
+              metrics_.addAll(other.metrics_);
+            }
+            onChanged();
+          }
+        } else {
+          if (!other.metrics_.isEmpty()) {
+            if (metricsBuilder_.isEmpty()) {
+              metricsBuilder_.dispose();
+              metricsBuilder_ = null;
+              metrics_ = other.metrics_;
+              bitField0_ = (bitField0_ & ~0x00000002);
+              metricsBuilder_ = 
+                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                   getMetricsFieldBuilder() : null;
+            } else {
+              metricsBuilder_.addAllMessages(other.metrics_);
+            }
           }
-          return result;
-        }
-
-        @java.lang.Override
-        public org.mlflow.api.proto.Service.LogBatch.Response buildPartial() {
-          org.mlflow.api.proto.Service.LogBatch.Response result = new org.mlflow.api.proto.Service.LogBatch.Response(this);
-          onBuilt();
-          return result;
-        }
-
-        @java.lang.Override
-        public Builder clone() {
-          return super.clone();
-        }
-        @java.lang.Override
-        public Builder setField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.setField(field, value);
-        }
-        @java.lang.Override
-        public Builder clearField(
-            com.google.protobuf.Descriptors.FieldDescriptor field) {
-          return super.clearField(field);
-        }
-        @java.lang.Override
-        public Builder clearOneof(
-            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-          return super.clearOneof(oneof);
-        }
-        @java.lang.Override
-        public Builder setRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            int index, java.lang.Object value) {
-          return super.setRepeatedField(field, index, value);
         }
-        @java.lang.Override
-        public Builder addRepeatedField(
-            com.google.protobuf.Descriptors.FieldDescriptor field,
-            java.lang.Object value) {
-          return super.addRepeatedField(field, value);
+        if (paramsBuilder_ == null) {
+          if (!other.params_.isEmpty()) {
+            if (params_.isEmpty()) {
+              params_ = other.params_;
+              bitField0_ = (bitField0_ & ~0x00000004);
+            } else {
+              ensureParamsIsMutable();
+              params_.addAll(other.params_);
+            }
+            onChanged();
+          }
+        } else {
+          if (!other.params_.isEmpty()) {
+            if (paramsBuilder_.isEmpty()) {
+              paramsBuilder_.dispose();
+              paramsBuilder_ = null;
+              params_ = other.params_;
+              bitField0_ = (bitField0_ & ~0x00000004);
+              paramsBuilder_ = 
+                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                   getParamsFieldBuilder() : null;
+            } else {
+              paramsBuilder_.addAllMessages(other.params_);
+            }
+          }
         }
-        @java.lang.Override
-        public Builder mergeFrom(com.google.protobuf.Message other) {
-          if (other instanceof org.mlflow.api.proto.Service.LogBatch.Response) {
-            return mergeFrom((org.mlflow.api.proto.Service.LogBatch.Response)other);
-          } else {
-            super.mergeFrom(other);
-            return this;
+        if (tagsBuilder_ == null) {
+          if (!other.tags_.isEmpty()) {
+            if (tags_.isEmpty()) {
+              tags_ = other.tags_;
+              bitField0_ = (bitField0_ & ~0x00000008);
+            } else {
+              ensureTagsIsMutable();
+              tags_.addAll(other.tags_);
+            }
+            onChanged();
+          }
+        } else {
+          if (!other.tags_.isEmpty()) {
+            if (tagsBuilder_.isEmpty()) {
+              tagsBuilder_.dispose();
+              tagsBuilder_ = null;
+              tags_ = other.tags_;
+              bitField0_ = (bitField0_ & ~0x00000008);
+              tagsBuilder_ = 
+                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                   getTagsFieldBuilder() : null;
+            } else {
+              tagsBuilder_.addAllMessages(other.tags_);
+            }
           }
         }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
 
-        public Builder mergeFrom(org.mlflow.api.proto.Service.LogBatch.Response other) {
-          if (other == org.mlflow.api.proto.Service.LogBatch.Response.getDefaultInstance()) return this;
-          this.mergeUnknownFields(other.unknownFields);
-          onChanged();
-          return this;
-        }
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
 
-        @java.lang.Override
-        public final boolean isInitialized() {
-          return true;
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.LogBatch parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.LogBatch) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
         }
+        return this;
+      }
+      private int bitField0_;
 
-        @java.lang.Override
-        public Builder mergeFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws java.io.IOException {
-          org.mlflow.api.proto.Service.LogBatch.Response parsedMessage = null;
-          try {
-            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
-          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-            parsedMessage = (org.mlflow.api.proto.Service.LogBatch.Response) e.getUnfinishedMessage();
-            throw e.unwrapIOException();
-          } finally {
-            if (parsedMessage != null) {
-              mergeFrom(parsedMessage);
-            }
+      private java.lang.Object runId_ = "";
+      /**
+       * <pre>
+       * ID of the run to log under
+       * </pre>
+       *
+       * <code>optional string run_id = 1;</code>
+       * @return Whether the runId field is set.
+       */
+      public boolean hasRunId() {
+        return ((bitField0_ & 0x00000001) != 0);
+      }
+      /**
+       * <pre>
+       * ID of the run to log under
+       * </pre>
+       *
+       * <code>optional string run_id = 1;</code>
+       * @return The runId.
+       */
+      public java.lang.String getRunId() {
+        java.lang.Object ref = runId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            runId_ = s;
           }
-          return this;
+          return s;
+        } else {
+          return (java.lang.String) ref;
         }
-        @java.lang.Override
-        public final Builder setUnknownFields(
-            final com.google.protobuf.UnknownFieldSet unknownFields) {
-          return super.setUnknownFields(unknownFields);
+      }
+      /**
+       * <pre>
+       * ID of the run to log under
+       * </pre>
+       *
+       * <code>optional string run_id = 1;</code>
+       * @return The bytes for runId.
+       */
+      public com.google.protobuf.ByteString
+          getRunIdBytes() {
+        java.lang.Object ref = runId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          runId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
         }
+      }
+      /**
+       * <pre>
+       * ID of the run to log under
+       * </pre>
+       *
+       * <code>optional string run_id = 1;</code>
+       * @param value The runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the run to log under
+       * </pre>
+       *
+       * <code>optional string run_id = 1;</code>
+       * @return This builder for chaining.
+       */
+      public Builder clearRunId() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        runId_ = getDefaultInstance().getRunId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the run to log under
+       * </pre>
+       *
+       * <code>optional string run_id = 1;</code>
+       * @param value The bytes for runId to set.
+       * @return This builder for chaining.
+       */
+      public Builder setRunIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        runId_ = value;
+        onChanged();
+        return this;
+      }
 
-        @java.lang.Override
-        public final Builder mergeUnknownFields(
-            final com.google.protobuf.UnknownFieldSet unknownFields) {
-          return super.mergeUnknownFields(unknownFields);
-        }
+      private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_ =
+        java.util.Collections.emptyList();
+      private void ensureMetricsIsMutable() {
+        if (!((bitField0_ & 0x00000002) != 0)) {
+          metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>(metrics_);
+          bitField0_ |= 0x00000002;
+         }
+      }
 
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> metricsBuilder_;
 
-        // @@protoc_insertion_point(builder_scope:mlflow.LogBatch.Response)
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
+        if (metricsBuilder_ == null) {
+          return java.util.Collections.unmodifiableList(metrics_);
+        } else {
+          return metricsBuilder_.getMessageList();
+        }
       }
-
-      // @@protoc_insertion_point(class_scope:mlflow.LogBatch.Response)
-      private static final org.mlflow.api.proto.Service.LogBatch.Response DEFAULT_INSTANCE;
-      static {
-        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatch.Response();
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public int getMetricsCount() {
+        if (metricsBuilder_ == null) {
+          return metrics_.size();
+        } else {
+          return metricsBuilder_.getCount();
+        }
       }
-
-      public static org.mlflow.api.proto.Service.LogBatch.Response getDefaultInstance() {
-        return DEFAULT_INSTANCE;
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
+        if (metricsBuilder_ == null) {
+          return metrics_.get(index);
+        } else {
+          return metricsBuilder_.getMessage(index);
+        }
       }
-
-      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
-          PARSER = new com.google.protobuf.AbstractParser<Response>() {
-        @java.lang.Override
-        public Response parsePartialFrom(
-            com.google.protobuf.CodedInputStream input,
-            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-            throws com.google.protobuf.InvalidProtocolBufferException {
-          return new Response(input, extensionRegistry);
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder setMetrics(
+          int index, org.mlflow.api.proto.Service.Metric value) {
+        if (metricsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureMetricsIsMutable();
+          metrics_.set(index, value);
+          onChanged();
+        } else {
+          metricsBuilder_.setMessage(index, value);
         }
-      };
-
-      public static com.google.protobuf.Parser<Response> parser() {
-        return PARSER;
+        return this;
       }
-
-      @java.lang.Override
-      public com.google.protobuf.Parser<Response> getParserForType() {
-        return PARSER;
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder setMetrics(
+          int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+        if (metricsBuilder_ == null) {
+          ensureMetricsIsMutable();
+          metrics_.set(index, builderForValue.build());
+          onChanged();
+        } else {
+          metricsBuilder_.setMessage(index, builderForValue.build());
+        }
+        return this;
       }
-
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.LogBatch.Response getDefaultInstanceForType() {
-        return DEFAULT_INSTANCE;
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder addMetrics(org.mlflow.api.proto.Service.Metric value) {
+        if (metricsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureMetricsIsMutable();
+          metrics_.add(value);
+          onChanged();
+        } else {
+          metricsBuilder_.addMessage(value);
+        }
+        return this;
       }
-
-    }
-
-    private int bitField0_;
-    public static final int RUN_ID_FIELD_NUMBER = 1;
-    private volatile java.lang.Object runId_;
-    /**
-     * <pre>
-     * ID of the run to log under
-     * </pre>
-     *
-     * <code>optional string run_id = 1;</code>
-     * @return Whether the runId field is set.
-     */
-    @java.lang.Override
-    public boolean hasRunId() {
-      return ((bitField0_ & 0x00000001) != 0);
-    }
-    /**
-     * <pre>
-     * ID of the run to log under
-     * </pre>
-     *
-     * <code>optional string run_id = 1;</code>
-     * @return The runId.
-     */
-    @java.lang.Override
-    public java.lang.String getRunId() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        return (java.lang.String) ref;
-      } else {
-        com.google.protobuf.ByteString bs = 
-            (com.google.protobuf.ByteString) ref;
-        java.lang.String s = bs.toStringUtf8();
-        if (bs.isValidUtf8()) {
-          runId_ = s;
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder addMetrics(
+          int index, org.mlflow.api.proto.Service.Metric value) {
+        if (metricsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureMetricsIsMutable();
+          metrics_.add(index, value);
+          onChanged();
+        } else {
+          metricsBuilder_.addMessage(index, value);
         }
-        return s;
+        return this;
       }
-    }
-    /**
-     * <pre>
-     * ID of the run to log under
-     * </pre>
-     *
-     * <code>optional string run_id = 1;</code>
-     * @return The bytes for runId.
-     */
-    @java.lang.Override
-    public com.google.protobuf.ByteString
-        getRunIdBytes() {
-      java.lang.Object ref = runId_;
-      if (ref instanceof java.lang.String) {
-        com.google.protobuf.ByteString b = 
-            com.google.protobuf.ByteString.copyFromUtf8(
-                (java.lang.String) ref);
-        runId_ = b;
-        return b;
-      } else {
-        return (com.google.protobuf.ByteString) ref;
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder addMetrics(
+          org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+        if (metricsBuilder_ == null) {
+          ensureMetricsIsMutable();
+          metrics_.add(builderForValue.build());
+          onChanged();
+        } else {
+          metricsBuilder_.addMessage(builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder addMetrics(
+          int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+        if (metricsBuilder_ == null) {
+          ensureMetricsIsMutable();
+          metrics_.add(index, builderForValue.build());
+          onChanged();
+        } else {
+          metricsBuilder_.addMessage(index, builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder addAllMetrics(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.Metric> values) {
+        if (metricsBuilder_ == null) {
+          ensureMetricsIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, metrics_);
+          onChanged();
+        } else {
+          metricsBuilder_.addAllMessages(values);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder clearMetrics() {
+        if (metricsBuilder_ == null) {
+          metrics_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000002);
+          onChanged();
+        } else {
+          metricsBuilder_.clear();
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public Builder removeMetrics(int index) {
+        if (metricsBuilder_ == null) {
+          ensureMetricsIsMutable();
+          metrics_.remove(index);
+          onChanged();
+        } else {
+          metricsBuilder_.remove(index);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.Metric.Builder getMetricsBuilder(
+          int index) {
+        return getMetricsFieldBuilder().getBuilder(index);
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+          int index) {
+        if (metricsBuilder_ == null) {
+          return metrics_.get(index);  } else {
+          return metricsBuilder_.getMessageOrBuilder(index);
+        }
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+           getMetricsOrBuilderList() {
+        if (metricsBuilder_ != null) {
+          return metricsBuilder_.getMessageOrBuilderList();
+        } else {
+          return java.util.Collections.unmodifiableList(metrics_);
+        }
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder() {
+        return getMetricsFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder(
+          int index) {
+        return getMetricsFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Metric.Builder> 
+           getMetricsBuilderList() {
+        return getMetricsFieldBuilder().getBuilderList();
+      }
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> 
+          getMetricsFieldBuilder() {
+        if (metricsBuilder_ == null) {
+          metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder>(
+                  metrics_,
+                  ((bitField0_ & 0x00000002) != 0),
+                  getParentForChildren(),
+                  isClean());
+          metrics_ = null;
+        }
+        return metricsBuilder_;
       }
-    }
-
-    public static final int METRICS_FIELD_NUMBER = 2;
-    private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_;
-    /**
-     * <pre>
-     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Metric metrics = 2;</code>
-     */
-    @java.lang.Override
-    public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
-      return metrics_;
-    }
-    /**
-     * <pre>
-     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Metric metrics = 2;</code>
-     */
-    @java.lang.Override
-    public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
-        getMetricsOrBuilderList() {
-      return metrics_;
-    }
-    /**
-     * <pre>
-     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Metric metrics = 2;</code>
-     */
-    @java.lang.Override
-    public int getMetricsCount() {
-      return metrics_.size();
-    }
-    /**
-     * <pre>
-     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Metric metrics = 2;</code>
-     */
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
-      return metrics_.get(index);
-    }
-    /**
-     * <pre>
-     * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Metric metrics = 2;</code>
-     */
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
-        int index) {
-      return metrics_.get(index);
-    }
-
-    public static final int PARAMS_FIELD_NUMBER = 3;
-    private java.util.List<org.mlflow.api.proto.Service.Param> params_;
-    /**
-     * <pre>
-     * Params to log. A single request can contain up to 100 params, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Param params = 3;</code>
-     */
-    @java.lang.Override
-    public java.util.List<org.mlflow.api.proto.Service.Param> getParamsList() {
-      return params_;
-    }
-    /**
-     * <pre>
-     * Params to log. A single request can contain up to 100 params, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Param params = 3;</code>
-     */
-    @java.lang.Override
-    public java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
-        getParamsOrBuilderList() {
-      return params_;
-    }
-    /**
-     * <pre>
-     * Params to log. A single request can contain up to 100 params, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Param params = 3;</code>
-     */
-    @java.lang.Override
-    public int getParamsCount() {
-      return params_.size();
-    }
-    /**
-     * <pre>
-     * Params to log. A single request can contain up to 100 params, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Param params = 3;</code>
-     */
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.Param getParams(int index) {
-      return params_.get(index);
-    }
-    /**
-     * <pre>
-     * Params to log. A single request can contain up to 100 params, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.Param params = 3;</code>
-     */
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
-        int index) {
-      return params_.get(index);
-    }
-
-    public static final int TAGS_FIELD_NUMBER = 4;
-    private java.util.List<org.mlflow.api.proto.Service.RunTag> tags_;
-    /**
-     * <pre>
-     * Tags to log. A single request can contain up to 100 tags, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.RunTag tags = 4;</code>
-     */
-    @java.lang.Override
-    public java.util.List<org.mlflow.api.proto.Service.RunTag> getTagsList() {
-      return tags_;
-    }
-    /**
-     * <pre>
-     * Tags to log. A single request can contain up to 100 tags, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.RunTag tags = 4;</code>
-     */
-    @java.lang.Override
-    public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
-        getTagsOrBuilderList() {
-      return tags_;
-    }
-    /**
-     * <pre>
-     * Tags to log. A single request can contain up to 100 tags, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.RunTag tags = 4;</code>
-     */
-    @java.lang.Override
-    public int getTagsCount() {
-      return tags_.size();
-    }
-    /**
-     * <pre>
-     * Tags to log. A single request can contain up to 100 tags, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.RunTag tags = 4;</code>
-     */
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.RunTag getTags(int index) {
-      return tags_.get(index);
-    }
-    /**
-     * <pre>
-     * Tags to log. A single request can contain up to 100 tags, and up to 1000
-     * metrics, params, and tags in total.
-     * </pre>
-     *
-     * <code>repeated .mlflow.RunTag tags = 4;</code>
-     */
-    @java.lang.Override
-    public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
-        int index) {
-      return tags_.get(index);
-    }
 
-    private byte memoizedIsInitialized = -1;
-    @java.lang.Override
-    public final boolean isInitialized() {
-      byte isInitialized = memoizedIsInitialized;
-      if (isInitialized == 1) return true;
-      if (isInitialized == 0) return false;
+      private java.util.List<org.mlflow.api.proto.Service.Param> params_ =
+        java.util.Collections.emptyList();
+      private void ensureParamsIsMutable() {
+        if (!((bitField0_ & 0x00000004) != 0)) {
+          params_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Param>(params_);
+          bitField0_ |= 0x00000004;
+         }
+      }
 
-      memoizedIsInitialized = 1;
-      return true;
-    }
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder> paramsBuilder_;
 
-    @java.lang.Override
-    public void writeTo(com.google.protobuf.CodedOutputStream output)
-                        throws java.io.IOException {
-      if (((bitField0_ & 0x00000001) != 0)) {
-        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runId_);
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Param> getParamsList() {
+        if (paramsBuilder_ == null) {
+          return java.util.Collections.unmodifiableList(params_);
+        } else {
+          return paramsBuilder_.getMessageList();
+        }
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public int getParamsCount() {
+        if (paramsBuilder_ == null) {
+          return params_.size();
+        } else {
+          return paramsBuilder_.getCount();
+        }
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public org.mlflow.api.proto.Service.Param getParams(int index) {
+        if (paramsBuilder_ == null) {
+          return params_.get(index);
+        } else {
+          return paramsBuilder_.getMessage(index);
+        }
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder setParams(
+          int index, org.mlflow.api.proto.Service.Param value) {
+        if (paramsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureParamsIsMutable();
+          params_.set(index, value);
+          onChanged();
+        } else {
+          paramsBuilder_.setMessage(index, value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder setParams(
+          int index, org.mlflow.api.proto.Service.Param.Builder builderForValue) {
+        if (paramsBuilder_ == null) {
+          ensureParamsIsMutable();
+          params_.set(index, builderForValue.build());
+          onChanged();
+        } else {
+          paramsBuilder_.setMessage(index, builderForValue.build());
+        }
+        return this;
       }
-      for (int i = 0; i < metrics_.size(); i++) {
-        output.writeMessage(2, metrics_.get(i));
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder addParams(org.mlflow.api.proto.Service.Param value) {
+        if (paramsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureParamsIsMutable();
+          params_.add(value);
+          onChanged();
+        } else {
+          paramsBuilder_.addMessage(value);
+        }
+        return this;
       }
-      for (int i = 0; i < params_.size(); i++) {
-        output.writeMessage(3, params_.get(i));
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder addParams(
+          int index, org.mlflow.api.proto.Service.Param value) {
+        if (paramsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureParamsIsMutable();
+          params_.add(index, value);
+          onChanged();
+        } else {
+          paramsBuilder_.addMessage(index, value);
+        }
+        return this;
       }
-      for (int i = 0; i < tags_.size(); i++) {
-        output.writeMessage(4, tags_.get(i));
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder addParams(
+          org.mlflow.api.proto.Service.Param.Builder builderForValue) {
+        if (paramsBuilder_ == null) {
+          ensureParamsIsMutable();
+          params_.add(builderForValue.build());
+          onChanged();
+        } else {
+          paramsBuilder_.addMessage(builderForValue.build());
+        }
+        return this;
       }
-      unknownFields.writeTo(output);
-    }
-
-    @java.lang.Override
-    public int getSerializedSize() {
-      int size = memoizedSize;
-      if (size != -1) return size;
-
-      size = 0;
-      if (((bitField0_ & 0x00000001) != 0)) {
-        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, runId_);
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder addParams(
+          int index, org.mlflow.api.proto.Service.Param.Builder builderForValue) {
+        if (paramsBuilder_ == null) {
+          ensureParamsIsMutable();
+          params_.add(index, builderForValue.build());
+          onChanged();
+        } else {
+          paramsBuilder_.addMessage(index, builderForValue.build());
+        }
+        return this;
       }
-      for (int i = 0; i < metrics_.size(); i++) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeMessageSize(2, metrics_.get(i));
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder addAllParams(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.Param> values) {
+        if (paramsBuilder_ == null) {
+          ensureParamsIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, params_);
+          onChanged();
+        } else {
+          paramsBuilder_.addAllMessages(values);
+        }
+        return this;
       }
-      for (int i = 0; i < params_.size(); i++) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeMessageSize(3, params_.get(i));
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder clearParams() {
+        if (paramsBuilder_ == null) {
+          params_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000004);
+          onChanged();
+        } else {
+          paramsBuilder_.clear();
+        }
+        return this;
       }
-      for (int i = 0; i < tags_.size(); i++) {
-        size += com.google.protobuf.CodedOutputStream
-          .computeMessageSize(4, tags_.get(i));
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public Builder removeParams(int index) {
+        if (paramsBuilder_ == null) {
+          ensureParamsIsMutable();
+          params_.remove(index);
+          onChanged();
+        } else {
+          paramsBuilder_.remove(index);
+        }
+        return this;
       }
-      size += unknownFields.getSerializedSize();
-      memoizedSize = size;
-      return size;
-    }
-
-    @java.lang.Override
-    public boolean equals(final java.lang.Object obj) {
-      if (obj == this) {
-       return true;
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public org.mlflow.api.proto.Service.Param.Builder getParamsBuilder(
+          int index) {
+        return getParamsFieldBuilder().getBuilder(index);
       }
-      if (!(obj instanceof org.mlflow.api.proto.Service.LogBatch)) {
-        return super.equals(obj);
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
+          int index) {
+        if (paramsBuilder_ == null) {
+          return params_.get(index);  } else {
+          return paramsBuilder_.getMessageOrBuilder(index);
+        }
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
+           getParamsOrBuilderList() {
+        if (paramsBuilder_ != null) {
+          return paramsBuilder_.getMessageOrBuilderList();
+        } else {
+          return java.util.Collections.unmodifiableList(params_);
+        }
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public org.mlflow.api.proto.Service.Param.Builder addParamsBuilder() {
+        return getParamsFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.Param.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public org.mlflow.api.proto.Service.Param.Builder addParamsBuilder(
+          int index) {
+        return getParamsFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.Param.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Params to log. A single request can contain up to 100 params, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 3;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Param.Builder> 
+           getParamsBuilderList() {
+        return getParamsFieldBuilder().getBuilderList();
+      }
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder> 
+          getParamsFieldBuilder() {
+        if (paramsBuilder_ == null) {
+          paramsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder>(
+                  params_,
+                  ((bitField0_ & 0x00000004) != 0),
+                  getParentForChildren(),
+                  isClean());
+          params_ = null;
+        }
+        return paramsBuilder_;
       }
-      org.mlflow.api.proto.Service.LogBatch other = (org.mlflow.api.proto.Service.LogBatch) obj;
 
-      if (hasRunId() != other.hasRunId()) return false;
-      if (hasRunId()) {
-        if (!getRunId()
-            .equals(other.getRunId())) return false;
+      private java.util.List<org.mlflow.api.proto.Service.RunTag> tags_ =
+        java.util.Collections.emptyList();
+      private void ensureTagsIsMutable() {
+        if (!((bitField0_ & 0x00000008) != 0)) {
+          tags_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunTag>(tags_);
+          bitField0_ |= 0x00000008;
+         }
       }
-      if (!getMetricsList()
-          .equals(other.getMetricsList())) return false;
-      if (!getParamsList()
-          .equals(other.getParamsList())) return false;
-      if (!getTagsList()
-          .equals(other.getTagsList())) return false;
-      if (!unknownFields.equals(other.unknownFields)) return false;
-      return true;
-    }
 
-    @java.lang.Override
-    public int hashCode() {
-      if (memoizedHashCode != 0) {
-        return memoizedHashCode;
-      }
-      int hash = 41;
-      hash = (19 * hash) + getDescriptor().hashCode();
-      if (hasRunId()) {
-        hash = (37 * hash) + RUN_ID_FIELD_NUMBER;
-        hash = (53 * hash) + getRunId().hashCode();
-      }
-      if (getMetricsCount() > 0) {
-        hash = (37 * hash) + METRICS_FIELD_NUMBER;
-        hash = (53 * hash) + getMetricsList().hashCode();
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> tagsBuilder_;
+
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunTag> getTagsList() {
+        if (tagsBuilder_ == null) {
+          return java.util.Collections.unmodifiableList(tags_);
+        } else {
+          return tagsBuilder_.getMessageList();
+        }
       }
-      if (getParamsCount() > 0) {
-        hash = (37 * hash) + PARAMS_FIELD_NUMBER;
-        hash = (53 * hash) + getParamsList().hashCode();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public int getTagsCount() {
+        if (tagsBuilder_ == null) {
+          return tags_.size();
+        } else {
+          return tagsBuilder_.getCount();
+        }
       }
-      if (getTagsCount() > 0) {
-        hash = (37 * hash) + TAGS_FIELD_NUMBER;
-        hash = (53 * hash) + getTagsList().hashCode();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag getTags(int index) {
+        if (tagsBuilder_ == null) {
+          return tags_.get(index);
+        } else {
+          return tagsBuilder_.getMessage(index);
+        }
       }
-      hash = (29 * hash) + unknownFields.hashCode();
-      memoizedHashCode = hash;
-      return hash;
-    }
-
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        java.nio.ByteBuffer data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        java.nio.ByteBuffer data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        com.google.protobuf.ByteString data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        com.google.protobuf.ByteString data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(byte[] data)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        byte[] data,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws com.google.protobuf.InvalidProtocolBufferException {
-      return PARSER.parseFrom(data, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseDelimitedFrom(java.io.InputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseDelimitedFrom(
-        java.io.InputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        com.google.protobuf.CodedInputStream input)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input);
-    }
-    public static org.mlflow.api.proto.Service.LogBatch parseFrom(
-        com.google.protobuf.CodedInputStream input,
-        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-        throws java.io.IOException {
-      return com.google.protobuf.GeneratedMessageV3
-          .parseWithIOException(PARSER, input, extensionRegistry);
-    }
-
-    @java.lang.Override
-    public Builder newBuilderForType() { return newBuilder(); }
-    public static Builder newBuilder() {
-      return DEFAULT_INSTANCE.toBuilder();
-    }
-    public static Builder newBuilder(org.mlflow.api.proto.Service.LogBatch prototype) {
-      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
-    }
-    @java.lang.Override
-    public Builder toBuilder() {
-      return this == DEFAULT_INSTANCE
-          ? new Builder() : new Builder().mergeFrom(this);
-    }
-
-    @java.lang.Override
-    protected Builder newBuilderForType(
-        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-      Builder builder = new Builder(parent);
-      return builder;
-    }
-    /**
-     * Protobuf type {@code mlflow.LogBatch}
-     */
-    public static final class Builder extends
-        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
-        // @@protoc_insertion_point(builder_implements:mlflow.LogBatch)
-        org.mlflow.api.proto.Service.LogBatchOrBuilder {
-      public static final com.google.protobuf.Descriptors.Descriptor
-          getDescriptor() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_descriptor;
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder setTags(
+          int index, org.mlflow.api.proto.Service.RunTag value) {
+        if (tagsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureTagsIsMutable();
+          tags_.set(index, value);
+          onChanged();
+        } else {
+          tagsBuilder_.setMessage(index, value);
+        }
+        return this;
       }
-
-      @java.lang.Override
-      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
-          internalGetFieldAccessorTable() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_fieldAccessorTable
-            .ensureFieldAccessorsInitialized(
-                org.mlflow.api.proto.Service.LogBatch.class, org.mlflow.api.proto.Service.LogBatch.Builder.class);
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder setTags(
+          int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.set(index, builderForValue.build());
+          onChanged();
+        } else {
+          tagsBuilder_.setMessage(index, builderForValue.build());
+        }
+        return this;
       }
-
-      // Construct using org.mlflow.api.proto.Service.LogBatch.newBuilder()
-      private Builder() {
-        maybeForceBuilderInitialization();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(org.mlflow.api.proto.Service.RunTag value) {
+        if (tagsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureTagsIsMutable();
+          tags_.add(value);
+          onChanged();
+        } else {
+          tagsBuilder_.addMessage(value);
+        }
+        return this;
       }
-
-      private Builder(
-          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
-        super(parent);
-        maybeForceBuilderInitialization();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(
+          int index, org.mlflow.api.proto.Service.RunTag value) {
+        if (tagsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureTagsIsMutable();
+          tags_.add(index, value);
+          onChanged();
+        } else {
+          tagsBuilder_.addMessage(index, value);
+        }
+        return this;
       }
-      private void maybeForceBuilderInitialization() {
-        if (com.google.protobuf.GeneratedMessageV3
-                .alwaysUseFieldBuilders) {
-          getMetricsFieldBuilder();
-          getParamsFieldBuilder();
-          getTagsFieldBuilder();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(
+          org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.add(builderForValue.build());
+          onChanged();
+        } else {
+          tagsBuilder_.addMessage(builderForValue.build());
         }
+        return this;
       }
-      @java.lang.Override
-      public Builder clear() {
-        super.clear();
-        runId_ = "";
-        bitField0_ = (bitField0_ & ~0x00000001);
-        if (metricsBuilder_ == null) {
-          metrics_ = java.util.Collections.emptyList();
-          bitField0_ = (bitField0_ & ~0x00000002);
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(
+          int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.add(index, builderForValue.build());
+          onChanged();
         } else {
-          metricsBuilder_.clear();
+          tagsBuilder_.addMessage(index, builderForValue.build());
         }
-        if (paramsBuilder_ == null) {
-          params_ = java.util.Collections.emptyList();
-          bitField0_ = (bitField0_ & ~0x00000004);
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addAllTags(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunTag> values) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, tags_);
+          onChanged();
         } else {
-          paramsBuilder_.clear();
+          tagsBuilder_.addAllMessages(values);
         }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder clearTags() {
         if (tagsBuilder_ == null) {
           tags_ = java.util.Collections.emptyList();
           bitField0_ = (bitField0_ & ~0x00000008);
+          onChanged();
         } else {
           tagsBuilder_.clear();
         }
         return this;
       }
-
-      @java.lang.Override
-      public com.google.protobuf.Descriptors.Descriptor
-          getDescriptorForType() {
-        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatch_descriptor;
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder removeTags(int index) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.remove(index);
+          onChanged();
+        } else {
+          tagsBuilder_.remove(index);
+        }
+        return this;
       }
-
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.LogBatch getDefaultInstanceForType() {
-        return org.mlflow.api.proto.Service.LogBatch.getDefaultInstance();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag.Builder getTagsBuilder(
+          int index) {
+        return getTagsFieldBuilder().getBuilder(index);
       }
-
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.LogBatch build() {
-        org.mlflow.api.proto.Service.LogBatch result = buildPartial();
-        if (!result.isInitialized()) {
-          throw newUninitializedMessageException(result);
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+          int index) {
+        if (tagsBuilder_ == null) {
+          return tags_.get(index);  } else {
+          return tagsBuilder_.getMessageOrBuilder(index);
         }
-        return result;
       }
-
-      @java.lang.Override
-      public org.mlflow.api.proto.Service.LogBatch buildPartial() {
-        org.mlflow.api.proto.Service.LogBatch result = new org.mlflow.api.proto.Service.LogBatch(this);
-        int from_bitField0_ = bitField0_;
-        int to_bitField0_ = 0;
-        if (((from_bitField0_ & 0x00000001) != 0)) {
-          to_bitField0_ |= 0x00000001;
-        }
-        result.runId_ = runId_;
-        if (metricsBuilder_ == null) {
-          if (((bitField0_ & 0x00000002) != 0)) {
-            metrics_ = java.util.Collections.unmodifiableList(metrics_);
-            bitField0_ = (bitField0_ & ~0x00000002);
-          }
-          result.metrics_ = metrics_;
-        } else {
-          result.metrics_ = metricsBuilder_.build();
-        }
-        if (paramsBuilder_ == null) {
-          if (((bitField0_ & 0x00000004) != 0)) {
-            params_ = java.util.Collections.unmodifiableList(params_);
-            bitField0_ = (bitField0_ & ~0x00000004);
-          }
-          result.params_ = params_;
-        } else {
-          result.params_ = paramsBuilder_.build();
-        }
-        if (tagsBuilder_ == null) {
-          if (((bitField0_ & 0x00000008) != 0)) {
-            tags_ = java.util.Collections.unmodifiableList(tags_);
-            bitField0_ = (bitField0_ & ~0x00000008);
-          }
-          result.tags_ = tags_;
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+           getTagsOrBuilderList() {
+        if (tagsBuilder_ != null) {
+          return tagsBuilder_.getMessageOrBuilderList();
         } else {
-          result.tags_ = tagsBuilder_.build();
+          return java.util.Collections.unmodifiableList(tags_);
         }
-        result.bitField0_ = to_bitField0_;
-        onBuilt();
-        return result;
       }
-
-      @java.lang.Override
-      public Builder clone() {
-        return super.clone();
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder() {
+        return getTagsFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
       }
-      @java.lang.Override
-      public Builder setField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.setField(field, value);
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder(
+          int index) {
+        return getTagsFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
       }
-      @java.lang.Override
-      public Builder clearField(
-          com.google.protobuf.Descriptors.FieldDescriptor field) {
-        return super.clearField(field);
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunTag.Builder> 
+           getTagsBuilderList() {
+        return getTagsFieldBuilder().getBuilderList();
       }
-      @java.lang.Override
-      public Builder clearOneof(
-          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
-        return super.clearOneof(oneof);
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> 
+          getTagsFieldBuilder() {
+        if (tagsBuilder_ == null) {
+          tagsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder>(
+                  tags_,
+                  ((bitField0_ & 0x00000008) != 0),
+                  getParentForChildren(),
+                  isClean());
+          tags_ = null;
+        }
+        return tagsBuilder_;
       }
       @java.lang.Override
-      public Builder setRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          int index, java.lang.Object value) {
-        return super.setRepeatedField(field, index, value);
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
       }
+
       @java.lang.Override
-      public Builder addRepeatedField(
-          com.google.protobuf.Descriptors.FieldDescriptor field,
-          java.lang.Object value) {
-        return super.addRepeatedField(field, value);
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
       }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.LogBatch)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.LogBatch)
+    private static final org.mlflow.api.proto.Service.LogBatch DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatch();
+    }
+
+    public static org.mlflow.api.proto.Service.LogBatch getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<LogBatch>
+        PARSER = new com.google.protobuf.AbstractParser<LogBatch>() {
       @java.lang.Override
-      public Builder mergeFrom(com.google.protobuf.Message other) {
-        if (other instanceof org.mlflow.api.proto.Service.LogBatch) {
-          return mergeFrom((org.mlflow.api.proto.Service.LogBatch)other);
-        } else {
-          super.mergeFrom(other);
-          return this;
-        }
+      public LogBatch parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new LogBatch(input, extensionRegistry);
       }
+    };
 
-      public Builder mergeFrom(org.mlflow.api.proto.Service.LogBatch other) {
-        if (other == org.mlflow.api.proto.Service.LogBatch.getDefaultInstance()) return this;
-        if (other.hasRunId()) {
-          bitField0_ |= 0x00000001;
-          runId_ = other.runId_;
-          onChanged();
-        }
-        if (metricsBuilder_ == null) {
-          if (!other.metrics_.isEmpty()) {
-            if (metrics_.isEmpty()) {
-              metrics_ = other.metrics_;
-              bitField0_ = (bitField0_ & ~0x00000002);
-            } else {
-              ensureMetricsIsMutable();
-              metrics_.addAll(other.metrics_);
-            }
-            onChanged();
-          }
-        } else {
-          if (!other.metrics_.isEmpty()) {
-            if (metricsBuilder_.isEmpty()) {
-              metricsBuilder_.dispose();
-              metricsBuilder_ = null;
-              metrics_ = other.metrics_;
-              bitField0_ = (bitField0_ & ~0x00000002);
-              metricsBuilder_ = 
-                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                   getMetricsFieldBuilder() : null;
-            } else {
-              metricsBuilder_.addAllMessages(other.metrics_);
-            }
-          }
-        }
-        if (paramsBuilder_ == null) {
-          if (!other.params_.isEmpty()) {
-            if (params_.isEmpty()) {
-              params_ = other.params_;
-              bitField0_ = (bitField0_ & ~0x00000004);
-            } else {
-              ensureParamsIsMutable();
-              params_.addAll(other.params_);
-            }
-            onChanged();
-          }
-        } else {
-          if (!other.params_.isEmpty()) {
-            if (paramsBuilder_.isEmpty()) {
-              paramsBuilder_.dispose();
-              paramsBuilder_ = null;
-              params_ = other.params_;
-              bitField0_ = (bitField0_ & ~0x00000004);
-              paramsBuilder_ = 
-                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                   getParamsFieldBuilder() : null;
-            } else {
-              paramsBuilder_.addAllMessages(other.params_);
-            }
-          }
-        }
-        if (tagsBuilder_ == null) {
-          if (!other.tags_.isEmpty()) {
-            if (tags_.isEmpty()) {
-              tags_ = other.tags_;
-              bitField0_ = (bitField0_ & ~0x00000008);
-            } else {
-              ensureTagsIsMutable();
-              tags_.addAll(other.tags_);
+    public static com.google.protobuf.Parser<LogBatch> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<LogBatch> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.LogBatch getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface LogBatchesOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.LogBatches)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    java.util.List<org.mlflow.api.proto.Service.LogBatch> 
+        getBatchesList();
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    org.mlflow.api.proto.Service.LogBatch getBatches(int index);
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    int getBatchesCount();
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    java.util.List<? extends org.mlflow.api.proto.Service.LogBatchOrBuilder> 
+        getBatchesOrBuilderList();
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    org.mlflow.api.proto.Service.LogBatchOrBuilder getBatchesOrBuilder(
+        int index);
+  }
+  /**
+   * Protobuf type {@code mlflow.LogBatches}
+   */
+  public static final class LogBatches extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.LogBatches)
+      LogBatchesOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use LogBatches.newBuilder() to construct.
+    private LogBatches(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private LogBatches() {
+      batches_ = java.util.Collections.emptyList();
+    }
+
+    @java.lang.Override
+    @SuppressWarnings({"unused"})
+    protected java.lang.Object newInstance(
+        UnusedPrivateParameter unused) {
+      return new LogBatches();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private LogBatches(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              if (!((mutable_bitField0_ & 0x00000001) != 0)) {
+                batches_ = new java.util.ArrayList<org.mlflow.api.proto.Service.LogBatch>();
+                mutable_bitField0_ |= 0x00000001;
+              }
+              batches_.add(
+                  input.readMessage(org.mlflow.api.proto.Service.LogBatch.PARSER, extensionRegistry));
+              break;
             }
-            onChanged();
-          }
-        } else {
-          if (!other.tags_.isEmpty()) {
-            if (tagsBuilder_.isEmpty()) {
-              tagsBuilder_.dispose();
-              tagsBuilder_ = null;
-              tags_ = other.tags_;
-              bitField0_ = (bitField0_ & ~0x00000008);
-              tagsBuilder_ = 
-                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
-                   getTagsFieldBuilder() : null;
-            } else {
-              tagsBuilder_.addAllMessages(other.tags_);
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
             }
           }
         }
-        this.mergeUnknownFields(other.unknownFields);
-        onChanged();
-        return this;
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000001) != 0)) {
+          batches_ = java.util.Collections.unmodifiableList(batches_);
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.LogBatches.class, org.mlflow.api.proto.Service.LogBatches.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.LogBatches.Response)
+        com.google.protobuf.MessageOrBuilder {
+    }
+    /**
+     * Protobuf type {@code mlflow.LogBatches.Response}
+     */
+    public static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.LogBatches.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
       }
 
       @java.lang.Override
-      public final boolean isInitialized() {
-        return true;
+      @SuppressWarnings({"unused"})
+      protected java.lang.Object newInstance(
+          UnusedPrivateParameter unused) {
+        return new Response();
       }
 
       @java.lang.Override
-      public Builder mergeFrom(
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
-          throws java.io.IOException {
-        org.mlflow.api.proto.Service.LogBatch parsedMessage = null;
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
         try {
-          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
         } catch (com.google.protobuf.InvalidProtocolBufferException e) {
-          parsedMessage = (org.mlflow.api.proto.Service.LogBatch) e.getUnfinishedMessage();
-          throw e.unwrapIOException();
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
         } finally {
-          if (parsedMessage != null) {
-            mergeFrom(parsedMessage);
-          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
         }
-        return this;
       }
-      private int bitField0_;
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_Response_descriptor;
+      }
 
-      private java.lang.Object runId_ = "";
-      /**
-       * <pre>
-       * ID of the run to log under
-       * </pre>
-       *
-       * <code>optional string run_id = 1;</code>
-       * @return Whether the runId field is set.
-       */
-      public boolean hasRunId() {
-        return ((bitField0_ & 0x00000001) != 0);
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.LogBatches.Response.class, org.mlflow.api.proto.Service.LogBatches.Response.Builder.class);
       }
-      /**
-       * <pre>
-       * ID of the run to log under
-       * </pre>
-       *
-       * <code>optional string run_id = 1;</code>
-       * @return The runId.
-       */
-      public java.lang.String getRunId() {
-        java.lang.Object ref = runId_;
-        if (!(ref instanceof java.lang.String)) {
-          com.google.protobuf.ByteString bs =
-              (com.google.protobuf.ByteString) ref;
-          java.lang.String s = bs.toStringUtf8();
-          if (bs.isValidUtf8()) {
-            runId_ = s;
-          }
-          return s;
-        } else {
-          return (java.lang.String) ref;
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.LogBatches.Response)) {
+          return super.equals(obj);
         }
+        org.mlflow.api.proto.Service.LogBatches.Response other = (org.mlflow.api.proto.Service.LogBatches.Response) obj;
+
+        if (!unknownFields.equals(other.unknownFields)) return false;
+        return true;
       }
-      /**
-       * <pre>
-       * ID of the run to log under
-       * </pre>
-       *
-       * <code>optional string run_id = 1;</code>
-       * @return The bytes for runId.
-       */
-      public com.google.protobuf.ByteString
-          getRunIdBytes() {
-        java.lang.Object ref = runId_;
-        if (ref instanceof String) {
-          com.google.protobuf.ByteString b = 
-              com.google.protobuf.ByteString.copyFromUtf8(
-                  (java.lang.String) ref);
-          runId_ = b;
-          return b;
-        } else {
-          return (com.google.protobuf.ByteString) ref;
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
         }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
       }
-      /**
-       * <pre>
-       * ID of the run to log under
-       * </pre>
-       *
-       * <code>optional string run_id = 1;</code>
-       * @param value The runId to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunId(
-          java.lang.String value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
-        onChanged();
-        return this;
+
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
       }
-      /**
-       * <pre>
-       * ID of the run to log under
-       * </pre>
-       *
-       * <code>optional string run_id = 1;</code>
-       * @return This builder for chaining.
-       */
-      public Builder clearRunId() {
-        bitField0_ = (bitField0_ & ~0x00000001);
-        runId_ = getDefaultInstance().getRunId();
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
       }
-      /**
-       * <pre>
-       * ID of the run to log under
-       * </pre>
-       *
-       * <code>optional string run_id = 1;</code>
-       * @param value The bytes for runId to set.
-       * @return This builder for chaining.
-       */
-      public Builder setRunIdBytes(
-          com.google.protobuf.ByteString value) {
-        if (value == null) {
-    throw new NullPointerException();
-  }
-  bitField0_ |= 0x00000001;
-        runId_ = value;
-        onChanged();
-        return this;
+      public static org.mlflow.api.proto.Service.LogBatches.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
       }
 
-      private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_ =
-        java.util.Collections.emptyList();
-      private void ensureMetricsIsMutable() {
-        if (!((bitField0_ & 0x00000002) != 0)) {
-          metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>(metrics_);
-          bitField0_ |= 0x00000002;
-         }
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.LogBatches.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
       }
 
-      private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> metricsBuilder_;
-
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
-        if (metricsBuilder_ == null) {
-          return java.util.Collections.unmodifiableList(metrics_);
-        } else {
-          return metricsBuilder_.getMessageList();
-        }
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
       }
       /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
+       * Protobuf type {@code mlflow.LogBatches.Response}
        */
-      public int getMetricsCount() {
-        if (metricsBuilder_ == null) {
-          return metrics_.size();
-        } else {
-          return metricsBuilder_.getCount();
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.LogBatches.Response)
+          org.mlflow.api.proto.Service.LogBatches.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_Response_descriptor;
         }
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
-        if (metricsBuilder_ == null) {
-          return metrics_.get(index);
-        } else {
-          return metricsBuilder_.getMessage(index);
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.LogBatches.Response.class, org.mlflow.api.proto.Service.LogBatches.Response.Builder.class);
         }
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder setMetrics(
-          int index, org.mlflow.api.proto.Service.Metric value) {
-        if (metricsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
+
+        // Construct using org.mlflow.api.proto.Service.LogBatches.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
           }
-          ensureMetricsIsMutable();
-          metrics_.set(index, value);
-          onChanged();
-        } else {
-          metricsBuilder_.setMessage(index, value);
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder setMetrics(
-          int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
-        if (metricsBuilder_ == null) {
-          ensureMetricsIsMutable();
-          metrics_.set(index, builderForValue.build());
-          onChanged();
-        } else {
-          metricsBuilder_.setMessage(index, builderForValue.build());
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          return this;
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder addMetrics(org.mlflow.api.proto.Service.Metric value) {
-        if (metricsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.LogBatches.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.LogBatches.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.LogBatches.Response build() {
+          org.mlflow.api.proto.Service.LogBatches.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
           }
-          ensureMetricsIsMutable();
-          metrics_.add(value);
-          onChanged();
-        } else {
-          metricsBuilder_.addMessage(value);
+          return result;
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder addMetrics(
-          int index, org.mlflow.api.proto.Service.Metric value) {
-        if (metricsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.LogBatches.Response buildPartial() {
+          org.mlflow.api.proto.Service.LogBatches.Response result = new org.mlflow.api.proto.Service.LogBatches.Response(this);
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.LogBatches.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.LogBatches.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
           }
-          ensureMetricsIsMutable();
-          metrics_.add(index, value);
-          onChanged();
-        } else {
-          metricsBuilder_.addMessage(index, value);
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder addMetrics(
-          org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
-        if (metricsBuilder_ == null) {
-          ensureMetricsIsMutable();
-          metrics_.add(builderForValue.build());
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.LogBatches.Response other) {
+          if (other == org.mlflow.api.proto.Service.LogBatches.Response.getDefaultInstance()) return this;
+          this.mergeUnknownFields(other.unknownFields);
           onChanged();
-        } else {
-          metricsBuilder_.addMessage(builderForValue.build());
+          return this;
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder addMetrics(
-          int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
-        if (metricsBuilder_ == null) {
-          ensureMetricsIsMutable();
-          metrics_.add(index, builderForValue.build());
-          onChanged();
-        } else {
-          metricsBuilder_.addMessage(index, builderForValue.build());
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder addAllMetrics(
-          java.lang.Iterable<? extends org.mlflow.api.proto.Service.Metric> values) {
-        if (metricsBuilder_ == null) {
-          ensureMetricsIsMutable();
-          com.google.protobuf.AbstractMessageLite.Builder.addAll(
-              values, metrics_);
-          onChanged();
-        } else {
-          metricsBuilder_.addAllMessages(values);
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.LogBatches.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.LogBatches.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder clearMetrics() {
-        if (metricsBuilder_ == null) {
-          metrics_ = java.util.Collections.emptyList();
-          bitField0_ = (bitField0_ & ~0x00000002);
-          onChanged();
-        } else {
-          metricsBuilder_.clear();
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
         }
-        return this;
-      }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public Builder removeMetrics(int index) {
-        if (metricsBuilder_ == null) {
-          ensureMetricsIsMutable();
-          metrics_.remove(index);
-          onChanged();
-        } else {
-          metricsBuilder_.remove(index);
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
         }
-        return this;
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.LogBatches.Response)
       }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public org.mlflow.api.proto.Service.Metric.Builder getMetricsBuilder(
-          int index) {
-        return getMetricsFieldBuilder().getBuilder(index);
+
+      // @@protoc_insertion_point(class_scope:mlflow.LogBatches.Response)
+      private static final org.mlflow.api.proto.Service.LogBatches.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatches.Response();
       }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
-          int index) {
-        if (metricsBuilder_ == null) {
-          return metrics_.get(index);  } else {
-          return metricsBuilder_.getMessageOrBuilder(index);
-        }
+
+      public static org.mlflow.api.proto.Service.LogBatches.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
       }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
-           getMetricsOrBuilderList() {
-        if (metricsBuilder_ != null) {
-          return metricsBuilder_.getMessageOrBuilderList();
-        } else {
-          return java.util.Collections.unmodifiableList(metrics_);
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
         }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
       }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder() {
-        return getMetricsFieldBuilder().addBuilder(
-            org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
       }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder(
-          int index) {
-        return getMetricsFieldBuilder().addBuilder(
-            index, org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.LogBatches.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
       }
-      /**
-       * <pre>
-       * Metrics to log. A single request can contain up to 1000 metrics, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Metric metrics = 2;</code>
-       */
-      public java.util.List<org.mlflow.api.proto.Service.Metric.Builder> 
-           getMetricsBuilderList() {
-        return getMetricsFieldBuilder().getBuilderList();
+
+    }
+
+    public static final int BATCHES_FIELD_NUMBER = 1;
+    private java.util.List<org.mlflow.api.proto.Service.LogBatch> batches_;
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    @java.lang.Override
+    public java.util.List<org.mlflow.api.proto.Service.LogBatch> getBatchesList() {
+      return batches_;
+    }
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    @java.lang.Override
+    public java.util.List<? extends org.mlflow.api.proto.Service.LogBatchOrBuilder> 
+        getBatchesOrBuilderList() {
+      return batches_;
+    }
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    @java.lang.Override
+    public int getBatchesCount() {
+      return batches_.size();
+    }
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.LogBatch getBatches(int index) {
+      return batches_.get(index);
+    }
+    /**
+     * <pre>
+     * Batches to log, each of them with the ID of the run to log under.
+     * </pre>
+     *
+     * <code>repeated .mlflow.LogBatch batches = 1;</code>
+     */
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.LogBatchOrBuilder getBatchesOrBuilder(
+        int index) {
+      return batches_.get(index);
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < batches_.size(); i++) {
+        output.writeMessage(1, batches_.get(i));
       }
-      private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> 
-          getMetricsFieldBuilder() {
-        if (metricsBuilder_ == null) {
-          metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-              org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder>(
-                  metrics_,
-                  ((bitField0_ & 0x00000002) != 0),
-                  getParentForChildren(),
-                  isClean());
-          metrics_ = null;
-        }
-        return metricsBuilder_;
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      for (int i = 0; i < batches_.size(); i++) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(1, batches_.get(i));
       }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
 
-      private java.util.List<org.mlflow.api.proto.Service.Param> params_ =
-        java.util.Collections.emptyList();
-      private void ensureParamsIsMutable() {
-        if (!((bitField0_ & 0x00000004) != 0)) {
-          params_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Param>(params_);
-          bitField0_ |= 0x00000004;
-         }
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.LogBatches)) {
+        return super.equals(obj);
       }
+      org.mlflow.api.proto.Service.LogBatches other = (org.mlflow.api.proto.Service.LogBatches) obj;
 
-      private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder> paramsBuilder_;
+      if (!getBatchesList()
+          .equals(other.getBatchesList())) return false;
+      if (!unknownFields.equals(other.unknownFields)) return false;
+      return true;
+    }
 
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public java.util.List<org.mlflow.api.proto.Service.Param> getParamsList() {
-        if (paramsBuilder_ == null) {
-          return java.util.Collections.unmodifiableList(params_);
-        } else {
-          return paramsBuilder_.getMessageList();
-        }
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public int getParamsCount() {
-        if (paramsBuilder_ == null) {
-          return params_.size();
-        } else {
-          return paramsBuilder_.getCount();
-        }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getBatchesCount() > 0) {
+        hash = (37 * hash) + BATCHES_FIELD_NUMBER;
+        hash = (53 * hash) + getBatchesList().hashCode();
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public org.mlflow.api.proto.Service.Param getParams(int index) {
-        if (paramsBuilder_ == null) {
-          return params_.get(index);
-        } else {
-          return paramsBuilder_.getMessage(index);
-        }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.LogBatches parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.LogBatches prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.LogBatches}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.LogBatches)
+        org.mlflow.api.proto.Service.LogBatchesOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_descriptor;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder setParams(
-          int index, org.mlflow.api.proto.Service.Param value) {
-        if (paramsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
-          }
-          ensureParamsIsMutable();
-          params_.set(index, value);
-          onChanged();
-        } else {
-          paramsBuilder_.setMessage(index, value);
-        }
-        return this;
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.LogBatches.class, org.mlflow.api.proto.Service.LogBatches.Builder.class);
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder setParams(
-          int index, org.mlflow.api.proto.Service.Param.Builder builderForValue) {
-        if (paramsBuilder_ == null) {
-          ensureParamsIsMutable();
-          params_.set(index, builderForValue.build());
-          onChanged();
-        } else {
-          paramsBuilder_.setMessage(index, builderForValue.build());
-        }
-        return this;
+
+      // Construct using org.mlflow.api.proto.Service.LogBatches.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder addParams(org.mlflow.api.proto.Service.Param value) {
-        if (paramsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
-          }
-          ensureParamsIsMutable();
-          params_.add(value);
-          onChanged();
-        } else {
-          paramsBuilder_.addMessage(value);
-        }
-        return this;
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder addParams(
-          int index, org.mlflow.api.proto.Service.Param value) {
-        if (paramsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
-          }
-          ensureParamsIsMutable();
-          params_.add(index, value);
-          onChanged();
-        } else {
-          paramsBuilder_.addMessage(index, value);
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+          getBatchesFieldBuilder();
         }
-        return this;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder addParams(
-          org.mlflow.api.proto.Service.Param.Builder builderForValue) {
-        if (paramsBuilder_ == null) {
-          ensureParamsIsMutable();
-          params_.add(builderForValue.build());
-          onChanged();
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        if (batchesBuilder_ == null) {
+          batches_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000001);
         } else {
-          paramsBuilder_.addMessage(builderForValue.build());
+          batchesBuilder_.clear();
         }
         return this;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder addParams(
-          int index, org.mlflow.api.proto.Service.Param.Builder builderForValue) {
-        if (paramsBuilder_ == null) {
-          ensureParamsIsMutable();
-          params_.add(index, builderForValue.build());
-          onChanged();
-        } else {
-          paramsBuilder_.addMessage(index, builderForValue.build());
-        }
-        return this;
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_LogBatches_descriptor;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder addAllParams(
-          java.lang.Iterable<? extends org.mlflow.api.proto.Service.Param> values) {
-        if (paramsBuilder_ == null) {
-          ensureParamsIsMutable();
-          com.google.protobuf.AbstractMessageLite.Builder.addAll(
-              values, params_);
-          onChanged();
-        } else {
-          paramsBuilder_.addAllMessages(values);
-        }
-        return this;
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.LogBatches getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.LogBatches.getDefaultInstance();
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder clearParams() {
-        if (paramsBuilder_ == null) {
-          params_ = java.util.Collections.emptyList();
-          bitField0_ = (bitField0_ & ~0x00000004);
-          onChanged();
-        } else {
-          paramsBuilder_.clear();
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.LogBatches build() {
+        org.mlflow.api.proto.Service.LogBatches result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
         }
-        return this;
+        return result;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public Builder removeParams(int index) {
-        if (paramsBuilder_ == null) {
-          ensureParamsIsMutable();
-          params_.remove(index);
-          onChanged();
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.LogBatches buildPartial() {
+        org.mlflow.api.proto.Service.LogBatches result = new org.mlflow.api.proto.Service.LogBatches(this);
+        int from_bitField0_ = bitField0_;
+        if (batchesBuilder_ == null) {
+          if (((bitField0_ & 0x00000001) != 0)) {
+            batches_ = java.util.Collections.unmodifiableList(batches_);
+            bitField0_ = (bitField0_ & ~0x00000001);
+          }
+          result.batches_ = batches_;
         } else {
-          paramsBuilder_.remove(index);
+          result.batches_ = batchesBuilder_.build();
         }
-        return this;
+        onBuilt();
+        return result;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public org.mlflow.api.proto.Service.Param.Builder getParamsBuilder(
-          int index) {
-        return getParamsFieldBuilder().getBuilder(index);
+
+      @java.lang.Override
+      public Builder clone() {
+        return super.clone();
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
-          int index) {
-        if (paramsBuilder_ == null) {
-          return params_.get(index);  } else {
-          return paramsBuilder_.getMessageOrBuilder(index);
-        }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.setField(field, value);
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
-           getParamsOrBuilderList() {
-        if (paramsBuilder_ != null) {
-          return paramsBuilder_.getMessageOrBuilderList();
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.LogBatches) {
+          return mergeFrom((org.mlflow.api.proto.Service.LogBatches)other);
         } else {
-          return java.util.Collections.unmodifiableList(params_);
+          super.mergeFrom(other);
+          return this;
         }
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public org.mlflow.api.proto.Service.Param.Builder addParamsBuilder() {
-        return getParamsFieldBuilder().addBuilder(
-            org.mlflow.api.proto.Service.Param.getDefaultInstance());
-      }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public org.mlflow.api.proto.Service.Param.Builder addParamsBuilder(
-          int index) {
-        return getParamsFieldBuilder().addBuilder(
-            index, org.mlflow.api.proto.Service.Param.getDefaultInstance());
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.LogBatches other) {
+        if (other == org.mlflow.api.proto.Service.LogBatches.getDefaultInstance()) return this;
+        if (batchesBuilder_ == null) {
+          if (!other.batches_.isEmpty()) {
+            if (batches_.isEmpty()) {
+              batches_ = other.batches_;
+              bitField0_ = (bitField0_ & ~0x00000001);
+            } else {
+              ensureBatchesIsMutable();
+              batches_.addAll(other.batches_);
+            }
+            onChanged();
+          }
+        } else {
+          if (!other.batches_.isEmpty()) {
+            if (batchesBuilder_.isEmpty()) {
+              batchesBuilder_.dispose();
+              batchesBuilder_ = null;
+              batches_ = other.batches_;
+              bitField0_ = (bitField0_ & ~0x00000001);
+              batchesBuilder_ = 
+                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                   getBatchesFieldBuilder() : null;
+            } else {
+              batchesBuilder_.addAllMessages(other.batches_);
+            }
+          }
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
       }
-      /**
-       * <pre>
-       * Params to log. A single request can contain up to 100 params, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.Param params = 3;</code>
-       */
-      public java.util.List<org.mlflow.api.proto.Service.Param.Builder> 
-           getParamsBuilderList() {
-        return getParamsFieldBuilder().getBuilderList();
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
       }
-      private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder> 
-          getParamsFieldBuilder() {
-        if (paramsBuilder_ == null) {
-          paramsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-              org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder>(
-                  params_,
-                  ((bitField0_ & 0x00000004) != 0),
-                  getParentForChildren(),
-                  isClean());
-          params_ = null;
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.LogBatches parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.LogBatches) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
         }
-        return paramsBuilder_;
+        return this;
       }
+      private int bitField0_;
 
-      private java.util.List<org.mlflow.api.proto.Service.RunTag> tags_ =
+      private java.util.List<org.mlflow.api.proto.Service.LogBatch> batches_ =
         java.util.Collections.emptyList();
-      private void ensureTagsIsMutable() {
-        if (!((bitField0_ & 0x00000008) != 0)) {
-          tags_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunTag>(tags_);
-          bitField0_ |= 0x00000008;
+      private void ensureBatchesIsMutable() {
+        if (!((bitField0_ & 0x00000001) != 0)) {
+          batches_ = new java.util.ArrayList<org.mlflow.api.proto.Service.LogBatch>(batches_);
+          bitField0_ |= 0x00000001;
          }
       }
 
       private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> tagsBuilder_;
+          org.mlflow.api.proto.Service.LogBatch, org.mlflow.api.proto.Service.LogBatch.Builder, org.mlflow.api.proto.Service.LogBatchOrBuilder> batchesBuilder_;
 
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public java.util.List<org.mlflow.api.proto.Service.RunTag> getTagsList() {
-        if (tagsBuilder_ == null) {
-          return java.util.Collections.unmodifiableList(tags_);
+      public java.util.List<org.mlflow.api.proto.Service.LogBatch> getBatchesList() {
+        if (batchesBuilder_ == null) {
+          return java.util.Collections.unmodifiableList(batches_);
         } else {
-          return tagsBuilder_.getMessageList();
+          return batchesBuilder_.getMessageList();
         }
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public int getTagsCount() {
-        if (tagsBuilder_ == null) {
-          return tags_.size();
+      public int getBatchesCount() {
+        if (batchesBuilder_ == null) {
+          return batches_.size();
         } else {
-          return tagsBuilder_.getCount();
+          return batchesBuilder_.getCount();
         }
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag getTags(int index) {
-        if (tagsBuilder_ == null) {
-          return tags_.get(index);
+      public org.mlflow.api.proto.Service.LogBatch getBatches(int index) {
+        if (batchesBuilder_ == null) {
+          return batches_.get(index);
         } else {
-          return tagsBuilder_.getMessage(index);
+          return batchesBuilder_.getMessage(index);
         }
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder setTags(
-          int index, org.mlflow.api.proto.Service.RunTag value) {
-        if (tagsBuilder_ == null) {
+      public Builder setBatches(
+          int index, org.mlflow.api.proto.Service.LogBatch value) {
+        if (batchesBuilder_ == null) {
           if (value == null) {
             throw new NullPointerException();
           }
-          ensureTagsIsMutable();
-          tags_.set(index, value);
+          ensureBatchesIsMutable();
+          batches_.set(index, value);
           onChanged();
         } else {
-          tagsBuilder_.setMessage(index, value);
+          batchesBuilder_.setMessage(index, value);
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder setTags(
-          int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.set(index, builderForValue.build());
+      public Builder setBatches(
+          int index, org.mlflow.api.proto.Service.LogBatch.Builder builderForValue) {
+        if (batchesBuilder_ == null) {
+          ensureBatchesIsMutable();
+          batches_.set(index, builderForValue.build());
           onChanged();
         } else {
-          tagsBuilder_.setMessage(index, builderForValue.build());
+          batchesBuilder_.setMessage(index, builderForValue.build());
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder addTags(org.mlflow.api.proto.Service.RunTag value) {
-        if (tagsBuilder_ == null) {
+      public Builder addBatches(org.mlflow.api.proto.Service.LogBatch value) {
+        if (batchesBuilder_ == null) {
           if (value == null) {
             throw new NullPointerException();
           }
-          ensureTagsIsMutable();
-          tags_.add(value);
+          ensureBatchesIsMutable();
+          batches_.add(value);
           onChanged();
         } else {
-          tagsBuilder_.addMessage(value);
+          batchesBuilder_.addMessage(value);
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder addTags(
-          int index, org.mlflow.api.proto.Service.RunTag value) {
-        if (tagsBuilder_ == null) {
+      public Builder addBatches(
+          int index, org.mlflow.api.proto.Service.LogBatch value) {
+        if (batchesBuilder_ == null) {
           if (value == null) {
             throw new NullPointerException();
           }
-          ensureTagsIsMutable();
-          tags_.add(index, value);
+          ensureBatchesIsMutable();
+          batches_.add(index, value);
           onChanged();
         } else {
-          tagsBuilder_.addMessage(index, value);
+          batchesBuilder_.addMessage(index, value);
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder addTags(
-          org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.add(builderForValue.build());
+      public Builder addBatches(
+          org.mlflow.api.proto.Service.LogBatch.Builder builderForValue) {
+        if (batchesBuilder_ == null) {
+          ensureBatchesIsMutable();
+          batches_.add(builderForValue.build());
           onChanged();
         } else {
-          tagsBuilder_.addMessage(builderForValue.build());
+          batchesBuilder_.addMessage(builderForValue.build());
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder addTags(
-          int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.add(index, builderForValue.build());
+      public Builder addBatches(
+          int index, org.mlflow.api.proto.Service.LogBatch.Builder builderForValue) {
+        if (batchesBuilder_ == null) {
+          ensureBatchesIsMutable();
+          batches_.add(index, builderForValue.build());
           onChanged();
         } else {
-          tagsBuilder_.addMessage(index, builderForValue.build());
+          batchesBuilder_.addMessage(index, builderForValue.build());
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder addAllTags(
-          java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunTag> values) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
+      public Builder addAllBatches(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.LogBatch> values) {
+        if (batchesBuilder_ == null) {
+          ensureBatchesIsMutable();
           com.google.protobuf.AbstractMessageLite.Builder.addAll(
-              values, tags_);
+              values, batches_);
           onChanged();
         } else {
-          tagsBuilder_.addAllMessages(values);
+          batchesBuilder_.addAllMessages(values);
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder clearTags() {
-        if (tagsBuilder_ == null) {
-          tags_ = java.util.Collections.emptyList();
-          bitField0_ = (bitField0_ & ~0x00000008);
+      public Builder clearBatches() {
+        if (batchesBuilder_ == null) {
+          batches_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000001);
           onChanged();
         } else {
-          tagsBuilder_.clear();
+          batchesBuilder_.clear();
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public Builder removeTags(int index) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.remove(index);
+      public Builder removeBatches(int index) {
+        if (batchesBuilder_ == null) {
+          ensureBatchesIsMutable();
+          batches_.remove(index);
           onChanged();
         } else {
-          tagsBuilder_.remove(index);
+          batchesBuilder_.remove(index);
         }
         return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag.Builder getTagsBuilder(
+      public org.mlflow.api.proto.Service.LogBatch.Builder getBatchesBuilder(
           int index) {
-        return getTagsFieldBuilder().getBuilder(index);
+        return getBatchesFieldBuilder().getBuilder(index);
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+      public org.mlflow.api.proto.Service.LogBatchOrBuilder getBatchesOrBuilder(
           int index) {
-        if (tagsBuilder_ == null) {
-          return tags_.get(index);  } else {
-          return tagsBuilder_.getMessageOrBuilder(index);
+        if (batchesBuilder_ == null) {
+          return batches_.get(index);  } else {
+          return batchesBuilder_.getMessageOrBuilder(index);
         }
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
-           getTagsOrBuilderList() {
-        if (tagsBuilder_ != null) {
-          return tagsBuilder_.getMessageOrBuilderList();
+      public java.util.List<? extends org.mlflow.api.proto.Service.LogBatchOrBuilder> 
+           getBatchesOrBuilderList() {
+        if (batchesBuilder_ != null) {
+          return batchesBuilder_.getMessageOrBuilderList();
         } else {
-          return java.util.Collections.unmodifiableList(tags_);
+          return java.util.Collections.unmodifiableList(batches_);
         }
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder() {
-        return getTagsFieldBuilder().addBuilder(
-            org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+      public org.mlflow.api.proto.Service.LogBatch.Builder addBatchesBuilder() {
+        return getBatchesFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.LogBatch.getDefaultInstance());
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder(
+      public org.mlflow.api.proto.Service.LogBatch.Builder addBatchesBuilder(
           int index) {
-        return getTagsFieldBuilder().addBuilder(
-            index, org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+        return getBatchesFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.LogBatch.getDefaultInstance());
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * Batches to log, each of them with the ID of the run to log under.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated .mlflow.LogBatch batches = 1;</code>
        */
-      public java.util.List<org.mlflow.api.proto.Service.RunTag.Builder> 
-           getTagsBuilderList() {
-        return getTagsFieldBuilder().getBuilderList();
+      public java.util.List<org.mlflow.api.proto.Service.LogBatch.Builder> 
+           getBatchesBuilderList() {
+        return getBatchesFieldBuilder().getBuilderList();
       }
       private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> 
-          getTagsFieldBuilder() {
-        if (tagsBuilder_ == null) {
-          tagsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-              org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder>(
-                  tags_,
-                  ((bitField0_ & 0x00000008) != 0),
+          org.mlflow.api.proto.Service.LogBatch, org.mlflow.api.proto.Service.LogBatch.Builder, org.mlflow.api.proto.Service.LogBatchOrBuilder> 
+          getBatchesFieldBuilder() {
+        if (batchesBuilder_ == null) {
+          batchesBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.LogBatch, org.mlflow.api.proto.Service.LogBatch.Builder, org.mlflow.api.proto.Service.LogBatchOrBuilder>(
+                  batches_,
+                  ((bitField0_ & 0x00000001) != 0),
                   getParentForChildren(),
                   isClean());
-          tags_ = null;
+          batches_ = null;
         }
-        return tagsBuilder_;
+        return batchesBuilder_;
       }
       @java.lang.Override
       public final Builder setUnknownFields(
@@ -54964,41 +57925,41 @@ public final class Service {
       }
 
 
-      // @@protoc_insertion_point(builder_scope:mlflow.LogBatch)
+      // @@protoc_insertion_point(builder_scope:mlflow.LogBatches)
     }
 
-    // @@protoc_insertion_point(class_scope:mlflow.LogBatch)
-    private static final org.mlflow.api.proto.Service.LogBatch DEFAULT_INSTANCE;
+    // @@protoc_insertion_point(class_scope:mlflow.LogBatches)
+    private static final org.mlflow.api.proto.Service.LogBatches DEFAULT_INSTANCE;
     static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatch();
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatches();
     }
 
-    public static org.mlflow.api.proto.Service.LogBatch getDefaultInstance() {
+    public static org.mlflow.api.proto.Service.LogBatches getDefaultInstance() {
       return DEFAULT_INSTANCE;
     }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<LogBatch>
-        PARSER = new com.google.protobuf.AbstractParser<LogBatch>() {
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<LogBatches>
+        PARSER = new com.google.protobuf.AbstractParser<LogBatches>() {
       @java.lang.Override
-      public LogBatch parsePartialFrom(
+      public LogBatches parsePartialFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
-        return new LogBatch(input, extensionRegistry);
+        return new LogBatches(input, extensionRegistry);
       }
     };
 
-    public static com.google.protobuf.Parser<LogBatch> parser() {
+    public static com.google.protobuf.Parser<LogBatches> parser() {
       return PARSER;
     }
 
     @java.lang.Override
-    public com.google.protobuf.Parser<LogBatch> getParserForType() {
+    public com.google.protobuf.Parser<LogBatches> getParserForType() {
       return PARSER;
     }
 
     @java.lang.Override
-    public org.mlflow.api.proto.Service.LogBatch getDefaultInstanceForType() {
+    public org.mlflow.api.proto.Service.LogBatches getDefaultInstanceForType() {
       return DEFAULT_INSTANCE;
     }
 
@@ -59438,6 +62399,16 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_GetRun_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_GetRuns_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_GetRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_GetRuns_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_GetRuns_Response_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_SearchRuns_descriptor;
   private static final 
@@ -59483,6 +62454,16 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_LogBatch_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_LogBatches_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_LogBatches_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_LogBatches_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_LogBatches_Response_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_LogModel_descriptor;
   private static final 
@@ -59611,126 +62592,137 @@ public final class Service {
       "abricks.rpc.RPC[$this.Response]\"}\n\006GetRu" +
       "n\022\016\n\006run_id\030\002 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\032$\n\010R" +
       "esponse\022\030\n\003run\030\001 \001(\0132\013.mlflow.Run:+\342?(\n&" +
-      "com.databricks.rpc.RPC[$this.Response]\"\230" +
-      "\002\n\nSearchRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n" +
-      "\006filter\030\004 \001(\t\0224\n\rrun_view_type\030\003 \001(\0162\020.m" +
-      "lflow.ViewType:\013ACTIVE_ONLY\022\031\n\013max_resul" +
-      "ts\030\005 \001(\005:\0041000\022\020\n\010order_by\030\006 \003(\t\022\022\n\npage" +
-      "_token\030\007 \001(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013" +
-      ".mlflow.Run\022\027\n\017next_page_token\030\002 \001(\t:+\342?" +
-      "(\n&com.databricks.rpc.RPC[$this.Response" +
-      "]\"\330\001\n\rListArtifacts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010r" +
-      "un_uuid\030\001 \001(\t\022\014\n\004path\030\002 \001(\t\022\022\n\npage_toke" +
-      "n\030\004 \001(\t\032V\n\010Response\022\020\n\010root_uri\030\001 \001(\t\022\037\n" +
-      "\005files\030\002 \003(\0132\020.mlflow.FileInfo\022\027\n\017next_p" +
-      "age_token\030\003 \001(\t:+\342?(\n&com.databricks.rpc" +
-      ".RPC[$this.Response]\";\n\010FileInfo\022\014\n\004path" +
-      "\030\001 \001(\t\022\016\n\006is_dir\030\002 \001(\010\022\021\n\tfile_size\030\003 \001(" +
-      "\003\"\352\001\n\020GetMetricHistory\022\016\n\006run_id\030\003 \001(\t\022\020" +
-      "\n\010run_uuid\030\001 \001(\t\022\030\n\nmetric_key\030\002 \001(\tB\004\370\206" +
-      "\031\001\022\022\n\npage_token\030\004 \001(\t\022\023\n\013max_results\030\005 " +
-      "\001(\005\032D\n\010Response\022\037\n\007metrics\030\001 \003(\0132\016.mlflo" +
-      "w.Metric\022\027\n\017next_page_token\030\002 \001(\t:+\342?(\n&" +
-      "com.databricks.rpc.RPC[$this.Response]\"\261" +
-      "\001\n\010LogBatch\022\016\n\006run_id\030\001 \001(\t\022\037\n\007metrics\030\002" +
-      " \003(\0132\016.mlflow.Metric\022\035\n\006params\030\003 \003(\0132\r.m" +
-      "lflow.Param\022\034\n\004tags\030\004 \003(\0132\016.mlflow.RunTa" +
-      "g\032\n\n\010Response:+\342?(\n&com.databricks.rpc.R" +
-      "PC[$this.Response]\"g\n\010LogModel\022\016\n\006run_id" +
-      "\030\001 \001(\t\022\022\n\nmodel_json\030\002 \001(\t\032\n\n\010Response:+" +
-      "\342?(\n&com.databricks.rpc.RPC[$this.Respon" +
-      "se]\"\266\001\n\tLogInputs\022\024\n\006run_id\030\001 \001(\tB\004\370\206\031\001\022" +
-      "&\n\010datasets\030\002 \003(\0132\024.mlflow.DatasetInput\032" +
-      "\n\n\010Response:_\342?(\n&com.databricks.rpc.RPC" +
-      "[$this.Response]\342?1\n/com.databricks.mlfl" +
-      "ow.api.MlflowTrackingMessage\"\225\001\n\023GetExpe" +
-      "rimentByName\022\035\n\017experiment_name\030\001 \001(\tB\004\370" +
-      "\206\031\001\0322\n\010Response\022&\n\nexperiment\030\001 \001(\0132\022.ml" +
-      "flow.Experiment:+\342?(\n&com.databricks.rpc" +
-      ".RPC[$this.Response]*6\n\010ViewType\022\017\n\013ACTI" +
-      "VE_ONLY\020\001\022\020\n\014DELETED_ONLY\020\002\022\007\n\003ALL\020\003*I\n\n" +
-      "SourceType\022\014\n\010NOTEBOOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PRO" +
-      "JECT\020\003\022\t\n\005LOCAL\020\004\022\014\n\007UNKNOWN\020\350\007*M\n\tRunSt" +
-      "atus\022\013\n\007RUNNING\020\001\022\r\n\tSCHEDULED\020\002\022\014\n\010FINI" +
-      "SHED\020\003\022\n\n\006FAILED\020\004\022\n\n\006KILLED\020\0052\370\027\n\rMlflo" +
-      "wService\022\246\001\n\023getExperimentByName\022\033.mlflo" +
-      "w.GetExperimentByName\032$.mlflow.GetExperi" +
-      "mentByName.Response\"L\362\206\031H\n,\n\003GET\022\037/mlflo" +
-      "w/experiments/get-by-name\032\004\010\002\020\000\020\001*\026Get E" +
-      "xperiment By Name\022\224\001\n\020createExperiment\022\030" +
-      ".mlflow.CreateExperiment\032!.mlflow.Create" +
-      "Experiment.Response\"C\362\206\031?\n(\n\004POST\022\032/mlfl" +
-      "ow/experiments/create\032\004\010\002\020\000\020\001*\021Create Ex" +
-      "periment\022\301\001\n\021searchExperiments\022\031.mlflow." +
-      "SearchExperiments\032\".mlflow.SearchExperim" +
-      "ents.Response\"m\362\206\031i\n(\n\004POST\022\032/mlflow/exp" +
-      "eriments/search\032\004\010\002\020\000\n\'\n\003GET\022\032/mlflow/ex" +
-      "periments/search\032\004\010\002\020\000\020\001*\022Search Experim" +
-      "ents\022\204\001\n\rgetExperiment\022\025.mlflow.GetExper" +
-      "iment\032\036.mlflow.GetExperiment.Response\"<\362" +
-      "\206\0318\n$\n\003GET\022\027/mlflow/experiments/get\032\004\010\002\020" +
-      "\000\020\001*\016Get Experiment\022\224\001\n\020deleteExperiment" +
-      "\022\030.mlflow.DeleteExperiment\032!.mlflow.Dele" +
-      "teExperiment.Response\"C\362\206\031?\n(\n\004POST\022\032/ml" +
-      "flow/experiments/delete\032\004\010\002\020\000\020\001*\021Delete " +
-      "Experiment\022\231\001\n\021restoreExperiment\022\031.mlflo" +
-      "w.RestoreExperiment\032\".mlflow.RestoreExpe" +
-      "riment.Response\"E\362\206\031A\n)\n\004POST\022\033/mlflow/e" +
-      "xperiments/restore\032\004\010\002\020\000\020\001*\022Restore Expe" +
-      "riment\022\224\001\n\020updateExperiment\022\030.mlflow.Upd" +
-      "ateExperiment\032!.mlflow.UpdateExperiment." +
-      "Response\"C\362\206\031?\n(\n\004POST\022\032/mlflow/experime" +
-      "nts/update\032\004\010\002\020\000\020\001*\021Update Experiment\022q\n" +
-      "\tcreateRun\022\021.mlflow.CreateRun\032\032.mlflow.C" +
-      "reateRun.Response\"5\362\206\0311\n!\n\004POST\022\023/mlflow" +
-      "/runs/create\032\004\010\002\020\000\020\001*\nCreate Run\022q\n\tupda" +
-      "teRun\022\021.mlflow.UpdateRun\032\032.mlflow.Update" +
-      "Run.Response\"5\362\206\0311\n!\n\004POST\022\023/mlflow/runs" +
-      "/update\032\004\010\002\020\000\020\001*\nUpdate Run\022q\n\tdeleteRun" +
-      "\022\021.mlflow.DeleteRun\032\032.mlflow.DeleteRun.R" +
-      "esponse\"5\362\206\0311\n!\n\004POST\022\023/mlflow/runs/dele" +
-      "te\032\004\010\002\020\000\020\001*\nDelete Run\022v\n\nrestoreRun\022\022.m" +
-      "lflow.RestoreRun\032\033.mlflow.RestoreRun.Res" +
-      "ponse\"7\362\206\0313\n\"\n\004POST\022\024/mlflow/runs/restor" +
-      "e\032\004\010\002\020\000\020\001*\013Restore Run\022u\n\tlogMetric\022\021.ml" +
-      "flow.LogMetric\032\032.mlflow.LogMetric.Respon" +
-      "se\"9\362\206\0315\n%\n\004POST\022\027/mlflow/runs/log-metri" +
-      "c\032\004\010\002\020\000\020\001*\nLog Metric\022t\n\010logParam\022\020.mlfl" +
-      "ow.LogParam\032\031.mlflow.LogParam.Response\";" +
-      "\362\206\0317\n(\n\004POST\022\032/mlflow/runs/log-parameter" +
-      "\032\004\010\002\020\000\020\001*\tLog Param\022\241\001\n\020setExperimentTag" +
-      "\022\030.mlflow.SetExperimentTag\032!.mlflow.SetE" +
-      "xperimentTag.Response\"P\362\206\031L\n4\n\004POST\022&/ml" +
-      "flow/experiments/set-experiment-tag\032\004\010\002\020" +
-      "\000\020\001*\022Set Experiment Tag\022f\n\006setTag\022\016.mlfl" +
-      "ow.SetTag\032\027.mlflow.SetTag.Response\"3\362\206\031/" +
-      "\n\"\n\004POST\022\024/mlflow/runs/set-tag\032\004\010\002\020\000\020\001*\007" +
-      "Set Tag\022u\n\tdeleteTag\022\021.mlflow.DeleteTag\032" +
-      "\032.mlflow.DeleteTag.Response\"9\362\206\0315\n%\n\004POS" +
-      "T\022\027/mlflow/runs/delete-tag\032\004\010\002\020\000\020\001*\nDele" +
-      "te Tag\022a\n\006getRun\022\016.mlflow.GetRun\032\027.mlflo" +
-      "w.GetRun.Response\".\362\206\031*\n\035\n\003GET\022\020/mlflow/" +
-      "runs/get\032\004\010\002\020\000\020\001*\007Get Run\022u\n\nsearchRuns\022" +
-      "\022.mlflow.SearchRuns\032\033.mlflow.SearchRuns." +
-      "Response\"6\362\206\0312\n!\n\004POST\022\023/mlflow/runs/sea" +
-      "rch\032\004\010\002\020\000\020\001*\013Search Runs\022\203\001\n\rlistArtifac" +
-      "ts\022\025.mlflow.ListArtifacts\032\036.mlflow.ListA" +
-      "rtifacts.Response\";\362\206\0317\n#\n\003GET\022\026/mlflow/" +
-      "artifacts/list\032\004\010\002\020\000\020\001*\016List Artifacts\022\225" +
-      "\001\n\020getMetricHistory\022\030.mlflow.GetMetricHi" +
-      "story\032!.mlflow.GetMetricHistory.Response" +
-      "\"D\362\206\031@\n(\n\003GET\022\033/mlflow/metrics/get-histo" +
-      "ry\032\004\010\002\020\000\020\001*\022Get Metric History\022p\n\010logBat" +
-      "ch\022\020.mlflow.LogBatch\032\031.mlflow.LogBatch.R" +
-      "esponse\"7\362\206\0313\n$\n\004POST\022\026/mlflow/runs/log-" +
-      "batch\032\004\010\002\020\000\020\001*\tLog Batch\022p\n\010logModel\022\020.m" +
-      "lflow.LogModel\032\031.mlflow.LogModel.Respons" +
-      "e\"7\362\206\0313\n$\n\004POST\022\026/mlflow/runs/log-model\032" +
-      "\004\010\002\020\000\020\001*\tLog Model\022u\n\tlogInputs\022\021.mlflow" +
-      ".LogInputs\032\032.mlflow.LogInputs.Response\"9" +
-      "\362\206\0315\n%\n\004POST\022\027/mlflow/runs/log-inputs\032\004\010" +
-      "\002\020\000\020\001*\nLog InputsB\036\n\024org.mlflow.api.prot" +
-      "o\220\001\001\342?\002\020\001"
+      "com.databricks.rpc.RPC[$this.Response]\"n" +
+      "\n\007GetRuns\022\017\n\007run_ids\030\001 \003(\t\032%\n\010Response\022\031" +
+      "\n\004runs\030\001 \003(\0132\013.mlflow.Run:+\342?(\n&com.data" +
+      "bricks.rpc.RPC[$this.Response]\"\230\002\n\nSearc" +
+      "hRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n\006filter\030" +
+      "\004 \001(\t\0224\n\rrun_view_type\030\003 \001(\0162\020.mlflow.Vi" +
+      "ewType:\013ACTIVE_ONLY\022\031\n\013max_results\030\005 \001(\005" +
+      ":\0041000\022\020\n\010order_by\030\006 \003(\t\022\022\n\npage_token\030\007" +
+      " \001(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013.mlflow." +
+      "Run\022\027\n\017next_page_token\030\002 \001(\t:+\342?(\n&com.d" +
+      "atabricks.rpc.RPC[$this.Response]\"\330\001\n\rLi" +
+      "stArtifacts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid\030" +
+      "\001 \001(\t\022\014\n\004path\030\002 \001(\t\022\022\n\npage_token\030\004 \001(\t\032" +
+      "V\n\010Response\022\020\n\010root_uri\030\001 \001(\t\022\037\n\005files\030\002" +
+      " \003(\0132\020.mlflow.FileInfo\022\027\n\017next_page_toke" +
+      "n\030\003 \001(\t:+\342?(\n&com.databricks.rpc.RPC[$th" +
+      "is.Response]\";\n\010FileInfo\022\014\n\004path\030\001 \001(\t\022\016" +
+      "\n\006is_dir\030\002 \001(\010\022\021\n\tfile_size\030\003 \001(\003\"\352\001\n\020Ge" +
+      "tMetricHistory\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uu" +
+      "id\030\001 \001(\t\022\030\n\nmetric_key\030\002 \001(\tB\004\370\206\031\001\022\022\n\npa" +
+      "ge_token\030\004 \001(\t\022\023\n\013max_results\030\005 \001(\005\032D\n\010R" +
+      "esponse\022\037\n\007metrics\030\001 \003(\0132\016.mlflow.Metric" +
+      "\022\027\n\017next_page_token\030\002 \001(\t:+\342?(\n&com.data" +
+      "bricks.rpc.RPC[$this.Response]\"\261\001\n\010LogBa" +
+      "tch\022\016\n\006run_id\030\001 \001(\t\022\037\n\007metrics\030\002 \003(\0132\016.m" +
+      "lflow.Metric\022\035\n\006params\030\003 \003(\0132\r.mlflow.Pa" +
+      "ram\022\034\n\004tags\030\004 \003(\0132\016.mlflow.RunTag\032\n\n\010Res" +
+      "ponse:+\342?(\n&com.databricks.rpc.RPC[$this" +
+      ".Response]\"h\n\nLogBatches\022!\n\007batches\030\001 \003(" +
+      "\0132\020.mlflow.LogBatch\032\n\n\010Response:+\342?(\n&co" +
+      "m.databricks.rpc.RPC[$this.Response]\"g\n\010" +
+      "LogModel\022\016\n\006run_id\030\001 \001(\t\022\022\n\nmodel_json\030\002" +
+      " \001(\t\032\n\n\010Response:+\342?(\n&com.databricks.rp" +
+      "c.RPC[$this.Response]\"\266\001\n\tLogInputs\022\024\n\006r" +
+      "un_id\030\001 \001(\tB\004\370\206\031\001\022&\n\010datasets\030\002 \003(\0132\024.ml" +
+      "flow.DatasetInput\032\n\n\010Response:_\342?(\n&com." +
+      "databricks.rpc.RPC[$this.Response]\342?1\n/c" +
+      "om.databricks.mlflow.api.MlflowTrackingM" +
+      "essage\"\225\001\n\023GetExperimentByName\022\035\n\017experi" +
+      "ment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Response\022&\n\nexp" +
+      "eriment\030\001 \001(\0132\022.mlflow.Experiment:+\342?(\n&" +
+      "com.databricks.rpc.RPC[$this.Response]*6" +
+      "\n\010ViewType\022\017\n\013ACTIVE_ONLY\020\001\022\020\n\014DELETED_O" +
+      "NLY\020\002\022\007\n\003ALL\020\003*I\n\nSourceType\022\014\n\010NOTEBOOK" +
+      "\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003\022\t\n\005LOCAL\020\004\022\014\n\007U" +
+      "NKNOWN\020\350\007*M\n\tRunStatus\022\013\n\007RUNNING\020\001\022\r\n\tS" +
+      "CHEDULED\020\002\022\014\n\010FINISHED\020\003\022\n\n\006FAILED\020\004\022\n\n\006" +
+      "KILLED\020\0052\342\031\n\rMlflowService\022\246\001\n\023getExperi" +
+      "mentByName\022\033.mlflow.GetExperimentByName\032" +
+      "$.mlflow.GetExperimentByName.Response\"L\362" +
+      "\206\031H\n,\n\003GET\022\037/mlflow/experiments/get-by-n" +
+      "ame\032\004\010\002\020\000\020\001*\026Get Experiment By Name\022\224\001\n\020" +
+      "createExperiment\022\030.mlflow.CreateExperime" +
+      "nt\032!.mlflow.CreateExperiment.Response\"C\362" +
+      "\206\031?\n(\n\004POST\022\032/mlflow/experiments/create\032" +
+      "\004\010\002\020\000\020\001*\021Create Experiment\022\301\001\n\021searchExp" +
+      "eriments\022\031.mlflow.SearchExperiments\032\".ml" +
+      "flow.SearchExperiments.Response\"m\362\206\031i\n(\n" +
+      "\004POST\022\032/mlflow/experiments/search\032\004\010\002\020\000\n" +
+      "\'\n\003GET\022\032/mlflow/experiments/search\032\004\010\002\020\000" +
+      "\020\001*\022Search Experiments\022\204\001\n\rgetExperiment" +
+      "\022\025.mlflow.GetExperiment\032\036.mlflow.GetExpe" +
+      "riment.Response\"<\362\206\0318\n$\n\003GET\022\027/mlflow/ex" +
+      "periments/get\032\004\010\002\020\000\020\001*\016Get Experiment\022\224\001" +
+      "\n\020deleteExperiment\022\030.mlflow.DeleteExperi" +
+      "ment\032!.mlflow.DeleteExperiment.Response\"" +
+      "C\362\206\031?\n(\n\004POST\022\032/mlflow/experiments/delet" +
+      "e\032\004\010\002\020\000\020\001*\021Delete Experiment\022\231\001\n\021restore" +
+      "Experiment\022\031.mlflow.RestoreExperiment\032\"." +
+      "mlflow.RestoreExperiment.Response\"E\362\206\031A\n" +
+      ")\n\004POST\022\033/mlflow/experiments/restore\032\004\010\002" +
+      "\020\000\020\001*\022Restore Experiment\022\224\001\n\020updateExper" +
+      "iment\022\030.mlflow.UpdateExperiment\032!.mlflow" +
+      ".UpdateExperiment.Response\"C\362\206\031?\n(\n\004POST" +
+      "\022\032/mlflow/experiments/update\032\004\010\002\020\000\020\001*\021Up" +
+      "date Experiment\022q\n\tcreateRun\022\021.mlflow.Cr" +
+      "eateRun\032\032.mlflow.CreateRun.Response\"5\362\206\031" +
+      "1\n!\n\004POST\022\023/mlflow/runs/create\032\004\010\002\020\000\020\001*\n" +
+      "Create Run\022q\n\tupdateRun\022\021.mlflow.UpdateR" +
+      "un\032\032.mlflow.UpdateRun.Response\"5\362\206\0311\n!\n\004" +
+      "POST\022\023/mlflow/runs/update\032\004\010\002\020\000\020\001*\nUpdat" +
+      "e Run\022q\n\tdeleteRun\022\021.mlflow.DeleteRun\032\032." +
+      "mlflow.DeleteRun.Response\"5\362\206\0311\n!\n\004POST\022" +
+      "\023/mlflow/runs/delete\032\004\010\002\020\000\020\001*\nDelete Run" +
+      "\022v\n\nrestoreRun\022\022.mlflow.RestoreRun\032\033.mlf" +
+      "low.RestoreRun.Response\"7\362\206\0313\n\"\n\004POST\022\024/" +
+      "mlflow/runs/restore\032\004\010\002\020\000\020\001*\013Restore Run" +
+      "\022u\n\tlogMetric\022\021.mlflow.LogMetric\032\032.mlflo" +
+      "w.LogMetric.Response\"9\362\206\0315\n%\n\004POST\022\027/mlf" +
+      "low/runs/log-metric\032\004\010\002\020\000\020\001*\nLog Metric\022" +
+      "t\n\010logParam\022\020.mlflow.LogParam\032\031.mlflow.L" +
+      "ogParam.Response\";\362\206\0317\n(\n\004POST\022\032/mlflow/" +
+      "runs/log-parameter\032\004\010\002\020\000\020\001*\tLog Param\022\241\001" +
+      "\n\020setExperimentTag\022\030.mlflow.SetExperimen" +
+      "tTag\032!.mlflow.SetExperimentTag.Response\"" +
+      "P\362\206\031L\n4\n\004POST\022&/mlflow/experiments/set-e" +
+      "xperiment-tag\032\004\010\002\020\000\020\001*\022Set Experiment Ta" +
+      "g\022f\n\006setTag\022\016.mlflow.SetTag\032\027.mlflow.Set" +
+      "Tag.Response\"3\362\206\031/\n\"\n\004POST\022\024/mlflow/runs" +
+      "/set-tag\032\004\010\002\020\000\020\001*\007Set Tag\022u\n\tdeleteTag\022\021" +
+      ".mlflow.DeleteTag\032\032.mlflow.DeleteTag.Res" +
+      "ponse\"9\362\206\0315\n%\n\004POST\022\027/mlflow/runs/delete" +
+      "-tag\032\004\010\002\020\000\020\001*\nDelete Tag\022a\n\006getRun\022\016.mlf" +
+      "low.GetRun\032\027.mlflow.GetRun.Response\".\362\206\031" +
+      "*\n\035\n\003GET\022\020/mlflow/runs/get\032\004\010\002\020\000\020\001*\007Get " +
+      "Run\022l\n\007getRuns\022\017.mlflow.GetRuns\032\030.mlflow" +
+      ".GetRuns.Response\"6\362\206\0312\n$\n\004POST\022\026/mlflow" +
+      "/runs/get-batch\032\004\010\002\020\000\020\001*\010Get Runs\022u\n\nsea" +
+      "rchRuns\022\022.mlflow.SearchRuns\032\033.mlflow.Sea" +
+      "rchRuns.Response\"6\362\206\0312\n!\n\004POST\022\023/mlflow/" +
+      "runs/search\032\004\010\002\020\000\020\001*\013Search Runs\022\203\001\n\rlis" +
+      "tArtifacts\022\025.mlflow.ListArtifacts\032\036.mlfl" +
+      "ow.ListArtifacts.Response\";\362\206\0317\n#\n\003GET\022\026" +
+      "/mlflow/artifacts/list\032\004\010\002\020\000\020\001*\016List Art" +
+      "ifacts\022\225\001\n\020getMetricHistory\022\030.mlflow.Get" +
+      "MetricHistory\032!.mlflow.GetMetricHistory." +
+      "Response\"D\362\206\031@\n(\n\003GET\022\033/mlflow/metrics/g" +
+      "et-history\032\004\010\002\020\000\020\001*\022Get Metric History\022p" +
+      "\n\010logBatch\022\020.mlflow.LogBatch\032\031.mlflow.Lo" +
+      "gBatch.Response\"7\362\206\0313\n$\n\004POST\022\026/mlflow/r" +
+      "uns/log-batch\032\004\010\002\020\000\020\001*\tLog Batch\022z\n\nlogB" +
+      "atches\022\022.mlflow.LogBatches\032\033.mlflow.LogB" +
+      "atches.Response\";\362\206\0317\n&\n\004POST\022\030/mlflow/r" +
+      "uns/log-batches\032\004\010\002\020\000\020\001*\013Log Batches\022p\n\010" +
+      "logModel\022\020.mlflow.LogModel\032\031.mlflow.LogM" +
+      "odel.Response\"7\362\206\0313\n$\n\004POST\022\026/mlflow/run" +
+      "s/log-model\032\004\010\002\020\000\020\001*\tLog Model\022u\n\tlogInp" +
+      "uts\022\021.mlflow.LogInputs\032\032.mlflow.LogInput" +
+      "s.Response\"9\362\206\0315\n%\n\004POST\022\027/mlflow/runs/l" +
+      "og-inputs\032\004\010\002\020\000\020\001*\nLog InputsB\036\n\024org.mlf" +
+      "low.api.proto\220\001\001\342?\002\020\001"
     };
     descriptor = com.google.protobuf.Descriptors.FileDescriptor
       .internalBuildGeneratedFileFrom(descriptorData,
@@ -60002,8 +62994,20 @@ public final class Service {
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetRun_Response_descriptor,
         new java.lang.String[] { "Run", });
-    internal_static_mlflow_SearchRuns_descriptor =
+    internal_static_mlflow_GetRuns_descriptor =
       getDescriptor().getMessageTypes().get(28);
+    internal_static_mlflow_GetRuns_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_GetRuns_descriptor,
+        new java.lang.String[] { "RunIds", });
+    internal_static_mlflow_GetRuns_Response_descriptor =
+      internal_static_mlflow_GetRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_GetRuns_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_GetRuns_Response_descriptor,
+        new java.lang.String[] { "Runs", });
+    internal_static_mlflow_SearchRuns_descriptor =
+      getDescriptor().getMessageTypes().get(29);
     internal_static_mlflow_SearchRuns_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SearchRuns_descriptor,
@@ -60015,7 +63019,7 @@ public final class Service {
         internal_static_mlflow_SearchRuns_Response_descriptor,
         new java.lang.String[] { "Runs", "NextPageToken", });
     internal_static_mlflow_ListArtifacts_descriptor =
-      getDescriptor().getMessageTypes().get(29);
+      getDescriptor().getMessageTypes().get(30);
     internal_static_mlflow_ListArtifacts_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_ListArtifacts_descriptor,
@@ -60027,13 +63031,13 @@ public final class Service {
         internal_static_mlflow_ListArtifacts_Response_descriptor,
         new java.lang.String[] { "RootUri", "Files", "NextPageToken", });
     internal_static_mlflow_FileInfo_descriptor =
-      getDescriptor().getMessageTypes().get(30);
+      getDescriptor().getMessageTypes().get(31);
     internal_static_mlflow_FileInfo_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_FileInfo_descriptor,
         new java.lang.String[] { "Path", "IsDir", "FileSize", });
     internal_static_mlflow_GetMetricHistory_descriptor =
-      getDescriptor().getMessageTypes().get(31);
+      getDescriptor().getMessageTypes().get(32);
     internal_static_mlflow_GetMetricHistory_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetMetricHistory_descriptor,
@@ -60045,7 +63049,7 @@ public final class Service {
         internal_static_mlflow_GetMetricHistory_Response_descriptor,
         new java.lang.String[] { "Metrics", "NextPageToken", });
     internal_static_mlflow_LogBatch_descriptor =
-      getDescriptor().getMessageTypes().get(32);
+      getDescriptor().getMessageTypes().get(33);
     internal_static_mlflow_LogBatch_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogBatch_descriptor,
@@ -60056,8 +63060,20 @@ public final class Service {
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogBatch_Response_descriptor,
         new java.lang.String[] { });
+    internal_static_mlflow_LogBatches_descriptor =
+      getDescriptor().getMessageTypes().get(34);
+    internal_static_mlflow_LogBatches_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_LogBatches_descriptor,
+        new java.lang.String[] { "Batches", });
+    internal_static_mlflow_LogBatches_Response_descriptor =
+      internal_static_mlflow_LogBatches_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_LogBatches_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_LogBatches_Response_descriptor,
+        new java.lang.String[] { });
     internal_static_mlflow_LogModel_descriptor =
-      getDescriptor().getMessageTypes().get(33);
+      getDescriptor().getMessageTypes().get(35);
     internal_static_mlflow_LogModel_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogModel_descriptor,
@@ -60069,7 +63085,7 @@ public final class Service {
         internal_static_mlflow_LogModel_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_LogInputs_descriptor =
-      getDescriptor().getMessageTypes().get(34);
+      getDescriptor().getMessageTypes().get(36);
     internal_static_mlflow_LogInputs_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogInputs_descriptor,
@@ -60081,7 +63097,7 @@ public final class Service {
         internal_static_mlflow_LogInputs_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_GetExperimentByName_descriptor =
-      getDescriptor().getMessageTypes().get(35);
+      getDescriptor().getMessageTypes().get(37);
     internal_static_mlflow_GetExperimentByName_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetExperimentByName_descriptor,
@@ -31,6 +31,7 @@ def commands():
 @cli_args.NO_CONDA
 @cli_args.INSTALL_MLFLOW
 @cli_args.ENABLE_MLSERVER
+@cli_args.ENABLE_ASGI
 def serve(
     model_uri,
     port,
@@ -41,6 +42,7 @@ def serve(
     no_conda=False,
     install_mlflow=False,
     enable_mlserver=False,
+    enable_asgi=False,
 ):
     """
     Serve a model saved with MLflow by launching a webserver on the specified host and port.
@@ -105,7 +107,12 @@ def serve(
     return get_flavor_backend(
         model_uri, env_manager=env_manager, workers=workers, install_mlflow=install_mlflow
     ).serve(
-        model_uri=model_uri, port=port, host=host, timeout=timeout, enable_mlserver=enable_mlserver
+        model_uri=model_uri,
+        port=port,
+        host=host,
+        timeout=timeout,
+        enable_mlserver=enable_mlserver,
+        enable_asgi=enable_asgi,
     )
 
 
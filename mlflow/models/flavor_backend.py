@@ -40,6 +40,7 @@ class FlavorBackend:
         synchronous=True,
         stdout=None,
         stderr=None,
+        enable_asgi=False,
     ):
         """
         Serve the specified MLflow model locally.
@@ -54,6 +55,7 @@ class FlavorBackend:
                             If False, return the server process `Popen` instance immediately.
         :param stdout: Redirect server stdout
         :param stderr: Redirect server stderr
+        :param enable_asgi: Whether to use the ASGI scoring server instead of the WSGI one.
         """
         pass
 
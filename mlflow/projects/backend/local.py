@@ -38,7 +38,10 @@ from mlflow.utils.virtualenv import (
     _VIRTUALENV_ENVS_DIR,
     _PYENV_ROOT_DIR,
 )
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
 from mlflow.store.artifact.azure_blob_artifact_repo import AzureBlobArtifactRepository
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
 from mlflow.store.artifact.hdfs_artifact_repo import HdfsArtifactRepository
@@ -420,7 +423,7 @@ _artifact_storages = {
 
 
 def _get_docker_artifact_storage_cmd_and_envs(artifact_uri):
-    artifact_repo = get_artifact_repository(artifact_uri)
+    artifact_repo = get_underlying_artifact_repository(get_artifact_repository(artifact_uri))
     _get_cmd_and_envs = _artifact_storages.get(type(artifact_repo))
     if _get_cmd_and_envs is not None:
         return _get_cmd_and_envs(artifact_repo)
@@ -170,16 +170,24 @@ class PyFuncBackend(FlavorBackend):
         synchronous=True,
         stdout=None,
         stderr=None,
+        enable_asgi=False,
     ):
         """
         Serve pyfunc model locally.
         """
+        if enable_mlserver and enable_asgi:
+            raise Exception(
+                "MLServer and the ASGI scoring server cannot be enabled at the same time."
+            )
+
         local_path = _download_artifact_from_uri(model_uri)
 
-        server_implementation = mlserver if enable_mlserver else scoring_server
-        command, command_env = server_implementation.get_cmd(
-            local_path, port, host, timeout, self._nworkers
-        )
+        if enable_mlserver:
+            command, command_env = mlserver.get_cmd(local_path, port, host, timeout, self._nworkers)
+        else:
+            command, command_env = scoring_server.get_cmd(
+                local_path, port, host, timeout, self._nworkers, enable_asgi=enable_asgi
+            )
 
         if sys.platform.startswith("linux"):
 
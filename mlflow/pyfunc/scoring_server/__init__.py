@@ -3,15 +3,20 @@ Scoring server for python model format.
 The passed int model is expected to have function:
    predict(pandas.Dataframe) -> pandas.DataFrame
 
-Input, expected in text/csv or application/json format,
-is parsed into pandas.DataFrame and passed to the model.
+Input, expected in text/csv, application/json, Arrow IPC stream or Parquet format,
+is parsed into pandas.DataFrame and passed to the model. Predictions are returned as JSON, or in
+the Arrow IPC stream or Parquet format when requested with the Accept header.
 
 Defines four endpoints:
     /ping used for health check
     /health (same as /ping)
     /version used for getting the mlflow version
     /invocations used for scoring
+
+When micro-batching is enabled with ``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE``, a fifth endpoint,
+/metrics, exposes the batch size and prediction latency histograms in the Prometheus format.
 """
+from collections import namedtuple
 from typing import Tuple, Dict
 import flask
 import json
@@ -20,7 +25,13 @@ import os
 import sys
 import traceback
 
-from mlflow.environment_variables import MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT
+from mlflow.environment_variables import (
+    MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE,
+    MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS,
+    MLFLOW_SCORING_SERVER_PRELOAD_MODEL,
+    MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
+    MLFLOW_SCORING_SERVER_USE_ORJSON,
+)
 
 # NB: We need to be careful what we import form mlflow here. Scoring server is used from within
 # model's conda environment. The version of mlflow doing the serving (outside) and the version of
@@ -28,7 +39,7 @@ from mlflow.environment_variables import MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT
 # dependencies to the minimum here.
 # ALl of the mlflow dependencies below need to be backwards compatible.
 from mlflow.exceptions import MlflowException
-from mlflow.types import Schema
+from mlflow.types import DataType, Schema
 from mlflow.utils import reraise
 from mlflow.utils.file_utils import path_to_local_file_uri
 from mlflow.utils.proto_json_utils import (
@@ -51,12 +62,26 @@ _SERVER_MODEL_PATH = "__pyfunc_model_path__"
 
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_ARROW = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/vnd.apache.parquet"
+
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4"
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
     CONTENT_TYPE_JSON,
+    CONTENT_TYPE_ARROW,
+    CONTENT_TYPE_PARQUET,
 ]
 
+# Binary columnar formats in which DataFrames are sent to and returned by the server without
+# a round-trip through JSON
+COLUMNAR_CONTENT_TYPES = [CONTENT_TYPE_ARROW, CONTENT_TYPE_PARQUET]
+
+# Maximum number of threads used to handle concurrent requests in each worker when micro-batching
+# is enabled
+_MAX_BATCHING_THREADS = 64
+
 _logger = logging.getLogger(__name__)
 
 DF_RECORDS = "dataframe_records"
@@ -82,6 +107,33 @@ SCORING_PROTOCOL_CHANGE_INFO = (
 )
 
 
+def _get_orjson():
+    """
+    :return: The ``orjson`` module if the scoring server is configured to use it and it's
+             installed, ``None`` otherwise.
+    """
+    if not MLFLOW_SCORING_SERVER_USE_ORJSON.get():
+        return None
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+def _loads_json(json_input):
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(json_input)
+        except orjson.JSONDecodeError:
+            # The NaN and Infinity literals produced by the json module aren't valid JSON and
+            # are rejected by orjson
+            pass
+    return json.loads(json_input)
+
+
 def infer_and_parse_json_input(json_input, schema: Schema = None):
     """
     :param json_input: A JSON-formatted string representation of TF serving input or a Pandas
@@ -92,7 +144,7 @@ def infer_and_parse_json_input(json_input, schema: Schema = None):
         decoded_input = json_input
     else:
         try:
-            decoded_input = json.loads(json_input)
+            decoded_input = _loads_json(json_input)
         except json.decoder.JSONDecodeError as ex:
             raise MlflowException(
                 message=(
@@ -157,13 +209,141 @@ def parse_csv_input(csv_input, schema: Schema = None):
         )
 
 
+def _is_pyarrow_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def dataframe_from_columnar_bytes(data, content_type):
+    """
+    :param data: A DataFrame serialized by :py:func:`dataframe_to_columnar_bytes`.
+    :param content_type: One of ``COLUMNAR_CONTENT_TYPES``.
+    """
+    import pyarrow as pa
+
+    if content_type == CONTENT_TYPE_ARROW:
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(pa.BufferReader(data))
+    return table.to_pandas()
+
+
+def dataframe_to_columnar_bytes(pdf, content_type):
+    """
+    :param pdf: The DataFrame to serialize. Its index isn't serialized.
+    :param content_type: One of ``COLUMNAR_CONTENT_TYPES``.
+    :return: The DataFrame serialized in the Arrow IPC stream format or the Parquet format.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(pdf, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    if content_type == CONTENT_TYPE_ARROW:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def parse_columnar_input(data, content_type, schema: Schema = None):
+    """
+    :param data: A Pandas DataFrame in the Arrow IPC stream format or the Parquet format, as bytes.
+    :param content_type: One of ``COLUMNAR_CONTENT_TYPES``.
+    :param schema: Optional schema specification used to cast the numeric columns, as is done for
+                   JSON inputs. The other columns keep the types they were serialized with.
+    """
+    try:
+        pdf = dataframe_from_columnar_bytes(data, content_type)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                f"Failed to parse input as a Pandas DataFrame. Ensure that the input is a valid"
+                f" DataFrame serialized in the '{content_type}' format."
+            ),
+            error_code=BAD_REQUEST,
+        )
+    if schema is None or not schema.has_input_names() or schema.is_tensor_spec():
+        return pdf
+
+    numeric_types = {
+        DataType.boolean,
+        DataType.integer,
+        DataType.long,
+        DataType.float,
+        DataType.double,
+    }
+    for name, col_type in zip(schema.input_names(), schema.input_types()):
+        if name in pdf.columns and col_type in numeric_types:
+            try:
+                pdf[name] = pdf[name].astype(col_type.to_pandas(), copy=False)
+            except Exception:
+                _handle_serving_error(
+                    error_message=f"Failed to convert column {name} to type '{col_type}'.",
+                    error_code=BAD_REQUEST,
+                )
+    return pdf
+
+
+def predictions_to_columnar_bytes(raw_predictions, content_type):
+    """
+    :return: The predictions serialized in the given columnar format, or ``None`` if they aren't
+             tabular and must be serialized as JSON.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(raw_predictions, pd.DataFrame):
+        pdf = raw_predictions
+    elif isinstance(raw_predictions, pd.Series):
+        pdf = raw_predictions.to_frame()
+    elif isinstance(raw_predictions, np.ndarray) and raw_predictions.ndim in (1, 2):
+        pdf = pd.DataFrame(raw_predictions)
+    else:
+        return None
+    try:
+        return dataframe_to_columnar_bytes(pdf, content_type)
+    except Exception as e:
+        _logger.debug("Failed to serialize the predictions in the '%s' format: %s", content_type, e)
+        return None
+
+
+def _get_accepted_columnar_content_type(accept):
+    """
+    :param accept: The value of the ``Accept`` header of the request, if any.
+    :return: The first columnar content type accepted by the client, or ``None``.
+    """
+    for media_range in (accept or "").split(","):
+        mime_type = media_range.split(";")[0].strip()
+        if mime_type in COLUMNAR_CONTENT_TYPES:
+            return mime_type
+    return None
+
+
 def predictions_to_json(raw_predictions, output, metadata=None):
     if metadata and "predictions" in metadata:
         raise MlflowException(
             "metadata cannot contain 'predictions' key", error_code=INVALID_PARAMETER_VALUE
         )
     predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
-    return json.dump({"predictions": predictions, **(metadata or {})}, output, cls=NumpyEncoder)
+    payload = {"predictions": predictions, **(metadata or {})}
+    orjson = _get_orjson()
+    if orjson is not None:
+        encoded = orjson.dumps(
+            payload,
+            default=NumpyEncoder().default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+        output.write(encoded.decode("utf-8"))
+    else:
+        output.write(json.dumps(payload, cls=NumpyEncoder))
 
 
 def _handle_serving_error(error_message, error_code, include_traceback=True):
@@ -187,12 +367,146 @@ def _handle_serving_error(error_message, error_code, include_traceback=True):
     reraise(MlflowException, e)
 
 
+InvocationsResponse = namedtuple("InvocationsResponse", ["response", "status", "mimetype"])
+
+
+def _get_micro_batcher(model: PyFuncModel):
+    """
+    :return: A ``MicroBatcher`` predicting with the model if micro-batching is enabled, ``None``
+             otherwise.
+    """
+    max_batch_size = MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get()
+    if not max_batch_size:
+        return None
+
+    from mlflow.pyfunc.scoring_server.batching import MicroBatcher
+
+    return MicroBatcher(
+        model.predict,
+        max_batch_size=max_batch_size,
+        max_wait_ms=MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS.get(),
+    )
+
+
+def invocations(data, content_type, predict, input_schema, accept=None):
+    """
+    Do an inference on a single batch of data. In this sample server,
+    we take data as CSV, json, Arrow or Parquet, convert it to a Pandas DataFrame or Numpy,
+    generate predictions and convert them back to json, or to Arrow or Parquet if requested.
+
+    :param data: The body of the request, as bytes.
+    :param content_type: The value of the ``Content-Type`` header of the request.
+    :param predict: The function generating the predictions, typically ``PyFuncModel.predict``.
+    :param input_schema: The input schema of the model, if any.
+    :param accept: The value of the ``Accept`` header of the request, if any.
+    :return: An ``InvocationsResponse``. Errors are raised as ``MlflowException``.
+    """
+
+    # Content-Type can include other attributes like CHARSET
+    # Content-type RFC: https://datatracker.ietf.org/doc/html/rfc2045#section-5.1
+    # TODO: Suport ";" in quoted parameter values
+    type_parts = content_type.split(";")
+    type_parts = list(map(str.strip, type_parts))
+    mime_type = type_parts[0]
+    parameter_value_pairs = type_parts[1:]
+    parameter_values = {}
+    for parameter_value_pair in parameter_value_pairs:
+        (key, _, value) = parameter_value_pair.partition("=")
+        parameter_values[key] = value
+
+    charset = parameter_values.get("charset", "utf-8").lower()
+    if charset != "utf-8":
+        return InvocationsResponse(
+            response="The scoring server only supports UTF-8",
+            status=415,
+            mimetype="text/plain",
+        )
+
+    unexpected_content_parameters = set(parameter_values.keys()).difference({"charset"})
+    if unexpected_content_parameters:
+        return InvocationsResponse(
+            response=(
+                f"Unrecognized content type parameters: "
+                f"{', '.join(unexpected_content_parameters)}. "
+                f"{SCORING_PROTOCOL_CHANGE_INFO}"
+            ),
+            status=415,
+            mimetype="text/plain",
+        )
+    # Convert from CSV to pandas
+    if mime_type == CONTENT_TYPE_CSV:
+        csv_input = StringIO(data.decode("utf-8"))
+        data = parse_csv_input(csv_input=csv_input, schema=input_schema)
+    elif mime_type == CONTENT_TYPE_JSON:
+        json_str = data.decode("utf-8")
+        data = infer_and_parse_json_input(json_str, input_schema)
+    elif mime_type in COLUMNAR_CONTENT_TYPES:
+        if not _is_pyarrow_available():
+            # Reported as an unsupported content type so that clients fall back to JSON
+            return InvocationsResponse(
+                response=(
+                    f"The '{mime_type}' content type requires the 'pyarrow' package, which isn't"
+                    " installed in the environment of the scoring server."
+                ),
+                status=415,
+                mimetype="text/plain",
+            )
+        data = parse_columnar_input(data, mime_type, input_schema)
+    else:
+        return InvocationsResponse(
+            response=(
+                "This predictor only supports the following content types:"
+                f" Types: {CONTENT_TYPES}."
+                f" Got '{content_type}'."
+            ),
+            status=415,
+            mimetype="text/plain",
+        )
+
+    # Do the prediction
+    try:
+        raw_predictions = predict(data)
+    except MlflowException as e:
+        raise e
+    except Exception:
+        raise MlflowException(
+            message=(
+                "Encountered an unexpected error while evaluating the model. Verify"
+                " that the serialized input Dataframe is compatible with the model for"
+                " inference."
+            ),
+            error_code=BAD_REQUEST,
+            stack_trace=traceback.format_exc(),
+        )
+    response_content_type = _get_accepted_columnar_content_type(accept)
+    if response_content_type is not None:
+        result = predictions_to_columnar_bytes(raw_predictions, response_content_type)
+        if result is not None:
+            return InvocationsResponse(response=result, status=200, mimetype=response_content_type)
+    result = StringIO()
+    predictions_to_json(raw_predictions, result)
+    return InvocationsResponse(response=result.getvalue(), status=200, mimetype="application/json")
+
+
 def init(model: PyFuncModel):
     """
     Initialize the server. Loads pyfunc model from the path.
     """
     app = flask.Flask(__name__)
     input_schema = model.metadata.get_input_schema()
+    batcher = _get_micro_batcher(model)
+    predict = batcher.predict if batcher else model.predict
+
+    if batcher:
+
+        @app.route("/metrics", methods=["GET"])
+        def metrics():
+            """
+            Returns the micro-batching histograms in the Prometheus text format.
+            """
+            return flask.Response(
+                response=batcher.get_metrics(), status=200, mimetype=CONTENT_TYPE_PROMETHEUS
+            )
 
     @app.route("/ping", methods=["GET"])
     @app.route("/health", methods=["GET"])
@@ -216,79 +530,18 @@ def init(model: PyFuncModel):
     @catch_mlflow_exception
     def transformation():
         """
-        Do an inference on a single batch of data. In this sample server,
-        we take data as CSV or json, convert it to a Pandas DataFrame or Numpy,
-        generate predictions and convert them back to json.
+        Do an inference on a single batch of data.
         """
-
-        # Content-Type can include other attributes like CHARSET
-        # Content-type RFC: https://datatracker.ietf.org/doc/html/rfc2045#section-5.1
-        # TODO: Suport ";" in quoted parameter values
-        type_parts = flask.request.content_type.split(";")
-        type_parts = list(map(str.strip, type_parts))
-        mime_type = type_parts[0]
-        parameter_value_pairs = type_parts[1:]
-        parameter_values = {}
-        for parameter_value_pair in parameter_value_pairs:
-            (key, _, value) = parameter_value_pair.partition("=")
-            parameter_values[key] = value
-
-        charset = parameter_values.get("charset", "utf-8").lower()
-        if charset != "utf-8":
-            return flask.Response(
-                response="The scoring server only supports UTF-8",
-                status=415,
-                mimetype="text/plain",
-            )
-
-        unexpected_content_parameters = set(parameter_values.keys()).difference({"charset"})
-        if unexpected_content_parameters:
-            return flask.Response(
-                response=(
-                    f"Unrecognized content type parameters: "
-                    f"{', '.join(unexpected_content_parameters)}. "
-                    f"{SCORING_PROTOCOL_CHANGE_INFO}"
-                ),
-                status=415,
-                mimetype="text/plain",
-            )
-        # Convert from CSV to pandas
-        if mime_type == CONTENT_TYPE_CSV:
-            data = flask.request.data.decode("utf-8")
-            csv_input = StringIO(data)
-            data = parse_csv_input(csv_input=csv_input, schema=input_schema)
-        elif mime_type == CONTENT_TYPE_JSON:
-            json_str = flask.request.data.decode("utf-8")
-            data = infer_and_parse_json_input(json_str, input_schema)
-        else:
-            return flask.Response(
-                response=(
-                    "This predictor only supports the following content types:"
-                    f" Types: {CONTENT_TYPES}."
-                    f" Got '{flask.request.content_type}'."
-                ),
-                status=415,
-                mimetype="text/plain",
-            )
-
-        # Do the prediction
-        try:
-            raw_predictions = model.predict(data)
-        except MlflowException as e:
-            raise e
-        except Exception:
-            raise MlflowException(
-                message=(
-                    "Encountered an unexpected error while evaluating the model. Verify"
-                    " that the serialized input Dataframe is compatible with the model for"
-                    " inference."
-                ),
-                error_code=BAD_REQUEST,
-                stack_trace=traceback.format_exc(),
-            )
-        result = StringIO()
-        predictions_to_json(raw_predictions, result)
-        return flask.Response(response=result.getvalue(), status=200, mimetype="application/json")
+        result = invocations(
+            flask.request.data,
+            flask.request.content_type,
+            predict,
+            input_schema,
+            accept=flask.request.headers.get("Accept"),
+        )
+        return flask.Response(
+            response=result.response, status=result.status, mimetype=result.mimetype
+        )
 
     return app
 
@@ -324,13 +577,36 @@ def _serve(model_uri, port, host):
 
 
 def get_cmd(
-    model_uri: str, port: int = None, host: int = None, timeout: int = None, nworkers: int = None
+    model_uri: str,
+    port: int = None,
+    host: int = None,
+    timeout: int = None,
+    nworkers: int = None,
+    enable_asgi: bool = False,
 ) -> Tuple[str, Dict[str, str]]:
     local_uri = path_to_local_file_uri(model_uri)
     timeout = timeout or MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.get()
+    # Requests are only batched together if they are handled concurrently by the same worker
+    max_batch_size = MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE.get()
+    batching_threads = min(max_batch_size, _MAX_BATCHING_THREADS) if max_batch_size else None
+    command_env = os.environ.copy()
     # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
     # platform compatibility.
-    if os.name != "nt":
+    if enable_asgi:
+        args = []
+        if host:
+            args.append(f"--host={host}")
+
+        if port:
+            args.append(f"--port={port}")
+
+        if nworkers:
+            args.append(f"--workers={nworkers}")
+
+        # uvicorn doesn't time out requests, the ASGI app does
+        command_env[MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.name] = str(timeout)
+        command = f"uvicorn {' '.join(args)} --factory mlflow.pyfunc.scoring_server.asgi:create_app"
+    elif os.name != "nt":
         args = [f"--timeout={timeout}"]
         if port and host:
             args.append(f"-b {host}:{port}")
@@ -340,6 +616,12 @@ def get_cmd(
         if nworkers:
             args.append(f"-w {nworkers}")
 
+        if batching_threads:
+            args.append(f"--threads={batching_threads}")
+
+        if MLFLOW_SCORING_SERVER_PRELOAD_MODEL.get():
+            args.append("--preload")
+
         command = (
             f"gunicorn {' '.join(args)} ${{GUNICORN_CMD_ARGS}}"
             " -- mlflow.pyfunc.scoring_server.wsgi:app"
@@ -352,12 +634,14 @@ def get_cmd(
         if port:
             args.append(f"--port={port}")
 
+        if batching_threads:
+            args.append(f"--threads={batching_threads}")
+
         command = (
             f"waitress-serve {' '.join(args)} "
             "--ident=mlflow mlflow.pyfunc.scoring_server.wsgi:app"
         )
 
-    command_env = os.environ.copy()
     command_env[_SERVER_MODEL_PATH] = local_uri
 
     return command, command_env
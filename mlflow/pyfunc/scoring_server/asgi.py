@@ -0,0 +1,104 @@
+"""
+ASGI implementation of the scoring server for python model format, served with ``uvicorn``.
+
+It defines the same endpoints as the WSGI scoring server, but a single worker process serves many
+concurrent connections with one copy of the model: the event loop keeps accepting requests while
+they are parsed and predicted in a bounded thread pool. Requires ``fastapi`` and ``uvicorn``.
+"""
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+
+from mlflow.environment_variables import (
+    MLFLOW_SCORING_SERVER_ASGI_MAX_THREADS,
+    MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.pyfunc import PyFuncModel, load_model, scoring_server
+from mlflow.version import VERSION
+
+
+def init(model: PyFuncModel, max_threads: int = None, timeout: int = None) -> FastAPI:
+    """
+    Initialize the server.
+
+    :param model: The model to serve.
+    :param max_threads: The maximum number of requests predicted concurrently. Defaults to the
+                        number of threads of a ``concurrent.futures.ThreadPoolExecutor``.
+    :param timeout: Time in seconds after which a request fails with a 504 error if its
+                    prediction isn't complete. Defaults to no timeout.
+    """
+    app = FastAPI()
+    input_schema = model.metadata.get_input_schema()
+    batcher = scoring_server._get_micro_batcher(model)
+    predict = batcher.predict if batcher else model.predict
+    executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="MlflowScoringServer")
+
+    if batcher:
+
+        @app.get("/metrics")
+        async def metrics():
+            return Response(
+                content=batcher.get_metrics(),
+                status_code=200,
+                media_type=scoring_server.CONTENT_TYPE_PROMETHEUS,
+            )
+
+    @app.get("/ping")
+    @app.get("/health")
+    async def ping():
+        return Response(content="\n", status_code=200, media_type="application/json")
+
+    @app.get("/version")
+    async def version():
+        return Response(content=VERSION, status_code=200, media_type="application/json")
+
+    @app.post("/invocations")
+    async def invocations(request: Request):
+        data = await request.body()
+        content_type = request.headers.get("content-type", "")
+        prediction = asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                scoring_server.invocations,
+                data,
+                content_type,
+                predict,
+                input_schema,
+                accept=request.headers.get("accept"),
+            ),
+        )
+        try:
+            result = await asyncio.wait_for(prediction, timeout)
+        except MlflowException as e:
+            return Response(
+                content=e.serialize_as_json(),
+                status_code=e.get_http_status_code(),
+                media_type="application/json",
+            )
+        except asyncio.TimeoutError:
+            return Response(
+                content=f"The prediction did not complete within {timeout} seconds.",
+                status_code=504,
+                media_type="text/plain",
+            )
+        return Response(
+            content=result.response, status_code=result.status, media_type=result.mimetype
+        )
+
+    return app
+
+
+def create_app() -> FastAPI:
+    """
+    Application factory used by ``uvicorn``, serving the model referenced by the environment.
+    """
+    return init(
+        load_model(os.environ[scoring_server._SERVER_MODEL_PATH]),
+        max_threads=MLFLOW_SCORING_SERVER_ASGI_MAX_THREADS.get(),
+        timeout=MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT.get(),
+    )
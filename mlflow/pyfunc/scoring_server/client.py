@@ -33,8 +33,19 @@ class BaseScoringServerClient(ABC):
 
 
 class ScoringServerClient(BaseScoringServerClient):
-    def __init__(self, host, port):
+    """
+    :param host: The host of the scoring server.
+    :param port: The port of the scoring server.
+    :param columnar_content_type: The binary format, one of
+                                  ``scoring_server.COLUMNAR_CONTENT_TYPES``, in which DataFrame
+                                  inputs and tabular predictions are exchanged with the server.
+                                  If ``None``, or if the server doesn't support it, they are
+                                  exchanged as JSON.
+    """
+
+    def __init__(self, host, port, columnar_content_type=scoring_server.CONTENT_TYPE_ARROW):
         self.url_prefix = f"http://{host}:{port}"
+        self.columnar_content_type = columnar_content_type
 
     def ping(self):
         ping_status = requests.get(url=self.url_prefix + "/ping")
@@ -66,15 +77,57 @@ class ScoringServerClient(BaseScoringServerClient):
         raise RuntimeError("Wait scoring server ready timeout.")
 
     def invoke(self, data):
+        import pandas as pd
+
+        if isinstance(data, pd.DataFrame) and self.columnar_content_type is not None:
+            response = self._invoke_columnar(data)
+            if response is not None:
+                return response
+
         response = requests.post(
             url=self.url_prefix + "/invocations",
             data=dump_input_data(data),
             headers={"Content-Type": scoring_server.CONTENT_TYPE_JSON},
         )
+        return self._parse_response(response)
+
+    def _invoke_columnar(self, data):
+        """
+        :return: The predictions, or ``None`` if the input must be sent as JSON instead.
+        """
+        content_type = self.columnar_content_type
+        try:
+            body = scoring_server.dataframe_to_columnar_bytes(data, content_type)
+        except Exception as e:
+            _logger.debug("Failed to serialize the input in the '%s' format: %s", content_type, e)
+            return None
+
+        response = requests.post(
+            url=self.url_prefix + "/invocations",
+            data=body,
+            headers={
+                "Content-Type": content_type,
+                "Accept": f"{content_type}, {scoring_server.CONTENT_TYPE_JSON}",
+            },
+        )
+        if response.status_code == 415:
+            # The server runs a version of MLflow that doesn't support the format
+            _logger.debug("The scoring server doesn't support the '%s' format", content_type)
+            self.columnar_content_type = None
+            return None
+        return self._parse_response(response)
+
+    def _parse_response(self, response):
         if response.status_code != 200:
             raise Exception(
                 f"Invocation failed (error code {response.status_code}, response: {response.text})"
             )
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type in scoring_server.COLUMNAR_CONTENT_TYPES:
+            predictions = scoring_server.dataframe_from_columnar_bytes(
+                response.content, content_type
+            )
+            return PredictionsResponse({"predictions": predictions})
         return PredictionsResponse.from_json(response.text)
 
 
@@ -1,6 +1,14 @@
+import gc
 import os
+from mlflow.environment_variables import MLFLOW_SCORING_SERVER_PRELOAD_MODEL
 from mlflow.pyfunc import scoring_server
 from mlflow.pyfunc import load_model
 
 
 app = scoring_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]))
+
+if MLFLOW_SCORING_SERVER_PRELOAD_MODEL.get():
+    # The app is loaded in the gunicorn master process. Move the objects loaded so far out of the
+    # garbage collector's generations so that collections in the forked workers don't write to
+    # them, which would copy the memory pages they share with the master.
+    gc.freeze()
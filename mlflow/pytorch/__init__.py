@@ -23,7 +23,10 @@ import posixpath
 import mlflow
 import shutil
 from mlflow import pyfunc
-from mlflow.environment_variables import MLFLOW_DEFAULT_PREDICTION_DEVICE
+from mlflow.environment_variables import (
+    MLFLOW_DEFAULT_PREDICTION_DEVICE,
+    MLFLOW_MMAP_MODEL_WEIGHTS,
+)
 from mlflow.exceptions import MlflowException
 from mlflow.ml_package_versions import _ML_PACKAGE_VERSIONS
 from mlflow.models import Model, ModelSignature
@@ -715,6 +718,17 @@ def _load_pyfunc(path, **kwargs):
 
     :param path: Local filesystem path to the MLflow Model with the ``pytorch`` flavor.
     """
+    if MLFLOW_MMAP_MODEL_WEIGHTS.get() and "mmap" not in kwargs:
+        import torch
+
+        if Version(torch.__version__) >= Version("2.1.0"):
+            kwargs["mmap"] = True
+        else:
+            _logger.warning(
+                "Memory-mapping the weights of PyTorch models requires PyTorch >= 2.1.0, but"
+                " PyTorch %s is installed. The weights will be read into memory.",
+                torch.__version__,
+            )
     return _PyTorchWrapper(_load_model(path, **kwargs))
 
 
@@ -55,6 +55,7 @@ class RFuncBackend(FlavorBackend):
         synchronous=True,
         stdout=None,
         stderr=None,
+        enable_asgi=False,
     ):
         """
         Generate R model locally.
@@ -66,6 +67,9 @@ class RFuncBackend(FlavorBackend):
         if enable_mlserver:
             raise Exception("The MLServer inference server is not yet supported in the R backend.")
 
+        if enable_asgi:
+            raise Exception("The ASGI scoring server is not supported in the R backend.")
+
         if timeout:
             _logger.warning("Timeout is not yet supported in the R backend.")
 
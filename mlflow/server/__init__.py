@@ -14,6 +14,7 @@ from mlflow.server import handlers
 from mlflow.server.handlers import (
     get_artifact_handler,
     get_metric_history_bulk_handler,
+    get_sampled_metric_history_bulk_handler,
     STATIC_PREFIX_ENV_VAR,
     _add_static_prefix,
     get_model_version_artifact_handler,
@@ -81,6 +82,12 @@ def serve_get_metric_history_bulk():
     return get_metric_history_bulk_handler()
 
 
+# Serve the "metrics/get-sampled-history-bulk" route.
+@app.route(_add_static_prefix("/ajax-api/2.0/mlflow/metrics/get-sampled-history-bulk"))
+def serve_get_sampled_metric_history_bulk():
+    return get_sampled_metric_history_bulk_handler()
+
+
 # Serve the "experiments/search-datasets" route.
 @app.route(_add_static_prefix("/ajax-api/2.0/mlflow/experiments/search-datasets"))
 def serve_search_datasets():
@@ -10,7 +10,7 @@ Usage
 import logging
 import uuid
 import re
-from typing import Callable, Dict, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 from flask import Flask, request, make_response, Response, flash, render_template_string
 import sqlalchemy
@@ -57,6 +57,7 @@ from mlflow.protos.databricks_pb2 import (
 from mlflow.protos.service_pb2 import (
     GetExperiment,
     GetRun,
+    GetRuns,
     ListArtifacts,
     GetMetricHistory,
     CreateRun,
@@ -70,6 +71,7 @@ from mlflow.protos.service_pb2 import (
     DeleteRun,
     UpdateExperiment,
     LogBatch,
+    LogBatches,
     DeleteTag,
     SetExperimentTag,
     GetExperimentByName,
@@ -226,6 +228,29 @@ def _get_permission_from_run_id() -> Permission:
     )
 
 
+def _validate_run_ids(param: str, run_ids) -> List[str]:
+    if not isinstance(run_ids, list) or not all(isinstance(r, str) for r in run_ids):
+        raise MlflowException(
+            f"Invalid value for parameter '{param}': expected a list of run IDs.",
+            INVALID_PARAMETER_VALUE,
+        )
+    return run_ids
+
+
+def _get_permissions_from_run_ids(run_ids: List[str]) -> List[Permission]:
+    # run permissions inherit from parent resource (experiment)
+    # so we get the permission of each distinct experiment of the runs
+    run_infos = _get_tracking_store()._get_run_infos(run_ids)
+    experiment_ids = {run_info.experiment_id for run_info in run_infos.values()}
+    username = request.authorization.username
+    return [
+        _get_permission_from_store_or_default(
+            lambda: store.get_experiment_permission(experiment_id, username).permission
+        )
+        for experiment_id in experiment_ids
+    ]
+
+
 def _get_permission_from_registered_model_name() -> Permission:
     name = _get_request_param("name")
     username = request.authorization.username
@@ -270,6 +295,22 @@ def validate_can_update_run():
     return _get_permission_from_run_id().can_update
 
 
+def validate_can_read_runs():
+    run_ids = _validate_run_ids("run_ids", _get_request_param("run_ids"))
+    return all(p.can_read for p in _get_permissions_from_run_ids(run_ids))
+
+
+def validate_can_update_runs():
+    batches = _get_request_param("batches")
+    if not isinstance(batches, list) or not all(isinstance(b, dict) for b in batches):
+        raise MlflowException(
+            "Invalid value for parameter 'batches': expected a list of batches.",
+            INVALID_PARAMETER_VALUE,
+        )
+    run_ids = _validate_run_ids("batches.run_id", [batch.get("run_id") for batch in batches])
+    return all(p.can_update for p in _get_permissions_from_run_ids(run_ids))
+
+
 def validate_can_delete_run():
     return _get_permission_from_run_id().can_delete
 
@@ -336,11 +377,13 @@ BEFORE_REQUEST_HANDLERS = {
     # Routes for runs
     CreateRun: validate_can_update_experiment,
     GetRun: validate_can_read_run,
+    GetRuns: validate_can_read_runs,
     DeleteRun: validate_can_delete_run,
     RestoreRun: validate_can_delete_run,
     UpdateRun: validate_can_update_run,
     LogMetric: validate_can_update_run,
     LogBatch: validate_can_update_run,
+    LogBatches: validate_can_update_runs,
     LogModel: validate_can_update_run,
     SetTag: validate_can_update_run,
     DeleteTag: validate_can_update_run,
@@ -398,7 +441,12 @@ BEFORE_REQUEST_VALIDATORS.update(
 
 
 def _is_proxy_artifact_path(path: str) -> bool:
-    return path.startswith(f"{_REST_API_PATH_PREFIX}/mlflow-artifacts/artifacts/")
+    return path.startswith(
+        (
+            f"{_REST_API_PATH_PREFIX}/mlflow-artifacts/artifacts/",
+            f"{_REST_API_PATH_PREFIX}/mlflow-artifacts/mpu/",
+        )
+    )
 
 
 def _get_proxy_artifact_validator(
@@ -410,6 +458,7 @@ def _get_proxy_artifact_validator(
     return {
         "GET": validate_can_read_experiment_artifact_proxy,  # Download
         "PUT": validate_can_update_experiment_artifact_proxy,  # Upload
+        "POST": validate_can_update_experiment_artifact_proxy,  # Multipart upload
         "DELETE": validate_can_update_experiment_artifact_proxy,  # Delete
     }.get(method)
 
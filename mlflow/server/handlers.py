@@ -6,12 +6,14 @@ import posixpath
 import urllib
 import pathlib
 import re
+import shutil
 
 import logging
-from functools import wraps
+from functools import partial, wraps
 
 from flask import Response, request, current_app, send_file
 from google.protobuf import descriptor
+from werkzeug.datastructures import ContentRange
 from google.protobuf.json_format import ParseError
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag, FileInfo, DatasetInput
@@ -24,6 +26,7 @@ from mlflow.protos.service_pb2 import (
     MlflowService,
     GetExperiment,
     GetRun,
+    GetRuns,
     SearchRuns,
     ListArtifacts,
     GetMetricHistory,
@@ -39,6 +42,7 @@ from mlflow.protos.service_pb2 import (
     DeleteRun,
     UpdateExperiment,
     LogBatch,
+    LogBatches,
     DeleteTag,
     SetExperimentTag,
     GetExperimentByName,
@@ -75,10 +79,15 @@ from mlflow.protos.mlflow_artifacts_pb2 import (
     UploadArtifact,
     ListArtifacts as ListArtifactsMlflowArtifacts,
     DeleteArtifact,
+    CreateMultipartUpload,
+    UploadPart,
+    CompleteMultipartUpload,
+    AbortMultipartUpload,
 )
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, INVALID_PARAMETER_VALUE
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.store.tracking.metric_sampling import METRIC_SAMPLING_X_AXES
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
 from mlflow.utils.mime_type_utils import _guess_mime_type
@@ -86,7 +95,7 @@ from mlflow.utils.proto_json_utils import message_to_json, parse_dict
 from mlflow.utils.validation import _validate_batch_log_api_req
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import is_local_uri, is_file_uri
-from mlflow.utils.file_utils import local_file_uri_to_path
+from mlflow.utils.file_utils import local_file_uri_to_path, yield_file_range_in_chunks
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 from mlflow.environment_variables import MLFLOW_ALLOW_FILE_URI_AS_MODEL_VERSION_SOURCE
 
@@ -410,6 +419,11 @@ def _get_request_message(request_message, flask_request=request, schema=None):
             ):
                 if not isinstance(request_dict[field.name], list):
                     request_dict[field.name] = [request_dict[field.name]]
+            # Likewise, boolean values are parsed as strings, which protobuf doesn't accept.
+            elif field.type == descriptor.FieldDescriptor.TYPE_BOOL and request_dict.get(
+                field.name
+            ) in ("true", "false"):
+                request_dict[field.name] = request_dict[field.name] == "true"
         parse_dict(request_dict, request_message)
         return request_message
 
@@ -892,6 +906,21 @@ def _get_run():
     return response
 
 
+@catch_mlflow_exception
+@_disable_if_artifacts_only
+def _get_runs():
+    request_message = _get_request_message(
+        GetRuns(),
+        schema={"run_ids": [_assert_required, _assert_array, _assert_item_type_string]},
+    )
+    response_message = GetRuns.Response()
+    runs = _get_tracking_store().get_runs(list(request_message.run_ids))
+    response_message.runs.extend([run.to_proto() for run in runs])
+    response = Response(mimetype="application/json")
+    response.set_data(message_to_json(response_message))
+    return response
+
+
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def _search_runs():
@@ -1087,6 +1116,93 @@ def get_metric_history_bulk_handler():
     }
 
 
+@catch_mlflow_exception
+@_disable_if_artifacts_only
+def get_sampled_metric_history_bulk_handler():
+    MAX_RUN_IDS_PER_REQUEST = 100
+    MAX_METRIC_KEYS_PER_REQUEST = 10
+    MAX_POINTS_PER_SERIES = 10000
+    DEFAULT_POINTS_PER_SERIES = 1000
+    args = request.args.to_dict(flat=False)
+    run_ids = args.get("run_id", [])
+    if not run_ids:
+        raise MlflowException(
+            message="GetSampledMetricHistoryBulk request must specify at least one run_id.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if len(run_ids) > MAX_RUN_IDS_PER_REQUEST:
+        raise MlflowException(
+            message=(
+                "GetSampledMetricHistoryBulk request cannot specify more than "
+                f"{MAX_RUN_IDS_PER_REQUEST} run_ids. Received {len(run_ids)} run_ids."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    metric_keys = args.get("metric_key", [])
+    if not metric_keys:
+        raise MlflowException(
+            message="GetSampledMetricHistoryBulk request must specify at least one metric_key.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if len(metric_keys) > MAX_METRIC_KEYS_PER_REQUEST:
+        raise MlflowException(
+            message=(
+                "GetSampledMetricHistoryBulk request cannot specify more than "
+                f"{MAX_METRIC_KEYS_PER_REQUEST} metric_keys. Received {len(metric_keys)} "
+                "metric_keys."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    try:
+        max_points = int(request.args.get("max_points", DEFAULT_POINTS_PER_SERIES))
+    except ValueError:
+        raise MlflowException(
+            message="GetSampledMetricHistoryBulk request max_points must be an integer.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if not 2 <= max_points <= MAX_POINTS_PER_SERIES:
+        raise MlflowException(
+            message=(
+                "GetSampledMetricHistoryBulk request max_points must be between 2 and "
+                f"{MAX_POINTS_PER_SERIES}. Received {max_points}."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    x_axis = request.args.get("x_axis", "step")
+    if x_axis not in METRIC_SAMPLING_X_AXES:
+        raise MlflowException(
+            message=(
+                f"GetSampledMetricHistoryBulk request x_axis must be one of "
+                f"{list(METRIC_SAMPLING_X_AXES)}. Received '{x_axis}'."
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    histories = _get_tracking_store().get_sampled_metric_history_bulk(
+        run_ids=sorted(set(run_ids)),
+        metric_keys=sorted(set(metric_keys)),
+        max_points=max_points,
+        x_axis=x_axis,
+    )
+    return {
+        "metrics": [
+            {
+                "key": metric.key,
+                "value": metric.value,
+                "timestamp": metric.timestamp,
+                "step": metric.step,
+                "run_id": run_id,
+            }
+            for run_id, run_histories in sorted(histories.items())
+            for _, history in sorted(run_histories.items())
+            for metric in history
+        ]
+    }
+
+
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def search_datasets_handler():
@@ -1152,19 +1268,21 @@ def _get_artifact_repo(run):
     return get_artifact_repository(run.info.artifact_uri)
 
 
+def _assert_metrics_fields_present(metrics):
+    for m in metrics:
+        _assert_required(m.get("key"))
+        _assert_required(m.get("value"))
+        _assert_required(m.get("timestamp"))
+
+
+def _assert_params_tags_fields_present(params_or_tags):
+    for param_or_tag in params_or_tags:
+        _assert_required(param_or_tag.get("key"))
+
+
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def _log_batch():
-    def _assert_metrics_fields_present(metrics):
-        for m in metrics:
-            _assert_required(m.get("key"))
-            _assert_required(m.get("value"))
-            _assert_required(m.get("timestamp"))
-
-    def _assert_params_tags_fields_present(params_or_tags):
-        for param_or_tag in params_or_tags:
-            _assert_required(param_or_tag.get("key"))
-
     _validate_batch_log_api_req(_get_request_json())
     request_message = _get_request_message(
         LogBatch(),
@@ -1187,6 +1305,42 @@ def _log_batch():
     return response
 
 
+@catch_mlflow_exception
+@_disable_if_artifacts_only
+def _log_batches():
+    def _assert_batches_fields_present(batches):
+        for batch in batches:
+            _assert_required(batch.get("run_id"))
+            _assert_string(batch["run_id"])
+            for field, assert_fields_present in [
+                ("metrics", _assert_metrics_fields_present),
+                ("params", _assert_params_tags_fields_present),
+                ("tags", _assert_params_tags_fields_present),
+            ]:
+                _assert_array(batch.get(field, []))
+                assert_fields_present(batch.get(field, []))
+
+    _validate_batch_log_api_req(_get_request_json())
+    request_message = _get_request_message(
+        LogBatches(),
+        schema={"batches": [_assert_required, _assert_array, _assert_batches_fields_present]},
+    )
+    batches = [
+        (
+            batch.run_id,
+            [Metric.from_proto(proto_metric) for proto_metric in batch.metrics],
+            [Param.from_proto(proto_param) for proto_param in batch.params],
+            [RunTag.from_proto(proto_tag) for proto_tag in batch.tags],
+        )
+        for batch in request_message.batches
+    ]
+    _get_tracking_store().log_batches(batches)
+    response_message = LogBatches.Response()
+    response = Response(mimetype="application/json")
+    response.set_data(message_to_json(response_message))
+    return response
+
+
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def _log_model():
@@ -1717,24 +1871,59 @@ def _get_model_version_by_alias():
 def _download_artifact(artifact_path):
     """
     A request handler for `GET /mlflow-artifacts/artifacts/<artifact_path>` to download an artifact
-    from `artifact_path` (a relative path from the root artifact directory).
+    from `artifact_path` (a relative path from the root artifact directory). A single byte range
+    can be requested with a `Range` header.
     """
     validate_path_is_safe(artifact_path)
-    tmp_dir = tempfile.TemporaryDirectory()
     artifact_repo = _get_artifact_repo_mlflow_artifacts()
-    dst = artifact_repo.download_artifacts(artifact_path, tmp_dir.name)
+    try:
+        file_size = artifact_repo._get_artifact_file_size(artifact_path)
+        stream_range = partial(artifact_repo._download_artifact_stream, artifact_path)
+        tmp_dir = None
+    except NotImplementedError:
+        # The artifact repository can't stream artifacts, download the artifact to a temporary
+        # directory and stream it from there
+        tmp_dir = tempfile.TemporaryDirectory()
+        dst = artifact_repo.download_artifacts(artifact_path, tmp_dir.name)
+        file_size = os.path.getsize(dst)
+        stream_range = partial(yield_file_range_in_chunks, dst)
 
-    # Ref: https://stackoverflow.com/a/24613980/6943581
-    file_handle = open(dst, "rb")
+    try:
+        response = _artifact_range_response(file_size, stream_range)
+    except BaseException:
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+        raise
+    if tmp_dir is not None:
+        response.call_on_close(tmp_dir.cleanup)
+    return _response_with_file_attachment_headers(artifact_path, response)
 
-    def stream_and_remove_file():
-        yield from file_handle
-        file_handle.close()
-        tmp_dir.cleanup()
 
-    file_sender_response = current_app.response_class(stream_and_remove_file())
+def _artifact_range_response(file_size, stream_range):
+    """
+    Builds the response streaming the artifact file of the specified size, or the byte range of it
+    requested by the `Range` header. Requests for several ranges are answered with the whole file.
 
-    return _response_with_file_attachment_headers(artifact_path, file_sender_response)
+    :param file_size: Size of the artifact file.
+    :param stream_range: Function taking the offsets of the first and last bytes of a range, and
+                         returning an iterator over the chunks of bytes of the range.
+    """
+    byte_range = request.range
+    if byte_range is not None and len(byte_range.ranges) == 1:
+        satisfiable_range = byte_range.range_for_length(file_size)
+        if satisfiable_range is None:
+            response = current_app.response_class(status=416)
+            response.content_range = ContentRange("bytes", None, None, file_size)
+            return response
+        start, stop = satisfiable_range
+        response = current_app.response_class(stream_range(start, stop - 1), status=206)
+        response.content_range = ContentRange("bytes", start, stop, file_size)
+        response.content_length = stop - start
+    else:
+        response = current_app.response_class(stream_range(0, None) if file_size else [])
+        response.content_length = file_size
+    response.accept_ranges = "bytes"
+    return response
 
 
 @catch_mlflow_exception
@@ -1745,6 +1934,15 @@ def _upload_artifact(artifact_path):
     to `artifact_path` (a relative path from the root artifact directory).
     """
     validate_path_is_safe(artifact_path)
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    try:
+        artifact_repo._log_artifact_stream(request.stream, artifact_path)
+        return _wrap_response(UploadArtifact.Response())
+    except NotImplementedError:
+        pass
+
+    # The artifact repository can't log streams, write the request body to a temporary file and
+    # log it from there
     head, tail = posixpath.split(artifact_path)
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = os.path.join(tmp_dir, tail)
@@ -1756,7 +1954,6 @@ def _upload_artifact(artifact_path):
                     break
                 f.write(chunk)
 
-        artifact_repo = _get_artifact_repo_mlflow_artifacts()
         artifact_repo.log_artifact(tmp_path, artifact_path=head or None)
 
     return _wrap_response(UploadArtifact.Response())
@@ -1767,7 +1964,8 @@ def _upload_artifact(artifact_path):
 def _list_artifacts_mlflow_artifacts():
     """
     A request handler for `GET /mlflow-artifacts/artifacts?path=<value>` to list artifacts in `path`
-    (a relative path from the root artifact directory).
+    (a relative path from the root artifact directory). With `recursive=true`, all the artifact
+    files under `path` are listed, with their paths relative to `path`.
     """
     request_message = _get_request_message(ListArtifactsMlflowArtifacts())
     if request_message.HasField("path"):
@@ -1777,10 +1975,16 @@ def _list_artifacts_mlflow_artifacts():
         path = None
     artifact_repo = _get_artifact_repo_mlflow_artifacts()
     files = []
-    for file_info in artifact_repo.list_artifacts(path):
-        basename = posixpath.basename(file_info.path)
-        new_file_info = FileInfo(basename, file_info.is_dir, file_info.file_size)
-        files.append(new_file_info.to_proto())
+    if request_message.recursive:
+        for file_info in artifact_repo.list_artifacts_recursive(path):
+            rel_path = posixpath.relpath(file_info.path, path) if path else file_info.path
+            new_file_info = FileInfo(rel_path, file_info.is_dir, file_info.file_size)
+            files.append(new_file_info.to_proto())
+    else:
+        for file_info in artifact_repo.list_artifacts(path):
+            basename = posixpath.basename(file_info.path)
+            new_file_info = FileInfo(basename, file_info.is_dir, file_info.file_size)
+            files.append(new_file_info.to_proto())
     response_message = ListArtifacts.Response()
     response_message.files.extend(files)
     response = Response(mimetype="application/json")
@@ -1805,6 +2009,101 @@ def _delete_artifact_mlflow_artifacts(artifact_path):
     return response
 
 
+def _multipart_upload_not_supported():
+    return MlflowException(
+        "The artifact repository of the tracking server does not support multipart uploads",
+        databricks_pb2.NOT_IMPLEMENTED,
+    )
+
+
+@catch_mlflow_exception
+@_disable_unless_serve_artifacts
+def _create_multipart_upload_artifact(artifact_path):
+    """
+    A request handler for `POST /mlflow-artifacts/mpu/create/<artifact_path>` to start a multipart
+    upload of an artifact to `artifact_path` (a relative path from the root artifact directory).
+    """
+    validate_path_is_safe(artifact_path)
+    _get_request_message(CreateMultipartUpload())
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    try:
+        upload_id = artifact_repo._create_multipart_upload(artifact_path)
+    except NotImplementedError:
+        raise _multipart_upload_not_supported()
+    return _wrap_response(CreateMultipartUpload.Response(upload_id=upload_id))
+
+
+@catch_mlflow_exception
+@_disable_unless_serve_artifacts
+def _upload_part_artifact(artifact_path):
+    """
+    A request handler for
+    `PUT /mlflow-artifacts/mpu/upload-part/<artifact_path>?upload_id=<value>&part_number=<value>`
+    to upload a part of a multipart upload. The request body is the content of the part.
+    """
+    validate_path_is_safe(artifact_path)
+    upload_id = request.args.get("upload_id")
+    part_number = request.args.get("part_number", type=int)
+    if not upload_id or part_number is None or part_number < 1:
+        raise MlflowException(
+            "The 'upload_id' and 'part_number' query parameters must be set to a multipart upload "
+            "ID and a positive part number",
+            INVALID_PARAMETER_VALUE,
+        )
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    with tempfile.TemporaryFile() as part_file:
+        shutil.copyfileobj(request.stream, part_file, 1024 * 1024)
+        part_file.seek(0)
+        try:
+            etag = artifact_repo._upload_multipart_part(
+                artifact_path, upload_id, part_number, part_file
+            )
+        except NotImplementedError:
+            raise _multipart_upload_not_supported()
+    return _wrap_response(UploadPart.Response(etag=etag))
+
+
+@catch_mlflow_exception
+@_disable_unless_serve_artifacts
+def _complete_multipart_upload_artifact(artifact_path):
+    """
+    A request handler for `POST /mlflow-artifacts/mpu/complete/<artifact_path>` to complete a
+    multipart upload by concatenating its parts into the artifact.
+    """
+    validate_path_is_safe(artifact_path)
+    request_message = _get_request_message(
+        CompleteMultipartUpload(),
+        schema={"upload_id": [_assert_required, _assert_string]},
+    )
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    parts = [(part.part_number, part.etag) for part in request_message.parts]
+    try:
+        artifact_repo._complete_multipart_upload(artifact_path, request_message.upload_id, parts)
+    except NotImplementedError:
+        raise _multipart_upload_not_supported()
+    return _wrap_response(CompleteMultipartUpload.Response())
+
+
+@catch_mlflow_exception
+@_disable_unless_serve_artifacts
+def _abort_multipart_upload_artifact(artifact_path):
+    """
+    A request handler for `POST /mlflow-artifacts/mpu/abort/<artifact_path>` to abort a multipart
+    upload and discard its uploaded parts.
+    """
+    validate_path_is_safe(artifact_path)
+    request_message = _get_request_message(
+        AbortMultipartUpload(),
+        schema={"upload_id": [_assert_required, _assert_string]},
+    )
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    try:
+        artifact_repo._abort_multipart_upload(artifact_path, request_message.upload_id)
+    except NotImplementedError:
+        raise _multipart_upload_not_supported()
+    return _wrap_response(AbortMultipartUpload.Response())
+
+
 def _get_rest_path(base_path):
     return f"/api/2.0{base_path}"
 
@@ -1877,8 +2176,10 @@ HANDLERS = {
     SetTag: _set_tag,
     DeleteTag: _delete_tag,
     LogBatch: _log_batch,
+    LogBatches: _log_batches,
     LogModel: _log_model,
     GetRun: _get_run,
+    GetRuns: _get_runs,
     SearchRuns: _search_runs,
     ListArtifacts: _list_artifacts,
     GetMetricHistory: _get_metric_history,
@@ -1911,4 +2212,8 @@ HANDLERS = {
     UploadArtifact: _upload_artifact,
     ListArtifactsMlflowArtifacts: _list_artifacts_mlflow_artifacts,
     DeleteArtifact: _delete_artifact_mlflow_artifacts,
+    CreateMultipartUpload: _create_multipart_upload_artifact,
+    UploadPart: _upload_part_artifact,
+    CompleteMultipartUpload: _complete_multipart_upload_artifact,
+    AbortMultipartUpload: _abort_multipart_upload_artifact,
 }
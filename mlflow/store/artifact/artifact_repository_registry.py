@@ -1,8 +1,14 @@
 import entrypoints
 import warnings
 
+from mlflow.environment_variables import (
+    MLFLOW_ARTIFACT_BLOB_STORE_URI,
+    MLFLOW_ARTIFACT_COMPRESSION,
+)
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.azure_blob_artifact_repo import AzureBlobArtifactRepository
+from mlflow.store.artifact.compressed_artifact_repo import CompressedArtifactRepository
+from mlflow.store.artifact.content_addressed_artifact_repo import ContentAddressedArtifactRepository
 from mlflow.store.artifact.dbfs_artifact_repo import dbfs_artifact_repo_factory
 from mlflow.store.artifact.ftp_artifact_repo import FTPArtifactRepository
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
@@ -109,9 +115,37 @@ def get_artifact_repository(artifact_uri):
                          constructor of the implementation.
 
     :return: An instance of `mlflow.store.ArtifactRepository` that fulfills the artifact URI
-             requirements.
+             requirements. If ``MLFLOW_ARTIFACT_COMPRESSION`` is set, text artifact files are
+             compressed with the specified codec. If ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` is set, the
+             artifact files are deduplicated in the specified blob store. The repository is wrapped
+             to resolve compressed and deduplicated artifacts whether they're set or not, use
+             :py:func:`get_underlying_artifact_repository` to get the repository of the URI.
     """
-    return _artifact_repository_registry.get_artifact_repository(artifact_uri)
+    repo = _artifact_repository_registry.get_artifact_repository(artifact_uri)
+    # The repositories of `runs:/` and `models:/` URIs use the repository of the artifact URI they
+    # resolve to, which is already compressed and deduplicated
+    if isinstance(repo, (RunsArtifactRepository, ModelsArtifactRepository)):
+        return repo
+    repo = CompressedArtifactRepository(repo, MLFLOW_ARTIFACT_COMPRESSION.get())
+    blob_repo = None
+    if blob_store_uri := MLFLOW_ARTIFACT_BLOB_STORE_URI.get():
+        blob_repo = _artifact_repository_registry.get_artifact_repository(blob_store_uri)
+    return ContentAddressedArtifactRepository(repo, blob_repo)
+
+
+def get_underlying_artifact_repository(repo):
+    """
+    Get the artifact repository storing the artifacts of a repository returned by
+    :py:func:`get_artifact_repository`, which is wrapped when artifacts are compressed or
+    deduplicated.
+
+    :param repo: An instance of `mlflow.store.ArtifactRepository`.
+
+    :return: The artifact repository of the artifact URI, e.g. an ``S3ArtifactRepository``.
+    """
+    while isinstance(repo, (CompressedArtifactRepository, ContentAddressedArtifactRepository)):
+        repo = repo.repo
+    return repo
 
 
 def get_registered_artifact_repositories():
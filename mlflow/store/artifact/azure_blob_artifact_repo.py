@@ -1,3 +1,4 @@
+import base64
 import os
 import posixpath
 import re
@@ -5,7 +6,12 @@ import urllib.parse
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    _generate_multipart_upload_id,
+    _verify_multipart_upload_id,
+)
 from mlflow.tracking._tracking_service.utils import _get_default_host_creds
 
 from mlflow.environment_variables import MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_TIMEOUT
@@ -170,6 +176,23 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             return []
         return sorted(infos, key=lambda f: f.path)
 
+    def _iter_artifacts_recursive(self, path):
+        (container, _, artifact_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+        # Unlike `walk_blobs`, `list_blobs` lists all the blobs under the prefix at once
+        for result in container_client.list_blobs(name_starts_with=prefix):
+            if not result.name.startswith(artifact_path):
+                raise MlflowException(
+                    "The name of the listed Azure blob does not begin with the specified"
+                    f" artifact path. Artifact path: {artifact_path}. Blob name: {result.name}"
+                )
+            file_name = posixpath.relpath(path=result.name, start=artifact_path)
+            yield FileInfo(file_name, is_dir=False, file_size=result.size)
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
@@ -177,5 +200,75 @@ class AzureBlobArtifactRepository(ArtifactRepository):
         with open(local_path, "wb") as file:
             container_client.download_blob(remote_full_path).readinto(file)
 
+    def _get_artifact_file_size(self, artifact_path):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        try:
+            properties = container_client.get_blob_client(remote_full_path).get_blob_properties()
+        except ResourceNotFoundError as e:
+            raise MlflowException(
+                f"Artifact file '{artifact_path}' does not exist", RESOURCE_DOES_NOT_EXIST
+            ) from e
+        return properties.size
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        (container, _, remote_root_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        length = None if range_end is None else range_end - range_start + 1
+        return container_client.download_blob(
+            remote_full_path, offset=range_start, length=length
+        ).chunks()
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        container_client.upload_blob(
+            posixpath.join(dest_path, artifact_file),
+            stream,
+            overwrite=True,
+            timeout=self.write_timeout,
+        )
+
+    def _get_blob_client(self, artifact_file):
+        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        return container_client.get_blob_client(posixpath.join(dest_path, artifact_file))
+
+    @staticmethod
+    def _get_block_id(upload_id, part_number):
+        # The parts are staged as blocks of the artifact blob, whose IDs must all have the same
+        # length
+        _verify_multipart_upload_id(upload_id)
+        return base64.b64encode(f"{upload_id}-{part_number:06d}".encode()).decode()
+
+    def _create_multipart_upload(self, artifact_file):
+        return _generate_multipart_upload_id()
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        block_id = self._get_block_id(upload_id, part_number)
+        self._get_blob_client(artifact_file).stage_block(
+            block_id, part_file, timeout=self.write_timeout
+        )
+        return block_id
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        from azure.storage.blob import BlobBlock
+
+        self._get_blob_client(artifact_file).commit_block_list(
+            [
+                BlobBlock(block_id=self._get_block_id(upload_id, part_number))
+                for part_number, _ in sorted(parts)
+            ],
+            timeout=self.write_timeout,
+        )
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        # Staged blocks that are never committed are garbage collected by Azure Blob Storage
+        _verify_multipart_upload_id(upload_id)
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
@@ -0,0 +1,429 @@
+"""
+Opt-in compression of text artifact files for their transfer and storage.
+
+When ``MLFLOW_ARTIFACT_COMPRESSION`` is set to a codec, the artifact repositories returned by
+:py:func:`mlflow.store.artifact.artifact_repository_registry.get_artifact_repository` compress the
+text artifact files of at least ``MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE`` bytes, e.g. JSON
+tables, dictionaries and requirements files, before uploading them. A compressed file is stored as
+``<file name>.mlflow-<codec>``, recording the codec it's compressed with.
+
+The compressed files are decompressed when artifacts are listed, downloaded and streamed, whether
+``MLFLOW_ARTIFACT_COMPRESSION`` is set or not, so that they're seen as the files that were logged.
+A file stored as is takes precedence over the compressed file of the same path, so that a file that
+already exists as is is logged again as is.
+"""
+import gzip
+import logging
+import os
+import posixpath
+import shutil
+import tempfile
+import zlib
+
+from mlflow.entities import FileInfo
+from mlflow.environment_variables import MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _yield_chunks_range,
+)
+from mlflow.utils.mime_type_utils import get_text_extensions
+
+_logger = logging.getLogger(__name__)
+
+_COMPRESSED_SUFFIX_PREFIX = ".mlflow-"
+# The maximum compression ratio of DEFLATE
+_MAX_GZIP_COMPRESSION_RATIO = 1032
+
+
+class _GzipCodec:
+    name = "gzip"
+
+    @staticmethod
+    def compress_file(src, dst):
+        with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+            # Compress deterministically, without the modification time of the file
+            with gzip.GzipFile(
+                filename="", mode="wb", fileobj=f_out, compresslevel=6, mtime=0
+            ) as f:
+                shutil.copyfileobj(f_in, f, _STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def decompress_file(src, dst):
+        with gzip.open(src, "rb") as f_in, open(dst, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, _STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def decompress_chunks(chunks):
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            if data := decompressor.decompress(chunk):
+                yield data
+        if data := decompressor.flush():
+            yield data
+
+    @staticmethod
+    def get_decompressed_size(repo, compressed_path):
+        compressed_size = repo._get_artifact_file_size(compressed_path)
+        if compressed_size * _MAX_GZIP_COMPRESSION_RATIO < 2**32:
+            # The last 4 bytes of a gzip file are its decompressed size modulo 2^32
+            trailer = b"".join(
+                repo._download_artifact_stream(
+                    compressed_path, compressed_size - 4, compressed_size - 1
+                )
+            )
+            return int.from_bytes(trailer, "little")
+        chunks = repo._download_artifact_stream(compressed_path)
+        return sum(len(data) for data in _GzipCodec.decompress_chunks(chunks))
+
+
+_CODECS = {codec.name: codec for codec in [_GzipCodec]}
+
+
+def get_codec(name):
+    if name not in _CODECS:
+        raise MlflowException(
+            f"Unsupported artifact compression codec {name!r}. Supported codecs are:"
+            f" {list(_CODECS)}",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return _CODECS[name]
+
+
+def _get_codec_of_stored_path(path):
+    """
+    :return: The codec a stored artifact file is compressed with, or ``None`` if it isn't
+             compressed.
+    """
+    _, separator, suffix = posixpath.basename(path).rpartition(_COMPRESSED_SUFFIX_PREFIX)
+    return _CODECS.get(suffix) if separator else None
+
+
+def _is_text_file(path):
+    name = posixpath.basename(path)
+    extension = os.path.splitext(name)[1].lstrip(".") or name
+    return extension in get_text_extensions()
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.symlink(os.path.abspath(src), dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _get_uncompressed_path(path):
+    """
+    :return: The path of the file a compressed file decompresses to, or ``None`` if the file at the
+             specified path isn't compressed.
+    """
+    if codec := _get_codec_of_stored_path(path):
+        return path[: -len(_COMPRESSED_SUFFIX_PREFIX + codec.name)]
+    return None
+
+
+class CompressedArtifactRepository(ArtifactRepository):
+    """
+    Compresses the text artifact files of an artifact repository, and decompresses the compressed
+    files stored in the artifact repository.
+
+    :param repo: The artifact repository storing the artifacts.
+    :param codec: The name of the codec with which to compress artifact files, e.g. ``"gzip"``, or
+                  ``None`` to log the artifact files as is. The compressed files are decompressed
+                  either way.
+    """
+
+    def __init__(self, repo, codec=None):
+        super().__init__(repo.artifact_uri)
+        self.repo = repo
+        self.codec = get_codec(codec) if codec else None
+        # The artifact paths of the text files known to be stored compressed, mapped to their codec,
+        # and stored as is, which are found by listing their directories. They're cleared whenever
+        # artifacts are logged or deleted.
+        self._compressed_paths = {}
+        self._file_paths = set()
+
+    def __getattr__(self, name):
+        # Expose the attributes specific to the wrapped repository
+        if name == "repo":
+            raise AttributeError(name)
+        return getattr(self.repo, name)
+
+    def _clear_listed_paths(self):
+        self._compressed_paths.clear()
+        self._file_paths.clear()
+
+    def _should_compress(self, local_file):
+        return (
+            _is_text_file(local_file)
+            and os.path.getsize(local_file) >= MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE.get()
+        )
+
+    def _list_stored_paths(self, artifact_path, recursive=False):
+        """
+        :return: The set of the paths of the files stored in the artifact repository at the
+                 specified directory, including the compressed files, without resolving them.
+        """
+        if recursive:
+            file_infos = self.repo._iter_artifacts_recursive(artifact_path)
+        else:
+            file_infos = self.repo.list_artifacts(artifact_path)
+        return {file_info.path for file_info in file_infos if not file_info.is_dir}
+
+    def _stage_file(self, local_file, staged_path, dst_path, stored_paths):
+        """
+        Write the file to log for the specified local file at the specified staging path, without
+        its compression suffix. Files that are already stored as is are staged as is, since they
+        take precedence over compressed files.
+
+        :param dst_path: The artifact path at which the file is logged.
+        :param stored_paths: The paths of the files already stored in its directory.
+        :return: The path of the staged file, and the paths of the stored compressed files that the
+                 logged file replaces.
+        """
+        logged_path = dst_path
+        if self._should_compress(local_file) and dst_path not in stored_paths:
+            staged_path += _COMPRESSED_SUFFIX_PREFIX + self.codec.name
+            logged_path += _COMPRESSED_SUFFIX_PREFIX + self.codec.name
+            self.codec.compress_file(local_file, staged_path)
+        else:
+            _link_or_copy(local_file, staged_path)
+        stale_paths = [
+            p for p in stored_paths if p != logged_path and _get_uncompressed_path(p) == dst_path
+        ]
+        return staged_path, stale_paths
+
+    def _delete_stale_files(self, stale_paths):
+        for stale_path in stale_paths:
+            try:
+                self.repo.delete_artifacts(stale_path)
+            except Exception as e:
+                # The stale compressed file is shadowed by the file logged at its path anyway
+                _logger.debug("Failed to delete the stale compressed file %s: %s", stale_path, e)
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self._clear_listed_paths()
+        if self.codec is None or not _is_text_file(local_file):
+            self.repo.log_artifact(local_file, artifact_path)
+            return
+
+        name = os.path.basename(local_file)
+        stored_paths = self._list_stored_paths(artifact_path)
+        with tempfile.TemporaryDirectory() as staging_dir:
+            staged_file, stale_paths = self._stage_file(
+                local_file,
+                os.path.join(staging_dir, name),
+                posixpath.join(artifact_path or "", name),
+                stored_paths,
+            )
+            self.repo.log_artifact(staged_file, artifact_path)
+        self._delete_stale_files(stale_paths)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self._clear_listed_paths()
+        if self.codec is None:
+            self.repo.log_artifacts(local_dir, artifact_path)
+            return
+
+        # The whole destination directory is listed to find the files already stored as is
+        stored_paths = self._list_stored_paths(artifact_path, recursive=True)
+        stale_paths = []
+        with tempfile.TemporaryDirectory() as staging_dir:
+            for root, _, filenames in os.walk(local_dir):
+                rel_dir = os.path.relpath(root, local_dir)
+                staged_dir = os.path.join(staging_dir, rel_dir)
+                os.makedirs(staged_dir, exist_ok=True)
+                dst_dir = posixpath.join(
+                    artifact_path or "", *([] if rel_dir == "." else rel_dir.split(os.sep))
+                )
+                for f in filenames:
+                    _, stale = self._stage_file(
+                        os.path.join(root, f),
+                        os.path.join(staged_dir, f),
+                        posixpath.join(dst_dir, f),
+                        stored_paths,
+                    )
+                    stale_paths.extend(stale)
+            self.repo.log_artifacts(staging_dir, artifact_path)
+        self._delete_stale_files(stale_paths)
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        self._clear_listed_paths()
+        self.repo._log_artifact_stream(stream, artifact_file)
+
+    def _create_multipart_upload(self, artifact_file):
+        return self.repo._create_multipart_upload(artifact_file)
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        return self.repo._upload_multipart_part(artifact_file, upload_id, part_number, part_file)
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        self._clear_listed_paths()
+        self.repo._complete_multipart_upload(artifact_file, upload_id, parts)
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        self.repo._abort_multipart_upload(artifact_file, upload_id)
+
+    def _resolve_file_infos(self, file_infos, file_paths=()):
+        """
+        Replace the compressed files of a listing with the files they decompress to, except for the
+        compressed files shadowed by files of the same paths, which take precedence.
+
+        :param file_paths: The paths of the files stored as is listed before the listing.
+        """
+        file_infos = list(file_infos)
+        file_paths = set(file_paths)
+        file_paths.update(
+            f.path for f in file_infos if not f.is_dir and _get_uncompressed_path(f.path) is None
+        )
+        self._file_paths.update(file_paths)
+        resolved = []
+        for file_info in file_infos:
+            path = None if file_info.is_dir else _get_uncompressed_path(file_info.path)
+            if path is None:
+                resolved.append(file_info)
+            elif path not in file_paths:
+                self._compressed_paths[path] = _get_codec_of_stored_path(file_info.path)
+                resolved.append(FileInfo(path, False, None))
+        return resolved
+
+    def list_artifacts(self, path=None):
+        return sorted(
+            self._resolve_file_infos(self.repo.list_artifacts(path)), key=lambda f: f.path
+        )
+
+    def _list_artifacts_with_versions(self, path=None):
+        listing = self.repo._list_artifacts_with_versions(path)
+        versions = {}
+        # The compressed files are versioned by the versions of the files they're stored as
+        compressed_versions = {}
+        for file_info, version in listing:
+            if uncompressed_path := _get_uncompressed_path(file_info.path):
+                compressed_versions[uncompressed_path] = version
+            else:
+                versions[file_info.path] = version
+        return [
+            (file_info, versions.get(file_info.path, compressed_versions.get(file_info.path)))
+            for file_info in self._resolve_file_infos(file_info for file_info, _ in listing)
+        ]
+
+    def _iter_artifacts_recursive(self, path):
+        # The compressed files are resolved once all the files stored as is are listed, since they
+        # take precedence over the compressed files of the same paths
+        compressed_infos = []
+        file_paths = set()
+        for file_info in self.repo._iter_artifacts_recursive(path):
+            if not file_info.is_dir and _get_uncompressed_path(file_info.path):
+                compressed_infos.append(file_info)
+                continue
+            if not file_info.is_dir:
+                file_paths.add(file_info.path)
+            yield file_info
+        yield from self._resolve_file_infos(compressed_infos, file_paths)
+
+    def _is_directory(self, artifact_path):
+        return self.repo._is_directory(artifact_path)
+
+    def _has_compressed_files(self, artifact_path):
+        """
+        :return: Whether the artifact file at the specified path or any artifact file of the
+                 directory at the specified path is stored compressed.
+        """
+        artifact_path = artifact_path.strip("/") if artifact_path else None
+        if artifact_path and self._get_stored_codec(artifact_path):
+            return True
+        return any(
+            not f.is_dir and _get_uncompressed_path(f.path)
+            for f in self.repo._iter_artifacts_recursive(artifact_path)
+        )
+
+    def download_artifacts(self, artifact_path, dst_path=None):
+        from mlflow.store.artifact.artifact_repository_registry import (
+            get_underlying_artifact_repository,
+        )
+
+        # The repositories downloading artifacts their own way, e.g. the local artifact repository
+        # returning the path of the artifacts in place, do so unless they're stored compressed
+        download_artifacts = type(get_underlying_artifact_repository(self.repo)).download_artifacts
+        if (
+            download_artifacts is not ArtifactRepository.download_artifacts
+            and not self._has_compressed_files(artifact_path)
+        ):
+            return self.repo.download_artifacts(artifact_path, dst_path)
+        return super().download_artifacts(artifact_path, dst_path)
+
+    def _get_stored_codec(self, artifact_path):
+        """
+        :return: The codec the artifact file at the specified path is stored compressed with, or
+                 ``None`` if it's stored as is.
+        """
+        if not _is_text_file(artifact_path):
+            return None
+        if artifact_path not in self._compressed_paths and artifact_path not in self._file_paths:
+            # List the directory of the artifact to find whether it's stored compressed
+            self.list_artifacts(posixpath.dirname(artifact_path) or None)
+        return self._compressed_paths.get(artifact_path)
+
+    def _download_compressed_file(self, codec, remote_file_path, local_path):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            compressed_path = os.path.join(tmp_dir, "compressed")
+            self.repo._download_file(
+                remote_file_path + _COMPRESSED_SUFFIX_PREFIX + codec.name, compressed_path
+            )
+            codec.decompress_file(compressed_path, local_path)
+
+    def _download_file(self, remote_file_path, local_path):
+        if codec := self._compressed_paths.get(remote_file_path):
+            self._download_compressed_file(codec, remote_file_path, local_path)
+            return
+        try:
+            self.repo._download_file(remote_file_path, local_path)
+        except Exception:
+            # The file isn't stored as is, it may be stored compressed
+            if remote_file_path in self._file_paths or not (
+                codec := self._get_stored_codec(remote_file_path)
+            ):
+                raise
+            self._download_compressed_file(codec, remote_file_path, local_path)
+
+    def _get_artifact_file_size(self, artifact_path):
+        if (codec := self._compressed_paths.get(artifact_path)) is None:
+            try:
+                return self.repo._get_artifact_file_size(artifact_path)
+            except Exception:
+                if artifact_path in self._file_paths or not (
+                    codec := self._get_stored_codec(artifact_path)
+                ):
+                    raise
+        return codec.get_decompressed_size(
+            self.repo, artifact_path + _COMPRESSED_SUFFIX_PREFIX + codec.name
+        )
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        codec = self._get_stored_codec(artifact_path)
+        if codec is None:
+            return self.repo._download_artifact_stream(artifact_path, range_start, range_end)
+        chunks = self.repo._download_artifact_stream(
+            artifact_path + _COMPRESSED_SUFFIX_PREFIX + codec.name
+        )
+        # Compressed files can only be decompressed from their start
+        return _yield_chunks_range(codec.decompress_chunks(chunks), range_start, range_end)
+
+    def _supports_file_range_downloads(self):
+        # Compressed files are listed without their size, so they're never downloaded in ranges
+        return self.repo._supports_file_range_downloads()
+
+    def delete_artifacts(self, artifact_path=None):
+        self._clear_listed_paths()
+        if artifact_path:
+            stored_paths = self._list_stored_paths(posixpath.dirname(artifact_path) or None)
+            compressed_paths = [
+                p for p in stored_paths if _get_uncompressed_path(p) == artifact_path
+            ]
+            for compressed_path in compressed_paths:
+                self.repo.delete_artifacts(compressed_path)
+            if compressed_paths and artifact_path not in stored_paths:
+                return
+        self.repo.delete_artifacts(artifact_path)
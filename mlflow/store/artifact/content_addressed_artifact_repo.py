@@ -0,0 +1,453 @@
+"""
+Opt-in deduplication of logged artifact files with a content-addressed blob store.
+
+When ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` is set, the artifact repositories returned by
+:py:func:`mlflow.store.artifact.artifact_repository_registry.get_artifact_repository` store the
+content of the artifact files of at least ``MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE`` bytes as
+blobs named by the SHA-256 hash of their content in the blob store, and log a small reference
+object named ``<file name>.mlflow-ref`` instead of each file. Blobs that already exist in the blob
+store aren't uploaded again, so that logging unchanged files, e.g. the weights of a base model
+logged again with a new adapter, only logs their references.
+
+The references record the URI of their blob store and are resolved when artifacts are listed and
+downloaded, whether ``MLFLOW_ARTIFACT_BLOB_STORE_URI`` is set or not, so that they're seen with
+the normal layout of the logged artifacts. A file stored as is takes precedence over the reference
+of the same path, so that a file that already exists as is is logged again as is. Blobs are shared
+by all the artifacts referencing them and aren't deleted with them.
+"""
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import shutil
+import tempfile
+from concurrent.futures import as_completed
+
+from mlflow.entities import FileInfo
+from mlflow.environment_variables import MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.utils.file_utils import yield_file_range_in_chunks
+
+_logger = logging.getLogger(__name__)
+
+REFERENCE_SUFFIX = ".mlflow-ref"
+_HASH_ALGORITHM = "sha256"
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def _compute_file_hash(local_file):
+    file_hash = hashlib.new(_HASH_ALGORITHM)
+    with open(local_file, "rb") as f:
+        while chunk := f.read(_HASH_BUFFER_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_blob_path(digest):
+    return posixpath.join(_HASH_ALGORITHM, digest[:2], digest)
+
+
+def _is_reference(file_info):
+    return not file_info.is_dir and file_info.path.endswith(REFERENCE_SUFFIX)
+
+
+def _download_blob_range(blob_repo, blob_path, range_start, range_end):
+    # The blob store can't stream blobs, stream the range from a downloaded copy of the blob
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = os.path.join(tmp_dir, posixpath.basename(blob_path))
+        blob_repo._download_file(blob_path, local_path)
+        yield from yield_file_range_in_chunks(local_path, range_start, range_end)
+
+
+class ContentAddressedArtifactRepository(ArtifactRepository):
+    """
+    Stores the artifact files of an artifact repository as references to deduplicated blobs of a
+    blob store, and resolves the references stored in the artifact repository.
+
+    :param repo: The artifact repository of the artifacts, in which the references are logged.
+    :param blob_repo: The artifact repository of the blob store, or ``None`` to log the artifact
+                      files as is. The references are resolved either way.
+    """
+
+    def __init__(self, repo, blob_repo=None):
+        super().__init__(repo.artifact_uri)
+        self.repo = repo
+        self.blob_repo = blob_repo
+        # The artifact repositories of the blob stores of the read references, by URI
+        self._blob_repos = {blob_repo.artifact_uri: blob_repo} if blob_repo else {}
+        # The artifact paths of the files known to be stored as references, mapped to their
+        # reference, or as files, which are found by listing their directories. They're cleared
+        # whenever artifacts are logged or deleted.
+        self._references = {}
+        self._file_paths = set()
+
+    def __getattr__(self, name):
+        # Expose the attributes specific to the wrapped repository, e.g. the run ID of a
+        # Databricks artifact repository
+        if name == "repo":
+            raise AttributeError(name)
+        return getattr(self.repo, name)
+
+    def _clear_listed_paths(self):
+        self._references.clear()
+        self._file_paths.clear()
+
+    def _upload_blobs(self, local_files):
+        """
+        Upload the content of the specified local files to the blob store, skipping the blobs that
+        already exist in it.
+
+        :return: A dictionary mapping the local files to their hash.
+        """
+        digests = {}
+        futures = {}
+        for local_file in local_files:
+            futures[self.thread_pool.submit(_compute_file_hash, local_file)] = local_file
+        for f in as_completed(futures):
+            digests[futures[f]] = f.result()
+
+        local_files_by_digest = {digest: local_file for local_file, digest in digests.items()}
+        existing_blobs = set()
+        for blob_dir in {posixpath.dirname(_get_blob_path(d)) for d in local_files_by_digest}:
+            existing_blobs.update(
+                file_info.path for file_info in self.blob_repo.list_artifacts(blob_dir)
+            )
+
+        futures = {}
+        for digest, local_file in local_files_by_digest.items():
+            blob_path = _get_blob_path(digest)
+            if blob_path not in existing_blobs:
+                future = self.thread_pool.submit(self._upload_blob, local_file, blob_path)
+                futures[future] = local_file
+
+        failed_uploads = {}
+        for f in as_completed(futures):
+            try:
+                f.result()
+            except Exception as e:
+                failed_uploads[futures[f]] = repr(e)
+        if failed_uploads:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while uploading one or more artifact blobs"
+                    f" to {self.blob_repo.artifact_uri}: {failed_uploads}"
+                )
+            )
+        return digests
+
+    def _upload_blob(self, local_file, blob_path):
+        try:
+            with open(local_file, "rb") as f:
+                self.blob_repo._log_artifact_stream(f, blob_path)
+            return
+        except NotImplementedError:
+            pass
+
+        # The blob store can't log streams, log a copy of the file named like the blob
+        blob_dir, blob_name = posixpath.split(blob_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, blob_name)
+            shutil.copyfile(local_file, tmp_file)
+            self.blob_repo.log_artifact(tmp_file, blob_dir)
+
+    def _list_stored_paths(self, artifact_path, recursive=False):
+        """
+        :return: The set of the paths of the files stored in the artifact repository at the
+                 specified directory, including the references, without resolving them.
+        """
+        if recursive:
+            file_infos = self.repo._iter_artifacts_recursive(artifact_path)
+        else:
+            file_infos = self.repo.list_artifacts(artifact_path)
+        return {file_info.path for file_info in file_infos if not file_info.is_dir}
+
+    def _stage_artifacts(self, local_files, staging_dir, artifact_path, stored_paths):
+        """
+        Write the artifacts to log for the specified local files to the staging directory: the
+        references to their blobs for large files, and copies of small files and of the files that
+        are already stored as is, which take precedence over references.
+
+        :param local_files: A dictionary mapping the local files to their relative paths in the
+                            staging directory.
+        :param artifact_path: The directory in which the staging directory is logged.
+        :param stored_paths: The paths of the files already stored in that directory.
+        :return: The paths of the stored references that the logged files replace.
+        """
+        minimum_size = MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE.get()
+        dst_paths = {
+            local_file: posixpath.join(artifact_path or "", *rel_path.split(os.sep))
+            for local_file, rel_path in local_files.items()
+        }
+        large_files = [
+            f
+            for f in local_files
+            if os.path.getsize(f) >= minimum_size and dst_paths[f] not in stored_paths
+        ]
+        digests = self._upload_blobs(large_files)
+        stale_references = []
+        for local_file, rel_path in local_files.items():
+            staged_path = os.path.join(staging_dir, rel_path)
+            os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+            if local_file in digests:
+                with open(staged_path + REFERENCE_SUFFIX, "w") as f:
+                    json.dump(
+                        {
+                            "blob_store_uri": self.blob_repo.artifact_uri,
+                            "algorithm": _HASH_ALGORITHM,
+                            "digest": digests[local_file],
+                            "size": os.path.getsize(local_file),
+                        },
+                        f,
+                    )
+            else:
+                shutil.copyfile(local_file, staged_path)
+                if dst_paths[local_file] + REFERENCE_SUFFIX in stored_paths:
+                    stale_references.append(dst_paths[local_file] + REFERENCE_SUFFIX)
+        return stale_references
+
+    def _delete_stale_references(self, reference_paths):
+        for reference_path in reference_paths:
+            try:
+                self.repo.delete_artifacts(reference_path)
+            except Exception as e:
+                # The stale reference is shadowed by the file logged at its path anyway
+                _logger.debug("Failed to delete the stale reference %s: %s", reference_path, e)
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self._clear_listed_paths()
+        if self.blob_repo is None:
+            self.repo.log_artifact(local_file, artifact_path)
+            return
+
+        name = os.path.basename(local_file)
+        stored_paths = self._list_stored_paths(artifact_path)
+        with tempfile.TemporaryDirectory() as staging_dir:
+            stale_references = self._stage_artifacts(
+                {local_file: name}, staging_dir, artifact_path, stored_paths
+            )
+            (staged_name,) = os.listdir(staging_dir)
+            self.repo.log_artifact(os.path.join(staging_dir, staged_name), artifact_path)
+        self._delete_stale_references(stale_references)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self._clear_listed_paths()
+        if self.blob_repo is None:
+            self.repo.log_artifacts(local_dir, artifact_path)
+            return
+
+        local_files = {}
+        for root, _, filenames in os.walk(local_dir):
+            for f in filenames:
+                local_file = os.path.join(root, f)
+                local_files[local_file] = os.path.relpath(local_file, local_dir)
+        # The whole destination directory is listed to find the files already stored as is
+        stored_paths = self._list_stored_paths(artifact_path, recursive=True)
+        with tempfile.TemporaryDirectory() as staging_dir:
+            stale_references = self._stage_artifacts(
+                local_files, staging_dir, artifact_path, stored_paths
+            )
+            self.repo.log_artifacts(staging_dir, artifact_path)
+        self._delete_stale_references(stale_references)
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        self._clear_listed_paths()
+        self.repo._log_artifact_stream(stream, artifact_file)
+
+    def _create_multipart_upload(self, artifact_file):
+        return self.repo._create_multipart_upload(artifact_file)
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        return self.repo._upload_multipart_part(artifact_file, upload_id, part_number, part_file)
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        self._clear_listed_paths()
+        self.repo._complete_multipart_upload(artifact_file, upload_id, parts)
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        self.repo._abort_multipart_upload(artifact_file, upload_id)
+
+    def _get_blob_repo(self, reference):
+        blob_store_uri = reference.get("blob_store_uri")
+        if blob_store_uri is None:
+            if self.blob_repo is None:
+                raise MlflowException(
+                    "The blob store of the artifact references isn't recorded in them, set"
+                    " MLFLOW_ARTIFACT_BLOB_STORE_URI to the URI of their blob store"
+                )
+            return self.blob_repo
+        if blob_store_uri not in self._blob_repos:
+            from mlflow.store.artifact.artifact_repository_registry import (
+                _artifact_repository_registry,
+            )
+
+            self._blob_repos[
+                blob_store_uri
+            ] = _artifact_repository_registry.get_artifact_repository(blob_store_uri)
+        return self._blob_repos[blob_store_uri]
+
+    def _download_reference(self, artifact_path):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_path = os.path.join(tmp_dir, "reference")
+            self.repo._download_file(artifact_path + REFERENCE_SUFFIX, local_path)
+            with open(local_path) as f:
+                return json.load(f)
+
+    def _resolve_file_infos(self, file_infos, file_paths=()):
+        """
+        Replace the references of a listing with the files they reference, except for the
+        references shadowed by files of the same paths, which take precedence. The references are
+        read for the sizes of their blobs.
+
+        :param file_paths: The paths of the files stored as is listed before the listing.
+        """
+        file_infos = list(file_infos)
+        file_paths = set(file_paths)
+        file_paths.update(f.path for f in file_infos if not f.is_dir and not _is_reference(f))
+        self._file_paths.update(file_paths)
+        reference_paths = [
+            f.path[: -len(REFERENCE_SUFFIX)]
+            for f in file_infos
+            if _is_reference(f) and f.path[: -len(REFERENCE_SUFFIX)] not in file_paths
+        ]
+        unread_paths = [p for p in reference_paths if p not in self._references]
+        for path, reference in zip(
+            unread_paths, self.thread_pool.map(self._download_reference, unread_paths)
+        ):
+            self._references[path] = reference
+        resolved = []
+        for file_info in file_infos:
+            if not _is_reference(file_info):
+                resolved.append(file_info)
+            elif (path := file_info.path[: -len(REFERENCE_SUFFIX)]) in self._references:
+                resolved.append(FileInfo(path, False, self._references[path]["size"]))
+        return resolved
+
+    def list_artifacts(self, path=None):
+        return sorted(
+            self._resolve_file_infos(self.repo.list_artifacts(path)), key=lambda f: f.path
+        )
+
+    def _list_artifacts_with_versions(self, path=None):
+        listing = self.repo._list_artifacts_with_versions(path)
+        versions = {file_info.path: version for file_info, version in listing}
+        resolved = []
+        for file_info in self._resolve_file_infos(file_info for file_info, _ in listing):
+            if file_info.path in versions:
+                resolved.append((file_info, versions[file_info.path]))
+            else:
+                # The files stored as references are versioned by the digests of their blobs
+                reference = self._references[file_info.path]
+                resolved.append((file_info, f"{reference['algorithm']}:{reference['digest']}"))
+        return resolved
+
+    def _iter_artifacts_recursive(self, path):
+        # The references are resolved once all the files stored as is are listed, since they
+        # take precedence over the references of the same paths
+        reference_infos = []
+        file_paths = set()
+        for file_info in self.repo._iter_artifacts_recursive(path):
+            if _is_reference(file_info):
+                reference_infos.append(file_info)
+                continue
+            if not file_info.is_dir:
+                file_paths.add(file_info.path)
+            yield file_info
+        yield from self._resolve_file_infos(reference_infos, file_paths)
+
+    def _is_directory(self, artifact_path):
+        return self.repo._is_directory(artifact_path)
+
+    def _has_references(self, artifact_path):
+        """
+        :return: Whether the artifact file at the specified path or any artifact file of the
+                 directory at the specified path is stored as a reference.
+        """
+        artifact_path = artifact_path.strip("/") if artifact_path else None
+        if artifact_path and self._read_reference(artifact_path):
+            return True
+        return any(map(_is_reference, self.repo._iter_artifacts_recursive(artifact_path)))
+
+    def download_artifacts(self, artifact_path, dst_path=None):
+        from mlflow.store.artifact.artifact_repository_registry import (
+            get_underlying_artifact_repository,
+        )
+
+        # The repositories downloading artifacts their own way, e.g. the local artifact repository
+        # returning the path of the artifacts in place, do so unless they're stored as references
+        download_artifacts = type(get_underlying_artifact_repository(self.repo)).download_artifacts
+        if (
+            download_artifacts is not ArtifactRepository.download_artifacts
+            and not self._has_references(artifact_path)
+        ):
+            return self.repo.download_artifacts(artifact_path, dst_path)
+        return super().download_artifacts(artifact_path, dst_path)
+
+    def _read_reference(self, artifact_path):
+        """
+        :return: The reference stored for the artifact file at the specified path, or ``None`` if
+                 the file isn't stored as a reference.
+        """
+        if artifact_path not in self._references and artifact_path not in self._file_paths:
+            # List the directory of the artifact to find whether it's stored as a reference
+            stored_paths = self._list_stored_paths(posixpath.dirname(artifact_path) or None)
+            if artifact_path in stored_paths:
+                self._file_paths.add(artifact_path)
+            elif artifact_path + REFERENCE_SUFFIX in stored_paths:
+                self._references[artifact_path] = self._download_reference(artifact_path)
+        return self._references.get(artifact_path)
+
+    def _download_file(self, remote_file_path, local_path):
+        if reference := self._references.get(remote_file_path):
+            self._get_blob_repo(reference)._download_file(
+                _get_blob_path(reference["digest"]), local_path
+            )
+            return
+        try:
+            self.repo._download_file(remote_file_path, local_path)
+        except Exception:
+            # The file isn't stored as is, it may be stored as a reference
+            if remote_file_path in self._file_paths or not (
+                reference := self._read_reference(remote_file_path)
+            ):
+                raise
+            self._get_blob_repo(reference)._download_file(
+                _get_blob_path(reference["digest"]), local_path
+            )
+
+    def _get_artifact_file_size(self, artifact_path):
+        if reference := self._references.get(artifact_path):
+            return reference["size"]
+        try:
+            return self.repo._get_artifact_file_size(artifact_path)
+        except Exception:
+            if artifact_path in self._file_paths or not (
+                reference := self._read_reference(artifact_path)
+            ):
+                raise
+            return reference["size"]
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        if reference := self._read_reference(artifact_path):
+            blob_repo = self._get_blob_repo(reference)
+            blob_path = _get_blob_path(reference["digest"])
+            if blob_repo._supports_file_range_downloads():
+                return blob_repo._download_artifact_stream(blob_path, range_start, range_end)
+            return _download_blob_range(blob_repo, blob_path, range_start, range_end)
+        return self.repo._download_artifact_stream(artifact_path, range_start, range_end)
+
+    def _supports_file_range_downloads(self):
+        return self.repo._supports_file_range_downloads() and (
+            self.blob_repo is None or self.blob_repo._supports_file_range_downloads()
+        )
+
+    def delete_artifacts(self, artifact_path=None):
+        self._clear_listed_paths()
+        if artifact_path:
+            stored_paths = self._list_stored_paths(posixpath.dirname(artifact_path) or None)
+            if artifact_path + REFERENCE_SUFFIX in stored_paths:
+                self.repo.delete_artifacts(artifact_path + REFERENCE_SUFFIX)
+                if artifact_path not in stored_paths:
+                    return
+        self.repo.delete_artifacts(artifact_path)
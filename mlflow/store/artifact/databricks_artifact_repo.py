@@ -35,6 +35,7 @@ from mlflow.protos.databricks_artifacts_pb2 import (
 )
 from mlflow.protos.service_pb2 import MlflowService, GetRun, ListArtifacts
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.instrumentation import record_retries
 from mlflow.utils import chunk_list
 from mlflow.utils.databricks_utils import get_databricks_host_creds
 from mlflow.utils.file_utils import (
@@ -250,6 +251,7 @@ class DatabricksArtifactRepository(ArtifactRepository):
                     "Failed to authorize request, possibly due to credential expiration."
                     " Refreshing credentials and trying again..."
                 )
+                record_retries()
                 credential_info = self._get_write_credential_infos(
                     run_id=self.run_id, paths=[artifact_path]
                 )[0]
@@ -302,6 +304,7 @@ class DatabricksArtifactRepository(ArtifactRepository):
                         "Failed to authorize request, possibly due to credential expiration."
                         " Refreshing credentials and trying again..."
                     )
+                    record_retries()
                     credential_info = self._get_write_credential_infos(
                         run_id=self.run_id, paths=[artifact_path]
                     )[0]
@@ -323,6 +326,7 @@ class DatabricksArtifactRepository(ArtifactRepository):
                     "Failed to authorize ADLS operation, possibly due "
                     "to credential expiration. Refreshing credentials and trying again..."
                 )
+                record_retries()
                 new_credentials = self._get_write_credential_infos(
                     run_id=self.run_id, paths=[artifact_path]
                 )[0]
@@ -434,13 +438,7 @@ class DatabricksArtifactRepository(ArtifactRepository):
     def _parallelized_download_from_cloud(
         self, cloud_credential_info, file_size, dst_local_file_path, dst_run_relative_artifact_path
     ):
-        from mlflow.utils.databricks_utils import get_databricks_env_vars
-
         try:
-            parallel_download_subproc_env = os.environ.copy()
-            parallel_download_subproc_env.update(
-                get_databricks_env_vars(self.databricks_profile_uri)
-            )
             failed_downloads = parallelized_download_file_using_http_uri(
                 thread_pool_executor=self.chunk_thread_pool,
                 http_uri=cloud_credential_info.signed_uri,
@@ -448,7 +446,6 @@ class DatabricksArtifactRepository(ArtifactRepository):
                 file_size=file_size,
                 uri_type=cloud_credential_info.type,
                 chunk_size=_DOWNLOAD_CHUNK_SIZE,
-                env=parallel_download_subproc_env,
                 headers=self._extract_headers_from_credentials(cloud_credential_info.headers),
             )
             download_errors = [
@@ -468,8 +465,13 @@ class DatabricksArtifactRepository(ArtifactRepository):
                 new_headers = self._extract_headers_from_credentials(new_cloud_creds.headers)
 
             for i in failed_downloads:
+                range_start = i * _DOWNLOAD_CHUNK_SIZE
                 download_chunk(
-                    i, _DOWNLOAD_CHUNK_SIZE, new_headers, dst_local_file_path, new_signed_uri
+                    range_start=range_start,
+                    range_end=range_start + _DOWNLOAD_CHUNK_SIZE - 1,
+                    headers=new_headers,
+                    download_path=dst_local_file_path,
+                    http_uri=new_signed_uri,
                 )
         except Exception as err:
             if os.path.exists(dst_local_file_path):
@@ -565,6 +567,7 @@ class DatabricksArtifactRepository(ArtifactRepository):
                 "Failed to authorize request, possibly due to credential expiration."
                 " Refreshing credentials and trying again..."
             )
+            record_retries()
             resp = self._get_presigned_upload_part_url(
                 cred_info.run_id, cred_info.path, upload_id, part_number
             )
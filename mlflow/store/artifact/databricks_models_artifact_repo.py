@@ -134,13 +134,7 @@ class DatabricksModelsArtifactRepository(ArtifactRepository):
     def _parallelized_download_from_cloud(
         self, signed_uri, headers, file_size, dst_local_file_path, dst_run_relative_artifact_path
     ):
-        from mlflow.utils.databricks_utils import get_databricks_env_vars
-
         try:
-            parallel_download_subproc_env = os.environ.copy()
-            parallel_download_subproc_env.update(
-                get_databricks_env_vars(self.databricks_profile_uri)
-            )
             failed_downloads = parallelized_download_file_using_http_uri(
                 thread_pool_executor=self.chunk_thread_pool,
                 http_uri=signed_uri,
@@ -149,7 +143,6 @@ class DatabricksModelsArtifactRepository(ArtifactRepository):
                 # URI type is not known in this context
                 uri_type=None,
                 chunk_size=_DOWNLOAD_CHUNK_SIZE,
-                env=parallel_download_subproc_env,
                 headers=headers,
             )
             download_errors = [
@@ -165,8 +158,13 @@ class DatabricksModelsArtifactRepository(ArtifactRepository):
                     dst_run_relative_artifact_path
                 )
             for i in failed_downloads:
+                range_start = i * _DOWNLOAD_CHUNK_SIZE
                 download_chunk(
-                    i, _DOWNLOAD_CHUNK_SIZE, new_headers, dst_local_file_path, new_signed_uri
+                    range_start=range_start,
+                    range_end=range_start + _DOWNLOAD_CHUNK_SIZE - 1,
+                    headers=new_headers,
+                    download_path=dst_local_file_path,
+                    http_uri=new_signed_uri,
                 )
         except Exception as err:
             if os.path.exists(dst_local_file_path):
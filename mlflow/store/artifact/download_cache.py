@@ -0,0 +1,279 @@
+"""
+Opt-in on-disk cache of downloaded artifacts, shared by the processes of a host.
+
+The cache is enabled by setting ``MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR``. Each cache entry holds the
+artifacts downloaded from a URI, and is keyed by the URI and by an identifier of the version of
+their content:
+
+- For ``models:/`` URIs, the model version the URI resolves to, since model versions are immutable.
+- For other URIs, the paths, sizes and versions of the artifact files, i.e. the digests of their
+  blobs for deduplicated artifacts, or the version identifiers of the artifact store, e.g. the ETags
+  of S3 objects, so that overwritten artifacts are downloaded again. The artifacts are listed to get
+  their versions whenever they're downloaded through the cache, with one listing request per
+  directory. Artifacts of stores that don't identify the versions of their files aren't cached.
+
+Entries are downloaded to a temporary directory and published with an atomic rename, so that
+processes downloading the same artifacts concurrently end up sharing a single copy. When the total
+size of the entries exceeds ``MLFLOW_ARTIFACT_DOWNLOAD_CACHE_MAX_SIZE``, the least recently used
+entries are evicted. Since entries can be evicted by other processes at any time, the cached
+artifacts are always copied, or hard linked, out of the cache to be used.
+"""
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import shutil
+import tempfile
+import time
+import uuid
+
+from mlflow.environment_variables import (
+    MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR,
+    MLFLOW_ARTIFACT_DOWNLOAD_CACHE_MAX_SIZE,
+)
+
+_logger = logging.getLogger(__name__)
+
+_ENTRY_DATA_DIR = "data"
+_ENTRY_METADATA_FILE = "entry.json"
+_TMP_PREFIX = ".tmp-"
+# Temporary directories older than this are left behind by interrupted downloads
+_STALE_TMP_DIR_SECONDS = 24 * 60 * 60
+
+
+def _get_directory_size(path):
+    size = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            size += os.path.getsize(os.path.join(root, f))
+    return size
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+class ArtifactDownloadCache:
+    """
+    Cache of downloaded artifacts stored in a local directory.
+
+    :param cache_dir: The directory of the cache, created if it doesn't exist.
+    :param max_size: The maximum total size in bytes of the cached artifacts.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def _get_entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key):
+        """
+        :return: The path of the data directory of the entry, and the path of the cached artifacts
+                 relative to this data directory, or ``None`` if the artifacts aren't cached.
+        """
+        entry_dir = self._get_entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, _ENTRY_METADATA_FILE)) as f:
+                metadata = json.load(f)
+            # Record the access for the eviction of the least recently used entries
+            os.utime(entry_dir)
+        except (OSError, ValueError):
+            return None
+        return os.path.join(entry_dir, _ENTRY_DATA_DIR), metadata["relative_path"]
+
+    def get_or_download(self, key, download_fn):
+        """
+        Gets cached artifacts, downloading them if they aren't cached.
+
+        :param key: The key of the artifacts.
+        :param download_fn: Function downloading the artifacts to the directory it takes, and
+                            returning their local path.
+        :return: The path of the data directory of the entry, and the path of the cached artifacts
+                 relative to this data directory.
+        """
+        if cached := self.get(key):
+            return cached
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_entry_dir = tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=self.cache_dir)
+        try:
+            data_dir = os.path.join(tmp_entry_dir, _ENTRY_DATA_DIR)
+            os.mkdir(data_dir)
+            local_path = download_fn(data_dir)
+            metadata = {
+                "relative_path": os.path.relpath(local_path, data_dir),
+                "size": _get_directory_size(data_dir),
+            }
+            with open(os.path.join(tmp_entry_dir, _ENTRY_METADATA_FILE), "w") as f:
+                json.dump(metadata, f)
+            try:
+                os.rename(tmp_entry_dir, self._get_entry_dir(key))
+            except OSError:
+                # Another process published the same entry first, use its copy
+                if not os.path.isdir(self._get_entry_dir(key)):
+                    raise
+        finally:
+            shutil.rmtree(tmp_entry_dir, ignore_errors=True)
+
+        self._evict(keep_key=key)
+        return self.get(key)
+
+    def _evict(self, keep_key):
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if name.startswith(_TMP_PREFIX):
+                    if now - os.stat(path).st_mtime > _STALE_TMP_DIR_SECONDS:
+                        shutil.rmtree(path, ignore_errors=True)
+                    continue
+                with open(os.path.join(path, _ENTRY_METADATA_FILE)) as f:
+                    size = json.load(f)["size"]
+                entries.append((os.stat(path).st_mtime, size, name))
+            except (OSError, ValueError):
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if name == keep_key:
+                continue
+            # Rename the entry before deleting it so that it's never seen partially deleted
+            trash_dir = os.path.join(self.cache_dir, f"{_TMP_PREFIX}{uuid.uuid4().hex}")
+            try:
+                os.rename(os.path.join(self.cache_dir, name), trash_dir)
+            except OSError:
+                # The entry was evicted by another process
+                continue
+            shutil.rmtree(trash_dir, ignore_errors=True)
+            total_size -= size
+
+
+def get_artifact_download_cache():
+    """
+    :return: The artifact download cache, or ``None`` if it isn't enabled.
+    """
+    if cache_dir := MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR.get():
+        return ArtifactDownloadCache(cache_dir, MLFLOW_ARTIFACT_DOWNLOAD_CACHE_MAX_SIZE.get())
+    return None
+
+
+def _list_artifact_files(repo, artifact_path):
+    """
+    :return: A sorted list of the paths, sizes and versions of the artifact files at
+             ``artifact_path``.
+    """
+    files = []
+
+    def walk(path):
+        for file_info, version in repo._list_artifacts_with_versions(path):
+            if file_info.is_dir:
+                walk(file_info.path)
+            else:
+                files.append((file_info.path, file_info.file_size, version))
+
+    walk(artifact_path)
+    if not files:
+        # The artifact path is a single file, which is only listed by its parent directory
+        artifact_path = artifact_path.strip("/")
+        parent_path = posixpath.dirname(artifact_path) or None
+        files = [
+            (file_info.path, file_info.file_size, version)
+            for file_info, version in repo._list_artifacts_with_versions(parent_path)
+            if file_info.path == artifact_path and not file_info.is_dir
+        ]
+    return sorted(files)
+
+
+def _get_cache_key(repo, artifact_path):
+    """
+    :return: The key of the artifacts at ``artifact_path`` in the repository, or ``None`` if they
+             can't be cached.
+    """
+    from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+
+    if isinstance(repo, ModelsArtifactRepository):
+        model_repo = repo.repo
+        if hasattr(model_repo, "model_version"):
+            version_id = [
+                type(model_repo).__name__,
+                model_repo.model_name,
+                model_repo.model_version,
+            ]
+        else:
+            # The location of the artifacts of a model version never changes
+            version_id = [model_repo.artifact_uri]
+    else:
+        files = _list_artifact_files(repo, artifact_path)
+        if not files or any(version is None for _, _, version in files):
+            # Artifacts whose versions are unknown could be overwritten with the same size
+            return None
+        version_id = [repo.artifact_uri, files]
+    return hashlib.sha256(json.dumps([version_id, artifact_path]).encode("utf-8")).hexdigest()
+
+
+def _is_local_repository(repo):
+    from mlflow.store.artifact.artifact_repository_registry import (
+        get_underlying_artifact_repository,
+    )
+    from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+    from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+    from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+
+    while isinstance(repo, (ModelsArtifactRepository, RunsArtifactRepository)):
+        repo = repo.repo
+    return isinstance(get_underlying_artifact_repository(repo), LocalArtifactRepository)
+
+
+def download_artifacts_with_cache(repo, artifact_path, dst_path=None):
+    """
+    Downloads artifacts like ``repo.download_artifacts``, through the artifact download cache if
+    it's enabled. Artifacts that are already on the local filesystem aren't cached.
+
+    :param repo: The artifact repository of the artifacts.
+    :param artifact_path: Relative source path to the desired artifacts.
+    :param dst_path: Absolute path of the local filesystem destination directory to which to copy
+                     the cached artifacts. If unspecified, the cached artifacts are hard linked to
+                     a new uniquely-named directory if possible, and must not be modified in place.
+    :return: Absolute path of the local filesystem location containing the desired artifacts.
+    """
+    cache = get_artifact_download_cache()
+    if cache is None or _is_local_repository(repo):
+        return repo.download_artifacts(artifact_path, dst_path=dst_path)
+
+    key = _get_cache_key(repo, artifact_path)
+    if key is None:
+        return repo.download_artifacts(artifact_path, dst_path=dst_path)
+
+    data_dir, relative_path = cache.get_or_download(
+        key, lambda dst: repo.download_artifacts(artifact_path, dst_path=dst)
+    )
+    cached_path = os.path.join(data_dir, relative_path)
+    _logger.debug("Using the cached artifacts at %s", cached_path)
+    # The artifacts are copied out of the cache, since the entry can be evicted while they're used
+    copy_function = shutil.copyfile
+    if dst_path is None:
+        dst_path = tempfile.mkdtemp()
+        copy_function = _link_or_copy
+
+    local_path = os.path.abspath(os.path.join(dst_path, relative_path))
+    try:
+        if os.path.isdir(cached_path):
+            shutil.copytree(
+                cached_path, local_path, copy_function=copy_function, dirs_exist_ok=True
+            )
+        else:
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            copy_function(cached_path, local_path)
+    except (FileNotFoundError, shutil.Error):
+        _logger.debug("The cached artifacts at %s were evicted, downloading them", cached_path)
+        return repo.download_artifacts(artifact_path, dst_path=dst_path)
+    return local_path
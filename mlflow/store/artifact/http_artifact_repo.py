@@ -1,17 +1,42 @@
+import logging
+import math
 import os
 import posixpath
+from concurrent.futures import as_completed
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.environment_variables import (
+    MLFLOW_ENABLE_PROXY_MULTIPART_UPLOAD,
+    MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE,
+    MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _yield_chunks_range,
+    verify_artifact_path,
+)
 from mlflow.tracking._tracking_service.utils import _get_default_host_creds
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.utils.file_utils import read_chunk
 from mlflow.utils.mime_type_utils import _guess_mime_type
 from mlflow.utils.rest_utils import augmented_raise_for_status, http_request
 
+_logger = logging.getLogger(__name__)
+
+# Maximum number of parts of a multipart upload, as for S3 multipart uploads
+_MAX_MULTIPART_UPLOAD_PARTS = 10_000
+
 
 class HttpArtifactRepository(ArtifactRepository):
     """Stores artifacts in a remote artifact storage using HTTP requests"""
 
+    def __init__(self, artifact_uri):
+        super().__init__(artifact_uri)
+        # Use an isolated thread pool executor for part uploads to avoid a deadlock caused by
+        # waiting for a part upload task within a file upload task of `log_artifacts`
+        self.chunk_thread_pool = self._create_thread_pool()
+
     @property
     def _host_creds(self):
         return _get_default_host_creds(self.artifact_uri)
@@ -22,6 +47,13 @@ class HttpArtifactRepository(ArtifactRepository):
         file_name = os.path.basename(local_file)
         mime_type = _guess_mime_type(file_name)
         paths = (artifact_path, file_name) if artifact_path else (file_name,)
+        if (
+            MLFLOW_ENABLE_PROXY_MULTIPART_UPLOAD.get()
+            and os.path.getsize(local_file) >= MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE.get()
+            and self._multipart_upload(local_file, posixpath.join(*paths))
+        ):
+            return
+
         endpoint = posixpath.join("/", *paths)
         extra_headers = {"Content-Type": mime_type}
         with open(local_file, "rb") as f:
@@ -30,25 +62,118 @@ class HttpArtifactRepository(ArtifactRepository):
             )
             augmented_raise_for_status(resp)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
-        local_dir = os.path.abspath(local_dir)
-        for root, _, filenames in os.walk(local_dir):
-            if root == local_dir:
-                artifact_dir = artifact_path
-            else:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                artifact_dir = (
-                    posixpath.join(artifact_path, rel_path) if artifact_path else rel_path
+    def _get_multipart_upload_endpoint(self, action, artifact_file):
+        """
+        :return: A tuple of the URL of the tracking server and the endpoint of the multipart upload
+                 API ``action`` for the artifact file, or ``None`` if the artifact URI isn't served
+                 by the mlflow-artifacts service.
+        """
+        if "/mlflow-artifacts/artifacts" not in self.artifact_uri:
+            return None
+        url, tail = self.artifact_uri.split("/mlflow-artifacts/artifacts", maxsplit=1)
+        endpoint = posixpath.join("/mlflow-artifacts/mpu", action, tail.strip("/"), artifact_file)
+        return url, endpoint
+
+    def _call_multipart_upload_endpoint(self, action, artifact_file, method="POST", **kwargs):
+        url, endpoint = self._get_multipart_upload_endpoint(action, artifact_file)
+        resp = http_request(_get_default_host_creds(url), endpoint, method, **kwargs)
+        augmented_raise_for_status(resp)
+        return resp.json()
+
+    def _upload_part(self, local_file, artifact_file, upload_id, part_number, chunk_size):
+        data = read_chunk(local_file, chunk_size, (part_number - 1) * chunk_size)
+        # Failed parts are retried on their own by `http_request`, without restarting the upload
+        return self._call_multipart_upload_endpoint(
+            "upload-part",
+            artifact_file,
+            method="PUT",
+            params={"upload_id": upload_id, "part_number": part_number},
+            data=data,
+        )["etag"]
+
+    def _multipart_upload(self, local_file, artifact_file):
+        """
+        Uploads a local file with a multipart upload, uploading its parts in parallel.
+
+        :return: ``True`` if the file was uploaded, ``False`` if the tracking server doesn't
+                 support multipart uploads.
+        """
+        create_endpoint = self._get_multipart_upload_endpoint("create", artifact_file)
+        if create_endpoint is None:
+            return False
+        url, endpoint = create_endpoint
+        resp = http_request(_get_default_host_creds(url), endpoint, "POST", json={})
+        # Servers predating multipart uploads don't have the endpoint, and servers whose artifact
+        # repository doesn't support them return a NOT_IMPLEMENTED error
+        if resp.status_code in (404, 501):
+            _logger.debug(
+                "Multipart uploads are not supported by the tracking server, uploading %s in a "
+                "single request",
+                local_file,
+            )
+            return False
+        augmented_raise_for_status(resp)
+        upload_id = resp.json()["upload_id"]
+
+        file_size = os.path.getsize(local_file)
+        chunk_size = max(
+            MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE.get(),
+            math.ceil(file_size / _MAX_MULTIPART_UPLOAD_PARTS),
+        )
+        num_parts = max(math.ceil(file_size / chunk_size), 1)
+        try:
+            futures = {
+                self.chunk_thread_pool.submit(
+                    self._upload_part, local_file, artifact_file, upload_id, part_number, chunk_size
+                ): part_number
+                for part_number in range(1, num_parts + 1)
+            }
+            etags = {}
+            failed_uploads = {}
+            for future in as_completed(futures):
+                part_number = futures[future]
+                try:
+                    etags[part_number] = future.result()
+                except Exception as e:
+                    failed_uploads[part_number] = repr(e)
+            if failed_uploads:
+                raise MlflowException(
+                    f"Failed to upload at least one part of {local_file}. Errors: {failed_uploads}"
+                )
+            self._call_multipart_upload_endpoint(
+                "complete",
+                artifact_file,
+                json={
+                    "upload_id": upload_id,
+                    "parts": [
+                        {"part_number": part_number, "etag": etags[part_number]}
+                        for part_number in sorted(etags)
+                    ],
+                },
+            )
+        except Exception as e:
+            _logger.warning(
+                "Encountered an unexpected error during multipart upload: %s, aborting", e
+            )
+            try:
+                self._call_multipart_upload_endpoint(
+                    "abort", artifact_file, json={"upload_id": upload_id}
                 )
-            for f in filenames:
-                self.log_artifact(os.path.join(root, f), artifact_dir)
+            except Exception as abort_error:
+                _logger.warning("Failed to abort multipart upload: %s", abort_error)
+            raise
+        return True
 
-    def list_artifacts(self, path=None):
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self._log_artifacts_concurrently(local_dir, artifact_path, self.log_artifact)
+
+    def _list_artifacts(self, path, recursive):
         endpoint = "/mlflow-artifacts/artifacts"
         url, tail = self.artifact_uri.split(endpoint, maxsplit=1)
         root = tail.lstrip("/")
         params = {"path": posixpath.join(root, path) if path else root}
+        if recursive:
+            params["recursive"] = "true"
         host_creds = _get_default_host_creds(url)
         resp = http_request(host_creds, endpoint, "GET", params=params)
         augmented_raise_for_status(resp)
@@ -63,6 +188,23 @@ class HttpArtifactRepository(ArtifactRepository):
 
         return sorted(file_infos, key=lambda f: f.path)
 
+    def list_artifacts(self, path=None):
+        return self._list_artifacts(path, recursive=False)
+
+    def _iter_artifacts_recursive(self, path):
+        for file_info in self._list_artifacts(path, recursive=True):
+            if file_info.is_dir:
+                # Servers that don't support recursive listings list the directories directly
+                # under the path, which are listed recursively like the default implementation
+                is_empty_dir = True
+                for dir_file_info in super()._iter_artifacts_recursive(file_info.path):
+                    is_empty_dir = False
+                    yield dir_file_info
+                if is_empty_dir:
+                    yield file_info
+            else:
+                yield file_info
+
     def _download_file(self, remote_file_path, local_path):
         endpoint = posixpath.join("/", remote_file_path)
         resp = http_request(self._host_creds, endpoint, "GET", stream=True)
@@ -72,6 +214,21 @@ class HttpArtifactRepository(ArtifactRepository):
             for chunk in resp.iter_content(chunk_size=chunk_size):
                 f.write(chunk)
 
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        endpoint = posixpath.join("/", artifact_path)
+        extra_headers = None
+        if range_start > 0 or range_end is not None:
+            byte_range = f"{range_start}-{'' if range_end is None else range_end}"
+            extra_headers = {"Range": f"bytes={byte_range}"}
+        resp = http_request(
+            self._host_creds, endpoint, "GET", stream=True, extra_headers=extra_headers
+        )
+        augmented_raise_for_status(resp)
+        chunks = resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+        if extra_headers and resp.status_code != 206:
+            chunks = _yield_chunks_range(chunks, range_start, range_end)
+        return chunks
+
     def delete_artifacts(self, artifact_path=None):
         endpoint = posixpath.join("/", artifact_path) if artifact_path else "/"
         resp = http_request(self._host_creds, endpoint, "DELETE", stream=True)
@@ -1,15 +1,33 @@
+import hashlib
 import os
 import shutil
+import tempfile
+import time
 
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _generate_multipart_upload_id,
+    _verify_multipart_upload_id,
+    verify_artifact_path,
+)
 from mlflow.utils.file_utils import (
     mkdir,
     list_all,
     get_file_info,
     local_file_uri_to_path,
     relative_path_to_artifact_path,
+    yield_file_range_in_chunks,
 )
 
+# The directory of the artifact root in which the parts of multipart uploads are staged, which
+# isn't listed as an artifact
+_MULTIPART_UPLOAD_DIR = ".mlflow-multipart-uploads"
+# Multipart uploads that haven't received a part for this long are abandoned
+_STALE_MULTIPART_UPLOAD_SECONDS = 24 * 60 * 60
+
 
 class LocalArtifactRepository(ArtifactRepository):
     """Stores artifacts as files in a local directory."""
@@ -95,20 +113,157 @@ class LocalArtifactRepository(ArtifactRepository):
                 )
                 for f in artifact_files
             ]
+            if not path:
+                infos = [f for f in infos if f.path != _MULTIPART_UPLOAD_DIR]
             return sorted(infos, key=lambda f: f.path)
         else:
             return []
 
+    def _iter_artifacts_recursive(self, path):
+        # NOTE: The path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        if path:
+            path = os.path.normpath(path)
+        list_dir = os.path.join(self.artifact_dir, path) if path else self.artifact_dir
+        for root, dirs, files in os.walk(list_dir):
+            if root == self.artifact_dir and _MULTIPART_UPLOAD_DIR in dirs:
+                dirs.remove(_MULTIPART_UPLOAD_DIR)
+            if not dirs and not files and root != list_dir:
+                # Empty directory
+                file_paths = [root]
+            else:
+                file_paths = [os.path.join(root, f) for f in files]
+            for file_path in file_paths:
+                yield get_file_info(
+                    file_path,
+                    relative_path_to_artifact_path(os.path.relpath(file_path, self.artifact_dir)),
+                )
+
     def _download_file(self, remote_file_path, local_path):
         # NOTE: The remote_file_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
         shutil.copyfile(remote_file_path, local_path)
 
+    def _supports_file_range_downloads(self):
+        # Copying local files in chunks isn't faster than copying them whole
+        return False
+
+    def _get_artifact_file_size(self, artifact_path):
+        # NOTE: The artifact_path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        if not os.path.isfile(local_artifact_path):
+            raise MlflowException(
+                f"Artifact file '{artifact_path}' does not exist", RESOURCE_DOES_NOT_EXIST
+            )
+        return os.path.getsize(local_artifact_path)
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        return yield_file_range_in_chunks(
+            local_artifact_path, range_start, range_end, chunk_size=_STREAM_CHUNK_SIZE
+        )
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        verify_artifact_path(artifact_file)
+        local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_file))
+        artifact_dir = os.path.dirname(local_artifact_path)
+        if not os.path.exists(artifact_dir):
+            mkdir(artifact_dir)
+        # Write to a temporary file first so that an interrupted stream doesn't leave a partial
+        # artifact behind
+        fd, tmp_path = tempfile.mkstemp(dir=artifact_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(stream, f, _STREAM_CHUNK_SIZE)
+            os.replace(tmp_path, local_artifact_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _get_multipart_upload_dir(self, upload_id):
+        # The parts are staged in the artifact root, on the filesystem of the artifacts and with
+        # the same access, in a directory that isn't listed as an artifact
+        _verify_multipart_upload_id(upload_id)
+        return os.path.join(self.artifact_dir, _MULTIPART_UPLOAD_DIR, upload_id)
+
+    def _delete_stale_multipart_uploads(self):
+        """
+        Delete the staged parts of the multipart uploads that were abandoned without being
+        completed or aborted.
+        """
+        staging_dir = os.path.join(self.artifact_dir, _MULTIPART_UPLOAD_DIR)
+        if not os.path.isdir(staging_dir):
+            return
+        now = time.time()
+        for upload_id in os.listdir(staging_dir):
+            upload_dir = os.path.join(staging_dir, upload_id)
+            try:
+                # The directory is modified each time a part is uploaded
+                if now - os.stat(upload_dir).st_mtime > _STALE_MULTIPART_UPLOAD_SECONDS:
+                    shutil.rmtree(upload_dir, ignore_errors=True)
+            except OSError:
+                # The upload was completed or aborted concurrently
+                continue
+
+    def _create_multipart_upload(self, artifact_file):
+        verify_artifact_path(artifact_file)
+        self._delete_stale_multipart_uploads()
+        upload_id = _generate_multipart_upload_id()
+        os.makedirs(self._get_multipart_upload_dir(upload_id))
+        return upload_id
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        upload_dir = self._get_multipart_upload_dir(upload_id)
+        if not os.path.isdir(upload_dir):
+            raise MlflowException(
+                f"Multipart upload '{upload_id}' does not exist", RESOURCE_DOES_NOT_EXIST
+            )
+        md5 = hashlib.md5()
+        with open(os.path.join(upload_dir, str(part_number)), "wb") as f:
+            while chunk := part_file.read(_STREAM_CHUNK_SIZE):
+                md5.update(chunk)
+                f.write(chunk)
+        return md5.hexdigest()
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        upload_dir = self._get_multipart_upload_dir(upload_id)
+        part_paths = [
+            os.path.join(upload_dir, str(part_number)) for part_number, _ in sorted(parts)
+        ]
+        missing_parts = [path for path in part_paths if not os.path.isfile(path)]
+        if missing_parts:
+            raise MlflowException(
+                f"Parts {[os.path.basename(path) for path in missing_parts]} of multipart upload "
+                f"'{upload_id}' were not uploaded",
+                INVALID_PARAMETER_VALUE,
+            )
+        local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_file))
+        artifact_dir = os.path.dirname(local_artifact_path)
+        if not os.path.exists(artifact_dir):
+            mkdir(artifact_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=artifact_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for part_path in part_paths:
+                    with open(part_path, "rb") as part:
+                        shutil.copyfileobj(part, f, _STREAM_CHUNK_SIZE)
+            os.replace(tmp_path, local_artifact_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        shutil.rmtree(upload_dir)
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        shutil.rmtree(self._get_multipart_upload_dir(upload_id), ignore_errors=True)
+
     def delete_artifacts(self, artifact_path=None):
         artifact_path = local_file_uri_to_path(
             os.path.join(self._artifact_dir, artifact_path) if artifact_path else self._artifact_dir
         )
 
-        if os.path.exists(artifact_path):
+        if os.path.isfile(artifact_path):
+            os.remove(artifact_path)
+        elif os.path.exists(artifact_path):
             shutil.rmtree(artifact_path)
@@ -117,6 +117,15 @@ class ModelsArtifactRepository(ArtifactRepository):
         """
         return self.repo.list_artifacts(path)
 
+    def _iter_artifacts_recursive(self, path):
+        return self.repo._iter_artifacts_recursive(path)
+
+    def _supports_file_range_downloads(self):
+        return self.repo._supports_file_range_downloads()
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        return self.repo._download_artifact_stream(artifact_path, range_start, range_end)
+
     def download_artifacts(self, artifact_path, dst_path=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
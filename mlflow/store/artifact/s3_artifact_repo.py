@@ -14,9 +14,13 @@ from mlflow.environment_variables import (
     MLFLOW_S3_IGNORE_TLS,
 )
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    _STREAM_CHUNK_SIZE,
+    ArtifactRepository,
+    _filter_empty_directories,
+)
 from mlflow.utils import data_utils
-from mlflow.utils.file_utils import relative_path_to_artifact_path
 
 _MAX_CACHE_SECONDS = 300
 
@@ -133,9 +137,9 @@ class S3ArtifactRepository(ArtifactRepository):
         else:
             return None
 
-    def _upload_file(self, s3_client, local_file, bucket, key):
+    def _get_upload_extra_args(self, file_name):
         extra_args = {}
-        guessed_type, guessed_encoding = guess_type(local_file)
+        guessed_type, guessed_encoding = guess_type(file_name)
         if guessed_type is not None:
             extra_args["ContentType"] = guessed_type
         if guessed_encoding is not None:
@@ -143,7 +147,15 @@ class S3ArtifactRepository(ArtifactRepository):
         environ_extra_args = self.get_s3_file_upload_extra_args()
         if environ_extra_args is not None:
             extra_args.update(environ_extra_args)
-        s3_client.upload_file(Filename=local_file, Bucket=bucket, Key=key, ExtraArgs=extra_args)
+        return extra_args
+
+    def _upload_file(self, s3_client, local_file, bucket, key):
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs=self._get_upload_extra_args(local_file),
+        )
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
@@ -156,25 +168,23 @@ class S3ArtifactRepository(ArtifactRepository):
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
         s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for root, _, filenames in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                self._upload_file(
-                    s3_client=s3_client,
-                    local_file=os.path.join(root, f),
-                    bucket=bucket,
-                    key=posixpath.join(upload_path, f),
-                )
+
+        def log_file(local_file, artifact_dir):
+            upload_path = posixpath.join(dest_path, artifact_dir) if artifact_dir else dest_path
+            self._upload_file(
+                s3_client=s3_client,
+                local_file=local_file,
+                bucket=bucket,
+                key=posixpath.join(upload_path, os.path.basename(local_file)),
+            )
+
+        self._log_artifacts_concurrently(local_dir, artifact_path, log_file)
 
     def list_artifacts(self, path=None):
+        return [file_info for file_info, _ in self._list_artifacts_with_versions(path)]
+
+    def _list_artifacts_with_versions(self, path=None):
         (bucket, artifact_path) = data_utils.parse_s3_uri(self.artifact_uri)
         dest_path = artifact_path
         if path:
@@ -194,7 +204,7 @@ class S3ArtifactRepository(ArtifactRepository):
                 subdir_rel_path = posixpath.relpath(path=subdir_path, start=artifact_path)
                 if subdir_rel_path.endswith("/"):
                     subdir_rel_path = subdir_rel_path[:-1]
-                infos.append(FileInfo(subdir_rel_path, True, None))
+                infos.append((FileInfo(subdir_rel_path, True, None), None))
             # Objects listed directly will be files
             for obj in result.get("Contents", []):
                 file_path = obj.get("Key")
@@ -203,8 +213,35 @@ class S3ArtifactRepository(ArtifactRepository):
                 )
                 file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
                 file_size = int(obj.get("Size"))
-                infos.append(FileInfo(file_rel_path, False, file_size))
-        return sorted(infos, key=lambda f: f.path)
+                infos.append((FileInfo(file_rel_path, False, file_size), obj.get("ETag")))
+        return sorted(infos, key=lambda info: info[0].path)
+
+    def _iter_artifacts_recursive(self, path):
+        (bucket, artifact_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path + "/" if dest_path else ""
+
+        def iter_objects():
+            s3_client = self._get_s3_client()
+            paginator = s3_client.get_paginator("list_objects_v2")
+            # Without a delimiter, all the objects under the prefix are listed at once
+            for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for obj in result.get("Contents", []):
+                    file_path = obj.get("Key")
+                    self._verify_listed_object_contains_artifact_path_prefix(
+                        listed_object_path=file_path, artifact_path=artifact_path
+                    )
+                    file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
+                    if file_path.endswith("/"):
+                        # Placeholder object of a directory
+                        if file_path != prefix:
+                            yield FileInfo(file_rel_path, True, None)
+                        continue
+                    yield FileInfo(file_rel_path, False, int(obj.get("Size")))
+
+        yield from _filter_empty_directories(iter_objects())
 
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
@@ -221,6 +258,80 @@ class S3ArtifactRepository(ArtifactRepository):
         s3_client = self._get_s3_client()
         s3_client.download_file(bucket, s3_full_path, local_path)
 
+    def _get_artifact_file_size(self, artifact_path):
+        from botocore.exceptions import ClientError
+
+        (bucket, s3_root_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        try:
+            head = self._get_s3_client().head_object(Bucket=bucket, Key=s3_full_path)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                raise MlflowException(
+                    f"Artifact file '{artifact_path}' does not exist", RESOURCE_DOES_NOT_EXIST
+                ) from e
+            raise
+        return head["ContentLength"]
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        (bucket, s3_root_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        kwargs = {}
+        # S3 rejects ranges of empty objects, so only request a range if a partial content is
+        # needed
+        if range_start > 0 or range_end is not None:
+            kwargs["Range"] = f"bytes={range_start}-{'' if range_end is None else range_end}"
+        response = self._get_s3_client().get_object(Bucket=bucket, Key=s3_full_path, **kwargs)
+        return response["Body"].iter_chunks(_STREAM_CHUNK_SIZE)
+
+    def _log_artifact_stream(self, stream, artifact_file):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        self._get_s3_client().upload_fileobj(
+            Fileobj=stream,
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            ExtraArgs=self._get_upload_extra_args(artifact_file),
+        )
+
+    def _create_multipart_upload(self, artifact_file):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        response = self._get_s3_client().create_multipart_upload(
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            **self._get_upload_extra_args(artifact_file),
+        )
+        return response["UploadId"]
+
+    def _upload_multipart_part(self, artifact_file, upload_id, part_number, part_file):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        response = self._get_s3_client().upload_part(
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=part_file,
+        )
+        return response["ETag"]
+
+    def _complete_multipart_upload(self, artifact_file, upload_id, parts):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        self._get_s3_client().complete_multipart_upload(
+            Bucket=bucket,
+            Key=posixpath.join(dest_path, artifact_file),
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": etag} for part_number, etag in sorted(parts)
+                ]
+            },
+        )
+
+    def _abort_multipart_upload(self, artifact_file, upload_id):
+        (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
+        self._get_s3_client().abort_multipart_upload(
+            Bucket=bucket, Key=posixpath.join(dest_path, artifact_file), UploadId=upload_id
+        )
+
     def delete_artifacts(self, artifact_path=None):
         (bucket, dest_path) = data_utils.parse_s3_uri(self.artifact_uri)
         if artifact_path:
@@ -4,7 +4,9 @@ from typing import List, Optional
 from mlflow.entities import ViewType, DatasetInput
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking.metric_sampling import sample_metric_history
 from mlflow.utils.annotations import developer_stable, experimental
+from mlflow.utils.validation import _validate_batches_log_limits, _validate_get_runs_limit
 
 
 @developer_stable
@@ -170,6 +172,35 @@ class AbstractStore:
         """
         pass
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs from backend store, like :py:meth:`get_run` does for each of them.
+
+        The default implementation fetches each run with :py:meth:`get_run`; stores that can fetch
+        many runs with fewer queries override it.
+
+        :param run_ids: List of the unique identifiers of the runs, at most
+                        ``mlflow.utils.validation.MAX_RUNS_PER_BATCH`` of them.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``, if
+                 all the runs exist. Otherwise, raises an exception.
+        """
+        _validate_get_runs_limit(run_ids)
+        return [self.get_run(run_id) for run_id in run_ids]
+
+    def _get_run_infos(self, run_ids):
+        """
+        Fetch the infos of multiple runs from backend store, without their data, e.g. to find
+        their experiments.
+
+        :param run_ids: List of the unique identifiers of the runs.
+
+        :return: A dictionary mapping the specified run IDs to their
+                 :py:class:`mlflow.entities.RunInfo` objects, if all the runs exist. Otherwise,
+                 raises an exception.
+        """
+        return {run_id: self.get_run(run_id).info for run_id in run_ids}
+
     @abstractmethod
     def update_run_info(self, run_id, run_status, end_time, run_name):
         """
@@ -268,6 +299,35 @@ class AbstractStore:
         # without the paged queries to the backend store.
         pass
 
+    def get_sampled_metric_history_bulk(self, run_ids, metric_keys, max_points, x_axis="step"):
+        """
+        Return the histories of the given metrics for the given runs, each downsampled to at most
+        ``max_points`` points by keeping the minimum and maximum values of equally sized buckets
+        along ``x_axis``. See :py:mod:`mlflow.store.tracking.metric_sampling` for details.
+
+        :param run_ids: Unique identifiers of the runs from which to fetch the metric histories.
+        :param metric_keys: Metric names within the runs.
+        :param max_points: The maximum number of points to return for each metric history, at
+                           least 2.
+        :param x_axis: The axis used to bucket the points, either ``"step"`` or ``"timestamp"``.
+
+        :return: A dictionary mapping run IDs to dictionaries mapping metric keys to lists of
+            :py:class:`mlflow.entities.Metric` sorted by ``x_axis``. Metrics that haven't been
+            logged to a run are omitted. Raises an exception if a run doesn't exist.
+        """
+        # NB: This default implementation fetches every metric history separately. Stores
+        # should override it to fetch all the histories at once.
+        histories = {}
+        for run_id in run_ids:
+            for metric_key in metric_keys:
+                history = self.get_metric_history(run_id, metric_key)
+                if history:
+                    # pylint: disable=cell-var-from-loop
+                    histories.setdefault(run_id, {})[metric_key] = sample_metric_history(
+                        lambda: history, max_points, x_axis
+                    )
+        return histories
+
     def search_runs(
         self,
         experiment_ids,
@@ -332,6 +392,23 @@ class AbstractStore:
         """
         pass
 
+    def log_batches(self, batches):
+        """
+        Log multiple metrics, params, and tags for multiple runs, like :py:meth:`log_batch` does
+        for each batch.
+
+        The default implementation logs each batch with :py:meth:`log_batch`; stores that can log
+        many batches with fewer writes override it.
+
+        :param batches: List of ``(run_id, metrics, params, tags)`` tuples, each with the
+                        arguments of :py:meth:`log_batch`.
+
+        :return: None.
+        """
+        _validate_batches_log_limits(batches)
+        for run_id, metrics, params, tags in batches:
+            self.log_batch(run_id, metrics, params, tags)
+
     @abstractmethod
     def record_logged_model(self, run_id, mlflow_model):
         """
@@ -205,13 +205,14 @@ class SqlRun(Base):
             mlflow_attribute_name, mlflow_attribute_name
         )
 
-    def to_mlflow_entity(self):
+    def to_run_info(self):
         """
-        Convert DB model to corresponding MLflow entity.
+        Convert DB model to the run info of the corresponding MLflow entity, without loading the
+        run's data. The run name isn't read from the run's tags if it's missing.
 
-        :return: :py:class:`mlflow.entities.Run`.
+        :return: :py:class:`mlflow.entities.RunInfo`.
         """
-        run_info = RunInfo(
+        return RunInfo(
             run_uuid=self.run_uuid,
             run_id=self.run_uuid,
             run_name=self.name,
@@ -224,6 +225,13 @@ class SqlRun(Base):
             artifact_uri=self.artifact_uri,
         )
 
+    def to_mlflow_entity(self):
+        """
+        Convert DB model to corresponding MLflow entity.
+
+        :return: :py:class:`mlflow.entities.Run`.
+        """
+        run_info = self.to_run_info()
         tags = [t.to_mlflow_entity() for t in self.tags]
         run_data = RunData(
             metrics=[m.to_mlflow_entity() for m in self.latest_metrics],
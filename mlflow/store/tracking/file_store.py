@@ -3,10 +3,12 @@ import json
 import logging
 import time
 import os
+import sqlite3
 import sys
 import shutil
 
 import uuid
+from functools import partial
 from typing import List, Dict, NamedTuple, Optional
 from dataclasses import dataclass
 
@@ -45,6 +47,8 @@ from mlflow.store.tracking import (
     SEARCH_MAX_RESULTS_THRESHOLD,
 )
 from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.file_store_index import FileStoreRunIndex
+from mlflow.store.tracking.metric_sampling import sample_metric_history
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.utils import get_results_from_paginated_fn
 from mlflow.utils.name_utils import _generate_random_name, _generate_unique_integer_id
@@ -58,8 +62,12 @@ from mlflow.utils.validation import (
     _validate_experiment_id,
     _validate_batch_log_limits,
     _validate_batch_log_data,
+    _validate_batches_log_limits,
+    _validate_batches_param_keys_unique,
+    _validate_get_runs_limit,
     _validate_param_keys_unique,
     _validate_experiment_name,
+    path_not_unique,
 )
 from mlflow.utils.file_utils import (
     is_directory,
@@ -94,7 +102,7 @@ from mlflow.utils.mlflow_tags import (
     MLFLOW_RUN_NAME,
     _get_run_name_from_tags,
 )
-from mlflow.environment_variables import MLFLOW_TRACKING_DIR
+from mlflow.environment_variables import MLFLOW_TRACKING_DIR, MLFLOW_ENABLE_FILE_STORE_RUN_INDEX
 
 
 def _default_root_dir():
@@ -211,6 +219,15 @@ class FileStore(AbstractStore):
             )
         return None
 
+    def _get_run_index(self, experiment_id):
+        """
+        Returns the run index of the given experiment, or ``None`` if the run index is disabled.
+        """
+        if not MLFLOW_ENABLE_FILE_STORE_RUN_INDEX.get():
+            return None
+        experiment_dir = self._get_experiment_path(experiment_id)
+        return FileStoreRunIndex(experiment_dir) if experiment_dir else None
+
     def _get_run_dir(self, experiment_id, run_uuid):
         _validate_run_id(run_uuid)
         if not self._has_experiment(experiment_id):
@@ -535,8 +552,10 @@ class FileStore(AbstractStore):
         Permanently delete a run (metadata and metrics, tags, parameters).
         This is used by the ``mlflow gc`` command line and is not intended to be used elsewhere.
         """
-        _, run_dir = self._find_run_root(run_id)
+        experiment_id, run_dir = self._find_run_root(run_id)
         shutil.rmtree(run_dir)
+        if run_index := self._get_run_index(experiment_id):
+            run_index.delete_run(run_id)
 
     def _get_deleted_runs(self, older_than=0):
         """
@@ -588,13 +607,38 @@ class FileStore(AbstractStore):
             return os.path.basename(os.path.abspath(experiment_dir)), runs[0]
         return None, None
 
+    def _find_run_roots(self, run_uuids):
+        """
+        Like :py:meth:`_find_run_root` for multiple runs, listing the directory of each experiment
+        at most once.
+
+        :return: A dictionary mapping the IDs of the found runs to their experiment ID and run
+                 directory.
+        """
+        for run_uuid in run_uuids:
+            _validate_run_id(run_uuid)
+        self._check_root_dir()
+        remaining_run_uuids = set(run_uuids)
+        run_roots = {}
+        all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
+        for experiment_dir in all_experiments:
+            if not remaining_run_uuids:
+                break
+            experiment_id = os.path.basename(os.path.abspath(experiment_dir))
+            for run_uuid in remaining_run_uuids.intersection(os.listdir(experiment_dir)):
+                run_roots[run_uuid] = experiment_id, os.path.join(experiment_dir, run_uuid)
+            remaining_run_uuids.difference_update(run_roots)
+        return run_roots
+
     def update_run_info(self, run_id, run_status, end_time, run_name):
         _validate_run_id(run_id)
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         new_info = run_info._copy_with_overrides(run_status, end_time, run_name=run_name)
         if run_name:
-            self._set_run_tag(run_info, RunTag(MLFLOW_RUN_NAME, run_name))
+            run_name_tag = RunTag(MLFLOW_RUN_NAME, run_name)
+            self._set_run_tag(run_info, run_name_tag)
+            self._index_run_data(run_info, tags=[run_name_tag])
         self._overwrite_run_info(new_info)
         return new_info
 
@@ -646,6 +690,8 @@ class FileStore(AbstractStore):
         run_info_dict = _make_persisted_run_info_dict(run_info)
         run_info_dict["deleted_time"] = None
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict)
+        if run_index := self._get_run_index(experiment_id):
+            run_index.create_run(run_info)
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
@@ -665,6 +711,14 @@ class FileStore(AbstractStore):
             )
         return self._get_run_from_info(run_info)
 
+    def get_runs(self, run_ids):
+        """
+        Note: Will get both active and deleted runs.
+        """
+        _validate_get_runs_limit(run_ids)
+        run_infos = self._get_run_infos(run_ids)
+        return [self._get_run_from_info(run_infos[run_id]) for run_id in run_ids]
+
     def _get_run_from_info(self, run_info):
         metrics = self._get_all_metrics(run_info)
         params = self._get_all_params(run_info)
@@ -676,6 +730,43 @@ class FileStore(AbstractStore):
                 run_info._set_run_name(run_name)
         return Run(run_info, RunData(metrics, params, tags), inputs)
 
+    def _get_partial_run_from_info(self, run_info, keys):
+        """
+        Builds a run that only contains the metrics, params and tags with the given keys, and the
+        run inputs if dataset keys are specified. ``keys`` is the dictionary returned by
+        :py:func:`SearchUtils.get_keys_referenced_by_search`.
+        """
+        run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
+        tag_keys = keys["tag"]
+        if not run_info.run_name:
+            tag_keys = tag_keys | {MLFLOW_RUN_NAME}
+        metrics = self._read_run_files(
+            run_dir, FileStore.METRICS_FOLDER_NAME, keys["metric"], self._get_metric_from_file
+        )
+        params = self._read_run_files(
+            run_dir, FileStore.PARAMS_FOLDER_NAME, keys["parameter"], self._get_param_from_file
+        )
+        tags = self._read_run_files(
+            run_dir, FileStore.TAGS_FOLDER_NAME, tag_keys, self._get_tag_from_file
+        )
+        inputs = self._get_all_inputs(run_info) if keys["dataset"] else None
+        if not run_info.run_name:
+            run_name = _get_run_name_from_tags(tags)
+            if run_name:
+                run_info._set_run_name(run_name)
+        return Run(run_info, RunData(metrics, params, tags), inputs)
+
+    @staticmethod
+    def _read_run_files(run_dir, subfolder_name, keys, read_file_func):
+        parent_path = os.path.join(run_dir, subfolder_name)
+        return [
+            read_file_func(parent_path, key)
+            for key in keys
+            # Keys from search filters aren't validated, make sure they can't resolve to other
+            # files before checking if they have been logged
+            if not path_not_unique(key) and os.path.isfile(os.path.join(parent_path, key))
+        ]
+
     def _get_run_info(self, run_uuid):
         """
         Note: Will get both active and deleted runs.
@@ -692,6 +783,31 @@ class FileStore(AbstractStore):
             )
         return run_info
 
+    def _get_run_infos(self, run_uuids):
+        """
+        Like :py:meth:`_get_run_info` for multiple runs.
+
+        :return: A dictionary mapping the specified run IDs to their run infos.
+        """
+        run_roots = self._find_run_roots(run_uuids)
+        run_infos = {}
+        for run_uuid in run_uuids:
+            if run_uuid in run_infos:
+                continue
+            if run_uuid not in run_roots:
+                raise MlflowException(
+                    "Run '%s' not found" % run_uuid, databricks_pb2.RESOURCE_DOES_NOT_EXIST
+                )
+            exp_id, run_dir = run_roots[run_uuid]
+            run_info = self._get_run_info_from_dir(run_dir)
+            if run_info.experiment_id != exp_id:
+                raise MlflowException(
+                    "Run '%s' metadata is in invalid state." % run_uuid,
+                    databricks_pb2.INVALID_STATE,
+                )
+            run_infos[run_uuid] = run_info
+        return run_infos
+
     def _get_run_info_from_dir(self, run_dir):
         meta = FileStore._read_yaml(run_dir, FileStore.META_DATA_FILE_NAME)
         run_info = _read_persisted_run_info_dict(meta)
@@ -815,6 +931,35 @@ class FileStore(AbstractStore):
             None,
         )
 
+    def get_sampled_metric_history_bulk(self, run_ids, metric_keys, max_points, x_axis="step"):
+        """
+        Return the histories of the given metrics for the given runs, each downsampled to at most
+        ``max_points`` points. Metric files are streamed rather than loaded into memory.
+
+        See :py:func:`AbstractStore.get_sampled_metric_history_bulk` for parameter and return
+        value descriptions.
+        """
+        histories = {}
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+            run_info = self._get_run_info(run_id)
+            for metric_key in metric_keys:
+                metric_path = self._get_metric_path(
+                    run_info.experiment_id, run_info.run_id, metric_key
+                )
+                if not os.path.isfile(metric_path):
+                    continue
+
+                def read_history(metric_path=metric_path, metric_key=metric_key):
+                    with open(metric_path) as f:
+                        for line in f:
+                            yield FileStore._get_metric_from_line(metric_key, line)
+
+                histories.setdefault(run_id, {})[metric_key] = sample_metric_history(
+                    read_history, max_points, x_axis
+                )
+        return histories
+
     @staticmethod
     def _get_param_from_file(parent_path, param_name):
         _validate_param_name(param_name)
@@ -880,28 +1025,89 @@ class FileStore(AbstractStore):
         )
         run_infos = []
         for r_dir in run_dirs:
+            run_info = self._get_listed_run_info_from_dir(experiment_id, r_dir)
+            if run_info is not None and LifecycleStage.matches_view_type(
+                view_type, run_info.lifecycle_stage
+            ):
+                run_infos.append(run_info)
+        return run_infos
+
+    def _get_listed_run_info_from_dir(self, experiment_id, run_dir):
+        """
+        Reads the run info of a run found while listing the runs of an experiment. Returns
+        ``None`` if the run is malformed or recorded under the wrong experiment.
+        """
+        try:
+            # trap and warn known issues, will raise unexpected exceptions to caller
+            run_info = self._get_run_info_from_dir(run_dir)
+        except MissingConfigException as rnfe:
+            # trap malformed run exception and log warning
+            r_id = os.path.basename(run_dir)
+            logging.warning("Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True)
+            return None
+        if run_info.experiment_id != experiment_id:
+            logging.warning(
+                "Wrong experiment ID (%s) recorded for run '%s'. "
+                "It should be %s. Run will be ignored.",
+                str(run_info.experiment_id),
+                str(run_info.run_id),
+                str(experiment_id),
+                exc_info=True,
+            )
+            return None
+        return run_info
+
+    def _read_run_to_index(self, experiment_id, run_dir):
+        run_info = self._get_listed_run_info_from_dir(experiment_id, run_dir)
+        if run_info is None:
+            return None
+        tags = self._get_all_tags(run_info)
+        if not run_info.run_name and (run_name := _get_run_name_from_tags(tags)):
+            run_info._set_run_name(run_name)
+        metrics = self._get_all_metrics(run_info)
+        params = self._get_all_params(run_info)
+        return Run(run_info, RunData(metrics, params, tags))
+
+    def _search_indexed_runs(
+        self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+    ):
+        """
+        Searches runs with the run indexes of the experiments. The filter, ``order_by`` and
+        pagination are evaluated by the run indexes, and only the runs of the requested page are
+        read from their run directories.
+        """
+        self._check_root_dir()
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        experiment_ids = [e for e in experiment_ids if self._has_experiment(e)]
+        # A single run index returns the requested page directly, while the runs of several
+        # experiments are merged from the first ``offset + max_results`` runs of each index. One
+        # more run is requested to know whether there is a next page.
+        if len(experiment_ids) == 1:
+            index_offset, index_max_results = offset, max_results + 1
+        else:
+            index_offset, index_max_results = 0, offset + max_results + 1
+        runs = []
+        for experiment_id in experiment_ids:
+            run_index = self._get_run_index(experiment_id)
             try:
-                # trap and warn known issues, will raise unexpected exceptions to caller
-                run_info = self._get_run_info_from_dir(r_dir)
-                if run_info.experiment_id != experiment_id:
-                    logging.warning(
-                        "Wrong experiment ID (%s) recorded for run '%s'. "
-                        "It should be %s. Run will be ignored.",
-                        str(run_info.experiment_id),
-                        str(run_info.run_id),
-                        str(experiment_id),
-                        exc_info=True,
+                run_index.reconcile(
+                    FileStore.RESERVED_EXPERIMENT_FOLDERS,
+                    partial(self._read_run_to_index, experiment_id),
+                )
+                runs.extend(
+                    run_index.search_runs(
+                        run_view_type, filter_string, order_by, index_max_results, index_offset
                     )
-                    continue
-                if LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
-                    run_infos.append(run_info)
-            except MissingConfigException as rnfe:
-                # trap malformed run exception and log warning
-                r_id = os.path.basename(r_dir)
-                logging.warning(
-                    "Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True
                 )
-        return run_infos
+            except sqlite3.Error:
+                run_index.invalidate()
+                raise
+        if len(experiment_ids) != 1:
+            runs = SearchUtils.sort(runs, order_by)[offset:]
+        next_page_token = None
+        if len(runs) > max_results:
+            next_page_token = SearchUtils.create_page_token(offset + max_results)
+        return self._read_indexed_runs(runs[:max_results]), next_page_token
 
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
@@ -912,21 +1118,52 @@ class FileStore(AbstractStore):
                 f"most {SEARCH_MAX_RESULTS_THRESHOLD}, but got value {max_results}",
                 databricks_pb2.INVALID_PARAMETER_VALUE,
             )
+        # Runs are loaded with the data that the filter and order_by clauses reference only, and
+        # are fully read for the requested page once the runs have been filtered and sorted
+        keys = SearchUtils.get_keys_referenced_by_search(filter_string, order_by)
+        # Dataset filters require the run inputs, which aren't recorded in the run index
+        if MLFLOW_ENABLE_FILE_STORE_RUN_INDEX.get() and not keys["dataset"]:
+            try:
+                return self._search_indexed_runs(
+                    experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+                )
+            except sqlite3.Error as e:
+                logging.warning(
+                    "Failed to search the run index, falling back to reading the run files: %s", e
+                )
         runs = []
         for experiment_id in experiment_ids:
             run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
+            runs.extend(self._get_partial_run_from_info(r, keys) for r in run_infos)
         filtered = SearchUtils.filter(runs, filter_string)
         sorted_runs = SearchUtils.sort(filtered, order_by)
         runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+        runs = [self._get_run_from_info(run.info) for run in runs]
         return runs, next_page_token
 
+    def _read_indexed_runs(self, indexed_runs):
+        """
+        Reads the runs returned from a run index from their run directories. Runs that are no
+        longer valid are skipped and removed from the run index.
+        """
+        runs = []
+        for indexed_run in indexed_runs:
+            experiment_id = indexed_run.info.experiment_id
+            run_dir = self._get_run_dir(experiment_id, indexed_run.info.run_id)
+            run_info = self._get_listed_run_info_from_dir(experiment_id, run_dir)
+            if run_info is None:
+                self._get_run_index(experiment_id).delete_run(indexed_run.info.run_id)
+                continue
+            runs.append(self._get_run_from_info(run_info))
+        return runs
+
     def log_metric(self, run_id, metric):
         _validate_run_id(run_id)
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._log_run_metric(run_info, metric)
+        self._index_run_data(run_info, metrics=[metric])
 
     def _log_run_metric(self, run_info, metric):
         metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric.key)
@@ -947,6 +1184,7 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._log_run_param(run_info, param)
+        self._index_run_data(run_info, params=[param])
 
     def _log_run_param(self, run_info, param):
         param_path = self._get_param_path(run_info.experiment_id, run_info.run_id, param.key)
@@ -1004,6 +1242,7 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._set_run_tag(run_info, tag)
+        self._index_run_data(run_info, tags=[tag])
         if tag.key == MLFLOW_RUN_NAME:
             run_status = RunStatus.from_string(run_info.status)
             self.update_run_info(run_id, run_status, run_info.end_time, tag.value)
@@ -1030,6 +1269,8 @@ class FileStore(AbstractStore):
                 error_code=RESOURCE_DOES_NOT_EXIST,
             )
         os.remove(tag_path)
+        if run_index := self._get_run_index(run_info.experiment_id):
+            run_index.delete_tag(run_id, key)
 
     def _overwrite_run_info(self, run_info, deleted_time=None):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
@@ -1037,6 +1278,21 @@ class FileStore(AbstractStore):
         if deleted_time is not None:
             run_info_dict["deleted_time"] = deleted_time
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=True)
+        if run_index := self._get_run_index(run_info.experiment_id):
+            run_index.update_run_info(run_info)
+
+    def _index_run_data(self, run_info, metrics=(), params=(), tags=()):
+        """
+        Records metrics, params and tags that have been written to the run directory in the run
+        index of the run's experiment, if the run index is enabled.
+        """
+        if run_index := self._get_run_index(run_info.experiment_id):
+            run_index.log_batch(
+                run_info.run_id,
+                metrics=metrics,
+                params=[Param(p.key, self._writeable_value(p.value)) for p in params],
+                tags=[RunTag(t.key, self._writeable_value(t.value)) for t in tags],
+            )
 
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
@@ -1045,6 +1301,23 @@ class FileStore(AbstractStore):
         _validate_param_keys_unique(params)
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
+        self._log_run_batch(run_info, metrics, params, tags)
+
+    def log_batches(self, batches):
+        for run_id, metrics, params, tags in batches:
+            _validate_run_id(run_id)
+            _validate_batch_log_data(metrics, params, tags)
+        _validate_batches_log_limits(batches)
+        _validate_batches_param_keys_unique(batches)
+        # Find all the runs before logging anything, so that nothing is logged if any is missing
+        run_infos = self._get_run_infos([run_id for run_id, *_ in batches])
+        for run_info in run_infos.values():
+            check_run_is_active(run_info)
+        for run_id, metrics, params, tags in batches:
+            self._log_run_batch(run_infos[run_id], metrics, params, tags)
+
+    def _log_run_batch(self, run_info, metrics, params, tags):
+        run_id = run_info.run_id
         try:
             for param in params:
                 self._log_run_param(run_info, param)
@@ -1058,7 +1331,11 @@ class FileStore(AbstractStore):
                     self.update_run_info(run_id, run_status, run_info.end_time, tag.value)
                 self._set_run_tag(run_info, tag)
         except Exception as e:
+            # Part of the batch may have been written, let the next search index the run again
+            if run_index := self._get_run_index(run_info.experiment_id):
+                run_index.delete_run(run_id)
             raise MlflowException(e, INTERNAL_ERROR)
+        self._index_run_data(run_info, metrics=metrics, params=params, tags=tags)
 
     def record_logged_model(self, run_id, mlflow_model):
         from mlflow.models import Model
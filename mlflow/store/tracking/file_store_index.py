@@ -0,0 +1,423 @@
+"""
+A persistent, per-experiment index of run metadata for the file-based tracking ``FileStore``.
+
+The index is a SQLite database stored next to the runs of an experiment. It records the run info,
+the latest value of each metric, the params and the tags of every run, which is all the data
+required to evaluate search filters, ``order_by`` clauses and pagination in SQL without reading
+the ``meta.yaml``, metric, param and tag files of every run.
+
+The run directories remain the source of truth: the index is kept up to date by the ``FileStore``
+write APIs and is reconciled with the run directories of the experiment on every search, so that
+runs created (or permanently deleted) without the index are picked up. Updates made to existing
+runs by writers that don't maintain the index are not detected.
+"""
+import logging
+import math
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.search_utils import SearchUtils
+
+_logger = logging.getLogger(__name__)
+
+# Seconds to wait for a lock held by a concurrent writer before giving up
+_SQLITE_TIMEOUT_SECONDS = 30
+
+# Recorded in the ``user_version`` of the index database once its schema has been created
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_uuid TEXT PRIMARY KEY,
+    run_name TEXT,
+    experiment_id TEXT,
+    user_id TEXT,
+    status TEXT,
+    start_time INTEGER,
+    end_time INTEGER,
+    lifecycle_stage TEXT,
+    artifact_uri TEXT
+);
+CREATE TABLE IF NOT EXISTS latest_metrics (
+    run_uuid TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value REAL,
+    is_nan INTEGER NOT NULL,
+    timestamp INTEGER,
+    step INTEGER,
+    PRIMARY KEY (run_uuid, key)
+);
+CREATE TABLE IF NOT EXISTS params (
+    run_uuid TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_uuid, key)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    run_uuid TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_uuid, key)
+);
+"""
+
+_RUN_INFO_COLUMNS = (
+    "run_uuid",
+    "run_name",
+    "experiment_id",
+    "user_id",
+    "status",
+    "start_time",
+    "end_time",
+    "lifecycle_stage",
+    "artifact_uri",
+)
+
+
+def _like(value, pattern):
+    return value is not None and SearchUtils.get_comparison_func("LIKE")(value, pattern)
+
+
+def _ilike(value, pattern):
+    return value is not None and SearchUtils.get_comparison_func("ILIKE")(value, pattern)
+
+
+def _get_attribute_column(key):
+    return "runs.run_uuid" if key == "run_id" else f"runs.{key}"
+
+
+def _get_comparison_sql(column, comparator, value):
+    """
+    Returns the SQL condition, and its parameters, that compares a column with a value. ``LIKE``
+    and ``ILIKE`` are evaluated with the same functions as ``SearchUtils.filter`` because the
+    SQLite ``LIKE`` operator is case insensitive.
+    """
+    if comparator in ("IN", "NOT IN"):
+        return f"{column} {comparator} ({', '.join('?' * len(value))})", list(value)
+    elif comparator == "LIKE":
+        return f"mlflow_like({column}, ?)", [value]
+    elif comparator == "ILIKE":
+        return f"mlflow_ilike({column}, ?)", [value]
+    return f"{column} {comparator} ?", [value]
+
+
+def _latest_metric_sort_key(metric):
+    # Must match the ordering used by ``FileStore._get_metric_from_file``
+    return (metric.step, metric.timestamp, metric.value)
+
+
+class FileStoreRunIndex:
+    """
+    Index of the runs of a single experiment directory.
+    """
+
+    INDEX_FILE_NAME = ".run_index.sqlite"
+
+    def __init__(self, experiment_dir):
+        self.experiment_dir = experiment_dir
+        self.path = os.path.join(experiment_dir, FileStoreRunIndex.INDEX_FILE_NAME)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=_SQLITE_TIMEOUT_SECONDS)
+        try:
+            # The schema is only created by the first connection to a new index
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.executescript(_SCHEMA + f"PRAGMA user_version = {_SCHEMA_VERSION};")
+            conn.create_function("mlflow_like", 2, _like, deterministic=True)
+            conn.create_function("mlflow_ilike", 2, _ilike, deterministic=True)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _update(self):
+        """
+        Applies an update to the index. Failures are not propagated to the caller because the run
+        directories remain the source of truth; instead, the index is discarded so that it is
+        rebuilt from the run directories by the next search.
+        """
+        try:
+            with self._connect() as conn:
+                yield conn
+        except sqlite3.Error as e:
+            _logger.warning(
+                "Failed to update the run index '%s', it will be rebuilt on the next search: %s",
+                self.path,
+                e,
+            )
+            self.invalidate()
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _upsert_run_info(conn, run_info, insert):
+        values = [getattr(run_info, column) for column in _RUN_INFO_COLUMNS]
+        if insert:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs ({}) VALUES ({})".format(
+                    ", ".join(_RUN_INFO_COLUMNS), ", ".join("?" * len(_RUN_INFO_COLUMNS))
+                ),
+                values,
+            )
+        else:
+            # Only runs that have been fully indexed are updated, other runs are indexed from their
+            # run directory by the next search
+            conn.execute(
+                "UPDATE runs SET {} WHERE run_uuid = ?".format(
+                    ", ".join(f"{column} = ?" for column in _RUN_INFO_COLUMNS[1:])
+                ),
+                values[1:] + values[:1],
+            )
+
+    @staticmethod
+    def _log_metrics(conn, run_id, metrics):
+        for metric in metrics:
+            row = conn.execute(
+                "SELECT value, is_nan, timestamp, step FROM latest_metrics "
+                "WHERE run_uuid = ? AND key = ?",
+                (run_id, metric.key),
+            ).fetchone()
+            if row is not None:
+                value, is_nan, timestamp, step = row
+                latest = Metric(metric.key, math.nan if is_nan else value, timestamp, step)
+                if not _latest_metric_sort_key(metric) > _latest_metric_sort_key(latest):
+                    continue
+            is_nan = math.isnan(metric.value)
+            conn.execute(
+                "INSERT OR REPLACE INTO latest_metrics "
+                "(run_uuid, key, value, is_nan, timestamp, step) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    metric.key,
+                    None if is_nan else float(metric.value),
+                    int(is_nan),
+                    metric.timestamp,
+                    metric.step,
+                ),
+            )
+
+    @staticmethod
+    def _set_key_values(conn, table, run_id, entities):
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {table} (run_uuid, key, value) VALUES (?, ?, ?)",
+            [(run_id, entity.key, entity.value) for entity in entities],
+        )
+
+    def create_run(self, run_info):
+        with self._update() as conn:
+            self._upsert_run_info(conn, run_info, insert=True)
+
+    def update_run_info(self, run_info):
+        with self._update() as conn:
+            self._upsert_run_info(conn, run_info, insert=False)
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Records metrics, params and tags that have been written to the run directory. ``params``
+        and ``tags`` must contain the values as they have been persisted.
+        """
+        with self._update() as conn:
+            self._log_metrics(conn, run_id, metrics)
+            self._set_key_values(conn, "params", run_id, params)
+            self._set_key_values(conn, "tags", run_id, tags)
+
+    def delete_tag(self, run_id, key):
+        with self._update() as conn:
+            conn.execute("DELETE FROM tags WHERE run_uuid = ? AND key = ?", (run_id, key))
+
+    @staticmethod
+    def _delete_runs(conn, run_ids):
+        for table in ("runs", "latest_metrics", "params", "tags"):
+            conn.executemany(
+                f"DELETE FROM {table} WHERE run_uuid = ?", [(run_id,) for run_id in run_ids]
+            )
+
+    def delete_run(self, run_id):
+        """
+        Removes a run from the index. If the run directory still exists, the run is indexed again
+        from its run directory by the next search.
+        """
+        with self._update() as conn:
+            self._delete_runs(conn, [run_id])
+
+    def _list_run_dirs(self):
+        with os.scandir(self.experiment_dir) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+
+    def reconcile(self, reserved_folders, load_run):
+        """
+        Brings the index in sync with the run directories of the experiment.
+
+        :param reserved_folders: Names of the experiment sub-directories that aren't runs.
+        :param load_run: Function that reads the ``Run`` stored in the given run directory, or
+                         returns ``None`` if the run can't be indexed.
+        """
+        run_dirs = self._list_run_dirs() - set(reserved_folders)
+        with self._connect() as conn:
+            indexed = {row[0] for row in conn.execute("SELECT run_uuid FROM runs")}
+            self._delete_runs(conn, indexed - run_dirs)
+            for run_dir in run_dirs - indexed:
+                run = load_run(os.path.join(self.experiment_dir, run_dir))
+                if run is None:
+                    continue
+                # Replace any partial data recorded for the run before it was indexed
+                self._delete_runs(conn, [run.info.run_id])
+                self._upsert_run_info(conn, run.info, insert=True)
+                self._log_metrics(conn, run.info.run_id, run.data._metric_objs)
+                params = [Param(key, value) for key, value in run.data.params.items()]
+                tags = [RunTag(key, value) for key, value in run.data.tags.items()]
+                self._set_key_values(conn, "params", run.info.run_id, params)
+                self._set_key_values(conn, "tags", run.info.run_id, tags)
+
+    @staticmethod
+    def _get_filter_sql(clause):
+        """
+        Returns the SQL condition, and its parameters, that matches the runs satisfying a parsed
+        filter clause the same way as ``SearchUtils.filter``.
+        """
+        key_type = clause["type"]
+        key = SearchUtils.translate_key_alias(clause["key"])
+        comparator = clause["comparator"].upper()
+        value = clause["value"]
+        if SearchUtils.is_metric(key_type, comparator):
+            # NaN metrics are stored as NULL and are only matched by the ``!=`` comparator
+            if comparator == "!=":
+                condition = "(latest_metrics.is_nan = 1 OR latest_metrics.value != ?)"
+            else:
+                condition = f"latest_metrics.is_nan = 0 AND latest_metrics.value {comparator} ?"
+            return (
+                "EXISTS (SELECT 1 FROM latest_metrics WHERE latest_metrics.run_uuid = "
+                f"runs.run_uuid AND latest_metrics.key = ? AND {condition})",
+                [key, float(value)],
+            )
+        elif SearchUtils.is_param(key_type, comparator) or SearchUtils.is_tag(key_type, comparator):
+            table = "params" if key_type == SearchUtils._PARAM_IDENTIFIER else "tags"
+            condition, params = _get_comparison_sql(f"{table}.value", comparator, value)
+            return (
+                f"EXISTS (SELECT 1 FROM {table} WHERE {table}.run_uuid = runs.run_uuid AND "
+                f"{table}.key = ? AND {condition})",
+                [key] + params,
+            )
+        elif SearchUtils.is_string_attribute(key_type, key, comparator):
+            return _get_comparison_sql(_get_attribute_column(key), comparator, value)
+        elif SearchUtils.is_numeric_attribute(key_type, key, comparator):
+            return _get_comparison_sql(_get_attribute_column(key), comparator, int(value))
+        raise MlflowException(
+            f"Search expression type '{key_type}' is not supported by the run index",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    @staticmethod
+    def _get_order_by_sql(index, order_by):
+        """
+        Returns the join, the selected columns and the ``ORDER BY`` terms that sort runs by a
+        parsed ``order_by`` clause the same way as ``SearchUtils.sort``: runs that don't have a
+        value come last, after runs whose value is NaN, whatever the sort direction.
+        """
+        key_type, key, ascending = order_by
+        key = SearchUtils.translate_key_alias(key)
+        direction = "ASC" if ascending else "DESC"
+        if key_type == SearchUtils._ATTRIBUTE_IDENTIFIER:
+            column = _get_attribute_column(key)
+            return (
+                None,
+                [],
+                [f"CASE WHEN {column} IS NULL THEN 1 ELSE 0 END", f"{column} {direction}"],
+            )
+
+        table = {
+            SearchUtils._METRIC_IDENTIFIER: "latest_metrics",
+            SearchUtils._PARAM_IDENTIFIER: "params",
+            SearchUtils._TAG_IDENTIFIER: "tags",
+        }.get(key_type)
+        if table is None:
+            raise MlflowException(
+                "Invalid order_by entity type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
+            )
+        alias = f"order_by_{index}"
+        is_nan = f"{alias}.is_nan" if table == "latest_metrics" else "0"
+        return (
+            f"LEFT JOIN {table} {alias} ON {alias}.run_uuid = runs.run_uuid AND {alias}.key = ?",
+            [f"{alias}.key", f"{alias}.value", is_nan],
+            [
+                f"CASE WHEN {alias}.key IS NULL THEN 2 WHEN {is_nan} = 1 THEN 1 ELSE 0 END",
+                f"{alias}.value {direction}",
+            ],
+        )
+
+    def search_runs(self, view_type, filter_string, order_by, max_results, offset=0):
+        """
+        Returns a page of the runs of the experiment that match the given view type and filter
+        string, sorted by the given ``order_by`` clauses like ``SearchUtils.sort``. The runs
+        contain the run info and, as recorded in the index, the metrics, params and tags that are
+        referenced by ``order_by``, which is the data required to merge the runs of several
+        experiments with ``SearchUtils.sort``.
+        """
+        stages = LifecycleStage.view_type_to_stages(view_type)
+        conditions = ["runs.lifecycle_stage IN ({})".format(", ".join("?" * len(stages)))]
+        condition_params = list(stages)
+        for clause in SearchUtils.parse_search_filter(filter_string):
+            condition, params = self._get_filter_sql(clause)
+            conditions.append(condition)
+            condition_params.extend(params)
+
+        parsed_order_by = [
+            SearchUtils.parse_order_by_for_search_runs(clause) for clause in order_by or []
+        ]
+        joins = []
+        join_params = []
+        order_by_columns = []
+        order_by_terms = []
+        for index, clause in enumerate(parsed_order_by):
+            join, columns, terms = self._get_order_by_sql(index, clause)
+            if join:
+                joins.append(join)
+                join_params.append(SearchUtils.translate_key_alias(clause[1]))
+            order_by_columns.append(columns)
+            order_by_terms.extend(terms)
+        order_by_terms.extend(["runs.start_time DESC", "runs.run_uuid ASC"])
+
+        query = "SELECT {} FROM runs {} WHERE {} ORDER BY {} LIMIT ? OFFSET ?".format(
+            ", ".join(
+                [f"runs.{column}" for column in _RUN_INFO_COLUMNS]
+                + [column for columns in order_by_columns for column in columns]
+            ),
+            " ".join(joins),
+            " AND ".join(conditions),
+            ", ".join(order_by_terms),
+        )
+        with self._connect() as conn:
+            rows = conn.execute(
+                query, join_params + condition_params + [max_results, offset]
+            ).fetchall()
+
+        runs = []
+        for row in rows:
+            run_info = RunInfo(**dict(zip(_RUN_INFO_COLUMNS, row)))
+            metrics, params, tags = [], [], []
+            values = row[len(_RUN_INFO_COLUMNS) :]
+            for (key_type, _, _), columns in zip(parsed_order_by, order_by_columns):
+                if not columns:
+                    continue
+                (key, value, is_nan), values = values[:3], values[3:]
+                if key is None:
+                    continue
+                if key_type == SearchUtils._METRIC_IDENTIFIER:
+                    metrics.append(Metric(key, math.nan if is_nan else value, 0, 0))
+                elif key_type == SearchUtils._PARAM_IDENTIFIER:
+                    params.append(Param(key, value))
+                else:
+                    tags.append(RunTag(key, value))
+            runs.append(Run(run_info, RunData(metrics, params, tags)))
+        return runs
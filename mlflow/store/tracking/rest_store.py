@@ -8,6 +8,7 @@ from mlflow.protos.service_pb2 import (
     MlflowService,
     GetExperiment,
     GetRun,
+    GetRuns,
     SearchRuns,
     SearchExperiments,
     GetMetricHistory,
@@ -22,6 +23,7 @@ from mlflow.protos.service_pb2 import (
     RestoreExperiment,
     UpdateExperiment,
     LogBatch,
+    LogBatches,
     LogModel,
     DeleteTag,
     SetExperimentTag,
@@ -40,6 +42,10 @@ from mlflow.utils.rest_utils import (
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
 
 
+def _is_endpoint_not_found(exception):
+    return exception.error_code == databricks_pb2.ErrorCode.Name(databricks_pb2.ENDPOINT_NOT_FOUND)
+
+
 class RestStore(AbstractStore):
     """
     Client for a remote tracking server accessed via REST API calls
@@ -137,6 +143,17 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
+    def get_runs(self, run_ids):
+        req_body = message_to_json(GetRuns(run_ids=run_ids))
+        try:
+            response_proto = self._call_endpoint(GetRuns, req_body)
+        except MlflowException as e:
+            if not _is_endpoint_not_found(e):
+                raise
+            # Fall back on getting the runs one by one from servers without the endpoint
+            return super().get_runs(run_ids)
+        return [Run.from_proto(proto_run) for proto_run in response_proto.runs]
+
     def update_run_info(self, run_id, run_status, end_time, run_name):
         """Updates the metadata of the specified run."""
         req_body = message_to_json(
@@ -323,6 +340,25 @@ class RestStore(AbstractStore):
         )
         self._call_endpoint(LogBatch, req_body)
 
+    def log_batches(self, batches):
+        batch_protos = [
+            LogBatch(
+                run_id=run_id,
+                metrics=[metric.to_proto() for metric in metrics],
+                params=[param.to_proto() for param in params],
+                tags=[tag.to_proto() for tag in tags],
+            )
+            for run_id, metrics, params, tags in batches
+        ]
+        req_body = message_to_json(LogBatches(batches=batch_protos))
+        try:
+            self._call_endpoint(LogBatches, req_body)
+        except MlflowException as e:
+            if not _is_endpoint_not_found(e):
+                raise
+            # Fall back on logging the batches one by one to servers without the endpoint
+            super().log_batches(batches)
+
     def record_logged_model(self, run_id, mlflow_model):
         req_body = message_to_json(LogModel(run_id=run_id, model_json=mlflow_model.to_json()))
         self._call_endpoint(LogModel, req_body)
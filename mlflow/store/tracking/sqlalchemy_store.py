@@ -1,9 +1,8 @@
 import json
 import logging
-import random
-import time
 import uuid
 import threading
+from collections import defaultdict
 from functools import reduce
 from typing import List, Optional
 
@@ -11,12 +10,15 @@ import math
 import sqlalchemy
 import sqlalchemy.sql.expression as sql
 from sqlalchemy import and_, sql, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.future import select
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import Label, UnaryExpression
 
 from mlflow.entities import RunTag, Metric, DatasetInput, _DatasetSummary
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT, SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.db.db_types import MYSQL, MSSQL
+from mlflow.store.db.db_types import MYSQL, MSSQL, POSTGRES, SQLITE
 import mlflow.store.db.utils
 from mlflow.store.tracking.dbmodels.models import (
     SqlExperiment,
@@ -32,6 +34,7 @@ from mlflow.store.tracking.dbmodels.models import (
 )
 from mlflow.entities import RunStatus, SourceType, Experiment, Run, RunInputs
 from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.metric_sampling import get_num_buckets
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
@@ -50,6 +53,9 @@ from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import append_to_uri_path
 from mlflow.utils.validation import (
     _validate_batch_log_limits,
+    _validate_batches_log_limits,
+    _validate_batches_param_keys_unique,
+    _validate_get_runs_limit,
     _validate_batch_log_data,
     _validate_dataset_inputs,
     _validate_run_id,
@@ -512,6 +518,27 @@ class SqlAlchemyStore(AbstractStore):
 
         return runs[0]
 
+    def _get_runs_by_id(self, session, run_uuids, eager=False):
+        """
+        Fetch multiple runs with a single query.
+
+        :param eager: If ``True``, eagerly loads the runs' summary metrics, params, and tags, like
+                      :py:meth:`_get_run` does.
+        :return: A dictionary mapping the specified run IDs to their ``SqlRun`` objects.
+        """
+        query_options = self._get_eager_run_query_options() if eager else []
+        runs = (
+            session.query(SqlRun)
+            .options(*query_options)
+            .filter(SqlRun.run_uuid.in_(set(run_uuids)))
+            .all()
+        )
+        runs_by_id = {run.run_uuid: run for run in runs}
+        for run_uuid in run_uuids:
+            if run_uuid not in runs_by_id:
+                raise MlflowException(f"Run with id={run_uuid} not found", RESOURCE_DOES_NOT_EXIST)
+        return runs_by_id
+
     def _get_run_inputs(self, session, run_uuids):
         datasets = (
             session.query(
@@ -625,6 +652,27 @@ class SqlAlchemyStore(AbstractStore):
             inputs = self._get_run_inputs(run_uuids=[run_id], session=session)[0]
             return Run(mlflow_run.info, mlflow_run.data, RunInputs(dataset_inputs=inputs))
 
+    def get_runs(self, run_ids):
+        _validate_get_runs_limit(run_ids)
+        with self.ManagedSessionMaker() as session:
+            # Load all the runs with their summary metrics, params, tags and inputs with a fixed
+            # number of queries, rather than with the queries of ``get_run`` for each of them
+            runs_by_id = self._get_runs_by_id(session, run_ids, eager=True)
+            unique_run_ids = list(runs_by_id)
+            inputs = self._get_run_inputs(run_uuids=unique_run_ids, session=session)
+            inputs_by_run_id = dict(zip(unique_run_ids, inputs))
+            runs = []
+            for run_id in run_ids:
+                mlflow_run = runs_by_id[run_id].to_mlflow_entity()
+                run_inputs = RunInputs(dataset_inputs=inputs_by_run_id[run_id])
+                runs.append(Run(mlflow_run.info, mlflow_run.data, run_inputs))
+            return runs
+
+    def _get_run_infos(self, run_ids):
+        with self.ManagedSessionMaker() as session:
+            runs_by_id = self._get_runs_by_id(session, run_ids)
+            return {run_id: run.to_run_info() for run_id, run in runs_by_id.items()}
+
     def restore_run(self, run_id):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
@@ -687,70 +735,130 @@ class SqlAlchemyStore(AbstractStore):
         if not metrics:
             return
 
+        with self.ManagedSessionMaker() as session:
+            run = self._get_run(run_uuid=run_id, session=session)
+            self._check_run_is_active(run)
+            self._log_metrics_impl(session, {run_id: metrics})
+
+    def _log_metrics_impl(self, session, metrics_by_run_id):
+        """
+        :param metrics_by_run_id: A dictionary mapping run IDs to the metrics to log for them.
+        """
         # Duplicate metric values are eliminated here to maintain
         # the same behavior in log_metric
-        metric_instances = []
+        metric_rows = []
         seen = set()
-        for metric in metrics:
-            metric, value, is_nan = self._get_metric_value_details(metric)
-            if metric not in seen:
-                metric_instances.append(
-                    SqlMetric(
-                        run_uuid=run_id,
-                        key=metric.key,
-                        value=value,
-                        timestamp=metric.timestamp,
-                        step=metric.step,
-                        is_nan=is_nan,
+        for run_id, metrics in metrics_by_run_id.items():
+            for metric in metrics:
+                metric, value, is_nan = self._get_metric_value_details(metric)
+                row = {
+                    "run_uuid": run_id,
+                    "key": metric.key,
+                    "value": value,
+                    "timestamp": metric.timestamp,
+                    "step": metric.step,
+                    "is_nan": is_nan,
+                }
+                primary_key = (run_id, metric.key, value, metric.timestamp, metric.step, is_nan)
+                if primary_key not in seen:
+                    metric_rows.append(row)
+                seen.add(primary_key)
+        if not metric_rows:
+            return
+
+        # Metric values that were already logged within the run with the same value, timestamp and
+        # step are skipped rather than violating the primary key
+        self._insert_ignoring_conflicts(session, SqlMetric, metric_rows)
+        self._update_latest_metrics_if_necessary([SqlMetric(**row) for row in metric_rows], session)
+
+    def _get_dialect_insert(self):
+        """
+        :return: The ``insert`` construct of the database dialect supporting conflict clauses, or
+                 ``None`` if the dialect has none, i.e. for MSSQL.
+        """
+        return {
+            SQLITE: sqlite.insert,
+            POSTGRES: postgresql.insert,
+            MYSQL: mysql.insert,
+        }.get(self.db_type)
+
+    def _get_logged_primary_keys(self, session, model, rows):
+        """
+        :return: The primary keys of the specified rows of the ``run_uuid`` and ``key`` columns that
+                 are already present in the table of the specified model.
+        """
+        primary_key_columns = list(model.__table__.primary_key.columns)
+        run_uuids = list({row["run_uuid"] for row in rows})
+        keys = list({row["key"] for row in rows})
+        logged_primary_keys = set()
+        # Divide keys into batches of 500 to avoid binding too many parameters to the SQL query
+        for i in range(0, len(keys), 500):
+            logged_primary_keys.update(
+                tuple(record)
+                for record in session.execute(
+                    select(*primary_key_columns).where(
+                        model.run_uuid.in_(run_uuids), model.key.in_(keys[i : i + 500])
                     )
                 )
-            seen.add(metric)
+            )
+        return logged_primary_keys
 
-        with self.ManagedSessionMaker() as session:
-            run = self._get_run(run_uuid=run_id, session=session)
-            self._check_run_is_active(run)
+    def _insert_ignoring_conflicts(self, session, model, rows):
+        """
+        Insert the specified rows into the table of the specified model with a single statement,
+        skipping the rows whose primary key is already present in the table.
+        """
+        if not rows:
+            return
 
-            def _insert_metrics(metric_instances):
-                session.add_all(metric_instances)
-                self._update_latest_metrics_if_necessary(metric_instances, session)
-                session.commit()
+        table = model.__table__
+        dialect_insert = self._get_dialect_insert()
+        if self.db_type == MYSQL:
+            # Unlike `INSERT IGNORE`, a no-op `ON DUPLICATE KEY UPDATE` only skips the duplicate
+            # rows, instead of also turning other errors, e.g. of truncated values, into warnings
+            statement = dialect_insert(table).on_duplicate_key_update(key=table.c.key)
+        elif dialect_insert is not None:
+            statement = dialect_insert(table).on_conflict_do_nothing()
+        else:
+            primary_key_columns = [column.name for column in table.primary_key.columns]
+            logged_primary_keys = self._get_logged_primary_keys(session, model, rows)
+            rows = [
+                row
+                for row in rows
+                if tuple(row[name] for name in primary_key_columns) not in logged_primary_keys
+            ]
+            if not rows:
+                return
+            statement = sqlalchemy.insert(table)
+        session.execute(statement, rows)
 
-            try:
-                _insert_metrics(metric_instances)
-            except sqlalchemy.exc.IntegrityError:
-                # Primary key can be violated if it is tried to log a metric with same value,
-                # timestamp, step, and key within the same run.
-                # Roll back the current session to make it usable for further transactions. In
-                # the event of an error during "commit", a rollback is required in order to
-                # continue using the session. In this case, we re-use the session to query
-                # SqlMetric
-                session.rollback()
-                # Divide metric keys into batches of 100 to avoid loading too much metric
-                # history data into memory at once
-                metric_keys = [m.key for m in metric_instances]
-                metric_key_batches = [
-                    metric_keys[i : i + 100] for i in range(0, len(metric_keys), 100)
-                ]
-                for metric_key_batch in metric_key_batches:
-                    # obtain the metric history corresponding to the given metrics
-                    metric_history = (
-                        session.query(SqlMetric)
-                        .filter(
-                            SqlMetric.run_uuid == run_id,
-                            SqlMetric.key.in_(metric_key_batch),
-                        )
-                        .all()
-                    )
-                    # convert to a set of Metric instance to take advantage of its hashable
-                    # and then obtain the metrics that were not logged earlier within this
-                    # run_id
-                    metric_history = {m.to_mlflow_entity() for m in metric_history}
-                    non_existing_metrics = [
-                        m for m in metric_instances if m.to_mlflow_entity() not in metric_history
-                    ]
-                    # if there exist metrics that were tried to be logged & rolled back even
-                    # though they were not violating the PK, log them
-                    _insert_metrics(non_existing_metrics)
+    def _upsert(self, session, model, rows, update_columns):
+        """
+        Insert the specified rows into the table of the specified model with a single statement,
+        updating the specified columns of the rows whose primary key is already present in the
+        table. The primary keys of the rows must be unique.
+        """
+        if not rows:
+            return
+
+        table = model.__table__
+        dialect_insert = self._get_dialect_insert()
+        if self.db_type == MYSQL:
+            statement = dialect_insert(table)
+            statement = statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in update_columns}
+            )
+        elif dialect_insert is not None:
+            statement = dialect_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=list(table.primary_key.columns),
+                set_={column: statement.excluded[column] for column in update_columns},
+            )
+        else:
+            for row in rows:
+                session.merge(model(**row))
+            return
+        session.execute(statement, rows)
 
     def _update_latest_metrics_if_necessary(self, logged_metrics, session):
         def _compare_metrics(metric_a, metric_b):
@@ -764,108 +872,101 @@ class SqlAlchemyStore(AbstractStore):
                 metric_b.value,
             )
 
-        def _overwrite_metric(new_metric, old_metric):
-            """
-            writes content of new_metric over old_metric. The content are
-            `value`, `step`, `timestamp`, and `is_nan`.
-
-            :return: old_metric with its content updated.
-            """
-            old_metric.value = new_metric.value
-            old_metric.step = new_metric.step
-            old_metric.timestamp = new_metric.timestamp
-            old_metric.is_nan = new_metric.is_nan
-            return old_metric
-
         if not logged_metrics:
             return
 
-        # Fetch the latest metric value corresponding to the specified run_id and metric keys and
-        # lock their associated rows for the remainder of the transaction in order to ensure
-        # isolation
-        latest_metrics = {}
-        metric_keys = [m.key for m in logged_metrics]
-        # Divide metric keys into batches of 500 to avoid binding too many parameters to the SQL
-        # query, which may produce limit exceeded errors or poor performance on certain database
-        # platforms
-        metric_key_batches = [metric_keys[i : i + 500] for i in range(0, len(metric_keys), 500)]
-        for metric_key_batch in metric_key_batches:
-            # First, determine which metric keys are present in the database
-            latest_metrics_key_records_from_db = (
-                session.query(SqlLatestMetric.key)
-                .filter(
-                    SqlLatestMetric.run_uuid == logged_metrics[0].run_uuid,
-                    SqlLatestMetric.key.in_(metric_key_batch),
+        # A metric key can be passed more than once within logged metrics with different
+        # step/timestamp/value, only the most recent one can be the latest value of the metric
+        most_recent_metrics = {}
+        for logged_metric in logged_metrics:
+            metric_id = (logged_metric.run_uuid, logged_metric.key)
+            most_recent_metric = most_recent_metrics.get(metric_id)
+            if most_recent_metric is None or _compare_metrics(logged_metric, most_recent_metric):
+                most_recent_metrics[metric_id] = logged_metric
+        latest_metric_rows = [
+            {
+                "run_uuid": metric.run_uuid,
+                "key": metric.key,
+                "value": metric.value,
+                "timestamp": metric.timestamp,
+                "step": metric.step,
+                "is_nan": metric.is_nan,
+            }
+            for metric in most_recent_metrics.values()
+        ]
+
+        # Insert the latest values of the new metric keys and overwrite the latest values that are
+        # less recent than the logged ones in a single statement, which atomically compares them
+        # to the latest values in the database without locking their rows for the remainder of the
+        # transaction
+        table = SqlLatestMetric.__table__
+        dialect_insert = self._get_dialect_insert()
+        if self.db_type == MYSQL:
+            statement = dialect_insert(table)
+            is_more_recent = sqlalchemy.tuple_(
+                statement.inserted.step, statement.inserted.timestamp, statement.inserted.value
+            ) > sqlalchemy.tuple_(table.c.step, table.c.timestamp, table.c.value)
+            # MySQL assigns the columns from left to right, and the comparison of each assignment
+            # sees the values assigned before it. In the order `is_nan`, `value`, `timestamp`,
+            # `step`, an assigned column only changes the result of the following comparisons when
+            # the remaining columns already have the logged values
+            statement = statement.on_duplicate_key_update(
+                [
+                    (
+                        column,
+                        sqlalchemy.func.IF(
+                            is_more_recent, statement.inserted[column], table.c[column]
+                        ),
+                    )
+                    for column in ["is_nan", "value", "timestamp", "step"]
+                ]
+            )
+        elif dialect_insert is not None:
+            statement = dialect_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.run_uuid, table.c.key],
+                set_={
+                    column: statement.excluded[column]
+                    for column in ["value", "timestamp", "step", "is_nan"]
+                },
+                where=sqlalchemy.tuple_(
+                    statement.excluded.step, statement.excluded.timestamp, statement.excluded.value
                 )
-                .all()
+                > sqlalchemy.tuple_(table.c.step, table.c.timestamp, table.c.value),
             )
-            # Then, take a write lock on the rows corresponding to metric keys that are present,
-            # ensuring that they aren't modified by another transaction until they can be
-            # compared to the metric values logged by this transaction while avoiding gap locking
-            # and next-key locking which may otherwise occur when issuing a `SELECT FOR UPDATE`
-            # against nonexistent rows
-            if len(latest_metrics_key_records_from_db) > 0:
-                latest_metric_keys_from_db = [
-                    record[0] for record in latest_metrics_key_records_from_db
-                ]
-                latest_metrics_batch = (
-                    session.query(SqlLatestMetric)
-                    .filter(
-                        SqlLatestMetric.run_uuid == logged_metrics[0].run_uuid,
-                        SqlLatestMetric.key.in_(latest_metric_keys_from_db),
-                    )
-                    # Order by the metric run ID and key to ensure a consistent locking order
-                    # across transactions, reducing deadlock likelihood
-                    .order_by(SqlLatestMetric.run_uuid, SqlLatestMetric.key)
-                    .with_for_update()
-                    .all()
+        else:
+            # MSSQL has neither `ON CONFLICT` clauses nor row value comparisons, so the new metric
+            # keys are inserted first and the latest values are then updated with a conditional
+            # `UPDATE` statement
+            self._insert_ignoring_conflicts(session, SqlLatestMetric, latest_metric_rows)
+            new = {
+                column: sqlalchemy.bindparam(f"new_{column}")
+                for column in ["run_uuid", "key", "value", "timestamp", "step", "is_nan"]
+            }
+            statement = (
+                sqlalchemy.update(table)
+                .where(
+                    table.c.run_uuid == new["run_uuid"],
+                    table.c.key == new["key"],
+                    sqlalchemy.or_(
+                        new["step"] > table.c.step,
+                        and_(new["step"] == table.c.step, new["timestamp"] > table.c.timestamp),
+                        and_(
+                            new["step"] == table.c.step,
+                            new["timestamp"] == table.c.timestamp,
+                            new["value"] > table.c.value,
+                        ),
+                    ),
                 )
-                latest_metrics.update({m.key: m for m in latest_metrics_batch})
-
-        # iterate over all logged metrics and compare them with corresponding
-        # SqlLatestMetric entries
-        # if there's no SqlLatestMetric entry for the current metric key,
-        # create a new SqlLatestMetric instance and put it in
-        # new_latest_metric_dict so that they can be saved later.
-        new_latest_metric_dict = {}
-        for logged_metric in logged_metrics:
-            latest_metric = latest_metrics.get(logged_metric.key)
-            # a metric key can be passed more then once within logged metrics
-            # with different step/timestamp/value. However SqlLatestMetric
-            # entries are inserted after this loop is completed.
-            # so, retrieve the instances they were just created and use them
-            # for comparison.
-            new_latest_metric = new_latest_metric_dict.get(logged_metric.key)
-
-            # just create a new SqlLatestMetric instance since both
-            # latest_metric row or recently created instance does not exist
-            if not latest_metric and not new_latest_metric:
-                new_latest_metric = SqlLatestMetric(
-                    run_uuid=logged_metric.run_uuid,
-                    key=logged_metric.key,
-                    value=logged_metric.value,
-                    timestamp=logged_metric.timestamp,
-                    step=logged_metric.step,
-                    is_nan=logged_metric.is_nan,
+                .values(
+                    {column: new[column] for column in ["value", "timestamp", "step", "is_nan"]}
                 )
-                new_latest_metric_dict[logged_metric.key] = new_latest_metric
-
-            # there's no row but a new instance is recently created.
-            # so, update the recent instance in new_latest_metric_dict if
-            # metric comparison is successful.
-            elif not latest_metric and new_latest_metric:
-                if _compare_metrics(logged_metric, new_latest_metric):
-                    new_latest_metric = _overwrite_metric(logged_metric, new_latest_metric)
-                    new_latest_metric_dict[logged_metric.key] = new_latest_metric
-
-            # compare with the row
-            elif _compare_metrics(logged_metric, latest_metric):
-                # editing the attributes of latest_metric, which is a
-                # SqlLatestMetric instance will result in UPDATE in DB side.
-                latest_metric = _overwrite_metric(logged_metric, latest_metric)
-
-        if new_latest_metric_dict:
-            session.add_all(new_latest_metric_dict.values())
+            )
+            latest_metric_rows = [
+                {f"new_{column}": value for column, value in row.items()}
+                for row in latest_metric_rows
+            ]
+        session.execute(statement, latest_metric_rows)
 
     def get_metric_history(self, run_id, metric_key, max_results=None, page_token=None):
         """
@@ -960,6 +1061,88 @@ class SqlAlchemyStore(AbstractStore):
                 for metric in metrics
             ]
 
+    def get_sampled_metric_history_bulk(self, run_ids, metric_keys, max_points, x_axis="step"):
+        """
+        Return the histories of the given metrics for the given runs, each downsampled to at most
+        ``max_points`` points, using a single query. The sampling is performed by the database
+        using window functions and follows the rules of
+        :py:func:`mlflow.store.tracking.metric_sampling.sample_metric_history`.
+
+        See :py:func:`AbstractStore.get_sampled_metric_history_bulk` for parameter and return
+        value descriptions.
+        """
+        x = getattr(SqlMetric, x_axis)
+        other_axis = getattr(SqlMetric, "timestamp" if x_axis == "step" else "step")
+        series_partition = (SqlMetric.run_uuid, SqlMetric.key)
+        series = (
+            select(
+                SqlMetric.run_uuid,
+                SqlMetric.key,
+                SqlMetric.value,
+                SqlMetric.timestamp,
+                SqlMetric.step,
+                SqlMetric.is_nan,
+                x.label("x"),
+                other_axis.label("other_axis"),
+                sqlalchemy.func.count().over(partition_by=series_partition).label("num_points"),
+                sqlalchemy.func.min(x).over(partition_by=series_partition).label("x_min"),
+                sqlalchemy.func.max(x).over(partition_by=series_partition).label("x_max"),
+            )
+            .where(SqlMetric.run_uuid.in_(run_ids), SqlMetric.key.in_(metric_keys))
+            .subquery()
+        )
+        # The x values are split into `num_buckets` buckets of equal width. The operands are
+        # non-negative integers, so the integer division computes the floor of the quotient.
+        bucket = ((series.c.x - series.c.x_min) * get_num_buckets(max_points)) // (
+            series.c.x_max - series.c.x_min + 1
+        )
+        bucket_partition = (series.c.run_uuid, series.c.key, bucket)
+        ranked = select(
+            series,
+            sqlalchemy.func.row_number()
+            .over(
+                partition_by=bucket_partition,
+                order_by=(series.c.is_nan, series.c.value, series.c.x, series.c.other_axis),
+            )
+            .label("min_rank"),
+            sqlalchemy.func.row_number()
+            .over(
+                partition_by=bucket_partition,
+                order_by=(series.c.is_nan, series.c.value.desc(), series.c.x, series.c.other_axis),
+            )
+            .label("max_rank"),
+        ).subquery()
+        stmt = (
+            select(ranked)
+            .where(
+                sqlalchemy.or_(
+                    ranked.c.num_points <= max_points,
+                    ranked.c.min_rank == 1,
+                    ranked.c.max_rank == 1,
+                )
+            )
+            .order_by(
+                ranked.c.run_uuid,
+                ranked.c.key,
+                ranked.c.x,
+                ranked.c.other_axis,
+                ranked.c.value,
+            )
+        )
+        histories = {}
+        with self.ManagedSessionMaker() as session:
+            # Raise for unknown runs, like `get_metric_history` does
+            self._get_runs_by_id(session, run_ids)
+            for row in session.execute(stmt):
+                metric = Metric(
+                    key=row.key,
+                    value=float("nan") if row.is_nan else row.value,
+                    timestamp=row.timestamp,
+                    step=row.step,
+                )
+                histories.setdefault(row.run_uuid, {}).setdefault(row.key, []).append(metric)
+        return histories
+
     def _search_datasets(self, experiment_ids):
         """
         Return all dataset summaries associated to the given experiments.
@@ -1052,29 +1235,44 @@ class SqlAlchemyStore(AbstractStore):
                 else:
                     raise
 
-    def _log_params(self, run_id, params):
-        if not params:
+    def _log_params_impl(self, session, params_by_run_id):
+        """
+        :param params_by_run_id: A dictionary mapping run IDs to the params to log for them.
+        """
+        param_rows = [
+            {"run_uuid": run_id, "key": param.key, "value": param.value}
+            for run_id, params in params_by_run_id.items()
+            for param in params
+        ]
+        if not param_rows:
             return
 
-        with self.ManagedSessionMaker() as session:
-            run = self._get_run(run_uuid=run_id, session=session)
-            self._check_run_is_active(run)
-            existing_params = {p.key: p.value for p in run.params}
-            new_params = []
-            non_matching_params = []
-            for param in params:
-                if param.key in existing_params:
-                    if param.value != existing_params[param.key]:
-                        non_matching_params.append(
-                            {
-                                "key": param.key,
-                                "old_value": existing_params[param.key],
-                                "new_value": param.value,
-                            }
-                        )
-                    continue
-                new_params.append(SqlParam(run_uuid=run_id, key=param.key, value=param.value))
-
+        self._insert_ignoring_conflicts(session, SqlParam, param_rows)
+        # Params that were already logged are skipped by the insertion, so their values must be
+        # compared with the new ones
+        run_ids = [run_id for run_id, params in params_by_run_id.items() if params]
+        keys = list({row["key"] for row in param_rows})
+        logged_params = {}
+        # Divide keys into batches of 500 to avoid binding too many parameters to the SQL query
+        for i in range(0, len(keys), 500):
+            logged_params.update(
+                ((run_uuid, key), value)
+                for run_uuid, key, value in session.execute(
+                    select(SqlParam.run_uuid, SqlParam.key, SqlParam.value).where(
+                        SqlParam.run_uuid.in_(run_ids), SqlParam.key.in_(keys[i : i + 500])
+                    )
+                )
+            )
+        for run_id, params in params_by_run_id.items():
+            non_matching_params = [
+                {
+                    "key": param.key,
+                    "old_value": logged_params[(run_id, param.key)],
+                    "new_value": param.value,
+                }
+                for param in params
+                if param.value != logged_params[(run_id, param.key)]
+            ]
             if non_matching_params:
                 raise MlflowException(
                     "Changing param values is not allowed. Params were already"
@@ -1082,11 +1280,6 @@ class SqlAlchemyStore(AbstractStore):
                     INVALID_PARAMETER_VALUE,
                 )
 
-            if not new_params:
-                return
-
-            session.add_all(new_params)
-
     def set_experiment_tag(self, experiment_id, tag):
         """
         Set a tag for the specified experiment
@@ -1122,80 +1315,22 @@ class SqlAlchemyStore(AbstractStore):
                 # NB: Updating the run_info will set the tag. No need to do it twice.
                 session.merge(SqlTag(run_uuid=run_id, key=tag.key, value=tag.value))
 
-    def _set_tags(self, run_id, tags):
+    def _set_tags_impl(self, session, runs_by_id, tags_by_run_id):
         """
-        Set multiple tags on a run
-
-        :param run_id: String ID of the run
-        :param tags: List of RunTag instances to log
+        :param runs_by_id: A dictionary mapping run IDs to their ``SqlRun`` objects.
+        :param tags_by_run_id: A dictionary mapping run IDs to the tags to set for them.
         """
-        if not tags:
-            return
-
-        for tag in tags:
-            _validate_tag(tag.key, tag.value)
-
-        with self.ManagedSessionMaker() as session:
-            run = self._get_run(run_uuid=run_id, session=session)
-            self._check_run_is_active(run)
-
-            def _try_insert_tags(attempt_number, max_retries):
-                try:
-                    current_tags = (
-                        session.query(SqlTag)
-                        .filter(SqlTag.run_uuid == run_id, SqlTag.key.in_([t.key for t in tags]))
-                        .all()
-                    )
-                    current_tags = {t.key: t for t in current_tags}
-
-                    new_tag_dict = {}
-                    for tag in tags:
-                        # NB: If the run name tag is explicitly set, update the run info attribute
-                        # and do not resubmit the tag for overwrite as the tag will be set within
-                        # `set_tag()` with a call to `update_run_info()`
-                        if tag.key == MLFLOW_RUN_NAME:
-                            self.set_tag(run_id, tag)
-                        else:
-                            current_tag = current_tags.get(tag.key)
-                            new_tag = new_tag_dict.get(tag.key)
-
-                            # update the SqlTag if it is already present in DB
-                            if current_tag:
-                                current_tag.value = tag.value
-                                continue
-
-                            # if a SqlTag instance is already present in `new_tag_dict`,
-                            # this means that multiple tags with the same key were passed to
-                            # `set_tags`.
-                            # In this case, we resolve potential conflicts by updating the value
-                            # of the existing instance to the value of `tag`
-                            if new_tag:
-                                new_tag.value = tag.value
-                            # otherwise, put it into the dict
-                            else:
-                                new_tag = SqlTag(run_uuid=run_id, key=tag.key, value=tag.value)
-
-                            new_tag_dict[tag.key] = new_tag
-
-                    # finally, save new entries to DB.
-                    session.add_all(new_tag_dict.values())
-                    session.commit()
-                except sqlalchemy.exc.IntegrityError:
-                    session.rollback()
-                    # two concurrent operations may try to attempt to insert tags.
-                    # apply retry here.
-                    if attempt_number > max_retries:
-                        raise MlflowException(
-                            "Failed to set tags with given within {} retries. Keys: {}".format(
-                                max_retries, [t.key for t in tags]
-                            )
-                        )
-                    sleep_duration = (2**attempt_number) - 1
-                    sleep_duration += random.uniform(0, 1)
-                    time.sleep(sleep_duration)
-                    _try_insert_tags(attempt_number + 1, max_retries=max_retries)
-
-            _try_insert_tags(attempt_number=0, max_retries=3)
+        tag_rows = []
+        for run_id, tags in tags_by_run_id.items():
+            # If multiple tags with the same key are set, the last one takes precedence
+            tag_values = {tag.key: tag.value for tag in tags}
+            if MLFLOW_RUN_NAME in tag_values:
+                # NB: The run name tag is kept in sync with the name of the run
+                runs_by_id[run_id].name = tag_values[MLFLOW_RUN_NAME]
+            tag_rows.extend(
+                {"run_uuid": run_id, "key": k, "value": v} for k, v in tag_values.items()
+            )
+        self._upsert(session, SqlTag, tag_rows, update_columns=["value"])
 
     def delete_tag(self, run_id, key):
         """
@@ -1225,11 +1360,13 @@ class SqlAlchemyStore(AbstractStore):
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
-        def compute_next_token(current_size):
+        def compute_next_token(current_size, last_keyset):
             next_token = None
             if max_results == current_size:
                 final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
+                next_token = SearchUtils.create_keyset_page_token(
+                    final_offset, last_keyset, order_by
+                )
 
             return next_token
 
@@ -1271,6 +1408,8 @@ class SqlAlchemyStore(AbstractStore):
                 stmt = stmt.outerjoin(j)
 
             offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+            keyset = SearchUtils.parse_keyset_from_page_token(page_token, order_by)
+            keyset_columns = _get_keyset_columns(cases_orderby, parsed_orderby)
             stmt = (
                 stmt.distinct()
                 .options(*self._get_eager_run_query_options())
@@ -1280,10 +1419,21 @@ class SqlAlchemyStore(AbstractStore):
                     *attribute_filters,
                 )
                 .order_by(*parsed_orderby)
-                .offset(offset)
-                .limit(max_results)
             )
-            queried_runs = session.execute(stmt).scalars(SqlRun).all()
+            # Resume from the sort key of the last run on the previous page when the page token
+            # carries one, so that deep pages don't require the database to scan and sort all of
+            # the skipped rows. Offset-only tokens fall back to ``OFFSET`` pagination.
+            if keyset is not None:
+                if len(keyset) != len(keyset_columns):
+                    raise MlflowException(
+                        "Invalid page token, keyset value=%s" % keyset,
+                        error_code=INVALID_PARAMETER_VALUE,
+                    )
+                stmt = stmt.filter(_get_keyset_filter_clause(keyset_columns, keyset))
+            else:
+                stmt = stmt.offset(offset)
+            rows = session.execute(stmt.limit(max_results)).all()
+            queried_runs = [row[0] for row in rows]
 
             runs = [run.to_mlflow_entity() for run in queried_runs]
             run_ids = [run.info.run_id for run in runs]
@@ -1296,7 +1446,8 @@ class SqlAlchemyStore(AbstractStore):
                     Run(run.info, run.data, RunInputs(dataset_inputs=inputs[i]))
                 )
 
-            next_page_token = compute_next_token(len(runs_with_inputs))
+            last_keyset = _get_keyset_values(keyset_columns, rows[-1]) if rows else None
+            next_page_token = compute_next_token(len(runs_with_inputs), last_keyset)
 
         return runs_with_inputs, next_page_token
 
@@ -1309,14 +1460,47 @@ class SqlAlchemyStore(AbstractStore):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
-            try:
-                self._log_params(run_id, params)
-                self._log_metrics(run_id, metrics)
-                self._set_tags(run_id, tags)
-            except MlflowException as e:
-                raise e
-            except Exception as e:
-                raise MlflowException(e, INTERNAL_ERROR)
+            self._log_batches_impl(session, {run_id: run}, [(run_id, metrics, params, tags)])
+
+    def log_batches(self, batches):
+        for run_id, metrics, params, tags in batches:
+            _validate_run_id(run_id)
+            _validate_batch_log_data(metrics, params, tags)
+        _validate_batches_log_limits(batches)
+        _validate_batches_param_keys_unique(batches)
+
+        with self.ManagedSessionMaker() as session:
+            runs_by_id = self._get_runs_by_id(session, [run_id for run_id, *_ in batches])
+            for run in runs_by_id.values():
+                self._check_run_is_active(run)
+            self._log_batches_impl(session, runs_by_id, batches)
+
+    def _log_batches_impl(self, session, runs_by_id, batches):
+        """
+        Log the metrics, params and tags of the specified batches with a fixed number of
+        statements, whatever the number of runs they are logged for.
+
+        :param runs_by_id: A dictionary mapping the run IDs of the batches to their ``SqlRun``
+                           objects.
+        :param batches: List of ``(run_id, metrics, params, tags)`` tuples.
+        """
+        metrics_by_run_id = defaultdict(list)
+        params_by_run_id = defaultdict(list)
+        tags_by_run_id = defaultdict(list)
+        for run_id, metrics, params, tags in batches:
+            metrics_by_run_id[run_id].extend(metrics)
+            params_by_run_id[run_id].extend(params)
+            tags_by_run_id[run_id].extend(tags)
+        # Everything is logged in the transaction of the session, so that nothing is logged if
+        # any of it fails
+        try:
+            self._log_params_impl(session, params_by_run_id)
+            self._log_metrics_impl(session, metrics_by_run_id)
+            self._set_tags_impl(session, runs_by_id, tags_by_run_id)
+        except MlflowException as e:
+            raise e
+        except Exception as e:
+            raise MlflowException(e, INTERNAL_ERROR)
 
     def record_logged_model(self, run_id, mlflow_model):
         from mlflow.models import Model
@@ -1664,11 +1848,79 @@ def _get_orderby_clauses(order_by_list, session):
                 clauses.append(order_value.desc())
 
     if (SearchUtils._ATTRIBUTE_IDENTIFIER, SqlRun.start_time.key) not in observed_order_by_clauses:
+        # Like the other nullable columns, runs without a start time are sorted last explicitly,
+        # whichever end of the order the dialect sorts NULLs to
+        clause_id += 1
+        case = sql.case((SqlRun.start_time.is_(None), 1), else_=0).label("clause_%s" % clause_id)
+        clauses.append(case.name)
+        select_clauses.append(case)
         clauses.append(SqlRun.start_time.desc())
     clauses.append(SqlRun.run_uuid)
     return select_clauses, clauses, ordering_joins
 
 
+def _get_keyset_columns(select_clauses, orderby_clauses):
+    """
+    Translates the ``select`` and ``order_by`` clauses produced by ``_get_orderby_clauses`` into
+    the ordered list of ``(column, ascending, select_index)`` tuples that make up the sort key of
+    a run. ``select_index`` is the position of the column in ``select_clauses``, or ``None`` if
+    the value must be read from the ``SqlRun`` row itself.
+    """
+    labels = {
+        clause.name: idx for idx, clause in enumerate(select_clauses) if isinstance(clause, Label)
+    }
+    keyset_columns = []
+    for clause in orderby_clauses:
+        if isinstance(clause, str):
+            # CASE WHEN columns are referenced by their label in the ORDER BY clause; the
+            # underlying expression is used for comparison because labels can't be referenced
+            # from a WHERE clause
+            idx = labels[clause]
+            keyset_columns.append((select_clauses[idx].element, True, idx))
+            continue
+
+        ascending = not (
+            isinstance(clause, UnaryExpression) and clause.modifier is operators.desc_op
+        )
+        column = clause if ascending else clause.element
+        idx = next((i for i, c in enumerate(select_clauses) if c is column), None)
+        keyset_columns.append((column, ascending, idx))
+    return keyset_columns
+
+
+def _get_keyset_values(keyset_columns, row):
+    """
+    Extracts the sort key of a row returned by ``_search_runs``. The row contains the ``SqlRun``
+    entity followed by the columns of ``select_clauses``.
+    """
+    run = row[0]
+    return [
+        getattr(run, column.key) if idx is None else row[idx + 1]
+        for column, _, idx in keyset_columns
+    ]
+
+
+def _get_keyset_filter_clause(keyset_columns, keyset):
+    """
+    Builds a predicate that matches the rows sorting strictly after the given sort key, i.e.
+    ``(c1 > v1) OR (c1 = v1 AND c2 > v2) OR ...`` with the comparison direction of each column
+    following its sort order. Every nullable column is preceded by a CASE WHEN column that sorts
+    on the presence of its value, so the position of NULLs doesn't depend on the dialect and all
+    the rows tied up to a NULL value in the sort key also have a NULL value; such columns are
+    matched with ``IS NULL`` and never compared.
+    """
+    conditions = []
+    equalities = []
+    for (column, ascending, _), value in zip(keyset_columns, keyset):
+        if value is None:
+            equalities.append(column.is_(None))
+            continue
+        comparison = column > value if ascending else column < value
+        conditions.append(sql.and_(*equalities, comparison))
+        equalities.append(column == value)
+    return sql.or_(*conditions)
+
+
 def _get_search_experiments_filter_clauses(parsed_filters, dialect):
     attribute_filters = []
     non_attribute_filters = []
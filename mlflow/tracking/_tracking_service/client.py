@@ -22,6 +22,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, ErrorCode
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.utils import chunk_list
+from mlflow.utils.async_logging import get_async_logging_queue, should_log_asynchronously
 from mlflow.utils.mlflow_tags import MLFLOW_USER
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import add_databricks_profile_info_to_artifact_uri
@@ -29,11 +30,40 @@ from mlflow.utils.validation import (
     MAX_METRICS_PER_BATCH,
     MAX_PARAMS_TAGS_PER_BATCH,
     MAX_ENTITIES_PER_BATCH,
+    MAX_RUNS_PER_BATCH,
 )
 from mlflow.utils.time_utils import get_current_time_millis
 from collections import OrderedDict
 
 
+def _split_batch(metrics, params, tags):
+    """
+    Split the metrics, params and tags to log for a run into batches within the request limits of
+    ``log_batch``.
+
+    :return: A generator of ``(metrics, params, tags)`` tuples.
+    """
+    metrics, params, tags = list(metrics), list(params), list(tags)
+    if len(metrics) == 0 and len(params) == 0 and len(tags) == 0:
+        return
+
+    param_batches = chunk_list(params, MAX_PARAMS_TAGS_PER_BATCH)
+    tag_batches = chunk_list(tags, MAX_PARAMS_TAGS_PER_BATCH)
+
+    for params_batch, tags_batch in zip_longest(param_batches, tag_batches, fillvalue=[]):
+        metrics_batch_size = min(
+            MAX_ENTITIES_PER_BATCH - len(params_batch) - len(tags_batch),
+            MAX_METRICS_PER_BATCH,
+        )
+        metrics_batch_size = max(metrics_batch_size, 0)
+        metrics_batch = metrics[:metrics_batch_size]
+        metrics = metrics[metrics_batch_size:]
+        yield metrics_batch, params_batch, tags_batch
+
+    for metrics_batch in chunk_list(metrics, chunk_size=MAX_METRICS_PER_BATCH):
+        yield metrics_batch, [], []
+
+
 class TrackingServiceClient:
     """
     Client of an MLflow Tracking Server that creates and manages experiments and runs.
@@ -73,6 +103,22 @@ class TrackingServiceClient:
         _validate_run_id(run_id)
         return self.store.get_run(run_id)
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs from backend store, with as few requests as the store allows.
+
+        :param run_ids: List of unique identifiers of the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``,
+                 if all the runs exist. Otherwise, raises an exception.
+        """
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+        runs = []
+        for run_ids_batch in chunk_list(list(run_ids), MAX_RUNS_PER_BATCH):
+            runs.extend(self.store.get_runs(run_ids_batch))
+        return runs
+
     def get_metric_history(self, run_id, key):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
@@ -263,7 +309,7 @@ class TrackingServiceClient:
         """
         self.store.rename_experiment(experiment_id, new_name)
 
-    def log_metric(self, run_id, key, value, timestamp=None, step=None):
+    def log_metric(self, run_id, key, value, timestamp=None, step=None, synchronous=None):
         """
         Log a metric against the run ID.
 
@@ -280,19 +326,32 @@ class TrackingServiceClient:
                       may support larger values.
         :param timestamp: Time when this metric was calculated. Defaults to the current system time.
         :param step: Training step (iteration) at which was the metric calculated. Defaults to 0.
+        :param synchronous: If ``False``, the metric is queued and logged asynchronously. Defaults
+                            to the process-wide asynchronous logging mode.
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` if the metric is logged
+                 asynchronously, ``None`` otherwise.
         """
         timestamp = timestamp if timestamp is not None else get_current_time_millis()
         step = step if step is not None else 0
         metric_value = convert_metric_value_to_float_if_possible(value)
         metric = Metric(key, metric_value, timestamp, step)
+        if should_log_asynchronously(synchronous):
+            return self._log_batch_async(run_id, metrics=[metric])
         self.store.log_metric(run_id, metric)
 
-    def log_param(self, run_id, key, value):
+    def log_param(self, run_id, key, value, synchronous=None):
         """
         Log a parameter (e.g. model hyperparameter) against the run ID. Value is converted to
         a string.
+
+        :param synchronous: If ``False``, the param is queued and logged asynchronously. Defaults
+                            to the process-wide asynchronous logging mode.
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` if the param is logged
+                 asynchronously, ``None`` otherwise.
         """
         param = Param(key, str(value))
+        if should_log_asynchronously(synchronous):
+            return self._log_batch_async(run_id, params=[param])
         try:
             self.store.log_param(run_id, param)
         except MlflowException as e:
@@ -313,7 +372,7 @@ class TrackingServiceClient:
         tag = ExperimentTag(key, str(value))
         self.store.set_experiment_tag(experiment_id, tag)
 
-    def set_tag(self, run_id, key, value):
+    def set_tag(self, run_id, key, value, synchronous=None):
         """
         Set a tag on the run with the specified ID. Value is converted to a string.
 
@@ -325,8 +384,14 @@ class TrackingServiceClient:
         :param value: Tag value (string, but will be string-ified if not).
                       All backend stores will support values up to length 5000, but some
                       may support larger values.
+        :param synchronous: If ``False``, the tag is queued and set asynchronously. Defaults to the
+                            process-wide asynchronous logging mode.
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` if the tag is set
+                 asynchronously, ``None`` otherwise.
         """
         tag = RunTag(key, str(value))
+        if should_log_asynchronously(synchronous):
+            return self._log_batch_async(run_id, tags=[tag])
         self.store.set_tag(run_id, tag)
 
     def delete_tag(self, run_id, key):
@@ -336,6 +401,8 @@ class TrackingServiceClient:
         :param run_id: String ID of the run
         :param key: Name of the tag
         """
+        # Don't let a queued `set_tag` recreate the tag
+        get_async_logging_queue().flush()
         self.store.delete_tag(run_id, key)
 
     def update_run(self, run_id, status=None, name=None):
@@ -361,7 +428,7 @@ class TrackingServiceClient:
             run_name=name,
         )
 
-    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+    def log_batch(self, run_id, metrics=(), params=(), tags=(), synchronous=None):
         """
         Log multiple metrics, params, and/or tags.
 
@@ -369,31 +436,61 @@ class TrackingServiceClient:
         :param metrics: If provided, List of Metric(key, value, timestamp) instances.
         :param params: If provided, List of Param(key, value) instances.
         :param tags: If provided, List of RunTag(key, value) instances.
+        :param synchronous: If ``False``, the batch is queued and logged asynchronously. Defaults
+                            to the process-wide asynchronous logging mode.
 
         Raises an MlflowException if any errors occur.
-        :return: None
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` if the batch is logged
+                 asynchronously, ``None`` otherwise.
         """
-        if len(metrics) == 0 and len(params) == 0 and len(tags) == 0:
-            return
-
-        param_batches = chunk_list(params, MAX_PARAMS_TAGS_PER_BATCH)
-        tag_batches = chunk_list(tags, MAX_PARAMS_TAGS_PER_BATCH)
+        if should_log_asynchronously(synchronous):
+            return self._log_batch_async(run_id, metrics=metrics, params=params, tags=tags)
+        self._log_batch(run_id, metrics=metrics, params=params, tags=tags)
 
-        for params_batch, tags_batch in zip_longest(param_batches, tag_batches, fillvalue=[]):
-            metrics_batch_size = min(
-                MAX_ENTITIES_PER_BATCH - len(params_batch) - len(tags_batch),
-                MAX_METRICS_PER_BATCH,
-            )
-            metrics_batch_size = max(metrics_batch_size, 0)
-            metrics_batch = metrics[:metrics_batch_size]
-            metrics = metrics[metrics_batch_size:]
+    def _log_batch_async(self, run_id, metrics=(), params=(), tags=()):
+        return get_async_logging_queue().log_batch(
+            self._log_batch,
+            store_key=self.tracking_uri,
+            run_id=run_id,
+            metrics=metrics,
+            params=params,
+            tags=tags,
+        )
 
+    def _log_batch(self, run_id, metrics=(), params=(), tags=()):
+        for metrics_batch, params_batch, tags_batch in _split_batch(metrics, params, tags):
             self.store.log_batch(
                 run_id=run_id, metrics=metrics_batch, params=params_batch, tags=tags_batch
             )
 
-        for metrics_batch in chunk_list(metrics, chunk_size=MAX_METRICS_PER_BATCH):
-            self.store.log_batch(run_id=run_id, metrics=metrics_batch, params=[], tags=[])
+    def log_batches(self, batches):
+        """
+        Log multiple metrics, params, and/or tags for multiple runs, with as few requests as the
+        request limits of the store allow.
+
+        :param batches: List of ``(run_id, metrics, params, tags)`` tuples, where ``metrics``,
+                        ``params`` and ``tags`` are lists of Metric, Param and RunTag instances
+                        to log for the run of ``run_id``.
+
+        Raises an MlflowException if any errors occur.
+        :return: None
+        """
+        request_batches = []
+        request_size = 0
+        for run_id, metrics, params, tags in batches:
+            for metrics_batch, params_batch, tags_batch in _split_batch(metrics, params, tags):
+                batch_size = len(metrics_batch) + len(params_batch) + len(tags_batch)
+                if (
+                    len(request_batches) == MAX_RUNS_PER_BATCH
+                    or request_size + batch_size > MAX_ENTITIES_PER_BATCH
+                ):
+                    self.store.log_batches(request_batches)
+                    request_batches = []
+                    request_size = 0
+                request_batches.append((run_id, metrics_batch, params_batch, tags_batch))
+                request_size += batch_size
+        if request_batches:
+            self.store.log_batches(request_batches)
 
     def log_inputs(self, run_id: str, datasets: Optional[List[DatasetInput]] = None):
         """
@@ -499,6 +596,8 @@ class TrackingServiceClient:
         :param end_time: If not provided, defaults to the current time."""
         end_time = end_time if end_time else get_current_time_millis()
         status = status if status else RunStatus.to_string(RunStatus.FINISHED)
+        # Log the data queued for the run before marking it as terminated
+        get_async_logging_queue().flush()
         self.store.update_run_info(
             run_id,
             run_status=RunStatus.from_string(status),
@@ -12,6 +12,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.dbfs_artifact_repo import DbfsRestArtifactRepository
+from mlflow.store.artifact.download_cache import download_artifacts_with_cache
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
 from mlflow.tracking._tracking_service.utils import _get_store
 from mlflow.utils.uri import add_databricks_profile_info_to_artifact_uri, append_to_uri_path
@@ -97,8 +98,8 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
                         a local output path will be created.
     """
     root_uri, artifact_path = _get_root_uri_and_artifact_path(artifact_uri)
-    return get_artifact_repository(artifact_uri=root_uri).download_artifacts(
-        artifact_path=artifact_path, dst_path=output_path
+    return download_artifacts_with_cache(
+        get_artifact_repository(artifact_uri=root_uri), artifact_path, dst_path=output_path
     )
 
 
@@ -0,0 +1,807 @@
+"""
+An ``asyncio`` client of the MLflow tracking server and model registry, for applications such as
+orchestrators that concurrently manage many runs from one event loop.
+
+:py:class:`AsyncMlflowClient` calls the same REST API as :py:class:`mlflow.client.MlflowClient`
+with a tracking URI of scheme ``http`` or ``https``, over a single pool of connections shared by all
+its requests. Its methods are coroutines that can be awaited concurrently, e.g.:
+
+.. code-block:: python
+
+    async with AsyncMlflowClient("http://localhost:5000") as client:
+        runs = await asyncio.gather(*(client.get_run(run_id) for run_id in run_ids))
+
+It requires ``aiohttp``, which is installed with the ``mlflow[gateway]`` extra.
+"""
+import asyncio
+import json
+import os
+import posixpath
+import ssl
+import tempfile
+from itertools import zip_longest
+
+import aiohttp
+
+from mlflow.entities import (
+    Experiment,
+    ExperimentTag,
+    FileInfo,
+    Metric,
+    Run,
+    RunInfo,
+    RunStatus,
+    RunTag,
+    ViewType,
+)
+from mlflow.entities.model_registry import ModelVersion, RegisteredModel
+from mlflow.entities.model_registry import ModelVersionTag, RegisteredModelTag
+from mlflow.environment_variables import (
+    MLFLOW_HTTP_POOL_MAXSIZE,
+    MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR,
+    MLFLOW_HTTP_REQUEST_MAX_RETRIES,
+    MLFLOW_HTTP_REQUEST_TIMEOUT,
+)
+from mlflow.exceptions import MlflowException, RestException, get_error_code
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, RESOURCE_DOES_NOT_EXIST, ErrorCode
+from mlflow.protos.model_registry_pb2 import (
+    CreateModelVersion,
+    CreateRegisteredModel,
+    DeleteRegisteredModel,
+    GetLatestVersions,
+    GetModelVersion,
+    GetModelVersionDownloadUri,
+    GetRegisteredModel,
+    ModelRegistryService,
+    SearchModelVersions,
+    SearchRegisteredModels,
+    TransitionModelVersionStage,
+)
+from mlflow.protos.service_pb2 import (
+    CreateExperiment,
+    CreateRun,
+    DeleteRun,
+    DeleteTag,
+    GetExperiment,
+    GetExperimentByName,
+    GetMetricHistory,
+    GetRun,
+    ListArtifacts,
+    LogBatch,
+    LogMetric,
+    LogParam,
+    MlflowService,
+    RestoreRun,
+    SearchExperiments,
+    SearchRuns,
+    SetTag,
+    UpdateRun,
+)
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.model_registry import (
+    SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+    SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
+)
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.tracking.metric_value_conversion_utils import convert_metric_value_to_float_if_possible
+from mlflow.tracking.request_header.registry import resolve_request_headers
+from mlflow.utils import chunk_list
+from mlflow.utils.mlflow_tags import MLFLOW_USER
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+from mlflow.utils.request_utils import _TRANSIENT_FAILURE_RESPONSE_CODES
+from mlflow.utils.rest_utils import (
+    _REST_API_PATH_PREFIX,
+    extract_all_api_info_for_service,
+    extract_api_info_for_service,
+)
+from mlflow.utils.string_utils import strip_suffix
+from mlflow.utils.time_utils import get_current_time_millis
+from mlflow.utils.validation import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+)
+
+_TRACKING_METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
+_REGISTRY_METHOD_TO_ALL_INFO = extract_all_api_info_for_service(
+    ModelRegistryService, _REST_API_PATH_PREFIX
+)
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_host_creds_of_rest_store(store, uri):
+    from mlflow.store.model_registry.rest_store import RestStore as RegistryRestStore
+    from mlflow.store.tracking.rest_store import RestStore as TrackingRestStore
+
+    if not isinstance(store, (TrackingRestStore, RegistryRestStore)):
+        raise MlflowException(
+            f"AsyncMlflowClient only supports tracking servers accessed over REST, got {uri!r}"
+        )
+    return store.get_host_creds
+
+
+def _to_query_params(json_body):
+    """
+    Convert the JSON body of a request to the query parameters of a GET request, encoding them
+    like ``requests`` does.
+    """
+    params = []
+    for key, value in json_body.items():
+        for v in value if isinstance(value, list) else [value]:
+            # Booleans are parsed from lowercase strings by the tracking server
+            params.append((key, str(v).lower() if isinstance(v, bool) else str(v)))
+    return params
+
+
+async def _raise_for_response(response, endpoint):
+    """Raise an exception if the request was not successful, like ``verify_rest_response``."""
+    if response.status == 200:
+        return
+    text = await response.text()
+    try:
+        js = json.loads(text)
+    except ValueError:
+        js = None
+    if isinstance(js, dict):
+        raise RestException(js)
+    raise MlflowException(
+        f"API request to endpoint {endpoint} failed with error code {response.status} != 200."
+        f" Response body: '{text}'",
+        error_code=get_error_code(response.status),
+    )
+
+
+class AsyncMlflowClient:
+    """
+    Client of an MLflow tracking server and model registry whose methods are coroutines.
+
+    The client opens its pool of connections when it first sends a request, and must be closed
+    when it's no longer used, with :py:meth:`close` or by using it as an asynchronous context
+    manager.
+
+    :param tracking_uri: Address of the tracking server. If not provided, defaults to the service
+                         set by ``mlflow.tracking.set_tracking_uri``.
+    :param registry_uri: Address of the model registry server. If not provided, defaults to the
+                         tracking server.
+    :param max_connections: Maximum number of connections concurrently open to each server.
+                            Defaults to ``MLFLOW_HTTP_POOL_MAXSIZE``.
+    """
+
+    def __init__(self, tracking_uri=None, registry_uri=None, max_connections=None):
+        from mlflow.tracking._model_registry.utils import _get_store as _get_registry_store
+        from mlflow.tracking._model_registry.utils import _resolve_registry_uri
+        from mlflow.tracking._tracking_service.utils import _get_store, _resolve_tracking_uri
+
+        self.tracking_uri = _resolve_tracking_uri(tracking_uri)
+        self._registry_uri = _resolve_registry_uri(registry_uri, self.tracking_uri)
+        self._get_tracking_host_creds = _get_host_creds_of_rest_store(
+            _get_store(self.tracking_uri), self.tracking_uri
+        )
+        self._registry_store = _get_registry_store(self._registry_uri, self.tracking_uri)
+        self._max_connections = max_connections or MLFLOW_HTTP_POOL_MAXSIZE.get()
+        self._session = None
+        self._ssl_contexts = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the connections of the client."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=self._max_connections)
+            )
+        return self._session
+
+    def _get_ssl(self, host_creds):
+        """
+        :return: The ``ssl`` argument of the requests sent with the specified credentials.
+        """
+        verify = host_creds.verify
+        if verify is True and host_creds.client_cert_path is None:
+            return True
+        if verify is False and host_creds.client_cert_path is None:
+            return False
+        key = (verify, host_creds.client_cert_path)
+        if key not in self._ssl_contexts:
+            context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+            if verify is False:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            if host_creds.client_cert_path is not None:
+                context.load_cert_chain(host_creds.client_cert_path)
+            self._ssl_contexts[key] = context
+        return self._ssl_contexts[key]
+
+    def _get_headers(self, host_creds):
+        headers = dict(resolve_request_headers())
+        if host_creds.username and host_creds.password:
+            headers["Authorization"] = aiohttp.BasicAuth(
+                host_creds.username, host_creds.password
+            ).encode()
+        elif host_creds.token:
+            headers["Authorization"] = f"Bearer {host_creds.token}"
+        return headers
+
+    async def _request(self, host_creds, endpoint, method, timeout, **kwargs):
+        """
+        Send an HTTP request to the specified endpoint of a server, retrying the transient
+        failures with an exponential backoff like :py:func:`mlflow.utils.rest_utils.http_request`.
+
+        :return: The ``aiohttp.ClientResponse``, which must be released by the caller.
+        """
+        if host_creds.aws_sigv4:
+            raise MlflowException("AsyncMlflowClient doesn't support AWS SigV4 authentication")
+
+        url = strip_suffix(host_creds.host, "/") + endpoint
+        max_retries = MLFLOW_HTTP_REQUEST_MAX_RETRIES.get()
+        backoff_factor = MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR.get()
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self._get_session().request(
+                    method,
+                    url,
+                    headers=self._get_headers(host_creds),
+                    ssl=self._get_ssl(host_creds),
+                    timeout=timeout,
+                    **kwargs,
+                )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == max_retries:
+                    raise MlflowException(
+                        f"API request to {url} failed with exception {e!r}"
+                    ) from e
+            else:
+                if response.status not in _TRANSIENT_FAILURE_RESPONSE_CODES or (
+                    attempt == max_retries
+                ):
+                    return response
+                response.release()
+            await asyncio.sleep(backoff_factor * 2**attempt)
+
+    async def _call_endpoint(self, host_creds, endpoint, method, request_message):
+        json_body = json.loads(message_to_json(request_message))
+        kwargs = {"params": _to_query_params(json_body)} if method == "GET" else {"json": json_body}
+        timeout = aiohttp.ClientTimeout(total=MLFLOW_HTTP_REQUEST_TIMEOUT.get())
+        async with await self._request(host_creds, endpoint, method, timeout, **kwargs) as response:
+            await _raise_for_response(response, endpoint)
+            js_dict = await response.json(content_type=None)
+        response_message = type(request_message).Response()
+        parse_dict(js_dict=js_dict, message=response_message)
+        return response_message
+
+    async def _call_tracking_endpoint(self, request_message):
+        endpoint, method = _TRACKING_METHOD_TO_INFO[type(request_message)]
+        return await self._call_endpoint(
+            self._get_tracking_host_creds(), endpoint, method, request_message
+        )
+
+    async def _call_registry_endpoint(self, request_message):
+        # Like the registry ``RestStore``, fall back on the next endpoints of the method if the
+        # server doesn't implement one
+        host_creds = _get_host_creds_of_rest_store(self._registry_store, self._registry_uri)()
+        endpoints = _REGISTRY_METHOD_TO_ALL_INFO[type(request_message)]
+        for i, (endpoint, method) in enumerate(endpoints):
+            try:
+                return await self._call_endpoint(host_creds, endpoint, method, request_message)
+            except RestException as e:
+                if e.error_code != ErrorCode.Name(ENDPOINT_NOT_FOUND) or i == len(endpoints) - 1:
+                    raise
+
+    # Experiments
+
+    async def create_experiment(self, name, artifact_location=None, tags=None):
+        """
+        Create an experiment.
+
+        :param name: The experiment name, which must be unique.
+        :param artifact_location: The location to store run artifacts.
+        :param tags: A dictionary of key-value pairs of the tags of the experiment.
+        :return: String ID of the created experiment.
+        """
+        tags = [ExperimentTag(key, str(value)).to_proto() for key, value in (tags or {}).items()]
+        response = await self._call_tracking_endpoint(
+            CreateExperiment(name=name, artifact_location=artifact_location, tags=tags)
+        )
+        return response.experiment_id
+
+    async def get_experiment(self, experiment_id):
+        """
+        :param experiment_id: The experiment ID returned from ``create_experiment``.
+        :return: :py:class:`mlflow.entities.Experiment`
+        """
+        response = await self._call_tracking_endpoint(
+            GetExperiment(experiment_id=str(experiment_id))
+        )
+        return Experiment.from_proto(response.experiment)
+
+    async def get_experiment_by_name(self, name):
+        """
+        :param name: The experiment name.
+        :return: :py:class:`mlflow.entities.Experiment`, or ``None`` if it doesn't exist.
+        """
+        try:
+            response = await self._call_tracking_endpoint(GetExperimentByName(experiment_name=name))
+        except MlflowException as e:
+            if e.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                return None
+            raise
+        return Experiment.from_proto(response.experiment)
+
+    async def search_experiments(
+        self,
+        view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        filter_string=None,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search for experiments that match the specified search query.
+
+        :return: A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
+                 :py:class:`Experiment <mlflow.entities.Experiment>` objects.
+        """
+        response = await self._call_tracking_endpoint(
+            SearchExperiments(
+                view_type=view_type,
+                max_results=max_results,
+                page_token=page_token,
+                order_by=order_by,
+                filter=filter_string,
+            )
+        )
+        experiments = [Experiment.from_proto(e) for e in response.experiments]
+        return PagedList(experiments, response.next_page_token or None)
+
+    # Runs
+
+    async def create_run(self, experiment_id, start_time=None, tags=None, run_name=None):
+        """
+        Create a run.
+
+        :param experiment_id: The ID of the experiment to create a run in.
+        :param start_time: If not provided, use the current timestamp.
+        :param tags: A dictionary of key-value pairs of the tags of the run.
+        :param run_name: The name of this run.
+        :return: :py:class:`mlflow.entities.Run` that was created.
+        """
+        tags = tags or {}
+        response = await self._call_tracking_endpoint(
+            CreateRun(
+                experiment_id=str(experiment_id),
+                user_id=tags.get(MLFLOW_USER, "unknown"),
+                start_time=start_time or get_current_time_millis(),
+                tags=[RunTag(key, str(value)).to_proto() for key, value in tags.items()],
+                run_name=run_name,
+            )
+        )
+        return Run.from_proto(response.run)
+
+    async def get_run(self, run_id):
+        """
+        :param run_id: Unique identifier for the run.
+        :return: :py:class:`mlflow.entities.Run`
+        """
+        response = await self._call_tracking_endpoint(GetRun(run_uuid=run_id, run_id=run_id))
+        return Run.from_proto(response.run)
+
+    async def update_run(self, run_id, status=None, name=None):
+        """
+        Update the status or name of a run.
+
+        :param run_id: The ID of the run to update.
+        :param status: The new status of the run, a string value of
+                       :py:class:`mlflow.entities.RunStatus`.
+        :param name: The new name of the run.
+        :return: :py:class:`mlflow.entities.RunInfo` of the updated run.
+        """
+        response = await self._call_tracking_endpoint(
+            UpdateRun(
+                run_uuid=run_id,
+                run_id=run_id,
+                status=RunStatus.from_string(status) if status else None,
+                run_name=name,
+            )
+        )
+        return RunInfo.from_proto(response.run_info)
+
+    async def set_terminated(self, run_id, status=None, end_time=None):
+        """
+        Set a run's status to terminated.
+
+        :param status: A string value of :py:class:`mlflow.entities.RunStatus`.
+                       Defaults to "FINISHED".
+        :param end_time: If not provided, defaults to the current time.
+        """
+        await self._call_tracking_endpoint(
+            UpdateRun(
+                run_uuid=run_id,
+                run_id=run_id,
+                status=RunStatus.from_string(status or "FINISHED"),
+                end_time=end_time or get_current_time_millis(),
+            )
+        )
+
+    async def delete_run(self, run_id):
+        """Delete a run with the given ID."""
+        await self._call_tracking_endpoint(DeleteRun(run_id=run_id))
+
+    async def restore_run(self, run_id):
+        """Restore a deleted run with the given ID."""
+        await self._call_tracking_endpoint(RestoreRun(run_id=run_id))
+
+    async def search_runs(
+        self,
+        experiment_ids,
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search for runs that match the specified search query.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string ID.
+        :return: A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
+                 :py:class:`Run <mlflow.entities.Run>` objects.
+        """
+        if isinstance(experiment_ids, (int, str)):
+            experiment_ids = [experiment_ids]
+        response = await self._call_tracking_endpoint(
+            SearchRuns(
+                experiment_ids=[str(experiment_id) for experiment_id in experiment_ids],
+                filter=filter_string,
+                run_view_type=ViewType.to_proto(run_view_type),
+                max_results=max_results,
+                order_by=order_by,
+                page_token=page_token,
+            )
+        )
+        runs = [Run.from_proto(run) for run in response.runs]
+        return PagedList(runs, response.next_page_token or None)
+
+    # Metrics, params and tags
+
+    async def log_metric(self, run_id, key, value, timestamp=None, step=None):
+        """
+        Log a metric against the run ID.
+
+        :param timestamp: Time when this metric was calculated. Defaults to the current system time.
+        :param step: Training step at which the metric was calculated. Defaults to 0.
+        """
+        await self._call_tracking_endpoint(
+            LogMetric(
+                run_uuid=run_id,
+                run_id=run_id,
+                key=key,
+                value=convert_metric_value_to_float_if_possible(value),
+                timestamp=timestamp if timestamp is not None else get_current_time_millis(),
+                step=step or 0,
+            )
+        )
+
+    async def log_param(self, run_id, key, value):
+        """
+        Log a parameter against the run ID, as a string.
+
+        :return: The parameter value that was logged.
+        """
+        value = str(value)
+        await self._call_tracking_endpoint(
+            LogParam(run_uuid=run_id, run_id=run_id, key=key, value=value)
+        )
+        return value
+
+    async def set_tag(self, run_id, key, value):
+        """Set a tag on the run with the specified ID, as a string."""
+        await self._call_tracking_endpoint(
+            SetTag(run_uuid=run_id, run_id=run_id, key=key, value=str(value))
+        )
+
+    async def delete_tag(self, run_id, key):
+        """Delete a tag from a run."""
+        await self._call_tracking_endpoint(DeleteTag(run_id=run_id, key=key))
+
+    async def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Log multiple metrics, params, and/or tags, in as many requests as the limits of the
+        ``LogBatch`` API require, like :py:meth:`mlflow.client.MlflowClient.log_batch`.
+
+        :param metrics: If provided, List of Metric(key, value, timestamp) instances.
+        :param params: If provided, List of Param(key, value) instances.
+        :param tags: If provided, List of RunTag(key, value) instances.
+        """
+        metrics = list(metrics)
+        batches = []
+        for params_batch, tags_batch in zip_longest(
+            chunk_list(list(params), MAX_PARAMS_TAGS_PER_BATCH),
+            chunk_list(list(tags), MAX_PARAMS_TAGS_PER_BATCH),
+            fillvalue=[],
+        ):
+            metrics_batch_size = min(
+                MAX_ENTITIES_PER_BATCH - len(params_batch) - len(tags_batch),
+                MAX_METRICS_PER_BATCH,
+            )
+            metrics_batch_size = max(metrics_batch_size, 0)
+            batches.append((metrics[:metrics_batch_size], params_batch, tags_batch))
+            metrics = metrics[metrics_batch_size:]
+        batches.extend(
+            (metrics_batch, [], []) for metrics_batch in chunk_list(metrics, MAX_METRICS_PER_BATCH)
+        )
+
+        # The batches are logged in order, so that the latest values of metrics are the last ones
+        for metrics_batch, params_batch, tags_batch in batches:
+            await self._call_tracking_endpoint(
+                LogBatch(
+                    run_id=run_id,
+                    metrics=[m.to_proto() for m in metrics_batch],
+                    params=[p.to_proto() for p in params_batch],
+                    tags=[t.to_proto() for t in tags_batch],
+                )
+            )
+
+    async def get_metric_history(self, run_id, key):
+        """
+        Return a list of metric objects corresponding to all values logged for a given metric.
+
+        :return: A list of :py:class:`mlflow.entities.Metric` entities.
+        """
+        response = await self._call_tracking_endpoint(
+            GetMetricHistory(run_uuid=run_id, run_id=run_id, metric_key=key)
+        )
+        return [Metric.from_proto(metric) for metric in response.metrics]
+
+    # Artifacts
+
+    async def list_artifacts(self, run_id, path=None):
+        """
+        List the artifacts of a run.
+
+        :param path: The run's relative artifact path to list from.
+        :return: List of :py:class:`mlflow.entities.FileInfo`
+        """
+        response = await self._call_tracking_endpoint(ListArtifacts(run_id=run_id, path=path))
+        return [FileInfo.from_proto(f) for f in response.files]
+
+    async def _download_artifact_file(self, run_id, path, local_path):
+        host_creds = self._get_tracking_host_creds()
+        # Large files are only limited by the time between the chunks read from the server
+        timeout = aiohttp.ClientTimeout(sock_read=MLFLOW_HTTP_REQUEST_TIMEOUT.get())
+        params = {"run_id": run_id, "path": path}
+        async with await self._request(
+            host_creds, "/get-artifact", "GET", timeout, params=params
+        ) as response:
+            await _raise_for_response(response, "/get-artifact")
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with open(local_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+    async def _is_artifact_directory(self, run_id, path):
+        parent = posixpath.dirname(path)
+        file_infos = await self.list_artifacts(run_id, parent or None)
+        return any(f.path == path and f.is_dir for f in file_infos)
+
+    async def _list_artifact_files(self, run_id, path, is_dir=None):
+        """
+        :param is_dir: Whether ``path`` is a directory, if known.
+        :return: A tuple of the paths of the artifact files under the specified directory, or
+                 ``[path]`` if it isn't a directory, and of the paths of the empty directories
+                 under it, including itself.
+        """
+        file_infos = await self.list_artifacts(run_id, path)
+        if len(file_infos) == 1 and not file_infos[0].is_dir and file_infos[0].path == path:
+            # Listing a file returns the file itself on some artifact stores
+            return [path], []
+        if not file_infos:
+            # Listing a file and listing an empty directory both return nothing on other
+            # artifact stores
+            if not path:
+                return [], []
+            if is_dir is None:
+                is_dir = await self._is_artifact_directory(run_id, path)
+            return ([], [path]) if is_dir else ([path], [])
+        nested = await asyncio.gather(
+            *(
+                self._list_artifact_files(run_id, f.path, is_dir=True)
+                for f in file_infos
+                if f.is_dir and f.path != path
+            )
+        )
+        files = [f.path for f in file_infos if not f.is_dir]
+        empty_dirs = []
+        for nested_files, nested_empty_dirs in nested:
+            files.extend(nested_files)
+            empty_dirs.extend(nested_empty_dirs)
+        return files, empty_dirs
+
+    async def download_artifacts(self, run_id, path, dst_path=None):
+        """
+        Download an artifact file or directory of a run to a local directory, through the tracking
+        server, concurrently downloading the files of directories.
+
+        :param path: Relative source path to the desired artifact.
+        :param dst_path: Absolute path of the local filesystem destination directory to which to
+                         download the specified artifacts. If not provided, a new temporary
+                         directory is created.
+        :return: Local path of desired artifact.
+        """
+        path = path.strip("/")
+        dst_path = dst_path if dst_path is not None else tempfile.mkdtemp()
+        file_paths, empty_dir_paths = await self._list_artifact_files(run_id, path)
+        for dir_path in empty_dir_paths:
+            os.makedirs(os.path.join(dst_path, *dir_path.split("/")), exist_ok=True)
+        await asyncio.gather(
+            *(
+                self._download_artifact_file(
+                    run_id, file_path, os.path.join(dst_path, *file_path.split("/"))
+                )
+                for file_path in file_paths
+            )
+        )
+        return os.path.join(dst_path, *path.split("/")) if path else dst_path
+
+    # Registered models
+
+    async def create_registered_model(self, name, tags=None, description=None):
+        """
+        Create a new registered model.
+
+        :param name: Name of the new model. This is expected to be unique in the backend store.
+        :param tags: A dictionary of key-value pairs of the tags of the registered model.
+        :param description: Description of the model.
+        :return: A single object of :py:class:`mlflow.entities.model_registry.RegisteredModel`.
+        """
+        tags = [
+            RegisteredModelTag(key, str(value)).to_proto() for key, value in (tags or {}).items()
+        ]
+        response = await self._call_registry_endpoint(
+            CreateRegisteredModel(name=name, tags=tags, description=description)
+        )
+        return RegisteredModel.from_proto(response.registered_model)
+
+    async def get_registered_model(self, name):
+        """
+        :param name: Name of the registered model to get.
+        :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        response = await self._call_registry_endpoint(GetRegisteredModel(name=name))
+        return RegisteredModel.from_proto(response.registered_model)
+
+    async def delete_registered_model(self, name):
+        """Delete a registered model."""
+        await self._call_registry_endpoint(DeleteRegisteredModel(name=name))
+
+    async def search_registered_models(
+        self,
+        filter_string=None,
+        max_results=SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search for registered models that satisfy the filter criteria.
+
+        :return: A PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects.
+        """
+        response = await self._call_registry_endpoint(
+            SearchRegisteredModels(
+                filter=filter_string,
+                max_results=max_results,
+                order_by=order_by,
+                page_token=page_token,
+            )
+        )
+        registered_models = [RegisteredModel.from_proto(m) for m in response.registered_models]
+        return PagedList(registered_models, response.next_page_token or None)
+
+    async def get_latest_versions(self, name, stages=None):
+        """
+        Latest version models for each requested stage. If no ``stages`` provided, returns the
+        latest version for each stage.
+
+        :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+        """
+        response = await self._call_registry_endpoint(GetLatestVersions(name=name, stages=stages))
+        return [ModelVersion.from_proto(mv) for mv in response.model_versions]
+
+    # Model versions
+
+    async def create_model_version(
+        self, name, source, run_id=None, tags=None, run_link=None, description=None
+    ):
+        """
+        Create a new model version from the given source.
+
+        :param name: Name for the containing registered model.
+        :param source: URI indicating the location of the model artifacts.
+        :param run_id: Run ID from MLflow tracking server that generated the model.
+        :param tags: A dictionary of key-value pairs of the tags of the model version.
+        :param run_link: Link to the run from an MLflow tracking server that generated this model.
+        :param description: Description of the version.
+        :return: Single :py:class:`mlflow.entities.model_registry.ModelVersion` object created by
+                 the backend.
+        """
+        tags = [ModelVersionTag(key, str(value)).to_proto() for key, value in (tags or {}).items()]
+        response = await self._call_registry_endpoint(
+            CreateModelVersion(
+                name=name,
+                source=source,
+                run_id=run_id,
+                run_link=run_link,
+                tags=tags,
+                description=description,
+            )
+        )
+        return ModelVersion.from_proto(response.model_version)
+
+    async def get_model_version(self, name, version):
+        """
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        response = await self._call_registry_endpoint(
+            GetModelVersion(name=name, version=str(version))
+        )
+        return ModelVersion.from_proto(response.model_version)
+
+    async def get_model_version_download_uri(self, name, version):
+        """
+        Get the download location in Model Registry for this model version.
+
+        :return: A single URI location that allows reads for downloading.
+        """
+        response = await self._call_registry_endpoint(
+            GetModelVersionDownloadUri(name=name, version=str(version))
+        )
+        return response.artifact_uri
+
+    async def transition_model_version_stage(
+        self, name, version, stage, archive_existing_versions=False
+    ):
+        """
+        Update model version stage.
+
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        response = await self._call_registry_endpoint(
+            TransitionModelVersionStage(
+                name=name,
+                version=str(version),
+                stage=stage,
+                archive_existing_versions=archive_existing_versions,
+            )
+        )
+        return ModelVersion.from_proto(response.model_version)
+
+    async def search_model_versions(
+        self,
+        filter_string=None,
+        max_results=SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search for model versions in backend that satisfy the filter criteria.
+
+        :return: A PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+        """
+        response = await self._call_registry_endpoint(
+            SearchModelVersions(
+                filter=filter_string,
+                max_results=max_results,
+                order_by=order_by,
+                page_token=page_token,
+            )
+        )
+        model_versions = [ModelVersion.from_proto(mv) for mv in response.model_versions]
+        return PagedList(model_versions, response.next_page_token or None)
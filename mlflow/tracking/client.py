@@ -12,9 +12,10 @@ import posixpath
 import sys
 import tempfile
 import yaml
-from typing import Any, Dict, Sequence, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, Sequence, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from mlflow.entities import Experiment, Run, Param, Metric, RunTag, FileInfo, ViewType, DatasetInput
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.entities.model_registry import RegisteredModel, ModelVersion
 from mlflow.entities.model_registry.model_version_stages import ALL_STAGES
@@ -33,9 +34,14 @@ from mlflow.tracking._tracking_service.client import TrackingServiceClient
 from mlflow.tracking.artifact_utils import _upload_artifacts_to_databricks
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 from mlflow.utils.annotations import experimental
+from mlflow.utils.async_logging import RunOperations
 from mlflow.utils.databricks_utils import get_databricks_run_url
 from mlflow.utils.logging_utils import eprint
-from mlflow.utils.uri import is_databricks_uri, is_databricks_unity_catalog_uri
+from mlflow.utils.uri import (
+    add_databricks_profile_info_to_artifact_uri,
+    is_databricks_uri,
+    is_databricks_unity_catalog_uri,
+)
 from mlflow.utils.validation import (
     _validate_model_version_or_stage_exists,
     _validate_model_name,
@@ -165,6 +171,42 @@ class MlflowClient:
         """
         return self._tracking_client.get_run(run_id)
 
+    def get_runs(self, run_ids: Sequence[str]) -> List[Run]:
+        """
+        Fetch multiple runs from backend store, like :py:meth:`get_run` does for each of them, with
+        as few requests as the backend store allows, e.g. a single request for up to 1000 runs
+        from a tracking server.
+
+        :param run_ids: Unique identifiers of the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``,
+                 if all the runs exist. Otherwise, raises an exception.
+
+        .. code-block:: python
+            :caption: Example
+
+            import mlflow
+            from mlflow import MlflowClient
+
+            run_ids = []
+            for i in range(3):
+                with mlflow.start_run() as run:
+                    mlflow.log_param("p", i)
+                run_ids.append(run.info.run_id)
+
+            client = MlflowClient()
+            for run in client.get_runs(run_ids):
+                print("params: {}".format(run.data.params))
+
+        .. code-block:: text
+            :caption: Output
+
+            params: {'p': '0'}
+            params: {'p': '1'}
+            params: {'p': '2'}
+        """
+        return self._tracking_client.get_runs(run_ids)
+
     def get_parent_run(self, run_id: str) -> Optional[Run]:
         """
         Gets the parent run for the given run id if one exists.
@@ -688,7 +730,8 @@ class MlflowClient:
         value: float,
         timestamp: Optional[int] = None,
         step: Optional[int] = None,
-    ) -> None:
+        synchronous: Optional[bool] = None,
+    ) -> Optional[RunOperations]:
         """
         Log a metric against the run ID.
 
@@ -705,6 +748,13 @@ class MlflowClient:
         :param timestamp: Time when this metric was calculated. Defaults to the current system time.
         :param step: Integer training step (iteration) at which was the metric calculated.
                      Defaults to 0.
+        :param synchronous: If ``False``, the metric is queued and logged asynchronously by a
+                            background thread. Defaults to ``False`` if asynchronous logging is
+                            enabled with :py:func:`mlflow.enable_async_logging` or the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable, ``True``
+                            otherwise.
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` that can be used to wait
+                 for the metric to be logged if it is logged asynchronously, ``None`` otherwise.
 
         .. code-block:: python
             :caption: Example
@@ -746,9 +796,13 @@ class MlflowClient:
             metrics: {'m': 1.5}
             status: FINISHED
         """
-        self._tracking_client.log_metric(run_id, key, value, timestamp, step)
+        return self._tracking_client.log_metric(
+            run_id, key, value, timestamp, step, synchronous=synchronous
+        )
 
-    def log_param(self, run_id: str, key: str, value: Any) -> Any:
+    def log_param(
+        self, run_id: str, key: str, value: Any, synchronous: Optional[bool] = None
+    ) -> Any:
         """
         Log a parameter (e.g. model hyperparameter) against the run ID.
 
@@ -760,6 +814,12 @@ class MlflowClient:
         :param value: Parameter value (string, but will be string-ified if not).
                       All backend stores support values up to length 500, but some
                       may support larger values.
+        :param synchronous: If ``False``, the param is queued and logged asynchronously by a
+                            background thread. Defaults to ``False`` if asynchronous logging is
+                            enabled with :py:func:`mlflow.enable_async_logging` or the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable, ``True``
+                            otherwise. Use :py:func:`mlflow.flush_async_logging` to wait for
+                            queued params to be logged.
         :return: the parameter value that is logged.
 
         .. code-block:: python
@@ -803,7 +863,7 @@ class MlflowClient:
             params: {'p': '1'}
             status: FINISHED
         """
-        self._tracking_client.log_param(run_id, key, value)
+        self._tracking_client.log_param(run_id, key, value, synchronous=synchronous)
         return value
 
     def set_experiment_tag(self, experiment_id: str, key: str, value: Any) -> None:
@@ -837,7 +897,9 @@ class MlflowClient:
         """
         self._tracking_client.set_experiment_tag(experiment_id, key, value)
 
-    def set_tag(self, run_id: str, key: str, value: Any) -> None:
+    def set_tag(
+        self, run_id: str, key: str, value: Any, synchronous: Optional[bool] = None
+    ) -> Optional[RunOperations]:
         """
         Set a tag on the run with the specified ID. Value is converted to a string.
 
@@ -849,6 +911,13 @@ class MlflowClient:
         :param value: Tag value (string, but will be string-ified if not).
                       All backend stores will support values up to length 5000, but some
                       may support larger values.
+        :param synchronous: If ``False``, the tag is queued and set asynchronously by a
+                            background thread. Defaults to ``False`` if asynchronous logging is
+                            enabled with :py:func:`mlflow.enable_async_logging` or the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable, ``True``
+                            otherwise.
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` that can be used to wait
+                 for the tag to be set if it is set asynchronously, ``None`` otherwise.
 
         .. code-block:: python
             :caption: Example
@@ -882,7 +951,7 @@ class MlflowClient:
             run_id: 4f226eb5758145e9b28f78514b59a03b
             Tags: {'nlp.framework': 'Spark NLP'}
         """
-        self._tracking_client.set_tag(run_id, key, value)
+        return self._tracking_client.set_tag(run_id, key, value, synchronous=synchronous)
 
     def delete_tag(self, run_id: str, key: str) -> None:
         """
@@ -981,7 +1050,8 @@ class MlflowClient:
         metrics: Sequence[Metric] = (),
         params: Sequence[Param] = (),
         tags: Sequence[RunTag] = (),
-    ) -> None:
+        synchronous: Optional[bool] = None,
+    ) -> Optional[RunOperations]:
         """
         Log multiple metrics, params, and/or tags.
 
@@ -989,9 +1059,16 @@ class MlflowClient:
         :param metrics: If provided, List of Metric(key, value, timestamp) instances.
         :param params: If provided, List of Param(key, value) instances.
         :param tags: If provided, List of RunTag(key, value) instances.
+        :param synchronous: If ``False``, the batch is queued and logged asynchronously by a
+                            background thread, coalesced with the other metrics, params and tags
+                            queued for the run. Defaults to ``False`` if asynchronous logging is
+                            enabled with :py:func:`mlflow.enable_async_logging` or the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable, ``True``
+                            otherwise.
 
         Raises an MlflowException if any errors occur.
-        :return: None
+        :return: A :py:class:`mlflow.utils.async_logging.RunOperations` that can be used to wait
+                 for the batch to be logged if it is logged asynchronously, ``None`` otherwise.
 
         .. code-block:: python
             :caption: Example
@@ -1034,7 +1111,56 @@ class MlflowClient:
             tags: {'t': 't'}
             status: FINISHED
         """
-        self._tracking_client.log_batch(run_id, metrics, params, tags)
+        return self._tracking_client.log_batch(
+            run_id, metrics, params, tags, synchronous=synchronous
+        )
+
+    def log_batches(
+        self,
+        batches: Sequence[Tuple[str, Sequence[Metric], Sequence[Param], Sequence[RunTag]]],
+    ) -> None:
+        """
+        Log multiple metrics, params, and/or tags for multiple runs, like :py:meth:`log_batch`
+        does for each of them, with as few requests as the backend store allows, e.g. a single
+        request for up to 1000 metrics, params, and tags in total to a tracking server.
+
+        :param batches: List of ``(run_id, metrics, params, tags)`` tuples, where ``metrics``,
+                        ``params`` and ``tags`` are lists of Metric, Param and RunTag instances
+                        to log for the run of ``run_id``.
+
+        Raises an MlflowException if any errors occur.
+        :return: None
+
+        .. code-block:: python
+            :caption: Example
+
+            import time
+
+            from mlflow import MlflowClient
+            from mlflow.entities import Metric, Param
+
+            client = MlflowClient()
+            run_ids = [client.create_run("0").info.run_id for _ in range(3)]
+
+            # Log a metric and a param for each run with a single request
+            timestamp = int(time.time() * 1000)
+            client.log_batches(
+                [
+                    (run_id, [Metric("m", i, timestamp, 0)], [Param("p", str(i))], [])
+                    for i, run_id in enumerate(run_ids)
+                ]
+            )
+            for run in client.get_runs(run_ids):
+                print("metrics: {}, params: {}".format(run.data.metrics, run.data.params))
+
+        .. code-block:: text
+            :caption: Output
+
+            metrics: {'m': 0.0}, params: {'p': '0'}
+            metrics: {'m': 1.0}, params: {'p': '1'}
+            metrics: {'m': 2.0}, params: {'p': '2'}
+        """
+        self._tracking_client.log_batches(batches)
 
     @experimental
     def log_inputs(
@@ -1653,37 +1779,43 @@ class MlflowClient:
         # TODO: Add parallelism support here
         def get_artifact_data(run):
             run_id = run.run_id
-            norm_path = posixpath.normpath(artifact_file)
-            artifact_dir = posixpath.dirname(norm_path)
-            artifact_dir = None if artifact_dir == "" else artifact_dir
-            existing_predictions = pd.DataFrame()
-
-            artifacts = [
-                f.path for f in self.list_artifacts(run_id, path=artifact_dir) if not f.is_dir
-            ]
-            if artifact_file in artifacts:
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    downloaded_artifact_path = mlflow.artifacts.download_artifacts(
-                        run_id=run_id, artifact_path=artifact_file, dst_path=tmpdir
+            # The table is downloaded from the artifact URI of the searched run, rather than
+            # fetching the run and listing its artifacts with additional requests
+            artifact_uri = add_databricks_profile_info_to_artifact_uri(
+                run.artifact_uri, self._tracking_client.tracking_uri
+            )
+            artifact_repo = get_artifact_repository(artifact_uri)
+            with tempfile.TemporaryDirectory() as tmpdir:
+                try:
+                    downloaded_artifact_path = artifact_repo.download_artifacts(
+                        artifact_file, dst_path=tmpdir
                     )
-                    existing_predictions = pd.read_json(downloaded_artifact_path, orient="split")
-                    if extra_columns is not None:
-                        for column in extra_columns:
-                            if column in existing_predictions:
-                                column_name = f"{column}_"
-                                _logger.warning(
-                                    f"Column name {column} already exists in the table. "
-                                    "Resolving the conflict, by appending an underscore "
-                                    "to the column name."
-                                )
-                            else:
-                                column_name = column
-                            existing_predictions[column_name] = run[column]
-
-            else:
-                raise MlflowException(
-                    f"Artifact {artifact_file} not found for run {run_id}.", RESOURCE_DOES_NOT_EXIST
-                )
+                except Exception as e:
+                    # Repositories report missing artifacts differently, list the directory of the
+                    # table to find whether the download failed because it doesn't exist
+                    artifact_dir = posixpath.dirname(posixpath.normpath(artifact_file)) or None
+                    if any(
+                        f.path == artifact_file and not f.is_dir
+                        for f in artifact_repo.list_artifacts(artifact_dir)
+                    ):
+                        raise
+                    raise MlflowException(
+                        f"Artifact {artifact_file} not found for run {run_id}.",
+                        RESOURCE_DOES_NOT_EXIST,
+                    ) from e
+                existing_predictions = pd.read_json(downloaded_artifact_path, orient="split")
+            if extra_columns is not None:
+                for column in extra_columns:
+                    if column in existing_predictions:
+                        column_name = f"{column}_"
+                        _logger.warning(
+                            f"Column name {column} already exists in the table. "
+                            "Resolving the conflict, by appending an underscore "
+                            "to the column name."
+                        )
+                    else:
+                        column_name = column
+                    existing_predictions[column_name] = run[column]
 
             return existing_predictions
 
@@ -34,7 +34,7 @@ from mlflow.tracking import artifact_utils, _get_store
 from mlflow.tracking.context import registry as context_registry
 from mlflow.tracking.default_experiment import registry as default_experiment_registry
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
-from mlflow.utils import get_results_from_paginated_fn
+from mlflow.utils import async_logging, get_results_from_paginated_fn
 from mlflow.utils.annotations import experimental
 from mlflow.utils.autologging_utils import (
     is_testing,
@@ -418,6 +418,44 @@ def _safe_end_run():
 atexit.register(_safe_end_run)
 
 
+@experimental
+def enable_async_logging(enable: bool = True) -> None:
+    """
+    Enable or disable asynchronous logging for the current process. When enabled, the metrics,
+    params and tags logged with the fluent APIs (e.g. :py:func:`mlflow.log_metric`) and
+    :py:class:`MlflowClient <mlflow.client.MlflowClient>` are queued and logged in batches by a
+    background thread, so that logging calls don't wait for the tracking server. Queued data is
+    logged before a run is ended and before the process exits. Logging errors are reported as
+    warnings, or raised by ``RunOperations.await_completion()`` on the object returned by
+    ``MlflowClient`` logging APIs.
+
+    This overrides the ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable.
+
+    :param enable: Whether to enable asynchronous logging.
+
+    .. test-code-block:: python
+        :caption: Example
+
+        import mlflow
+
+        mlflow.enable_async_logging()
+        with mlflow.start_run():
+            for step in range(100):
+                mlflow.log_metric("loss", 1 / (step + 1), step=step)
+        mlflow.enable_async_logging(False)
+    """
+    async_logging.enable_async_logging(enable)
+
+
+@experimental
+def flush_async_logging() -> None:
+    """
+    Block until all the metrics, params and tags queued for asynchronous logging by the current
+    process have been logged.
+    """
+    async_logging.get_async_logging_queue().flush()
+
+
 def active_run() -> Optional[ActiveRun]:
     """Get the currently active ``Run``, or None if no such run exists.
 
@@ -1,6 +1,7 @@
 import entrypoints
 import warnings
 import logging
+import time
 
 from mlflow.tracking.request_header.databricks_request_header_provider import (
     DatabricksRequestHeaderProvider,
@@ -8,9 +9,19 @@ from mlflow.tracking.request_header.databricks_request_header_provider import (
 from mlflow.tracking.request_header.default_request_header_provider import (
     DefaultRequestHeaderProvider,
 )
+from mlflow.environment_variables import MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL
 
 _logger = logging.getLogger(__name__)
 
+# The registry of the providers that the cached request headers were resolved from, the monotonic
+# time at which they expire and the cached request headers
+_cached_request_headers = None
+
+
+def _invalidate_request_headers_cache():
+    global _cached_request_headers
+    _cached_request_headers = None
+
 
 class RequestHeaderProviderRegistry:
     def __init__(self):
@@ -18,6 +29,7 @@ class RequestHeaderProviderRegistry:
 
     def register(self, request_header_provider):
         self._registry.append(request_header_provider())
+        _invalidate_request_headers_cache()
 
     def register_entrypoints(self):
         """Register tracking stores provided by other packages"""
@@ -43,19 +55,7 @@ _request_header_provider_registry.register(DefaultRequestHeaderProvider)
 _request_header_provider_registry.register_entrypoints()
 
 
-def resolve_request_headers(request_headers=None):
-    """Generate a set of request headers from registered providers. Request headers are resolved in
-    the order that providers are registered. Argument headers are applied last.
-
-    This function iterates through all request header providers in the registry. Additional context
-    providers can be registered as described in
-    :py:class:`mlflow.tracking.request_header.RequestHeaderProvider`.
-
-    :param tags: A dictionary of request headers to override. If specified, headers passed in this
-        argument will override those inferred from the context.
-    :return: A dictionary of resolved headers.
-    """
-
+def _resolve_provider_request_headers():
     all_request_headers = {}
     for provider in _request_header_provider_registry:
         try:
@@ -69,6 +69,43 @@ def resolve_request_headers(request_headers=None):
                     )
         except Exception as e:
             _logger.warning("Encountered unexpected error during resolving request headers: %s", e)
+    return all_request_headers
+
+
+def resolve_request_headers(request_headers=None):
+    """Generate a set of request headers from registered providers. Request headers are resolved in
+    the order that providers are registered. Argument headers are applied last.
+
+    This function iterates through all request header providers in the registry. Additional context
+    providers can be registered as described in
+    :py:class:`mlflow.tracking.request_header.RequestHeaderProvider`. The headers are resolved from
+    the providers on every call, unless ``MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL`` is set, in which
+    case they are cached for that many seconds, or until another provider is registered.
+
+    :param tags: A dictionary of request headers to override. If specified, headers passed in this
+        argument will override those inferred from the context.
+    :return: A dictionary of resolved headers.
+    """
+    global _cached_request_headers
+
+    cache_ttl = MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL.get()
+    now = time.monotonic()
+    cached = _cached_request_headers
+    if (
+        cache_ttl > 0
+        and cached is not None
+        and cached[0] is _request_header_provider_registry
+        and now < cached[1]
+    ):
+        all_request_headers = dict(cached[2])
+    else:
+        all_request_headers = _resolve_provider_request_headers()
+        if cache_ttl > 0:
+            _cached_request_headers = (
+                _request_header_provider_registry,
+                now + cache_ttl,
+                dict(all_request_headers),
+            )
 
     if request_headers is not None:
         all_request_headers.update(request_headers)
@@ -0,0 +1,236 @@
+"""
+Asynchronous logging of run metrics, params and tags.
+
+When asynchronous logging is enabled, the metrics, params and tags logged with ``MlflowClient``
+and the fluent APIs are put on a process-wide queue and the logging calls return immediately.
+A background thread drains the queue, coalesces the operations queued for the same run into as
+few ``log_batch`` calls as possible and logs them. The queue is bounded: logging calls block
+while it is full, which prevents a fast producer from buffering an unbounded amount of data.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import Future
+
+from mlflow.environment_variables import (
+    MLFLOW_ASYNC_LOGGING_MAX_QUEUE_SIZE,
+    MLFLOW_ENABLE_ASYNC_LOGGING,
+)
+from mlflow.exceptions import MlflowException
+
+_logger = logging.getLogger(__name__)
+
+# Maximum number of queued operations coalesced by the background thread at once
+_MAX_OPERATIONS_PER_FLUSH = 1000
+
+_PendingLogBatch = namedtuple(
+    "_PendingLogBatch",
+    ["log_batch_func", "store_key", "run_id", "metrics", "params", "tags", "future"],
+)
+
+# Overrides the `MLFLOW_ENABLE_ASYNC_LOGGING` environment variable when set
+_async_logging_enabled = None
+
+
+class RunOperations:
+    """
+    Represents a collection of operations on one or more MLflow Runs, such as run creation
+    or metric logging.
+    """
+
+    def __init__(self, operation_futures):
+        self._operation_futures = operation_futures
+
+    def await_completion(self):
+        """
+        Blocks on completion of the MLflow Run operations.
+        """
+        failed_operations = []
+        for future in self._operation_futures:
+            try:
+                future.result()
+            except Exception as e:
+                failed_operations.append(e)
+
+        if len(failed_operations) > 0:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while performing one or more logging"
+                    f" operations: {failed_operations}"
+                )
+            )
+
+
+def enable_async_logging(enable=True):
+    """
+    Enables or disables asynchronous logging for the current process, overriding the
+    ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable.
+    """
+    global _async_logging_enabled
+    _async_logging_enabled = enable
+
+
+def is_async_logging_enabled():
+    if _async_logging_enabled is None:
+        return MLFLOW_ENABLE_ASYNC_LOGGING.get()
+    return _async_logging_enabled
+
+
+def should_log_asynchronously(synchronous):
+    """
+    :param synchronous: The ``synchronous`` argument of a logging call. ``None`` defers to the
+                        process-wide asynchronous logging mode.
+    """
+    if synchronous is None:
+        return is_async_logging_enabled()
+    return not synchronous
+
+
+class _CoalescedLogBatch:
+    """
+    Queued operations for a single run that are logged with the same ``log_batch`` call.
+    """
+
+    def __init__(self, log_batch_func, run_id):
+        self.log_batch_func = log_batch_func
+        self.run_id = run_id
+        self.metrics = []
+        self.params = []
+        self.param_keys = set()
+        # Only the latest value of a tag is logged, as if the tags were set one at a time
+        self.tags = {}
+        self.futures = []
+
+    def can_add(self, operation):
+        # Stores reject batches containing the same param key more than once
+        return not any(param.key in self.param_keys for param in operation.params)
+
+    def add(self, operation):
+        self.metrics.extend(operation.metrics)
+        self.params.extend(operation.params)
+        self.param_keys.update(param.key for param in operation.params)
+        for tag in operation.tags:
+            self.tags[tag.key] = tag
+        self.futures.append(operation.future)
+
+    def log(self):
+        try:
+            self.log_batch_func(
+                run_id=self.run_id,
+                metrics=self.metrics,
+                params=self.params,
+                tags=list(self.tags.values()),
+            )
+        except Exception as e:
+            _logger.warning(
+                "Failed to asynchronously log %d metrics, %d params and %d tags to the run"
+                " with ID %s: %s",
+                len(self.metrics),
+                len(self.params),
+                len(self.tags),
+                self.run_id,
+                e,
+            )
+            for future in self.futures:
+                future.set_exception(e)
+        else:
+            for future in self.futures:
+                future.set_result(None)
+
+
+def _coalesce(operations):
+    """
+    Groups queued ``_PendingLogBatch`` operations by store and run, preserving their order.
+    """
+    batches_by_run = {}
+    for operation in operations:
+        batches = batches_by_run.setdefault((operation.store_key, operation.run_id), [])
+        if not batches or not batches[-1].can_add(operation):
+            batches.append(_CoalescedLogBatch(operation.log_batch_func, operation.run_id))
+        batches[-1].add(operation)
+    return [batch for batches in batches_by_run.values() for batch in batches]
+
+
+class AsyncLoggingQueue:
+    """
+    Queue of pending ``log_batch`` operations, logged by a background thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = None
+        self._pid = None
+
+    def _get_queue(self):
+        with self._lock:
+            # Threads don't survive a fork, so a child process starts its own worker thread
+            if self._queue is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=MLFLOW_ASYNC_LOGGING_MAX_QUEUE_SIZE.get())
+                self._pid = os.getpid()
+                threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="MlflowAsyncLogging",
+                    daemon=True,
+                ).start()
+            return self._queue
+
+    @staticmethod
+    def _run(pending_queue):
+        while True:
+            operations = [pending_queue.get()]
+            while len(operations) < _MAX_OPERATIONS_PER_FLUSH:
+                try:
+                    operations.append(pending_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for batch in _coalesce(operations):
+                    batch.log()
+            finally:
+                for _ in operations:
+                    pending_queue.task_done()
+
+    def log_batch(self, log_batch_func, store_key, run_id, metrics=(), params=(), tags=()):
+        """
+        Queues metrics, params and tags to be logged to a run. Blocks while the queue is full.
+
+        :param log_batch_func: Function logging a batch synchronously, called with the ``run_id``,
+                               ``metrics``, ``params`` and ``tags`` keyword arguments.
+        :param store_key: Identifies the tracking store the batch is logged to. Only the batches
+                          with the same ``store_key`` and ``run_id`` are coalesced.
+        :return: A :py:class:`RunOperations` that can be used to wait for the batch to be logged.
+        """
+        future = Future()
+        self._get_queue().put(
+            _PendingLogBatch(
+                log_batch_func=log_batch_func,
+                store_key=store_key,
+                run_id=run_id,
+                metrics=list(metrics),
+                params=list(params),
+                tags=list(tags),
+                future=future,
+            )
+        )
+        return RunOperations([future])
+
+    def flush(self):
+        """
+        Blocks until all the operations queued by the current process have been logged.
+        """
+        with self._lock:
+            pending_queue = self._queue if self._pid == os.getpid() else None
+        if pending_queue is not None:
+            pending_queue.join()
+
+
+_ASYNC_LOGGING_QUEUE = AsyncLoggingQueue()
+atexit.register(_ASYNC_LOGGING_QUEUE.flush)
+
+
+def get_async_logging_queue():
+    return _ASYNC_LOGGING_QUEUE
@@ -20,6 +20,7 @@ from mlflow.entities.dataset_input import DatasetInput
 from mlflow.exceptions import MlflowException
 from mlflow.tracking.client import MlflowClient
 from mlflow.utils import chunk_list, _truncate_dict
+from mlflow.utils.async_logging import RunOperations
 from mlflow.utils.validation import (
     MAX_ENTITIES_PER_BATCH,
     MAX_ENTITY_KEY_LENGTH,
@@ -47,35 +48,6 @@ class PendingRunId:
     """
 
 
-class RunOperations:
-    """
-    Represents a collection of operations on one or more MLflow Runs, such as run creation
-    or metric logging.
-    """
-
-    def __init__(self, operation_futures):
-        self._operation_futures = operation_futures
-
-    def await_completion(self):
-        """
-        Blocks on completion of the MLflow Run operations.
-        """
-        failed_operations = []
-        for future in self._operation_futures:
-            try:
-                future.result()
-            except Exception as e:
-                failed_operations.append(e)
-
-        if len(failed_operations) > 0:
-            raise MlflowException(
-                message=(
-                    "The following failures occurred while performing one or more logging"
-                    f" operations: {failed_operations}"
-                )
-            )
-
-
 # Define a threadpool for use across `MlflowAutologgingQueueingClient` instances to ensure that
 # `MlflowAutologgingQueueingClient` instances can be pickled (ThreadPoolExecutor objects are not
 # pickleable and therefore cannot be assigned as instance attributes).
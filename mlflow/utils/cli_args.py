@@ -179,6 +179,18 @@ ENABLE_MLSERVER = click.option(
     ),
 )
 
+ENABLE_ASGI = click.option(
+    "--enable-asgi",
+    is_flag=True,
+    default=False,
+    help=(
+        "Serve the model with the ASGI scoring server, which runs on uvicorn and predicts "
+        "concurrent requests in a thread pool, so that one worker process with one copy of the "
+        "model can serve many concurrent connections. Requires fastapi and uvicorn in the "
+        "model environment."
+    ),
+)
+
 ARTIFACTS_DESTINATION = click.option(
     "--artifacts-destination",
     envvar="MLFLOW_ARTIFACTS_DESTINATION",
@@ -24,6 +24,7 @@ from urllib.request import pathname2url
 
 import atexit
 
+import requests
 import yaml
 
 try:
@@ -36,16 +37,17 @@ from mlflow.exceptions import MissingConfigException
 from mlflow.protos.databricks_artifacts_pb2 import ArtifactCredentialType
 from mlflow.utils.rest_utils import augmented_raise_for_status
 from mlflow.utils.request_utils import cloud_storage_http_request
-from mlflow.utils.process import cache_return_value_per_process, _exec_cmd
+from mlflow.utils.process import cache_return_value_per_process
 from mlflow.utils import merge_dicts
 from mlflow.utils.databricks_utils import _get_dbutils
 from mlflow.utils.os import is_windows
-from mlflow.utils import download_cloud_file_chunk
 from mlflow.utils.request_utils import download_chunk
 
 
 ENCODING = "utf-8"
 MAX_PARALLEL_DOWNLOAD_WORKERS = os.cpu_count() * 2
+# Maximum number of times a chunk is downloaded if the connection fails while it's streamed
+_MAX_CHUNK_DOWNLOAD_ATTEMPTS = 3
 
 
 def is_directory(name):
@@ -578,6 +580,40 @@ def yield_file_in_chunks(file, chunk_size=100000000):
                 break
 
 
+def yield_file_range_in_chunks(file, range_start=0, range_end=None, chunk_size=1024 * 1024):
+    """
+    Generator to chunk-ify a range of bytes of the inputted file based on the chunk-size.
+
+    :param file: Path to the file.
+    :param range_start: Offset of the first byte to read.
+    :param range_end: Offset of the last byte to read, inclusive. Defaults to the end of the file.
+    :param chunk_size: Maximum size of the yielded chunks.
+    """
+    with open(file, "rb") as f:
+        yield from yield_stream_range_in_chunks(f, range_start, range_end, chunk_size)
+
+
+def yield_stream_range_in_chunks(stream, range_start=0, range_end=None, chunk_size=1024 * 1024):
+    """
+    Generator to chunk-ify a range of bytes of the inputted seekable binary stream based on the
+    chunk-size.
+
+    :param stream: A seekable binary file-like object.
+    :param range_start: Offset of the first byte to read.
+    :param range_end: Offset of the last byte to read, inclusive. Defaults to the end of the stream.
+    :param chunk_size: Maximum size of the yielded chunks.
+    """
+    stream.seek(range_start)
+    remaining = None if range_end is None else range_end - range_start + 1
+    while remaining is None or remaining > 0:
+        chunk = stream.read(chunk_size if remaining is None else min(chunk_size, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        yield chunk
+
+
 def download_file_using_http_uri(http_uri, download_path, chunk_size=100000000, headers=None):
     """
     Downloads a file specified using the `http_uri` to a local `download_path`. This function
@@ -597,6 +633,20 @@ def download_file_using_http_uri(http_uri, download_path, chunk_size=100000000,
                 output_file.write(chunk)
 
 
+def _download_chunk_with_retries(range_start, range_end, headers, download_path, http_uri):
+    """
+    Downloads a chunk with :py:func:`download_chunk <mlflow.utils.request_utils.download_chunk>`,
+    retrying it if the connection fails while its content is streamed. Failed requests are
+    already retried by the HTTP session.
+    """
+    for attempt in range(_MAX_CHUNK_DOWNLOAD_ATTEMPTS):
+        try:
+            return download_chunk(range_start, range_end, headers, download_path, http_uri)
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+            if attempt == _MAX_CHUNK_DOWNLOAD_ATTEMPTS - 1:
+                raise
+
+
 def parallelized_download_file_using_http_uri(
     thread_pool_executor,
     http_uri,
@@ -604,84 +654,54 @@ def parallelized_download_file_using_http_uri(
     file_size,
     uri_type,
     chunk_size,
-    env,
     headers=None,
 ):
     """
     Downloads a file specified using the `http_uri` to a local `download_path`. This function
     sends multiple requests in parallel each specifying its own desired byte range as a header,
-    then reconstructs the file from the downloaded chunks. This allows for downloads of large files
+    and streams each chunk into the file at its offset. This allows for downloads of large files
     without OOM risk.
 
     Note : This function is meant to download files using presigned urls from various cloud
             providers.
     Returns a dict of chunk index : exception, if one was thrown for that index.
     """
+    headers = headers or {}
 
     def run_download(range_start, range_end):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_file = os.path.join(tmpdir, "error_messages.txt")
-            download_proc = _exec_cmd(
-                cmd=[
-                    sys.executable,
-                    download_cloud_file_chunk.__file__,
-                    "--range-start",
-                    range_start,
-                    "--range-end",
-                    range_end,
-                    "--headers",
-                    json.dumps(headers or {}),
-                    "--download-path",
-                    download_path,
-                    "--http-uri",
-                    http_uri,
-                    "--temp-file",
-                    temp_file,
-                ],
-                throw_on_error=True,
-                synchronous=False,
-                capture_output=True,
-                stream_output=False,
-                env=env,
-            )
-            _, stderr = download_proc.communicate()
-            if download_proc.returncode != 0:
-                if os.path.exists(temp_file):
-                    with open(temp_file) as f:
-                        file_contents = f.read()
-                        if file_contents:
-                            return json.loads(file_contents)
-                        else:
-                            raise Exception(
-                                "Error from download_cloud_file_chunk not captured, "
-                                f"return code {download_proc.returncode}, stderr {stderr}"
-                            )
+        try:
+            _download_chunk_with_retries(range_start, range_end, headers, download_path, http_uri)
+        except requests.HTTPError as e:
+            return {
+                "error_status_code": e.response.status_code,
+                "error_text": str(e),
+            }
 
     num_requests = int(math.ceil(file_size / float(chunk_size)))
-    # Create file if it doesn't exist or erase the contents if it does. We should do this here
-    # before sending to the workers so they can each individually seek to their respective positions
-    # and write chunks without overwriting.
+    # Create file if it doesn't exist or erase the contents if it does. The workers then each
+    # write their chunk at its offset without overwriting the other chunks.
     open(download_path, "w").close()
     starting_index = 0
     if uri_type == ArtifactCredentialType.GCP_SIGNED_URL or uri_type is None:
         # GCP files could be transcoded, in which case the range header is ignored.
         # Test if this is the case by downloading one chunk and seeing if it's larger than the
         # requested size. If yes, let that be the file; if not, continue downloading more chunks.
-        download_chunk(
+        downloaded_size = _download_chunk_with_retries(
             range_start=0,
             range_end=chunk_size - 1,
             headers=headers,
             download_path=download_path,
             http_uri=http_uri,
         )
-        downloaded_size = os.path.getsize(download_path)
         # If downloaded size was equal to the chunk size it would have been downloaded serially,
-        # so we don't need to consider this here
-        if downloaded_size > chunk_size:
+        # so we don't need to consider this here. If it's smaller, the whole file was downloaded.
+        if downloaded_size != chunk_size:
             return {}
         else:
             starting_index = 1
 
+    # Preallocate the file so that the chunks can be written in any order
+    os.truncate(download_path, file_size)
     futures = {}
     for i in range(starting_index, num_requests):
         range_start = i * chunk_size
@@ -239,7 +239,7 @@ def cast_df_types_according_to_schema(pdf, schema):
                     # The conversion will be done in `_enforce_schema` while
                     # `PyFuncModel.predict` being called.
                     pass
-                else:
+                elif pdf[col_name].dtype != col_type:
                     pdf[col_name] = pdf[col_name].astype(col_type, copy=False)
             except Exception as ex:
                 raise MlflowFailedTypeConversion(col_name, col_type, ex)
@@ -251,6 +251,56 @@ class MlflowBadScoringInputException(MlflowException):
         super().__init__(message, error_code=BAD_REQUEST)
 
 
+def _dataframe_from_split_columns(decoded_input, schema):
+    """
+    Builds the DataFrame of a 'split' oriented payload column by column, converting the numeric
+    columns to their type in the schema straight from the payload. This skips the row-wise object
+    array that pandas builds from a list of rows, which dominates the parsing time of wide
+    payloads.
+
+    :return: The DataFrame, or ``None`` if the payload isn't eligible or can't be converted, in
+             which case it must be parsed by pandas.
+    """
+    import numpy as np
+    import pandas as pd
+    from mlflow.types.schema import DataType
+
+    columns = decoded_input.get("columns")
+    data = decoded_input["data"]
+    if (
+        not schema.has_input_names()
+        or schema.is_tensor_spec()
+        or not isinstance(columns, list)
+        or len(set(columns)) != len(columns)
+        or not isinstance(data, list)
+        or len(data) == 0
+        or set(map(type, data)) != {list}
+        or set(map(len, data)) != {len(columns)}
+    ):
+        return None
+
+    numeric_types = {
+        DataType.boolean,
+        DataType.integer,
+        DataType.long,
+        DataType.float,
+        DataType.double,
+    }
+    column_types = dict(zip(schema.input_names(), schema.input_types()))
+    column_values = {}
+    try:
+        for name, values in zip(columns, zip(*data)):
+            column_type = column_types.get(name)
+            if column_type in numeric_types:
+                values = np.array(values, dtype=column_type.to_numpy())
+                if values.ndim != 1:
+                    return None
+            column_values[name] = values
+        return pd.DataFrame(column_values, index=decoded_input.get("index"))
+    except Exception:
+        return None
+
+
 def dataframe_from_parsed_json(decoded_input, pandas_orient, schema=None):
     """
     Convert parsed json into pandas.DataFrame. If schema is provided this methods will attempt to
@@ -296,12 +346,14 @@ def dataframe_from_parsed_json(decoded_input, pandas_orient, schema=None):
                 f"Dataframe split format must have 'data' field and optionally 'columns' "
                 f"and 'index' fields. Got {keys}.'"
             )
+        pdf = _dataframe_from_split_columns(decoded_input, schema) if schema is not None else None
         try:
-            pdf = pd.DataFrame(
-                index=decoded_input.get("index"),
-                columns=decoded_input.get("columns"),
-                data=decoded_input["data"],
-            )
+            if pdf is None:
+                pdf = pd.DataFrame(
+                    index=decoded_input.get("index"),
+                    columns=decoded_input.get("columns"),
+                    data=decoded_input["data"],
+                )
         except Exception as ex:
             raise MlflowBadScoringInputException(
                 f"Provided dataframe_split field is not a valid dataframe representation in "
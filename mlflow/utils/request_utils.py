@@ -1,6 +1,5 @@
 # DO NO IMPORT MLFLOW IN THIS FILE.
-# This file is imported by download_cloud_file_chunk.py.
-# Importing mlflow is time-consuming and we want to avoid that in artifact download subprocesses.
+# This module only depends on requests and urllib3 so that it can be imported cheaply.
 import os
 import requests
 import urllib3
@@ -39,18 +38,48 @@ def augmented_raise_for_status(response):
             raise e
 
 
+# Size of the buffers in which a downloaded chunk is streamed to its file
+_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+
+def _write_at_offset(fd, data, offset):
+    if hasattr(os, "pwrite"):
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+
 def download_chunk(range_start, range_end, headers, download_path, http_uri):
+    """
+    Downloads the given byte range of the file at ``http_uri`` and writes it at the same offset
+    in the file at ``download_path``, which must exist. The response is streamed to the file.
+
+    :return: The number of bytes written, which is larger than the requested range if the server
+             ignored the ``Range`` header.
+    """
     combined_headers = {**headers, "Range": f"bytes={range_start}-{range_end}"}
 
     with cloud_storage_http_request(
-        "get", http_uri, stream=False, headers=combined_headers
+        "get", http_uri, stream=True, headers=combined_headers
     ) as response:
-        # File will have been created upstream. Use r+b to ensure chunks
-        # don't overwrite the entire file.
         augmented_raise_for_status(response)
-        with open(download_path, "r+b") as f:
-            f.seek(range_start)
-            f.write(response.content)
+        # Don't truncate the file, other chunks may be written to it concurrently
+        fd = os.open(download_path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        try:
+            offset = range_start
+            for data in response.iter_content(chunk_size=_DOWNLOAD_BUFFER_SIZE):
+                _write_at_offset(fd, data, offset)
+                offset += len(data)
+        finally:
+            os.close(fd)
+    return offset - range_start
 
 
 @lru_cache(maxsize=64)
@@ -58,6 +87,8 @@ def _cached_get_request_session(
     max_retries,
     backoff_factor,
     retry_codes,
+    pool_connections,
+    pool_maxsize,
     # To create a new Session object for each process, we use the process id as the cache key.
     # This is to avoid sharing the same Session object across processes, which can lead to issues
     # such as https://stackoverflow.com/q/3724900.
@@ -84,7 +115,10 @@ def _cached_get_request_session(
         retry_kwargs["method_whitelist"] = None
 
     retry = Retry(**retry_kwargs)
-    adapter = HTTPAdapter(max_retries=retry)
+    # The connections of the pool are kept alive and reused by the requests of all the threads
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
     session = requests.Session()
     session.mount("https://", adapter)
     session.mount("http://", adapter)
@@ -93,7 +127,8 @@ def _cached_get_request_session(
 
 def _get_request_session(max_retries, backoff_factor, retry_codes):
     """
-    Returns a `Requests.Session` object for making an HTTP request.
+    Returns a `Requests.Session` object for making an HTTP request. The session is shared by all
+    the requests of the process with the same retry policy, reusing the connections of its pool.
 
     :param max_retries: Maximum total number of retries.
     :param backoff_factor: a time factor for exponential backoff. e.g. value 5 means the HTTP
@@ -106,6 +141,10 @@ def _get_request_session(max_retries, backoff_factor, retry_codes):
         max_retries,
         backoff_factor,
         retry_codes,
+        # See `MLFLOW_HTTP_POOL_CONNECTIONS` and `MLFLOW_HTTP_POOL_MAXSIZE` in
+        # `mlflow.environment_variables`, which can't be imported here
+        pool_connections=int(os.environ.get("MLFLOW_HTTP_POOL_CONNECTIONS", 10)),
+        pool_maxsize=int(os.environ.get("MLFLOW_HTTP_POOL_MAXSIZE", 10)),
         _pid=os.getpid(),
     )
 
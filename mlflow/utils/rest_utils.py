@@ -90,7 +90,7 @@ def http_request(
     cleaned_hostname = strip_suffix(hostname, "/")
     url = f"{cleaned_hostname}{endpoint}"
     try:
-        return _get_http_response_with_retries(
+        response = _get_http_response_with_retries(
             method,
             url,
             max_retries,
@@ -112,6 +112,12 @@ def http_request(
     except Exception as e:
         raise MlflowException(f"API request to {url} failed with exception {e}")
 
+    if retries := getattr(getattr(response, "raw", None), "retries", None):
+        from mlflow.store.artifact.instrumentation import record_retries
+
+        record_retries(len(retries.history))
+    return response
+
 
 def _can_parse_as_json_object(string):
     try:
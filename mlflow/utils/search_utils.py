@@ -1,4 +1,5 @@
 import base64
+import hashlib
 import json
 import operator
 import re
@@ -606,6 +607,29 @@ class SearchUtils:
 
         return [run for run in runs if run_matches(run)]
 
+    @classmethod
+    def get_keys_referenced_by_search(cls, filter_string, order_by_list):
+        """
+        Returns a dictionary mapping the ``metric``, ``parameter``, ``tag`` and ``dataset``
+        entity types to the set of keys of that type referenced by a search filter and a list of
+        ``order_by`` clauses. A run only needs to contain the data for these keys to be evaluated
+        by :py:func:`filter` and :py:func:`sort`, which allows stores to load runs partially.
+        """
+        keys = {
+            cls._METRIC_IDENTIFIER: set(),
+            cls._PARAM_IDENTIFIER: set(),
+            cls._TAG_IDENTIFIER: set(),
+            cls._DATASET_IDENTIFIER: set(),
+        }
+        referenced = [(f["type"], f["key"]) for f in cls.parse_search_filter(filter_string)]
+        for order_by_clause in order_by_list or []:
+            key_type, key, _ = cls.parse_order_by_for_search_runs(order_by_clause)
+            referenced.append((key_type, key))
+        for key_type, key in referenced:
+            if key_type in keys:
+                keys[key_type].add(cls.translate_key_alias(key))
+        return keys
+
     @classmethod
     def _validate_order_by_and_generate_token(cls, order_by):
         try:
@@ -740,13 +764,7 @@ class SearchUtils:
         return runs
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -766,6 +784,23 @@ class SearchUtils:
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+        return parsed_token
+
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
+
+        parsed_token = cls._decode_page_token(page_token)
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -787,6 +822,55 @@ class SearchUtils:
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
 
+    @classmethod
+    def _get_order_by_fingerprint(cls, order_by):
+        return hashlib.sha256(json.dumps(list(order_by or [])).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def parse_keyset_from_page_token(cls, page_token, order_by):
+        """
+        Returns the sort key of the last run on the previous page, as recorded by
+        :py:func:`create_keyset_page_token`, or ``None`` if the page token does not carry one
+        (e.g. it is an offset-only token). Raises if the page token was created for a different
+        ``order_by``, whose sort key can't be compared with the current one.
+        """
+        if not page_token:
+            return None
+
+        parsed_token = cls._decode_page_token(page_token)
+        keyset = parsed_token.get("keyset")
+        if keyset is None:
+            return None
+        if not isinstance(keyset, list):
+            raise MlflowException(
+                "Invalid page token, keyset value=%s" % keyset,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        if parsed_token.get("order_by") != cls._get_order_by_fingerprint(order_by):
+            raise MlflowException(
+                "Invalid page token, it was created for a different order_by than %s" % order_by,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return keyset
+
+    @classmethod
+    def create_keyset_page_token(cls, offset, keyset, order_by):
+        """
+        Creates a page token that records the sort key (``keyset``) of the last run on the
+        current page in addition to the offset. Stores that support keyset pagination resume from
+        the sort key; the offset is kept so that the token stays valid for offset-based readers.
+        A fingerprint of ``order_by`` is recorded to reject the token for another ``order_by``.
+        """
+        return base64.b64encode(
+            json.dumps(
+                {
+                    "offset": offset,
+                    "keyset": keyset,
+                    "order_by": cls._get_order_by_fingerprint(order_by),
+                }
+            ).encode("utf-8")
+        )
+
     @classmethod
     def paginate(cls, runs, page_token, max_results):
         """Paginates a set of runs based on an offset encoded into the page_token and a max
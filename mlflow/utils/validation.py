@@ -46,6 +46,7 @@ MAX_PARAMS_TAGS_PER_BATCH = 100
 MAX_METRICS_PER_BATCH = 1000
 MAX_DATASETS_PER_BATCH = 1000
 MAX_ENTITIES_PER_BATCH = 1000
+MAX_RUNS_PER_BATCH = 1000
 MAX_BATCH_LOG_REQUEST_SIZE = int(1e6)
 MAX_PARAM_VAL_LENGTH = 500
 MAX_TAG_VAL_LENGTH = 5000
@@ -230,6 +231,18 @@ def _validate_param_keys_unique(params):
         )
 
 
+def _validate_batches_param_keys_unique(batches):
+    """
+    Ensures that duplicate param keys are not present for any run across the batches of a
+    `log_batches()` request
+    """
+    params_by_run_id = {}
+    for run_id, _, params, _ in batches:
+        params_by_run_id.setdefault(run_id, []).extend(params)
+    for params in params_by_run_id.values():
+        _validate_param_keys_unique(params)
+
+
 def _validate_param_name(name):
     """Check that `name` is a valid parameter name and raise an exception if it isn't."""
     if name is None:
@@ -313,6 +326,31 @@ def _validate_batch_log_limits(metrics, params, tags):
     )
 
 
+def _validate_batches_log_limits(batches):
+    """
+    Validate that the provided batches of a multi-run batched logging request are within expected
+    limits.
+    """
+    _validate_batch_limit(entity_name="batches", limit=MAX_RUNS_PER_BATCH, length=len(batches))
+    for _, metrics, params, tags in batches:
+        _validate_batch_log_limits(metrics, params, tags)
+    total_length = sum(
+        len(metrics) + len(params) + len(tags) for _, metrics, params, tags in batches
+    )
+    _validate_batch_limit(
+        entity_name="metrics, params, and tags", limit=MAX_ENTITIES_PER_BATCH, length=total_length
+    )
+
+
+def _validate_get_runs_limit(run_ids):
+    if len(run_ids) > MAX_RUNS_PER_BATCH:
+        raise MlflowException(
+            f"A request can get at most {MAX_RUNS_PER_BATCH} runs. Got {len(run_ids)} run IDs."
+            " Please split up the run IDs across multiple requests and try again.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
 def _validate_batch_log_data(metrics, params, tags):
     for metric in metrics:
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
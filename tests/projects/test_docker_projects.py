@@ -198,6 +198,23 @@ def test_docker_mount_local_artifact_uri(
     assert (docker_volume_expected in " ".join(docker_command)) == should_mount
 
 
+@pytest.mark.parametrize(
+    "env_var", ["MLFLOW_ARTIFACT_COMPRESSION", "MLFLOW_ARTIFACT_BLOB_STORE_URI"]
+)
+def test_docker_mount_local_artifact_uri_of_wrapped_repository(env_var, monkeypatch, tmp_path):
+    monkeypatch.setenv(
+        env_var, "gzip" if env_var == "MLFLOW_ARTIFACT_COMPRESSION" else str(tmp_path)
+    )
+    active_run = mock.MagicMock()
+    active_run.info.artifact_uri = "/tmp/mlruns/artifacts"
+    image = mock.MagicMock()
+    image.tags = ["image:tag"]
+
+    docker_command = _get_docker_command(image, active_run)
+
+    assert "-v /tmp/mlruns/artifacts:/tmp/mlruns/artifacts" in " ".join(docker_command)
+
+
 @mock.patch("databricks_cli.configure.provider.ProfileConfigProvider")
 def test_docker_databricks_tracking_cmd_and_envs(ProfileConfigProvider):
     mock_provider = mock.MagicMock()
@@ -567,6 +567,28 @@ def test_get_jsonnable_obj():
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
 
 
+@pytest.mark.parametrize("use_orjson", ["false", "true"])
+def test_parse_and_encode_json_with_orjson(monkeypatch, use_orjson):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_USE_ORJSON", use_orjson)
+    schema = Schema([ColSpec("double", "a"), ColSpec("string", "b")])
+    # NaN isn't valid JSON and is parsed by the json module when orjson rejects the payload
+    for a, expected in [("1.5", [1.5, 2.0]), ("NaN", [np.nan, 2.0])]:
+        payload = (
+            f'{{"dataframe_split": {{"columns": ["a", "b"], "data": [[{a}, "x"], [2, "y"]]}}}}'
+        )
+        parsed = pyfunc_scoring_server.infer_and_parse_json_input(payload, schema)
+        np.testing.assert_array_equal(parsed["a"], expected)
+        assert parsed["b"].tolist() == ["x", "y"]
+
+    predictions = pd.DataFrame({"a": np.array([1.5, 2.5]), "b": np.array([1, 2], dtype=np.int32)})
+    output = StringIO()
+    pyfunc_scoring_server.predictions_to_json(predictions, output, metadata={"m": np.int64(1)})
+    assert json.loads(output.getvalue()) == {
+        "predictions": [{"a": 1.5, "b": 1}, {"a": 2.5, "b": 2}],
+        "m": 1,
+    }
+
+
 def test_parse_json_input_including_path():
     class TestModel(PythonModel):
         def predict(self, context, model_input):
@@ -611,6 +633,16 @@ def test_get_cmd(args: dict, expected: str):
     )
 
 
+def test_get_cmd_with_preload_model(monkeypatch):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_PRELOAD_MODEL", "true")
+    cmd, _ = get_cmd(model_uri="foo", nworkers=4, timeout=60)
+
+    assert cmd == (
+        "gunicorn --timeout=60 -w 4 --preload ${GUNICORN_CMD_ARGS}"
+        " -- mlflow.pyfunc.scoring_server.wsgi:app"
+    )
+
+
 def test_scoring_server_client(sklearn_model, model_path):
     from mlflow.pyfunc.scoring_server.client import ScoringServerClient
     from mlflow.utils import find_free_port
@@ -0,0 +1,89 @@
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import mlflow
+from mlflow.protos.databricks_pb2 import BAD_REQUEST, ErrorCode
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.scoring_server import asgi, get_cmd
+from mlflow.version import VERSION
+
+
+class _DoubleModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        if (model_input["x"] < 0).any():
+            raise ValueError("Negative input")
+        if (model_input["x"] == 0).any():
+            time.sleep(2)
+        return model_input["x"] * 2
+
+
+@pytest.fixture
+def model(tmp_path):
+    model_path = str(tmp_path / "model")
+    mlflow.pyfunc.save_model(model_path, python_model=_DoubleModel())
+    return mlflow.pyfunc.load_model(model_path)
+
+
+def _score(client, x, content_type="application/json"):
+    return client.post(
+        "/invocations",
+        content=json.dumps({"dataframe_split": {"columns": ["x"], "data": [[x]]}}),
+        headers={"Content-Type": content_type},
+    )
+
+
+def test_asgi_scoring_server_endpoints(model):
+    client = TestClient(asgi.init(model))
+
+    assert client.get("/ping").status_code == 200
+    assert client.get("/health").status_code == 200
+    assert client.get("/version").text == VERSION
+
+    response = _score(client, 2)
+    assert response.status_code == 200
+    assert response.json() == {"predictions": [{"x": 4}]}
+
+    response = _score(client, -1)
+    assert response.status_code == 400
+    assert response.json()["error_code"] == ErrorCode.Name(BAD_REQUEST)
+
+    response = _score(client, 2, content_type="application/json; format=pandas-split")
+    assert response.status_code == 415
+
+    response = client.post("/invocations", content="x\n3\n", headers={"Content-Type": "text/csv"})
+    assert response.json() == {"predictions": [{"x": 6}]}
+
+
+def test_asgi_scoring_server_times_out_slow_predictions(model):
+    client = TestClient(asgi.init(model, timeout=0.5))
+    response = _score(client, 0)
+    assert response.status_code == 504
+
+
+def test_asgi_scoring_server_with_micro_batching(model, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", "8")
+    client = TestClient(asgi.init(model))
+    assert _score(client, 1).json() == {"predictions": [{"x": 2}]}
+    assert "mlflow_scoring_server_batch_size_count 1" in client.get("/metrics").text
+
+
+def test_get_cmd_with_asgi():
+    cmd, env = get_cmd(
+        model_uri="foo", port=5000, host="0.0.0.0", nworkers=2, timeout=30, enable_asgi=True
+    )
+    assert cmd == (
+        "uvicorn --host=0.0.0.0 --port=5000 --workers=2"
+        " --factory mlflow.pyfunc.scoring_server.asgi:create_app"
+    )
+    assert env["MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT"] == "30"
+
+
+def test_serve_rejects_mlserver_and_asgi():
+    from mlflow.pyfunc.backend import PyFuncBackend
+
+    backend = PyFuncBackend({}, env_manager="local")
+    with pytest.raises(Exception, match="cannot be enabled at the same time"):
+        backend.serve("foo", 5000, "localhost", 60, enable_mlserver=True, enable_asgi=True)
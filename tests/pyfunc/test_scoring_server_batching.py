@@ -0,0 +1,144 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlflow
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.scoring_server import get_cmd
+from mlflow.pyfunc.scoring_server.batching import MicroBatcher, _Histogram, _split
+
+
+class _DoubleModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        if (model_input["x"] < 0).any():
+            raise ValueError("Negative input")
+        return model_input["x"] * 2
+
+
+def test_micro_batcher_batches_concurrent_requests():
+    batch_sizes = []
+
+    def predict_fn(data):
+        batch_sizes.append(len(data))
+        return data["x"] * 2
+
+    batcher = MicroBatcher(predict_fn, max_batch_size=100, max_wait_ms=1000)
+    inputs = [pd.DataFrame({"x": [i, i + 1]}) for i in range(5)]
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(batcher.predict, inputs))
+
+    assert sum(batch_sizes) == 10
+    assert len(batch_sizes) < 5
+    for data, result in zip(inputs, results):
+        pd.testing.assert_series_equal(result, data["x"] * 2)
+
+
+def test_micro_batcher_respects_max_batch_size_and_input_compatibility():
+    batch_sizes = []
+
+    def predict_fn(data):
+        batch_sizes.append(len(data))
+        return data * 2
+
+    batcher = MicroBatcher(predict_fn, max_batch_size=4, max_wait_ms=200)
+    inputs = [np.ones((3, 2)), np.ones((3, 2)), np.ones((2, 3)), np.ones((5, 2))]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(batcher.predict, inputs))
+
+    assert sorted(batch_sizes) == [2, 3, 3, 5]
+    for data, result in zip(inputs, results):
+        np.testing.assert_array_equal(result, data * 2)
+
+
+def test_micro_batcher_isolates_failing_requests():
+    def predict_fn(data):
+        if (data["x"] < 0).any():
+            raise ValueError("Negative input")
+        return data["x"] * 2
+
+    batcher = MicroBatcher(predict_fn, max_batch_size=100, max_wait_ms=200)
+    inputs = [pd.DataFrame({"x": [1]}), pd.DataFrame({"x": [-1]}), pd.DataFrame({"x": [2]})]
+
+    def predict(data):
+        try:
+            return batcher.predict(data).tolist()
+        except ValueError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(predict, inputs))
+
+    assert results == [[2], "Negative input", [4]]
+
+
+def test_split_returns_none_if_predictions_cannot_be_split():
+    assert _split(np.arange(3), [1, 2])[1].tolist() == [1, 2]
+    assert _split(np.arange(4), [1, 2]) is None
+    assert _split({"a": 1}, [1]) is None
+    assert _split(pd.Series([1, 2, 3]), [2, 1])[1].index.tolist() == [0]
+
+
+def test_histogram_to_prometheus():
+    histogram = _Histogram("h", "Help.", [1, 10])
+    for value in (1, 5, 50):
+        histogram.observe(value)
+    assert histogram.to_prometheus().splitlines() == [
+        "# HELP h Help.",
+        "# TYPE h histogram",
+        'h_bucket{le="1"} 1',
+        'h_bucket{le="10"} 2',
+        'h_bucket{le="+Inf"} 3',
+        "h_sum 56",
+        "h_count 3",
+    ]
+
+
+def test_scoring_server_with_micro_batching(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", "16")
+    model_path = str(tmp_path / "model")
+    mlflow.pyfunc.save_model(model_path, python_model=_DoubleModel())
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+    client = app.test_client()
+
+    def score(x):
+        return client.post(
+            "/invocations",
+            data=json.dumps({"dataframe_split": {"columns": ["x"], "data": [[x]]}}),
+            content_type="application/json",
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(score, [1, 2, -1, 3]))
+
+    assert [response.status_code for response in responses] == [200, 200, 400, 200]
+    assert [json.loads(r.data)["predictions"] for r in responses if r.status_code == 200] == [
+        [{"x": 2}],
+        [{"x": 4}],
+        [{"x": 6}],
+    ]
+    metrics = client.get("/metrics").data.decode("utf-8")
+    assert 'mlflow_scoring_server_batch_size_bucket{le="+Inf"}' in metrics
+    assert "mlflow_scoring_server_prediction_latency_ms_count 4" in metrics
+
+
+def test_scoring_server_metrics_endpoint_requires_micro_batching(tmp_path):
+    model_path = str(tmp_path / "model")
+    mlflow.pyfunc.save_model(model_path, python_model=_DoubleModel())
+    app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+    assert app.test_client().get("/metrics").status_code == 404
+
+
+@pytest.mark.parametrize(
+    ("max_batch_size", "expected"), [("8", "--threads=8"), ("1000", "--threads=64")]
+)
+def test_get_cmd_with_micro_batching(monkeypatch, max_batch_size, expected):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", max_batch_size)
+    cmd, _ = get_cmd(model_uri="foo", nworkers=2, timeout=60)
+    assert cmd == (
+        f"gunicorn --timeout=60 -w 2 {expected} ${{GUNICORN_CMD_ARGS}}"
+        " -- mlflow.pyfunc.scoring_server.wsgi:app"
+    )
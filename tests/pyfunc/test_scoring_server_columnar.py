@@ -0,0 +1,189 @@
+import json
+import sys
+import threading
+from unittest import mock
+
+import flask
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from fastapi.testclient import TestClient
+from werkzeug.serving import make_server
+
+import mlflow
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.models import ModelSignature
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.scoring_server import (
+    CONTENT_TYPE_ARROW,
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_PARQUET,
+    asgi,
+    dataframe_from_columnar_bytes,
+    dataframe_to_columnar_bytes,
+)
+from mlflow.pyfunc.scoring_server.client import ScoringServerClient
+from mlflow.types import ColSpec, Schema
+
+
+class _EchoModel(PythonModel):
+    def predict(self, context, model_input, params=None):
+        if (model_input["x"] < 0).any():
+            return {"x": model_input["x"].tolist()}
+        return model_input
+
+
+@pytest.fixture
+def model(tmp_path):
+    model_path = str(tmp_path / "model")
+    signature = ModelSignature(
+        inputs=Schema([ColSpec("double", "x"), ColSpec("string", "s")]),
+    )
+    mlflow.pyfunc.save_model(model_path, python_model=_EchoModel(), signature=signature)
+    return mlflow.pyfunc.load_model(model_path)
+
+
+@pytest.fixture
+def server_url(model):
+    server = make_server("127.0.0.1", 0, pyfunc_scoring_server.init(model), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "127.0.0.1", server.server_port
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize("content_type", [CONTENT_TYPE_ARROW, CONTENT_TYPE_PARQUET])
+def test_columnar_bytes_round_trip(content_type):
+    pdf = pd.DataFrame(
+        {
+            "x": np.array([1, 2], dtype=np.int32),
+            "s": ["a", "b"],
+            "b": [b"\x00", b"\x01"],
+            "t": pd.to_datetime(["2022-01-01", "2022-01-02"]),
+        },
+        index=[5, 6],
+    )
+    parsed = dataframe_from_columnar_bytes(
+        dataframe_to_columnar_bytes(pdf, content_type), content_type
+    )
+    pd.testing.assert_frame_equal(parsed, pdf.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("content_type", [CONTENT_TYPE_ARROW, CONTENT_TYPE_PARQUET])
+def test_scoring_server_with_columnar_input_and_output(model, content_type):
+    client = pyfunc_scoring_server.init(model).test_client()
+    body = dataframe_to_columnar_bytes(pd.DataFrame({"x": [1, 2], "s": ["a", "b"]}), content_type)
+
+    response = client.post(
+        "/invocations", data=body, headers={"Content-Type": content_type, "Accept": content_type}
+    )
+    assert response.status_code == 200
+    assert response.content_type == content_type
+    # Numeric columns are cast according to the input schema, like JSON inputs
+    pd.testing.assert_frame_equal(
+        dataframe_from_columnar_bytes(response.data, content_type),
+        pd.DataFrame({"x": [1.0, 2.0], "s": ["a", "b"]}),
+    )
+
+    response = client.post("/invocations", data=body, headers={"Content-Type": content_type})
+    assert response.content_type == CONTENT_TYPE_JSON
+    assert json.loads(response.data) == {
+        "predictions": [{"x": 1.0, "s": "a"}, {"x": 2.0, "s": "b"}]
+    }
+
+
+def test_scoring_server_returns_json_for_non_tabular_predictions(model):
+    client = pyfunc_scoring_server.init(model).test_client()
+    pdf = pd.DataFrame({"x": [-1.0], "s": ["a"]})
+    response = client.post(
+        "/invocations",
+        data=dataframe_to_columnar_bytes(pdf, CONTENT_TYPE_ARROW),
+        headers={"Content-Type": CONTENT_TYPE_ARROW, "Accept": CONTENT_TYPE_ARROW},
+    )
+    assert response.content_type == CONTENT_TYPE_JSON
+    assert json.loads(response.data) == {"predictions": {"x": [-1.0]}}
+
+
+def test_scoring_server_rejects_invalid_columnar_input(model):
+    client = pyfunc_scoring_server.init(model).test_client()
+    response = client.post(
+        "/invocations", data=b"not arrow", headers={"Content-Type": CONTENT_TYPE_ARROW}
+    )
+    assert response.status_code == 400
+    assert "Failed to parse input" in json.loads(response.data)["message"]
+
+
+def test_scoring_server_rejects_columnar_input_without_pyarrow(model, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    client = pyfunc_scoring_server.init(model).test_client()
+    response = client.post(
+        "/invocations", data=b"arrow", headers={"Content-Type": CONTENT_TYPE_ARROW}
+    )
+    assert response.status_code == 415
+    assert "pyarrow" in response.get_data(as_text=True)
+
+
+def test_asgi_scoring_server_with_columnar_input_and_output(model):
+    client = TestClient(asgi.init(model))
+    body = dataframe_to_columnar_bytes(pd.DataFrame({"x": [1.0], "s": ["a"]}), CONTENT_TYPE_ARROW)
+    response = client.post(
+        "/invocations",
+        content=body,
+        headers={"Content-Type": CONTENT_TYPE_ARROW, "Accept": CONTENT_TYPE_ARROW},
+    )
+    assert response.headers["content-type"] == CONTENT_TYPE_ARROW
+    pd.testing.assert_frame_equal(
+        dataframe_from_columnar_bytes(response.content, CONTENT_TYPE_ARROW),
+        pd.DataFrame({"x": [1.0], "s": ["a"]}),
+    )
+
+
+@pytest.mark.parametrize("content_type", [CONTENT_TYPE_ARROW, CONTENT_TYPE_PARQUET, None])
+def test_scoring_server_client_with_columnar_content_type(server_url, content_type):
+    client = ScoringServerClient(*server_url, columnar_content_type=content_type)
+    pdf = pd.DataFrame({"x": [1.5, 2.5], "s": ["a", "b"]})
+    pd.testing.assert_frame_equal(client.invoke(pdf).get_predictions(), pdf)
+
+
+def test_scoring_server_client_falls_back_to_json_for_servers_without_pyarrow(server_url):
+    client = ScoringServerClient(*server_url)
+    pdf = pd.DataFrame({"x": [1.5, 2.5], "s": ["a", "b"]})
+    with mock.patch(
+        "mlflow.pyfunc.scoring_server._is_pyarrow_available", return_value=False
+    ), mock.patch("requests.post", wraps=requests.post) as mock_post:
+        pd.testing.assert_frame_equal(client.invoke(pdf).get_predictions(), pdf)
+    assert [c.kwargs["headers"]["Content-Type"] for c in mock_post.call_args_list] == [
+        CONTENT_TYPE_ARROW,
+        CONTENT_TYPE_JSON,
+    ]
+    assert client.columnar_content_type is None
+
+
+def test_scoring_server_client_falls_back_to_json_for_older_servers():
+    app = flask.Flask(__name__)
+    content_types = []
+
+    @app.route("/invocations", methods=["POST"])
+    def invocations():
+        content_types.append(flask.request.content_type)
+        if flask.request.content_type != CONTENT_TYPE_JSON:
+            return flask.Response(status=415)
+        return flask.Response(
+            response=json.dumps({"predictions": [{"x": 1}]}), mimetype=CONTENT_TYPE_JSON
+        )
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = ScoringServerClient("127.0.0.1", server.server_port)
+        for _ in range(2):
+            assert client.invoke(pd.DataFrame({"x": [1]})).get_predictions()["x"].tolist() == [1]
+    finally:
+        server.shutdown()
+        thread.join()
+
+    assert content_types == [CONTENT_TYPE_ARROW, CONTENT_TYPE_JSON, CONTENT_TYPE_JSON]
+    assert client.columnar_content_type is None
@@ -9,6 +9,7 @@ import logging
 import pickle
 import re
 from unittest import mock
+from packaging.version import Version
 
 import pytest
 import numpy as np
@@ -314,6 +315,24 @@ def test_save_and_load_model(sequential_model, model_path, data, sequential_pred
     )
 
 
+@pytest.mark.skipif(
+    Version(torch.__version__) < Version("2.1.0"), reason="mmap requires torch >= 2.1.0"
+)
+@pytest.mark.parametrize("scripted_model", [True, False])
+def test_pyfunc_load_model_with_mmap_model_weights(
+    sequential_model, model_path, data, sequential_predicted, monkeypatch
+):
+    mlflow.pytorch.save_model(sequential_model, model_path)
+    monkeypatch.setenv("MLFLOW_MMAP_MODEL_WEIGHTS", "true")
+    with mock.patch("torch.load", wraps=torch.load) as torch_load_mock:
+        pyfunc_loaded = mlflow.pyfunc.load_model(model_path)
+
+    assert torch_load_mock.call_args.kwargs["mmap"] is True
+    np.testing.assert_array_almost_equal(
+        pyfunc_loaded.predict(data[0]).values[:, 0], sequential_predicted, decimal=4
+    )
+
+
 @pytest.mark.parametrize("scripted_model", [True, False])
 def test_pyfunc_model_works_with_np_input_type(
     sequential_model, model_path, data, sequential_predicted
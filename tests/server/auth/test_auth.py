@@ -11,6 +11,7 @@ import psutil
 
 import mlflow
 from mlflow import MlflowClient
+from mlflow.entities import Param
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import (
     ErrorCode,
@@ -137,6 +138,62 @@ def test_search_experiments(client, monkeypatch):
         assert names == [f"exp{i}" for i in readable]
 
 
+def test_get_runs_and_log_batches(client, monkeypatch):
+    """
+    Use user1 to create a run in each of 2 experiments,
+    grant READ permission to user2 on experiment 0 only.
+    Test whether user2 can get the runs of the readable experiment only,
+    and whether batches can be logged for the runs of multiple experiments.
+    """
+    username1, password1 = create_user(client.tracking_uri)
+    username2, password2 = create_user(client.tracking_uri)
+
+    run_ids = []
+    with User(username1, password1, monkeypatch):
+        for i, permission in enumerate(["READ", "NO_PERMISSIONS"]):
+            experiment_id = client.create_experiment(f"exp{i}")
+            run_ids.append(client.create_run(experiment_id).info.run_id)
+            _send_rest_tracking_post_request(
+                client.tracking_uri,
+                "/api/2.0/mlflow/experiments/permissions/create",
+                json_payload={
+                    "experiment_id": experiment_id,
+                    "username": username2,
+                    "permission": permission,
+                },
+                auth=(username1, password1),
+            )
+
+    with User(username2, password2, monkeypatch):
+        assert [run.info.run_id for run in client.get_runs(run_ids[:1])] == run_ids[:1]
+        with pytest.raises(MlflowException, match=r"Permission denied"):
+            client.get_runs(run_ids)
+        with pytest.raises(MlflowException, match=r"Permission denied"):
+            client.log_batches([(run_ids[0], [], [Param("p", "v")], [])])
+
+    with User(username1, password1, monkeypatch):
+        client.log_batches([(run_id, [], [Param("p", "v")], []) for run_id in run_ids])
+        assert [run.data.params for run in client.get_runs(run_ids)] == [{"p": "v"}] * 2
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "json_payload"),
+    [
+        ("/api/2.0/mlflow/runs/get-batch", {"run_ids": "run_id"}),
+        ("/api/2.0/mlflow/runs/get-batch", {"run_ids": [1]}),
+        ("/api/2.0/mlflow/runs/log-batches", {"batches": [{"params": []}]}),
+        ("/api/2.0/mlflow/runs/log-batches", {"batches": "batch"}),
+    ],
+)
+def test_get_runs_and_log_batches_validate_run_ids(client, endpoint, json_payload):
+    username, password = create_user(client.tracking_uri)
+    response = requests.post(
+        client.tracking_uri + endpoint, json=json_payload, auth=(username, password)
+    )
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "INVALID_PARAMETER_VALUE"
+
+
 def test_search_registered_models(client, monkeypatch):
     """
     Use user1 to create 10 registered_models,
@@ -45,6 +45,7 @@ from mlflow.server.handlers import (
 )
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.protos.mlflow_artifacts_pb2 import ListArtifacts as ListArtifactsMlflowArtifacts
 from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
 from mlflow.store.model_registry import (
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
@@ -179,6 +180,15 @@ def test_can_parse_get_json_with_unknown_fields():
     assert msg.name == "hello"
 
 
+def test_can_parse_get_json_with_boolean_fields():
+    request = mock.MagicMock()
+    request.method = "GET"
+    request.query_string = b"path=dir&recursive=true"
+    msg = _get_request_message(ListArtifactsMlflowArtifacts(), flask_request=request)
+    assert msg.path == "dir"
+    assert msg.recursive
+
+
 # Previous versions of the client sent a doubly string encoded JSON blob,
 # so this test ensures continued compliance with such clients.
 def test_can_parse_json_string():
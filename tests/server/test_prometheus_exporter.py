@@ -1,10 +1,17 @@
 import os
 from unittest import mock
 
+import prometheus_client
 import pytest
 
 
-from mlflow.server.prometheus_exporter import activate_prometheus_exporter
+from mlflow.server.prometheus_exporter import ArtifactTransferMetrics, activate_prometheus_exporter
+from mlflow.store.artifact.instrumentation import (
+    ArtifactTransferListenerRegistry,
+    register_artifact_transfer_listener,
+    unregister_artifact_transfer_listener,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 
 
 @pytest.fixture(autouse=True)
@@ -13,6 +20,15 @@ def mock_settings_env_vars(tmp_path):
         yield
 
 
+@pytest.fixture(autouse=True)
+def artifact_transfer_listener_registry():
+    with mock.patch(
+        "mlflow.store.artifact.instrumentation._artifact_transfer_listener_registry",
+        ArtifactTransferListenerRegistry(),
+    ):
+        yield
+
+
 @pytest.fixture()
 def app():
     from mlflow.server import app
@@ -74,3 +90,23 @@ def test_metrics(app, test_client):
     assert (
         metrics.registry.get_sample_value("mlflow_http_request_total", labels=failure_labels) == 1
     )
+
+
+def test_artifact_transfer_metrics(tmp_path):
+    registry = prometheus_client.CollectorRegistry()
+    metrics = ArtifactTransferMetrics(registry)
+    repo = LocalArtifactRepository(str(tmp_path / "artifacts"))
+    local_file = tmp_path / "a.txt"
+    local_file.write_text("abc")
+    register_artifact_transfer_listener(metrics)
+    try:
+        repo.log_artifact(str(local_file))
+        repo.log_artifact(str(local_file), "dir")
+    finally:
+        unregister_artifact_transfer_listener(metrics)
+
+    labels = {"operation": "upload", "scope": "file", "backend": "LocalArtifactRepository"}
+    success_labels = {**labels, "status": "success"}
+    assert registry.get_sample_value("mlflow_artifact_transfers_total", success_labels) == 2
+    assert registry.get_sample_value("mlflow_artifact_transferred_bytes_total", labels) == 6
+    assert registry.get_sample_value("mlflow_artifact_transfer_duration_seconds_count", labels) == 2
@@ -1,3 +1,4 @@
+import os
 import posixpath
 from unittest import mock
 import pytest
@@ -6,6 +7,8 @@ import time
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.download_planner import DownloadPlanner
+from mlflow.store.artifact.instrumentation import _ProgressBar
 from mlflow.utils.file_utils import TempDir
 
 _MOCK_ERROR = "MOCK ERROR"
@@ -94,6 +97,23 @@ def test_download_artifacts_does_not_infinitely_loop(base_uri, download_arg, lis
         repo.download_artifacts(download_arg)
 
 
+def test_list_artifacts_recursive():
+    def list_artifacts(path):
+        return {
+            None: [FileInfo("a.txt", False, 1), FileInfo("dir", True, None)],
+            "dir": [FileInfo("dir/b.txt", False, 2), FileInfo("dir/" + _EMPTY_DIR, True, None)],
+        }.get(path, [])
+
+    with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts", side_effect=list_artifacts):
+        repo = ArtifactRepositoryImpl(_PARENT_DIR)
+        assert repo.list_artifacts_recursive() == [
+            FileInfo("a.txt", False, 1),
+            FileInfo("dir/b.txt", False, 2),
+            FileInfo("dir/" + _EMPTY_DIR, True, None),
+        ]
+        assert repo.list_artifacts_recursive("a.txt") == []
+
+
 def test_download_artifacts_download_file():
     with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts", return_value=[]):
         repo = ArtifactRepositoryImpl(_PARENT_DIR)
@@ -204,3 +224,151 @@ def test_download_artifacts_provides_failure_info(base_uri, download_arg, list_r
         err_msg = str(exc.value)
         assert _MODEL_FILE in err_msg
         assert _MOCK_ERROR in err_msg
+
+
+def test_log_artifacts_concurrently_logs_all_files(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "subdir" / "nested").mkdir(parents=True)
+    (tmp_path / "subdir" / "b.txt").write_text("b")
+    (tmp_path / "subdir" / "nested" / "c.txt").write_text("c")
+    logged = []
+
+    def log_file(local_file, artifact_dir):
+        logged.append((posixpath.basename(local_file), artifact_dir))
+
+    repo = ArtifactRepositoryImpl("uri")
+    repo._log_artifacts_concurrently(str(tmp_path), "root", log_file)
+    assert sorted(logged) == [
+        ("a.txt", "root"),
+        ("b.txt", "root/subdir"),
+        ("c.txt", "root/subdir/nested"),
+    ]
+
+
+def test_log_artifacts_concurrently_provides_failure_info(tmp_path):
+    for name in ("ok.txt", "bad1.txt", "bad2.txt"):
+        (tmp_path / name).write_text(name)
+
+    def log_file(local_file, artifact_dir):
+        if "bad" in local_file:
+            raise Exception(_MOCK_ERROR)
+
+    repo = ArtifactRepositoryImpl("uri")
+    with pytest.raises(MlflowException, match="failures occurred while uploading") as exc:
+        repo._log_artifacts_concurrently(str(tmp_path), None, log_file)
+    assert "bad1.txt" in exc.value.message
+    assert "bad2.txt" in exc.value.message
+    assert "ok.txt" not in exc.value.message
+    assert _MOCK_ERROR in exc.value.message
+
+
+def test_log_artifacts_concurrently_only_stats_files_for_progress_bar(tmp_path, monkeypatch):
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "a.txt").write_text("aaa")
+    (tmp_path / "subdir" / "b.txt").write_text("bb")
+    repo = ArtifactRepositoryImpl("uri")
+
+    with mock.patch("os.path.getsize", wraps=os.path.getsize) as getsize_mock:
+        repo._log_artifacts_concurrently(str(tmp_path), None, lambda *_: None)
+    getsize_mock.assert_not_called()
+
+    pytest.importorskip("tqdm")
+    monkeypatch.setenv("MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR", "true")
+    with mock.patch("os.path.getsize", wraps=os.path.getsize) as getsize_mock, mock.patch.object(
+        _ProgressBar, "close", autospec=True
+    ) as close_mock:
+        repo._log_artifacts_concurrently(str(tmp_path), None, lambda *_: None)
+    # Each file is stat'ed once, while the directory is walked
+    assert getsize_mock.call_count == 2
+    [(progress_bar,), _] = close_mock.call_args
+    assert progress_bar._pbar.n == progress_bar._pbar.total == 5
+
+
+def test_max_workers_can_be_configured(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_UPLOAD_DOWNLOAD_MAX_WORKERS", "3")
+    repo = ArtifactRepositoryImpl("uri")
+    assert repo.max_workers == 3
+    assert repo.thread_pool._max_workers == 3
+
+
+class StreamingArtifactRepositoryImpl(ArtifactRepository):
+    """Implementation of ArtifactRepository which streams files of an in-memory directory."""
+
+    def __init__(self, artifact_uri, files):
+        super().__init__(artifact_uri)
+        self.files = files
+        self.ranges = []
+
+    def log_artifact(self, local_file, artifact_path=None):
+        raise NotImplementedError()
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        raise NotImplementedError()
+
+    def list_artifacts(self, path):
+        raise NotImplementedError()
+
+    def _iter_artifacts_recursive(self, path):
+        for file_path, content in self.files.items():
+            yield FileInfo(file_path, False, len(content))
+
+    def _download_file(self, remote_file_path, local_path):
+        with open(local_path, "wb") as f:
+            f.write(self.files[remote_file_path])
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        self.ranges.append((artifact_path, range_start, range_end))
+        yield self.files[artifact_path][range_start : range_end + 1]
+
+
+def test_download_artifacts_starts_downloads_while_listing(tmp_path):
+    listing_done = False
+    downloaded_while_listing = []
+
+    class Repo(StreamingArtifactRepositoryImpl):
+        def _iter_artifacts_recursive(self, path):
+            nonlocal listing_done
+            yield from super()._iter_artifacts_recursive(path)
+            time.sleep(0.5)
+            listing_done = True
+
+        def _download_file(self, remote_file_path, local_path):
+            downloaded_while_listing.append(not listing_done)
+            super()._download_file(remote_file_path, local_path)
+
+    repo = Repo("uri", {"a.txt": b"a", "dir/b.txt": b"b"})
+    repo.download_artifacts("", str(tmp_path))
+    assert downloaded_while_listing == [True, True]
+    assert tmp_path.joinpath("dir", "b.txt").read_bytes() == b"b"
+
+
+def test_download_artifacts_downloads_large_files_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE", "10")
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE", "4")
+    repo = StreamingArtifactRepositoryImpl("uri", {"large.txt": b"0123456789", "small.txt": b"s"})
+    repo.download_artifacts("", str(tmp_path))
+    assert tmp_path.joinpath("large.txt").read_bytes() == b"0123456789"
+    assert tmp_path.joinpath("small.txt").read_bytes() == b"s"
+    assert sorted(repo.ranges) == [("large.txt", 0, 3), ("large.txt", 4, 7), ("large.txt", 8, 9)]
+
+    monkeypatch.setenv("MLFLOW_ENABLE_MULTIPART_DOWNLOAD", "false")
+    repo.ranges.clear()
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    repo.download_artifacts("", str(dst_path))
+    assert tmp_path.joinpath("dst", "large.txt").read_bytes() == b"0123456789"
+    assert repo.ranges == []
+
+
+def test_download_planner_reports_progress(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE", "10")
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE", "4")
+    repo = StreamingArtifactRepositoryImpl("uri", {"large.txt": b"0123456789", "small.txt": b"s"})
+    progress = []
+    DownloadPlanner(repo, str(tmp_path), progress_callback=progress.append).download("")
+    assert len(progress) == 4
+    assert [p.downloaded_bytes for p in progress] == sorted(p.downloaded_bytes for p in progress)
+    last = progress[-1]
+    assert (last.completed_files, last.total_files) == (2, 2)
+    assert (last.downloaded_bytes, last.total_bytes) == (11, 11)
+    assert last.throughput >= 0
@@ -6,7 +6,10 @@ from unittest import mock
 from azure.storage.blob import BlobServiceClient, BlobPrefix, BlobProperties
 
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
 from mlflow.store.artifact.azure_blob_artifact_repo import AzureBlobArtifactRepository
 
 
@@ -48,7 +51,7 @@ def test_artifact_uri_factory(mock_client):
     # We do need to set up a fake access key for the code to run though
     os.environ["AZURE_STORAGE_ACCESS_KEY"] = ""
     repo = get_artifact_repository(TEST_URI)
-    assert isinstance(repo, AzureBlobArtifactRepository)
+    assert isinstance(get_underlying_artifact_repository(repo), AzureBlobArtifactRepository)
     del os.environ["AZURE_STORAGE_ACCESS_KEY"]
 
 
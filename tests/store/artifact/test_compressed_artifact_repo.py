@@ -0,0 +1,172 @@
+import gzip
+import os
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.compressed_artifact_repo import CompressedArtifactRepository
+from mlflow.store.artifact.content_addressed_artifact_repo import (
+    ContentAddressedArtifactRepository,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+
+@pytest.fixture(autouse=True)
+def minimum_file_size(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_COMPRESSION_MINIMUM_FILE_SIZE", "10")
+
+
+@pytest.fixture
+def artifact_dir(tmp_path):
+    return tmp_path / "artifacts"
+
+
+def create_repo(artifact_dir):
+    return CompressedArtifactRepository(LocalArtifactRepository(str(artifact_dir)), "gzip")
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    model_dir = tmp_path / "model"
+    model_dir.joinpath("data").mkdir(parents=True)
+    model_dir.joinpath("MLmodel").write_text("flavors: {}\n" * 10)
+    model_dir.joinpath("requirements.txt").write_text("small")
+    model_dir.joinpath("data", "table.json").write_text('{"a": [1, 2, 3]}' * 10)
+    model_dir.joinpath("data", "weights.bin").write_bytes(b"weights" * 10)
+    return model_dir
+
+
+def list_files(root):
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, f), root)
+        for dirpath, _, files in os.walk(root)
+        for f in files
+    )
+
+
+def test_log_artifacts_compresses_large_text_files(artifact_dir, model_dir):
+    create_repo(artifact_dir).log_artifacts(str(model_dir), "model")
+
+    assert list_files(artifact_dir) == [
+        os.path.join("model", "MLmodel.mlflow-gzip"),
+        os.path.join("model", "data", "table.json.mlflow-gzip"),
+        os.path.join("model", "data", "weights.bin"),
+        os.path.join("model", "requirements.txt"),
+    ]
+    compressed_file = artifact_dir / "model" / "data" / "table.json.mlflow-gzip"
+    assert (
+        gzip.decompress(compressed_file.read_bytes())
+        == (model_dir / "data" / "table.json").read_bytes()
+    )
+
+
+def test_artifacts_are_listed_and_downloaded_decompressed(artifact_dir, model_dir, tmp_path):
+    repo = create_repo(artifact_dir)
+    repo.log_artifacts(str(model_dir), "model")
+
+    assert [(f.path, f.is_dir) for f in repo.list_artifacts("model")] == [
+        ("model/MLmodel", False),
+        ("model/data", True),
+        ("model/requirements.txt", False),
+    ]
+    assert [f.path for f in repo.list_artifacts_recursive("model")] == [
+        "model/MLmodel",
+        "model/data/table.json",
+        "model/data/weights.bin",
+        "model/requirements.txt",
+    ]
+
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    local_path = repo.download_artifacts("model", str(dst_path))
+    assert list_files(local_path) == list_files(model_dir)
+    for rel_path in list_files(model_dir):
+        assert (dst_path / "model" / rel_path).read_bytes() == (model_dir / rel_path).read_bytes()
+
+
+def test_single_files_are_logged_and_downloaded_decompressed(artifact_dir, model_dir, tmp_path):
+    table = model_dir / "data" / "table.json"
+    create_repo(artifact_dir).log_artifact(str(table), "dir")
+    assert list_files(artifact_dir) == [os.path.join("dir", "table.json.mlflow-gzip")]
+
+    repo = create_repo(artifact_dir)
+    local_path = repo.download_artifacts("dir/table.json", str(tmp_path))
+    assert open(local_path, "rb").read() == table.read_bytes()
+    assert repo._get_artifact_file_size("dir/table.json") == table.stat().st_size
+    chunks = repo._download_artifact_stream("dir/table.json", 1, 4)
+    assert b"".join(chunks) == b'"a":'
+
+
+def test_files_are_logged_again_over_their_compressed_files(artifact_dir, tmp_path):
+    repo = create_repo(artifact_dir)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    local_file = src_dir / "a.txt"
+    local_file.write_text("C" * 20)
+    repo.log_artifact(str(local_file))
+    assert [f.path for f in repo.list_artifacts()] == ["a.txt"]
+
+    # The same repository doesn't use the compressed files it listed before the file is logged
+    # again
+    local_file.write_text("D" * 20)
+    repo.log_artifact(str(local_file))
+    assert open(repo.download_artifacts("a.txt", str(tmp_path))).read() == "D" * 20
+
+    # The compressed file of a file logged again below the minimum size is replaced by the file
+    local_file.write_text("E" * 5)
+    repo.log_artifacts(str(src_dir))
+    assert list_files(artifact_dir) == ["a.txt"]
+    for r in [repo, create_repo(artifact_dir)]:
+        assert open(r.download_artifacts("a.txt", str(tmp_path))).read() == "E" * 5
+        assert r._get_artifact_file_size("a.txt") == 5
+
+    # The file stored as is is logged again as is
+    local_file.write_text("F" * 20)
+    repo.log_artifact(str(local_file))
+    assert list_files(artifact_dir) == ["a.txt"]
+    assert open(repo.download_artifacts("a.txt", str(tmp_path))).read() == "F" * 20
+
+
+def test_compressed_files_are_decompressed_without_codec(tmp_path, monkeypatch, model_dir):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_COMPRESSION", "gzip")
+    get_artifact_repository(str(tmp_path / "artifacts")).log_artifacts(str(model_dir), "model")
+
+    monkeypatch.delenv("MLFLOW_ARTIFACT_COMPRESSION")
+    repo = get_artifact_repository(str(tmp_path / "artifacts"))
+    assert [f.path for f in repo.list_artifacts("model/data")] == [
+        "model/data/table.json",
+        "model/data/weights.bin",
+    ]
+    local_path = repo.download_artifacts("model")
+    assert list_files(local_path) == list_files(model_dir)
+    for rel_path in list_files(model_dir):
+        assert (
+            open(os.path.join(local_path, rel_path), "rb").read()
+            == (model_dir / rel_path).read_bytes()
+        )
+    chunks = repo._download_artifact_stream("model/data/table.json", 1, 4)
+    assert b"".join(chunks) == b'"a":'
+
+
+def test_unsupported_codecs_are_rejected(artifact_dir):
+    with pytest.raises(MlflowException, match="Unsupported artifact compression codec 'lz4'"):
+        CompressedArtifactRepository(LocalArtifactRepository(str(artifact_dir)), "lz4")
+
+
+def test_get_artifact_repository_compresses_artifacts_if_enabled(tmp_path, monkeypatch):
+    repo = get_artifact_repository(str(tmp_path))
+    assert isinstance(repo.repo, CompressedArtifactRepository)
+    assert repo.repo.codec is None
+
+    monkeypatch.setenv("MLFLOW_ARTIFACT_COMPRESSION", "gzip")
+    repo = get_artifact_repository(str(tmp_path))
+    assert isinstance(repo.repo, CompressedArtifactRepository)
+    assert repo.repo.codec.name == "gzip"
+    assert isinstance(repo.repo.repo, LocalArtifactRepository)
+
+    # Compressed files are deduplicated as is
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_STORE_URI", str(tmp_path / "blobs"))
+    repo = get_artifact_repository(str(tmp_path))
+    assert isinstance(repo, ContentAddressedArtifactRepository)
+    assert isinstance(repo.repo, CompressedArtifactRepository)
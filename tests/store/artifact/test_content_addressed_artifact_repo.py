@@ -0,0 +1,220 @@
+import os
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
+from mlflow.store.artifact.content_addressed_artifact_repo import (
+    REFERENCE_SUFFIX,
+    ContentAddressedArtifactRepository,
+)
+from mlflow.store.artifact.download_cache import _get_cache_key
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+
+
+@pytest.fixture(autouse=True)
+def minimum_file_size(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_MINIMUM_FILE_SIZE", "10")
+
+
+@pytest.fixture
+def blob_store_dir(tmp_path):
+    return tmp_path / "blobs"
+
+
+@pytest.fixture
+def blob_repo(blob_store_dir):
+    return LocalArtifactRepository(str(blob_store_dir))
+
+
+def create_repo(tmp_path, blob_repo, name="artifacts"):
+    return ContentAddressedArtifactRepository(
+        LocalArtifactRepository(str(tmp_path / name)), blob_repo
+    )
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    model_dir = tmp_path / "model"
+    model_dir.joinpath("data").mkdir(parents=True)
+    model_dir.joinpath("MLmodel").write_text("small")
+    model_dir.joinpath("data", "weights.bin").write_bytes(b"weights" * 10)
+    model_dir.joinpath("data", "adapter.bin").write_bytes(b"adapter" * 10)
+    return model_dir
+
+
+def list_files(root):
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, f), root)
+        for dirpath, _, files in os.walk(root)
+        for f in files
+    )
+
+
+def test_log_artifacts_deduplicates_large_files(tmp_path, blob_repo, blob_store_dir, model_dir):
+    repo = create_repo(tmp_path, blob_repo)
+    repo.log_artifacts(str(model_dir), "model")
+
+    assert list_files(tmp_path / "artifacts") == [
+        os.path.join("model", "MLmodel"),
+        os.path.join("model", "data", "adapter.bin" + REFERENCE_SUFFIX),
+        os.path.join("model", "data", "weights.bin" + REFERENCE_SUFFIX),
+    ]
+    assert len(list_files(blob_store_dir)) == 2
+
+    # Only the blob of the modified file is uploaded when the model is logged again
+    model_dir.joinpath("data", "adapter.bin").write_bytes(b"new adapter" * 10)
+    other_repo = create_repo(tmp_path, blob_repo, "other-artifacts")
+    with mock.patch.object(
+        ContentAddressedArtifactRepository, "_upload_blob", wraps=other_repo._upload_blob
+    ) as upload_blob_mock:
+        other_repo.log_artifacts(str(model_dir), "model")
+    assert upload_blob_mock.call_count == 1
+    assert len(list_files(blob_store_dir)) == 3
+
+
+def test_artifacts_are_listed_and_downloaded_with_their_layout(tmp_path, blob_repo, model_dir):
+    repo = create_repo(tmp_path, blob_repo)
+    repo.log_artifacts(str(model_dir), "model")
+
+    assert [(f.path, f.is_dir, f.file_size) for f in repo.list_artifacts("model/data")] == [
+        ("model/data/adapter.bin", False, 70),
+        ("model/data/weights.bin", False, 70),
+    ]
+    assert [f.path for f in repo.list_artifacts_recursive("model")] == [
+        "model/MLmodel",
+        "model/data/adapter.bin",
+        "model/data/weights.bin",
+    ]
+
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    local_path = repo.download_artifacts("model", str(dst_path))
+    assert list_files(local_path) == list_files(model_dir)
+    for rel_path in list_files(model_dir):
+        assert (dst_path / "model" / rel_path).read_bytes() == (model_dir / rel_path).read_bytes()
+
+
+def test_single_files_are_logged_and_downloaded(tmp_path, blob_repo, model_dir):
+    weights = model_dir / "data" / "weights.bin"
+    create_repo(tmp_path, blob_repo).log_artifact(str(weights), "dir")
+
+    repo = create_repo(tmp_path, blob_repo)
+    local_path = repo.download_artifacts("dir/weights.bin", str(tmp_path))
+    assert open(local_path, "rb").read() == weights.read_bytes()
+    assert repo._get_artifact_file_size("dir/weights.bin") == weights.stat().st_size
+    chunks = repo._download_artifact_stream("dir/weights.bin", 7, 13)
+    assert b"".join(chunks) == b"weights"
+
+
+def test_files_are_logged_again_over_their_references(tmp_path, blob_repo):
+    repo = create_repo(tmp_path, blob_repo)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    local_file = src_dir / "w.bin"
+    local_file.write_bytes(b"C" * 20)
+    repo.log_artifact(str(local_file))
+    assert [f.path for f in repo.list_artifacts()] == ["w.bin"]
+
+    # The same repository doesn't use the references it listed before the file is logged again
+    local_file.write_bytes(b"D" * 20)
+    repo.log_artifact(str(local_file))
+    assert open(repo.download_artifacts("w.bin", str(tmp_path)), "rb").read() == b"D" * 20
+
+    # The reference of a file logged again below the minimum size is replaced by the file
+    local_file.write_bytes(b"E" * 5)
+    repo.log_artifact(str(local_file))
+    assert list_files(tmp_path / "artifacts") == ["w.bin"]
+    for r in [repo, create_repo(tmp_path, blob_repo)]:
+        assert open(r.download_artifacts("w.bin", str(tmp_path)), "rb").read() == b"E" * 5
+        assert r._get_artifact_file_size("w.bin") == 5
+
+    # The file stored as is is logged again as is
+    local_file.write_bytes(b"F" * 20)
+    repo.log_artifacts(str(src_dir))
+    assert list_files(tmp_path / "artifacts") == ["w.bin"]
+    assert open(repo.download_artifacts("w.bin", str(tmp_path)), "rb").read() == b"F" * 20
+
+
+def test_get_artifact_repository_deduplicates_artifacts_if_enabled(
+    tmp_path, monkeypatch, blob_store_dir
+):
+    repo = get_artifact_repository(str(tmp_path))
+    assert isinstance(repo, ContentAddressedArtifactRepository)
+    assert repo.blob_repo is None
+
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_STORE_URI", str(blob_store_dir))
+    repo = get_artifact_repository(str(tmp_path))
+    assert isinstance(repo, ContentAddressedArtifactRepository)
+    assert isinstance(get_underlying_artifact_repository(repo), LocalArtifactRepository)
+    assert repo.blob_repo.artifact_uri == str(blob_store_dir)
+
+    with mlflow.start_run() as run:
+        pass
+    runs_repo = get_artifact_repository(f"runs:/{run.info.run_id}")
+    assert isinstance(runs_repo, RunsArtifactRepository)
+    assert isinstance(runs_repo.repo, ContentAddressedArtifactRepository)
+
+
+def test_logged_models_are_deduplicated(tmp_path, monkeypatch, blob_store_dir, model_dir):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_STORE_URI", str(blob_store_dir))
+    mlflow.set_experiment(experiment_id=mlflow.create_experiment("exp", str(tmp_path / "exp")))
+    run_ids = []
+    for _ in range(2):
+        with mlflow.start_run() as run:
+            mlflow.log_artifacts(str(model_dir), "model")
+        run_ids.append(run.info.run_id)
+
+    assert len(list_files(blob_store_dir)) == 2
+    for run_id in run_ids:
+        local_path = mlflow.artifacts.download_artifacts(
+            run_id=run_id, artifact_path="model", dst_path=str(tmp_path / run_id)
+        )
+        assert list_files(local_path) == list_files(model_dir)
+
+
+def test_cache_key_depends_on_blob_digests(tmp_path, blob_repo, model_dir):
+    repo = create_repo(tmp_path, blob_repo)
+    repo.log_artifacts(str(model_dir), "model")
+    key = _get_cache_key(create_repo(tmp_path, blob_repo), "model/data")
+    assert key is not None
+
+    # Overwrite a file with content of the same size
+    model_dir.joinpath("data", "weights.bin").write_bytes(b"WEIGHTS" * 10)
+    repo.log_artifacts(str(model_dir), "model")
+    assert _get_cache_key(create_repo(tmp_path, blob_repo), "model/data") != key
+
+    # The local files stored as is have no version
+    assert _get_cache_key(create_repo(tmp_path, blob_repo), "model") is None
+
+
+def test_references_are_resolved_without_blob_store_uri(
+    tmp_path, monkeypatch, blob_store_dir, model_dir
+):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_BLOB_STORE_URI", str(blob_store_dir))
+    get_artifact_repository(str(tmp_path / "artifacts")).log_artifacts(str(model_dir), "model")
+
+    monkeypatch.delenv("MLFLOW_ARTIFACT_BLOB_STORE_URI")
+    repo = get_artifact_repository(str(tmp_path / "artifacts"))
+    assert [f.path for f in repo.list_artifacts("model/data")] == [
+        "model/data/adapter.bin",
+        "model/data/weights.bin",
+    ]
+    local_path = repo.download_artifacts("model")
+    assert list_files(local_path) == list_files(model_dir)
+    weights = model_dir / "data" / "weights.bin"
+    assert (
+        open(repo.download_artifacts("model/data/weights.bin"), "rb").read() == weights.read_bytes()
+    )
+
+    # Files logged without deduplication are logged as is, over their references
+    weights.write_bytes(b"new weights" * 10)
+    repo.log_artifact(str(weights), "model/data")
+    assert (tmp_path / "artifacts" / "model" / "data" / "weights.bin").exists()
+    local_path = create_repo(tmp_path, None).download_artifacts("model/data/weights.bin")
+    assert open(local_path, "rb").read() == weights.read_bytes()
@@ -0,0 +1,261 @@
+import os
+import shutil
+import threading
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.download_cache import (
+    ArtifactDownloadCache,
+    download_artifacts_with_cache,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+from tests.helper_functions import set_boto_credentials  # pylint: disable=unused-import
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("MLFLOW_ARTIFACT_DOWNLOAD_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def s3_repo(mock_s3_bucket, tmp_path):
+    repo = S3ArtifactRepository(f"s3://{mock_s3_bucket}")
+    src = tmp_path / "src"
+    src.mkdir()
+    src.joinpath("a.txt").write_text("a")
+    src.joinpath("subdir").mkdir()
+    src.joinpath("subdir", "b.txt").write_text("b")
+    repo.log_artifacts(str(src), "model")
+    return repo
+
+
+def test_download_artifacts_with_cache_downloads_once(cache_dir, s3_repo, tmp_path):
+    with mock.patch.object(
+        S3ArtifactRepository, "_download_file", wraps=s3_repo._download_file
+    ) as download_file_mock:
+        path1 = download_artifacts_with_cache(s3_repo, "model")
+        path2 = download_artifacts_with_cache(s3_repo, "model")
+        assert download_file_mock.call_count == 2
+
+    # The cached artifacts are linked out of the cache
+    assert path1 != path2
+    assert not path1.startswith(str(cache_dir))
+    assert open(os.path.join(path1, "subdir", "b.txt")).read() == "b"
+    assert open(os.path.join(path2, "subdir", "b.txt")).read() == "b"
+
+    dst_path = tmp_path / "dst"
+    local_path = download_artifacts_with_cache(s3_repo, "model/subdir/b.txt", str(dst_path))
+    assert local_path == str(dst_path / "model" / "subdir" / "b.txt")
+    assert open(local_path).read() == "b"
+
+
+def test_download_artifacts_with_cache_downloads_again_modified_artifacts(
+    cache_dir, s3_repo, tmp_path
+):
+    download_artifacts_with_cache(s3_repo, "model")
+    # Overwrite a file with content of the same size
+    modified = tmp_path / "a.txt"
+    modified.write_text("A")
+    s3_repo.log_artifact(str(modified), "model")
+
+    path = download_artifacts_with_cache(s3_repo, "model")
+    assert open(os.path.join(path, "a.txt")).read() == "A"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+class VersionedArtifactRepository(ArtifactRepository):
+    """
+    Artifact repository of a local directory that isn't handled as local artifacts, which
+    optionally identifies the versions of its files by their content.
+    """
+
+    def __init__(self, artifact_dir, versioned=True):
+        super().__init__(str(artifact_dir))
+        self.repo = LocalArtifactRepository(str(artifact_dir))
+        self.versioned = versioned
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self.repo.log_artifact(local_file, artifact_path)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self.repo.log_artifacts(local_dir, artifact_path)
+
+    def list_artifacts(self, path=None):
+        return self.repo.list_artifacts(path)
+
+    def _list_artifacts_with_versions(self, path=None):
+        return [
+            (
+                file_info,
+                open(os.path.join(self.artifact_uri, file_info.path)).read()
+                if self.versioned and not file_info.is_dir
+                else None,
+            )
+            for file_info in self.list_artifacts(path)
+        ]
+
+    def _download_file(self, remote_file_path, local_path):
+        self.repo._download_file(remote_file_path, local_path)
+
+
+@pytest.fixture
+def versioned_repo(tmp_path):
+    repo = VersionedArtifactRepository(tmp_path / "artifacts")
+    src = tmp_path / "src"
+    src.mkdir()
+    src.joinpath("a.txt").write_text("a")
+    repo.log_artifacts(str(src), "model")
+    return repo
+
+
+def test_download_artifacts_with_cache_downloads_again_overwritten_artifacts(
+    cache_dir, versioned_repo, tmp_path
+):
+    path1 = download_artifacts_with_cache(versioned_repo, "model")
+    versioned_repo.log_artifact(str(tmp_path / "src" / "a.txt"), "model")
+    assert download_artifacts_with_cache(versioned_repo, "model") != path1
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Overwrite a file with content of the same size
+    tmp_path.joinpath("src", "a.txt").write_text("A")
+    versioned_repo.log_artifact(str(tmp_path / "src" / "a.txt"), "model")
+    path2 = download_artifacts_with_cache(versioned_repo, "model")
+    assert open(os.path.join(path2, "a.txt")).read() == "A"
+    assert open(os.path.join(path1, "a.txt")).read() == "a"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_download_artifacts_with_cache_skips_unversioned_artifacts(cache_dir, versioned_repo):
+    versioned_repo.versioned = False
+    local_path = download_artifacts_with_cache(versioned_repo, "model")
+    assert open(os.path.join(local_path, "a.txt")).read() == "a"
+    assert not cache_dir.exists()
+
+
+def test_download_artifacts_with_cache_returns_artifacts_surviving_eviction(
+    cache_dir, versioned_repo
+):
+    local_path = download_artifacts_with_cache(versioned_repo, "model/a.txt")
+    assert not local_path.startswith(str(cache_dir))
+    shutil.rmtree(cache_dir)
+    assert open(local_path).read() == "a"
+
+    # Artifacts evicted while they're copied out of the cache are downloaded again
+    with mock.patch(
+        "mlflow.store.artifact.download_cache._link_or_copy", side_effect=FileNotFoundError
+    ):
+        local_path = download_artifacts_with_cache(versioned_repo, "model/a.txt")
+    assert open(local_path).read() == "a"
+
+
+def test_download_artifacts_with_cache_is_disabled_by_default(s3_repo, tmp_path):
+    with mock.patch("mlflow.store.artifact.download_cache._get_cache_key") as get_key_mock:
+        local_path = download_artifacts_with_cache(s3_repo, "model/a.txt", str(tmp_path))
+        get_key_mock.assert_not_called()
+    assert open(local_path).read() == "a"
+
+
+@pytest.mark.parametrize(
+    "env_var", ["MLFLOW_ARTIFACT_COMPRESSION", "MLFLOW_ARTIFACT_BLOB_STORE_URI"]
+)
+def test_download_artifacts_with_cache_skips_wrapped_local_repositories(
+    env_var, cache_dir, monkeypatch, tmp_path
+):
+    monkeypatch.setenv(
+        env_var, "gzip" if env_var == "MLFLOW_ARTIFACT_COMPRESSION" else str(tmp_path)
+    )
+    src = tmp_path / "a.txt"
+    src.write_text("a")
+    repo = get_artifact_repository(str(tmp_path / "artifacts"))
+    repo.log_artifact(str(src))
+
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    with mock.patch("mlflow.store.artifact.download_cache._get_cache_key") as get_key_mock:
+        local_path = download_artifacts_with_cache(repo, "a.txt", str(dst_path))
+        get_key_mock.assert_not_called()
+    assert open(local_path).read() == "a"
+    assert not cache_dir.exists()
+
+
+def test_download_artifacts_with_cache_uses_model_version(cache_dir, s3_repo, tmp_path):
+    with mock.patch.object(
+        ModelsArtifactRepository, "get_underlying_uri", return_value=s3_repo.artifact_uri
+    ):
+        repo = ModelsArtifactRepository("models:/model/1")
+    path1 = download_artifacts_with_cache(repo, "model")
+    # The artifacts of a model version aren't listed to check whether they were modified
+    modified = tmp_path / "a.txt"
+    modified.write_text("aaa")
+    s3_repo.log_artifact(str(modified), "model")
+
+    path2 = download_artifacts_with_cache(repo, "model")
+    assert path1 == path2
+    assert open(os.path.join(path2, "a.txt")).read() == "a"
+
+
+def test_artifact_download_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = ArtifactDownloadCache(str(tmp_path), max_size=10)
+
+    def download(content):
+        def download_fn(dst):
+            path = os.path.join(dst, "file")
+            with open(path, "w") as f:
+                f.write(content)
+            return path
+
+        return download_fn
+
+    cache.get_or_download("k1", download("1234"))
+    cache.get_or_download("k2", download("1234"))
+    os.utime(tmp_path / "k1", (0, 0))
+    os.utime(tmp_path / "k2", (1, 1))
+    # Accessing the first entry makes the second one the least recently used
+    assert cache.get("k1") is not None
+    cache.get_or_download("k3", download("1234"))
+    assert cache.get("k2") is None
+    assert cache.get("k1") is not None
+    # The entry that was just downloaded isn't evicted even if it exceeds the maximum size
+    data_dir, relative_path = cache.get_or_download("k4", download("x" * 20))
+    assert open(os.path.join(data_dir, relative_path)).read() == "x" * 20
+    assert sorted(os.listdir(tmp_path)) == ["k4"]
+
+
+def test_artifact_download_cache_shares_concurrent_downloads(tmp_path):
+    cache = ArtifactDownloadCache(str(tmp_path), max_size=100)
+    barrier = threading.Barrier(4)
+
+    def download_fn(dst):
+        barrier.wait()
+        path = os.path.join(dst, "file")
+        with open(path, "w") as f:
+            f.write(threading.current_thread().name)
+        return path
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_download("k", download_fn)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == 1
+    assert os.listdir(tmp_path) == ["k"]
+
+
+def test_download_artifacts_uses_cache(cache_dir, s3_repo):
+    local_path = mlflow.artifacts.download_artifacts(artifact_uri=f"{s3_repo.artifact_uri}/model")
+    assert len(os.listdir(cache_dir)) == 1
+    assert open(os.path.join(local_path, "a.txt")).read() == "a"
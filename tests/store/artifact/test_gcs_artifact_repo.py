@@ -7,7 +7,10 @@ from unittest import mock
 from google.cloud.storage import client as gcs_client
 from google.auth.exceptions import DefaultCredentialsError
 
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
 from tests.helper_functions import mock_method_chain
 
@@ -19,7 +22,7 @@ def mock_client():
 
 def test_artifact_uri_factory():
     repo = get_artifact_repository("gs://test_bucket/some/path")
-    assert isinstance(repo, GCSArtifactRepository)
+    assert isinstance(get_underlying_artifact_repository(repo), GCSArtifactRepository)
 
 
 def test_list_artifacts_empty(mock_client):
@@ -4,7 +4,11 @@ from unittest import mock
 
 import pytest
 
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
 from mlflow.store.artifact.http_artifact_repo import HttpArtifactRepository
 from mlflow.tracking._tracking_service.utils import _get_default_host_creds
 from mlflow.utils.rest_utils import MlflowHostCreds
@@ -21,7 +25,7 @@ from mlflow.environment_variables import (
 @pytest.mark.parametrize("scheme", ["http", "https"])
 def test_artifact_uri_factory(scheme):
     repo = get_artifact_repository(f"{scheme}://test.com")
-    assert isinstance(repo, HttpArtifactRepository)
+    assert isinstance(get_underlying_artifact_repository(repo), HttpArtifactRepository)
 
 
 class MockResponse:
@@ -97,6 +101,91 @@ def test_log_artifact(http_artifact_repo, tmp_path, artifact_path, filename, exp
             http_artifact_repo.log_artifact(file_path, artifact_path)
 
 
+def test_log_artifact_with_multipart_upload(http_artifact_repo, tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", "10")
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", "4")
+    file_path = tmp_path.joinpath("a.txt")
+    file_path.write_text("0123456789")
+
+    def http_request(host_creds, endpoint, method, **kwargs):
+        if endpoint.startswith("/mlflow-artifacts/mpu/upload-part/"):
+            return MockResponse({"etag": f"etag-{kwargs['data'].decode()}"}, 200)
+        return MockResponse({"upload_id": "123"}, 200)
+
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request", side_effect=http_request
+    ) as mock_request:
+        http_artifact_repo.log_artifact(file_path, "dir")
+
+    upload_part_calls = sorted(
+        (c for c in mock_request.call_args_list if c.args[2] == "PUT"),
+        key=lambda c: c.kwargs["params"]["part_number"],
+    )
+    assert [(c.kwargs["params"], c.kwargs["data"]) for c in upload_part_calls] == [
+        ({"upload_id": "123", "part_number": 1}, b"0123"),
+        ({"upload_id": "123", "part_number": 2}, b"4567"),
+        ({"upload_id": "123", "part_number": 3}, b"89"),
+    ]
+    mock_request.assert_called_with(
+        MlflowHostCreds("http://test.com/api/2.0"),
+        "/mlflow-artifacts/mpu/complete/dir/a.txt",
+        "POST",
+        json={
+            "upload_id": "123",
+            "parts": [
+                {"part_number": 1, "etag": "etag-0123"},
+                {"part_number": 2, "etag": "etag-4567"},
+                {"part_number": 3, "etag": "etag-89"},
+            ],
+        },
+    )
+
+
+def test_log_artifact_with_multipart_upload_aborts_on_failure(
+    http_artifact_repo, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", "10")
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", "4")
+    file_path = tmp_path.joinpath("a.txt")
+    file_path.write_text("0123456789")
+
+    def http_request(host_creds, endpoint, method, **kwargs):
+        if endpoint.startswith("/mlflow-artifacts/mpu/upload-part/"):
+            return MockResponse({}, 500 if kwargs["params"]["part_number"] == 2 else 200)
+        return MockResponse({"upload_id": "123"}, 200)
+
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request", side_effect=http_request
+    ) as mock_request:
+        with pytest.raises(MlflowException, match="Failed to upload at least one part"):
+            http_artifact_repo.log_artifact(file_path)
+
+    mock_request.assert_called_with(
+        MlflowHostCreds("http://test.com/api/2.0"),
+        "/mlflow-artifacts/mpu/abort/a.txt",
+        "POST",
+        json={"upload_id": "123"},
+    )
+
+
+def test_log_artifact_falls_back_to_single_request_without_multipart_upload_support(
+    http_artifact_repo, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", "1")
+    file_path = tmp_path.joinpath("a.txt")
+    file_path.write_text("0")
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request",
+        side_effect=[MockResponse({}, 501), MockResponse({}, 200)],
+    ) as mock_request:
+        http_artifact_repo.log_artifact(file_path)
+
+    assert [c.args[1:3] for c in mock_request.call_args_list] == [
+        ("/mlflow-artifacts/mpu/create/a.txt", "POST"),
+        ("/a.txt", "PUT"),
+    ]
+
+
 @pytest.mark.parametrize("artifact_path", [None, "dir"])
 def test_log_artifacts(http_artifact_repo, tmp_path, artifact_path):
     tmp_path_a = tmp_path.joinpath("a.txt")
@@ -180,6 +269,53 @@ def test_list_artifacts(http_artifact_repo):
             http_artifact_repo.list_artifacts()
 
 
+def test_list_artifacts_recursive(http_artifact_repo):
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request",
+        return_value=MockResponse(
+            {
+                "files": [
+                    {"path": "a/1.txt", "is_dir": False, "file_size": 1},
+                    {"path": "b/2.txt", "is_dir": False, "file_size": 2},
+                ]
+            },
+            200,
+        ),
+    ) as mock_get:
+        artifacts = http_artifact_repo.list_artifacts_recursive(path="path")
+        assert [(a.path, a.file_size) for a in artifacts] == [
+            ("path/a/1.txt", 1),
+            ("path/b/2.txt", 2),
+        ]
+        endpoint = "/mlflow-artifacts/artifacts"
+        url, _ = http_artifact_repo.artifact_uri.split(endpoint, maxsplit=1)
+        mock_get.assert_called_once_with(
+            _get_default_host_creds(url),
+            endpoint,
+            "GET",
+            params={"path": "path", "recursive": "true"},
+        )
+
+
+def test_list_artifacts_recursive_with_server_listing_directories(http_artifact_repo):
+    def list_artifacts(host_creds, endpoint, method, params):
+        files = {
+            "": [
+                {"path": "1.txt", "is_dir": False, "file_size": 1},
+                {"path": "dir", "is_dir": True},
+            ],
+            "dir": [{"path": "2.txt", "is_dir": False, "file_size": 2}],
+        }[params["path"]]
+        return MockResponse({"files": files}, 200)
+
+    # Servers that don't support recursive listings ignore the `recursive` parameter
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request", side_effect=list_artifacts
+    ):
+        artifacts = http_artifact_repo.list_artifacts_recursive()
+        assert [a.path for a in artifacts] == ["1.txt", "dir/2.txt"]
+
+
 def read_file(path):
     with open(path) as f:
         return f.read()
@@ -209,6 +345,30 @@ def test_download_file(http_artifact_repo, tmp_path, remote_file_path):
             http_artifact_repo._download_file(remote_file_path, tmp_path)
 
 
+@pytest.mark.parametrize(
+    ("status_code", "data"),
+    [
+        # Servers that don't support ranges respond with the whole file
+        (200, "0123456789"),
+        (206, "2345"),
+    ],
+)
+def test_download_artifact_stream_range(http_artifact_repo, status_code, data):
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request",
+        return_value=MockStreamResponse(data, status_code),
+    ) as mock_get:
+        chunks = http_artifact_repo._download_artifact_stream("a.txt", 2, 5)
+        assert b"".join(chunks) == b"2345"
+        mock_get.assert_called_once_with(
+            http_artifact_repo._host_creds,
+            "/a.txt",
+            "GET",
+            stream=True,
+            extra_headers={"Range": "bytes=2-5"},
+        )
+
+
 def test_download_artifacts(http_artifact_repo, tmp_path):
     # This test simulates downloading artifacts in the following structure:
     # ---------
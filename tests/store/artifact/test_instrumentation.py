@@ -0,0 +1,191 @@
+import io
+import os
+from unittest import mock
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.instrumentation import (
+    ArtifactTransferListenerRegistry,
+    _ProgressBar,
+    record_retries,
+    register_artifact_transfer_listener,
+    unregister_artifact_transfer_listener,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+
+@pytest.fixture
+def events():
+    events = []
+    register_artifact_transfer_listener(events.append)
+    yield events
+    unregister_artifact_transfer_listener(events.append)
+
+
+@pytest.fixture
+def local_repo(tmp_path):
+    return LocalArtifactRepository(str(tmp_path / "artifacts"))
+
+
+@pytest.fixture
+def local_dir(tmp_path):
+    local_dir = tmp_path / "local"
+    local_dir.joinpath("subdir").mkdir(parents=True)
+    local_dir.joinpath("a.txt").write_text("aaa")
+    local_dir.joinpath("subdir", "b.txt").write_text("bb")
+    return local_dir
+
+
+class DelegatingArtifactRepository(ArtifactRepository):
+    def __init__(self, repo):
+        super().__init__(repo.artifact_uri)
+        self.repo = repo
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self.repo.log_artifact(local_file, artifact_path)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self.repo.log_artifacts(local_dir, artifact_path)
+
+    def list_artifacts(self, path=None):
+        return self.repo.list_artifacts(path)
+
+    def _download_file(self, remote_file_path, local_path):
+        self.repo._download_file(remote_file_path, local_path)
+
+    def _download_artifact_stream(self, artifact_path, range_start=0, range_end=None):
+        return self.repo._download_artifact_stream(artifact_path, range_start, range_end)
+
+
+def summarize(events):
+    return sorted(
+        (e.operation, e.scope, e.backend, e.path, e.num_bytes, e.retries, e.error) for e in events
+    )
+
+
+def test_transfers_are_reported(events, local_repo, local_dir, tmp_path):
+    local_repo.log_artifact(str(local_dir / "a.txt"), "dir")
+    local_repo.log_artifacts(str(local_dir), "model")
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    local_repo.download_artifacts("model", str(dst_path))
+
+    backend = "LocalArtifactRepository"
+    assert summarize(events) == [
+        ("download", "file", backend, "model/a.txt", 3, 0, None),
+        ("download", "file", backend, "model/subdir/b.txt", 2, 0, None),
+        ("download", "operation", backend, "model", 5, 0, None),
+        ("upload", "file", backend, "dir/a.txt", 3, 0, None),
+        ("upload", "operation", backend, "model", 5, 0, None),
+    ]
+    assert all(e.artifact_uri == local_repo.artifact_uri for e in events)
+    assert all(e.duration_seconds >= 0 for e in events)
+
+
+def test_transfers_are_reported_by_the_repository_they_are_delegated_to(
+    events, local_repo, local_dir, tmp_path
+):
+    repo = DelegatingArtifactRepository(local_repo)
+    repo.log_artifact(str(local_dir / "a.txt"))
+    repo.log_artifacts(str(local_dir / "subdir"), "subdir")
+    assert summarize(events) == [
+        ("upload", "file", "LocalArtifactRepository", "a.txt", 3, 0, None),
+        ("upload", "operation", "LocalArtifactRepository", "subdir", 2, 0, None),
+    ]
+
+    events.clear()
+    dst_path = tmp_path / "dst"
+    dst_path.mkdir()
+    repo.download_artifacts("", str(dst_path))
+    assert summarize(events) == [
+        ("download", "file", "LocalArtifactRepository", "a.txt", 3, 0, None),
+        ("download", "file", "LocalArtifactRepository", "subdir/b.txt", 2, 0, None),
+        ("download", "operation", "DelegatingArtifactRepository", "", 5, 0, None),
+    ]
+
+
+def test_retries_are_reported(events, local_repo, local_dir, tmp_path):
+    local_repo.log_artifacts(str(local_dir))
+    events.clear()
+
+    class RetryingArtifactRepository(DelegatingArtifactRepository):
+        def _download_file(self, remote_file_path, local_path):
+            record_retries(2)
+            self.repo._download_file(remote_file_path, local_path)
+
+    RetryingArtifactRepository(local_repo).download_artifacts("a.txt", str(tmp_path))
+    assert summarize(events) == [
+        ("download", "file", "LocalArtifactRepository", "a.txt", 3, 2, None),
+        ("download", "operation", "RetryingArtifactRepository", "a.txt", 3, 0, None),
+    ]
+
+
+def test_failed_transfers_are_reported(events, local_repo, tmp_path):
+    with pytest.raises(MlflowException, match="failures occurred while downloading"):
+        local_repo.download_artifacts("missing", str(tmp_path))
+    file_event, operation_event = sorted(events, key=lambda e: e.scope)
+    assert (file_event.scope, file_event.path, file_event.num_bytes) == ("file", "missing", 0)
+    assert isinstance(file_event.error, FileNotFoundError)
+    assert (operation_event.scope, operation_event.num_bytes) == ("operation", 0)
+    assert isinstance(operation_event.error, MlflowException)
+
+
+def test_streams_are_reported(events, local_repo):
+    local_repo._log_artifact_stream(io.BytesIO(b"0123456789"), "dir/stream.txt")
+    chunks = local_repo._download_artifact_stream("dir/stream.txt", 2, 5)
+    # Downloads of streams are reported once they're consumed
+    assert len(events) == 1
+    assert b"".join(chunks) == b"2345"
+    assert summarize(events) == [
+        ("download", "file", "LocalArtifactRepository", "dir/stream.txt", 4, 0, None),
+        ("upload", "file", "LocalArtifactRepository", "dir/stream.txt", 10, 0, None),
+    ]
+
+    events.clear()
+    repo = DelegatingArtifactRepository(local_repo)
+    chunks = repo._download_artifact_stream("dir/stream.txt")
+    chunks.close()
+    assert summarize(events) == [
+        ("download", "file", "LocalArtifactRepository", "dir/stream.txt", 0, 0, None)
+    ]
+
+
+def test_transfers_are_not_instrumented_without_listeners(local_repo, local_dir):
+    with mock.patch(
+        "mlflow.store.artifact.instrumentation._artifact_transfer_listener_registry",
+        ArtifactTransferListenerRegistry(),
+    ), mock.patch("mlflow.store.artifact.instrumentation._Transfer") as transfer_mock:
+        local_repo.log_artifacts(str(local_dir))
+        list(local_repo._download_artifact_stream("a.txt"))
+    transfer_mock.assert_not_called()
+
+
+def test_listener_failures_are_logged(local_repo, local_dir):
+    def listener(event):
+        raise Exception("listener failure")
+
+    register_artifact_transfer_listener(listener)
+    try:
+        with mock.patch("mlflow.store.artifact.instrumentation._logger.warning") as warning_mock:
+            local_repo.log_artifact(str(local_dir / "a.txt"))
+        warning_mock.assert_called_once()
+    finally:
+        unregister_artifact_transfer_listener(listener)
+    assert os.path.exists(os.path.join(local_repo.artifact_dir, "a.txt"))
+
+
+def test_progress_bar_is_disabled_by_default():
+    assert _ProgressBar.create("Downloading") is None
+
+
+def test_progress_bar_reports_download_progress(monkeypatch, local_repo, local_dir, tmp_path):
+    pytest.importorskip("tqdm")
+    monkeypatch.setenv("MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR", "true")
+    local_repo.log_artifacts(str(local_dir))
+    repo = DelegatingArtifactRepository(local_repo)
+    with mock.patch.object(_ProgressBar, "close", autospec=True) as close_mock:
+        repo.download_artifacts("", str(tmp_path))
+    [(progress_bar,), _] = close_mock.call_args
+    assert progress_bar._pbar.n == progress_bar._pbar.total == 5
@@ -1,8 +1,11 @@
+import io
 import os
 import pytest
 import posixpath
+import time
 
 from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from mlflow.utils.file_utils import TempDir
 
@@ -31,6 +34,29 @@ def test_list_artifacts(local_artifact_repo, local_artifact_root):
     assert artifacts_list[0].path == artifact_rel_path
 
 
+def test_list_artifacts_recursive(local_artifact_repo, local_artifact_root):
+    assert local_artifact_repo.list_artifacts_recursive() == []
+
+    os.makedirs(os.path.join(local_artifact_root, "dir", "subdir"))
+    os.makedirs(os.path.join(local_artifact_root, "dir", "empty"))
+    for path in ["a.txt", os.path.join("dir", "subdir", "b.txt")]:
+        with open(os.path.join(local_artifact_root, path), "w") as f:
+            f.write("artifact")
+
+    artifacts = local_artifact_repo.list_artifacts_recursive()
+    assert [(a.path, a.is_dir) for a in artifacts] == [
+        ("a.txt", False),
+        ("dir/empty", True),
+        ("dir/subdir/b.txt", False),
+    ]
+    # The listing matches the default implementation crawling directories
+    assert artifacts == ArtifactRepository.list_artifacts_recursive(local_artifact_repo)
+    assert [a.path for a in local_artifact_repo.list_artifacts_recursive("dir/subdir")] == [
+        "dir/subdir/b.txt"
+    ]
+    assert local_artifact_repo.list_artifacts_recursive("a.txt") == []
+
+
 def test_log_artifacts(local_artifact_repo, local_artifact_root):
     artifact_rel_path = "test.txt"
     artifact_text = "hello world!"
@@ -190,3 +216,71 @@ def test_delete_artifacts(local_artifact_repo):
 
 def test_delete_artifacts_with_nonexistent_path_succeeds(local_artifact_repo):
     local_artifact_repo.delete_artifacts("nonexistent")
+
+
+def test_log_and_download_artifact_streams(local_artifact_repo, local_artifact_root):
+    local_artifact_repo._log_artifact_stream(io.BytesIO(b"0123456789"), "dir/file.txt")
+    assert os.listdir(os.path.join(local_artifact_root, "dir")) == ["file.txt"]
+    assert local_artifact_repo._get_artifact_file_size("dir/file.txt") == 10
+    assert b"".join(local_artifact_repo._download_artifact_stream("dir/file.txt")) == b"0123456789"
+    assert b"".join(local_artifact_repo._download_artifact_stream("dir/file.txt", 2, 4)) == b"234"
+    assert b"".join(local_artifact_repo._download_artifact_stream("dir/file.txt", 8)) == b"89"
+
+    with pytest.raises(MlflowException, match="does not exist"):
+        local_artifact_repo._get_artifact_file_size("dir")
+    with pytest.raises(MlflowException, match="Invalid artifact path"):
+        local_artifact_repo._log_artifact_stream(io.BytesIO(b""), "../file.txt")
+
+
+def test_multipart_upload(local_artifact_repo, local_artifact_root):
+    upload_id = local_artifact_repo._create_multipart_upload("dir/file.txt")
+    parts = [
+        (
+            part_number,
+            local_artifact_repo._upload_multipart_part(
+                "dir/file.txt", upload_id, part_number, io.BytesIO(data)
+            ),
+        )
+        for part_number, data in [(2, b"456"), (1, b"0123")]
+    ]
+    local_artifact_repo._complete_multipart_upload("dir/file.txt", upload_id, parts)
+
+    with open(os.path.join(local_artifact_root, "dir", "file.txt"), "rb") as f:
+        assert f.read() == b"0123456"
+    assert os.listdir(os.path.join(local_artifact_root, "dir")) == ["file.txt"]
+    with pytest.raises(MlflowException, match="does not exist"):
+        local_artifact_repo._upload_multipart_part("dir/file.txt", upload_id, 3, io.BytesIO(b""))
+
+
+def test_multipart_upload_abort_and_validation(local_artifact_repo):
+    upload_id = local_artifact_repo._create_multipart_upload("file.txt")
+    local_artifact_repo._upload_multipart_part("file.txt", upload_id, 1, io.BytesIO(b"0"))
+    with pytest.raises(MlflowException, match=r"Parts \['2'\] of multipart upload"):
+        local_artifact_repo._complete_multipart_upload("file.txt", upload_id, [(1, ""), (2, "")])
+    local_artifact_repo._abort_multipart_upload("file.txt", upload_id)
+    assert local_artifact_repo.list_artifacts() == []
+
+    with pytest.raises(MlflowException, match="Invalid multipart upload ID"):
+        local_artifact_repo._upload_multipart_part("file.txt", "../../x", 1, io.BytesIO(b"0"))
+
+
+def test_multipart_upload_parts_are_staged_in_artifact_root(local_artifact_repo):
+    local_artifact_repo.log_artifact(__file__, "dir")
+    upload_id = local_artifact_repo._create_multipart_upload("file.txt")
+    local_artifact_repo._upload_multipart_part("file.txt", upload_id, 1, io.BytesIO(b"0"))
+    upload_dir = local_artifact_repo._get_multipart_upload_dir(upload_id)
+    assert upload_dir.startswith(local_artifact_repo.artifact_dir)
+    assert os.path.isfile(os.path.join(upload_dir, "1"))
+
+    # The staged parts aren't listed as artifacts
+    assert [f.path for f in local_artifact_repo.list_artifacts()] == ["dir"]
+    assert [f.path for f in local_artifact_repo.list_artifacts_recursive()] == [
+        posixpath.join("dir", os.path.basename(__file__))
+    ]
+
+    # Abandoned uploads are deleted when an upload is created
+    stale_time = time.time() - 2 * 24 * 60 * 60
+    os.utime(upload_dir, (stale_time, stale_time))
+    new_upload_id = local_artifact_repo._create_multipart_upload("file.txt")
+    assert not os.path.exists(upload_dir)
+    assert os.path.isdir(local_artifact_repo._get_multipart_upload_dir(new_upload_id))
@@ -4,7 +4,10 @@ import posixpath
 import pytest
 
 from mlflow.store.artifact.mlflow_artifacts_repo import MlflowArtifactsRepository
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
 from mlflow.exceptions import MlflowException
 from mlflow.tracking._tracking_service.utils import _get_default_host_creds
 
@@ -20,7 +23,7 @@ def set_tracking_uri():
 
 def test_artifact_uri_factory():
     repo = get_artifact_repository("mlflow-artifacts://test.com")
-    assert isinstance(repo, MlflowArtifactsRepository)
+    assert isinstance(get_underlying_artifact_repository(repo), MlflowArtifactsRepository)
 
 
 base_url = "/api/2.0/mlflow-artifacts/artifacts"
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import mlflow
 from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repository_registry import get_underlying_artifact_repository
 from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 
@@ -85,7 +86,7 @@ def test_runs_artifact_repo_init_with_real_run():
     runs_repo = RunsArtifactRepository(runs_uri)
 
     assert runs_repo.artifact_uri == runs_uri
-    assert isinstance(runs_repo.repo, S3ArtifactRepository)
+    assert isinstance(get_underlying_artifact_repository(runs_repo.repo), S3ArtifactRepository)
     expected_absolute_uri = f"{artifact_location}{run_id}/artifacts/path/to/model"
     assert runs_repo.repo.artifact_uri == expected_absolute_uri
 
@@ -1,3 +1,4 @@
+import io
 import os
 import posixpath
 import tarfile
@@ -6,6 +7,7 @@ from datetime import datetime
 
 import pytest
 
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.s3_artifact_repo import (
     S3ArtifactRepository,
@@ -252,6 +254,32 @@ def test_file_and_directories_artifacts_are_logged_and_listed_successfully_in_ba
     assert nested_artifacts_listing == [("nested/c.txt", False, 1)]
 
 
+def test_list_artifacts_recursive(s3_artifact_root, tmp_path):
+    nested = tmp_path / "dir" / "nested"
+    nested.mkdir(parents=True)
+    tmp_path.joinpath("a.txt").write_text("A")
+    nested.joinpath("b.txt").write_text("BB")
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifacts(str(tmp_path))
+    # Directory placeholder objects, as created by the S3 console
+    s3 = repo._get_s3_client()
+    bucket, _ = repo.parse_s3_uri(repo.artifact_uri)
+    s3.put_object(Bucket=bucket, Key="some/path/dir/", Body=b"")
+    s3.put_object(Bucket=bucket, Key="some/path/empty/", Body=b"")
+
+    with mock.patch.object(repo, "list_artifacts") as list_artifacts_mock:
+        artifacts = [(f.path, f.is_dir, f.file_size) for f in repo.list_artifacts_recursive()]
+        list_artifacts_mock.assert_not_called()
+    assert artifacts == [
+        ("a.txt", False, 1),
+        ("dir/nested/b.txt", False, 2),
+        ("empty", True, None),
+    ]
+    assert [f.path for f in repo.list_artifacts_recursive("dir")] == ["dir/nested/b.txt"]
+    assert repo.list_artifacts_recursive("a.txt") == []
+
+
 def test_download_directory_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
     s3_artifact_root, tmp_path
 ):
@@ -346,3 +374,40 @@ def test_delete_artifacts(s3_artifact_root, tmp_path):
     repo.delete_artifacts()
     tmpdir_objects = repo.list_artifacts()
     assert not tmpdir_objects
+
+
+def test_log_and_download_artifact_streams(s3_artifact_root):
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo._log_artifact_stream(io.BytesIO(b"0123456789"), "dir/file.txt")
+    repo._log_artifact_stream(io.BytesIO(b""), "empty.txt")
+
+    assert [f.path for f in repo.list_artifacts("dir")] == ["dir/file.txt"]
+    assert repo._get_artifact_file_size("dir/file.txt") == 10
+    assert b"".join(repo._download_artifact_stream("dir/file.txt")) == b"0123456789"
+    assert b"".join(repo._download_artifact_stream("dir/file.txt", 2, 4)) == b"234"
+    assert b"".join(repo._download_artifact_stream("dir/file.txt", 8)) == b"89"
+    assert repo._get_artifact_file_size("empty.txt") == 0
+    assert b"".join(repo._download_artifact_stream("empty.txt")) == b""
+    with pytest.raises(MlflowException, match="does not exist"):
+        repo._get_artifact_file_size("missing.txt")
+
+
+def test_multipart_upload(s3_artifact_root):
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    # All the parts but the last one must be at least 5 MB large
+    first_part = b"0" * 5 * 1024 * 1024
+    upload_id = repo._create_multipart_upload("dir/file.txt")
+    parts = [
+        (
+            part_number,
+            repo._upload_multipart_part("dir/file.txt", upload_id, part_number, io.BytesIO(data)),
+        )
+        for part_number, data in [(1, first_part), (2, b"1")]
+    ]
+    repo._complete_multipart_upload("dir/file.txt", upload_id, parts)
+    assert b"".join(repo._download_artifact_stream("dir/file.txt")) == first_part + b"1"
+
+    upload_id = repo._create_multipart_upload("aborted.txt")
+    repo._upload_multipart_part("aborted.txt", upload_id, 1, io.BytesIO(b"0"))
+    repo._abort_multipart_upload("aborted.txt", upload_id)
+    assert [f.path for f in repo.list_artifacts()] == ["dir"]
@@ -1,6 +1,9 @@
 import pytest
 from tempfile import NamedTemporaryFile
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.artifact_repository_registry import (
+    get_artifact_repository,
+    get_underlying_artifact_repository,
+)
 from mlflow.store.artifact.sftp_artifact_repo import SFTPArtifactRepository
 from mlflow.utils.file_utils import TempDir
 import os
@@ -12,7 +15,8 @@ pytestmark = pytest.mark.requires_ssh
 
 
 def test_artifact_uri_factory(tmp_path):
-    assert isinstance(get_artifact_repository(f"sftp://{tmp_path}"), SFTPArtifactRepository)
+    repo = get_artifact_repository(f"sftp://{tmp_path}")
+    assert isinstance(get_underlying_artifact_repository(repo), SFTPArtifactRepository)
 
 
 def test_list_artifacts_empty(tmp_path):
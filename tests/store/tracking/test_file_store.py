@@ -4,6 +4,7 @@ import os
 import posixpath
 import random
 import shutil
+import sqlite3
 import time
 import uuid
 from pathlib import Path
@@ -32,6 +33,7 @@ from mlflow.exceptions import MlflowException, MissingConfigException
 from mlflow.models import Model
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.file_store_index import FileStoreRunIndex
 from mlflow.utils.file_utils import write_yaml, read_yaml, path_to_local_file_uri, TempDir
 from mlflow.utils.mlflow_tags import MLFLOW_DATASET_CONTEXT, MLFLOW_LOGGED_MODELS
 from mlflow.utils.os import is_windows
@@ -866,6 +868,26 @@ def test_get_run(store):
             _verify_run(store, run_id, run_data)
 
 
+def test_get_runs(store):
+    experiments, exp_data, run_data = _create_root(store)
+    run_ids = [run_id for exp_id in experiments for run_id in exp_data[exp_id]["runs"]]
+    random.shuffle(run_ids)
+    # The runs are found by listing the directory of each experiment once, rather than searching
+    # all the experiments for each run
+    with mock.patch(
+        FILESTORE_PACKAGE + ".FileStore._find_run_root", side_effect=Exception("Unexpected")
+    ):
+        runs = store.get_runs(run_ids + run_ids[:1])
+    assert [run.info.run_id for run in runs] == run_ids + run_ids[:1]
+    for run in runs:
+        assert run.to_dictionary() == store.get_run(run.info.run_id).to_dictionary()
+
+    nonexistent_uuid = uuid.uuid4().hex
+    with pytest.raises(MlflowException, match=f"Run '{nonexistent_uuid}' not found") as e:
+        store.get_runs([run_ids[0], nonexistent_uuid])
+    assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+
 def test_get_run_returns_name_in_info(store):
     run_id = store.create_run(
         experiment_id=FileStore.DEFAULT_EXPERIMENT_ID,
@@ -1024,6 +1046,24 @@ def test_get_metric_history(store):
                     assert metric.value == metric_value
 
 
+def test_get_sampled_metric_history_bulk(store):
+    exp_id = store.create_experiment("test_get_sampled_metric_history_bulk")
+    run_id1 = store.create_run(exp_id, "user", 0, [], "run1").info.run_id
+    run_id2 = store.create_run(exp_id, "user", 0, [], "run2").info.run_id
+    metrics = [Metric("m1", float(i % 10), 1000 + i, i) for i in range(100)]
+    store.log_batch(run_id1, metrics=metrics, params=[], tags=[])
+    store.log_metric(run_id2, Metric("m2", 1.0, 0, 0))
+
+    histories = store.get_sampled_metric_history_bulk([run_id1, run_id2], ["m1", "m2"], 10)
+    assert histories.keys() == {run_id1, run_id2}
+    assert histories[run_id1].keys() == {"m1"}
+    assert histories[run_id2] == {"m2": [Metric("m2", 1.0, 0, 0)]}
+    # 5 buckets of 20 steps, each one represented by its minimum and maximum value
+    assert [(m.step, m.value) for m in histories[run_id1]["m1"]] == [
+        (s, v) for b in range(5) for s, v in [(20 * b, 0.0), (20 * b + 9, 9.0)]
+    ]
+
+
 def test_get_metric_history_paginated_request_raises(store):
     with pytest.raises(
         MlflowException,
@@ -1135,6 +1175,188 @@ def test_search_runs_pagination(store):
     assert result.token is None
 
 
+def _search_run_dicts(store, experiment_id, filter_string=None, order_by=None, max_results=100):
+    return [
+        r.to_dictionary()
+        for r in store.search_runs(
+            [experiment_id], filter_string, ViewType.ALL, max_results, order_by=order_by
+        )
+    ]
+
+
+def test_search_runs_with_run_index_matches_search_without_run_index(store, monkeypatch):
+    exp = store.create_experiment("test_search_runs_with_run_index")
+    # runs created before the run index is enabled are indexed by the first search
+    run_ids = [store.create_run(exp, "user", 0, [], f"run_{i}").info.run_id for i in range(2)]
+    monkeypatch.setenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", "true")
+    run_ids += [store.create_run(exp, "user", i, [], f"run_{i}").info.run_id for i in range(2, 6)]
+    for i, run_id in enumerate(run_ids):
+        store.log_metric(run_id, Metric("m", i % 3, 1, 0))
+        store.log_metric(run_id, Metric("m", float("nan"), 0, 0))
+        store.log_batch(
+            run_id,
+            metrics=[Metric("m2", -i, 1, 1)],
+            params=[Param("p", str(i % 2))],
+            tags=[RunTag("t", f"value_{i}")],
+        )
+    store.set_tag(run_ids[0], RunTag("t", "updated"))
+    store.set_tag(run_ids[1], RunTag(MLFLOW_RUN_NAME, "renamed"))
+    store.delete_tag(run_ids[2], "t")
+    store.log_param(run_ids[3], Param("p2", "1.5"))
+    store.update_run_info(run_ids[4], RunStatus.FINISHED, 100, None)
+    store.delete_run(run_ids[5])
+
+    queries = [
+        (None, None),
+        ("metrics.m > 0", ["metrics.m2"]),
+        ("params.p = '1'", ["attributes.run_name DESC"]),
+        ("tags.t LIKE 'value%'", ["tags.t"]),
+        ("attributes.status = 'FINISHED'", None),
+        ("params.p2 = '1.5'", None),
+    ]
+    results_with_index = [_search_run_dicts(store, exp, *query) for query in queries]
+    assert os.path.exists(
+        os.path.join(store.root_directory, exp, FileStoreRunIndex.INDEX_FILE_NAME)
+    )
+    monkeypatch.delenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX")
+    assert results_with_index == [_search_run_dicts(store, exp, *query) for query in queries]
+
+    monkeypatch.setenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", "true")
+    store.restore_run(run_ids[5])
+    store._hard_delete_run(run_ids[0])
+    assert [r.info.run_id for r in store.search_runs([exp], None, ViewType.ACTIVE_ONLY)] == [
+        run_ids[5],
+        run_ids[4],
+        run_ids[3],
+        run_ids[2],
+        run_ids[1],
+    ]
+
+
+def test_search_runs_with_run_index_only_reads_requested_page(store, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", "true")
+    exp = store.create_experiment("test_search_runs_with_run_index_page")
+    runs = [store.create_run(exp, "user", i, [], "name").info.run_id for i in range(10)]
+    # index the runs
+    store.search_runs([exp], None, ViewType.ALL)
+
+    with mock.patch.object(
+        store, "_get_run_from_info", wraps=store._get_run_from_info
+    ) as mock_get_run_from_info:
+        result = store.search_runs([exp], None, ViewType.ALL, max_results=3)
+    assert [r.info.run_id for r in result] == runs[::-1][:3]
+    assert mock_get_run_from_info.call_count == 3
+
+
+def _search_all_run_ids(store, experiment_ids, filter_string, order_by, max_results):
+    run_ids = []
+    page_token = None
+    while True:
+        result = store.search_runs(
+            experiment_ids,
+            filter_string,
+            ViewType.ALL,
+            max_results,
+            order_by=order_by,
+            page_token=page_token,
+        )
+        run_ids.extend(r.info.run_id for r in result)
+        page_token = result.token
+        if not page_token:
+            return run_ids
+
+
+def test_search_runs_with_run_index_sorts_and_paginates_like_search_without_run_index(
+    store, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", "true")
+    exps = [store.create_experiment(f"test_search_runs_with_run_index_sort_{i}") for i in range(2)]
+    metric_values = [1.0, float("nan"), None, -1.0, 1.0, float("inf"), None, float("nan")]
+    for i, value in enumerate(metric_values):
+        run_id = store.create_run(exps[i % 2], "user", i // 3, [], f"Run_{i}").info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[] if value is None else [Metric("m", value, 0, 0)],
+            params=[Param("p", "abc"[i % 3])] if i % 4 else [],
+            tags=[RunTag("t", "Value" if i % 2 else "value")],
+        )
+
+    queries = [
+        (None, ["metrics.m"]),
+        (None, ["metrics.m DESC", "params.p"]),
+        (None, ["params.p DESC", "attributes.run_name"]),
+        ("metrics.m != 1", ["tags.t", "metrics.m DESC"]),
+        ("metrics.m <= 1", ["created"]),
+        ("tags.t LIKE 'val%'", None),
+        ("tags.t ILIKE 'val%' and params.p != 'a'", ["attributes.end_time"]),
+        ("attributes.run_name LIKE 'Run_%' and created >= 1", ["metrics.m"]),
+    ]
+    for filter_string, order_by in queries:
+        results_with_index = [
+            _search_all_run_ids(store, experiment_ids, filter_string, order_by, max_results)
+            for experiment_ids in (exps[:1], exps)
+            for max_results in (1, 3, 100)
+        ]
+        monkeypatch.delenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX")
+        assert results_with_index == [
+            _search_all_run_ids(store, experiment_ids, filter_string, order_by, max_results)
+            for experiment_ids in (exps[:1], exps)
+            for max_results in (1, 3, 100)
+        ]
+        monkeypatch.setenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", "true")
+
+
+def test_run_index_creates_schema_once(store, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", "true")
+    exp = store.create_experiment("test_run_index_creates_schema_once")
+    store.create_run(exp, "user", 0, [], "name")
+    statements = []
+    connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    with mock.patch("sqlite3.connect", side_effect=traced_connect):
+        store.search_runs([exp], None, ViewType.ALL)
+    assert statements
+    assert not any("CREATE TABLE" in statement for statement in statements)
+
+
+def test_search_runs_only_reads_referenced_data(store, monkeypatch):
+    monkeypatch.delenv("MLFLOW_ENABLE_FILE_STORE_RUN_INDEX", raising=False)
+    exp = store.create_experiment("test_search_runs_only_reads_referenced_data")
+    runs = []
+    for i in range(10):
+        run_id = store.create_run(exp, "user", i, [], "name").info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[Metric("m1", i, 0, 0), Metric("m2", -i, 0, 0)],
+            params=[Param("p1", str(i)), Param("p2", "value")],
+            tags=[],
+        )
+        runs.append(run_id)
+
+    with mock.patch.object(
+        store, "_get_metric_from_file", wraps=store._get_metric_from_file
+    ) as mock_get_metric_from_file, mock.patch.object(
+        store, "_get_param_from_file", wraps=store._get_param_from_file
+    ) as mock_get_param_from_file:
+        result = store.search_runs(
+            [exp], "params.p1 != '0'", ViewType.ALL, max_results=2, order_by=["metrics.m2"]
+        )
+    assert [r.info.run_id for r in result] == [runs[9], runs[8]]
+    assert result[0].data.metrics == {"m1": 9, "m2": -9}
+    assert result[0].data.params == {"p1": "9", "p2": "value"}
+    # The referenced metric and param are read for every run, while the other ones are only read
+    # for the runs of the requested page
+    metric_reads = [c.args[1] for c in mock_get_metric_from_file.call_args_list]
+    param_reads = [c.args[1] for c in mock_get_param_from_file.call_args_list]
+    assert sorted(metric_reads) == ["m1"] * 2 + ["m2"] * 12
+    assert sorted(param_reads) == ["p1"] * 12 + ["p2"] * 2
+
+
 def test_search_runs_run_name(store):
     exp_id = store.create_experiment("test_search_runs_pagination")
     run1 = store.create_run(exp_id, user_id="user", start_time=1000, tags=[], run_name="run_name1")
@@ -1798,6 +2020,60 @@ def test_log_batch(store):
     _verify_logged(store, run_id, metric_entities, param_entities, tag_entities)
 
 
+def test_log_batches(store):
+    run_ids = [
+        store.create_run(
+            experiment_id=FileStore.DEFAULT_EXPERIMENT_ID,
+            user_id="user",
+            start_time=0,
+            tags=[],
+            run_name="name",
+        ).info.run_id
+        for _ in range(3)
+    ]
+    store.log_batches(
+        [
+            (run_ids[0], [Metric("m", 0.5, 1, 0)], [Param("p", "0")], [RunTag("t", "a")]),
+            (run_ids[1], [Metric("m", 2.5, 1, 0)], [Param("p", "1")], []),
+            (run_ids[0], [Metric("n", 3.5, 1, 0)], [], [RunTag("t", "b")]),
+            (run_ids[2], [], [], [RunTag(MLFLOW_RUN_NAME, "renamed")]),
+        ]
+    )
+    _verify_logged(
+        store,
+        run_ids[0],
+        [Metric("m", 0.5, 1, 0), Metric("n", 3.5, 1, 0)],
+        [Param("p", "0")],
+        [RunTag("t", "b")],
+    )
+    _verify_logged(store, run_ids[1], [Metric("m", 2.5, 1, 0)], [Param("p", "1")], [])
+    assert store.get_run(run_ids[2]).info.run_name == "renamed"
+
+    # Nothing is logged if any of the runs is missing or not active
+    nonexistent_uuid = uuid.uuid4().hex
+    with pytest.raises(MlflowException, match=f"Run '{nonexistent_uuid}' not found"):
+        store.log_batches(
+            [
+                (run_ids[1], [Metric("m", 1.0, 2, 0)], [], []),
+                (nonexistent_uuid, [Metric("m", 1.0, 2, 0)], [], []),
+            ]
+        )
+    store.delete_run(run_ids[2])
+    with pytest.raises(MlflowException, match="must be in 'active' lifecycle_stage"):
+        store.log_batches(
+            [
+                (run_ids[1], [Metric("m", 1.0, 2, 0)], [], []),
+                (run_ids[2], [Metric("m", 1.0, 2, 0)], [], []),
+            ]
+        )
+    _verify_logged(store, run_ids[1], [Metric("m", 2.5, 1, 0)], [Param("p", "1")], [])
+
+    with pytest.raises(MlflowException, match="Duplicate parameter keys"):
+        store.log_batches(
+            [(run_ids[1], [], [Param("q", "0")], []), (run_ids[1], [], [Param("q", "0")], [])]
+        )
+
+
 def test_log_batch_max_length_value(store):
     param_entities = [Param("long param", "x" * 500), Param("short param", "xyz")]
     expected_param_entities = [
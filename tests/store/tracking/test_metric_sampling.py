@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from mlflow.entities import Metric
+from mlflow.store.tracking.metric_sampling import sample_metric_history
+
+
+def _sample(metrics, max_points, x_axis="step"):
+    return sample_metric_history(lambda: iter(metrics), max_points, x_axis)
+
+
+def test_sample_metric_history_returns_all_points_when_under_limit():
+    metrics = [Metric("m", float(i), 100 - i, i) for i in range(10)][::-1]
+    assert _sample(metrics, 10) == sorted(metrics, key=lambda m: m.step)
+    assert _sample(metrics, 10, x_axis="timestamp") == sorted(metrics, key=lambda m: m.timestamp)
+
+
+@pytest.mark.parametrize("max_points", [2, 3, 10, 99])
+def test_sample_metric_history_bounds_number_of_points(max_points):
+    metrics = [Metric("m", math.sin(i), i, i) for i in range(1000)]
+    sampled = _sample(metrics, max_points)
+    assert 0 < len(sampled) <= max_points
+    assert [m.step for m in sampled] == sorted(m.step for m in sampled)
+
+
+def test_sample_metric_history_keeps_extreme_values_of_each_bucket():
+    metrics = [Metric("m", 0.0, i, i) for i in range(100)]
+    metrics[10] = Metric("m", 5.0, 10, 10)
+    metrics[70] = Metric("m", -5.0, 70, 70)
+    sampled = _sample(metrics, 4)
+    # two buckets ([0, 50) and [50, 100)), each represented by its minimum and maximum value
+    assert sampled == [metrics[0], metrics[10], metrics[50], metrics[70]]
+
+
+def test_sample_metric_history_only_keeps_nan_for_buckets_without_other_values():
+    metrics = [Metric("m", float(i), i, i) for i in range(4)] + [
+        Metric("m", float("nan"), i, i) for i in range(4, 8)
+    ]
+    sampled = _sample(metrics, 4)
+    assert [m.step for m in sampled] == [0, 3, 4]
+    assert math.isnan(sampled[-1].value)
+
+
+def test_sample_metric_history_buckets_by_timestamp():
+    metrics = [Metric("m", float(i), 1000 * (i // 10), i) for i in range(100)]
+    sampled = _sample(metrics, 20, x_axis="timestamp")
+    assert len(sampled) == 20
+    assert [m.step for m in sampled[:2]] == [0, 9]
@@ -24,6 +24,7 @@ from mlflow.protos.service_pb2 import (
     DeleteExperiment,
     DeleteRun,
     LogBatch,
+    LogBatches,
     LogMetric,
     LogParam,
     RestoreExperiment,
@@ -481,3 +482,81 @@ def test_get_metric_history_on_non_existent_metric_key():
         metrics = rest_store.get_metric_history(run_id="1", metric_key="test_metric")
         mock_request.assert_called_once()
         assert metrics == []
+
+
+def _run_payload(run_id):
+    return {
+        "info": {"run_id": run_id, "run_uuid": run_id, "experiment_id": "0"},
+        "data": {"params": [{"key": "p", "value": run_id}]},
+    }
+
+
+def test_get_runs():
+    creds = MlflowHostCreds("https://hello")
+    store = RestStore(lambda: creds)
+    response = _mock_response_with_200_status_code()
+    response.text = json.dumps({"runs": [_run_payload("b"), _run_payload("a")]})
+    with mock.patch("requests.Session.request", return_value=response) as mock_request:
+        runs = store.get_runs(["b", "a"])
+        mock_request.assert_called_once()
+        assert mock_request.call_args.args[1] == "https://hello/api/2.0/mlflow/runs/get-batch"
+        assert mock_request.call_args.kwargs["json"] == {"run_ids": ["b", "a"]}
+    assert [run.info.run_id for run in runs] == ["b", "a"]
+    assert runs[0].data.params == {"p": "b"}
+
+
+def test_get_runs_falls_back_on_getting_each_run_from_older_servers():
+    creds = MlflowHostCreds("https://hello")
+    store = RestStore(lambda: creds)
+    not_found_response = mock.MagicMock(status_code=404, text="<html>Not Found</html>")
+    responses = [not_found_response]
+    for run_id in ["b", "a"]:
+        response = _mock_response_with_200_status_code()
+        response.text = json.dumps({"run": _run_payload(run_id)})
+        responses.append(response)
+    with mock.patch("requests.Session.request", side_effect=responses) as mock_request:
+        runs = store.get_runs(["b", "a"])
+        assert mock_request.call_count == 3
+        assert mock_request.call_args.args[1] == "https://hello/api/2.0/mlflow/runs/get"
+    assert [run.info.run_id for run in runs] == ["b", "a"]
+
+
+def test_log_batches():
+    creds = MlflowHostCreds("https://hello")
+    store = RestStore(lambda: creds)
+    batches = [
+        ("a", [Metric("m", 1.0, 1, 0)], [Param("p", "v")], []),
+        ("b", [], [], [RunTag("t", "v")]),
+    ]
+    expected_body = message_to_json(
+        LogBatches(
+            batches=[
+                LogBatch(
+                    run_id="a",
+                    metrics=[Metric("m", 1.0, 1, 0).to_proto()],
+                    params=[Param("p", "v").to_proto()],
+                ),
+                LogBatch(run_id="b", tags=[RunTag("t", "v").to_proto()]),
+            ]
+        )
+    )
+    with mock_http_request() as mock_http:
+        store.log_batches(batches)
+        mock_http.assert_called_once_with(**_args(creds, "runs/log-batches", "POST", expected_body))
+
+    # Older servers without the endpoint are sent a request per batch
+    not_found_response = mock.MagicMock(status_code=404, text="<html>Not Found</html>")
+    responses = [not_found_response] + [_mock_response_with_200_status_code() for _ in batches]
+    for response in responses[1:]:
+        response.text = "{}"
+    with mock.patch("requests.Session.request", side_effect=responses) as mock_request:
+        store.log_batches(batches)
+        assert [call.args[1] for call in mock_request.call_args_list] == [
+            "https://hello/api/2.0/mlflow/runs/log-batches",
+            "https://hello/api/2.0/mlflow/runs/log-batch",
+            "https://hello/api/2.0/mlflow/runs/log-batch",
+        ]
+        assert [call.kwargs["json"]["run_id"] for call in mock_request.call_args_list[1:]] == [
+            "a",
+            "b",
+        ]
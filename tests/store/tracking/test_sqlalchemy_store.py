@@ -45,11 +45,13 @@ from mlflow.store.tracking.dbmodels import models
 from mlflow.store.db.db_types import SQLITE, POSTGRES, MYSQL, MSSQL
 from mlflow import entities
 from mlflow.exceptions import MlflowException
+from mlflow.store.tracking.metric_sampling import sample_metric_history
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
 from mlflow.utils.mlflow_tags import MLFLOW_DATASET_CONTEXT, MLFLOW_RUN_NAME
 from mlflow.utils.name_utils import _GENERATOR_PREDICATES
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
 from mlflow.utils.time_utils import get_current_time_millis
 from mlflow.utils.os import is_windows
@@ -815,6 +817,69 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
         run_name = name_empty_str_run.info.run_name
         assert run_name.split("-")[0] in _GENERATOR_PREDICATES
 
+    def test_get_runs(self):
+        experiment_id = self._experiment_factory("test_get_runs")
+        run_ids = [
+            self._run_factory(self._get_run_configs(experiment_id)).info.run_id for _ in range(3)
+        ]
+        for i, run_id in enumerate(run_ids):
+            self.store.log_batch(
+                run_id,
+                metrics=[Metric("m", i, 0, 0), Metric("m", -1, 0, 1)],
+                params=[Param("p", str(i))],
+                tags=[RunTag("t", str(i))],
+            )
+        dataset = entities.Dataset(
+            name="name", digest="digest", source_type="st", source="source", schema="schema"
+        )
+        self.store.log_inputs(run_ids[1], [entities.DatasetInput(dataset, [])])
+
+        requested_run_ids = [run_ids[2], run_ids[0], run_ids[1], run_ids[0]]
+        with mock.patch.object(
+            self.store, "ManagedSessionMaker", wraps=self.store.ManagedSessionMaker
+        ) as session_maker_mock:
+            runs = self.store.get_runs(requested_run_ids)
+        session_maker_mock.assert_called_once()
+        assert [run.info.run_id for run in runs] == requested_run_ids
+        for run in runs:
+            expected_run = self.store.get_run(run.info.run_id)
+            assert run.info == expected_run.info
+            assert run.data.metrics == expected_run.data.metrics
+            assert run.data.params == expected_run.data.params
+            assert run.data.tags == expected_run.data.tags
+            assert len(run.inputs.dataset_inputs) == len(expected_run.inputs.dataset_inputs)
+        assert runs[0].data.metrics == {"m": -1}
+        assert runs[0].data.params == {"p": "2"}
+        assert runs[2].inputs.dataset_inputs[0].dataset.name == "name"
+        assert self.store.get_runs([]) == []
+
+    def test_get_runs_nonexistent_run(self):
+        run_id = self._run_factory().info.run_id
+        nonexistent_run_id = uuid.uuid4().hex
+        with pytest.raises(
+            MlflowException, match=rf"Run with id={nonexistent_run_id} not found"
+        ) as exception_context:
+            self.store.get_runs([run_id, nonexistent_run_id])
+        assert exception_context.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    def test_get_runs_limits(self):
+        with pytest.raises(MlflowException, match=r"A request can get at most 1000 runs"):
+            self.store.get_runs([uuid.uuid4().hex for _ in range(1001)])
+
+    def test_get_run_infos(self):
+        run_ids = [self._run_factory().info.run_id]
+        run_ids.append(
+            self._run_factory(self._get_run_configs(self._experiment_factory("exp"))).info.run_id
+        )
+        run_infos = self.store._get_run_infos(run_ids)
+        assert {run_id: info.experiment_id for run_id, info in run_infos.items()} == {
+            run_id: self.store.get_run(run_id).info.experiment_id for run_id in run_ids
+        }
+        for run_id, run_info in run_infos.items():
+            assert run_info == self.store.get_run(run_id).info
+        with pytest.raises(MlflowException, match=r"Run with id=.+ not found"):
+            self.store._get_run_infos([run_ids[0], uuid.uuid4().hex])
+
     def test_to_mlflow_entity_and_proto(self):
         # Create a run and log metrics, params, tags to the run
         created_run = self._run_factory()
@@ -978,6 +1043,61 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
                     >= 100
                 )
 
+    def _assert_latest_metrics_are_maintained(self):
+        run = self._run_factory()
+        run_id = run.info.run_id
+        self.store.log_batch(
+            run_id,
+            metrics=[Metric("a", 2, 10, 1), Metric("a", 1, 20, 1), Metric("b", float("nan"), 1, 0)],
+            params=[],
+            tags=[],
+        )
+        assert self.store.get_run(run_id).data.metrics["a"] == 1
+        # Less recent values don't overwrite the latest ones, regardless of the logging order
+        self.store.log_metric(run_id, Metric("a", 5, 30, 0))
+        self.store.log_metric(run_id, Metric("a", 0, 20, 1))
+        assert self.store.get_run(run_id).data.metrics["a"] == 1
+        # Values at the same step and timestamp are ordered by value
+        self.store.log_metric(run_id, Metric("a", 3, 20, 1))
+        self.store.log_metric(run_id, Metric("b", 4, 1, 0))
+        metrics = self.store.get_run(run_id).data.metrics
+        assert metrics == {"a": 3, "b": 4}
+        self.store.log_batch(
+            run_id,
+            metrics=[Metric("b", float("nan"), 0, 1), Metric("a", 0, 0, 2)],
+            params=[],
+            tags=[],
+        )
+        metrics = self.store.get_run(run_id).data.metrics
+        assert metrics["a"] == 0
+        assert math.isnan(metrics["b"])
+
+    def test_latest_metrics_are_maintained(self):
+        self._assert_latest_metrics_are_maintained()
+
+    def test_latest_metrics_are_maintained_without_dialect_conflict_clauses(self):
+        # Simulate the MSSQL dialect, which has no `ON CONFLICT` clauses
+        with mock.patch.object(self.store, "db_type", MSSQL):
+            self._assert_latest_metrics_are_maintained()
+
+    def test_latest_metrics_are_maintained_under_contention(self):
+        run_id = self._run_factory().info.run_id
+
+        def log_metrics(worker_idx):
+            for step in range(worker_idx, 40, 4):
+                self.store.log_batch(
+                    run_id,
+                    metrics=[Metric(f"m{i}", worker_idx, 0, step) for i in range(10)],
+                    params=[],
+                    tags=[],
+                )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(log_metrics, worker_idx) for worker_idx in range(4)]:
+                future.result()
+        # The latest values are the ones of the last step, logged by the last worker
+        assert self.store.get_run(run_id).data.metrics == {f"m{i}": 3 for i in range(10)}
+
     def test_log_metric_allows_multiple_values_at_same_ts_and_run_data_uses_max_ts_value(self):
         run = self._run_factory()
         run_id = run.info.run_id
@@ -1226,6 +1346,46 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
             [(m.key, m.value, m.timestamp) for m in actual],
         )
 
+    def test_get_sampled_metric_history_bulk(self):
+        experiment_id = self._experiment_factory("test_get_sampled_metric_history_bulk")
+        run1 = self._run_factory(self._get_run_configs(experiment_id))
+        run2 = self._run_factory(self._get_run_configs(experiment_id))
+        metrics = [
+            entities.Metric("m1", math.sin(i) if i % 7 else float("nan"), 1000 + 3 * i, i)
+            for i in range(200)
+        ]
+        self.store.log_batch(run1.info.run_id, metrics=metrics[:100], params=[], tags=[])
+        self.store.log_batch(run1.info.run_id, metrics=metrics[100:], params=[], tags=[])
+        self.store.log_batch(
+            run2.info.run_id, metrics=[entities.Metric("m2", 1.0, 0, 0)], params=[], tags=[]
+        )
+
+        def to_tuples(history):
+            # NaN values don't compare equal to each other
+            return [
+                (m.key, "nan" if math.isnan(m.value) else m.value, m.timestamp, m.step)
+                for m in history
+            ]
+
+        for x_axis in ["step", "timestamp"]:
+            histories = self.store.get_sampled_metric_history_bulk(
+                [run1.info.run_id, run2.info.run_id],
+                ["m1", "m2"],
+                max_points=20,
+                x_axis=x_axis,
+            )
+            assert set(histories) == {run1.info.run_id, run2.info.run_id}
+            assert list(histories[run1.info.run_id]) == ["m1"]
+            assert to_tuples(histories[run2.info.run_id]["m2"]) == [("m2", 1.0, 0, 0)]
+            # the sampling performed in SQL matches the reference implementation
+            expected = sample_metric_history(lambda: metrics, 20, x_axis)
+            assert len(expected) <= 20
+            assert to_tuples(histories[run1.info.run_id]["m1"]) == to_tuples(expected)
+
+        with pytest.raises(MlflowException, match=r"Run with id=unknown not found") as e:
+            self.store.get_sampled_metric_history_bulk([run1.info.run_id, "unknown"], ["m1"], 20)
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
     def test_rename_experiment(self):
         new_name = "new name"
         experiment_id = self._experiment_factory("test name")
@@ -2022,6 +2182,72 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
         assert [r.info.run_id for r in result] == runs[8:]
         assert result.token is None
 
+    def test_search_runs_keyset_pagination(self):
+        exp = self._experiment_factory("test_search_runs_keyset_pagination")
+        for i in range(11):
+            run_id = self._run_factory(self._get_run_configs(exp, start_time=i % 3)).info.run_id
+            # leave some of the values unset and create ties to exercise NULL and
+            # tie-breaking handling
+            if i % 4 != 0:
+                self.store.log_metric(run_id, entities.Metric("m", i % 5, 0, 0))
+            if i % 3 != 0:
+                self.store.log_param(run_id, entities.Param("p", str(i % 2)))
+            if i == 5:
+                self.store.log_metric(run_id, entities.Metric("m", float("nan"), 1, 1))
+
+        def paginate(order_by, max_results):
+            run_ids = []
+            token = None
+            while True:
+                result = self.store.search_runs(
+                    [exp],
+                    None,
+                    ViewType.ALL,
+                    max_results=max_results,
+                    order_by=order_by,
+                    page_token=token,
+                )
+                run_ids.extend(r.info.run_id for r in result)
+                token = result.token
+                if token is None:
+                    return run_ids
+                assert SearchUtils.parse_keyset_from_page_token(token, order_by) is not None
+
+        for order_by in [
+            None,
+            ["attribute.start_time ASC"],
+            ["metrics.m DESC"],
+            ["metrics.m ASC", "params.p DESC"],
+            ["params.p", "attribute.run_name DESC"],
+        ]:
+            expected = [
+                r.info.run_id
+                for r in self.store.search_runs([exp], None, ViewType.ALL, order_by=order_by)
+            ]
+            assert len(expected) == 11
+            for max_results in [1, 2, 4, 11]:
+                assert paginate(order_by, max_results) == expected
+
+        # keyset page tokens can't be used with another order_by
+        token = self.store.search_runs(
+            [exp], None, ViewType.ALL, max_results=4, order_by=["metrics.m DESC"]
+        ).token
+        with pytest.raises(MlflowException, match="created for a different order_by"):
+            self.store.search_runs(
+                [exp], None, ViewType.ALL, order_by=["metrics.m ASC"], page_token=token
+            )
+
+        # offset-only page tokens are still supported
+        runs = [r.info.run_id for r in self.store.search_runs([exp], None, ViewType.ALL)]
+        result = self.store.search_runs(
+            [exp],
+            None,
+            ViewType.ALL,
+            max_results=4,
+            page_token=SearchUtils.create_page_token(4),
+        )
+        assert [r.info.run_id for r in result] == runs[4:8]
+
     def test_search_runs_run_name(self):
         exp_id = self._experiment_factory("test_search_runs_pagination")
         run1 = self._run_factory(dict(self._get_run_configs(exp_id), run_name="run_name1"))
@@ -2576,9 +2802,9 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
             raise Exception("Some internal error")
 
         package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
-        with mock.patch(package + "._log_metrics") as metric_mock, mock.patch(
-            package + "._log_params"
-        ) as param_mock, mock.patch(package + "._set_tags") as tags_mock:
+        with mock.patch(package + "._log_metrics_impl") as metric_mock, mock.patch(
+            package + "._log_params_impl"
+        ) as param_mock, mock.patch(package + "._set_tags_impl") as tags_mock:
             metric_mock.side_effect = _raise_exception_fn
             param_mock.side_effect = _raise_exception_fn
             tags_mock.side_effect = _raise_exception_fn
@@ -2592,6 +2818,60 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
                 with pytest.raises(MlflowException, match=r"Some internal error"):
                     self.store.log_batch(run.info.run_id, **log_batch_kwargs)
 
+    def test_log_batch_logs_nothing_on_failure(self):
+        run = self._run_factory()
+        package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
+        with mock.patch(package + "._set_tags_impl", side_effect=Exception("Some internal error")):
+            with pytest.raises(MlflowException, match=r"Some internal error"):
+                self.store.log_batch(
+                    run.info.run_id,
+                    metrics=[Metric("m", 1.0, 1, 0)],
+                    params=[Param("p", "v")],
+                    tags=[RunTag("t", "v")],
+                )
+        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
+
+    def test_log_batch_uses_single_session(self):
+        run = self._run_factory()
+        with mock.patch.object(
+            self.store, "ManagedSessionMaker", wraps=self.store.ManagedSessionMaker
+        ) as session_maker_mock:
+            self.store.log_batch(
+                run.info.run_id,
+                metrics=[Metric("m", 1.0, 1, 0)],
+                params=[Param("p", "v")],
+                tags=[RunTag("t", "v"), RunTag(MLFLOW_RUN_NAME, "new-name")],
+            )
+        session_maker_mock.assert_called_once()
+        run = self.store.get_run(run.info.run_id)
+        assert run.info.run_name == "new-name"
+        assert run.data.tags["t"] == "v"
+
+    def test_log_batch_without_dialect_conflict_clauses(self):
+        # Simulate the MSSQL dialect, which has no `ON CONFLICT` clauses
+        run = self._run_factory()
+        metrics = [Metric("m", 1.0, 1, 0), Metric("m", 2.0, 2, 1)]
+        with mock.patch.object(self.store, "db_type", MSSQL):
+            self.store.log_batch(
+                run.info.run_id, metrics=metrics[:1], params=[Param("p", "v")], tags=[]
+            )
+            self.store.log_batch(
+                run.info.run_id,
+                metrics=metrics,
+                params=[Param("p", "v"), Param("q", "w")],
+                tags=[RunTag("t", "v")],
+            )
+            self.store.log_batch(run.info.run_id, metrics=[], params=[], tags=[RunTag("t", "w")])
+            with pytest.raises(MlflowException, match=r"Changing param values is not allowed"):
+                self.store.log_batch(run.info.run_id, metrics=[], params=[Param("p", "x")], tags=[])
+        self._verify_logged(
+            self.store,
+            run.info.run_id,
+            metrics=metrics,
+            params=[Param("p", "v"), Param("q", "w")],
+            tags=[RunTag("t", "w")],
+        )
+
     def test_log_batch_nonexistent_run(self):
         nonexistent_run_id = uuid.uuid4().hex
         with pytest.raises(
@@ -2726,6 +3006,90 @@ class TestSqlAlchemyStore(unittest.TestCase, AbstractStoreTest):
         with pytest.raises(MlflowException, match="exceeded length"):
             self.store.log_batch(run.info.run_id, [], param_entities, [])
 
+    def test_log_batches(self):
+        experiment_id = self._experiment_factory("log_batches")
+        run_ids = [
+            self._run_factory(self._get_run_configs(experiment_id)).info.run_id for _ in range(3)
+        ]
+        self.store.log_param(run_ids[0], Param("p", "0"))
+        with mock.patch.object(
+            self.store, "ManagedSessionMaker", wraps=self.store.ManagedSessionMaker
+        ) as session_maker_mock:
+            self.store.log_batches(
+                [
+                    (
+                        run_ids[0],
+                        [Metric("m", 0.5, 1, 0), Metric("m", 1.5, 1, 1)],
+                        [Param("p", "0")],
+                        [RunTag("t", "a")],
+                    ),
+                    (run_ids[1], [Metric("m", 2.5, 1, 0)], [Param("p", "1")], []),
+                    (run_ids[0], [Metric("n", 3.5, 1, 0)], [], [RunTag("t", "b")]),
+                    (run_ids[2], [], [], [RunTag(MLFLOW_RUN_NAME, "renamed")]),
+                ]
+            )
+        session_maker_mock.assert_called_once()
+        self._verify_logged(
+            self.store,
+            run_ids[0],
+            metrics=[Metric("m", 0.5, 1, 0), Metric("m", 1.5, 1, 1), Metric("n", 3.5, 1, 0)],
+            params=[Param("p", "0")],
+            tags=[RunTag("t", "b")],
+        )
+        self._verify_logged(
+            self.store,
+            run_ids[1],
+            metrics=[Metric("m", 2.5, 1, 0)],
+            params=[Param("p", "1")],
+            tags=[],
+        )
+        runs = self.store.get_runs(run_ids)
+        assert runs[0].data.metrics == {"m": 1.5, "n": 3.5}
+        assert runs[1].data.metrics == {"m": 2.5}
+        assert runs[2].info.run_name == "renamed"
+
+    def test_log_batches_logs_nothing_on_failure(self):
+        experiment_id = self._experiment_factory("log_batches_failure")
+        run_ids = [
+            self._run_factory(self._get_run_configs(experiment_id)).info.run_id for _ in range(2)
+        ]
+        self.store.log_param(run_ids[1], Param("p", "v"))
+        with pytest.raises(MlflowException, match=r"Changing param values is not allowed"):
+            self.store.log_batches(
+                [
+                    (run_ids[0], [Metric("m", 1.0, 1, 0)], [Param("p", "v")], []),
+                    (run_ids[1], [], [Param("p", "w")], [RunTag("t", "v")]),
+                ]
+            )
+        self._verify_logged(self.store, run_ids[0], metrics=[], params=[], tags=[])
+        self._verify_logged(self.store, run_ids[1], metrics=[], params=[Param("p", "v")], tags=[])
+
+        nonexistent_run_id = uuid.uuid4().hex
+        with pytest.raises(MlflowException, match=rf"Run with id={nonexistent_run_id} not found"):
+            self.store.log_batches(
+                [
+                    (run_ids[0], [Metric("m", 1.0, 1, 0)], [], []),
+                    (nonexistent_run_id, [Metric("m", 1.0, 1, 0)], [], []),
+                ]
+            )
+        self._verify_logged(self.store, run_ids[0], metrics=[], params=[], tags=[])
+
+    def test_log_batches_validation(self):
+        run_id = self._run_factory().info.run_id
+        with pytest.raises(MlflowException, match=r"Duplicate parameter keys"):
+            self.store.log_batches(
+                [(run_id, [], [Param("p", "v")], []), (run_id, [], [Param("p", "v")], [])]
+            )
+        with pytest.raises(MlflowException, match=r"A batch logging request can contain at most"):
+            self.store.log_batches(
+                [(run_id, [Metric(f"m{i}", 1.0, 1, 0) for i in range(600)], [], [])] * 2
+            )
+        self._verify_logged(self.store, run_id, metrics=[], params=[], tags=[])
+
+        self.store.delete_run(run_id)
+        with pytest.raises(MlflowException, match=r"must be in the 'active' state"):
+            self.store.log_batches([(run_id, [Metric("m", 1.0, 1, 0)], [], [])])
+
     def test_upgrade_cli_idempotence(self):
         # Repeatedly run `mlflow db upgrade` against our database, verifying that the command
         # succeeds and that the DB has the latest schema
@@ -1,7 +1,7 @@
 import pytest
 from unittest import mock
 
-from mlflow.entities import Run, RunInfo
+from mlflow.entities import Metric, Param, Run, RunInfo
 from mlflow.tracking._tracking_service.client import TrackingServiceClient
 
 
@@ -69,3 +69,41 @@ def test_artifact_repo_is_cached_per_run_id(tmp_path):
             "some_run_id"
         )
         assert artifact_repo is another_artifact_repo
+
+
+def test_get_runs_fetches_runs_in_batches(tmp_path):
+    run_ids = [f"{i:032x}" for i in range(2500)]
+    with mock.patch.object(
+        TrackingServiceClient, "store", new_callable=mock.PropertyMock
+    ) as store_mock:
+        store_mock.return_value.get_runs.side_effect = lambda ids: list(ids)
+        runs = TrackingServiceClient(tmp_path.as_uri()).get_runs(run_ids)
+    assert runs == run_ids
+    get_runs_mock = store_mock.return_value.get_runs
+    assert [len(call.args[0]) for call in get_runs_mock.call_args_list] == [1000, 1000, 500]
+
+
+def test_log_batches_packs_batches_within_request_limits(tmp_path):
+    batches = [
+        ("a", [Metric(f"m{i}", 0, 0, 0) for i in range(1500)], [Param("p", "v")], []),
+        ("b", [Metric("m", 0, 0, 0)], [], []),
+        *[(f"r{i}", [], [Param("p", "v")], []) for i in range(1200)],
+    ]
+    with mock.patch.object(
+        TrackingServiceClient, "store", new_callable=mock.PropertyMock
+    ) as store_mock:
+        TrackingServiceClient(tmp_path.as_uri()).log_batches(batches)
+    requests = [call.args[0] for call in store_mock.return_value.log_batches.call_args_list]
+    # The batch of run "a" exceeds the limits of a single batch and is split in two
+    assert [
+        [(run_id, len(metrics), len(params), len(tags)) for run_id, metrics, params, tags in r][:2]
+        for r in requests
+    ] == [
+        [("a", 999, 1, 0)],
+        [("a", 501, 0, 0), ("b", 1, 0, 0)],
+        [("r498", 0, 1, 0), ("r499", 0, 1, 0)],
+    ]
+    assert [len(r) for r in requests] == [1, 500, 702]
+    for r in requests:
+        assert len(r) <= 1000
+        assert sum(len(m) + len(p) + len(t) for _, m, p, t in r) <= 1000
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from unittest import mock
 from importlib import reload
@@ -158,3 +160,37 @@ def test_resolve_request_headers_no_arg(mock_request_header_providers):
         "three": "three-val",
         "new": "new-val",
     }
+
+
+def test_resolve_request_headers_caches_provider_headers(monkeypatch):
+    monkeypatch.setenv("MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL", "1")
+    provider = mock.Mock()
+    provider.in_context.return_value = True
+    provider.request_headers.return_value = {"one": "one-val"}
+    registry = RequestHeaderProviderRegistry()
+    with mock.patch(
+        "mlflow.tracking.request_header.registry._request_header_provider_registry", registry
+    ):
+        registry.register(lambda: provider)
+        assert resolve_request_headers() == {"one": "one-val"}
+        assert resolve_request_headers({"two": "two-val"}) == {"one": "one-val", "two": "two-val"}
+        assert provider.request_headers.call_count == 1
+
+        # Registering a provider invalidates the cache
+        other_provider = mock.Mock()
+        other_provider.in_context.return_value = True
+        other_provider.request_headers.return_value = {"other": "other-val"}
+        registry.register(lambda: other_provider)
+        assert resolve_request_headers() == {"one": "one-val", "other": "other-val"}
+        assert provider.request_headers.call_count == 2
+
+        # The cache expires
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 10):
+            resolve_request_headers()
+        assert provider.request_headers.call_count == 3
+
+        # The cache is disabled by default
+        monkeypatch.delenv("MLFLOW_HTTP_REQUEST_HEADERS_CACHE_TTL")
+        resolve_request_headers()
+        resolve_request_headers()
+        assert provider.request_headers.call_count == 5
@@ -0,0 +1,186 @@
+import asyncio
+import os
+import sys
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+
+from mlflow import MlflowClient
+from mlflow.entities import Metric, Param, RunStatus, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracking.async_client import AsyncMlflowClient, _to_query_params
+
+from tests.tracking.integration_test_utils import _init_server
+
+
+@pytest.fixture(scope="module")
+def tracking_server_url(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("server")
+    path = tmp_path.joinpath("sqlalchemy.db").as_uri()
+    backend_uri = ("sqlite://" if sys.platform == "win32" else "sqlite:////") + path[
+        len("file://") :
+    ]
+    with _init_server(backend_uri, root_artifact_uri=tmp_path.as_uri()) as url:
+        yield url
+
+
+@pytest_asyncio.fixture
+async def client(tracking_server_url):
+    async with AsyncMlflowClient(tracking_server_url) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_runs_are_created_logged_and_searched(client):
+    experiment_id = await client.create_experiment("runs", tags={"team": "a"})
+    assert (await client.get_experiment(experiment_id)).tags == {"team": "a"}
+    assert (await client.get_experiment_by_name("runs")).experiment_id == experiment_id
+    assert await client.get_experiment_by_name("missing") is None
+
+    runs = await asyncio.gather(
+        *(client.create_run(experiment_id, run_name=f"run-{i}") for i in range(10))
+    )
+    run_ids = [run.info.run_id for run in runs]
+    await asyncio.gather(
+        *(client.log_metric(run_id, "loss", i, step=1) for i, run_id in enumerate(run_ids)),
+        *(client.log_param(run_id, "index", i) for i, run_id in enumerate(run_ids)),
+        *(client.set_tag(run_id, "tag", "value") for run_id in run_ids),
+    )
+    await client.log_batch(
+        run_ids[0],
+        metrics=[Metric("acc", 0.5, 0, step) for step in range(3)],
+        params=[Param("lr", "0.1")],
+        tags=[RunTag("batch", "yes")],
+    )
+    await client.set_terminated(run_ids[0])
+
+    run = await client.get_run(run_ids[0])
+    assert run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+    assert run.data.metrics == {"loss": 0.0, "acc": 0.5}
+    assert run.data.params == {"index": "0", "lr": "0.1"}
+    assert run.data.tags["batch"] == "yes"
+    assert [m.step for m in await client.get_metric_history(run_ids[0], "acc")] == [0, 1, 2]
+
+    found = await client.search_runs(experiment_id, "metrics.loss >= 5", order_by=["params.index"])
+    assert [r.info.run_id for r in found] == run_ids[5:]
+    assert found.token is None
+
+    await client.delete_tag(run_ids[1], "tag")
+    await client.delete_run(run_ids[2])
+    assert "tag" not in (await client.get_run(run_ids[1])).data.tags
+    assert len(await client.search_runs([experiment_id])) == 9
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_session(client):
+    experiment_id = await client.create_experiment("session")
+    session = client._session
+    await asyncio.gather(*(client.create_run(experiment_id) for _ in range(20)))
+    assert client._session is session
+
+    await client.close()
+    assert session.closed
+    assert client._session is None
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_as_mlflow_exceptions(client):
+    with pytest.raises(MlflowException, match="Run with id=missing not found") as exc_info:
+        await client.get_run("missing")
+    assert exc_info.value.error_code == "RESOURCE_DOES_NOT_EXIST"
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried(client, monkeypatch):
+    monkeypatch.setenv("MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR", "0")
+    experiment_id = await client.create_experiment("retries")
+    session = client._get_session()
+    request = session.request
+    responses = []
+
+    async def fail_first_request(*args, **kwargs):
+        response = await request(*args, **kwargs)
+        responses.append(response)
+        if len(responses) == 1:
+            response.status = 503
+        return response
+
+    with mock.patch.object(session, "request", side_effect=fail_first_request):
+        experiment = await client.get_experiment(experiment_id)
+    assert experiment.name == "retries"
+    assert len(responses) == 2
+
+
+@pytest.mark.asyncio
+async def test_registry(client):
+    experiment_id = await client.create_experiment("registry")
+    run = await client.create_run(experiment_id)
+    model = await client.create_registered_model("model", tags={"k": "v"}, description="desc")
+    assert model.tags == {"k": "v"}
+
+    versions = await asyncio.gather(
+        *(
+            client.create_model_version("model", f"runs:/{run.info.run_id}/model", run.info.run_id)
+            for _ in range(3)
+        )
+    )
+    assert sorted(v.version for v in versions) == ["1", "2", "3"]
+    await client.transition_model_version_stage("model", 2, "Production")
+
+    assert (await client.get_model_version("model", 2)).current_stage == "Production"
+    assert [v.version for v in await client.get_latest_versions("model", ["Production"])] == ["2"]
+    assert await client.get_model_version_download_uri("model", 1) == (
+        f"runs:/{run.info.run_id}/model"
+    )
+    assert len(await client.search_model_versions("name = 'model'")) == 3
+    assert [m.name for m in await client.search_registered_models("name = 'model'")] == ["model"]
+
+    await client.delete_registered_model("model")
+    with pytest.raises(MlflowException, match="not found"):
+        await client.get_registered_model("model")
+
+
+@pytest.mark.asyncio
+async def test_artifacts_are_listed_and_downloaded(client, tracking_server_url, tmp_path):
+    experiment_id = await client.create_experiment("artifacts")
+    run_id = (await client.create_run(experiment_id)).info.run_id
+    src = tmp_path / "src"
+    src.joinpath("model", "data").mkdir(parents=True)
+    src.joinpath("model", "empty").mkdir()
+    src.joinpath("model", "MLmodel").write_text("flavors")
+    src.joinpath("model", "data", "weights.bin").write_bytes(b"\x00" * 3_000_000)
+    MlflowClient(tracking_server_url).log_artifacts(run_id, str(src))
+
+    assert [(f.path, f.is_dir) for f in await client.list_artifacts(run_id, "model")] == [
+        ("model/MLmodel", False),
+        ("model/data", True),
+        ("model/empty", True),
+    ]
+
+    local_path = await client.download_artifacts(run_id, "model", str(tmp_path / "dst"))
+    assert local_path == str(tmp_path / "dst" / "model")
+    assert (tmp_path / "dst" / "model" / "MLmodel").read_text() == "flavors"
+    assert (tmp_path / "dst" / "model" / "data" / "weights.bin").stat().st_size == 3_000_000
+    assert list((tmp_path / "dst" / "model" / "empty").iterdir()) == []
+
+    local_path = await client.download_artifacts(run_id, "model/empty", str(tmp_path / "empty"))
+    assert local_path == str(tmp_path / "empty" / "model" / "empty")
+    assert os.path.isdir(local_path)
+
+    local_path = await client.download_artifacts(run_id, "model/MLmodel", str(tmp_path / "file"))
+    assert open(local_path).read() == "flavors"
+
+
+def test_query_params_encode_booleans_in_lowercase():
+    assert _to_query_params({"a": True, "b": [False, 1], "c": "x"}) == [
+        ("a", "true"),
+        ("b", "false"),
+        ("b", "1"),
+        ("c", "x"),
+    ]
+
+
+def test_non_rest_tracking_uri_is_rejected(tmp_path):
+    with pytest.raises(MlflowException, match="only supports tracking servers accessed over REST"):
+        AsyncMlflowClient(tmp_path.as_uri())
@@ -5,12 +5,16 @@ import tempfile
 import requests
 import pathlib
 import cgi
+from unittest import mock
 
 import pytest
 
 import mlflow
 from mlflow import MlflowClient
 from mlflow.artifacts import download_artifacts
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.http_artifact_repo import HttpArtifactRepository
+from mlflow.utils.rest_utils import http_request
 
 from tests.helper_functions import LOCALHOST, get_safe_port
 from tests.tracking.integration_test_utils import _await_server_up_or_die
@@ -131,6 +135,40 @@ def test_mlflow_artifacts_rest_apis(artifacts_server, tmp_path):
     assert resp.json() == {"files": [{"path": "b.txt", "is_dir": False, "file_size": 1}]}
 
 
+def test_mlflow_artifacts_download_byte_ranges(artifacts_server, tmp_path):
+    default_artifact_root = artifacts_server.default_artifact_root
+    file_path = tmp_path.joinpath("range.txt")
+    file_path.write_text("0123456789")
+    upload_file(file_path, f"{default_artifact_root}/range.txt")
+    url = f"{default_artifact_root}/range.txt"
+
+    resp = requests.get(url)
+    assert resp.status_code == 200
+    assert resp.content == b"0123456789"
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert resp.headers["Content-Length"] == "10"
+
+    resp = requests.get(url, headers={"Range": "bytes=2-4"})
+    assert resp.status_code == 206
+    assert resp.content == b"234"
+    assert resp.headers["Content-Range"] == "bytes 2-4/10"
+
+    resp = requests.get(url, headers={"Range": "bytes=-3"})
+    assert resp.status_code == 206
+    assert resp.content == b"789"
+
+    resp = requests.get(url, headers={"Range": "bytes=20-"})
+    assert resp.status_code == 416
+    assert resp.headers["Content-Range"] == "bytes */10"
+
+    resp = requests.get(url, headers={"Range": "bytes=0-1,3-4"})
+    assert resp.status_code == 200
+    assert resp.content == b"0123456789"
+
+    resp = requests.get(f"{default_artifact_root}/missing.txt")
+    assert resp.status_code == 404
+
+
 def test_log_artifact(artifacts_server, tmp_path):
     url = artifacts_server.url
     artifacts_destination = artifacts_server.artifacts_destination
@@ -161,6 +199,39 @@ def test_log_artifact(artifacts_server, tmp_path):
     assert read_file(dest_path) == "0"
 
 
+def test_log_artifact_with_multipart_upload(artifacts_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", "1")
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", "1000")
+    url = artifacts_server.url
+    artifacts_destination = artifacts_server.artifacts_destination
+    mlflow.set_tracking_uri(url)
+
+    file_path = tmp_path.joinpath("large.txt")
+    content = "".join(str(i % 10) for i in range(4500))
+    file_path.write_text(content)
+    with mlflow.start_run() as run, mock.patch.object(
+        HttpArtifactRepository,
+        "_upload_part",
+        autospec=True,
+        side_effect=HttpArtifactRepository._upload_part,
+    ) as mock_upload_part:
+        mlflow.log_artifact(file_path, artifact_path="dir")
+    assert mock_upload_part.call_count == 5
+
+    experiment_id = run.info.experiment_id
+    run_artifact_root = os.path.join(
+        artifacts_destination, experiment_id, run.info.run_id, "artifacts"
+    )
+    assert read_file(os.path.join(run_artifact_root, "dir", "large.txt")) == content
+
+    resp = requests.post(
+        f"{url}/api/2.0/mlflow-artifacts/mpu/complete/{experiment_id}/large.txt",
+        json={"upload_id": "../../invalid", "parts": [{"part_number": 1, "etag": ""}]},
+    )
+    assert resp.status_code == 400
+    assert "Invalid multipart upload ID" in resp.json()["message"]
+
+
 def test_log_artifacts(artifacts_server, tmp_path):
     url = artifacts_server.url
     mlflow.set_tracking_uri(url)
@@ -211,6 +282,28 @@ def test_list_artifacts(artifacts_server, tmp_path):
     assert artifacts == ["dir/b.txt"]
 
 
+def test_list_artifacts_recursive(artifacts_server, tmp_path):
+    url = artifacts_server.url
+    mlflow.set_tracking_uri(url)
+
+    tmp_path.joinpath("a.txt").write_text("0")
+    tmp_path.joinpath("dir", "subdir").mkdir(parents=True)
+    tmp_path.joinpath("dir", "subdir", "b.txt").write_text("12")
+    with mlflow.start_run() as run:
+        mlflow.log_artifacts(tmp_path)
+
+    repo = get_artifact_repository(run.info.artifact_uri)
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request", wraps=http_request
+    ) as http_request_mock:
+        artifacts = repo.list_artifacts_recursive()
+        assert http_request_mock.call_count == 1
+    assert [(a.path, a.file_size) for a in artifacts] == [("a.txt", 1), ("dir/subdir/b.txt", 2)]
+    artifacts = repo.list_artifacts_recursive("dir")
+    assert [a.path for a in artifacts] == ["dir/subdir/b.txt"]
+    assert repo.list_artifacts_recursive("a.txt") == []
+
+
 def test_download_artifacts(artifacts_server, tmp_path):
     url = artifacts_server.url
     mlflow.set_tracking_uri(url)
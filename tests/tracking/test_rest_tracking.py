@@ -12,6 +12,7 @@ import posixpath
 import logging
 import time
 import urllib.parse
+import uuid
 import requests
 import pandas as pd
 import math
@@ -811,6 +812,71 @@ def test_log_batch_validation(mlflow_client):
     assert response.status_code == 200
 
 
+def test_get_runs_and_log_batches(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("Batches of runs")
+    run_ids = [mlflow_client.create_run(experiment_id).info.run_id for _ in range(5)]
+    mlflow_client.log_batches(
+        [
+            (run_id, [Metric("metric", i, 789, 3)], [Param("param", str(i))], [RunTag("t", "v")])
+            for i, run_id in enumerate(run_ids)
+        ]
+    )
+    runs = mlflow_client.get_runs(run_ids[::-1])
+    assert [run.info.run_id for run in runs] == run_ids[::-1]
+    for i, run in enumerate(runs[::-1]):
+        assert run.data.metrics == {"metric": i}
+        assert run.data.params == {"param": str(i)}
+        assert run.data.tags["t"] == "v"
+
+    with pytest.raises(MlflowException, match="not found") as exc_info:
+        mlflow_client.get_runs([run_ids[0], "0" * 32])
+    assert exc_info.value.error_code == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_log_batches_validation(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("log_batches validation")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+
+    def assert_bad_request(payload, expected_error_message):
+        response = _send_rest_tracking_post_request(
+            mlflow_client.tracking_uri,
+            "/api/2.0/mlflow/runs/log-batches",
+            payload,
+        )
+        assert response.status_code == 400
+        assert expected_error_message in response.text
+
+    assert_bad_request({}, "Missing value for required parameter 'batches'")
+    assert_bad_request(
+        {"batches": [{"run_id": run_id, "metrics": [{"key": "mae", "value": 2.5}]}]},
+        "Invalid value",
+    )
+    assert_bad_request(
+        {
+            "batches": [
+                {
+                    "run_id": run_id,
+                    "metrics": [{"key": f"m{i}", "value": 1, "timestamp": 1} for i in range(600)],
+                }
+            ]
+            * 2
+        },
+        "A batch logging request can contain at most 1000 metrics, params, and tags",
+    )
+
+    response = _send_rest_tracking_post_request(
+        mlflow_client.tracking_uri,
+        "/api/2.0/mlflow/runs/log-batches",
+        {
+            "batches": [
+                {"run_id": run_id, "metrics": [{"key": "mae", "value": 2.5, "timestamp": 1}]}
+            ]
+        },
+    )
+    assert response.status_code == 200
+    assert mlflow_client.get_run(run_id).data.metrics == {"mae": 2.5}
+
+
 @pytest.mark.allow_infer_pip_requirements_fallback
 def test_log_model(mlflow_client):
     experiment_id = mlflow_client.create_experiment("Log models")
@@ -1119,6 +1185,60 @@ def test_get_metric_history_bulk_returns_expected_metrics_in_expected_order(mlfl
     )
 
 
+def test_get_sampled_metric_history_bulk(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("get sampled metric history bulk")
+    run_id1 = mlflow_client.create_run(experiment_id).info.run_id
+    run_id2 = mlflow_client.create_run(experiment_id).info.run_id
+    mlflow_client.log_batch(
+        run_id1, metrics=[Metric("metricA", float(i % 10), 1000 + i, i) for i in range(100)]
+    )
+    mlflow_client.log_metric(run_id2, "metricB", 1.0, timestamp=0, step=0)
+
+    url = f"{mlflow_client.tracking_uri}/ajax-api/2.0/mlflow/metrics/get-sampled-history-bulk"
+    response = requests.get(
+        url,
+        params={
+            "run_id": [run_id1, run_id2],
+            "metric_key": ["metricA", "metricB"],
+            "max_points": 10,
+        },
+    )
+    assert response.status_code == 200
+    metrics = response.json()["metrics"]
+    run1_metrics = [m for m in metrics if m["run_id"] == run_id1]
+    assert len(run1_metrics) == 10
+    assert [m["step"] for m in run1_metrics] == sorted(m["step"] for m in run1_metrics)
+    assert {m["value"] for m in run1_metrics} == {0.0, 9.0}
+    assert [m for m in metrics if m["run_id"] == run_id2] == [
+        {"key": "metricB", "value": 1.0, "timestamp": 0, "step": 0, "run_id": run_id2}
+    ]
+
+    for params, message in [
+        ({"metric_key": "metricA"}, "must specify at least one run_id"),
+        ({"run_id": run_id1}, "must specify at least one metric_key"),
+        ({"run_id": run_id1, "metric_key": "metricA", "max_points": 1}, "max_points"),
+        ({"run_id": run_id1, "metric_key": "metricA", "x_axis": "value"}, "x_axis"),
+    ]:
+        response = requests.get(url, params=params)
+        assert response.status_code == 400
+        assert message in response.json()["message"]
+
+
+def test_get_sampled_metric_history_bulk_unknown_run(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("get sampled metric history bulk")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    mlflow_client.log_metric(run_id, "metricA", 1.0, timestamp=0, step=0)
+    unknown_run_id = uuid.uuid4().hex
+
+    response = requests.get(
+        f"{mlflow_client.tracking_uri}/ajax-api/2.0/mlflow/metrics/get-sampled-history-bulk",
+        params={"run_id": [run_id, unknown_run_id], "metric_key": "metricA"},
+    )
+    assert response.status_code == 404
+    assert response.json()["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+    assert unknown_run_id in response.json()["message"]
+
+
 def test_get_metric_history_bulk_respects_max_results(mlflow_client):
     experiment_id = mlflow_client.create_experiment("get metric history bulk")
     run_id = mlflow_client.create_run(experiment_id).info.run_id
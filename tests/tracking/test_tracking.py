@@ -1049,3 +1049,28 @@ def test_load_table():
     # test 7: load table with no matching extra_column found. Error case
     with pytest.raises(KeyError, match="error_column"):
         mlflow.load_table(artifact_file=artifact_file, extra_columns=["error_column"])
+
+
+@pytest.mark.skipif(
+    "MLFLOW_SKINNY" in os.environ,
+    reason="Skinny client does not support the np or pandas dependencies",
+)
+def test_load_table_reports_missing_tables_and_download_failures():
+    artifact_file = "tables/table.json"
+    with mlflow.start_run() as run:
+        mlflow.log_table(data={"a": [1]}, artifact_file=artifact_file)
+
+    with mock.patch(
+        "mlflow.store.artifact.local_artifact_repo.LocalArtifactRepository._download_file",
+        side_effect=PermissionError("denied"),
+    ):
+        with pytest.raises(MlflowException, match="denied") as exception_context:
+            mlflow.load_table(artifact_file=artifact_file)
+        assert exception_context.value.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    os.remove(os.path.join(local_file_uri_to_path(run.info.artifact_uri), artifact_file))
+    with pytest.raises(
+        MlflowException, match=f"Artifact {artifact_file} not found for run {run.info.run_id}"
+    ) as exception_context:
+        mlflow.load_table(artifact_file=artifact_file)
+    assert exception_context.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
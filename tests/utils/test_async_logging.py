@@ -0,0 +1,144 @@
+import threading
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow import MlflowClient
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.utils import async_logging
+from mlflow.utils.async_logging import (
+    AsyncLoggingQueue,
+    _coalesce,
+    _PendingLogBatch,
+    should_log_asynchronously,
+)
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+
+@pytest.fixture(autouse=True)
+def reset_async_logging():
+    yield
+    mlflow.flush_async_logging()
+    async_logging._async_logging_enabled = None
+
+
+def _pending(run_id, metrics=(), params=(), tags=(), store_key="store"):
+    return _PendingLogBatch(
+        log_batch_func=None,
+        store_key=store_key,
+        run_id=run_id,
+        metrics=list(metrics),
+        params=list(params),
+        tags=list(tags),
+        future=None,
+    )
+
+
+def test_should_log_asynchronously(monkeypatch):
+    assert not should_log_asynchronously(None)
+    assert should_log_asynchronously(False)
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+    assert should_log_asynchronously(None)
+    assert not should_log_asynchronously(True)
+    mlflow.enable_async_logging(False)
+    assert not should_log_asynchronously(None)
+
+
+def test_coalesce_groups_operations_by_store_and_run():
+    m1, m2, m3 = (Metric("m", i, 0, i) for i in range(3))
+    batches = _coalesce(
+        [
+            _pending("r1", metrics=[m1], tags=[RunTag("t", "a")]),
+            _pending("r2", metrics=[m2]),
+            _pending("r1", params=[Param("p", "1")], tags=[RunTag("t", "b")]),
+            _pending("r1", metrics=[m3], store_key="other"),
+        ]
+    )
+    assert [(b.run_id, b.metrics, b.params) for b in batches] == [
+        ("r1", [m1], [Param("p", "1")]),
+        ("r2", [m2], []),
+        ("r1", [m3], []),
+    ]
+    assert list(batches[0].tags.values()) == [RunTag("t", "b")]
+    assert len(batches[0].futures) == 2
+
+
+def test_coalesce_splits_batches_with_duplicate_param_keys():
+    batches = _coalesce(
+        [
+            _pending("r", params=[Param("p", "1")]),
+            _pending("r", params=[Param("q", "1")]),
+            _pending("r", params=[Param("p", "2")]),
+        ]
+    )
+    assert [b.params for b in batches] == [
+        [Param("p", "1"), Param("q", "1")],
+        [Param("p", "2")],
+    ]
+
+
+def test_async_logging_queue_logs_batches_and_reports_failures():
+    logged = []
+    first_call_started = threading.Event()
+    release_first_call = threading.Event()
+
+    def log_batch(run_id, metrics, params, tags):
+        if not first_call_started.is_set():
+            first_call_started.set()
+            release_first_call.wait()
+        if run_id == "bad":
+            raise MlflowException("failed")
+        logged.append((run_id, metrics, params, tags))
+
+    logging_queue = AsyncLoggingQueue()
+    metrics = [Metric("m", i, 0, i) for i in range(4)]
+    first = logging_queue.log_batch(log_batch, "store", "r", metrics=metrics[:1])
+    first_call_started.wait()
+    # Operations queued while a batch is being logged are coalesced
+    others = [
+        logging_queue.log_batch(log_batch, "store", "r", metrics=[metric]) for metric in metrics[1:]
+    ]
+    failed = logging_queue.log_batch(log_batch, "store", "bad", tags=[RunTag("t", "v")])
+    release_first_call.set()
+    logging_queue.flush()
+
+    assert logged == [("r", metrics[:1], [], []), ("r", metrics[1:], [], [])]
+    for operations in [first, *others]:
+        operations.await_completion()
+    with pytest.raises(MlflowException, match="failed"):
+        failed.await_completion()
+
+
+def test_fluent_async_logging_is_flushed_by_end_run():
+    mlflow.enable_async_logging()
+    with mlflow.start_run() as run:
+        for step in range(3):
+            mlflow.log_metric("m", step, step=step)
+        mlflow.log_param("p", "v")
+        mlflow.set_tag("t", "v")
+        mlflow.log_metrics({"a": 1.0, "b": 2.0})
+
+    data = mlflow.get_run(run.info.run_id).data
+    assert data.metrics == {"m": 2, "a": 1.0, "b": 2.0}
+    assert data.params == {"p": "v"}
+    assert data.tags["t"] == "v"
+    history = MlflowClient().get_metric_history(run.info.run_id, "m")
+    assert [m.value for m in history] == [0, 1, 2]
+
+
+def test_client_async_log_batch_respects_batch_limits():
+    client = MlflowClient()
+    run_id = client.create_run("0").info.run_id
+    metrics = [Metric("m", i, 0, i) for i in range(MAX_METRICS_PER_BATCH + 1)]
+    store = client._tracking_client.store
+    with mock.patch(
+        "mlflow.tracking._tracking_service.utils._get_store", return_value=store
+    ), mock.patch.object(store, "log_batch", wraps=store.log_batch) as log_batch_mock:
+        operations = client.log_batch(run_id, metrics=metrics, synchronous=False)
+        operations.await_completion()
+    batch_sizes = [len(call.kwargs["metrics"]) for call in log_batch_mock.call_args_list]
+    assert batch_sizes == [MAX_METRICS_PER_BATCH, 1]
+    assert len(client.get_metric_history(run_id, "m")) == MAX_METRICS_PER_BATCH + 1
+    client.set_terminated(run_id)
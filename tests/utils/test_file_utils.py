@@ -2,9 +2,12 @@
 import codecs
 import filecmp
 import hashlib
+import http.server
 import os
 import shutil
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import jinja2.exceptions
 import pytest
@@ -15,6 +18,7 @@ from pyspark.sql import SparkSession
 
 import mlflow
 from mlflow.exceptions import MissingConfigException
+from mlflow.protos.databricks_artifacts_pb2 import ArtifactCredentialType
 from mlflow.utils import file_utils
 from mlflow.utils.file_utils import (
     get_parent_dir,
@@ -363,3 +367,90 @@ def test_shutil_copytree_without_file_permissions(tmp_path):
     assert set(os.listdir(dst_dir.joinpath("subdir"))) == {"subdir-file.txt"}
     assert dst_dir.joinpath("subdir/subdir-file.txt").read_text() == "testing 123"
     assert dst_dir.joinpath("top-level-file.txt").read_text() == "hi"
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    content = os.urandom(1000)
+    ignore_range = False
+    requested_ranges = []
+
+    def do_GET(self):
+        if self.headers.get("Authorization") != "token":
+            self.send_error(403)
+            return
+        range_start, range_end = map(int, self.headers["Range"][len("bytes=") :].split("-"))
+        self.requested_ranges.append((range_start, range_end))
+        body = self.content if self.ignore_range else self.content[range_start : range_end + 1]
+        self.send_response(200 if self.ignore_range else 206)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def range_server(monkeypatch):
+    monkeypatch.setattr(_RangeRequestHandler, "requested_ranges", [])
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/file"
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize("uri_type", [None, ArtifactCredentialType.AWS_PRESIGNED_URL])
+def test_parallelized_download_file_using_http_uri(range_server, tmp_path, uri_type):
+    download_path = tmp_path / "file"
+    download_path.write_bytes(b"previous content" * 100)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        failed_downloads = file_utils.parallelized_download_file_using_http_uri(
+            thread_pool_executor=executor,
+            http_uri=range_server,
+            download_path=str(download_path),
+            file_size=1000,
+            uri_type=uri_type,
+            chunk_size=128,
+            headers={"Authorization": "token"},
+        )
+    assert failed_downloads == {}
+    assert download_path.read_bytes() == _RangeRequestHandler.content
+    assert sorted(_RangeRequestHandler.requested_ranges) == [
+        (start, start + 127) for start in range(0, 1000, 128)
+    ]
+
+
+def test_parallelized_download_file_using_http_uri_with_transcoded_file(
+    range_server, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(_RangeRequestHandler, "ignore_range", True)
+    download_path = tmp_path / "file"
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        failed_downloads = file_utils.parallelized_download_file_using_http_uri(
+            thread_pool_executor=executor,
+            http_uri=range_server,
+            download_path=str(download_path),
+            file_size=500,
+            uri_type=ArtifactCredentialType.GCP_SIGNED_URL,
+            chunk_size=128,
+            headers={"Authorization": "token"},
+        )
+    assert failed_downloads == {}
+    assert download_path.read_bytes() == _RangeRequestHandler.content
+    assert len(_RangeRequestHandler.requested_ranges) == 1
+
+
+def test_parallelized_download_file_using_http_uri_returns_failed_chunks(range_server, tmp_path):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        failed_downloads = file_utils.parallelized_download_file_using_http_uri(
+            thread_pool_executor=executor,
+            http_uri=range_server,
+            download_path=str(tmp_path / "file"),
+            file_size=1000,
+            uri_type=ArtifactCredentialType.AWS_PRESIGNED_URL,
+            chunk_size=128,
+        )
+    assert sorted(failed_downloads) == list(range(8))
+    assert {e["error_status_code"] for e in failed_downloads.values()} == {403}
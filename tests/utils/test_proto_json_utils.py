@@ -22,7 +22,9 @@ from mlflow.utils.proto_json_utils import (
     _stringify_all_experiment_ids,
     parse_tf_serving_input,
     dataframe_from_raw_json,
+    dataframe_from_parsed_json,
     _CustomJsonEncoder,
+    _dataframe_from_split_columns,
     MlflowFailedTypeConversion,
 )
 from tests.protos.test_message_pb2 import TestMessage
@@ -557,6 +559,47 @@ def test_dataframe_from_json():
     pd.testing.assert_frame_equal(parsed, expected)
 
 
+def test_dataframe_from_split_json_matches_pandas():
+    schema = Schema(
+        [
+            ColSpec("boolean", "boolean"),
+            ColSpec("string", "string"),
+            ColSpec("float", "float"),
+            ColSpec("double", "double"),
+            ColSpec("integer", "integer"),
+            ColSpec("long", "long"),
+            ColSpec("binary", "binary"),
+        ]
+    )
+    columns = ["boolean", "string", "float", "double", "integer", "long", "binary", "extra"]
+    data = [
+        [True, "a", 1.5, 2.5, 3, 4, base64.b64encode(b"x").decode(), 1],
+        [False, "b", 2, 3.5, 4, 5, base64.b64encode(b"yz").decode(), 2],
+    ]
+    expected = cast_df_types_according_to_schema(pd.DataFrame(columns=columns, data=data), schema)
+    for decoded_input in [
+        {"columns": columns, "data": data},
+        {"columns": columns, "data": data, "index": [5, 6]},
+    ]:
+        parsed = dataframe_from_parsed_json(decoded_input, pandas_orient="split", schema=schema)
+        pd.testing.assert_frame_equal(parsed, expected.set_axis(decoded_input.get("index", [0, 1])))
+
+
+@pytest.mark.parametrize(
+    "decoded_input",
+    [
+        {"columns": ["a", "b"], "data": [[1, 2], [3]]},
+        {"columns": ["a", "b"], "data": [[1, 2], [None, 4]]},
+        {"columns": ["a", "b"], "data": [[[1, 2], 3]]},
+        {"columns": ["a", "a"], "data": [[1, 2]]},
+        {"data": [[1, 2]]},
+    ],
+)
+def test_dataframe_from_split_json_falls_back_to_pandas(decoded_input):
+    schema = Schema([ColSpec("long", "a"), ColSpec("long", "b")])
+    assert _dataframe_from_split_columns(decoded_input, schema) is None
+
+
 @pytest.mark.parametrize(
     ("dt", "expected"),
     [
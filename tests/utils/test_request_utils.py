@@ -1,6 +1,8 @@
 import subprocess
 import sys
 
+from mlflow.utils import request_utils
+
 
 def test_request_utils_does_not_import_mlflow(tmp_path):
     import mlflow.utils.request_utils
@@ -26,3 +28,21 @@ assert "mlflow.utils.request_utils" in sys.modules
     test_file.write_text(file_content)
 
     subprocess.run([sys.executable, str(test_file)], check=True)
+
+
+def test_request_sessions_are_reused_with_configured_pool_size(monkeypatch):
+    session = request_utils._get_request_session(
+        2, 1, request_utils._TRANSIENT_FAILURE_RESPONSE_CODES
+    )
+    assert session is request_utils._get_request_session(
+        2, 1, request_utils._TRANSIENT_FAILURE_RESPONSE_CODES
+    )
+    assert session.get_adapter("https://example.com")._pool_maxsize == 10
+
+    monkeypatch.setenv("MLFLOW_HTTP_POOL_CONNECTIONS", "4")
+    monkeypatch.setenv("MLFLOW_HTTP_POOL_MAXSIZE", "32")
+    adapter = request_utils._get_request_session(
+        2, 1, request_utils._TRANSIENT_FAILURE_RESPONSE_CODES
+    ).get_adapter("https://example.com")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
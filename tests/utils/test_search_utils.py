@@ -691,3 +691,46 @@ def test_pagination(page_token, max_results, matching_runs, expected_next_page_t
 def test_invalid_page_tokens(page_token, error_message):
     with pytest.raises(MlflowException, match=error_message):
         SearchUtils.paginate([], page_token, 1)
+
+
+def test_keyset_page_token_round_trip():
+    order_by = ["metrics.m DESC", "params.p"]
+    token = SearchUtils.create_keyset_page_token(8, [0, 1.5, None, 123, "abc"], order_by)
+    assert SearchUtils.parse_start_offset_from_page_token(token) == 8
+    assert SearchUtils.parse_keyset_from_page_token(token, order_by) == [0, 1.5, None, 123, "abc"]
+    assert (
+        SearchUtils.parse_keyset_from_page_token(SearchUtils.create_page_token(8), order_by) is None
+    )
+    assert SearchUtils.parse_keyset_from_page_token(None, order_by) is None
+    token = SearchUtils.create_keyset_page_token(8, [0, "abc"], None)
+    assert SearchUtils.parse_keyset_from_page_token(token, []) == [0, "abc"]
+
+    invalid_token = base64.b64encode(json.dumps({"offset": 1, "keyset": 2}).encode("utf-8"))
+    with pytest.raises(MlflowException, match="Invalid page token"):
+        SearchUtils.parse_keyset_from_page_token(invalid_token, order_by)
+
+
+def test_keyset_page_token_is_rejected_for_another_order_by():
+    token = SearchUtils.create_keyset_page_token(8, [0, 1.5, 123, "abc"], ["metrics.m DESC"])
+    with pytest.raises(MlflowException, match="created for a different order_by"):
+        SearchUtils.parse_keyset_from_page_token(token, ["metrics.m ASC"])
+
+
+def test_get_keys_referenced_by_search():
+    keys = SearchUtils.get_keys_referenced_by_search(
+        "metrics.acc > 0.5 AND params.lr = '0.1' AND tags.`a b` = 'x' AND "
+        "attributes.status = 'FINISHED' AND datasets.name = 'd'",
+        ["metrics.loss DESC", "param.lr", "attributes.start_time"],
+    )
+    assert keys == {
+        "metric": {"acc", "loss"},
+        "parameter": {"lr"},
+        "tag": {"a b"},
+        "dataset": {"name"},
+    }
+    assert SearchUtils.get_keys_referenced_by_search(None, None) == {
+        "metric": set(),
+        "parameter": set(),
+        "tag": set(),
+        "dataset": set(),
+    }